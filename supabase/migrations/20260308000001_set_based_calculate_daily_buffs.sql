@@ -0,0 +1,186 @@
+-- =============================================================================
+-- Set-based calculate_daily_buffs()
+-- =============================================================================
+-- PURPOSE:
+--   Replace the per-province / per-district FOR loops in
+--   calculate_daily_buffs() (20260306000003_province_win_scoped_to_res5.sql)
+--   with a fixed number of set-based statements.
+--
+--   The loop version re-scanned hexes once per Res-5 province and then, per
+--   Res-6 district, re-scanned hexes, run_history (twice) and users, issuing one
+--   single-row INSERT each time — O(provinces + districts) scans inside the
+--   midnight GMT+2 window. This version does:
+--     1. One GROUP BY parent_hex with FILTER counts → daily_province_range_stats
+--     2. daily_all_range_stats summed from the rows just written
+--     3. One INSERT ... SELECT for every district: hex counts (GROUP BY
+--        district_hex), yesterday's per-user points (one run_history pass), the
+--        red elite PERCENTILE_CONT(0.80) grouped by district, and purple
+--        participation, all LEFT JOINed onto the distinct user districts.
+--
+--   Output rows are identical to the loop version, including:
+--     - ties resolve red > blue > purple
+--     - districts with users but no colored hexes get a row (0 counts, 'red')
+--     - districts with no red runners get elite threshold 0
+--   test_simulation/bench_daily_buffs.py seeds a scaled dataset and compares
+--   both versions row-for-row.
+--
+--   'all_range_dominant' in the result now reports the server-wide leader.
+--   The loop version returned whichever district it happened to process last,
+--   because it reused v_dominant.
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.calculate_daily_buffs()
+RETURNS jsonb
+LANGUAGE plpgsql SECURITY DEFINER
+AS $$
+DECLARE
+  v_today_gmt2           DATE;
+  v_yesterday            DATE;
+  v_all                  RECORD;
+  v_all_dominant         TEXT;
+  v_districts_processed  INTEGER := 0;
+  v_provinces_processed  INTEGER := 0;
+BEGIN
+  -- Consistent GMT+2 date (must match get_user_buff and get_team_rankings)
+  v_today_gmt2 := (CURRENT_TIMESTAMP AT TIME ZONE 'Etc/GMT-2')::DATE;
+  v_yesterday  := v_today_gmt2 - INTERVAL '1 day';
+
+  -- Delete existing stats for today (idempotent re-run)
+  DELETE FROM public.daily_buff_stats           WHERE stat_date = v_today_gmt2;
+  DELETE FROM public.daily_province_range_stats WHERE stat_date = v_today_gmt2;
+  DELETE FROM public.daily_all_range_stats      WHERE stat_date = v_today_gmt2;
+
+  -- ── Step 1: Per-province (Res-5) dominance, one pass over hexes ──────────
+  INSERT INTO public.daily_province_range_stats (
+    stat_date, province_hex, leading_team,
+    red_hex_count, blue_hex_count, purple_hex_count
+  )
+  SELECT
+    v_today_gmt2, c.parent_hex,
+    CASE
+      WHEN c.red_count >= c.blue_count AND c.red_count >= c.purple_count THEN 'red'
+      WHEN c.blue_count >= c.red_count AND c.blue_count >= c.purple_count THEN 'blue'
+      ELSE 'purple'
+    END,
+    c.red_count, c.blue_count, c.purple_count
+  FROM (
+    SELECT
+      h.parent_hex,
+      COUNT(*) FILTER (WHERE h.last_runner_team = 'red')    AS red_count,
+      COUNT(*) FILTER (WHERE h.last_runner_team = 'blue')   AS blue_count,
+      COUNT(*) FILTER (WHERE h.last_runner_team = 'purple') AS purple_count
+    FROM public.hexes h
+    WHERE h.parent_hex IS NOT NULL
+      AND h.last_runner_team IS NOT NULL
+    GROUP BY h.parent_hex
+  ) c;
+
+  GET DIAGNOSTICS v_provinces_processed = ROW_COUNT;
+
+  -- ── Server-wide totals (analytics only, NOT used for buff) ─────────────────
+  SELECT
+    COALESCE(SUM(red_hex_count), 0)    AS red_count,
+    COALESCE(SUM(blue_hex_count), 0)   AS blue_count,
+    COALESCE(SUM(purple_hex_count), 0) AS purple_count
+  INTO v_all
+  FROM public.daily_province_range_stats
+  WHERE stat_date = v_today_gmt2;
+
+  v_all_dominant := CASE
+    WHEN v_all.red_count >= v_all.blue_count AND v_all.red_count >= v_all.purple_count THEN 'red'
+    WHEN v_all.blue_count >= v_all.red_count AND v_all.blue_count >= v_all.purple_count THEN 'blue'
+    ELSE 'purple'
+  END;
+
+  INSERT INTO public.daily_all_range_stats (
+    stat_date, dominant_team, red_hex_count, blue_hex_count, purple_hex_count
+  ) VALUES (
+    v_today_gmt2, v_all_dominant, v_all.red_count, v_all.blue_count, v_all.purple_count
+  );
+
+  -- ── Step 2: Per-district (Res-6) buff stats, one INSERT ... SELECT ────────
+  WITH districts AS (
+    SELECT DISTINCT u.district_hex
+    FROM public.users u
+    WHERE u.team IS NOT NULL
+      AND u.district_hex IS NOT NULL
+  ),
+  hex_counts AS (
+    SELECT
+      h.district_hex,
+      COUNT(*) FILTER (WHERE h.last_runner_team = 'red')    AS red_count,
+      COUNT(*) FILTER (WHERE h.last_runner_team = 'blue')   AS blue_count,
+      COUNT(*) FILTER (WHERE h.last_runner_team = 'purple') AS purple_count
+    FROM public.hexes h
+    WHERE h.last_runner_team IS NOT NULL
+      AND h.district_hex IS NOT NULL
+    GROUP BY h.district_hex
+  ),
+  yesterday_points AS (
+    SELECT rh.user_id, SUM(rh.flip_points) AS total_points
+    FROM public.run_history rh
+    WHERE rh.run_date = v_yesterday
+    GROUP BY rh.user_id
+  ),
+  -- RED Elite threshold: top 20% flip_points from yesterday per district
+  elite AS (
+    SELECT
+      u.district_hex,
+      COALESCE(PERCENTILE_CONT(0.80) WITHIN GROUP (ORDER BY y.total_points), 0)::INTEGER AS threshold
+    FROM yesterday_points y
+    JOIN public.users u ON u.id = y.user_id
+    WHERE u.team = 'red'
+      AND u.district_hex IS NOT NULL
+    GROUP BY u.district_hex
+  ),
+  -- PURPLE participation per district
+  purple AS (
+    SELECT
+      u.district_hex,
+      COUNT(*)         AS total_users,
+      COUNT(y.user_id) AS active_users
+    FROM public.users u
+    LEFT JOIN yesterday_points y ON y.user_id = u.id
+    WHERE u.team = 'purple'
+      AND u.district_hex IS NOT NULL
+    GROUP BY u.district_hex
+  )
+  INSERT INTO public.daily_buff_stats (
+    stat_date, district_hex, dominant_team,
+    red_hex_count, blue_hex_count, purple_hex_count,
+    red_elite_threshold_points,
+    purple_total_users, purple_active_users, purple_participation_rate
+  )
+  SELECT
+    v_today_gmt2, d.district_hex,
+    CASE
+      WHEN COALESCE(c.red_count, 0) >= COALESCE(c.blue_count, 0)
+        AND COALESCE(c.red_count, 0) >= COALESCE(c.purple_count, 0) THEN 'red'
+      WHEN COALESCE(c.blue_count, 0) >= COALESCE(c.red_count, 0)
+        AND COALESCE(c.blue_count, 0) >= COALESCE(c.purple_count, 0) THEN 'blue'
+      ELSE 'purple'
+    END,
+    COALESCE(c.red_count, 0), COALESCE(c.blue_count, 0), COALESCE(c.purple_count, 0),
+    COALESCE(e.threshold, 0),
+    COALESCE(p.total_users, 0), COALESCE(p.active_users, 0),
+    CASE WHEN COALESCE(p.total_users, 0) > 0
+      THEN p.active_users::DOUBLE PRECISION / p.total_users
+      ELSE 0
+    END
+  FROM districts d
+  LEFT JOIN hex_counts c ON c.district_hex = d.district_hex
+  LEFT JOIN elite      e ON e.district_hex = d.district_hex
+  LEFT JOIN purple     p ON p.district_hex = d.district_hex;
+
+  GET DIAGNOSTICS v_districts_processed = ROW_COUNT;
+
+  RETURN jsonb_build_object(
+    'stat_date',            v_today_gmt2,
+    'provinces_processed',  v_provinces_processed,
+    'districts_processed',  v_districts_processed,
+    'all_range_dominant',   v_all_dominant
+  );
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.calculate_daily_buffs() TO authenticated;
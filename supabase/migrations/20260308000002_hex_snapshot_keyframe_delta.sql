@@ -0,0 +1,212 @@
+-- =============================================================================
+-- Keyframe + Delta hex_snapshot Storage (prototype)
+-- =============================================================================
+-- PURPOSE:
+--   hex_snapshot stores one row per owned hex per snapshot_date, so it grows
+--   as days x owned hexes even though most hexes do not change overnight.
+--   This prototype stores the same information as:
+--     - hex_snapshot_keyframe: a full copy every K days
+--     - hex_snapshot_delta:    between keyframes, only the hexes whose team
+--                              or last_run_end_time changed that night
+--   get_hex_snapshot_cow() reconstructs any date from the nearest keyframe
+--   at or before it plus the deltas after that keyframe, and returns the
+--   same rows as get_hex_snapshot() would from the full copy.
+--
+--   No tombstones are needed: within a season a hex never returns to
+--   neutral. Across seasons the tables must start empty, because
+--   build_hex_snapshot_cow() builds on the latest keyframe: reset_season()
+--   and reset_season_batched() (20260308000003 / 20260308000004) clear them,
+--   as does test_simulation/reset_simulation.sql.
+--
+-- STATUS:
+--   Side-by-side prototype. hex_snapshot and get_hex_snapshot() are
+--   unchanged, and build_hex_snapshot_cow() is not scheduled.
+--   test_simulation/bench_snapshot_storage.py compares table size, nightly
+--   write volume and read latency of both layouts over a simulated season.
+-- =============================================================================
+
+
+-- =============================================================================
+-- STEP 1: Tables
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS public.hex_snapshot_keyframe (
+  keyframe_date     DATE        NOT NULL,
+  hex_id            TEXT        NOT NULL,
+  last_runner_team  TEXT        NOT NULL CHECK (last_runner_team IN ('red', 'blue', 'purple')),
+  last_run_end_time TIMESTAMPTZ,
+  parent_hex        TEXT,       -- H3 Res-5 province (same as hex_snapshot.parent_hex)
+  PRIMARY KEY (keyframe_date, hex_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_hex_snapshot_keyframe_date_parent
+  ON public.hex_snapshot_keyframe (keyframe_date, parent_hex);
+
+CREATE TABLE IF NOT EXISTS public.hex_snapshot_delta (
+  snapshot_date     DATE        NOT NULL,
+  hex_id            TEXT        NOT NULL,
+  last_runner_team  TEXT        NOT NULL CHECK (last_runner_team IN ('red', 'blue', 'purple')),
+  last_run_end_time TIMESTAMPTZ,
+  parent_hex        TEXT,
+  PRIMARY KEY (snapshot_date, hex_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_hex_snapshot_delta_parent_date
+  ON public.hex_snapshot_delta (parent_hex, snapshot_date);
+
+-- Readable by everyone like hex_snapshot; written only by build_hex_snapshot_cow()
+ALTER TABLE public.hex_snapshot_keyframe ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.hex_snapshot_delta    ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY hex_snapshot_keyframe_select ON public.hex_snapshot_keyframe
+  FOR SELECT USING (true);
+CREATE POLICY hex_snapshot_delta_select ON public.hex_snapshot_delta
+  FOR SELECT USING (true);
+
+
+-- =============================================================================
+-- STEP 2: Reconstruction (same output shape as get_hex_snapshot)
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.get_hex_snapshot_cow(
+  p_parent_hex TEXT,
+  p_snapshot_date DATE DEFAULT NULL
+)
+RETURNS SETOF jsonb
+LANGUAGE sql STABLE
+AS $$
+  WITH target AS (
+    SELECT COALESCE(p_snapshot_date, CURRENT_DATE) AS d
+  ),
+  kf AS (
+    SELECT MAX(k.keyframe_date) AS d
+    FROM public.hex_snapshot_keyframe k, target t
+    WHERE k.keyframe_date <= t.d
+  )
+  SELECT to_jsonb(sub) FROM (
+    SELECT DISTINCT ON (x.hex_id)
+      x.hex_id,
+      x.last_runner_team,
+      x.last_run_end_time
+    FROM (
+      SELECT k.hex_id, k.last_runner_team, k.last_run_end_time, k.keyframe_date AS d
+      FROM public.hex_snapshot_keyframe k, kf
+      WHERE k.keyframe_date = kf.d
+        AND k.parent_hex = p_parent_hex
+      UNION ALL
+      SELECT s.hex_id, s.last_runner_team, s.last_run_end_time, s.snapshot_date
+      FROM public.hex_snapshot_delta s, kf, target t
+      WHERE s.parent_hex = p_parent_hex
+        AND s.snapshot_date > COALESCE(kf.d, '-infinity'::DATE)
+        AND s.snapshot_date <= t.d
+    ) x
+    ORDER BY x.hex_id, x.d DESC
+  ) sub;
+$$;
+
+
+-- =============================================================================
+-- STEP 3: Nightly build into keyframe / delta
+-- =============================================================================
+-- Applies runs that ended on GMT+2 date (p_snapshot_date - 1) on top of the
+-- previous snapshot. The latest end_time wins (docs §5.3). Writes a keyframe when
+-- none exists yet or the last one is p_keyframe_every days old, else only
+-- the changed hexes.
+
+CREATE OR REPLACE FUNCTION public.build_hex_snapshot_cow(
+  p_snapshot_date DATE,
+  p_keyframe_every INTEGER DEFAULT 7
+)
+RETURNS jsonb
+LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  v_run_day    DATE := p_snapshot_date - 1;
+  v_day_start  TIMESTAMPTZ := v_run_day::TIMESTAMP AT TIME ZONE 'Etc/GMT-2';
+  v_keyframe   DATE;
+  v_mode       TEXT;
+  v_rows       INTEGER;
+BEGIN
+  SELECT MAX(keyframe_date) INTO v_keyframe
+  FROM public.hex_snapshot_keyframe
+  WHERE keyframe_date < p_snapshot_date;
+
+  -- Idempotent re-run for this date
+  DELETE FROM public.hex_snapshot_keyframe WHERE keyframe_date = p_snapshot_date;
+  DELETE FROM public.hex_snapshot_delta    WHERE snapshot_date = p_snapshot_date;
+
+  -- Today's winner per hex
+  CREATE TEMP TABLE _cow_today ON COMMIT DROP AS
+  SELECT DISTINCT ON (p.hex_id)
+    p.hex_id, r.team_at_run AS last_runner_team, r.end_time AS last_run_end_time, h.parent_hex
+  FROM public.runs r
+  CROSS JOIN LATERAL unnest(r.hex_path) AS p(hex_id)
+  LEFT JOIN public.hexes h ON h.id = p.hex_id
+  WHERE r.end_time >= v_day_start
+    AND r.end_time <  v_day_start + INTERVAL '1 day'
+  ORDER BY p.hex_id, r.end_time DESC, r.id DESC;
+
+  -- Previous snapshot, reconstructed: keyframe + deltas up to yesterday
+  CREATE TEMP TABLE _cow_prev ON COMMIT DROP AS
+  SELECT DISTINCT ON (x.hex_id) x.hex_id, x.last_runner_team, x.last_run_end_time, x.parent_hex
+  FROM (
+    SELECT k.hex_id, k.last_runner_team, k.last_run_end_time, k.parent_hex, k.keyframe_date AS d
+    FROM public.hex_snapshot_keyframe k
+    WHERE k.keyframe_date = v_keyframe
+    UNION ALL
+    SELECT s.hex_id, s.last_runner_team, s.last_run_end_time, s.parent_hex, s.snapshot_date
+    FROM public.hex_snapshot_delta s
+    WHERE s.snapshot_date > COALESCE(v_keyframe, '-infinity'::DATE)
+      AND s.snapshot_date < p_snapshot_date
+  ) x
+  ORDER BY x.hex_id, x.d DESC;
+
+  IF v_keyframe IS NULL OR p_snapshot_date - v_keyframe >= p_keyframe_every THEN
+    v_mode := 'keyframe';
+    INSERT INTO public.hex_snapshot_keyframe (keyframe_date, hex_id, last_runner_team, last_run_end_time, parent_hex)
+    SELECT p_snapshot_date,
+           COALESCE(t.hex_id, p.hex_id),
+           COALESCE(t.last_runner_team, p.last_runner_team),
+           COALESCE(t.last_run_end_time, p.last_run_end_time),
+           COALESCE(t.parent_hex, p.parent_hex)
+    FROM _cow_prev p
+    FULL JOIN _cow_today t ON t.hex_id = p.hex_id;
+  ELSE
+    v_mode := 'delta';
+    INSERT INTO public.hex_snapshot_delta (snapshot_date, hex_id, last_runner_team, last_run_end_time, parent_hex)
+    SELECT p_snapshot_date, t.hex_id, t.last_runner_team, t.last_run_end_time,
+           COALESCE(t.parent_hex, p.parent_hex)
+    FROM _cow_today t
+    LEFT JOIN _cow_prev p ON p.hex_id = t.hex_id
+    WHERE p.hex_id IS NULL
+       OR p.last_runner_team IS DISTINCT FROM t.last_runner_team
+       OR p.last_run_end_time IS DISTINCT FROM t.last_run_end_time;
+  END IF;
+
+  GET DIAGNOSTICS v_rows = ROW_COUNT;
+
+  DROP TABLE _cow_today;
+  DROP TABLE _cow_prev;
+
+  RETURN jsonb_build_object(
+    'snapshot_date', p_snapshot_date,
+    'mode',          v_mode,
+    'rows_written',  v_rows,
+    'keyframe_date', CASE WHEN v_mode = 'keyframe' THEN p_snapshot_date ELSE v_keyframe END
+  );
+END;
+$$;
+
+
+-- =============================================================================
+-- STEP 4: Grants
+-- =============================================================================
+
+GRANT SELECT ON public.hex_snapshot_keyframe TO authenticated;
+GRANT SELECT ON public.hex_snapshot_delta    TO authenticated;
+GRANT EXECUTE ON FUNCTION public.get_hex_snapshot_cow(TEXT, DATE) TO authenticated;
+
+-- Nightly build overwrites snapshots: service_role only
+REVOKE EXECUTE ON FUNCTION public.build_hex_snapshot_cow(DATE, INTEGER) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.build_hex_snapshot_cow(DATE, INTEGER) TO service_role;
@@ -0,0 +1,378 @@
+-- =============================================================================
+-- Range-partition hex_snapshot (daily) and run_history (monthly by run_date)
+-- =============================================================================
+-- PURPOSE:
+--   Almost every read of these tables filters on the date column:
+--     - get_hex_snapshot:            hex_snapshot WHERE snapshot_date = D AND parent_hex = P
+--     - get_user_yesterday_stats:    run_history WHERE user_id = U AND run_date = D
+--     - snapshot_season_leaderboard: run_history WHERE run_date in [season start, end)
+--   hex_snapshot is a single heap, so it grows by one full copy per day. The
+--   season reset DELETEs every row of it.
+--   run_history is partitioned on created_at, which none of these queries
+--   filter on, so the planner cannot prune any partition.
+--
+--   After this migration:
+--     - hex_snapshot is PARTITION BY RANGE (snapshot_date), one partition per
+--       day. get_hex_snapshot touches only one partition, and reset_season()
+--       drops whole partitions instead of deleting rows.
+--     - run_history is PARTITION BY RANGE (run_date), one partition per month,
+--       with an index on (user_id, run_date). The PK becomes (id, run_date).
+--     - Each table has a DEFAULT partition, so an insert outside the
+--       pre-created range never fails. create_date_partitions() moves those
+--       rows out when it creates the matching partition.
+--     - Every partition has RLS enabled with no policy of its own. A
+--       partition queried directly does not use the parent's policies, so
+--       clients can only read through the parent.
+--
+-- HELPERS:
+--   create_date_partitions(parent, from, to, 'day' | 'month')  pre-create, idempotent
+--   drop_date_partitions(parent, before, detach_only)          detach (+ drop) partitions ending <= before
+--   maintain_partitions()                                      nightly pre-create for both tables
+--
+-- SETUP (run ONCE in Supabase SQL Editor after applying this migration):
+--   SELECT cron.schedule(
+--     'maintain-partitions',
+--     '50 21 * * *',
+--     'SELECT maintain_partitions()'
+--   );
+--   If pg_partman was set up for run_history (baseline_schema.sql comment),
+--   remove it from partman.part_config BEFORE applying this migration.
+--
+-- test_simulation/bench_partitioning.py loads a simulated season into both
+-- layouts and compares partition pruning, query latency and reset duration.
+-- =============================================================================
+
+
+-- =============================================================================
+-- STEP 1: Partition helpers
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.create_date_partitions(
+  p_parent REGCLASS,
+  p_from   DATE,
+  p_to     DATE,
+  p_step   TEXT DEFAULT 'day'
+)
+RETURNS INTEGER
+LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  v_schema   TEXT;
+  v_name     TEXT;
+  v_key      TEXT;
+  v_default  REGCLASS;
+  v_lo       DATE;
+  v_hi       DATE;
+  v_part     TEXT;
+  v_stray    BOOLEAN;
+  v_created  INTEGER := 0;
+BEGIN
+  IF p_step NOT IN ('day', 'month') THEN
+    RAISE EXCEPTION 'p_step must be ''day'' or ''month'', got %', p_step;
+  END IF;
+
+  SELECT n.nspname, c.relname, a.attname, pt.partdefid::REGCLASS
+  INTO v_schema, v_name, v_key, v_default
+  FROM pg_partitioned_table pt
+  JOIN pg_class c ON c.oid = pt.partrelid
+  JOIN pg_namespace n ON n.oid = c.relnamespace
+  JOIN pg_attribute a ON a.attrelid = pt.partrelid AND a.attnum = pt.partattrs[0]
+  WHERE pt.partrelid = p_parent
+    AND pt.partstrat = 'r';
+
+  IF v_key IS NULL THEN
+    RAISE EXCEPTION '% is not range-partitioned on a column', p_parent;
+  END IF;
+  IF v_default = 0::REGCLASS THEN
+    v_default := NULL;
+  END IF;
+
+  v_lo := date_trunc(p_step, p_from)::DATE;
+  WHILE v_lo <= p_to LOOP
+    v_hi := (v_lo + ('1 ' || p_step)::INTERVAL)::DATE;
+    v_part := v_name || '_p' || to_char(v_lo, CASE p_step WHEN 'day' THEN 'YYYYMMDD' ELSE 'YYYYMM' END);
+
+    IF to_regclass(format('%I.%I', v_schema, v_part)) IS NULL THEN
+      -- Rows already in DEFAULT for this range would make CREATE ... PARTITION OF fail
+      v_stray := false;
+      IF v_default IS NOT NULL THEN
+        EXECUTE format('SELECT EXISTS (SELECT 1 FROM %s WHERE %I >= %L AND %I < %L)',
+                       v_default, v_key, v_lo, v_key, v_hi)
+        INTO v_stray;
+      END IF;
+      IF v_stray THEN
+        EXECUTE format('CREATE TEMP TABLE _partition_move ON COMMIT DROP AS '
+                       'WITH moved AS (DELETE FROM %s WHERE %I >= %L AND %I < %L RETURNING *) '
+                       'SELECT * FROM moved',
+                       v_default, v_key, v_lo, v_key, v_hi);
+      END IF;
+
+      EXECUTE format('CREATE TABLE %I.%I PARTITION OF %s FOR VALUES FROM (%L) TO (%L)',
+                     v_schema, v_part, p_parent, v_lo, v_hi);
+      -- The parent's policies do not apply to a partition queried directly
+      EXECUTE format('ALTER TABLE %I.%I ENABLE ROW LEVEL SECURITY', v_schema, v_part);
+      v_created := v_created + 1;
+
+      IF v_stray THEN
+        EXECUTE format('INSERT INTO %s SELECT * FROM _partition_move', p_parent);
+        DROP TABLE _partition_move;
+      END IF;
+    END IF;
+
+    v_lo := v_hi;
+  END LOOP;
+
+  RETURN v_created;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.drop_date_partitions(
+  p_parent      REGCLASS,
+  p_before      DATE,
+  p_detach_only BOOLEAN DEFAULT false
+)
+RETURNS jsonb
+LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  v_parts  REGCLASS[];
+  v_part   REGCLASS;
+  v_name   TEXT;
+  v_names  jsonb := '[]'::jsonb;
+BEGIN
+  -- Collect first: the catalog changes under us as partitions are detached
+  SELECT array_agg(c.oid::REGCLASS ORDER BY c.relname)
+  INTO v_parts
+  FROM pg_inherits i
+  JOIN pg_class c ON c.oid = i.inhrelid
+  WHERE i.inhparent = p_parent
+    AND substring(pg_get_expr(c.relpartbound, c.oid) FROM 'TO \(''([^'']+)''\)')::DATE <= p_before;
+
+  FOREACH v_part IN ARRAY COALESCE(v_parts, '{}') LOOP
+    v_name := v_part::TEXT;
+    EXECUTE format('ALTER TABLE %s DETACH PARTITION %s', p_parent, v_part);
+    IF NOT p_detach_only THEN
+      EXECUTE format('DROP TABLE %s', v_part);
+    END IF;
+    v_names := v_names || to_jsonb(v_name);
+  END LOOP;
+
+  RETURN jsonb_build_object(
+    'parent',   p_parent::TEXT,
+    'before',   p_before,
+    'detached', v_names,
+    'dropped',  NOT p_detach_only
+  );
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION public.maintain_partitions()
+RETURNS jsonb
+LANGUAGE plpgsql SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  v_today  DATE := (CURRENT_TIMESTAMP AT TIME ZONE 'Etc/GMT-2')::DATE;
+  v_hex    INTEGER;
+  v_runs   INTEGER;
+BEGIN
+  -- A week of snapshot days and two months of run_history ahead
+  v_hex  := public.create_date_partitions('public.hex_snapshot', v_today - 1, v_today + 7, 'day');
+  v_runs := public.create_date_partitions('public.run_history', v_today - 1,
+                                          (v_today + INTERVAL '2 months')::DATE, 'month');
+  RETURN jsonb_build_object(
+    'date',                 v_today,
+    'hex_snapshot_created', v_hex,
+    'run_history_created',  v_runs
+  );
+END;
+$$;
+
+
+-- =============================================================================
+-- STEP 2: hex_snapshot -> daily partitions on snapshot_date
+-- =============================================================================
+
+ALTER TABLE public.hex_snapshot RENAME TO hex_snapshot_unpartitioned;
+ALTER TABLE public.hex_snapshot_unpartitioned RENAME CONSTRAINT hex_snapshot_pkey TO hex_snapshot_unpartitioned_pkey;
+ALTER INDEX public.idx_hex_snapshot_date_parent RENAME TO idx_hex_snapshot_unpartitioned_date_parent;
+
+CREATE TABLE public.hex_snapshot (
+  hex_id TEXT NOT NULL,
+  last_runner_team TEXT NOT NULL CHECK (last_runner_team IN ('red', 'blue', 'purple')),
+  snapshot_date DATE NOT NULL,
+  last_run_end_time TIMESTAMPTZ,
+  parent_hex TEXT,
+  PRIMARY KEY (hex_id, snapshot_date)
+) PARTITION BY RANGE (snapshot_date);
+
+-- Same definition as before; within a daily partition it is effectively (parent_hex)
+CREATE INDEX IF NOT EXISTS idx_hex_snapshot_date_parent ON public.hex_snapshot(snapshot_date, parent_hex);
+
+SELECT public.create_date_partitions(
+  'public.hex_snapshot',
+  COALESCE((SELECT MIN(snapshot_date) FROM public.hex_snapshot_unpartitioned),
+           (CURRENT_TIMESTAMP AT TIME ZONE 'Etc/GMT-2')::DATE),
+  GREATEST((SELECT MAX(snapshot_date) FROM public.hex_snapshot_unpartitioned),
+           (CURRENT_TIMESTAMP AT TIME ZONE 'Etc/GMT-2')::DATE + 7),
+  'day'
+);
+
+INSERT INTO public.hex_snapshot (hex_id, last_runner_team, snapshot_date, last_run_end_time, parent_hex)
+SELECT hex_id, last_runner_team, snapshot_date, last_run_end_time, parent_hex
+FROM public.hex_snapshot_unpartitioned;
+
+DROP TABLE public.hex_snapshot_unpartitioned;
+
+CREATE TABLE public.hex_snapshot_default PARTITION OF public.hex_snapshot DEFAULT;
+ALTER TABLE public.hex_snapshot_default ENABLE ROW LEVEL SECURITY;
+
+ALTER TABLE public.hex_snapshot ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY hex_snapshot_select ON public.hex_snapshot
+  FOR SELECT USING (true);
+
+
+-- =============================================================================
+-- STEP 3: run_history -> monthly partitions on run_date
+-- =============================================================================
+-- Preserved across seasons, so partitions are monthly rather than daily.
+
+ALTER TABLE public.run_history RENAME TO run_history_by_created_at;
+ALTER TABLE public.run_history_by_created_at RENAME CONSTRAINT run_history_pkey TO run_history_by_created_at_pkey;
+
+CREATE TABLE public.run_history (
+  id UUID NOT NULL DEFAULT gen_random_uuid(),
+  user_id UUID NOT NULL REFERENCES public.users(id),
+  run_date DATE NOT NULL,
+  start_time TIMESTAMPTZ NOT NULL,
+  end_time TIMESTAMPTZ NOT NULL,
+  distance_km DOUBLE PRECISION NOT NULL,
+  duration_seconds INTEGER NOT NULL,
+  avg_pace_min_per_km DOUBLE PRECISION,
+  flip_count INTEGER NOT NULL DEFAULT 0,
+  flip_points INTEGER NOT NULL DEFAULT 0,
+  cv DOUBLE PRECISION,
+  team_at_run TEXT NOT NULL CHECK (team_at_run IN ('red', 'blue', 'purple')),
+  created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  PRIMARY KEY (id, run_date)
+) PARTITION BY RANGE (run_date);
+
+CREATE INDEX IF NOT EXISTS idx_run_history_user_date ON public.run_history(user_id, run_date);
+
+SELECT public.create_date_partitions(
+  'public.run_history',
+  COALESCE((SELECT MIN(run_date) FROM public.run_history_by_created_at),
+           (CURRENT_TIMESTAMP AT TIME ZONE 'Etc/GMT-2')::DATE),
+  GREATEST((SELECT MAX(run_date) FROM public.run_history_by_created_at),
+           ((CURRENT_TIMESTAMP AT TIME ZONE 'Etc/GMT-2') + INTERVAL '2 months')::DATE),
+  'month'
+);
+
+INSERT INTO public.run_history (
+  id, user_id, run_date, start_time, end_time, distance_km, duration_seconds,
+  avg_pace_min_per_km, flip_count, flip_points, cv, team_at_run, created_at
+)
+SELECT
+  id, user_id, run_date, start_time, end_time, distance_km, duration_seconds,
+  avg_pace_min_per_km, flip_count, flip_points, cv, team_at_run, created_at
+FROM public.run_history_by_created_at;
+
+-- Drops the old created_at partitions with it
+DROP TABLE public.run_history_by_created_at;
+
+CREATE TABLE public.run_history_default PARTITION OF public.run_history DEFAULT;
+ALTER TABLE public.run_history_default ENABLE ROW LEVEL SECURITY;
+
+ALTER TABLE public.run_history ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY run_history_select ON public.run_history
+  FOR SELECT USING (user_id IN (SELECT id FROM public.users WHERE auth_id = auth.uid()));
+
+
+-- =============================================================================
+-- STEP 4: reset_season() drops hex_snapshot partitions instead of DELETE
+-- =============================================================================
+-- Same as 20260303000002_fix_reset_season.sql except the hex_snapshot wipe,
+-- which also clears the keyframe + delta tables from 20260308000002.
+
+CREATE OR REPLACE FUNCTION public.reset_season(p_season_number INT)
+RETURNS jsonb
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $function$
+DECLARE
+  v_snapshot_count INT;
+  v_today          DATE := (CURRENT_TIMESTAMP AT TIME ZONE 'Etc/GMT-2')::DATE;
+  v_dropped        jsonb;
+BEGIN
+  -- ── Step 1: Freeze leaderboard snapshot (date-bounded, safe to call anytime) ──
+  -- snapshot_season_leaderboard reads run_history with date bounds — does NOT
+  -- depend on users.season_points, so it's correct regardless of call timing.
+  SELECT snapshot_season_leaderboard(p_season_number) INTO v_snapshot_count;
+
+  -- ── Step 2: Reset SEASON-ONLY user fields ──────────────────────────────────
+  -- DO NOT touch ALL-TIME fields: total_distance_km, avg_pace_min_per_km,
+  -- avg_cv, total_runs, cv_run_count, home_hex, home_hex_end, district_hex
+  UPDATE public.users SET
+    season_points   = 0,
+    team            = NULL,
+    season_home_hex = NULL;
+
+  -- ── Step 3: Wipe season-specific tables ───────────────────────────────────
+  -- hexes: live hex state (re-built as users run in the new season)
+  DELETE FROM public.hexes;
+
+  -- hex_snapshot: yesterday's baseline for flip counting
+  -- (build_daily_hex_snapshot at 22:00 UTC will rebuild from empty hexes)
+  -- Drop every daily partition up to and including today, clear whatever is
+  -- left (DEFAULT / pre-created days), then pre-create the new season's days.
+  v_dropped := drop_date_partitions('public.hex_snapshot', v_today + 1);
+  DELETE FROM public.hex_snapshot;
+  PERFORM create_date_partitions('public.hex_snapshot', v_today, v_today + 7, 'day');
+
+  -- Keyframe + delta prototype (20260308000002): build_hex_snapshot_cow()
+  -- starts from the latest keyframe, so a stale one would carry last
+  -- season's hexes into the new season
+  DELETE FROM public.hex_snapshot_keyframe;
+  DELETE FROM public.hex_snapshot_delta;
+
+  -- daily_buff_stats: per-district buff multipliers (calculated fresh by
+  -- calculate_daily_buffs at 22:00 UTC)
+  DELETE FROM public.daily_buff_stats;
+
+  -- Province/all range stats: season-specific hex dominance aggregates
+  DELETE FROM public.daily_all_range_stats;
+  DELETE FROM public.daily_province_range_stats;
+
+  -- DO NOT delete: run_history, daily_stats (preserved across seasons per AGENTS.md)
+  -- DO NOT delete: season_leaderboard_snapshot (historical records for all seasons)
+
+  RETURN jsonb_build_object(
+    'season_ended',       p_season_number,
+    'snapshot_count',     v_snapshot_count,
+    'partitions_dropped', jsonb_array_length(v_dropped->'detached'),
+    'reset_complete',     true
+  );
+END;
+$function$;
+
+
+-- =============================================================================
+-- STEP 5: Grants (admin operations, like reset_season)
+-- =============================================================================
+-- SECURITY DEFINER, and the helpers take any table: service_role only.
+
+REVOKE EXECUTE ON FUNCTION public.create_date_partitions(REGCLASS, DATE, DATE, TEXT) FROM PUBLIC;
+REVOKE EXECUTE ON FUNCTION public.drop_date_partitions(REGCLASS, DATE, BOOLEAN) FROM PUBLIC;
+REVOKE EXECUTE ON FUNCTION public.maintain_partitions() FROM PUBLIC;
+REVOKE EXECUTE ON FUNCTION public.reset_season(INT) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.create_date_partitions(REGCLASS, DATE, DATE, TEXT) TO service_role;
+GRANT EXECUTE ON FUNCTION public.drop_date_partitions(REGCLASS, DATE, BOOLEAN) TO service_role;
+GRANT EXECUTE ON FUNCTION public.maintain_partitions() TO service_role;
+GRANT EXECUTE ON FUNCTION public.reset_season(INT) TO service_role;
+
+NOTIFY pgrst, 'reload schema';
@@ -0,0 +1,222 @@
+-- =============================================================================
+-- Batched season reset ("The Void") — reset_season_batched procedure
+-- =============================================================================
+-- PROBLEM:
+--   reset_season() runs as one transaction at D-0 (21:55 UTC). The
+--   UPDATE public.users and DELETE FROM public.hexes each touch every row, and
+--   their row locks are held until the function returns. Until then, every
+--   finalize_run() that updates its user or upserts a hex waits. Reads are not
+--   blocked, but run sync stalls for the whole reset.
+--   test_simulation/bench_season_reset.py measures this at scale.
+--
+-- FIX (alternative path, reset_season() is unchanged):
+--   reset_season_batched(p_season_number, p_batch_size, p_pause_ms) is a
+--   PROCEDURE that COMMITs after every batch. Row locks are only ever held for
+--   one batch:
+--     1. snapshot_season_leaderboard()  (same as reset_season, own transaction)
+--     2. users:  keyset batches over the PK, season fields -> 0 / NULL
+--     3. hexes:  keyset batches of DELETE over the PK
+--     4. final sweep of users / hexes touched by runs that finished mid-reset
+--     5. hex_snapshot partitions dropped (20260308000003), the keyframe +
+--        delta tables (20260308000002), then the daily buff / range stats
+--        tables, same as reset_season()
+--   handle_season_transition_batched() is the matching cron entry point.
+--
+-- TRADE-OFF:
+--   The reset is no longer atomic. For a few seconds, some users are already
+--   on the new season while others are not. The window sits inside the
+--   21:55–22:00 UTC slot before the midnight crons. The final sweep in step 4
+--   catches writes that landed in batches already processed. Rerunning the
+--   procedure is safe: every step is idempotent.
+--
+--   Procedures with COMMIT cannot be SECURITY DEFINER or carry SET
+--   search_path, so every name is schema-qualified and EXECUTE is granted
+--   only to service_role.
+--
+-- SETUP (replace the 'season-transition' job from 20260303000004):
+--   SELECT cron.unschedule('season-transition');
+--   SELECT cron.schedule(
+--     'season-transition',
+--     '55 21 * * *',
+--     'CALL handle_season_transition_batched()'
+--   );
+-- =============================================================================
+
+
+-- =============================================================================
+-- STEP 1: Season boundary detection (same rule as handle_season_transition)
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.season_ending_tonight()
+RETURNS INT
+LANGUAGE plpgsql STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $function$
+DECLARE
+  v_cfg                   JSONB;
+  v_duration              INT;
+  v_base_season           INT;
+  v_start_date            DATE;
+  v_days_elapsed_tomorrow INT;
+BEGIN
+  SELECT config_data->'season' INTO v_cfg FROM app_config LIMIT 1;
+  v_duration    := COALESCE((v_cfg->>'durationDays')::INT,  40);
+  v_base_season := COALESCE((v_cfg->>'seasonNumber')::INT,  2);
+  v_start_date  := COALESCE((v_cfg->>'startDate')::DATE, '2026-02-11'::DATE);
+
+  v_days_elapsed_tomorrow := ((CURRENT_TIMESTAMP AT TIME ZONE 'Etc/GMT-2')::DATE + 1) - v_start_date;
+
+  IF v_days_elapsed_tomorrow > 0 AND v_days_elapsed_tomorrow % v_duration = 0 THEN
+    RETURN v_base_season + (v_days_elapsed_tomorrow / v_duration) - 1;
+  END IF;
+  RETURN NULL;
+END;
+$function$;
+
+
+-- =============================================================================
+-- STEP 2: reset_season_batched
+-- =============================================================================
+
+CREATE OR REPLACE PROCEDURE public.reset_season_batched(
+  p_season_number INT,
+  p_batch_size    INT DEFAULT 5000,
+  p_pause_ms      INT DEFAULT 0
+)
+LANGUAGE plpgsql
+AS $procedure$
+DECLARE
+  v_today          DATE := (CURRENT_TIMESTAMP AT TIME ZONE 'Etc/GMT-2')::DATE;
+  v_snapshot_count INT;
+  v_last_user      UUID;
+  v_next_user      UUID;
+  v_last_hex       TEXT;
+  v_next_hex       TEXT;
+  v_rows           INT;
+  v_users          BIGINT := 0;
+  v_hexes          BIGINT := 0;
+  v_batches        INT := 0;
+BEGIN
+  -- ── Step 1: Freeze leaderboard snapshot ───────────────────────────────────
+  SELECT public.snapshot_season_leaderboard(p_season_number) INTO v_snapshot_count;
+  COMMIT;
+
+  -- ── Step 2: Reset SEASON-ONLY user fields, one PK range per transaction ──
+  -- DO NOT touch ALL-TIME fields (see reset_season)
+  LOOP
+    SELECT b.id INTO v_next_user FROM (
+      SELECT id FROM public.users
+      WHERE v_last_user IS NULL OR id > v_last_user
+      ORDER BY id
+      LIMIT p_batch_size
+    ) b
+    ORDER BY b.id DESC
+    LIMIT 1;
+    EXIT WHEN v_next_user IS NULL;
+
+    UPDATE public.users SET
+      season_points   = 0,
+      team            = NULL,
+      season_home_hex = NULL
+    WHERE (v_last_user IS NULL OR id > v_last_user)
+      AND id <= v_next_user
+      AND (season_points <> 0 OR team IS NOT NULL OR season_home_hex IS NOT NULL);
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    v_users := v_users + v_rows;
+    v_batches := v_batches + 1;
+    v_last_user := v_next_user;
+    COMMIT;
+    IF p_pause_ms > 0 THEN PERFORM pg_sleep(p_pause_ms / 1000.0); END IF;
+  END LOOP;
+
+  -- ── Step 3: Delete hexes, one PK range per transaction ────────────────────
+  LOOP
+    SELECT b.id INTO v_next_hex FROM (
+      SELECT id FROM public.hexes
+      WHERE v_last_hex IS NULL OR id > v_last_hex
+      ORDER BY id
+      LIMIT p_batch_size
+    ) b
+    ORDER BY b.id DESC
+    LIMIT 1;
+    EXIT WHEN v_next_hex IS NULL;
+
+    DELETE FROM public.hexes
+    WHERE (v_last_hex IS NULL OR id > v_last_hex)
+      AND id <= v_next_hex;
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    v_hexes := v_hexes + v_rows;
+    v_batches := v_batches + 1;
+    v_last_hex := v_next_hex;
+    COMMIT;
+    IF p_pause_ms > 0 THEN PERFORM pg_sleep(p_pause_ms / 1000.0); END IF;
+  END LOOP;
+
+  -- ── Step 4: Final sweep (runs that finished behind the batch cursor) ──────
+  UPDATE public.users SET
+    season_points   = 0,
+    team            = NULL,
+    season_home_hex = NULL
+  WHERE season_points <> 0 OR team IS NOT NULL OR season_home_hex IS NOT NULL;
+  GET DIAGNOSTICS v_rows = ROW_COUNT;
+  v_users := v_users + v_rows;
+
+  DELETE FROM public.hexes;
+  GET DIAGNOSTICS v_rows = ROW_COUNT;
+  v_hexes := v_hexes + v_rows;
+  COMMIT;
+
+  -- ── Step 5: Remaining season tables (small, or partition drops) ───────────
+  PERFORM public.drop_date_partitions('public.hex_snapshot', v_today + 1);
+  DELETE FROM public.hex_snapshot;
+  PERFORM public.create_date_partitions('public.hex_snapshot', v_today, v_today + 7, 'day');
+  DELETE FROM public.hex_snapshot_keyframe;
+  DELETE FROM public.hex_snapshot_delta;
+
+  DELETE FROM public.daily_buff_stats;
+  DELETE FROM public.daily_all_range_stats;
+  DELETE FROM public.daily_province_range_stats;
+  COMMIT;
+
+  -- DO NOT delete: run_history, daily_stats, season_leaderboard_snapshot
+
+  RAISE NOTICE 'reset_season_batched(%): snapshot_count=%, users_reset=%, hexes_deleted=%, batches=%',
+    p_season_number, v_snapshot_count, v_users, v_hexes, v_batches;
+END;
+$procedure$;
+
+
+-- =============================================================================
+-- STEP 3: Cron entry point
+-- =============================================================================
+
+CREATE OR REPLACE PROCEDURE public.handle_season_transition_batched(
+  p_batch_size INT DEFAULT 5000,
+  p_pause_ms   INT DEFAULT 0
+)
+LANGUAGE plpgsql
+AS $procedure$
+DECLARE
+  v_ending_season INT;
+BEGIN
+  v_ending_season := public.season_ending_tonight();
+  IF v_ending_season IS NOT NULL THEN
+    CALL public.reset_season_batched(v_ending_season, p_batch_size, p_pause_ms);
+  END IF;
+END;
+$procedure$;
+
+
+-- =============================================================================
+-- STEP 4: Grants (admin operations, like reset_season)
+-- =============================================================================
+
+REVOKE EXECUTE ON FUNCTION public.season_ending_tonight() FROM PUBLIC;
+REVOKE EXECUTE ON PROCEDURE public.reset_season_batched(INT, INT, INT) FROM PUBLIC;
+REVOKE EXECUTE ON PROCEDURE public.handle_season_transition_batched(INT, INT) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.season_ending_tonight() TO service_role;
+GRANT EXECUTE ON PROCEDURE public.reset_season_batched(INT, INT, INT) TO service_role;
+GRANT EXECUTE ON PROCEDURE public.handle_season_transition_batched(INT, INT) TO service_role;
+
+NOTIFY pgrst, 'reload schema';
@@ -0,0 +1,511 @@
+-- =============================================================================
+-- Materialized leaderboard — leaderboard_entries + incremental refresh
+-- =============================================================================
+-- PROBLEM:
+--   get_leaderboard() sorts every user with season_points > 0 on every call.
+--   Each call also aggregates today's run_history to subtract today's points,
+--   because the board shows standings "as of GMT+2 midnight". A user's own
+--   rank costs the same sort, and get_scoped_leaderboard() is still the debug
+--   version that ignores its scope.
+--   test_simulation/bench_leaderboard.py measures this at 1M users.
+--
+-- FIX:
+--   leaderboard_entries holds one row per (user, scope), for three scopes:
+--     global    scope_hex = ''
+--     province  scope_hex = users.province_hex (Res 5)
+--     district  scope_hex = users.district_hex (Res 6)
+--   Each row stores season_points as of GMT+2 midnight. Rank order is
+--   season_points DESC, name ASC, user_id ASC, and one index holds the rows
+--   in exactly that order per board:
+--     - top-N is an index-only range scan of N entries
+--     - a user's own rank is a primary key lookup plus an index-only count of
+--       the entries ahead of them
+--   leaderboard_totals keeps each board's size.
+--
+--   Rank is not stored. A stored dense rank must be rewritten for every
+--   entry a user passes. At 1M users, a +60 point late sync passes hundreds
+--   of thousands of entries, so 10 late syncs rewrote ~600k rows. Without it,
+--   moving a user is one delete and one insert per scope.
+--
+--   Between nightly rebuilds, the board only changes for late syncs: runs
+--   whose run_date is before today. Runs from today are excluded from the
+--   board anyway. An AFTER INSERT trigger on run_history marks those users
+--   dirty. refresh_leaderboard() runs every minute and does one of two things:
+--     - as_of is not today (GMT+2 midnight passed) -> rebuild_leaderboard()
+--     - otherwise -> replace the dirty users' entries. Their points are
+--       recomputed from users / run_history, so applying twice is harmless.
+--
+--   get_leaderboard() keeps its return shape and reads the global board.
+--   If the board is not as of today (cron not scheduled, or before the
+--   first refresh after midnight) it, get_scoped_leaderboard() and
+--   get_leaderboard_rank() fall back to the live boards
+--   (leaderboard_live_entries()).
+--
+-- NOT TRACKED INCREMENTALLY (picked up by the next nightly rebuild):
+--   name, team, province_hex or district_hex changes without a late run, and
+--   reset_season(). The board keeps showing the finished season between the
+--   21:55 UTC reset and the 22:00 UTC rebuild.
+--
+-- SETUP:
+--   SELECT cron.schedule(
+--     'refresh-leaderboard',
+--     '* * * * *',
+--     'SELECT public.refresh_leaderboard()'
+--   );
+-- =============================================================================
+
+
+-- =============================================================================
+-- STEP 1: Tables
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS public.leaderboard_entries (
+  scope          TEXT NOT NULL CHECK (scope IN ('global', 'province', 'district')),
+  scope_hex      TEXT NOT NULL,   -- '' for global
+  user_id        UUID NOT NULL,
+  name           TEXT NOT NULL,
+  season_points  INT  NOT NULL,   -- as of GMT+2 midnight (today's runs excluded)
+  PRIMARY KEY (user_id, scope) INCLUDE (scope_hex, season_points, name)
+);
+
+-- Rank order per board: top-N scans, own-rank counts
+CREATE INDEX IF NOT EXISTS idx_leaderboard_entries_rank_order
+  ON public.leaderboard_entries (scope, scope_hex, season_points DESC, name, user_id);
+
+CREATE TABLE IF NOT EXISTS public.leaderboard_totals (
+  scope      TEXT NOT NULL,
+  scope_hex  TEXT NOT NULL,
+  total      INT  NOT NULL,
+  PRIMARY KEY (scope, scope_hex)
+);
+
+CREATE TABLE IF NOT EXISTS public.leaderboard_dirty (
+  user_id    UUID PRIMARY KEY,
+  queued_at  TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE TABLE IF NOT EXISTS public.leaderboard_meta (
+  id            BOOLEAN PRIMARY KEY DEFAULT true CHECK (id),
+  as_of         DATE,          -- GMT+2 date whose midnight the board reflects
+  rebuilt_at    TIMESTAMPTZ,
+  refreshed_at  TIMESTAMPTZ
+);
+
+INSERT INTO public.leaderboard_meta (id) VALUES (true) ON CONFLICT DO NOTHING;
+
+ALTER TABLE public.leaderboard_entries ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY leaderboard_entries_select ON public.leaderboard_entries
+  FOR SELECT USING (true);
+
+ALTER TABLE public.leaderboard_totals ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY leaderboard_totals_select ON public.leaderboard_totals
+  FOR SELECT USING (true);
+
+ALTER TABLE public.leaderboard_dirty ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.leaderboard_meta ENABLE ROW LEVEL SECURITY;
+
+
+-- =============================================================================
+-- STEP 2: Full rebuild (nightly, or whenever as_of is stale)
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.rebuild_leaderboard()
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  v_today DATE := (NOW() AT TIME ZONE 'Etc/GMT-2')::DATE;
+  v_rows  BIGINT;
+BEGIN
+  -- Clear the dirty set first: every user it held is visible to the rebuild
+  -- below, which runs on a later snapshot.
+  DELETE FROM leaderboard_dirty;
+
+  -- DELETE, not TRUNCATE: readers keep seeing the old board until commit.
+  DELETE FROM leaderboard_entries;
+  DELETE FROM leaderboard_totals;
+
+  WITH today_points AS (
+    SELECT r.user_id, SUM(r.flip_points)::INT AS today_fp
+    FROM run_history r
+    WHERE r.run_date = v_today
+    GROUP BY r.user_id
+  ),
+  eligible AS (
+    SELECT u.id, u.name, u.province_hex, u.district_hex,
+           (u.season_points - COALESCE(tp.today_fp, 0))::INT AS pts
+    FROM users u
+    LEFT JOIN today_points tp ON tp.user_id = u.id
+    WHERE u.team IS NOT NULL
+      AND (u.season_points - COALESCE(tp.today_fp, 0)) > 0
+  )
+  INSERT INTO leaderboard_entries (scope, scope_hex, user_id, name, season_points)
+  SELECT 'global', '', e.id, e.name, e.pts FROM eligible e
+  UNION ALL
+  SELECT 'province', e.province_hex, e.id, e.name, e.pts FROM eligible e WHERE e.province_hex IS NOT NULL
+  UNION ALL
+  SELECT 'district', e.district_hex, e.id, e.name, e.pts FROM eligible e WHERE e.district_hex IS NOT NULL;
+  GET DIAGNOSTICS v_rows = ROW_COUNT;
+
+  INSERT INTO leaderboard_totals (scope, scope_hex, total)
+  SELECT scope, scope_hex, COUNT(*) FROM leaderboard_entries GROUP BY scope, scope_hex;
+
+  UPDATE leaderboard_meta SET as_of = v_today, rebuilt_at = now(), refreshed_at = now();
+
+  RETURN jsonb_build_object('mode', 'rebuild', 'as_of', v_today, 'rows', v_rows);
+END;
+$$;
+
+
+-- =============================================================================
+-- STEP 3: Cron entry point (every minute)
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.refresh_leaderboard()
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  v_today   DATE := (NOW() AT TIME ZONE 'Etc/GMT-2')::DATE;
+  v_as_of   DATE;
+  v_users   INT;
+  v_removed INT;
+  v_added   INT;
+BEGIN
+  -- One refresh at a time; a run that overlaps the previous one just skips.
+  IF NOT pg_try_advisory_xact_lock(hashtext('refresh_leaderboard')) THEN
+    RETURN jsonb_build_object('mode', 'skipped');
+  END IF;
+
+  SELECT as_of INTO v_as_of FROM leaderboard_meta;
+  IF v_as_of IS DISTINCT FROM v_today THEN
+    RETURN rebuild_leaderboard();
+  END IF;
+
+  -- Dirty users with points recomputed from users / run_history
+  -- (pts NULL = no longer on any board)
+  CREATE TEMP TABLE _leaderboard_moves (
+    user_id UUID, name TEXT, pts INT, province_hex TEXT, district_hex TEXT
+  ) ON COMMIT DROP;
+
+  WITH drained AS (
+    DELETE FROM leaderboard_dirty RETURNING user_id
+  )
+  INSERT INTO _leaderboard_moves
+  SELECT u.id, u.name,
+         CASE WHEN u.team IS NOT NULL AND u.season_points - COALESCE(tp.today_fp, 0) > 0
+              THEN (u.season_points - COALESCE(tp.today_fp, 0))::INT END,
+         u.province_hex, u.district_hex
+  FROM drained d
+  JOIN users u ON u.id = d.user_id
+  LEFT JOIN LATERAL (
+    SELECT SUM(r.flip_points)::INT AS today_fp
+    FROM run_history r
+    WHERE r.user_id = u.id AND r.run_date = v_today
+  ) tp ON true;
+  GET DIAGNOSTICS v_users = ROW_COUNT;
+
+  -- Board sizes: -1 per entry removed, +1 per entry added
+  CREATE TEMP TABLE _leaderboard_size_delta (scope TEXT, scope_hex TEXT, delta INT) ON COMMIT DROP;
+
+  WITH removed AS (
+    DELETE FROM leaderboard_entries le
+    USING _leaderboard_moves m
+    WHERE le.user_id = m.user_id
+    RETURNING le.scope, le.scope_hex
+  )
+  INSERT INTO _leaderboard_size_delta SELECT scope, scope_hex, -1 FROM removed;
+  GET DIAGNOSTICS v_removed = ROW_COUNT;
+
+  WITH added AS (
+    INSERT INTO leaderboard_entries (scope, scope_hex, user_id, name, season_points)
+    SELECT t.scope, t.scope_hex, m.user_id, m.name, m.pts
+    FROM _leaderboard_moves m
+    CROSS JOIN LATERAL (VALUES ('global', ''), ('province', m.province_hex), ('district', m.district_hex))
+      AS t(scope, scope_hex)
+    WHERE m.pts IS NOT NULL AND t.scope_hex IS NOT NULL
+    RETURNING scope, scope_hex
+  )
+  INSERT INTO _leaderboard_size_delta SELECT scope, scope_hex, 1 FROM added;
+  GET DIAGNOSTICS v_added = ROW_COUNT;
+
+  INSERT INTO leaderboard_totals (scope, scope_hex, total)
+  SELECT scope, scope_hex, SUM(delta) FROM _leaderboard_size_delta GROUP BY scope, scope_hex
+  ON CONFLICT (scope, scope_hex) DO UPDATE SET total = leaderboard_totals.total + EXCLUDED.total;
+
+  UPDATE leaderboard_meta SET refreshed_at = now();
+
+  RETURN jsonb_build_object('mode', 'incremental', 'as_of', v_today, 'users', v_users,
+                            'removed', v_removed, 'added', v_added);
+END;
+$$;
+
+
+-- =============================================================================
+-- STEP 4: Mark late syncs dirty
+-- =============================================================================
+-- finalize_run() inserts one run_history row per run. Runs from today do not
+-- move the board (their points are subtracted), so only earlier run_dates
+-- are queued.
+
+CREATE OR REPLACE FUNCTION public.queue_leaderboard_dirty()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  IF NEW.run_date < (NOW() AT TIME ZONE 'Etc/GMT-2')::DATE AND NEW.flip_points <> 0 THEN
+    INSERT INTO leaderboard_dirty (user_id) VALUES (NEW.user_id)
+    ON CONFLICT (user_id) DO NOTHING;
+  END IF;
+  RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_run_history_leaderboard_dirty ON public.run_history;
+
+CREATE TRIGGER trg_run_history_leaderboard_dirty
+  AFTER INSERT ON public.run_history
+  FOR EACH ROW EXECUTE FUNCTION public.queue_leaderboard_dirty();
+
+
+-- =============================================================================
+-- STEP 5: Read RPCs
+-- =============================================================================
+
+-- The boards computed live, same rows as leaderboard_entries would hold now.
+-- Fallback for the read RPCs while the board is not as of today. Plain SQL
+-- without SET so the planner can inline it; every name is schema-qualified.
+CREATE OR REPLACE FUNCTION public.leaderboard_live_entries()
+RETURNS TABLE (scope TEXT, scope_hex TEXT, user_id UUID, name TEXT, season_points INT)
+LANGUAGE sql STABLE
+AS $$
+  WITH today_points AS (
+    SELECT r.user_id, SUM(r.flip_points)::INT AS today_fp
+    FROM public.run_history r
+    WHERE r.run_date = (NOW() AT TIME ZONE 'Etc/GMT-2')::DATE
+    GROUP BY r.user_id
+  ),
+  eligible AS (
+    SELECT u.id, u.name, u.province_hex, u.district_hex,
+           (u.season_points - COALESCE(tp.today_fp, 0))::INT AS pts
+    FROM public.users u
+    LEFT JOIN today_points tp ON tp.user_id = u.id
+    WHERE u.team IS NOT NULL
+      AND (u.season_points - COALESCE(tp.today_fp, 0)) > 0
+  )
+  SELECT 'global', '', e.id, e.name, e.pts FROM eligible e
+  UNION ALL
+  SELECT 'province', e.province_hex, e.id, e.name, e.pts FROM eligible e WHERE e.province_hex IS NOT NULL
+  UNION ALL
+  SELECT 'district', e.district_hex, e.id, e.name, e.pts FROM eligible e WHERE e.district_hex IS NOT NULL;
+$$;
+
+-- get_leaderboard_rank() over leaderboard_live_entries(): O(users), like the
+-- get_leaderboard() fallback.
+CREATE OR REPLACE FUNCTION public.leaderboard_live_rank(p_user_id UUID)
+RETURNS JSONB
+LANGUAGE sql STABLE
+AS $$
+  WITH live AS MATERIALIZED (
+    SELECT * FROM public.leaderboard_live_entries()
+  )
+  SELECT COALESCE(jsonb_object_agg(me.scope, jsonb_build_object(
+    'scope_hex', me.scope_hex,
+    'rank', 1
+      + (SELECT COUNT(*) FROM live o
+         WHERE o.scope = me.scope AND o.scope_hex = me.scope_hex
+           AND (o.season_points > me.season_points
+                OR (o.season_points = me.season_points AND (o.name, o.user_id) < (me.name, me.user_id)))),
+    'season_points', me.season_points,
+    'total', (SELECT COUNT(*) FROM live o WHERE o.scope = me.scope AND o.scope_hex = me.scope_hex)
+  )), '{}'::jsonb)
+  FROM live me
+  WHERE me.user_id = p_user_id;
+$$;
+
+-- Same signature and shape as 20260303000005; reads the global board, and
+-- falls back to the live sort when the board is not as of today.
+CREATE OR REPLACE FUNCTION public.get_leaderboard(p_limit INTEGER DEFAULT 200)
+RETURNS TABLE (
+  id UUID, name TEXT, team TEXT, avatar TEXT,
+  season_points INT, total_distance_km FLOAT8,
+  avg_pace_min_per_km FLOAT8, avg_cv FLOAT8,
+  home_hex TEXT, home_hex_end TEXT, manifesto TEXT,
+  nationality TEXT, total_runs INT, rank BIGINT,
+  district_hex TEXT
+)
+LANGUAGE plpgsql STABLE SECURITY DEFINER
+SET search_path = public
+AS $fn$
+BEGIN
+  IF (SELECT m.as_of FROM leaderboard_meta m) = (NOW() AT TIME ZONE 'Etc/GMT-2')::DATE THEN
+    RETURN QUERY
+    WITH top AS (
+      SELECT le.user_id, le.season_points,
+             ROW_NUMBER() OVER (ORDER BY le.season_points DESC, le.name, le.user_id) AS rn
+      FROM leaderboard_entries le
+      WHERE le.scope = 'global' AND le.scope_hex = ''
+      ORDER BY le.season_points DESC, le.name, le.user_id
+      LIMIT p_limit
+    )
+    SELECT
+      u.id, u.name, u.team, u.avatar,
+      t.season_points,
+      u.total_distance_km,
+      u.avg_pace_min_per_km, u.avg_cv,
+      u.home_hex, u.home_hex_end,
+      u.manifesto, u.nationality, u.total_runs,
+      t.rn,
+      u.district_hex
+    FROM top t
+    JOIN users u ON u.id = t.user_id
+    ORDER BY t.rn;
+    RETURN;
+  END IF;
+
+  RETURN QUERY
+  WITH today_points AS (
+    SELECT
+      r.user_id,
+      COALESCE(SUM(r.flip_points), 0)::INT AS today_fp
+    FROM run_history r
+    WHERE r.run_date = (NOW() AT TIME ZONE 'Etc/GMT-2')::DATE
+    GROUP BY r.user_id
+  )
+  SELECT
+    u.id, u.name, u.team, u.avatar,
+    (u.season_points - COALESCE(tp.today_fp, 0))::INT,
+    u.total_distance_km,
+    u.avg_pace_min_per_km, u.avg_cv,
+    u.home_hex, u.home_hex_end,
+    u.manifesto, u.nationality, u.total_runs,
+    ROW_NUMBER() OVER (
+      ORDER BY (u.season_points - COALESCE(tp.today_fp, 0)) DESC, u.name ASC
+    ),
+    u.district_hex
+  FROM public.users u
+  LEFT JOIN today_points tp ON tp.user_id = u.id
+  WHERE (u.season_points - COALESCE(tp.today_fp, 0)) > 0
+    AND u.team IS NOT NULL
+  ORDER BY (u.season_points - COALESCE(tp.today_fp, 0)) DESC, u.name ASC
+  LIMIT p_limit;
+END;
+$fn$;
+
+-- Replaces the debug version from 20260216070853, which ignored its scope.
+-- p_scope_resolution: 5 = province (Res-5 parent), 6 = district, else global.
+-- Like get_leaderboard(), reads the live boards when the board is not as of
+-- today; the one-time filter means only one branch of `board` runs.
+CREATE OR REPLACE FUNCTION public.get_scoped_leaderboard(
+  p_parent_hex TEXT,
+  p_scope_resolution INTEGER,
+  p_limit INTEGER DEFAULT 100
+)
+RETURNS SETOF jsonb
+LANGUAGE sql STABLE SECURITY DEFINER
+SET search_path = public
+AS $$
+  WITH fresh AS (
+    SELECT COALESCE((SELECT m.as_of FROM leaderboard_meta m) = (NOW() AT TIME ZONE 'Etc/GMT-2')::DATE,
+                    false) AS ok
+  ),
+  board AS (
+    SELECT le.scope, le.scope_hex, le.user_id, le.name, le.season_points
+    FROM leaderboard_entries le
+    WHERE (SELECT ok FROM fresh)
+    UNION ALL
+    SELECT lv.scope, lv.scope_hex, lv.user_id, lv.name, lv.season_points
+    FROM leaderboard_live_entries() lv
+    WHERE NOT (SELECT ok FROM fresh)
+  ),
+  top AS (
+    SELECT le.user_id, le.season_points,
+           ROW_NUMBER() OVER (ORDER BY le.season_points DESC, le.name, le.user_id) AS rank
+    FROM board le
+    WHERE le.scope = CASE p_scope_resolution WHEN 5 THEN 'province' WHEN 6 THEN 'district' ELSE 'global' END
+      AND le.scope_hex = CASE WHEN p_scope_resolution IN (5, 6) THEN p_parent_hex ELSE '' END
+    ORDER BY le.season_points DESC, le.name, le.user_id
+    LIMIT p_limit
+  )
+  SELECT to_jsonb(sub) FROM (
+    SELECT
+      u.id AS user_id,
+      u.name,
+      u.avatar,
+      u.team,
+      t.season_points AS flip_points,
+      u.total_distance_km,
+      u.avg_pace_min_per_km,
+      u.home_hex,
+      u.manifesto,
+      u.nationality,
+      CASE WHEN u.avg_cv IS NOT NULL
+        THEN (100 - u.avg_cv)::INTEGER
+        ELSE NULL END AS stability_score,
+      t.rank
+    FROM top t
+    JOIN users u ON u.id = t.user_id
+    ORDER BY t.rank
+  ) sub;
+$$;
+
+-- The caller's own position on each board: {scope: {scope_hex, rank, season_points, total}}.
+-- A scope is absent when the user is not on that board. Falls back to the
+-- live boards when the board is not as of today.
+CREATE OR REPLACE FUNCTION public.get_leaderboard_rank(p_user_id UUID)
+RETURNS JSONB
+LANGUAGE plpgsql STABLE SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  IF (SELECT m.as_of FROM leaderboard_meta m) IS DISTINCT FROM (NOW() AT TIME ZONE 'Etc/GMT-2')::DATE THEN
+    RETURN leaderboard_live_rank(p_user_id);
+  END IF;
+
+  RETURN (
+    SELECT COALESCE(jsonb_object_agg(me.scope, jsonb_build_object(
+      'scope_hex', me.scope_hex,
+      'rank', 1
+        + (SELECT COUNT(*) FROM leaderboard_entries o
+           WHERE o.scope = me.scope AND o.scope_hex = me.scope_hex
+             AND o.season_points > me.season_points)
+        + (SELECT COUNT(*) FROM leaderboard_entries o
+           WHERE o.scope = me.scope AND o.scope_hex = me.scope_hex
+             AND o.season_points = me.season_points AND (o.name, o.user_id) < (me.name, me.user_id)),
+      'season_points', me.season_points,
+      'total', (SELECT t.total FROM leaderboard_totals t
+                WHERE t.scope = me.scope AND t.scope_hex = me.scope_hex)
+    )), '{}'::jsonb)
+    FROM leaderboard_entries me
+    WHERE me.user_id = p_user_id
+  );
+END;
+$$;
+
+
+-- =============================================================================
+-- STEP 6: Grants + initial build
+-- =============================================================================
+
+GRANT EXECUTE ON FUNCTION public.get_leaderboard(INTEGER) TO authenticated, anon;
+GRANT EXECUTE ON FUNCTION public.get_scoped_leaderboard(TEXT, INTEGER, INTEGER) TO authenticated, anon;
+GRANT EXECUTE ON FUNCTION public.get_leaderboard_rank(UUID) TO authenticated, anon;
+
+REVOKE EXECUTE ON FUNCTION public.leaderboard_live_entries() FROM PUBLIC;
+REVOKE EXECUTE ON FUNCTION public.leaderboard_live_rank(UUID) FROM PUBLIC;
+REVOKE EXECUTE ON FUNCTION public.rebuild_leaderboard() FROM PUBLIC;
+REVOKE EXECUTE ON FUNCTION public.refresh_leaderboard() FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.rebuild_leaderboard() TO service_role;
+GRANT EXECUTE ON FUNCTION public.refresh_leaderboard() TO service_role;
+
+SELECT public.rebuild_leaderboard();
+
+NOTIFY pgrst, 'reload schema';
@@ -0,0 +1,256 @@
+-- =============================================================================
+-- Leaderboard rank index — leaderboard_rank_buckets
+-- =============================================================================
+-- PROBLEM:
+--   get_leaderboard_rank() (20260308000005) counts every leaderboard entry
+--   ahead of the caller. That costs O(rank): ~0.5s p50 per call at 1M users,
+--   on a screen that opens with every leaderboard view.
+--
+-- FIX:
+--   leaderboard_rank_buckets holds, per board, the entry counts for
+--   power-of-two point ranges:
+--     (scope, scope_hex, level L, bucket b) = entries whose season_points >> L = b
+--   for L = 0..30, which covers every positive INT.
+--
+--   The number of entries with more points than p:
+--     SUM over L where bit L of p is 0 of count(L, (p >> L) + 1)
+--   Every x > p is counted exactly once, at the highest bit L where x and p
+--   differ. That is at most 31 primary key probes, whatever the board size.
+--   Entries tied on points are then counted through the rank-order index of
+--   leaderboard_entries: O(size of the tie group), not O(rank).
+--
+--   Maintenance: an entry adds 1 to one bucket per level.
+--     - rebuild_leaderboard() recomputes the buckets from the per-board
+--       point histogram.
+--     - refresh_leaderboard() applies +1 / -1 for the entries it moves.
+--   Buckets that drop to 0 stay until the next rebuild; they count nothing.
+--
+--   test_simulation/leaderboard_rank_index.py is the Python reference of the
+--   same structure. It checks both the reference and this SQL against a
+--   brute-force sort after every simulated day.
+-- =============================================================================
+
+
+-- =============================================================================
+-- STEP 1: Table
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS public.leaderboard_rank_buckets (
+  scope      TEXT     NOT NULL,
+  scope_hex  TEXT     NOT NULL,
+  level      SMALLINT NOT NULL,   -- 0..30
+  bucket     INT      NOT NULL,   -- season_points >> level
+  n          INT      NOT NULL,
+  PRIMARY KEY (scope, scope_hex, level, bucket)
+);
+
+ALTER TABLE public.leaderboard_rank_buckets ENABLE ROW LEVEL SECURITY;
+
+
+-- =============================================================================
+-- STEP 2: rebuild_leaderboard — also rebuild the buckets
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.rebuild_leaderboard()
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  v_today DATE := (NOW() AT TIME ZONE 'Etc/GMT-2')::DATE;
+  v_rows  BIGINT;
+BEGIN
+  -- Clear the dirty set first: every user it held is visible to the rebuild
+  -- below, which runs on a later snapshot.
+  DELETE FROM leaderboard_dirty;
+
+  -- DELETE, not TRUNCATE: readers keep seeing the old board until commit.
+  DELETE FROM leaderboard_entries;
+  DELETE FROM leaderboard_totals;
+  DELETE FROM leaderboard_rank_buckets;
+
+  WITH today_points AS (
+    SELECT r.user_id, SUM(r.flip_points)::INT AS today_fp
+    FROM run_history r
+    WHERE r.run_date = v_today
+    GROUP BY r.user_id
+  ),
+  eligible AS (
+    SELECT u.id, u.name, u.province_hex, u.district_hex,
+           (u.season_points - COALESCE(tp.today_fp, 0))::INT AS pts
+    FROM users u
+    LEFT JOIN today_points tp ON tp.user_id = u.id
+    WHERE u.team IS NOT NULL
+      AND (u.season_points - COALESCE(tp.today_fp, 0)) > 0
+  )
+  INSERT INTO leaderboard_entries (scope, scope_hex, user_id, name, season_points)
+  SELECT 'global', '', e.id, e.name, e.pts FROM eligible e
+  UNION ALL
+  SELECT 'province', e.province_hex, e.id, e.name, e.pts FROM eligible e WHERE e.province_hex IS NOT NULL
+  UNION ALL
+  SELECT 'district', e.district_hex, e.id, e.name, e.pts FROM eligible e WHERE e.district_hex IS NOT NULL;
+  GET DIAGNOSTICS v_rows = ROW_COUNT;
+
+  INSERT INTO leaderboard_totals (scope, scope_hex, total)
+  SELECT scope, scope_hex, COUNT(*) FROM leaderboard_entries GROUP BY scope, scope_hex;
+
+  -- Per-board histogram first (one row per distinct points value), then one
+  -- bucket per level
+  WITH histogram AS (
+    SELECT scope, scope_hex, season_points, COUNT(*)::INT AS n
+    FROM leaderboard_entries
+    GROUP BY scope, scope_hex, season_points
+  )
+  INSERT INTO leaderboard_rank_buckets (scope, scope_hex, level, bucket, n)
+  SELECT h.scope, h.scope_hex, l.level, h.season_points >> l.level, SUM(h.n)
+  FROM histogram h
+  CROSS JOIN generate_series(0, 30) AS l(level)
+  GROUP BY h.scope, h.scope_hex, l.level, h.season_points >> l.level;
+
+  UPDATE leaderboard_meta SET as_of = v_today, rebuilt_at = now(), refreshed_at = now();
+
+  RETURN jsonb_build_object('mode', 'rebuild', 'as_of', v_today, 'rows', v_rows);
+END;
+$$;
+
+
+-- =============================================================================
+-- STEP 3: refresh_leaderboard — apply bucket deltas for moved entries
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.refresh_leaderboard()
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  v_today   DATE := (NOW() AT TIME ZONE 'Etc/GMT-2')::DATE;
+  v_as_of   DATE;
+  v_users   INT;
+  v_removed INT;
+  v_added   INT;
+BEGIN
+  -- One refresh at a time; a run that overlaps the previous one just skips.
+  IF NOT pg_try_advisory_xact_lock(hashtext('refresh_leaderboard')) THEN
+    RETURN jsonb_build_object('mode', 'skipped');
+  END IF;
+
+  SELECT as_of INTO v_as_of FROM leaderboard_meta;
+  IF v_as_of IS DISTINCT FROM v_today THEN
+    RETURN rebuild_leaderboard();
+  END IF;
+
+  -- Dirty users with points recomputed from users / run_history
+  -- (pts NULL = no longer on any board)
+  CREATE TEMP TABLE _leaderboard_moves (
+    user_id UUID, name TEXT, pts INT, province_hex TEXT, district_hex TEXT
+  ) ON COMMIT DROP;
+
+  WITH drained AS (
+    DELETE FROM leaderboard_dirty RETURNING user_id
+  )
+  INSERT INTO _leaderboard_moves
+  SELECT u.id, u.name,
+         CASE WHEN u.team IS NOT NULL AND u.season_points - COALESCE(tp.today_fp, 0) > 0
+              THEN (u.season_points - COALESCE(tp.today_fp, 0))::INT END,
+         u.province_hex, u.district_hex
+  FROM drained d
+  JOIN users u ON u.id = d.user_id
+  LEFT JOIN LATERAL (
+    SELECT SUM(r.flip_points)::INT AS today_fp
+    FROM run_history r
+    WHERE r.user_id = u.id AND r.run_date = v_today
+  ) tp ON true;
+  GET DIAGNOSTICS v_users = ROW_COUNT;
+
+  -- -1 per entry removed, +1 per entry added, with the entry's points
+  CREATE TEMP TABLE _leaderboard_size_delta (
+    scope TEXT, scope_hex TEXT, season_points INT, delta INT
+  ) ON COMMIT DROP;
+
+  WITH removed AS (
+    DELETE FROM leaderboard_entries le
+    USING _leaderboard_moves m
+    WHERE le.user_id = m.user_id
+    RETURNING le.scope, le.scope_hex, le.season_points
+  )
+  INSERT INTO _leaderboard_size_delta SELECT scope, scope_hex, season_points, -1 FROM removed;
+  GET DIAGNOSTICS v_removed = ROW_COUNT;
+
+  WITH added AS (
+    INSERT INTO leaderboard_entries (scope, scope_hex, user_id, name, season_points)
+    SELECT t.scope, t.scope_hex, m.user_id, m.name, m.pts
+    FROM _leaderboard_moves m
+    CROSS JOIN LATERAL (VALUES ('global', ''), ('province', m.province_hex), ('district', m.district_hex))
+      AS t(scope, scope_hex)
+    WHERE m.pts IS NOT NULL AND t.scope_hex IS NOT NULL
+    RETURNING scope, scope_hex, season_points
+  )
+  INSERT INTO _leaderboard_size_delta SELECT scope, scope_hex, season_points, 1 FROM added;
+  GET DIAGNOSTICS v_added = ROW_COUNT;
+
+  INSERT INTO leaderboard_totals (scope, scope_hex, total)
+  SELECT scope, scope_hex, SUM(delta) FROM _leaderboard_size_delta GROUP BY scope, scope_hex
+  ON CONFLICT (scope, scope_hex) DO UPDATE SET total = leaderboard_totals.total + EXCLUDED.total;
+
+  INSERT INTO leaderboard_rank_buckets (scope, scope_hex, level, bucket, n)
+  SELECT d.scope, d.scope_hex, l.level, d.season_points >> l.level, SUM(d.delta)
+  FROM _leaderboard_size_delta d
+  CROSS JOIN generate_series(0, 30) AS l(level)
+  GROUP BY d.scope, d.scope_hex, l.level, d.season_points >> l.level
+  ON CONFLICT (scope, scope_hex, level, bucket) DO UPDATE SET n = leaderboard_rank_buckets.n + EXCLUDED.n;
+
+  UPDATE leaderboard_meta SET refreshed_at = now();
+
+  RETURN jsonb_build_object('mode', 'incremental', 'as_of', v_today, 'users', v_users,
+                            'removed', v_removed, 'added', v_added);
+END;
+$$;
+
+
+-- =============================================================================
+-- STEP 4: get_leaderboard_rank — bucket probes + tie group count
+-- =============================================================================
+
+-- Falls back to leaderboard_live_rank() (20260308000005) when the board is
+-- not as of today, like get_leaderboard().
+CREATE OR REPLACE FUNCTION public.get_leaderboard_rank(p_user_id UUID)
+RETURNS JSONB
+LANGUAGE plpgsql STABLE SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+  IF (SELECT m.as_of FROM leaderboard_meta m) IS DISTINCT FROM (NOW() AT TIME ZONE 'Etc/GMT-2')::DATE THEN
+    RETURN leaderboard_live_rank(p_user_id);
+  END IF;
+
+  RETURN (
+    SELECT COALESCE(jsonb_object_agg(me.scope, jsonb_build_object(
+      'scope_hex', me.scope_hex,
+      'rank', 1
+        + (SELECT COALESCE(SUM(b.n), 0) FROM leaderboard_rank_buckets b
+           WHERE b.scope = me.scope AND b.scope_hex = me.scope_hex
+             AND (b.level, b.bucket) IN (
+               SELECT l.level, (me.season_points >> l.level) + 1
+               FROM generate_series(0, 30) AS l(level)
+               WHERE (me.season_points >> l.level) & 1 = 0))
+        + (SELECT COUNT(*) FROM leaderboard_entries o
+           WHERE o.scope = me.scope AND o.scope_hex = me.scope_hex
+             AND o.season_points = me.season_points AND (o.name, o.user_id) < (me.name, me.user_id)),
+      'season_points', me.season_points,
+      'total', (SELECT t.total FROM leaderboard_totals t
+                WHERE t.scope = me.scope AND t.scope_hex = me.scope_hex)
+    )), '{}'::jsonb)
+    FROM leaderboard_entries me
+    WHERE me.user_id = p_user_id
+  );
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.get_leaderboard_rank(UUID) TO authenticated, anon;
+
+SELECT public.rebuild_leaderboard();
+
+NOTIFY pgrst, 'reload schema';
@@ -0,0 +1,530 @@
+-- =============================================================================
+-- Buffered hexes updates — hex_flip_queue + apply_hex_flip_queue()
+-- =============================================================================
+-- PROBLEM:
+--   finalize_run() upserts every cell of the run's path into hexes inside the
+--   sync transaction: one row lock and one new row version per cell. hexes is
+--   only read by the buff / dominance calculations, and hex_snapshot is built
+--   from runs at midnight, so nobody needs the update before the sync returns.
+--   Runners sharing a park loop also wait on each other's row locks
+--   (test_simulation/bench_hex_contention.py).
+--
+-- FIX:
+--   Buffered mode (hex_flip_queue_meta.buffered = true): finalize_run() still
+--   writes users and run_history, but appends the path to hex_flip_queue
+--   instead of upserting hexes. One row per run, no lock on shared rows.
+--
+--   apply_hex_flip_queue() drains the queue every few seconds:
+--     - takes the oldest p_batch_size runs (NULL = all)
+--     - keeps one flip per hex: latest end_time wins, the earlier-synced run
+--       on a tie (what the inline upsert keeps too)
+--     - upserts them in hex id order, only moving a row forward in time
+--   A hex flipped by many runs in one batch is written once.
+--
+--   The inline path is unchanged and stays the default. Switching in either
+--   direction is safe at any time: queued flips never overwrite a later one.
+--
+-- SETUP (run ONCE in Supabase SQL Editor after applying this migration):
+--   SELECT cron.schedule(
+--     'apply-hex-flip-queue',
+--     '10 seconds',
+--     'SELECT apply_hex_flip_queue()'
+--   );
+--   Drain the queue in the 22:00 UTC jobs that read hexes, so they see
+--   every run synced before them, e.g.:
+--     'SELECT apply_hex_flip_queue(NULL); SELECT calculate_daily_buffs()'
+--   The 21:55 UTC season reset needs no change: reset_season() and
+--   reset_season_batched() (STEP 4) drain and clear the queue themselves
+--   before wiping hexes.
+--   Then: UPDATE hex_flip_queue_meta SET buffered = true;
+--
+-- test_simulation/hex_flip_worker.py runs the same loop locally without
+-- pg_cron. test_simulation/bench_buffered_hexes.py compares finalize_run()
+-- latency, WAL volume and the resulting hexes in both modes.
+-- =============================================================================
+
+
+-- =============================================================================
+-- STEP 1: Tables
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS public.hex_flip_queue (
+  id                    BIGSERIAL   PRIMARY KEY,
+  team                  TEXT        NOT NULL,
+  end_time              TIMESTAMPTZ NOT NULL,
+  hex_path              TEXT[]      NOT NULL,
+  hex_parents           TEXT[],     -- Res-5 province parent per hex
+  hex_district_parents  TEXT[]      -- Res-6 district parent per hex
+);
+
+CREATE TABLE IF NOT EXISTS public.hex_flip_queue_meta (
+  id          BOOLEAN PRIMARY KEY DEFAULT true CHECK (id),
+  buffered    BOOLEAN NOT NULL DEFAULT false,
+  applied_at  TIMESTAMPTZ
+);
+
+INSERT INTO public.hex_flip_queue_meta (id) VALUES (true) ON CONFLICT DO NOTHING;
+
+ALTER TABLE public.hex_flip_queue ENABLE ROW LEVEL SECURITY;
+ALTER TABLE public.hex_flip_queue_meta ENABLE ROW LEVEL SECURITY;
+
+
+-- =============================================================================
+-- STEP 2: finalize_run — queue the path in buffered mode
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.finalize_run(
+  p_user_id               UUID,
+  p_start_time            TIMESTAMPTZ,
+  p_end_time              TIMESTAMPTZ,
+  p_distance_km           DOUBLE PRECISION,
+  p_duration_seconds      INTEGER,
+  p_hex_path              TEXT[],
+  p_buff_multiplier       INTEGER    DEFAULT 1,
+  p_cv                    DOUBLE PRECISION DEFAULT NULL,
+  p_client_points         INTEGER    DEFAULT 0,
+  p_home_region_flips     INTEGER    DEFAULT 0,
+  p_hex_parents           TEXT[]     DEFAULT NULL,  -- Res-5 province parent per hex
+  p_district_hex          TEXT       DEFAULT NULL,  -- User's Res-6 district
+  p_hex_district_parents  TEXT[]     DEFAULT NULL   -- Res-6 district parent per hex
+)
+RETURNS jsonb
+LANGUAGE plpgsql SECURITY DEFINER
+AS $$
+DECLARE
+  v_team                TEXT;
+  v_hex_id              TEXT;
+  v_points              INTEGER;
+  v_max_allowed_points  INTEGER;
+  v_flip_count          INTEGER;
+  v_current_flipped_at  TIMESTAMPTZ;
+  v_parent_hex          TEXT;
+  v_district_parent_hex TEXT;
+  v_province_hex        TEXT;  -- Res-5, derived from p_hex_parents[1]
+  v_idx                 INTEGER;
+  v_run_history_id      UUID;
+  v_buffered            BOOLEAN;
+  v_server_buff         JSONB;
+  v_validated_multiplier INTEGER;
+BEGIN
+  -- Get user's team
+  SELECT team INTO v_team FROM public.users WHERE id = p_user_id;
+
+  IF v_team IS NULL THEN
+    RAISE EXCEPTION 'User not found or has no team assigned';
+  END IF;
+
+  -- Derive province_hex (Res-5) from first hex's parent (all hexes in one run
+  -- share the same province parent when running within home province)
+  IF p_hex_parents IS NOT NULL AND array_length(p_hex_parents, 1) > 0 THEN
+    v_province_hex := p_hex_parents[1];
+  END IF;
+
+  -- Pre-populate users.province_hex BEFORE calling get_user_buff() so that
+  -- province win is evaluated correctly even on a user's very first run.
+  IF v_province_hex IS NOT NULL THEN
+    UPDATE public.users
+    SET province_hex = v_province_hex
+    WHERE id = p_user_id AND province_hex IS NULL;
+  END IF;
+
+  -- Server-side buff validation: client cannot claim higher than server allows
+  v_server_buff := public.get_user_buff(p_user_id, p_district_hex);
+  v_validated_multiplier := GREATEST((v_server_buff->>'multiplier')::INTEGER, 1);
+
+  -- Use lower of client and server multiplier (anti-cheat)
+  IF p_buff_multiplier < v_validated_multiplier THEN
+    v_validated_multiplier := p_buff_multiplier;
+  END IF;
+
+  -- [SECURITY] Cap validation: client points ≤ hex_path_length × validated_multiplier
+  v_max_allowed_points := COALESCE(array_length(p_hex_path, 1), 0) * v_validated_multiplier;
+  v_points := LEAST(COALESCE(p_client_points, 0), v_max_allowed_points);
+  v_flip_count := CASE
+    WHEN v_validated_multiplier > 0 THEN v_points / v_validated_multiplier
+    ELSE 0
+  END;
+
+  IF p_client_points > v_max_allowed_points THEN
+    RAISE WARNING 'Client claimed % points but max allowed is %. Capped.',
+      p_client_points, v_max_allowed_points;
+  END IF;
+
+  -- Update live hexes table (for buff/dominance calculations only)
+  -- hex_snapshot is immutable until midnight build
+  -- Buffered mode: queue the path; apply_hex_flip_queue() upserts it later
+  SELECT buffered INTO v_buffered FROM public.hex_flip_queue_meta;
+
+  IF p_hex_path IS NOT NULL AND array_length(p_hex_path, 1) > 0 THEN
+    IF v_buffered THEN
+      INSERT INTO public.hex_flip_queue (team, end_time, hex_path, hex_parents, hex_district_parents)
+      VALUES (v_team, p_end_time, p_hex_path, p_hex_parents, p_hex_district_parents);
+    ELSE
+      v_idx := 1;
+      FOREACH v_hex_id IN ARRAY p_hex_path LOOP
+        v_parent_hex := NULL;
+        v_district_parent_hex := NULL;
+
+        IF p_hex_parents IS NOT NULL AND v_idx <= array_length(p_hex_parents, 1) THEN
+          v_parent_hex := p_hex_parents[v_idx];
+        END IF;
+
+        IF p_hex_district_parents IS NOT NULL AND v_idx <= array_length(p_hex_district_parents, 1) THEN
+          v_district_parent_hex := p_hex_district_parents[v_idx];
+        END IF;
+
+        SELECT last_flipped_at INTO v_current_flipped_at
+        FROM public.hexes WHERE id = v_hex_id;
+
+        IF v_current_flipped_at IS NULL OR p_end_time > v_current_flipped_at THEN
+          INSERT INTO public.hexes (id, last_runner_team, last_flipped_at, parent_hex, district_hex)
+          VALUES (v_hex_id, v_team, p_end_time, v_parent_hex, v_district_parent_hex)
+          ON CONFLICT (id) DO UPDATE
+          SET last_runner_team = v_team,
+              last_flipped_at  = p_end_time,
+              parent_hex       = COALESCE(EXCLUDED.parent_hex,    public.hexes.parent_hex),
+              district_hex     = COALESCE(EXCLUDED.district_hex,  public.hexes.district_hex)
+          WHERE public.hexes.last_flipped_at IS NULL
+             OR public.hexes.last_flipped_at < p_end_time;
+        END IF;
+
+        v_idx := v_idx + 1;
+      END LOOP;
+    END IF;
+  END IF;
+
+  -- Update user stats (season_points, distance, pace, cv, home hexes, district, province)
+  UPDATE public.users SET
+    season_points       = season_points + v_points,
+    home_hex            = CASE
+                            WHEN home_hex IS NULL
+                              AND p_hex_path IS NOT NULL
+                              AND array_length(p_hex_path, 1) > 0
+                            THEN p_hex_path[1]
+                            ELSE home_hex
+                          END,
+    home_hex_end        = CASE
+                            WHEN p_hex_path IS NOT NULL
+                              AND array_length(p_hex_path, 1) > 0
+                            THEN p_hex_path[array_length(p_hex_path, 1)]
+                            ELSE home_hex_end
+                          END,
+    season_home_hex     = CASE
+                            WHEN season_home_hex IS NULL
+                              AND p_hex_path IS NOT NULL
+                              AND array_length(p_hex_path, 1) > 0
+                            THEN p_hex_path[1]
+                            ELSE season_home_hex
+                          END,
+    district_hex        = COALESCE(p_district_hex, district_hex),
+    province_hex        = COALESCE(v_province_hex, province_hex),  -- NEW: Res-5
+    total_distance_km   = total_distance_km + p_distance_km,
+    total_runs          = total_runs + 1,
+    avg_pace_min_per_km = CASE
+                            WHEN p_distance_km > 0 THEN
+                              (COALESCE(avg_pace_min_per_km, 0) * total_runs
+                               + (p_duration_seconds / 60.0) / p_distance_km)
+                              / (total_runs + 1)
+                            ELSE avg_pace_min_per_km
+                          END,
+    avg_cv              = CASE
+                            WHEN p_cv IS NOT NULL THEN
+                              (COALESCE(avg_cv, 0) * cv_run_count + p_cv)
+                              / (cv_run_count + 1)
+                            ELSE avg_cv
+                          END,
+    cv_run_count        = CASE
+                            WHEN p_cv IS NOT NULL THEN cv_run_count + 1
+                            ELSE cv_run_count
+                          END
+  WHERE id = p_user_id;
+
+  -- Insert run history (preserved across seasons)
+  INSERT INTO public.run_history (
+    user_id, run_date, start_time, end_time,
+    distance_km, duration_seconds, avg_pace_min_per_km,
+    flip_count, flip_points, team_at_run, cv
+  ) VALUES (
+    p_user_id,
+    (p_end_time AT TIME ZONE 'Etc/GMT-2')::DATE,
+    p_start_time, p_end_time,
+    p_distance_km, p_duration_seconds,
+    CASE WHEN p_distance_km > 0
+      THEN (p_duration_seconds / 60.0) / p_distance_km
+      ELSE NULL
+    END,
+    v_flip_count, v_points, v_team, p_cv
+  )
+  RETURNING id INTO v_run_history_id;
+
+  RETURN jsonb_build_object(
+    'run_id',               v_run_history_id,
+    'flips',                v_flip_count,
+    'hex_count',            COALESCE(array_length(p_hex_path, 1), 0),
+    'multiplier',           v_validated_multiplier,
+    'points_earned',        v_points,
+    'server_validated',     TRUE,
+    'total_season_points',  (SELECT season_points FROM public.users WHERE id = p_user_id)
+  );
+END;
+$$;
+
+-- =============================================================================
+-- STEP 3: Aggregator (cron, every few seconds)
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION public.apply_hex_flip_queue(p_batch_size INTEGER DEFAULT 5000)
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+  v_runs   INT;
+  v_hexes  INT;
+BEGIN
+  -- One aggregator at a time; a tick that overlaps the previous one just skips.
+  IF NOT pg_try_advisory_xact_lock(hashtext('apply_hex_flip_queue')) THEN
+    RETURN jsonb_build_object('mode', 'skipped');
+  END IF;
+
+  WITH batch AS (
+    DELETE FROM hex_flip_queue q
+    WHERE q.id IN (SELECT id FROM hex_flip_queue ORDER BY id LIMIT p_batch_size)
+    RETURNING q.*
+  ),
+  flips AS (
+    SELECT DISTINCT ON (f.hex_id) f.hex_id, b.team, b.end_time, f.parent_hex, f.district_hex
+    FROM batch b
+    CROSS JOIN LATERAL unnest(b.hex_path, b.hex_parents, b.hex_district_parents)
+      AS f(hex_id, parent_hex, district_hex)
+    WHERE f.hex_id IS NOT NULL
+    ORDER BY f.hex_id, b.end_time DESC, b.id
+  ),
+  applied AS (
+    INSERT INTO hexes (id, last_runner_team, last_flipped_at, parent_hex, district_hex)
+    SELECT hex_id, team, end_time, parent_hex, district_hex FROM flips
+    ORDER BY hex_id
+    ON CONFLICT (id) DO UPDATE
+    SET last_runner_team = EXCLUDED.last_runner_team,
+        last_flipped_at  = EXCLUDED.last_flipped_at,
+        parent_hex       = COALESCE(EXCLUDED.parent_hex,   hexes.parent_hex),
+        district_hex     = COALESCE(EXCLUDED.district_hex, hexes.district_hex)
+    WHERE hexes.last_flipped_at IS NULL
+       OR hexes.last_flipped_at < EXCLUDED.last_flipped_at
+    RETURNING 1
+  )
+  SELECT (SELECT COUNT(*) FROM batch), (SELECT COUNT(*) FROM applied) INTO v_runs, v_hexes;
+
+  UPDATE hex_flip_queue_meta SET applied_at = now();
+
+  RETURN jsonb_build_object('mode', 'applied', 'runs', v_runs, 'hexes', v_hexes);
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION public.apply_hex_flip_queue(INTEGER) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.apply_hex_flip_queue(INTEGER) TO service_role;
+
+
+-- =============================================================================
+-- STEP 4: Season resets drain and clear hex_flip_queue before wiping hexes
+-- =============================================================================
+-- Without this, runs queued before the 21:55 UTC reset are applied after
+-- DELETE FROM hexes and last season's colours reappear on the new map.
+-- reset_season(): same as 20260308000003 plus the queue step.
+-- reset_season_batched(): same as 20260308000004 plus the queue step in
+-- step 3 and in the final sweep.
+
+CREATE OR REPLACE FUNCTION public.reset_season(p_season_number INT)
+RETURNS jsonb
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $function$
+DECLARE
+  v_snapshot_count INT;
+  v_today          DATE := (CURRENT_TIMESTAMP AT TIME ZONE 'Etc/GMT-2')::DATE;
+  v_dropped        jsonb;
+BEGIN
+  -- ── Step 1: Freeze leaderboard snapshot (date-bounded, safe to call anytime) ──
+  -- snapshot_season_leaderboard reads run_history with date bounds — does NOT
+  -- depend on users.season_points, so it's correct regardless of call timing.
+  SELECT snapshot_season_leaderboard(p_season_number) INTO v_snapshot_count;
+
+  -- ── Step 2: Reset SEASON-ONLY user fields ──────────────────────────────────
+  -- DO NOT touch ALL-TIME fields: total_distance_km, avg_pace_min_per_km,
+  -- avg_cv, total_runs, cv_run_count, home_hex, home_hex_end, district_hex
+  UPDATE public.users SET
+    season_points   = 0,
+    team            = NULL,
+    season_home_hex = NULL;
+
+  -- ── Step 3: Wipe season-specific tables ───────────────────────────────────
+  -- hex_flip_queue: drain, then drop whatever is left, so no queued run of the
+  -- finished season repaints the new season's empty map. The aggregator lock
+  -- is held until the reset commits, so a cron tick cannot apply a batch
+  -- after the hexes wipe.
+  PERFORM pg_advisory_xact_lock(hashtext('apply_hex_flip_queue'));
+  PERFORM apply_hex_flip_queue(NULL);
+  DELETE FROM public.hex_flip_queue;
+
+  -- hexes: live hex state (re-built as users run in the new season)
+  DELETE FROM public.hexes;
+
+  -- hex_snapshot: yesterday's baseline for flip counting
+  -- (build_daily_hex_snapshot at 22:00 UTC will rebuild from empty hexes)
+  -- Drop every daily partition up to and including today, clear whatever is
+  -- left (DEFAULT / pre-created days), then pre-create the new season's days.
+  v_dropped := drop_date_partitions('public.hex_snapshot', v_today + 1);
+  DELETE FROM public.hex_snapshot;
+  PERFORM create_date_partitions('public.hex_snapshot', v_today, v_today + 7, 'day');
+
+  -- Keyframe + delta prototype (20260308000002): build_hex_snapshot_cow()
+  -- starts from the latest keyframe, so a stale one would carry last
+  -- season's hexes into the new season
+  DELETE FROM public.hex_snapshot_keyframe;
+  DELETE FROM public.hex_snapshot_delta;
+
+  -- daily_buff_stats: per-district buff multipliers (calculated fresh by
+  -- calculate_daily_buffs at 22:00 UTC)
+  DELETE FROM public.daily_buff_stats;
+
+  -- Province/all range stats: season-specific hex dominance aggregates
+  DELETE FROM public.daily_all_range_stats;
+  DELETE FROM public.daily_province_range_stats;
+
+  -- DO NOT delete: run_history, daily_stats (preserved across seasons per AGENTS.md)
+  -- DO NOT delete: season_leaderboard_snapshot (historical records for all seasons)
+
+  RETURN jsonb_build_object(
+    'season_ended',       p_season_number,
+    'snapshot_count',     v_snapshot_count,
+    'partitions_dropped', jsonb_array_length(v_dropped->'detached'),
+    'reset_complete',     true
+  );
+END;
+$function$;
+
+CREATE OR REPLACE PROCEDURE public.reset_season_batched(
+  p_season_number INT,
+  p_batch_size    INT DEFAULT 5000,
+  p_pause_ms      INT DEFAULT 0
+)
+LANGUAGE plpgsql
+AS $procedure$
+DECLARE
+  v_today          DATE := (CURRENT_TIMESTAMP AT TIME ZONE 'Etc/GMT-2')::DATE;
+  v_snapshot_count INT;
+  v_last_user      UUID;
+  v_next_user      UUID;
+  v_last_hex       TEXT;
+  v_next_hex       TEXT;
+  v_rows           INT;
+  v_users          BIGINT := 0;
+  v_hexes          BIGINT := 0;
+  v_batches        INT := 0;
+BEGIN
+  -- ── Step 1: Freeze leaderboard snapshot ───────────────────────────────────
+  SELECT public.snapshot_season_leaderboard(p_season_number) INTO v_snapshot_count;
+  COMMIT;
+
+  -- ── Step 2: Reset SEASON-ONLY user fields, one PK range per transaction ──
+  -- DO NOT touch ALL-TIME fields (see reset_season)
+  LOOP
+    SELECT b.id INTO v_next_user FROM (
+      SELECT id FROM public.users
+      WHERE v_last_user IS NULL OR id > v_last_user
+      ORDER BY id
+      LIMIT p_batch_size
+    ) b
+    ORDER BY b.id DESC
+    LIMIT 1;
+    EXIT WHEN v_next_user IS NULL;
+
+    UPDATE public.users SET
+      season_points   = 0,
+      team            = NULL,
+      season_home_hex = NULL
+    WHERE (v_last_user IS NULL OR id > v_last_user)
+      AND id <= v_next_user
+      AND (season_points <> 0 OR team IS NOT NULL OR season_home_hex IS NOT NULL);
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    v_users := v_users + v_rows;
+    v_batches := v_batches + 1;
+    v_last_user := v_next_user;
+    COMMIT;
+    IF p_pause_ms > 0 THEN PERFORM pg_sleep(p_pause_ms / 1000.0); END IF;
+  END LOOP;
+
+  -- ── Step 3: Drain hex_flip_queue, then delete hexes per PK range ──────────
+  -- Under the aggregator lock, so no cron tick is mid-batch when the queue is
+  -- cleared. The lock is released at COMMIT; runs queued after that are the
+  -- mid-reset runs the final sweep clears.
+  PERFORM pg_advisory_xact_lock(hashtext('apply_hex_flip_queue'));
+  PERFORM public.apply_hex_flip_queue(NULL);
+  DELETE FROM public.hex_flip_queue;
+  COMMIT;
+
+  LOOP
+    SELECT b.id INTO v_next_hex FROM (
+      SELECT id FROM public.hexes
+      WHERE v_last_hex IS NULL OR id > v_last_hex
+      ORDER BY id
+      LIMIT p_batch_size
+    ) b
+    ORDER BY b.id DESC
+    LIMIT 1;
+    EXIT WHEN v_next_hex IS NULL;
+
+    DELETE FROM public.hexes
+    WHERE (v_last_hex IS NULL OR id > v_last_hex)
+      AND id <= v_next_hex;
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+    v_hexes := v_hexes + v_rows;
+    v_batches := v_batches + 1;
+    v_last_hex := v_next_hex;
+    COMMIT;
+    IF p_pause_ms > 0 THEN PERFORM pg_sleep(p_pause_ms / 1000.0); END IF;
+  END LOOP;
+
+  -- ── Step 4: Final sweep (runs that finished behind the batch cursor) ──────
+  UPDATE public.users SET
+    season_points   = 0,
+    team            = NULL,
+    season_home_hex = NULL
+  WHERE season_points <> 0 OR team IS NOT NULL OR season_home_hex IS NOT NULL;
+  GET DIAGNOSTICS v_rows = ROW_COUNT;
+  v_users := v_users + v_rows;
+
+  PERFORM pg_advisory_xact_lock(hashtext('apply_hex_flip_queue'));
+  PERFORM public.apply_hex_flip_queue(NULL);
+  DELETE FROM public.hex_flip_queue;
+
+  DELETE FROM public.hexes;
+  GET DIAGNOSTICS v_rows = ROW_COUNT;
+  v_hexes := v_hexes + v_rows;
+  COMMIT;
+
+  -- ── Step 5: Remaining season tables (small, or partition drops) ───────────
+  PERFORM public.drop_date_partitions('public.hex_snapshot', v_today + 1);
+  DELETE FROM public.hex_snapshot;
+  PERFORM public.create_date_partitions('public.hex_snapshot', v_today, v_today + 7, 'day');
+  DELETE FROM public.hex_snapshot_keyframe;
+  DELETE FROM public.hex_snapshot_delta;
+
+  DELETE FROM public.daily_buff_stats;
+  DELETE FROM public.daily_all_range_stats;
+  DELETE FROM public.daily_province_range_stats;
+  COMMIT;
+
+  -- DO NOT delete: run_history, daily_stats, season_leaderboard_snapshot
+
+  RAISE NOTICE 'reset_season_batched(%): snapshot_count=%, users_reset=%, hexes_deleted=%, batches=%',
+    p_season_number, v_snapshot_count, v_users, v_hexes, v_batches;
+END;
+$procedure$;
+
+REVOKE EXECUTE ON FUNCTION public.reset_season(INT) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.reset_season(INT) TO service_role;
+
+NOTIFY pgrst, 'reload schema';
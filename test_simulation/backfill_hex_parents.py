@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+RunStrict Parent / District Hex Backfill
+
+Recomputes H3 parent columns (Res 5 province, Res 6 district) whenever the
+resolution rules change, instead of rewriting them row-by-row in SQL
+(see 20260306000001_fix_hex_district_resolution.sql and
+20260218110001_backfill_real_user_district_hex.sql).
+
+How it works:
+- The target table is split into primary-key ranges (keyset scan, once).
+- Each range is handled by a worker process in its own transaction:
+  COPY rows out -> compute parents with h3 -> COPY into a temp staging
+  table -> one UPDATE ... FROM staging (only rows whose value changed).
+- Completed ranges are recorded in a state file, so a re-run resumes
+  where the previous one stopped.
+- --max-rows-per-sec / --pause throttle the workers to protect live traffic.
+
+Usage:
+    python3 backfill_hex_parents.py --table hexes
+    python3 backfill_hex_parents.py --table hex_snapshot --workers 8 --range-size 50000
+    python3 backfill_hex_parents.py --table users --only-null --dry-run
+    python3 backfill_hex_parents.py --table hexes --max-rows-per-sec 20000 --pause 0.5
+    python3 backfill_hex_parents.py --table hexes --restart        # Ignore saved progress
+
+Requires: pip install h3 psycopg2-binary
+"""
+
+import argparse
+import io
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from simulate_day import (
+    ALL_RESOLUTION, CITY_RESOLUTION, LOCAL_DB_DSN, SCRIPT_DIR,
+    get_db_connection, h3,
+)
+
+STATE_FILE = SCRIPT_DIR / '.backfill_state.json'
+
+# Backfill targets: which column holds the Res 9 cell, and which parent
+# column is derived at which resolution. Ranges are taken on key[0].
+TARGETS = {
+    'hexes': {
+        'key': ['id'],
+        'cell': 'id',
+        'columns': {'parent_hex': ALL_RESOLUTION, 'district_hex': CITY_RESOLUTION},
+    },
+    'hex_snapshot': {
+        'key': ['hex_id', 'snapshot_date'],
+        'cell': 'hex_id',
+        'columns': {'parent_hex': ALL_RESOLUTION},
+    },
+    'users': {
+        'key': ['id'],
+        'cell': 'home_hex',
+        'columns': {'province_hex': ALL_RESOLUTION, 'district_hex': CITY_RESOLUTION},
+    },
+}
+
+
+# ==================== Parent Computation ====================
+
+def cell_parents(cell, columns):
+    """Return {column: parent} for one cell, or None if the cell is unusable."""
+    if not cell:
+        return None
+    try:
+        res = h3.get_resolution(cell)
+        parents = {}
+        for col, target_res in columns.items():
+            if target_res > res:
+                return None
+            parents[col] = h3.cell_to_parent(cell, target_res)
+        return parents
+    except Exception:
+        return None
+
+
+def compute_rows(copy_text, target):
+    """Parse COPY text rows (key..., cell) and emit staging rows (key..., parents...).
+
+    Rows whose cell is NULL or not a valid H3 index are skipped and counted.
+    """
+    n_keys = len(target['key'])
+    cols = list(target['columns'])
+    out = io.StringIO()
+    staged = skipped = 0
+    for line in copy_text.splitlines():
+        fields = line.split('\t')
+        keys, cell = fields[:n_keys], fields[n_keys]
+        parents = cell_parents(None if cell == '\\N' else cell, target['columns'])
+        if parents is None:
+            skipped += 1
+            continue
+        out.write('\t'.join(keys + [parents[c] for c in cols]) + '\n')
+        staged += 1
+    out.seek(0)
+    return out, staged, skipped
+
+
+# ==================== Key Ranges ====================
+
+def plan_ranges(dsn, table, range_size):
+    """Keyset-scan key[0] once and cut it into [lo, hi) ranges of ~range_size rows.
+
+    The last range has hi=None (open-ended). Boundaries are kept as text so
+    they can be stored in the state file and compared against TEXT or UUID keys.
+    """
+    key = TARGETS[table]['key'][0]
+    conn = get_db_connection(dsn)
+    try:
+        cur = conn.cursor(name='backfill_keys')  # server-side cursor
+        cur.itersize = 10000
+        cur.execute(f"SELECT {key}::text FROM public.{table} ORDER BY {key}")
+        bounds = []
+        for i, (k,) in enumerate(cur):
+            if i % range_size == 0 and (not bounds or bounds[-1] != k):
+                bounds.append(k)
+        cur.close()
+    finally:
+        conn.close()
+    return [(lo, bounds[i + 1] if i + 1 < len(bounds) else None) for i, lo in enumerate(bounds)]
+
+
+def range_id(lo, hi):
+    return f"{lo}..{hi or ''}"
+
+
+# ==================== Worker ====================
+
+def backfill_range(dsn, table, lo, hi, only_null, dry_run, max_rows_per_sec, lock_timeout_ms):
+    """Backfill one key range in a single transaction. Runs in a worker process."""
+    target = TARGETS[table]
+    key = target['key'][0]
+    key_cols = ', '.join(target['key'])
+    parent_cols = list(target['columns'])
+    t0 = time.perf_counter()
+
+    where = [f"t.{key} >= %s"]
+    params = [lo]
+    if hi is not None:
+        where.append(f"t.{key} < %s")
+        params.append(hi)
+    if only_null:
+        where.append('(' + ' OR '.join(f"t.{c} IS NULL" for c in parent_cols) + ')')
+
+    conn = get_db_connection(dsn)
+    try:
+        with conn:  # one transaction per range
+            cur = conn.cursor()
+            cur.execute(f"SET LOCAL lock_timeout = '{int(lock_timeout_ms)}ms'")
+            export_sql = cur.mogrify(
+                f"COPY (SELECT {', '.join('t.' + k for k in target['key'])}, t.{target['cell']} "
+                f"FROM public.{table} t WHERE {' AND '.join(where)}) TO STDOUT",
+                params,
+            ).decode()
+            buf = io.StringIO()
+            cur.copy_expert(export_sql, buf)
+            staging, staged, skipped = compute_rows(buf.getvalue(), target)
+
+            updated = 0
+            if staged and not dry_run:
+                null_cols = ', '.join(f"NULL::text AS {c}" for c in parent_cols)
+                cur.execute(
+                    f"CREATE TEMP TABLE _backfill_stage ON COMMIT DROP AS "
+                    f"SELECT {key_cols}, {null_cols} FROM public.{table} WITH NO DATA"
+                )
+                cur.copy_expert(f"COPY _backfill_stage ({key_cols}, {', '.join(parent_cols)}) FROM STDIN", staging)
+                sets = ', '.join(f"{c} = s.{c}" for c in parent_cols)
+                join = ' AND '.join(f"t.{k} = s.{k}" for k in target['key'])
+                changed = ' OR '.join(f"t.{c} IS DISTINCT FROM s.{c}" for c in parent_cols)
+                cur.execute(
+                    f"UPDATE public.{table} t SET {sets} FROM _backfill_stage s "
+                    f"WHERE {join} AND ({changed})"
+                )
+                updated = cur.rowcount
+            if dry_run:
+                conn.rollback()
+    finally:
+        conn.close()
+
+    # Throttle: stretch this range to at most max_rows_per_sec (per worker)
+    elapsed = time.perf_counter() - t0
+    if max_rows_per_sec and staged:
+        min_elapsed = staged / max_rows_per_sec
+        if elapsed < min_elapsed:
+            time.sleep(min_elapsed - elapsed)
+
+    return {'lo': lo, 'hi': hi, 'staged': staged, 'skipped': skipped,
+            'updated': updated, 'seconds': round(elapsed, 3)}
+
+
+# ==================== Progress State ====================
+
+def load_progress(path, table):
+    if path.exists():
+        return json.load(open(path)).get(table, {'ranges': [], 'done': []})
+    return {'ranges': [], 'done': []}
+
+
+def save_progress(path, table, progress):
+    data = json.load(open(path)) if path.exists() else {}
+    data[table] = progress
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+# ==================== Main ====================
+
+def main():
+    parser = argparse.ArgumentParser(description='RunStrict parent/district hex backfill')
+    parser.add_argument('--table', required=True, choices=sorted(TARGETS), help='Table to backfill')
+    parser.add_argument('--dsn', default=LOCAL_DB_DSN, help='Postgres DSN (default: local supabase / $SIM_DB_DSN)')
+    parser.add_argument('--workers', type=int, default=4, help='Worker processes (default: 4)')
+    parser.add_argument('--range-size', type=int, default=20000, help='Rows per key range / transaction (default: 20000)')
+    parser.add_argument('--only-null', action='store_true', help='Only rows with a NULL parent column')
+    parser.add_argument('--max-rows-per-sec', type=int, default=0,
+                        help='Global throughput cap, split across workers (0 = unthrottled)')
+    parser.add_argument('--pause', type=float, default=0.0, help='Seconds to wait before submitting each range')
+    parser.add_argument('--lock-timeout-ms', type=int, default=2000, help='Per-range lock_timeout (default: 2000)')
+    parser.add_argument('--state-file', type=str, default=str(STATE_FILE), help='Resume file')
+    parser.add_argument('--restart', action='store_true', help='Discard saved progress for this table')
+    parser.add_argument('--dry-run', action='store_true', help='Export and compute, but roll back every range')
+    args = parser.parse_args()
+
+    state_path = Path(args.state_file)
+    progress = {'ranges': [], 'done': []} if args.restart else load_progress(state_path, args.table)
+
+    if not progress['ranges']:
+        print(f"Planning key ranges for {args.table} (~{args.range_size} rows each)...", file=sys.stderr)
+        progress['ranges'] = plan_ranges(args.dsn, args.table, args.range_size)
+        progress['done'] = []
+        if not args.dry_run:
+            save_progress(state_path, args.table, progress)
+
+    done = set(progress['done'])
+    pending = [(lo, hi) for lo, hi in progress['ranges'] if range_id(lo, hi) not in done]
+    print(f"{args.table}: {len(progress['ranges'])} ranges, {len(done)} done, {len(pending)} pending", file=sys.stderr)
+    if not pending:
+        return
+
+    per_worker_rate = args.max_rows_per_sec / args.workers if args.max_rows_per_sec else 0
+    totals = {'staged': 0, 'skipped': 0, 'updated': 0}
+    t0 = time.perf_counter()
+    failed = 0
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {}
+        for lo, hi in pending:
+            if args.pause:
+                time.sleep(args.pause)
+            fut = pool.submit(backfill_range, args.dsn, args.table, lo, hi, args.only_null,
+                              args.dry_run, per_worker_rate, args.lock_timeout_ms)
+            futures[fut] = (lo, hi)
+
+        for fut in as_completed(futures):
+            lo, hi = futures[fut]
+            try:
+                result = fut.result()
+            except Exception as e:
+                failed += 1
+                print(f"  ERROR range {range_id(lo, hi)}: {e}", file=sys.stderr)
+                continue
+            for k in totals:
+                totals[k] += result[k]
+            if not args.dry_run:
+                progress['done'].append(range_id(lo, hi))
+                save_progress(state_path, args.table, progress)
+            print(f"  range {range_id(lo, hi)}: staged {result['staged']}, updated {result['updated']}, "
+                  f"skipped {result['skipped']} ({result['seconds']}s)", file=sys.stderr)
+
+    elapsed = time.perf_counter() - t0
+    rate = totals['staged'] / elapsed if elapsed > 0 else 0
+    print(f"Done: staged {totals['staged']:,}, updated {totals['updated']:,}, skipped {totals['skipped']:,} "
+          f"in {elapsed:.1f}s ({rate:,.0f} rows/s)", file=sys.stderr)
+    if failed:
+        print(f"{failed} range(s) failed; re-run to resume.", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
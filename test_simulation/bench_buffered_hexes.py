@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+RunStrict Buffered Hexes Benchmark: inline upsert vs hex_flip_queue
+
+Replays the same simulated days through finalize_run() twice:
+
+  inline    finalize_run() upserts every cell of the path into hexes
+            (hex_flip_queue_meta.buffered = false, the default)
+  buffered  finalize_run() appends the path to hex_flip_queue, and a
+            HexFlipWorker (hex_flip_worker.py) applies the queue every
+            --interval seconds, as the pg_cron job does
+            (20260308000007_buffered_hexes_updates.sql)
+
+Each day's runs are sent in end_time order from --clients concurrent
+connections. The report gives, per mode:
+  - finalize_run() p50 / p99 latency and throughput. A sync that loses a
+    deadlock is retried, as the app does, and counted; its latency includes
+    the retries.
+  - WAL written by the whole mode, aggregator included, in total and per run
+  - row versions written to hexes and hex_flip_queue
+  - for buffered, the number of aggregator ticks and the largest tick
+
+At the end, hexes after both modes are compared row by row
+(team, last_flipped_at). They should match: both keep the latest end_time
+per hex.
+
+The runs come from simulate_day (zipf workload). Each mode starts from empty
+hexes and fresh users, and a CHECKPOINT, so both pay the same full-page
+writes. This deletes the simulation users, their run_history, and all hexes
+and hex_flip_queue rows, so point it at a disposable local database. The
+buffered flag is restored at the end.
+
+Usage:
+    python3 bench_buffered_hexes.py                               # 1000 users, 7 days, 8 clients
+    python3 bench_buffered_hexes.py --users 5000 --days 10 --clients 16
+    python3 bench_buffered_hexes.py --interval 2 --batch-size 1000
+    python3 bench_buffered_hexes.py --dsn postgresql://...
+
+Requires: pip install h3 numpy psycopg2-binary
+"""
+
+import argparse
+import copy
+import sys
+import threading
+import time
+
+import numpy as np
+
+from hex_flip_worker import SET_MODE_SQL, HexFlipWorker
+import simulate_day as sim
+
+FINALIZE_RUN_SQL = """
+SELECT public.finalize_run(
+  p_user_id := %s, p_start_time := %s, p_end_time := %s, p_distance_km := %s, p_duration_seconds := %s,
+  p_hex_path := %s, p_buff_multiplier := %s, p_cv := %s, p_client_points := %s,
+  p_hex_parents := %s, p_district_hex := %s, p_hex_district_parents := %s)
+"""
+
+ROW_WRITES_SQL = """
+SELECT relname, n_tup_ins + n_tup_upd + n_tup_del
+FROM pg_stat_user_tables
+WHERE schemaname = 'public' AND relname IN ('hexes', 'hex_flip_queue')
+"""
+
+CLEANUP_SQL = """
+DELETE FROM public.run_history WHERE user_id::text LIKE 'aaaaaaaa-%';
+DELETE FROM public.leaderboard_dirty WHERE user_id::text LIKE 'aaaaaaaa-%';
+DELETE FROM public.users WHERE id::text LIKE 'aaaaaaaa-%';
+DELETE FROM auth.users WHERE id::text LIKE 'aaaaaaaa-%';
+DELETE FROM public.hex_flip_queue;
+DELETE FROM public.hexes;
+"""
+
+
+# ==================== Workload ====================
+
+def simulate(n_users, days, seed):
+    """Users as of day 1, and each day's (defectors, finalize_run() argument tuples)."""
+    home_hex = sim.DEFAULT_HOME_HEX
+    same_hexes, other_hexes = sim.generate_hexes_from_home(home_hex)
+    state = sim.default_state()
+    state.update(seed=seed, home_hex=home_hex, same_hexes=same_hexes, other_hexes=other_hexes, total_days=days)
+    state['users'] = sim.generate_users(seed, same_hexes, other_hexes, n_users)
+    users = copy.deepcopy(state['users'])
+    district = {u['id']: sim.h3.cell_to_parent(u['home_hex'], sim.CITY_RESOLUTION) for u in users}
+
+    schedule = []
+    for day in range(1, days + 1):
+        defectors, runs, _, _, _ = sim.simulate_day_step(state, day, days)
+        calls = []
+        for run in sorted(runs, key=lambda r: r['end_time']):
+            path = run['hex_path']
+            calls.append((
+                run['user_id'], run['start_time'], run['end_time'], run['distance_km'],
+                run['duration_seconds'], path, run['buff_multiplier'], run['cv'], run['flip_points'],
+                [sim.h3.cell_to_parent(h, sim.ALL_RESOLUTION) for h in path], district[run['user_id']],
+                [sim.h3.cell_to_parent(h, sim.CITY_RESOLUTION) for h in path]))
+        schedule.append((defectors, calls))
+    return users, schedule
+
+
+# ==================== Measure ====================
+
+class Client(threading.Thread):
+    """One connection syncing its share of a day's runs."""
+
+    def __init__(self, dsn, calls):
+        super().__init__(daemon=True)
+        self.conn = sim.get_db_connection(dsn)
+        self.conn.autocommit = True
+        self.calls = calls
+        self.latency = []
+        self.deadlocks = 0
+
+    def run(self):
+        cur = self.conn.cursor()
+        for params in self.calls:
+            t0 = time.perf_counter()
+            while True:
+                try:
+                    cur.execute(FINALIZE_RUN_SQL, params)
+                    break
+                except sim.psycopg2.errors.DeadlockDetected:
+                    self.deadlocks += 1   # the app retries the sync; so do we
+            cur.fetchall()
+            self.latency.append(time.perf_counter() - t0)
+        self.conn.close()
+
+
+def row_writes(cur):
+    time.sleep(1.0)  # let exited backends' table stats land
+    cur.execute("SELECT pg_stat_clear_snapshot()")
+    cur.execute(ROW_WRITES_SQL)
+    return dict(cur.fetchall())
+
+
+def replay(conn, dsn, users, schedule, mode, args):
+    """Fresh users and hexes, then every day through finalize_run() in `mode`. Returns the stats."""
+    cur = conn.cursor()
+    cur.execute(CLEANUP_SQL)
+    cur.execute(sim.sql_auth_users_insert(users))
+    cur.execute(sim.sql_users_insert(users))
+    cur.execute(SET_MODE_SQL, (mode == 'buffered',))
+    conn.commit()
+    conn.autocommit = True
+    try:
+        cur.execute("CHECKPOINT")
+    except sim.psycopg2.Error:
+        print("  (no CHECKPOINT privilege: WAL includes a varying share of full-page writes)", file=sys.stderr)
+    writes0 = row_writes(cur)
+    cur.execute("SELECT pg_current_wal_insert_lsn()")
+    lsn0 = cur.fetchone()[0]
+
+    worker = None
+    if mode == 'buffered':
+        worker = HexFlipWorker(dsn, args.interval, args.batch_size)
+        worker.start()
+    latency = []
+    deadlocks = 0
+    t0 = time.perf_counter()
+    for defectors, calls in schedule:
+        if defectors:
+            cur.execute(sim.sql_defections(defectors))
+        clients = [Client(dsn, calls[k::args.clients]) for k in range(args.clients)]
+        for c in clients:
+            c.start()
+        for c in clients:
+            c.join()
+        latency += [x for c in clients for x in c.latency]
+        deadlocks += sum(c.deadlocks for c in clients)
+    sync_s = time.perf_counter() - t0
+    if worker is not None:
+        worker.close()   # final drain: hexes complete, as before the midnight jobs
+
+    cur.execute("SELECT pg_wal_lsn_diff(pg_current_wal_insert_lsn(), %s)", (lsn0,))
+    wal = int(cur.fetchone()[0])
+    writes1 = row_writes(cur)
+    cur.execute("SELECT id, last_runner_team, last_flipped_at FROM public.hexes")
+    hexes = {h: (team, at) for h, team, at in cur.fetchall()}
+    conn.autocommit = False
+    return {
+        'runs': len(latency),
+        'rps': len(latency) / sync_s,
+        'p50': float(np.percentile(latency, 50)) * 1000,
+        'p99': float(np.percentile(latency, 99)) * 1000,
+        'deadlocks': deadlocks,
+        'wal': wal,
+        'hex_writes': writes1.get('hexes', 0) - writes0.get('hexes', 0),
+        'queue_writes': writes1.get('hex_flip_queue', 0) - writes0.get('hex_flip_queue', 0),
+        'ticks': worker.ticks if worker else [],
+        'hexes': hexes,
+    }
+
+
+def fmt_bytes(n):
+    for unit in ('B', 'kB', 'MB', 'GB'):
+        if abs(n) < 1024 or unit == 'GB':
+            return f"{n:,.0f}B" if unit == 'B' else f"{n:,.1f}{unit}"
+        n /= 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description='finalize_run() latency and WAL: inline hexes upsert vs hex_flip_queue')
+    parser.add_argument('--dsn', default=sim.LOCAL_DB_DSN, help='Postgres DSN (default: local supabase / $SIM_DB_DSN)')
+    parser.add_argument('--users', type=int, default=1000, help='Simulated users (default: 1000)')
+    parser.add_argument('--days', type=int, default=7, help='Simulated days replayed per mode (default: 7)')
+    parser.add_argument('--clients', type=int, default=8, help='Concurrent syncing connections (default: 8)')
+    parser.add_argument('--modes', default='inline,buffered', help='Modes to run (default: inline,buffered)')
+    parser.add_argument('--interval', type=float, default=10, help='Aggregator tick in seconds (default: 10)')
+    parser.add_argument('--batch-size', type=int, default=5000, help='Runs per apply_hex_flip_queue() call (default: 5000)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    args = parser.parse_args()
+
+    if sim.psycopg2 is None:
+        print("ERROR: psycopg2 required. Install with: pip install psycopg2-binary", file=sys.stderr)
+        sys.exit(1)
+
+    conn = sim.get_db_connection(args.dsn)
+    cur = conn.cursor()
+    cur.execute("SELECT to_regproc('public.apply_hex_flip_queue')")
+    if cur.fetchone()[0] is None:
+        print("ERROR: apply 20260308000007_buffered_hexes_updates.sql first", file=sys.stderr)
+        sys.exit(1)
+    cur.execute("SELECT buffered FROM public.hex_flip_queue_meta")
+    buffered_before = cur.fetchone()[0]
+    conn.rollback()
+
+    t0 = time.perf_counter()
+    users, schedule = simulate(args.users, args.days, args.seed)
+    n_runs = sum(len(calls) for _, calls in schedule)
+    print(f"Simulated {args.days} days: {n_runs:,} runs from {len(users):,} users "
+          f"({time.perf_counter() - t0:.1f}s)", file=sys.stderr)
+
+    results = {}
+    try:
+        for mode in args.modes.split(','):
+            print(f"Replaying {mode} ...", file=sys.stderr)
+            results[mode] = replay(conn, args.dsn, users, schedule, mode, args)
+    finally:
+        conn.rollback()
+        cur = conn.cursor()
+        cur.execute(CLEANUP_SQL)
+        cur.execute(SET_MODE_SQL, (buffered_before,))
+        conn.commit()
+        conn.close()
+
+    print(f"\n{'mode':<9} {'runs':>7} {'runs/s':>8} {'p50':>9} {'p99':>9} {'deadlocks':>9} {'WAL':>10} {'WAL/run':>9} "
+          f"{'hexes rows':>10} {'queue rows':>10}")
+    for mode, r in results.items():
+        print(f"{mode:<9} {r['runs']:>7,} {r['rps']:>8.1f} {r['p50']:>7.2f}ms {r['p99']:>7.2f}ms {r['deadlocks']:>9,} "
+              f"{fmt_bytes(r['wal']):>10} {fmt_bytes(r['wal'] / max(r['runs'], 1)):>9} "
+              f"{r['hex_writes']:>10,} {r['queue_writes']:>10,}")
+    if 'buffered' in results and results['buffered']['ticks']:
+        ticks = results['buffered']['ticks']
+        largest = max(ticks)
+        print(f"\naggregator: {len(ticks)} ticks every {args.interval:g}s, largest {largest[0]:,} runs -> "
+              f"{largest[1]:,} hexes in {largest[2] * 1000:.0f}ms")
+    if 'inline' in results and 'buffered' in results:
+        a, b = results['inline']['hexes'], results['buffered']['hexes']
+        diff = sum(1 for h in a.keys() | b.keys() if a.get(h) != b.get(h))
+        print(f"hexes inline vs buffered: {len(a):,} / {len(b):,} rows, {diff:,} differ")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+RunStrict calculate_daily_buffs() Scale Harness
+
+Seeds a scaled province/district dataset into a local Postgres and runs the
+loop version of calculate_daily_buffs() (20260306000003_province_win_scoped_to_res5.sql)
+against the set-based one (20260308000001_set_based_calculate_daily_buffs.sql).
+Both are loaded from the migration files under private names, so it works
+whether or not the new migration has been applied.
+
+Reports the runtime of each and diffs daily_province_range_stats,
+daily_all_range_stats and daily_buff_stats row-for-row.
+
+Everything runs in one transaction that is rolled back at the end (unless
+--keep), so the local DB is left untouched. FK checks are skipped for the
+synthetic users via session_replication_role (local superuser only).
+
+Usage:
+    python3 bench_daily_buffs.py                                   # 10k provinces x 7 districts
+    python3 bench_daily_buffs.py --provinces 1000 --repeat 5
+    python3 bench_daily_buffs.py --hexes-per-district 50 --users-per-district 10
+    python3 bench_daily_buffs.py --dsn postgresql://... --keep     # Leave the seeded data behind
+
+Requires: pip install psycopg2-binary
+"""
+
+import argparse
+import re
+import sys
+import time
+
+from simulate_day import LOCAL_DB_DSN, SCRIPT_DIR, get_db_connection, psycopg2
+
+MIGRATIONS_DIR = SCRIPT_DIR.parent / 'supabase' / 'migrations'
+VERSIONS = {
+    'loop': ('20260306000003_province_win_scoped_to_res5.sql', '_bench_daily_buffs_loop'),
+    'set': ('20260308000001_set_based_calculate_daily_buffs.sql', '_bench_daily_buffs_set'),
+}
+
+# Output tables and the columns compared (ids / calculated_at excluded)
+OUTPUTS = {
+    'daily_province_range_stats': ('province_hex', 'leading_team', 'red_hex_count', 'blue_hex_count',
+                                   'purple_hex_count'),
+    'daily_all_range_stats': ('dominant_team', 'red_hex_count', 'blue_hex_count', 'purple_hex_count'),
+    'daily_buff_stats': ('district_hex', 'dominant_team', 'red_hex_count', 'blue_hex_count',
+                         'purple_hex_count', 'red_elite_threshold_points', 'purple_total_users',
+                         'purple_active_users', 'purple_participation_rate'),
+}
+
+TODAY_GMT2 = "(CURRENT_TIMESTAMP AT TIME ZONE 'Etc/GMT-2')::DATE"
+
+
+def function_sql(migration, name):
+    """Pull CREATE FUNCTION calculate_daily_buffs() out of a migration, renamed."""
+    text = (MIGRATIONS_DIR / migration).read_text()
+    m = re.search(r"CREATE OR REPLACE FUNCTION public\.calculate_daily_buffs\(\).*?\n\$\$;", text, re.S)
+    if not m:
+        raise RuntimeError(f"calculate_daily_buffs() not found in {migration}")
+    return m.group(0).replace('public.calculate_daily_buffs()', f'pg_temp.{name}()')
+
+
+# ==================== Seeding ====================
+
+def seed(cur, provinces, districts, hexes_per_district, users_per_district, participation, seed_value):
+    """Synthetic provinces -> districts -> hexes/users, plus yesterday's run_history."""
+    cur.execute("SELECT setseed(%s)", (seed_value,))
+    cur.execute("""
+        CREATE TEMP TABLE _bench_districts ON COMMIT DROP AS
+        SELECT 'bench_p' || lpad(p::text, 6, '0') AS province_hex,
+               'bench_p' || lpad(p::text, 6, '0') || '_d' || d AS district_hex
+        FROM generate_series(1, %s) p, generate_series(1, %s) d
+    """, (provinces, districts))
+
+    # Hexes: random team mix, ~10% neutral; small districts make dominance ties common
+    cur.execute("""
+        INSERT INTO public.hexes (id, last_runner_team, last_flipped_at, parent_hex, district_hex)
+        SELECT b.district_hex || '_h' || h,
+               CASE WHEN random() < 0.1 THEN NULL
+                    ELSE (ARRAY['red', 'blue', 'purple'])[1 + floor(random() * 3)::int] END,
+               now(), b.province_hex, b.district_hex
+        FROM _bench_districts b, generate_series(1, %s) h
+    """, (hexes_per_district,))
+    n_hexes = cur.rowcount
+
+    cur.execute("""
+        INSERT INTO public.users (id, auth_id, name, team, district_hex, province_hex)
+        SELECT gen_random_uuid(), gen_random_uuid(), 'bench',
+               (ARRAY['red', 'red', 'blue', 'blue', 'purple'])[1 + floor(random() * 5)::int],
+               b.district_hex, b.province_hex
+        FROM _bench_districts b, generate_series(1, %s) u
+    """, (users_per_district,))
+    n_users = cur.rowcount
+
+    # Yesterday's runs: participating users get 1-2 runs with random flip points
+    cur.execute(f"""
+        WITH runners AS (
+            SELECT u.id, u.team, 1 + (random() < 0.3)::int AS n_runs
+            FROM public.users u
+            JOIN _bench_districts b ON b.district_hex = u.district_hex
+            WHERE random() < %s
+        )
+        INSERT INTO public.run_history (user_id, run_date, start_time, end_time, distance_km,
+                                        duration_seconds, flip_count, flip_points, team_at_run)
+        SELECT r.id, {TODAY_GMT2} - 1, now() - interval '1 day', now() - interval '1 day' + interval '30 minutes',
+               5.0, 1800, 0, floor(random() * 40)::int, r.team
+        FROM runners r, generate_series(1, r.n_runs)
+    """, (participation,))
+    n_runs = cur.rowcount
+    return n_hexes, n_users, n_runs
+
+
+def ensure_run_history_partition(cur):
+    """run_history is range-partitioned; add a DEFAULT partition (rolled back) if none exists."""
+    cur.execute("""
+        SELECT p.partdefid <> 0 FROM pg_partitioned_table p
+        WHERE p.partrelid = 'public.run_history'::regclass
+    """)
+    row = cur.fetchone()
+    if row is not None and not row[0]:
+        cur.execute("CREATE TABLE public.run_history_bench_default PARTITION OF public.run_history DEFAULT")
+
+
+# ==================== Compare ====================
+
+def snapshot(cur):
+    out = {}
+    for table, cols in OUTPUTS.items():
+        cur.execute(f"SELECT {', '.join(cols)} FROM public.{table} WHERE stat_date = {TODAY_GMT2} "
+                    f"ORDER BY {', '.join(cols)}")
+        out[table] = cur.fetchall()
+    return out
+
+
+def diff(a, b, limit=5):
+    problems = []
+    for table in OUTPUTS:
+        ra, rb = set(a[table]), set(b[table])
+        if len(a[table]) != len(b[table]):
+            problems.append(f"{table}: {len(a[table])} vs {len(b[table])} rows")
+        for row in sorted(ra - rb)[:limit]:
+            problems.append(f"{table}: only in loop   {row}")
+        for row in sorted(rb - ra)[:limit]:
+            problems.append(f"{table}: only in set    {row}")
+    return problems
+
+
+def run_version(cur, name, timeout_s):
+    """Time one call; (None, None) if it hits the statement timeout."""
+    cur.execute("SAVEPOINT bench_run")
+    cur.execute(f"SET LOCAL statement_timeout = '{int(timeout_s * 1000)}ms'")
+    t0 = time.perf_counter()
+    try:
+        cur.execute(f"SELECT pg_temp.{name}()")
+        result = cur.fetchone()[0]
+    except psycopg2.errors.QueryCanceled:
+        cur.execute("ROLLBACK TO SAVEPOINT bench_run")
+        return None, None
+    elapsed = time.perf_counter() - t0
+    cur.execute("SET LOCAL statement_timeout = 0")
+    cur.execute("RELEASE SAVEPOINT bench_run")
+    return elapsed, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare loop vs set-based calculate_daily_buffs()')
+    parser.add_argument('--dsn', default=LOCAL_DB_DSN, help='Postgres DSN (default: local supabase / $SIM_DB_DSN)')
+    parser.add_argument('--provinces', type=int, default=10000, help='Res 5 provinces to seed (default: 10000)')
+    parser.add_argument('--districts', type=int, default=7, help='Res 6 districts per province (default: 7)')
+    parser.add_argument('--hexes-per-district', type=int, default=20, help='Hexes per district (default: 20)')
+    parser.add_argument('--users-per-district', type=int, default=4, help='Users per district (default: 4)')
+    parser.add_argument('--participation', type=float, default=0.6, help="Share of users with yesterday's runs")
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per version (default: 3)')
+    parser.add_argument('--timeout', type=float, default=600, help='Per-call statement timeout in seconds (default: 600)')
+    parser.add_argument('--seed', type=float, default=0.42, help='setseed() value in [-1, 1] (default: 0.42)')
+    parser.add_argument('--keep', action='store_true', help='Commit the seeded data instead of rolling back')
+    args = parser.parse_args()
+
+    if psycopg2 is None:
+        print("ERROR: psycopg2 required. Install with: pip install psycopg2-binary", file=sys.stderr)
+        sys.exit(1)
+    conn = get_db_connection(args.dsn)
+    cur = conn.cursor()
+    problems = []
+    try:
+        cur.execute("SET LOCAL session_replication_role = replica")  # skip auth.users FK for synthetic users
+        ensure_run_history_partition(cur)
+        for migration, name in VERSIONS.values():
+            cur.execute(function_sql(migration, name))
+
+        t0 = time.perf_counter()
+        n_hexes, n_users, n_runs = seed(cur, args.provinces, args.districts, args.hexes_per_district,
+                                        args.users_per_district, args.participation, args.seed)
+        cur.execute("ANALYZE public.hexes; ANALYZE public.users")
+        print(f"Seeded {args.provinces:,} provinces x {args.districts} districts: {n_hexes:,} hexes, "
+              f"{n_users:,} users, {n_runs:,} runs ({time.perf_counter() - t0:.1f}s)", file=sys.stderr)
+
+        timings = {v: [] for v in VERSIONS}
+        results = {}
+        outputs = {}
+        for _ in range(args.repeat):
+            for version, (_, name) in VERSIONS.items():
+                if timings[version] and timings[version][-1] is None:
+                    continue  # timed out once; don't wait again
+                elapsed, result = run_version(cur, name, args.timeout)
+                timings[version].append(elapsed)
+                if elapsed is not None:
+                    results[version] = result
+                    outputs[version] = snapshot(cur)
+
+        best = {}
+        for version in VERSIONS:
+            done = [t for t in timings[version] if t is not None]
+            if not done:
+                print(f"  {version:<5} timed out after {args.timeout:.0f}s", file=sys.stderr)
+                continue
+            best[version] = min(done)
+            print(f"  {version:<5} best {best[version] * 1000:,.0f} ms  "
+                  f"(runs: {', '.join(f'{t * 1000:,.0f}' for t in done)})  {results[version]}",
+                  file=sys.stderr)
+        if len(best) == 2:
+            print(f"Speedup: {best['loop'] / max(best['set'], 1e-9):.1f}x", file=sys.stderr)
+
+        if len(outputs) == 2:
+            problems = diff(outputs['loop'], outputs['set'])
+            for p in problems:
+                print(f"  MISMATCH {p}", file=sys.stderr)
+            rows = {t: len(outputs['set'][t]) for t in OUTPUTS}
+            print(f"Row-for-row: {'IDENTICAL' if not problems else 'DIFFERENT'} {rows}", file=sys.stderr)
+        else:
+            problems = ['timeout']
+            print("Row-for-row: not compared (a version timed out; lower --provinces or raise --timeout)",
+                  file=sys.stderr)
+    finally:
+        if args.keep:
+            conn.commit()
+        else:
+            conn.rollback()
+        conn.close()
+
+    if problems:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+RunStrict Hot-Hex Contention Benchmark for finalize_run()
+
+finalize_run() upserts every cell of the run's path into hexes, one
+INSERT ... ON CONFLICT (id) DO UPDATE per cell, in path order, in a single
+transaction. Runners who share a park loop sync at the same moment and
+lock the same hexes rows. When two of them ran the loop in opposite
+directions, each can hold a row the other one waits for: that is a deadlock,
+detected only after deadlock_timeout, and one of the two runs is lost.
+
+--runners connections each call finalize_run() in a loop for --seconds,
+always for their own user, for every cell of the matrix:
+
+  overlap   share of each path on the shared park loop: an arc of an
+            H3 ring, with a random start and direction per run. The rest
+            of the path is the runner's own cells, which nobody else touches.
+  order     run      cells in the order they were run (what the app sends)
+            sorted   the client sorts the path by hex id before uploading.
+                     This changes home_hex / home_hex_end (first / last cell),
+                     so it is a lock-order probe, not a client fix.
+  upsert    loop     public.finalize_run() as deployed
+            sorted   the same function with the per-cell loop replaced by one
+                     set-based upsert in hex id order (SORTED_UPSERT below,
+                     loaded as pg_temp.finalize_run()). Every transaction then
+                     locks shared rows in the same order, so they queue
+                     instead of deadlocking.
+
+Per cell the report gives committed runs/s (and the ratio to the 0% overlap
+cell with the same order and upsert), p50/p99 latency, deadlocks per 1000
+runs, and lock waits. A side connection samples pg_stat_activity for the
+runner backends every --sample-ms. "lock wait" is the share of samples
+where a runner waited on a heavyweight lock (the row lock of another
+runner's transaction), and "wait/run" is that time spread over committed runs.
+
+This measures the inline upsert. In buffered mode
+(20260308000007_buffered_hexes_updates.sql) finalize_run() only queues the
+path, and bench_buffered_hexes.py is the benchmark to use.
+
+Synthetic users go into the real public tables, so point this at a
+disposable local database. The users (and their auth.users rows), their
+run_history and the bench hexes are deleted at the end.
+
+Usage:
+    python3 bench_hex_contention.py                                # 32 runners, 10s per cell
+    python3 bench_hex_contention.py --runners 64 --overlaps 0,0.1,0.5,0.9
+    python3 bench_hex_contention.py --orders run --upserts loop,sorted --seconds 30
+    python3 bench_hex_contention.py --dsn postgresql://...
+
+Requires: pip install h3 numpy psycopg2-binary
+"""
+
+import argparse
+import random
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from bench_season_reset import copy_into
+import simulate_day as sim
+
+FINALIZE_RUN_SQL = """
+SELECT {schema}.finalize_run(
+  p_user_id := %s, p_start_time := %s, p_end_time := %s, p_distance_km := %s, p_duration_seconds := %s,
+  p_hex_path := %s, p_buff_multiplier := 1, p_client_points := %s,
+  p_hex_parents := %s, p_district_hex := %s, p_hex_district_parents := %s)
+"""
+
+UPSERTS = {'loop': 'public', 'sorted': 'pg_temp'}
+
+LOOP_UPSERT_RE = re.compile(r"v_idx := 1;\s+FOREACH v_hex_id IN ARRAY p_hex_path LOOP.*?END LOOP;", re.S)
+
+# Same writes as the loop: first occurrence of a cell wins its parents, and a
+# row is only moved forward in time. ORDER BY id fixes the lock order.
+SORTED_UPSERT = """INSERT INTO public.hexes (id, last_runner_team, last_flipped_at, parent_hex, district_hex)
+    SELECT DISTINCT ON (h.id) h.id, v_team, p_end_time, h.parent_hex, h.district_hex
+    FROM unnest(p_hex_path, p_hex_parents, p_hex_district_parents) WITH ORDINALITY
+      AS h(id, parent_hex, district_hex, idx)
+    WHERE h.id IS NOT NULL
+    ORDER BY h.id, h.idx
+    ON CONFLICT (id) DO UPDATE
+    SET last_runner_team = v_team,
+        last_flipped_at  = p_end_time,
+        parent_hex       = COALESCE(EXCLUDED.parent_hex,    public.hexes.parent_hex),
+        district_hex     = COALESCE(EXCLUDED.district_hex,  public.hexes.district_hex)
+    WHERE public.hexes.last_flipped_at IS NULL
+       OR public.hexes.last_flipped_at < p_end_time;"""
+
+LOCK_SAMPLE_SQL = """
+SELECT count(*) FILTER (WHERE wait_event_type = 'Lock') FROM pg_stat_activity WHERE pid = ANY(%s)
+"""
+
+CLEANUP_SQL = """
+DELETE FROM public.run_history WHERE user_id::text LIKE 'aaaaaaaa-%%';
+DELETE FROM public.leaderboard_dirty WHERE user_id::text LIKE 'aaaaaaaa-%%';
+DELETE FROM public.users WHERE id::text LIKE 'aaaaaaaa-%%';
+DELETE FROM auth.users WHERE id::text LIKE 'aaaaaaaa-%%';
+DELETE FROM public.hexes WHERE id = ANY(%s);
+"""
+
+
+def sorted_finalize_run_sql(conn):
+    """The deployed finalize_run() as pg_temp.finalize_run(), with the hexes upsert in id order."""
+    cur = conn.cursor()
+    cur.execute("SELECT pg_get_functiondef('public.finalize_run'::regproc)")
+    text = cur.fetchone()[0]
+    conn.rollback()
+    text, n = LOOP_UPSERT_RE.subn(lambda _: SORTED_UPSERT, text)
+    if n != 1:
+        raise RuntimeError("per-cell hexes loop not found in public.finalize_run()")
+    return text.replace('FUNCTION public.finalize_run(', 'FUNCTION pg_temp.finalize_run(', 1)
+
+
+# ==================== Paths ====================
+
+def park_loop(radius):
+    """The shared loop: an H3 ring around the default home hex, in walking order."""
+    return sim.h3.grid_ring(sim.DEFAULT_HOME_HEX, radius)
+
+
+def private_loops(n, path_len, avoid):
+    """One loop per runner, far enough from the park and from each other that no cell is shared."""
+    radius = 1
+    while 6 * radius < path_len:
+        radius += 1
+    area = sim.h3.cell_to_parent(sim.DEFAULT_HOME_HEX, 4)
+    taken = set(avoid)
+    loops = []
+    for cell in sorted(sim.h3.cell_to_children(area, 7)):
+        ring = sim.h3.grid_ring(sim.h3.cell_to_center_child(cell, sim.BASE_RESOLUTION), radius)
+        if taken.isdisjoint(ring):
+            taken.update(ring)
+            loops.append(ring)
+        if len(loops) == n:
+            return loops
+    raise ValueError(f"not enough Res-7 cells for {n} private loops of {path_len} cells")
+
+
+def arc(loop, length, rng):
+    """`length` consecutive cells of `loop`, from a random start, in a random direction."""
+    start = rng.randrange(len(loop))
+    step = rng.choice((1, -1))
+    return [loop[(start + step * i) % len(loop)] for i in range(length)]
+
+
+def make_path(hot, own, path_len, overlap, order, rng):
+    """Own cells, then the shared arc, then own cells again: in through the park and out."""
+    n_hot = min(round(path_len * overlap), len(hot))
+    mine = arc(own, path_len - n_hot, rng)
+    half = len(mine) // 2
+    path = mine[:half] + arc(hot, n_hot, rng) + mine[half:]
+    return sorted(path) if order == 'sorted' else path
+
+
+# ==================== Fill ====================
+
+def fill(conn, n_runners, cells):
+    """COPY one user per runner (alternating red / blue) and every bench cell into hexes."""
+    ids = [sim.sim_user_id(i) for i in range(n_runners)]
+    cur = conn.cursor()
+    # finalize_run() updates the users row from the runner's own session, so auth.users must exist
+    cur.execute(sim.sql_auth_users_insert([{'id': user_id, 'name': f"runner{i}"} for i, user_id in enumerate(ids)]))
+    copy_into(cur, 'public.users',
+              ('id', 'auth_id', 'name', 'team', 'season_points', 'total_distance_km', 'total_runs'),
+              ((user_id, user_id, f"Runner {i}", ('red', 'blue')[i % 2], 0, 0, 0) for i, user_id in enumerate(ids)))
+    # Start from existing rows: the contention is on ON CONFLICT DO UPDATE, not on first inserts
+    long_ago = (datetime.now(timezone.utc) - timedelta(days=1)).strftime('%Y-%m-%d %H:%M:%S+00')
+    copy_into(cur, 'public.hexes', ('id', 'last_runner_team', 'last_flipped_at', 'parent_hex', 'district_hex'),
+              ((h, 'red', long_ago, sim.h3.cell_to_parent(h, sim.ALL_RESOLUTION),
+                sim.h3.cell_to_parent(h, sim.CITY_RESOLUTION)) for h in cells))
+    conn.commit()
+    return ids
+
+
+# ==================== Measure ====================
+
+class Runner(threading.Thread):
+    """One user syncing runs back to back until told to stop."""
+
+    def __init__(self, dsn, user_id, hot, own, args, overlap, order, upsert, seed, stop):
+        super().__init__(daemon=True)
+        self.conn = sim.get_db_connection(dsn)
+        self.conn.autocommit = True
+        if upsert == 'sorted':
+            self.conn.cursor().execute(sorted_finalize_run_sql(self.conn))
+        cur = self.conn.cursor()
+        cur.execute("SELECT pg_backend_pid()")
+        self.pid = cur.fetchone()[0]
+        self.sql = FINALIZE_RUN_SQL.format(schema=UPSERTS[upsert])
+        self.user_id = user_id
+        self.hot, self.own = hot, own
+        self.path_len, self.overlap, self.order = args.path_len, overlap, order
+        self.district = sim.h3.cell_to_parent(own[0], sim.CITY_RESOLUTION)
+        self.rng = random.Random(seed)
+        self.stop = stop
+        self.latency = []
+        self.deadlocks = 0
+        self.errors = 0
+
+    def run(self):
+        cur = self.conn.cursor()
+        while not self.stop.is_set():
+            path = make_path(self.hot, self.own, self.path_len, self.overlap, self.order, self.rng)
+            end = datetime.now(timezone.utc)
+            t0 = time.perf_counter()
+            try:
+                cur.execute(self.sql, (
+                    self.user_id, end - timedelta(minutes=30), end, len(path) * 0.17, 1800, path, len(path),
+                    [sim.h3.cell_to_parent(h, sim.ALL_RESOLUTION) for h in path], self.district,
+                    [sim.h3.cell_to_parent(h, sim.CITY_RESOLUTION) for h in path]))
+                cur.fetchall()
+                self.latency.append(time.perf_counter() - t0)
+            except sim.psycopg2.errors.DeadlockDetected:
+                self.deadlocks += 1
+            except sim.psycopg2.Error as e:
+                self.errors += 1
+                if self.errors == 1:
+                    print(f"  finalize_run failed: {e.pgerror or e}".rstrip(), file=sys.stderr)
+        self.conn.close()
+
+
+class LockSampler(threading.Thread):
+    """Counts, every interval, the runner backends waiting on a heavyweight lock."""
+
+    def __init__(self, dsn, pids, interval):
+        super().__init__(daemon=True)
+        self.conn = sim.get_db_connection(dsn)
+        self.conn.autocommit = True
+        self.pids = pids
+        self.interval = interval
+        self.stop = threading.Event()
+        self.samples = []
+
+    def run(self):
+        cur = self.conn.cursor()
+        while not self.stop.is_set():
+            cur.execute(LOCK_SAMPLE_SQL, (self.pids,))
+            self.samples.append(cur.fetchone()[0])
+            time.sleep(self.interval)
+        self.conn.close()
+
+
+def contention_test(dsn, ids, hot, own_loops, args, overlap, order, upsert):
+    stop = threading.Event()
+    runners = [Runner(dsn, user_id, hot, own_loops[k], args, overlap, order, upsert, args.seed + k, stop)
+               for k, user_id in enumerate(ids)]
+    sampler = LockSampler(dsn, [r.pid for r in runners], args.sample_ms / 1000)
+    sampler.start()
+    for r in runners:
+        r.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for r in runners:
+        r.join()
+    sampler.stop.set()
+    sampler.join()
+
+    latency = [x for r in runners for x in r.latency]
+    deadlocks = sum(r.deadlocks for r in runners)
+    waiting = float(np.mean(sampler.samples)) if sampler.samples else 0.0
+    return {
+        'runs': len(latency),
+        'rps': len(latency) / args.seconds,
+        'p50': float(np.percentile(latency, 50)) * 1000 if latency else float('nan'),
+        'p99': float(np.percentile(latency, 99)) * 1000 if latency else float('nan'),
+        'deadlocks': deadlocks,
+        'errors': sum(r.errors for r in runners),
+        'lock_wait': waiting / len(runners),
+        'wait_per_run': waiting * args.seconds / max(len(latency), 1) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='finalize_run() hexes upsert under hot-hex contention')
+    parser.add_argument('--dsn', default=sim.LOCAL_DB_DSN, help='Postgres DSN (default: local supabase / $SIM_DB_DSN)')
+    parser.add_argument('--runners', type=int, default=32, help='Concurrent runners, one connection each (default: 32)')
+    parser.add_argument('--seconds', type=float, default=10, help='Load-test duration per cell (default: 10)')
+    parser.add_argument('--path-len', type=int, default=40, help='Cells per run (default: 40)')
+    parser.add_argument('--park-radius', type=int, default=5,
+                        help='H3 ring radius of the shared park loop; 6 x radius cells (default: 5)')
+    parser.add_argument('--overlaps', default='0,0.25,0.5,1',
+                        help='Comma-separated shares of each path on the park loop (default: 0,0.25,0.5,1)')
+    parser.add_argument('--orders', default='run,sorted', help='Path orders to test: run, sorted (default: both)')
+    parser.add_argument('--upserts', default='loop,sorted', help='Upsert variants to test: loop, sorted (default: both)')
+    parser.add_argument('--sample-ms', type=float, default=10, help='Lock sampling interval (default: 10)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    args = parser.parse_args()
+
+    if sim.psycopg2 is None:
+        print("ERROR: psycopg2 required. Install with: pip install psycopg2-binary", file=sys.stderr)
+        sys.exit(1)
+
+    overlaps = [float(x) for x in args.overlaps.split(',')]
+    orders = args.orders.split(',')
+    upserts = args.upserts.split(',')
+    hot = park_loop(args.park_radius)
+    own_loops = private_loops(args.runners, args.path_len, set(hot))
+    cells = sorted(set(hot).union(*own_loops))
+
+    conn = sim.get_db_connection(args.dsn)
+    cur = conn.cursor()
+    cur.execute("SHOW deadlock_timeout")
+    deadlock_timeout = cur.fetchone()[0]
+    conn.rollback()
+    if 'sorted' in upserts:
+        sorted_finalize_run_sql(conn)  # fail before loading anything if the loop is not there
+
+    try:
+        ids = fill(conn, args.runners, cells)
+        print(f"{args.runners} runners, {args.path_len}-cell paths, park loop of {len(hot)} cells, "
+              f"deadlock_timeout {deadlock_timeout}, {args.seconds:g}s per cell", file=sys.stderr)
+
+        print(f"\n{'overlap':>7} {'order':<7} {'upsert':<7} {'runs/s':>8} {'vs 0%':>6} {'p50':>9} {'p99':>9} "
+              f"{'deadlocks':>9} {'/1k runs':>8} {'lock wait':>9} {'wait/run':>9}")
+        baseline = {}
+        for order in orders:
+            for upsert in upserts:
+                for overlap in overlaps:
+                    r = contention_test(args.dsn, ids, hot, own_loops, args, overlap, order, upsert)
+                    if overlap == 0:
+                        baseline[(order, upsert)] = r['rps']
+                    base = baseline.get((order, upsert))
+                    vs = f"{r['rps'] / base:>5.2f}x" if base else f"{'-':>6}"
+                    per_k = r['deadlocks'] * 1000 / max(r['runs'] + r['deadlocks'], 1)
+                    print(f"{overlap:>7.0%} {order:<7} {upsert:<7} {r['rps']:>8.1f} {vs} {r['p50']:>7.1f}ms "
+                          f"{r['p99']:>7.1f}ms {r['deadlocks']:>9,} {per_k:>8.1f} {r['lock_wait']:>9.1%} "
+                          f"{r['wait_per_run']:>7.1f}ms", flush=True)
+                    if r['errors']:
+                        print(f"        {r['errors']:,} runs failed with other errors", file=sys.stderr)
+    finally:
+        conn.rollback()
+        cur = conn.cursor()
+        cur.execute(CLEANUP_SQL, (cells,))
+        conn.commit()
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
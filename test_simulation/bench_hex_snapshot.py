@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+RunStrict Midnight hex_snapshot Build Benchmark
+
+Runs the nightly snapshot build as SQL against a local Postgres and checks
+every day's result against hex_snapshot_oracle.py:
+
+    snapshot(D + 1) = DISTINCT ON (hex) of
+                      snapshot(D) rows  UNION ALL  unnest(hex_path) of runs ending on GMT+2 date D
+                      ordered by (today's runs first, end_time DESC, run order DESC)
+
+The season is synthetic (hex_snapshot_oracle.synthetic_season): by default
+1M hexes and 100k runs per day. Runs are COPYed into temp tables shaped like
+runs / hex_snapshot. Nothing is written to public tables.
+
+Usage:
+    python3 bench_hex_snapshot.py                                  # 1M hexes, 100k runs/day, 3 days
+    python3 bench_hex_snapshot.py --hexes 200000 --runs-per-day 20000 --days 7
+    python3 bench_hex_snapshot.py --dsn postgresql://...
+
+Requires: pip install numpy psycopg2-binary
+"""
+
+import argparse
+import io
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from hex_snapshot_oracle import (
+    DAY_SECONDS, GMT2_OFFSET, TEAMS, build_snapshot_diffs, day_to_date,
+    iter_snapshots, snapshot_rows, synthetic_season,
+)
+from simulate_day import LOCAL_DB_DSN, get_db_connection
+
+SCHEMA_SQL = """
+CREATE TEMP TABLE _bench_runs (
+  seq          BIGINT      NOT NULL,
+  team_at_run  TEXT        NOT NULL,
+  end_time     TIMESTAMPTZ NOT NULL,
+  hex_path     TEXT[]      NOT NULL
+);
+CREATE TEMP TABLE _bench_hex_snapshot (
+  hex_id            TEXT        NOT NULL,
+  last_runner_team  TEXT        NOT NULL,
+  snapshot_date     DATE        NOT NULL,
+  last_run_end_time TIMESTAMPTZ,
+  PRIMARY KEY (hex_id, snapshot_date)
+);
+CREATE TEMP TABLE _bench_runs_in (seq BIGINT, team TEXT, end_epoch BIGINT, hex_path TEXT[]);
+"""
+
+# Same shape as the midnight build: yesterday's snapshot + today's runs, latest end_time wins
+BUILD_SQL = """
+INSERT INTO _bench_hex_snapshot (hex_id, last_runner_team, snapshot_date, last_run_end_time)
+SELECT DISTINCT ON (x.hex_id) x.hex_id, x.team, %(snapshot_date)s, x.end_time
+FROM (
+  SELECT s.hex_id, s.last_runner_team AS team, s.last_run_end_time AS end_time, 0 AS src, 0::BIGINT AS seq
+  FROM _bench_hex_snapshot s
+  WHERE s.snapshot_date = %(prev_date)s
+  UNION ALL
+  SELECT p.hex_id, r.team_at_run, r.end_time, 1, r.seq
+  FROM _bench_runs r
+  CROSS JOIN LATERAL unnest(r.hex_path) AS p(hex_id)
+  WHERE r.end_time >= %(day_start)s AND r.end_time < %(day_end)s
+) x
+ORDER BY x.hex_id, x.src DESC, x.end_time DESC, x.seq DESC
+"""
+
+FETCH_SQL = """
+COPY (
+  SELECT substr(hex_id, 2)::BIGINT,
+         array_position(ARRAY['red', 'blue', 'purple'], last_runner_team) - 1,
+         extract(epoch FROM last_run_end_time)::BIGINT
+  FROM _bench_hex_snapshot WHERE snapshot_date = '{date}' ORDER BY 1
+) TO STDOUT
+"""
+
+
+def _ts(epoch):
+    return datetime.fromtimestamp(int(epoch), tz=timezone.utc)
+
+
+def hex_id(i):
+    return f"h{i:07d}"
+
+
+def copy_runs(cur, season, lo, hi):
+    """COPY runs [lo, hi) into _bench_runs."""
+    buf = io.StringIO()
+    offsets = season['offsets']
+    for r in range(lo, hi):
+        path = ','.join(hex_id(h) for h in season['hexes'][offsets[r]:offsets[r + 1]])
+        buf.write(f"{r}\t{TEAMS[season['team'][r]]}\t{int(season['end_time'][r])}\t{{{path}}}\n")
+    buf.seek(0)
+    cur.execute("TRUNCATE _bench_runs_in")
+    cur.copy_expert("COPY _bench_runs_in FROM STDIN", buf)
+    cur.execute("INSERT INTO _bench_runs SELECT seq, team, to_timestamp(end_epoch), hex_path FROM _bench_runs_in")
+
+
+def fetch_snapshot(cur, date):
+    buf = io.StringIO()
+    cur.copy_expert(FETCH_SQL.format(date=date), buf)
+    data = np.array(buf.getvalue().split(), dtype=np.int64).reshape(-1, 3)
+    return data[:, 0], data[:, 1], data[:, 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the midnight hex_snapshot build against the oracle')
+    parser.add_argument('--dsn', default=LOCAL_DB_DSN, help='Postgres DSN (default: local supabase / $SIM_DB_DSN)')
+    parser.add_argument('--hexes', type=int, default=1_000_000, help='Hex universe (default: 1M)')
+    parser.add_argument('--runs-per-day', type=int, default=100_000, help='Runs per day (default: 100k)')
+    parser.add_argument('--days', type=int, default=3, help='Days to build (default: 3)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    parser.add_argument('--work-mem', type=str, default='256MB', help='work_mem for the build (default: 256MB)')
+    args = parser.parse_args()
+
+    season = synthetic_season(args.hexes, args.runs_per_day, args.days, args.seed)
+    t0 = time.perf_counter()
+    diffs = build_snapshot_diffs(season, args.hexes)
+    oracle_s = time.perf_counter() - t0
+    print(f"Oracle: {len(season['hexes']):,} hex entries -> {len(diffs['hex']):,} diff rows "
+          f"in {oracle_s:.2f}s", file=sys.stderr)
+
+    conn = get_db_connection(args.dsn)
+    cur = conn.cursor()
+    failed = 0
+    try:
+        cur.execute(SCHEMA_SQL)
+        cur.execute(f"SET LOCAL work_mem = '{args.work_mem}'")
+        run_days = (season['end_time'] + GMT2_OFFSET) // DAY_SECONDS
+        day_bounds = np.searchsorted(run_days, diffs['days'])
+        day_bounds = np.r_[day_bounds, len(run_days)]
+
+        t0 = time.perf_counter()
+        for i in range(len(diffs['days'])):
+            copy_runs(cur, season, day_bounds[i], day_bounds[i + 1])
+        cur.execute("CREATE INDEX ON _bench_runs (end_time); ANALYZE _bench_runs")
+        print(f"Loaded {len(season['end_time']):,} runs in {time.perf_counter() - t0:.1f}s", file=sys.stderr)
+
+        total_sql = 0.0
+        for snap_day, team, end in iter_snapshots(diffs, args.hexes):
+            run_day = snap_day - 1
+            snapshot_date = day_to_date(snap_day)
+            day_start = run_day * DAY_SECONDS - GMT2_OFFSET
+            t0 = time.perf_counter()
+            cur.execute(BUILD_SQL, {
+                'snapshot_date': snapshot_date,
+                'prev_date': day_to_date(run_day),
+                'day_start': _ts(day_start),
+                'day_end': _ts(day_start + DAY_SECONDS),
+            })
+            rows = cur.rowcount
+            elapsed = time.perf_counter() - t0
+            total_sql += elapsed
+
+            o_hex, o_team, o_end = snapshot_rows(team, end)
+            s_hex, s_team, s_end = fetch_snapshot(cur, snapshot_date)
+            same = (np.array_equal(o_hex, s_hex) and np.array_equal(o_team, s_team)
+                    and np.array_equal(o_end, s_end))
+            if not same:
+                failed += 1
+            print(f"  {snapshot_date}: {rows:,} rows in {elapsed * 1000:,.0f} ms  "
+                  f"{'MATCH' if same else 'MISMATCH'} (oracle {len(o_hex):,} hexes)", file=sys.stderr)
+
+        print(f"SQL build total {total_sql:.2f}s vs oracle {oracle_s:.2f}s for the whole season", file=sys.stderr)
+    finally:
+        conn.rollback()
+        conn.close()
+
+    if failed:
+        print(f"{failed} day(s) differ from the oracle", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
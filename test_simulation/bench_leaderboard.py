@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+RunStrict Leaderboard Benchmark: live sort vs materialized leaderboard_entries
+
+Loads N synthetic users (1M by default) and today's runs into the public
+tables. It then compares the leaderboard RPCs before and after
+20260308000005_materialized_leaderboard.sql:
+
+  live          get_leaderboard() from 20260303000005 (loaded as a pg_temp
+                function), the same sort filtered to one province, and the
+                caller's rank by counting everyone ahead of them
+  materialized  get_leaderboard(), get_scoped_leaderboard(), get_leaderboard_rank()
+                reading leaderboard_entries
+
+Each RPC runs from --clients concurrent connections for --seconds, and the
+report gives p50/p99 latency and throughput. The refresh side is measured
+too:
+  rebuild       rebuild_leaderboard() over every user (nightly, or when stale)
+  incremental   refresh_leaderboard() after a batch of runs with an earlier
+                run_date arrives (one batch per --late-syncs size). This is
+                what the every-minute cron does.
+After the last incremental refresh, the board and its totals are checked
+row for row against a fresh rebuild. get_leaderboard_rank() is also checked
+against a full sort of the board for sampled users.
+
+Users get a long-tailed season_points distribution with many ties, so the
+name tie-break matters. Their homes are spread zipf-like over the Res-5
+provinces (and their Res-6 districts) around the default home hex. The
+migration must already be applied. The data goes into the real public
+tables, so point this at a disposable local database. The synthetic users
+and their runs are deleted at the end, and the board is rebuilt.
+
+Usage:
+    python3 bench_leaderboard.py                                   # 1M users, 8 clients, 10s per RPC
+    python3 bench_leaderboard.py --users 200000 --clients 16 --seconds 20
+    python3 bench_leaderboard.py --late-syncs 1,10,100,1000
+    python3 bench_leaderboard.py --dsn postgresql://...
+
+Requires: pip install h3 numpy psycopg2-binary
+"""
+
+import argparse
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from bench_season_reset import copy_into
+import simulate_day as sim
+
+LIVE_MIGRATION = sim.SCRIPT_DIR.parent / 'supabase' / 'migrations' / '20260303000005_fix_get_leaderboard_run_date.sql'
+
+TEAMS = ('red', 'blue', 'purple')
+
+LIVE_SCOPED_SQL = """
+WITH today_points AS (
+  SELECT r.user_id, SUM(r.flip_points)::INT AS today_fp
+  FROM public.run_history r
+  WHERE r.run_date = (NOW() AT TIME ZONE 'Etc/GMT-2')::DATE
+  GROUP BY r.user_id
+)
+SELECT u.id, u.name, (u.season_points - COALESCE(tp.today_fp, 0))::INT AS pts,
+       ROW_NUMBER() OVER (ORDER BY (u.season_points - COALESCE(tp.today_fp, 0)) DESC, u.name)
+FROM public.users u
+LEFT JOIN today_points tp ON tp.user_id = u.id
+WHERE u.province_hex = %s AND u.team IS NOT NULL
+  AND (u.season_points - COALESCE(tp.today_fp, 0)) > 0
+ORDER BY 3 DESC, u.name
+LIMIT 100
+"""
+
+LIVE_RANK_SQL = """
+WITH today_points AS (
+  SELECT r.user_id, SUM(r.flip_points)::INT AS today_fp
+  FROM public.run_history r
+  WHERE r.run_date = (NOW() AT TIME ZONE 'Etc/GMT-2')::DATE
+  GROUP BY r.user_id
+),
+pts AS (
+  SELECT u.id, u.name, u.province_hex, u.district_hex,
+         u.season_points - COALESCE(tp.today_fp, 0) AS p
+  FROM public.users u
+  LEFT JOIN today_points tp ON tp.user_id = u.id
+  WHERE u.team IS NOT NULL
+),
+me AS (
+  SELECT u.id, u.name, u.province_hex, u.district_hex,
+         u.season_points - COALESCE((SELECT SUM(r.flip_points) FROM public.run_history r
+                                     WHERE r.user_id = u.id
+                                       AND r.run_date = (NOW() AT TIME ZONE 'Etc/GMT-2')::DATE), 0) AS p
+  FROM public.users u
+  WHERE u.id = %s
+)
+SELECT 1 + COUNT(*),
+       1 + COUNT(*) FILTER (WHERE o.province_hex = me.province_hex),
+       1 + COUNT(*) FILTER (WHERE o.district_hex = me.district_hex)
+FROM pts o, me
+WHERE o.p > 0 AND (o.p > me.p OR (o.p = me.p AND (o.name, o.id) < (me.name, me.id)))
+"""
+
+RPCS = {
+    'top 200 global': {
+        'live': "SELECT * FROM pg_temp.get_leaderboard(200)",
+        'materialized': "SELECT * FROM public.get_leaderboard(200)",
+        'param': None,
+    },
+    'top 100 province': {
+        'live': LIVE_SCOPED_SQL,
+        'materialized': "SELECT * FROM public.get_scoped_leaderboard(%s, 5, 100)",
+        'param': 'province',
+    },
+    'own rank': {
+        'live': LIVE_RANK_SQL,
+        'materialized': "SELECT public.get_leaderboard_rank(%s)",
+        'param': 'user',
+    },
+}
+
+VERIFY_SQL = """
+SELECT (SELECT count(*) FROM _bench_entries b
+        FULL JOIN public.leaderboard_entries le ON le.user_id = b.user_id AND le.scope = b.scope
+        WHERE le.user_id IS NULL OR b.user_id IS NULL
+           OR (le.scope_hex, le.name, le.season_points) IS DISTINCT FROM (b.scope_hex, b.name, b.season_points))
+     + (SELECT count(*) FROM _bench_totals b
+        FULL JOIN public.leaderboard_totals t ON t.scope = b.scope AND t.scope_hex = b.scope_hex
+        WHERE t.total IS DISTINCT FROM b.total)
+"""
+
+SORTED_RANK_SQL = """
+SELECT user_id::text, scope, rank FROM (
+  SELECT user_id, scope, ROW_NUMBER() OVER (
+           PARTITION BY scope, scope_hex ORDER BY season_points DESC, name, user_id) AS rank
+  FROM public.leaderboard_entries
+) ranked
+WHERE user_id = ANY(%s::uuid[])
+"""
+
+CLEANUP_SQL = """
+DELETE FROM public.run_history WHERE user_id::text LIKE 'aaaaaaaa-%';
+DELETE FROM public.leaderboard_entries WHERE user_id::text LIKE 'aaaaaaaa-%';
+DELETE FROM public.leaderboard_dirty WHERE user_id::text LIKE 'aaaaaaaa-%';
+DELETE FROM public.users WHERE id::text LIKE 'aaaaaaaa-%';
+"""
+
+
+def live_get_leaderboard_sql():
+    """The pre-materialization get_leaderboard() as pg_temp.get_leaderboard()."""
+    text = LIVE_MIGRATION.read_text()
+    m = re.search(r"CREATE FUNCTION public\.get_leaderboard\(.*?\n\$fn\$;", text, re.S)
+    if not m:
+        raise RuntimeError(f"get_leaderboard() not found in {LIVE_MIGRATION.name}")
+    return m.group(0).replace('public.get_leaderboard(', 'pg_temp.get_leaderboard(')
+
+
+# ==================== Fill ====================
+
+def geography(rng):
+    """Res-5 provinces around the default home hex, each with its Res-6 districts."""
+    region = sim.h3.cell_to_parent(sim.DEFAULT_HOME_HEX, 3)
+    provinces = sorted(sim.h3.cell_to_children(region, sim.ALL_RESOLUTION))
+    rng.shuffle(provinces)
+    return [(p, sorted(sim.h3.cell_to_children(p, sim.CITY_RESOLUTION))) for p in provinces]
+
+
+def gmt2_today():
+    return (datetime.now(timezone.utc) + timedelta(hours=2)).date()
+
+
+def fill(conn, n_users, today_frac, seed):
+    """COPY users and today's runs. Returns (user ids, province hexes)."""
+    rng = np.random.default_rng(seed)
+    geo = geography(random.Random(seed))
+    weights = 1.0 / np.arange(1, len(geo) + 1)
+    province_idx = rng.choice(len(geo), size=n_users, p=weights / weights.sum())
+    district_pick = rng.integers(0, 7, size=n_users)
+    # Long tail with many ties: most users in the hundreds, a few in the tens of thousands
+    points = np.floor(rng.lognormal(5.0, 1.3, size=n_users)).astype(int)
+    points[rng.random(n_users) < 0.1] = 0
+    teams = rng.integers(0, len(TEAMS), size=n_users)
+    no_team = rng.random(n_users) < 0.02
+    ids = [sim.sim_user_id(i) for i in range(n_users)]
+
+    cur = conn.cursor()
+    cur.execute("SET session_replication_role = replica")  # synthetic users have no auth.users rows
+    copy_into(cur, 'public.users',
+              ('id', 'auth_id', 'name', 'team', 'season_points', 'province_hex', 'district_hex',
+               'total_distance_km', 'total_runs'),
+              ((ids[i], ids[i], f"Runner {i % 50000}", None if no_team[i] else TEAMS[teams[i]], int(points[i]),
+                geo[province_idx[i]][0], geo[province_idx[i]][1][district_pick[i] % len(geo[province_idx[i]][1])],
+                0, 0)
+               for i in range(n_users)))
+
+    today = gmt2_today()
+    runners = np.flatnonzero((rng.random(n_users) < today_frac) & (points > 0))
+    now = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S+00')
+    copy_into(cur, 'public.run_history',
+              ('id', 'user_id', 'run_date', 'start_time', 'end_time', 'distance_km', 'duration_seconds',
+               'flip_points', 'team_at_run', 'created_at'),
+              ((uuid.uuid4(), ids[i], today, now, now, 5.0, 1800, int(rng.integers(1, points[i] + 1)),
+                TEAMS[teams[i]], now)
+               for i in runners.tolist()))
+    cur.execute("SET session_replication_role = DEFAULT")
+    conn.commit()
+    cur.execute("ANALYZE public.users")
+    cur.execute("ANALYZE public.run_history")
+    conn.commit()
+    return ids, [p for p, _ in geo], len(runners)
+
+
+# ==================== Measure ====================
+
+class Client(threading.Thread):
+    """One connection calling one RPC in a loop until told to stop."""
+
+    def __init__(self, dsn, sql, params, seed, stop):
+        super().__init__(daemon=True)
+        self.conn = sim.get_db_connection(dsn)
+        self.conn.autocommit = True
+        cur = self.conn.cursor()
+        cur.execute(live_get_leaderboard_sql())
+        self.sql = sql
+        self.params = params
+        self.rng = random.Random(seed)
+        self.stop = stop
+        self.latency = []
+
+    def run(self):
+        cur = self.conn.cursor()
+        while not self.stop.is_set():
+            args = (self.rng.choice(self.params),) if self.params else None
+            t0 = time.perf_counter()
+            cur.execute(self.sql, args)
+            cur.fetchall()
+            self.latency.append(time.perf_counter() - t0)
+        self.conn.close()
+
+
+def load_test(dsn, sql, params, clients, seconds, seed):
+    stop = threading.Event()
+    threads = [Client(dsn, sql, params, seed + k, stop) for k in range(clients)]
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    latency = [x for t in threads for x in t.latency]
+    return {
+        'n': len(latency),
+        'p50': float(np.percentile(latency, 50)) * 1000,
+        'p99': float(np.percentile(latency, 99)) * 1000,
+        'qps': len(latency) / seconds,
+    }
+
+
+def late_syncs(conn, ids, n, seed):
+    """n runs dated yesterday arriving now, written the way finalize_run() writes them."""
+    rng = random.Random(seed)
+    yesterday = gmt2_today() - timedelta(days=1)
+    stamp = f"{yesterday} 10:00:00+00"
+    cur = conn.cursor()
+    for user_id in rng.sample(ids, n):
+        pts = rng.randint(1, 60)
+        cur.execute("UPDATE public.users SET season_points = season_points + %s WHERE id = %s", (pts, user_id))
+        cur.execute("INSERT INTO public.run_history (id, user_id, run_date, start_time, end_time, distance_km, "
+                    "duration_seconds, flip_points, team_at_run) VALUES (%s, %s, %s, %s, %s, 5.0, 1800, %s, 'red')",
+                    (str(uuid.uuid4()), user_id, yesterday, stamp, stamp, pts))
+    conn.commit()
+
+
+def mismatches(conn):
+    """Entries / totals where the incrementally maintained board differs from a fresh rebuild."""
+    cur = conn.cursor()
+    cur.execute("CREATE TEMP TABLE _bench_entries ON COMMIT DROP AS SELECT * FROM public.leaderboard_entries")
+    cur.execute("CREATE TEMP TABLE _bench_totals ON COMMIT DROP AS SELECT * FROM public.leaderboard_totals")
+    cur.execute("SELECT public.rebuild_leaderboard()")
+    cur.execute(VERIFY_SQL)
+    n = cur.fetchone()[0]
+    conn.rollback()
+    return n
+
+
+def rank_mismatches(conn, user_ids):
+    """(user, scope) pairs where get_leaderboard_rank() disagrees with a full sort of the board."""
+    cur = conn.cursor()
+    cur.execute(SORTED_RANK_SQL, (user_ids,))
+    expected = {(u, scope): rank for u, scope, rank in cur.fetchall()}
+    got = {}
+    for user_id in user_ids:
+        cur.execute("SELECT public.get_leaderboard_rank(%s)", (user_id,))
+        for scope, r in cur.fetchone()[0].items():
+            got[(user_id, scope)] = r['rank']
+    conn.rollback()
+    return sum(1 for k in expected.keys() | got.keys() if expected.get(k) != got.get(k))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Leaderboard RPC latency and refresh cost: live vs materialized')
+    parser.add_argument('--dsn', default=sim.LOCAL_DB_DSN, help='Postgres DSN (default: local supabase / $SIM_DB_DSN)')
+    parser.add_argument('--users', type=int, default=1_000_000, help='Synthetic users (default: 1,000,000)')
+    parser.add_argument('--today-frac', type=float, default=0.3, help='Share of users with a run today (default: 0.3)')
+    parser.add_argument('--clients', type=int, default=8, help='Concurrent connections per RPC (default: 8)')
+    parser.add_argument('--seconds', type=float, default=10, help='Load-test duration per RPC (default: 10)')
+    parser.add_argument('--late-syncs', default='10,100,1000',
+                        help='Comma-separated late-sync batch sizes, one incremental refresh each (default: 10,100,1000)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    args = parser.parse_args()
+
+    if sim.psycopg2 is None:
+        print("ERROR: psycopg2 required. Install with: pip install psycopg2-binary", file=sys.stderr)
+        sys.exit(1)
+
+    conn = sim.get_db_connection(args.dsn)
+    cur = conn.cursor()
+    cur.execute("SELECT to_regproc('public.refresh_leaderboard')")
+    if cur.fetchone()[0] is None:
+        print("ERROR: apply 20260308000005_materialized_leaderboard.sql first", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        t0 = time.perf_counter()
+        ids, provinces, n_runs = fill(conn, args.users, args.today_frac, args.seed)
+        print(f"Loaded {len(ids):,} users and {n_runs:,} runs today over {len(provinces)} provinces "
+              f"({time.perf_counter() - t0:.1f}s)", file=sys.stderr)
+
+        t0 = time.perf_counter()
+        cur.execute("SELECT public.rebuild_leaderboard()")
+        rebuild = cur.fetchone()[0]
+        conn.commit()
+        rebuild_s = time.perf_counter() - t0
+        conn.autocommit = True
+        cur.execute("VACUUM ANALYZE public.leaderboard_entries")  # what autovacuum does after the nightly rebuild
+        conn.autocommit = False
+        print(f"\nrebuild_leaderboard(): {rebuild_s:,.2f}s, {rebuild['rows']:,} rows over 3 scopes")
+
+        rng = random.Random(args.seed)
+        params = {'province': provinces, 'user': rng.sample(ids, min(len(ids), 5000))}
+        print(f"\n{'rpc':<18} {'version':<13} {'calls':>7} {'p50':>10} {'p99':>10} {'qps':>8}")
+        for rpc, spec in RPCS.items():
+            for version in ('live', 'materialized'):
+                r = load_test(args.dsn, spec[version], params.get(spec['param']), args.clients, args.seconds,
+                              args.seed)
+                print(f"{rpc:<18} {version:<13} {r['n']:>7,} {r['p50']:>8.2f}ms {r['p99']:>8.2f}ms {r['qps']:>8.1f}")
+
+        print(f"\n{'late syncs':>10} {'mode':<12} {'entries moved':>14} {'refresh':>9}")
+        for k, n in enumerate(int(x) for x in args.late_syncs.split(',')):
+            late_syncs(conn, ids, n, args.seed + k)
+            t0 = time.perf_counter()
+            cur.execute("SELECT public.refresh_leaderboard()")
+            refresh = cur.fetchone()[0]
+            conn.commit()
+            refresh_s = time.perf_counter() - t0
+            print(f"{n:>10,} {refresh['mode']:<12} {refresh.get('added', 0):>14,} {refresh_s * 1000:>7.1f}ms")
+        print(f"board vs fresh rebuild: {mismatches(conn):,} mismatched entries / totals")
+        print(f"get_leaderboard_rank() vs full sort: {rank_mismatches(conn, params['user'][:200]):,} "
+              f"mismatched ranks (200 users)")
+    finally:
+        conn.rollback()
+        cur = conn.cursor()
+        cur.execute(CLEANUP_SQL)
+        cur.execute("SELECT public.rebuild_leaderboard()")
+        conn.commit()
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
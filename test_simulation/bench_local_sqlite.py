@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+RunStrict Local SQLite Benchmark: journal mode, synchronous, batch size
+
+Replays a season of the app's client-side SQLite writes under each
+combination of journal mode (WAL / DELETE), synchronous (NORMAL / FULL),
+route-point batch size and cache size. The goal is to fill in the open
+settings of docs/04-sync-and-performance.md §D with measurements.
+
+The database is the app's current schema (LocalStorage._onCreate, v19),
+loaded with test_data/local_sqlite_dump.sql. The dump is schema v8, so its
+runs are mapped to the v19 columns on load (distanceKm -> distance_meters,
+as the v11 migration does). The dump's runs also calibrate the generated
+runs: distance and pace are drawn from them.
+
+Each run replays the write pattern of RunNotifier / LocalStorage:
+  - one GPS route point per second. --batch-sizes decides how they reach
+    disk: N = a transaction every N points (laps ride along in the batch
+    when a km completes); 'run' = all points and laps in the finalize
+    transaction, which is what saveRunWithSyncTracking() does today
+  - saveRunCheckpoint() on every new hex, and every 60s
+  - finalize: saveRunWithSyncTracking(), clearRunCheckpoint(), then
+    updateRunSyncStatus('synced') after the Final Sync
+  - reads after the run: getTodayFlippedHexes() (local overlay) and
+    getTodayRoutes()
+  - --opens app opens per day, each reading getTodayFlippedHexes() and
+    getRetryableRuns()
+
+Hex ids come from the h3 cells of the simulated GPS track (Res 9, with the
+Res 5 / Res 6 parents in hex_parents / hex_district_parents).
+
+The report gives, per configuration:
+  - write transaction p50 / p99 / max while running, and finalize p99
+  - overlay read p99
+  - fsyncs per run, counted from the block device's flush counter
+    (/sys/dev/block/*/stat). Other processes flushing the same device add
+    noise, and on tmpfs or when the counter is unavailable it shows '-'
+  - database and -wal file size after the season
+
+Run it on the kind of disk you care about (--dir). fsync on a laptop SSD or
+a VM is much cheaper than on phone flash, so compare configurations by
+fsyncs and ratios rather than by absolute latency.
+
+Usage:
+    python3 bench_local_sqlite.py                                  # 40-day season, full matrix
+    python3 bench_local_sqlite.py --days 10 --batch-sizes 1,20,run
+    python3 bench_local_sqlite.py --journal-modes WAL --syncs NORMAL --cache-pages 500,2000,8000
+    python3 bench_local_sqlite.py --dir /mnt/slow-disk
+
+Requires: pip install h3 numpy
+"""
+
+import argparse
+import itertools
+import math
+import os
+import random
+import re
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+
+import simulate_day as sim
+
+DUMP_PATH = Path(__file__).resolve().parent.parent / 'test_data' / 'local_sqlite_dump.sql'
+
+# LocalStorage._onCreate (schema v19)
+SCHEMA_SQL = """
+CREATE TABLE runs (
+  id TEXT PRIMARY KEY,
+  startTime INTEGER NOT NULL,
+  endTime INTEGER NOT NULL,
+  distance_meters REAL NOT NULL,
+  durationSeconds INTEGER NOT NULL,
+  hexesColored INTEGER NOT NULL DEFAULT 0,
+  teamAtRun TEXT NOT NULL,
+  hex_path TEXT DEFAULT '',
+  hex_parents TEXT DEFAULT '',
+  hex_district_parents TEXT DEFAULT '',
+  buff_multiplier INTEGER DEFAULT 1,
+  cv REAL,
+  sync_status TEXT DEFAULT 'pending',
+  run_date TEXT,
+  retry_count INTEGER DEFAULT 0,
+  next_retry_at INTEGER,
+  has_flips INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE routes (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  runId TEXT NOT NULL,
+  lat REAL NOT NULL,
+  lng REAL NOT NULL,
+  timestampMs INTEGER NOT NULL,
+  FOREIGN KEY (runId) REFERENCES runs (id) ON DELETE CASCADE
+);
+CREATE TABLE laps (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  runId TEXT NOT NULL,
+  lapNumber INTEGER NOT NULL,
+  distanceMeters REAL NOT NULL,
+  durationSeconds REAL NOT NULL,
+  startTimestampMs INTEGER NOT NULL,
+  endTimestampMs INTEGER NOT NULL,
+  FOREIGN KEY (runId) REFERENCES runs (id) ON DELETE CASCADE
+);
+CREATE INDEX idx_routes_runId ON routes(runId);
+CREATE INDEX idx_laps_runId ON laps(runId);
+CREATE TABLE hex_cache (
+  hex_id TEXT PRIMARY KEY,
+  last_runner_team TEXT,
+  last_updated INTEGER
+);
+CREATE TABLE leaderboard_cache (
+  user_id TEXT PRIMARY KEY,
+  name TEXT NOT NULL,
+  avatar TEXT NOT NULL,
+  team TEXT NOT NULL,
+  flip_points INTEGER NOT NULL DEFAULT 0,
+  total_distance_km REAL NOT NULL DEFAULT 0,
+  stability_score INTEGER,
+  home_hex TEXT
+);
+CREATE TABLE prefetch_meta (
+  key TEXT PRIMARY KEY,
+  value TEXT NOT NULL,
+  updated_at INTEGER NOT NULL
+);
+CREATE TABLE sync_queue (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  run_id TEXT NOT NULL UNIQUE,
+  payload TEXT NOT NULL,
+  created_at INTEGER NOT NULL,
+  retry_count INTEGER NOT NULL DEFAULT 0,
+  last_error TEXT
+);
+CREATE INDEX idx_sync_queue_created ON sync_queue(created_at ASC);
+CREATE TABLE run_checkpoint (
+  id TEXT PRIMARY KEY DEFAULT 'active',
+  run_id TEXT NOT NULL,
+  team_at_run TEXT NOT NULL,
+  start_time INTEGER NOT NULL,
+  distance_meters REAL NOT NULL,
+  hexes_colored INTEGER NOT NULL DEFAULT 0,
+  captured_hex_ids TEXT NOT NULL DEFAULT '',
+  buff_multiplier INTEGER NOT NULL DEFAULT 1,
+  config_snapshot TEXT,
+  last_updated INTEGER NOT NULL
+);
+-- v13 index (LocalStorage._onUpgrade)
+CREATE INDEX idx_runs_sync_date ON runs(sync_status, run_date);
+"""
+
+# v8 dump rows -> v19 runs (the v11 migration's distanceKm * 1000)
+DUMP_RUNS_SQL = """
+INSERT INTO runs (id, startTime, endTime, distance_meters, durationSeconds, hexesColored, teamAtRun, cv,
+                  sync_status, run_date)
+SELECT id, startTime, endTime, distanceKm * 1000, durationSeconds, hexesColored, teamAtRun, cv,
+       'synced', date(endTime / 1000 + 7200, 'unixepoch')
+FROM temp.dump_runs
+"""
+
+INSERT_ROUTE_SQL = "INSERT INTO routes (runId, lat, lng, timestampMs) VALUES (?, ?, ?, ?)"
+INSERT_LAP_SQL = ("INSERT INTO laps (runId, lapNumber, distanceMeters, durationSeconds, startTimestampMs, endTimestampMs) "
+                  "VALUES (?, ?, ?, ?, ?, ?)")
+INSERT_RUN_SQL = """
+INSERT OR REPLACE INTO runs (id, startTime, endTime, distance_meters, durationSeconds, hexesColored, teamAtRun,
+                             hex_path, hex_parents, hex_district_parents, buff_multiplier, cv, sync_status, run_date,
+                             has_flips)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'pending', ?, ?)
+"""
+CHECKPOINT_SQL = """
+INSERT OR REPLACE INTO run_checkpoint (id, run_id, team_at_run, start_time, distance_meters, hexes_colored,
+                                       captured_hex_ids, buff_multiplier, last_updated)
+VALUES ('active', ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+CHECKPOINT_INTERVAL = 60   # RunNotifier._checkpointTimer
+GMT2 = timezone(timedelta(hours=2))
+
+
+# ==================== Fixture ====================
+
+def load_dump(conn, path):
+    """Load the v8 dump into the v19 schema. Returns the dump's runs as (distance_km, pace_sec_per_km)."""
+    text = Path(path).read_text()
+    for table, columns, values in re.findall(r"INSERT OR REPLACE INTO (\w+) \(([^)]*)\) VALUES(.*?);\n", text, re.S):
+        conn.execute(f"CREATE TEMP TABLE IF NOT EXISTS dump_{table} ({columns})")
+        conn.execute(f"INSERT INTO temp.dump_{table} ({columns}) VALUES {values}")
+        if table != 'runs':
+            conn.execute(f"INSERT OR REPLACE INTO {table} ({columns}) SELECT {columns} FROM temp.dump_{table}")
+    conn.execute(DUMP_RUNS_SQL)
+    runs = conn.execute("SELECT distanceKm, durationSeconds / distanceKm FROM temp.dump_runs").fetchall()
+    home = conn.execute("SELECT value FROM prefetch_meta WHERE key = 'home_hex'").fetchone()
+    for table in re.findall(r"INSERT OR REPLACE INTO (\w+) ", text):
+        conn.execute(f"DROP TABLE IF EXISTS temp.dump_{table}")
+    return runs, home[0] if home else sim.DEFAULT_HOME_HEX
+
+
+# ==================== Workload ====================
+
+def generate_season(dump_runs, home_hex, days, runs_per_day, seed):
+    """The season's runs: GPS points at 1 Hz, laps, hex path and parents."""
+    rng = random.Random(seed)
+    home_lat, home_lng = sim.h3.cell_to_latlng(home_hex)
+    season_start = datetime.now(GMT2).replace(hour=7, minute=0, second=0, microsecond=0) - timedelta(days=days)
+    season = []
+    for day in range(days):
+        for k in range(runs_per_day):
+            base_km, base_pace = rng.choice(dump_runs)
+            distance_km = base_km * rng.uniform(0.8, 1.2)
+            pace = base_pace * rng.uniform(0.9, 1.1)
+            start = season_start + timedelta(days=day, hours=11 * k, minutes=rng.randint(0, 90))
+            season.append(make_run(f"run_{day:02d}_{k}", start, distance_km, pace, home_lat, home_lng, rng))
+    return season
+
+
+def make_run(run_id, start, distance_km, pace, lat, lng, rng):
+    """One run: a heading-drifting walk, one point per second."""
+    start_ms = int(start.timestamp() * 1000)
+    speed = 1000 / pace   # m/s
+    seconds = int(distance_km * pace)
+    heading = rng.uniform(0, 2 * math.pi)
+    points, laps, hex_path = [], [], []
+    seen = set()
+    new_hex_at = set()
+    lap_start = 0
+    for s in range(seconds + 1):
+        heading += rng.gauss(0, 0.05)
+        lat += speed * math.cos(heading) / 111320
+        lng += speed * math.sin(heading) / (111320 * math.cos(math.radians(lat)))
+        points.append((lat, lng, start_ms + s * 1000))
+        cell = sim.h3.latlng_to_cell(lat, lng, sim.BASE_RESOLUTION)
+        if cell not in seen:
+            seen.add(cell)
+            hex_path.append(cell)
+            new_hex_at.add(s)
+        if s and int(s * speed // 1000) > len(laps):
+            laps.append((len(laps) + 1, 1000.0, float(s - lap_start), start_ms + lap_start * 1000, start_ms + s * 1000))
+            lap_start = s
+    lap_paces = [lap[2] for lap in laps]
+    cv = float(np.std(lap_paces) / np.mean(lap_paces) * 100) if len(lap_paces) > 1 else None
+    end = start + timedelta(seconds=seconds)
+    return {
+        'id': run_id,
+        'start_ms': start_ms,
+        'end_ms': start_ms + seconds * 1000,
+        'distance_m': seconds * speed,
+        'duration': seconds,
+        'points': points,
+        'laps': laps,
+        'lap_at': {int((lap[4] - start_ms) / 1000): lap for lap in laps},
+        'new_hex_at': new_hex_at,
+        'hex_path': hex_path,
+        'hex_parents': [sim.h3.cell_to_parent(h, sim.ALL_RESOLUTION) for h in hex_path],
+        'hex_district_parents': [sim.h3.cell_to_parent(h, sim.CITY_RESOLUTION) for h in hex_path],
+        'cv': cv,
+        'run_date': end.strftime('%Y-%m-%d'),
+    }
+
+
+# ==================== Measure ====================
+
+def device_flushes(path):
+    """Completed flush requests on the block device holding `path`, or None."""
+    st = os.stat(path)
+    try:
+        fields = Path(f"/sys/dev/block/{os.major(st.st_dev)}:{os.minor(st.st_dev)}/stat").read_text().split()
+    except OSError:
+        return None
+    return int(fields[15]) if len(fields) > 15 else None
+
+
+class Replay:
+    """One configuration: a fresh database, the season's runs, timed transactions."""
+
+    def __init__(self, directory, journal, synchronous, batch, cache_pages):
+        self.path = os.path.join(directory, f"bench_{journal}_{synchronous}_{batch}_{cache_pages}.db")
+        self.batch = batch
+        self.conn = sqlite3.connect(self.path, isolation_level=None)
+        self.conn.executescript(SCHEMA_SQL)
+        self.conn.execute(f"PRAGMA journal_mode={journal}")
+        self.conn.execute(f"PRAGMA synchronous={synchronous}")
+        self.conn.execute(f"PRAGMA cache_size={cache_pages}")
+        self.writes = []     # seconds per write transaction while running
+        self.finalize = []   # seconds per saveRunWithSyncTracking() transaction
+        self.reads = []      # seconds per getTodayFlippedHexes()
+
+    def txn(self, statements, into):
+        """One timed transaction of (sql, rows) pairs."""
+        t0 = time.perf_counter()
+        self.conn.execute("BEGIN")
+        for sql, rows in statements:
+            self.conn.executemany(sql, rows)
+        self.conn.execute("COMMIT")
+        into.append(time.perf_counter() - t0)
+
+    def today_flipped_hexes(self, run_date):
+        t0 = time.perf_counter()
+        hex_team = {}
+        for path, team in self.conn.execute(
+                "SELECT hex_path, teamAtRun FROM runs WHERE run_date = ? AND hex_path IS NOT NULL AND hex_path != ?",
+                (run_date, '')):
+            for hex_id in path.split(','):
+                hex_team[hex_id] = team
+        self.reads.append(time.perf_counter() - t0)
+        return hex_team
+
+    def today_routes(self, run_date):
+        for (run_id,) in self.conn.execute("SELECT id FROM runs WHERE run_date = ? ORDER BY startTime", (run_date,)).fetchall():
+            self.conn.execute("SELECT lat, lng, timestampMs FROM routes WHERE runId = ? ORDER BY timestampMs", (run_id,)).fetchall()
+
+    def retryable_runs(self, now_ms):
+        self.conn.execute("SELECT * FROM runs WHERE sync_status = 'pending' AND (next_retry_at IS NULL OR next_retry_at <= ?) "
+                          "ORDER BY endTime ASC", (now_ms,)).fetchall()
+
+    def run(self, r, team='red'):
+        pending = []
+        captured = []
+        for s, (lat, lng, ts) in enumerate(r['points']):
+            pending.append((INSERT_ROUTE_SQL, (r['id'], lat, lng, ts)))
+            if s in r['lap_at']:
+                pending.append((INSERT_LAP_SQL, (r['id'],) + r['lap_at'][s]))
+            if self.batch != 'run' and len(pending) >= self.batch:
+                self.txn(group(pending), self.writes)
+                pending = []
+            if s in r['new_hex_at'] or (s and s % CHECKPOINT_INTERVAL == 0):
+                if s in r['new_hex_at']:
+                    captured.append(r['hex_path'][len(captured)])
+                self.txn([(CHECKPOINT_SQL, [(r['id'], team, r['start_ms'], s * r['distance_m'] / r['duration'],
+                                             len(captured), ','.join(captured), 1, ts)])], self.writes)
+
+        run_row = (r['id'], r['start_ms'], r['end_ms'], r['distance_m'], r['duration'], len(r['hex_path']), team,
+                   ','.join(r['hex_path']), ','.join(r['hex_parents']), ','.join(r['hex_district_parents']), 1,
+                   r['cv'], r['run_date'], 1 if r['hex_path'] else 0)
+        self.txn([(INSERT_RUN_SQL, [run_row])] + group(pending), self.finalize)
+        self.txn([("DELETE FROM run_checkpoint WHERE id = ?", [('active',)])], self.writes)
+        self.txn([("UPDATE runs SET sync_status = ? WHERE id = ?", [('synced', r['id'])])], self.writes)
+        self.today_flipped_hexes(r['run_date'])
+        self.today_routes(r['run_date'])
+
+    def app_open(self, run_date, now_ms):
+        self.today_flipped_hexes(run_date)
+        self.retryable_runs(now_ms)
+
+    def sizes(self):
+        db = os.path.getsize(self.path)
+        wal = os.path.getsize(self.path + '-wal') if os.path.exists(self.path + '-wal') else 0
+        return db, wal
+
+
+def group(statements):
+    """Consecutive inserts into the same table as one executemany()."""
+    grouped = []
+    for sql, row in statements:
+        if grouped and grouped[-1][0] == sql:
+            grouped[-1][1].append(row)
+        else:
+            grouped.append((sql, [row]))
+    return grouped
+
+
+def replay(season, directory, dump, config, opens):
+    journal, synchronous, batch, cache_pages = config
+    bench = Replay(directory, journal, synchronous, batch, cache_pages)
+    load_dump(bench.conn, dump)
+    flush0 = device_flushes(bench.path)
+    t0 = time.perf_counter()
+    for r in season:
+        for k in range(opens):
+            bench.app_open(r['run_date'], r['start_ms'] - (k + 1) * 3600 * 1000)
+        bench.run(r)
+    elapsed = time.perf_counter() - t0
+    flush1 = device_flushes(bench.path)
+    db, wal = bench.sizes()
+    bench.conn.close()
+    closed = os.path.getsize(bench.path)
+    for suffix in ('', '-wal', '-shm', '-journal'):
+        if os.path.exists(bench.path + suffix):
+            os.remove(bench.path + suffix)
+    ms = lambda xs, q: float(np.percentile(xs, q)) * 1000
+    return {
+        'writes': len(bench.writes),
+        'w_p50': ms(bench.writes, 50),
+        'w_p99': ms(bench.writes, 99),
+        'w_max': max(bench.writes) * 1000,
+        'f_p99': ms(bench.finalize, 99),
+        'r_p99': ms(bench.reads, 99),
+        'fsyncs': None if flush0 is None or flush1 is None else (flush1 - flush0) / len(season),
+        'db': db,
+        'wal': wal,
+        'closed': closed,
+        'elapsed': elapsed,
+    }
+
+
+def fmt_bytes(n):
+    for unit in ('B', 'kB', 'MB', 'GB'):
+        if abs(n) < 1024 or unit == 'GB':
+            return f"{n:,.0f}B" if unit == 'B' else f"{n:,.1f}{unit}"
+        n /= 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Client SQLite settings benchmark on the app's schema and write pattern")
+    parser.add_argument('--days', type=int, default=40, help='Season length in days (default: 40)')
+    parser.add_argument('--runs-per-day', type=int, default=1, help='Runs per day (default: 1)')
+    parser.add_argument('--opens', type=int, default=3, help='App opens per run day (default: 3)')
+    parser.add_argument('--journal-modes', default='WAL,DELETE', help='journal_mode values (default: WAL,DELETE)')
+    parser.add_argument('--syncs', default='NORMAL,FULL', help='synchronous values (default: NORMAL,FULL)')
+    parser.add_argument('--batch-sizes', default='1,10,20,run',
+                        help="Route points per transaction, 'run' = all at finalize as today (default: 1,10,20,run)")
+    parser.add_argument('--cache-pages', default='2000', help='cache_size values in pages (default: 2000)')
+    parser.add_argument('--dump', default=str(DUMP_PATH), help='Client dump to load (default: test_data/local_sqlite_dump.sql)')
+    parser.add_argument('--dir', default='.', help='Directory for the database files (default: .)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    args = parser.parse_args()
+
+    batches = [b if b == 'run' else int(b) for b in args.batch_sizes.split(',')]
+    configs = list(itertools.product(args.journal_modes.split(','), args.syncs.split(','), batches,
+                                     [int(c) for c in args.cache_pages.split(',')]))
+
+    directory = tempfile.mkdtemp(prefix='bench_local_sqlite_', dir=args.dir)
+    try:
+        probe = sqlite3.connect(':memory:')
+        probe.executescript(SCHEMA_SQL)
+        dump_runs, home_hex = load_dump(probe, args.dump)
+        probe.close()
+        season = generate_season(dump_runs, home_hex, args.days, args.runs_per_day, args.seed)
+        points = sum(len(r['points']) for r in season)
+        print(f"SQLite {sqlite3.sqlite_version}: {len(season)} runs, {points:,} route points, "
+              f"{sum(len(r['laps']) for r in season)} laps, {sum(len(r['hex_path']) for r in season):,} hexes "
+              f"(dump: {len(dump_runs)} runs, home {home_hex})", file=sys.stderr)
+        if device_flushes(directory) is None:
+            print(f"  (no flush counter for the device under {args.dir}: fsyncs not reported)", file=sys.stderr)
+
+        results = {}
+        for config in configs:
+            results[config] = replay(season, directory, args.dump, config, args.opens)
+            print(f"  {'/'.join(map(str, config))}: {results[config]['elapsed']:.1f}s", file=sys.stderr)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print(f"\n{'journal':<8} {'sync':<7} {'batch':>5} {'cache':>6} {'writes':>7} {'w p50':>8} {'w p99':>8} {'w max':>8} "
+          f"{'final p99':>9} {'read p99':>9} {'fsync/run':>9} {'db':>9} {'wal':>9} {'closed':>9}")
+    for (journal, synchronous, batch, cache_pages), r in results.items():
+        fsyncs = '-' if r['fsyncs'] is None else f"{r['fsyncs']:,.0f}"
+        print(f"{journal:<8} {synchronous:<7} {batch:>5} {cache_pages:>6} {r['writes']:>7,} {r['w_p50']:>6.2f}ms "
+              f"{r['w_p99']:>6.2f}ms {r['w_max']:>6.1f}ms {r['f_p99']:>7.1f}ms {r['r_p99']:>7.2f}ms {fsyncs:>9} "
+              f"{fmt_bytes(r['db']):>9} {fmt_bytes(r['wal']):>9} {fmt_bytes(r['closed']):>9}")
+
+
+if __name__ == '__main__':
+    main()
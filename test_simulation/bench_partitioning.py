@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+RunStrict Partitioning Benchmark: hex_snapshot / run_history
+
+Loads a simulated season into two layouts in temp tables and compares them:
+
+  current      hex_snapshot as one heap; run_history range-partitioned monthly on
+               created_at (what pg_partman would create per baseline_schema.sql)
+  partitioned  20260308000003_partition_hex_snapshot_run_history.sql: hex_snapshot
+               daily on snapshot_date; run_history monthly on run_date
+
+Both layouts get the same indexes, including (user_id, run_date) on
+run_history, so the only difference is the partition key. The migration's
+create_date_partitions() / drop_date_partitions() are loaded from the file
+as pg_temp functions and build the partitioned layout.
+
+Runs come from simulate_day (zipf workload by default). Snapshots come from
+hex_snapshot_oracle.py (one full copy per day). --seasons repeats the
+season's runs further back in time, because run_history is kept across
+seasons and hex_snapshot is not.
+
+For each RPC-shaped query, the report gives the partitions the planner
+kept (EXPLAIN) and the p50/p95 latency over sampled parameters:
+  get_hex_snapshot             snapshot_date = D AND parent_hex = P
+  get_user_yesterday_stats     user_id = U AND run_date = D
+  season leaderboard           run_date in [season start, end), GROUP BY user_id
+It also times the hex_snapshot wipe in reset_season(): DELETE against
+dropping the daily partitions. Everything is rolled back.
+
+Usage:
+    python3 bench_partitioning.py                                   # 40 days, 2000 users, 3 seasons
+    python3 bench_partitioning.py --users 5000 --seasons 6 --samples 500
+    python3 bench_partitioning.py --dsn postgresql://...
+
+Requires: pip install h3 numpy psycopg2-binary
+"""
+
+import argparse
+import io
+import random
+import re
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from bench_snapshot_storage import simulate_season
+from hex_snapshot_oracle import TEAMS, build_snapshot_diffs, day_to_date, iter_snapshots, snapshot_rows
+import simulate_day as sim
+
+MIGRATION = sim.SCRIPT_DIR.parent / 'supabase' / 'migrations' / '20260308000003_partition_hex_snapshot_run_history.sql'
+HELPERS = ('create_date_partitions', 'drop_date_partitions')
+
+HEX_SNAPSHOT_COLS = """
+  hex_id            TEXT        NOT NULL,
+  last_runner_team  TEXT        NOT NULL,
+  snapshot_date     DATE        NOT NULL,
+  last_run_end_time TIMESTAMPTZ,
+  parent_hex        TEXT
+"""
+RUN_HISTORY_COLS = """
+  id               UUID        NOT NULL,
+  user_id          UUID        NOT NULL,
+  run_date         DATE        NOT NULL,
+  end_time         TIMESTAMPTZ NOT NULL,
+  distance_km      DOUBLE PRECISION NOT NULL,
+  duration_seconds INTEGER     NOT NULL,
+  flip_points      INTEGER     NOT NULL,
+  team_at_run      TEXT        NOT NULL,
+  created_at       TIMESTAMPTZ NOT NULL
+"""
+
+SCHEMA_SQL = f"""
+CREATE TEMP TABLE cur_hex_snapshot ({HEX_SNAPSHOT_COLS}, PRIMARY KEY (hex_id, snapshot_date));
+CREATE INDEX ON cur_hex_snapshot (snapshot_date, parent_hex);
+CREATE TEMP TABLE cur_run_history ({RUN_HISTORY_COLS}, PRIMARY KEY (id, created_at))
+  PARTITION BY RANGE (created_at);
+CREATE INDEX ON cur_run_history (user_id, run_date);
+
+CREATE TEMP TABLE part_hex_snapshot ({HEX_SNAPSHOT_COLS}, PRIMARY KEY (hex_id, snapshot_date))
+  PARTITION BY RANGE (snapshot_date);
+CREATE INDEX ON part_hex_snapshot (snapshot_date, parent_hex);
+CREATE TEMP TABLE part_hex_snapshot_default PARTITION OF part_hex_snapshot DEFAULT;
+CREATE TEMP TABLE part_run_history ({RUN_HISTORY_COLS}, PRIMARY KEY (id, run_date))
+  PARTITION BY RANGE (run_date);
+CREATE INDEX ON part_run_history (user_id, run_date);
+CREATE TEMP TABLE part_run_history_default PARTITION OF part_run_history DEFAULT;
+"""
+
+QUERIES = {
+    'get_hex_snapshot': """
+        SELECT hex_id, last_runner_team, last_run_end_time FROM {hex_snapshot}
+        WHERE parent_hex = %(parent)s AND snapshot_date = %(date)s""",
+    'get_user_yesterday_stats': """
+        SELECT COUNT(*), COALESCE(SUM(distance_km), 0), COALESCE(SUM(duration_seconds), 0),
+               COALESCE(SUM(flip_points), 0)
+        FROM {run_history} WHERE user_id = %(user_id)s AND run_date = %(date)s""",
+    'season_leaderboard': """
+        SELECT user_id, SUM(flip_points) AS points FROM {run_history}
+        WHERE run_date >= %(season_start)s AND run_date < %(season_end)s
+        GROUP BY user_id ORDER BY points DESC LIMIT 50""",
+}
+
+LAYOUTS = {
+    'current': {'hex_snapshot': 'cur_hex_snapshot', 'run_history': 'cur_run_history'},
+    'partitioned': {'hex_snapshot': 'part_hex_snapshot', 'run_history': 'part_run_history'},
+}
+
+
+def helper_sql(name):
+    """Pull CREATE FUNCTION <name>() out of the migration as a pg_temp function."""
+    text = MIGRATION.read_text()
+    m = re.search(rf"CREATE OR REPLACE FUNCTION public\.{name}\(.*?\n\$\$;", text, re.S)
+    if not m:
+        raise RuntimeError(f"{name}() not found in {MIGRATION.name}")
+    return m.group(0).replace(f'public.{name}(', f'pg_temp.{name}(')
+
+
+# ==================== Loading ====================
+
+def copy_into(cur, table, rows):
+    buf = io.StringIO()
+    for row in rows:
+        buf.write('\t'.join('\\N' if v is None else str(v) for v in row) + '\n')
+    buf.seek(0)
+    cur.copy_expert(f"COPY {table} FROM STDIN", buf)
+
+
+def run_history_rows(runs, seasons, days):
+    """run_history rows for `seasons` copies of the season, each shifted back by `days`.
+
+    Copies keep the run id: both primary keys include the shifted date column.
+    """
+    for s in range(seasons):
+        shift = timedelta(days=days * s)
+        for r in runs:
+            end = datetime.strptime(r['end_time'], '%Y-%m-%d %H:%M:%S+00') - shift
+            run_date = datetime.strptime(r['run_date'], '%Y-%m-%d').date() - shift
+            stamp = end.strftime('%Y-%m-%d %H:%M:%S+00')
+            yield (r['id'], r['user_id'], run_date, stamp, r['distance_km'], r['duration_seconds'],
+                   r['flip_points'], r['team_at_run'], stamp)
+
+
+def snapshot_copy_rows(date, ids, parents, hexes, team, end):
+    for h, t, e in zip(hexes.tolist(), team.tolist(), end.tolist()):
+        stamp = datetime.fromtimestamp(e, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S+00')
+        yield (ids[h], TEAMS[t], date, stamp, parents[h])
+
+
+def load(cur, season, ids, parents, runs, days, seasons):
+    diffs = build_snapshot_diffs(season, len(ids))
+    snapshot_dates = []
+    for snap_day, team, end in iter_snapshots(diffs, len(ids)):
+        date = day_to_date(snap_day)
+        snapshot_dates.append(date)
+        rows = list(snapshot_copy_rows(date, ids, parents, *snapshot_rows(team, end)))
+        copy_into(cur, 'cur_hex_snapshot', rows)
+        copy_into(cur, 'part_hex_snapshot', rows)
+
+    history = list(run_history_rows(runs, seasons, days))
+    first = min(r[2] for r in history)
+    last = max(r[2] for r in history)
+    cur.execute("SELECT pg_temp.create_date_partitions('cur_run_history', %s, %s, 'month')",
+                (first - timedelta(days=1), last + timedelta(days=1)))
+    cur.execute("SELECT pg_temp.create_date_partitions('part_run_history', %s, %s, 'month')", (first, last))
+    copy_into(cur, 'cur_run_history', history)
+    copy_into(cur, 'part_run_history', history)
+
+    # hex_snapshot: create the daily partitions afterwards so rows move out of DEFAULT
+    t0 = time.perf_counter()
+    cur.execute("SELECT pg_temp.create_date_partitions('part_hex_snapshot', %s, %s, 'day')",
+                (snapshot_dates[0], snapshot_dates[-1] + timedelta(days=7)))
+    move_s = time.perf_counter() - t0
+    cur.execute("ANALYZE cur_hex_snapshot; ANALYZE part_hex_snapshot; "
+                "ANALYZE cur_run_history; ANALYZE part_run_history")
+    return snapshot_dates, len(history), move_s
+
+
+# ==================== Measure ====================
+
+def scanned_relations(plan):
+    """Relation names scanned anywhere in an EXPLAIN (FORMAT JSON) plan."""
+    found = set()
+    stack = [plan]
+    while stack:
+        node = stack.pop()
+        if 'Relation Name' in node:
+            found.add(node['Relation Name'])
+        stack.extend(node.get('Plans', []))
+    return found
+
+
+def partition_count(cur, table):
+    cur.execute("SELECT count(*) FROM pg_inherits WHERE inhparent = %s::regclass", (table,))
+    return cur.fetchone()[0] or 1
+
+
+def measure(cur, params_list, repeat):
+    out = {}
+    for query, template in QUERIES.items():
+        out[query] = {}
+        for layout, tables in LAYOUTS.items():
+            sql = template.format(**tables)
+            cur.execute("EXPLAIN (FORMAT JSON) " + sql, params_list[query][0])
+            scanned = scanned_relations(cur.fetchone()[0][0]['Plan'])
+            table = tables['hex_snapshot' if 'hex_snapshot' in template else 'run_history']
+            latency = []
+            for params in params_list[query][:repeat]:
+                t0 = time.perf_counter()
+                cur.execute(sql, params)
+                cur.fetchall()
+                latency.append(time.perf_counter() - t0)
+            out[query][layout] = {
+                'scanned': len(scanned),
+                'partitions': partition_count(cur, table),
+                'p50': float(np.percentile(latency, 50)) * 1000,
+                'p95': float(np.percentile(latency, 95)) * 1000,
+            }
+    return out
+
+
+def time_reset(cur, last_date):
+    """hex_snapshot part of reset_season(): DELETE vs drop partitions (each rolled back)."""
+    out = {}
+    for layout, sql in (
+        ('current', "DELETE FROM cur_hex_snapshot"),
+        ('partitioned', "SELECT pg_temp.drop_date_partitions('part_hex_snapshot', %(before)s); "
+                        "DELETE FROM part_hex_snapshot"),
+    ):
+        cur.execute("SAVEPOINT bench_reset")
+        t0 = time.perf_counter()
+        cur.execute(sql, {'before': last_date + timedelta(days=1)})
+        out[layout] = time.perf_counter() - t0
+        cur.execute("ROLLBACK TO SAVEPOINT bench_reset")
+    return out
+
+
+def sample_params(rng, runs, parents, snapshot_dates, days, seasons, samples):
+    provinces = sorted(set(parents.tolist()))
+    run_pairs = [(r['user_id'], r['run_date']) for r in runs]
+    first_run_date = min(datetime.strptime(r['run_date'], '%Y-%m-%d').date() for r in runs)
+    season_starts = [first_run_date - timedelta(days=days * s) for s in range(seasons)]
+    out = {'get_hex_snapshot': [], 'get_user_yesterday_stats': [], 'season_leaderboard': []}
+    for _ in range(samples):
+        out['get_hex_snapshot'].append({'parent': rng.choice(provinces), 'date': rng.choice(snapshot_dates)})
+        user_id, run_date = rng.choice(run_pairs)
+        out['get_user_yesterday_stats'].append({'user_id': user_id, 'date': run_date})
+        start = rng.choice(season_starts)
+        out['season_leaderboard'].append({'season_start': start, 'season_end': start + timedelta(days=days)})
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare current vs date-partitioned hex_snapshot / run_history')
+    parser.add_argument('--dsn', default=sim.LOCAL_DB_DSN, help='Postgres DSN (default: local supabase / $SIM_DB_DSN)')
+    parser.add_argument('--days', type=int, default=40, help='Season length in days (default: 40)')
+    parser.add_argument('--users', type=int, default=2000, help='Simulator users (default: 2000)')
+    parser.add_argument('--workload', choices=['uniform', 'zipf'], default='zipf', help='simulate_day workload')
+    parser.add_argument('--seasons', type=int, default=3, help='Seasons of run_history (default: 3)')
+    parser.add_argument('--samples', type=int, default=200, help='Timed calls per query and layout (default: 200)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    args = parser.parse_args()
+
+    if sim.psycopg2 is None:
+        print("ERROR: psycopg2 required. Install with: pip install psycopg2-binary", file=sys.stderr)
+        sys.exit(1)
+
+    t0 = time.perf_counter()
+    sim_season = simulate_season(args.days, args.users, args.seed, args.workload)
+    season, ids, parents, runs = (sim_season[k] for k in ('season', 'ids', 'parents', 'runs'))
+    print(f"Simulated {args.days} days, {args.users:,} users: {len(runs):,} runs over {len(ids):,} hexes "
+          f"({time.perf_counter() - t0:.1f}s)", file=sys.stderr)
+
+    conn = sim.get_db_connection(args.dsn)
+    cur = conn.cursor()
+    try:
+        for name in HELPERS:
+            cur.execute(helper_sql(name))
+        cur.execute(SCHEMA_SQL)
+        t0 = time.perf_counter()
+        snapshot_dates, n_history, move_s = load(cur, season, ids, parents, runs, args.days, args.seasons)
+        cur.execute("SELECT count(*) FROM cur_hex_snapshot")
+        n_snapshot = cur.fetchone()[0]
+        print(f"Loaded {n_snapshot:,} hex_snapshot rows ({len(snapshot_dates)} days) and {n_history:,} "
+              f"run_history rows ({args.seasons} seasons) in {time.perf_counter() - t0:.1f}s; "
+              f"moving snapshots out of DEFAULT took {move_s:.1f}s", file=sys.stderr)
+
+        params = sample_params(random.Random(args.seed), runs, parents, snapshot_dates,
+                               args.days, args.seasons, args.samples)
+        results = measure(cur, params, args.samples)
+        print(f"\n{'query':<26} {'layout':<12} {'partitions':>10} {'p50':>9} {'p95':>9}")
+        for query, layouts in results.items():
+            for layout, r in layouts.items():
+                print(f"{query:<26} {layout:<12} {r['scanned']:>4} / {r['partitions']:<3} "
+                      f"{r['p50']:>7.2f}ms {r['p95']:>7.2f}ms")
+
+        reset = time_reset(cur, snapshot_dates[-1])
+        print(f"\nreset_season hex_snapshot wipe: DELETE {reset['current'] * 1000:,.0f} ms, "
+              f"drop partitions {reset['partitioned'] * 1000:,.0f} ms")
+    finally:
+        conn.rollback()
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
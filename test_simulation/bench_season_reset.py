@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+RunStrict Season Reset ("The Void") Scale Test
+
+Fills a local Postgres with a simulated 40-day season and times the D-0
+transition end to end:
+
+  snapshot     snapshot_season_leaderboard(n) on its own (rolled back)
+  single       reset_season(n): one transaction, as handle_season_transition runs it
+               (rolled back, so the batched path sees the same data)
+  batched      CALL reset_season_batched(n, batch, pause)
+               (20260308000004_batched_season_reset.sql, commits per batch)
+
+While each reset runs, two side connections watch it:
+  - a lock monitor polls pg_stat_activity / pg_locks for the reset backend.
+    It records how long each of its transactions held write locks on users / hexes.
+  - an app probe loops finalize_run-shaped writes: a no-op UPDATE of a random
+    user row and of a random hex row, plus a plain read. It records their
+    latency, which is what a client syncing a run would see.
+
+The season comes from simulate_day (zipf workload). --replicas copies it
+under new user ids and hex ids to reach scale: 2000 users x 25 replicas is
+50k users, ~400k hexes and ~1.2M run_history rows. The data is COPYed into
+the real public tables, so point this at a disposable local database. The
+batched reset commits. At the end the simulation users and their run_history
+are deleted and hexes / hex_snapshot are emptied, like simulate_day.py --reset.
+
+Usage:
+    python3 bench_season_reset.py                                  # 2000 users x 25 replicas
+    python3 bench_season_reset.py --replicas 100 --batch-size 10000
+    python3 bench_season_reset.py --mode single --snapshot-days 14
+    python3 bench_season_reset.py --dsn postgresql://...
+
+Requires: pip install h3 numpy psycopg2-binary
+"""
+
+import argparse
+import io
+import random
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+
+import numpy as np
+
+from bench_snapshot_storage import simulate_season
+from hex_snapshot_oracle import TEAMS, build_snapshot_diffs, day_to_date, iter_snapshots, snapshot_rows
+import simulate_day as sim
+
+SEASON_CFG_SQL = "SELECT config_data->'season' FROM public.app_config LIMIT 1"
+
+LOCK_MONITOR_SQL = """
+SELECT a.xact_start, clock_timestamp() - a.xact_start,
+       ARRAY(SELECT DISTINCT c.relname FROM pg_locks l JOIN pg_class c ON c.oid = l.relation
+             WHERE l.pid = a.pid AND l.granted AND l.mode <> 'AccessShareLock'
+               AND c.relname IN ('users', 'hexes'))
+FROM pg_stat_activity a WHERE a.pid = %s AND a.xact_start IS NOT NULL
+"""
+
+PROBES = {
+    'user write': "UPDATE public.users SET season_points = season_points WHERE id = %s",
+    'hex write': "UPDATE public.hexes SET last_runner_team = last_runner_team WHERE id = %s",
+    'user read': "SELECT season_points, team FROM public.users WHERE id = %s",
+}
+
+CLEANUP_SQL = """
+DELETE FROM public.run_history WHERE user_id::text LIKE 'aaaaaaaa-%';
+DELETE FROM public.season_leaderboard_snapshot WHERE user_id::text LIKE 'aaaaaaaa-%';
+DELETE FROM public.users WHERE id::text LIKE 'aaaaaaaa-%';
+DELETE FROM public.hexes;
+DELETE FROM public.hex_snapshot;
+"""
+
+
+# ==================== Fill ====================
+
+def copy_into(cur, table, columns, rows):
+    buf = io.StringIO()
+    for row in rows:
+        buf.write('\t'.join('\\N' if v is None else str(v) for v in row) + '\n')
+    buf.seek(0)
+    cur.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buf)
+
+
+def replica_hex(hid, k):
+    return hid if k == 0 else f"{hid}_r{k}"
+
+
+def fill(conn, sim_season, replicas, snapshot_days):
+    """COPY users, run_history, hexes and the last `snapshot_days` of hex_snapshot."""
+    state = sim_season['state']
+    users = state['users']
+    n_users = len(users)
+    index = {u['id']: i for i, u in enumerate(users)}
+    ids, parents = sim_season['ids'], sim_season['parents']
+    districts = [sim.h3.cell_to_parent(h, sim.CITY_RESOLUTION) for h in ids]
+
+    cur = conn.cursor()
+    cur.execute("SET session_replication_role = replica")  # synthetic users have no auth.users rows
+    counts = {}
+
+    def uid(user_id, k):
+        return sim.sim_user_id(index[user_id] + k * n_users)
+
+    copy_into(cur, 'public.users',
+              ('id', 'auth_id', 'name', 'team', 'season_points', 'home_hex', 'season_home_hex',
+               'district_hex', 'total_distance_km', 'total_runs', 'nationality'),
+              ((uid(u['id'], k), uid(u['id'], k), u['name'], u['team'], state['user_points'].get(u['id'], 0),
+                u['home_hex'], u['home_hex'], sim.h3.cell_to_parent(u['home_hex'], sim.CITY_RESOLUTION),
+                state['user_stats'].get(u['id'], {}).get('total_distance_km', 0),
+                state['user_stats'].get(u['id'], {}).get('total_runs', 0), u.get('nationality'))
+               for k in range(replicas) for u in users))
+    counts['users'] = n_users * replicas
+
+    run_cols = ('id', 'user_id', 'run_date', 'start_time', 'end_time', 'distance_km', 'duration_seconds',
+                'avg_pace_min_per_km', 'flip_count', 'flip_points', 'team_at_run', 'cv', 'created_at')
+    copy_into(cur, 'public.run_history', run_cols,
+              ((r['id'] if k == 0 else uuid.uuid4(), uid(r['user_id'], k), r['run_date'], r['start_time'],
+                r['end_time'], r['distance_km'], r['duration_seconds'], r['avg_pace_min_per_km'],
+                r['flip_count'], r['flip_points'], r['team_at_run'], r['cv'], r['end_time'])
+               for k in range(replicas) for r in sim_season['runs']))
+    counts['run_history'] = len(sim_season['runs']) * replicas
+
+    diffs = build_snapshot_diffs(sim_season['season'], len(ids))
+    snapshots = [(day_to_date(d), team.copy(), end.copy()) for d, team, end in iter_snapshots(diffs, len(ids))]
+    last_date, team, end = snapshots[-1]
+    hexes, h_team, h_end = snapshot_rows(team, end)
+
+    def stamp(e):
+        return datetime.fromtimestamp(e, tz=timezone.utc).strftime('%Y-%m-%d %H:%M:%S+00')
+
+    copy_into(cur, 'public.hexes', ('id', 'last_runner_team', 'last_flipped_at', 'parent_hex', 'district_hex'),
+              ((replica_hex(ids[h], k), TEAMS[t], stamp(e), parents[h], districts[h])
+               for k in range(replicas) for h, t, e in zip(hexes.tolist(), h_team.tolist(), h_end.tolist())))
+    counts['hexes'] = len(hexes) * replicas
+
+    counts['hex_snapshot'] = 0
+    for date, team, end in snapshots[-snapshot_days:]:
+        hexes, h_team, h_end = snapshot_rows(team, end)
+        copy_into(cur, 'public.hex_snapshot',
+                  ('hex_id', 'last_runner_team', 'snapshot_date', 'last_run_end_time', 'parent_hex'),
+                  ((replica_hex(ids[h], k), TEAMS[t], date, stamp(e), parents[h])
+                   for k in range(replicas) for h, t, e in zip(hexes.tolist(), h_team.tolist(), h_end.tolist())))
+        counts['hex_snapshot'] += len(hexes) * replicas
+
+    cur.execute("SET session_replication_role = DEFAULT")
+    conn.commit()
+    for table in ('users', 'run_history', 'hexes', 'hex_snapshot'):
+        cur.execute(f"ANALYZE public.{table}")
+    conn.commit()
+    return counts
+
+
+def season_for(conn, run_dates):
+    """Season number whose [start, end) window holds the simulated season's last run date."""
+    cur = conn.cursor()
+    cur.execute(SEASON_CFG_SQL)
+    row = cur.fetchone()
+    cfg = (row[0] if row else None) or {}
+    duration = int(cfg.get('durationDays', 40))
+    base = int(cfg.get('seasonNumber', 2))
+    start = datetime.strptime(cfg.get('startDate', '2026-02-11'), '%Y-%m-%d').date()
+    last = max(datetime.strptime(d, '%Y-%m-%d').date() for d in run_dates)
+    return base + (last - start).days // duration
+
+
+# ==================== Watchers ====================
+
+class LockMonitor(threading.Thread):
+    """Polls the reset backend: per transaction, its age and the user/hex write locks it holds."""
+
+    def __init__(self, dsn, pid, interval=0.01):
+        super().__init__(daemon=True)
+        self.conn = sim.get_db_connection(dsn)
+        self.conn.autocommit = True
+        self.pid = pid
+        self.interval = interval
+        self.stop = threading.Event()
+        self.xacts = {}   # xact_start -> {'age': seconds, 'relations': set}
+
+    def run(self):
+        cur = self.conn.cursor()
+        while not self.stop.is_set():
+            cur.execute(LOCK_MONITOR_SQL, (self.pid,))
+            row = cur.fetchone()
+            if row is not None:
+                xact_start, age, relations = row
+                x = self.xacts.setdefault(xact_start, {'age': 0.0, 'relations': set()})
+                x['age'] = max(x['age'], age.total_seconds())
+                x['relations'].update(relations or ())
+            time.sleep(self.interval)
+        self.conn.close()
+
+    def summary(self):
+        out = {}
+        for rel in ('users', 'hexes'):
+            ages = [x['age'] for x in self.xacts.values() if rel in x['relations']]
+            out[rel] = {'transactions': len(ages), 'longest': max(ages, default=0.0), 'total': sum(ages)}
+        return out
+
+
+class AppProbe(threading.Thread):
+    """finalize_run-shaped writes and a read against random rows, timed."""
+
+    def __init__(self, dsn, user_ids, hex_ids, seed):
+        super().__init__(daemon=True)
+        self.conn = sim.get_db_connection(dsn)
+        self.conn.autocommit = True
+        self.user_ids = user_ids
+        self.hex_ids = hex_ids
+        self.rng = random.Random(seed)
+        self.stop = threading.Event()
+        self.recording = threading.Event()
+        self.latency = {k: [] for k in PROBES}
+
+    def run(self):
+        cur = self.conn.cursor()
+        while not self.stop.is_set():
+            for kind, sql in PROBES.items():
+                target = self.rng.choice(self.hex_ids if kind == 'hex write' else self.user_ids)
+                t0 = time.perf_counter()
+                cur.execute(sql, (target,))
+                if cur.description:
+                    cur.fetchall()
+                if self.recording.is_set():
+                    self.latency[kind].append(time.perf_counter() - t0)
+        self.conn.close()
+
+    def summary(self):
+        return {k: {'n': len(v),
+                    'p50': float(np.percentile(v, 50)) * 1000 if v else 0.0,
+                    'p99': float(np.percentile(v, 99)) * 1000 if v else 0.0,
+                    'max': max(v, default=0.0) * 1000}
+                for k, v in self.latency.items()}
+
+
+def watched(dsn, conn, sql, params, probe_targets, seed, rollback=False):
+    """Run sql on conn with the lock monitor and app probe attached; returns (seconds, monitor, probe).
+
+    With rollback=True the statement's transaction is rolled back as soon as it returns.
+    """
+    cur = conn.cursor()
+    cur.execute("SELECT pg_backend_pid()")
+    pid = cur.fetchone()[0]
+    if not conn.autocommit:
+        conn.rollback()
+    monitor = LockMonitor(dsn, pid)
+    probe = AppProbe(dsn, *probe_targets, seed)
+    monitor.start()
+    probe.start()
+    time.sleep(0.2)  # let both side connections settle before the reset starts
+    probe.recording.set()
+    t0 = time.perf_counter()
+    cur.execute(sql, params)
+    if rollback:
+        conn.rollback()
+    elapsed = time.perf_counter() - t0
+    probe.recording.clear()
+    probe.stop.set()
+    monitor.stop.set()
+    probe.join()
+    monitor.join()
+    return elapsed, monitor, probe
+
+
+def report(label, elapsed, monitor, probe):
+    print(f"\n{label}: {elapsed:,.2f}s")
+    for rel, s in monitor.summary().items():
+        print(f"  locks on {rel:<6} {s['transactions']:>4} transaction(s), longest {s['longest']:,.2f}s, "
+              f"total {s['total']:,.2f}s")
+    for kind, s in probe.summary().items():
+        print(f"  probe {kind:<11} n={s['n']:<6} p50 {s['p50']:>8.2f}ms  p99 {s['p99']:>9.2f}ms  "
+              f"max {s['max']:>9.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time snapshot_season_leaderboard + reset_season at scale')
+    parser.add_argument('--dsn', default=sim.LOCAL_DB_DSN, help='Postgres DSN (default: local supabase / $SIM_DB_DSN)')
+    parser.add_argument('--days', type=int, default=40, help='Season length in days (default: 40)')
+    parser.add_argument('--users', type=int, default=2000, help='Simulator users per replica (default: 2000)')
+    parser.add_argument('--replicas', type=int, default=25, help='Copies of the simulated season (default: 25)')
+    parser.add_argument('--workload', choices=['uniform', 'zipf'], default='zipf', help='simulate_day workload')
+    parser.add_argument('--snapshot-days', type=int, default=7, help='hex_snapshot days to load (default: 7)')
+    parser.add_argument('--mode', choices=['single', 'batched', 'both'], default='both',
+                        help='Reset path(s) to time (default: both)')
+    parser.add_argument('--batch-size', type=int, default=5000, help='reset_season_batched batch size (default: 5000)')
+    parser.add_argument('--pause-ms', type=int, default=0, help='reset_season_batched pause between batches')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    args = parser.parse_args()
+
+    if sim.psycopg2 is None:
+        print("ERROR: psycopg2 required. Install with: pip install psycopg2-binary", file=sys.stderr)
+        sys.exit(1)
+
+    t0 = time.perf_counter()
+    sim_season = simulate_season(args.days, args.users, args.seed, args.workload)
+    print(f"Simulated {args.days} days, {args.users:,} users: {len(sim_season['runs']):,} runs "
+          f"({time.perf_counter() - t0:.1f}s)", file=sys.stderr)
+
+    conn = sim.get_db_connection(args.dsn)
+    try:
+        t0 = time.perf_counter()
+        counts = fill(conn, sim_season, args.replicas, args.snapshot_days)
+        print(f"Loaded {', '.join(f'{v:,} {k}' for k, v in counts.items())} "
+              f"({time.perf_counter() - t0:.1f}s)", file=sys.stderr)
+        season = season_for(conn, [r['run_date'] for r in sim_season['runs']])
+        rng = random.Random(args.seed)
+        n_total = len(sim_season['state']['users']) * args.replicas
+        probe_targets = ([sim.sim_user_id(rng.randrange(n_total)) for _ in range(1000)],
+                         [replica_hex(rng.choice(sim_season['ids']), rng.randrange(args.replicas))
+                          for _ in range(1000)])
+
+        cur = conn.cursor()
+        t0 = time.perf_counter()
+        cur.execute("SELECT public.snapshot_season_leaderboard(%s)", (season,))
+        ranked = cur.fetchone()[0]
+        snapshot_s = time.perf_counter() - t0
+        conn.rollback()
+        print(f"\nsnapshot_season_leaderboard({season}): {snapshot_s:,.2f}s, {ranked:,} ranked users")
+
+        if args.mode in ('single', 'both'):
+            elapsed, monitor, probe = watched(args.dsn, conn, "SELECT public.reset_season(%s)", (season,),
+                                              probe_targets, args.seed, rollback=True)
+            report(f"reset_season({season}) single transaction (rolled back)", elapsed, monitor, probe)
+
+        if args.mode in ('batched', 'both'):
+            conn.autocommit = True
+            elapsed, monitor, probe = watched(args.dsn, conn, "CALL public.reset_season_batched(%s, %s, %s)",
+                                              (season, args.batch_size, args.pause_ms), probe_targets, args.seed)
+            report(f"reset_season_batched({season}, {args.batch_size}, {args.pause_ms})", elapsed, monitor, probe)
+            conn.autocommit = False
+    finally:
+        conn.rollback()
+        cur = conn.cursor()
+        cur.execute(CLEANUP_SQL)
+        conn.commit()
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+RunStrict hex_snapshot Storage Benchmark: Full Copy vs Keyframe + Delta
+
+Runs simulate_day for a season (default 40 days) in memory and builds the
+daily snapshots with hex_snapshot_oracle.py (latest end_time wins, docs §5.3).
+It then compares two layouts:
+
+  full      hex_snapshot today: every owned hex rewritten for every snapshot_date
+  keyframe  20260308000002_hex_snapshot_keyframe_delta.sql: a full keyframe every
+            K days, otherwise only the hexes touched that night (team or
+            last_run_end_time changed)
+
+The offline report covers rows stored and rows written per night for
+several K. With a database (unless --offline), the migration is applied
+inside one transaction. Both layouts are then loaded night by night,
+timing each night's writes, and the report gives:
+  - table + index size (pg_total_relation_size)
+  - read latency of get_hex_snapshot_cow() against the equivalent
+    hex_snapshot query, for sampled (province, date) pairs
+  - a row-for-row check that every sampled reconstruction equals the full copy
+The simulated users, runs and hexes are then written to public.users,
+public.runs and public.hexes, and build_hex_snapshot_cow() builds the
+keyframe / delta tables night by night from those runs. Every (province,
+date) read of get_hex_snapshot_cow() is diffed against the oracle snapshot.
+The transaction is rolled back at the end, so the local DB is left untouched.
+
+Usage:
+    python3 bench_snapshot_storage.py                               # 40 days, 1000 users, zipf, K=7
+    python3 bench_snapshot_storage.py --users 5000 --keyframe-every 14
+    python3 bench_snapshot_storage.py --offline --k-values 1,3,7,14,40
+    python3 bench_snapshot_storage.py --dsn postgresql://...
+
+Requires: pip install h3 numpy psycopg2-binary
+"""
+
+import argparse
+import io
+import json
+import random
+import sys
+import time
+
+import numpy as np
+
+from hex_snapshot_oracle import (
+    NEUTRAL, TEAMS, build_snapshot_diffs, concat_arrays, day_diff, day_to_date,
+    iter_snapshots, runs_to_arrays, snapshot_rows,
+)
+import simulate_day as sim
+
+MIGRATION = sim.SCRIPT_DIR.parent / 'supabase' / 'migrations' / '20260308000002_hex_snapshot_keyframe_delta.sql'
+
+SCHEMA_SQL = """
+CREATE TEMP TABLE _bench_full (
+  hex_id            TEXT        NOT NULL,
+  last_runner_team  TEXT        NOT NULL,
+  snapshot_date     DATE        NOT NULL,
+  last_run_end_time TIMESTAMPTZ,
+  parent_hex        TEXT,
+  PRIMARY KEY (hex_id, snapshot_date)
+);
+CREATE INDEX ON _bench_full (snapshot_date, parent_hex);
+CREATE TEMP TABLE _bench_rows_in (hex_id TEXT, team TEXT, end_epoch BIGINT, parent_hex TEXT);
+TRUNCATE public.hex_snapshot_keyframe, public.hex_snapshot_delta;
+"""
+
+LOAD_SQL = {
+    'full': """INSERT INTO _bench_full (snapshot_date, hex_id, last_runner_team, last_run_end_time, parent_hex)
+               SELECT %s, hex_id, team, to_timestamp(end_epoch), parent_hex FROM _bench_rows_in""",
+    'keyframe': """INSERT INTO public.hex_snapshot_keyframe (keyframe_date, hex_id, last_runner_team,
+                                                             last_run_end_time, parent_hex)
+                   SELECT %s, hex_id, team, to_timestamp(end_epoch), parent_hex FROM _bench_rows_in""",
+    'delta': """INSERT INTO public.hex_snapshot_delta (snapshot_date, hex_id, last_runner_team,
+                                                       last_run_end_time, parent_hex)
+                SELECT %s, hex_id, team, to_timestamp(end_epoch), parent_hex FROM _bench_rows_in""",
+}
+
+# Same rows/shape as get_hex_snapshot() over the full copy
+READ_FULL_SQL = """
+SELECT to_jsonb(sub) FROM (
+  SELECT hex_id, last_runner_team, last_run_end_time
+  FROM _bench_full WHERE parent_hex = %s AND snapshot_date = %s
+) sub
+"""
+READ_COW_SQL = "SELECT public.get_hex_snapshot_cow(%s, %s)"
+
+# build_hex_snapshot_cow() reads public.runs; start from the simulated season only
+BUILD_SCHEMA_SQL = """
+TRUNCATE public.hex_snapshot_keyframe, public.hex_snapshot_delta, public.runs;
+CREATE TEMP TABLE _bench_hexes_in (id TEXT, parent_hex TEXT);
+"""
+HEXES_SQL = """
+INSERT INTO public.hexes (id, parent_hex) SELECT id, parent_hex FROM _bench_hexes_in
+ON CONFLICT (id) DO UPDATE SET parent_hex = EXCLUDED.parent_hex
+"""
+BUILD_SQL = "SELECT public.build_hex_snapshot_cow(%s, %s)"
+
+SIZE_SQL = "SELECT pg_total_relation_size(%s::regclass)"
+
+
+# ==================== Season ====================
+
+def simulate_season(days, users, seed, workload_name):
+    """Run simulate_day in memory.
+
+    Returns {'season': oracle arrays, 'ids': hex ids, 'parents': Res-5 parent per hex,
+    'runs': every run dict, 'state': final simulator state}.
+    """
+    home_hex = sim.DEFAULT_HOME_HEX
+    same_hexes, other_hexes = sim.generate_hexes_from_home(home_hex)
+    state = sim.default_state()
+    state.update(seed=seed, home_hex=home_hex, same_hexes=same_hexes, other_hexes=other_hexes, total_days=days)
+    workload = None
+    if workload_name == 'zipf':
+        from workload import get_workload
+        state['workload'] = {}
+        workload = get_workload(state)
+    state['users'] = sim.generate_users(seed, same_hexes, other_hexes, users, workload)
+
+    vocab = {}
+    parts = []
+    all_runs = []
+    for day in range(1, days + 1):
+        _, runs, _, _, _ = sim.simulate_day_step(state, day, days)
+        arrays, vocab = runs_to_arrays(runs, vocab)
+        parts.append(arrays)
+        all_runs.extend(runs)
+    ids = list(vocab)
+    parents = np.array([sim.h3.cell_to_parent(h, sim.ALL_RESOLUTION) for h in ids], dtype=object)
+    return {'season': concat_arrays(parts), 'ids': ids, 'parents': parents, 'runs': all_runs, 'state': state}
+
+
+def is_keyframe(snap_day, last_keyframe, keyframe_every):
+    return last_keyframe is None or snap_day - last_keyframe >= keyframe_every
+
+
+def nightly_rows(diffs, n_hexes, keyframe_every):
+    """(snapshot_day, full rows, keyframe-layout rows, is_keyframe) per night."""
+    pos = {int(d): i for i, d in enumerate(diffs['days'])}
+    out = []
+    last_keyframe = None
+    for snap_day, team, _ in iter_snapshots(diffs, n_hexes):
+        owned = int((team != NEUTRAL).sum())
+        if is_keyframe(snap_day, last_keyframe, keyframe_every):
+            last_keyframe = snap_day
+            out.append((snap_day, owned, owned, True))
+        else:
+            i = pos.get(snap_day - 1)
+            touched = len(day_diff(diffs, i)['hex']) if i is not None else 0
+            out.append((snap_day, owned, touched, False))
+    return out
+
+
+def offline_report(diffs, n_hexes, k_values):
+    print(f"{'K':>4} {'full rows':>12} {'kf+delta rows':>14} {'ratio':>6} "
+          f"{'write/night avg':>16} {'max':>8} {'worst read rows':>16}")
+    for k in k_values:
+        nights = nightly_rows(diffs, n_hexes, k)
+        full = sum(n[1] for n in nights)
+        stored = sum(n[2] for n in nights)
+        writes = [n[2] for n in nights]
+        # Worst-case reconstruction reads a keyframe plus every delta since it
+        worst, run = 0, 0
+        for _, _, rows, kf in nights:
+            run = rows if kf else run + rows
+            worst = max(worst, run)
+        print(f"{k:>4} {full:>12,} {stored:>14,} {stored / max(full, 1):>6.2f} "
+              f"{sum(writes) / len(writes):>16,.0f} {max(writes):>8,} {worst:>16,}")
+
+
+# ==================== Database ====================
+
+def copy_rows(cur, ids, parents, hexes, team, end):
+    buf = io.StringIO()
+    for h, t, e in zip(hexes.tolist(), team.tolist(), end.tolist()):
+        buf.write(f"{ids[h]}\t{TEAMS[t]}\t{e}\t{parents[h]}\n")
+    buf.seek(0)
+    cur.execute("TRUNCATE _bench_rows_in")
+    cur.copy_expert("COPY _bench_rows_in FROM STDIN", buf)
+
+
+def load_night(cur, kind, snapshot_date, ids, parents, hexes, team, end):
+    t0 = time.perf_counter()
+    copy_rows(cur, ids, parents, hexes, team, end)
+    cur.execute(LOAD_SQL[kind], (snapshot_date,))
+    return time.perf_counter() - t0
+
+
+def percentile(values, q):
+    return float(np.percentile(values, q)) * 1000 if values else 0.0
+
+
+def read_rows(cur, sql, parent, date):
+    cur.execute(sql, (parent, date))
+    return sorted(json.dumps(r[0], sort_keys=True) for r in cur.fetchall())
+
+
+def db_report(conn, diffs, ids, parents, keyframe_every, samples, seed):
+    cur = conn.cursor()
+    cur.execute(MIGRATION.read_text())
+    cur.execute(SCHEMA_SQL)
+
+    pos = {int(d): i for i, d in enumerate(diffs['days'])}
+    n_hexes = len(ids)
+    write_s = {'full': 0.0, 'keyframe': 0.0}
+    rows = {'full': 0, 'keyframe': 0}
+    dates = []
+    last_keyframe = None
+    for snap_day, team, end in iter_snapshots(diffs, n_hexes):
+        date = day_to_date(snap_day)
+        dates.append(date)
+        h, t, e = snapshot_rows(team, end)
+        write_s['full'] += load_night(cur, 'full', date, ids, parents, h, t, e)
+        rows['full'] += len(h)
+        if is_keyframe(snap_day, last_keyframe, keyframe_every):
+            last_keyframe = snap_day
+            write_s['keyframe'] += load_night(cur, 'keyframe', date, ids, parents, h, t, e)
+            rows['keyframe'] += len(h)
+        elif snap_day - 1 in pos:
+            dd = day_diff(diffs, pos[snap_day - 1])
+            write_s['keyframe'] += load_night(cur, 'delta', date, ids, parents,
+                                              dd['hex'], dd['team'], dd['end_time'])
+            rows['keyframe'] += len(dd['hex'])
+    cur.execute("ANALYZE _bench_full; ANALYZE public.hex_snapshot_keyframe; ANALYZE public.hex_snapshot_delta")
+
+    sizes = {}
+    cur.execute(SIZE_SQL, ('_bench_full',))
+    sizes['full'] = cur.fetchone()[0]
+    sizes['keyframe'] = 0
+    for table in ('public.hex_snapshot_keyframe', 'public.hex_snapshot_delta'):
+        cur.execute(SIZE_SQL, (table,))
+        sizes['keyframe'] += cur.fetchone()[0]
+
+    rng = random.Random(seed)
+    provinces = sorted(set(parents.tolist()))
+    pairs = [(rng.choice(provinces), rng.choice(dates)) for _ in range(samples)]
+    latency = {'full': [], 'keyframe': []}
+    mismatched = 0
+    for parent, date in pairs:
+        t0 = time.perf_counter()
+        full = read_rows(cur, READ_FULL_SQL, parent, date)
+        latency['full'].append(time.perf_counter() - t0)
+        t0 = time.perf_counter()
+        cow = read_rows(cur, READ_COW_SQL, parent, date)
+        latency['keyframe'].append(time.perf_counter() - t0)
+        if full != cow:
+            mismatched += 1
+
+    nights = len(dates)
+    print(f"\nDatabase ({nights} nights, K={keyframe_every}, {len(provinces)} provinces):")
+    print(f"{'layout':<10} {'rows':>10} {'size':>10} {'write/night':>12} {'read p50':>9} {'read p95':>9}")
+    for kind in ('full', 'keyframe'):
+        print(f"{kind:<10} {rows[kind]:>10,} {sizes[kind] / 1024 / 1024:>8.1f}MB "
+              f"{write_s[kind] / nights * 1000:>10.1f}ms "
+              f"{percentile(latency[kind], 50):>7.2f}ms {percentile(latency[kind], 95):>7.2f}ms")
+    print(f"Reconstruction: {'IDENTICAL' if not mismatched else f'{mismatched} MISMATCHED'} "
+          f"over {samples} (province, date) samples")
+    return mismatched, dates, provinces
+
+
+def run_id(seq):
+    """UUID that sorts like the run's position in the season, the oracle's tie-break for equal end_time."""
+    return f"00000000-0000-0000-0000-{seq:012x}"
+
+
+def ensure_runs_partition(cur):
+    """runs is range-partitioned on created_at with no partitions by migration; add a DEFAULT (rolled back)."""
+    cur.execute("""
+        SELECT p.partdefid <> 0 FROM pg_partitioned_table p
+        WHERE p.partrelid = 'public.runs'::regclass
+    """)
+    row = cur.fetchone()
+    if row is not None and not row[0]:
+        cur.execute("CREATE TABLE public.runs_bench_default PARTITION OF public.runs DEFAULT")
+
+
+def load_season(cur, users, runs, ids, parents):
+    """Write the simulated users, runs and hexes where build_hex_snapshot_cow() reads them."""
+    ensure_runs_partition(cur)
+    cur.execute(sim.sql_auth_users_insert(users))
+    cur.execute(sim.sql_users_insert(users))
+
+    buf = io.StringIO()
+    for seq, r in enumerate(runs):
+        buf.write(f"{run_id(seq)}\t{r['user_id']}\t{r['team_at_run']}\t{r['start_time']}\t"
+                  f"{r['end_time']}\t{{{','.join(r['hex_path'])}}}\n")
+    buf.seek(0)
+    cur.copy_expert("COPY public.runs (id, user_id, team_at_run, start_time, end_time, hex_path) FROM STDIN", buf)
+
+    buf = io.StringIO()
+    for h, parent in zip(ids, parents.tolist()):
+        buf.write(f"{h}\t{parent}\n")
+    buf.seek(0)
+    cur.copy_expert("COPY _bench_hexes_in FROM STDIN", buf)
+    cur.execute(HEXES_SQL)
+
+
+def build_report(conn, sim_season, ids, parents, dates, provinces, keyframe_every):
+    """Run build_hex_snapshot_cow() for every night and diff each (province, date) against the oracle.
+
+    The oracle snapshots are the _bench_full rows loaded by db_report().
+    """
+    cur = conn.cursor()
+    cur.execute(BUILD_SCHEMA_SQL)
+    load_season(cur, sim_season['state']['users'], sim_season['runs'], ids, parents)
+
+    build_s = 0.0
+    written = {'keyframe': 0, 'delta': 0}
+    for date in dates:
+        t0 = time.perf_counter()
+        cur.execute(BUILD_SQL, (date, keyframe_every))
+        result = cur.fetchone()[0]
+        build_s += time.perf_counter() - t0
+        written[result['mode']] += result['rows_written']
+    cur.execute("ANALYZE public.hex_snapshot_keyframe; ANALYZE public.hex_snapshot_delta")
+
+    mismatched = 0
+    for date in dates:
+        for parent in provinces:
+            if read_rows(cur, READ_FULL_SQL, parent, date) != read_rows(cur, READ_COW_SQL, parent, date):
+                mismatched += 1
+
+    pairs = len(dates) * len(provinces)
+    print(f"\nbuild_hex_snapshot_cow() from {len(sim_season['runs']):,} runs: "
+          f"{written['keyframe']:,} keyframe + {written['delta']:,} delta rows, "
+          f"{build_s / len(dates) * 1000:.1f}ms/night")
+    print(f"Nightly build: {'IDENTICAL' if not mismatched else f'{mismatched} MISMATCHED'} "
+          f"to the oracle over all {pairs} (province, date) pairs")
+    return mismatched
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare full-copy vs keyframe + delta hex_snapshot storage')
+    parser.add_argument('--dsn', default=sim.LOCAL_DB_DSN, help='Postgres DSN (default: local supabase / $SIM_DB_DSN)')
+    parser.add_argument('--days', type=int, default=40, help='Season length in days (default: 40)')
+    parser.add_argument('--users', type=int, default=1000, help='Simulator users (default: 1000)')
+    parser.add_argument('--workload', choices=['uniform', 'zipf'], default='zipf',
+                        help='simulate_day workload (default: zipf; uniform only covers 160 hexes)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    parser.add_argument('--keyframe-every', type=int, default=7, help='K for the database run (default: 7)')
+    parser.add_argument('--k-values', type=str, default='1,3,7,14,40', help='K values for the offline table')
+    parser.add_argument('--samples', type=int, default=200, help='(province, date) reads to time (default: 200)')
+    parser.add_argument('--offline', action='store_true', help='Skip the database, row counts only')
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    sim_season = simulate_season(args.days, args.users, args.seed, args.workload)
+    season, ids, parents = sim_season['season'], sim_season['ids'], sim_season['parents']
+    diffs = build_snapshot_diffs(season, len(ids))
+    print(f"Simulated {args.days} days, {args.users:,} users: {len(season['end_time']):,} runs over "
+          f"{len(ids):,} hexes ({time.perf_counter() - t0:.1f}s)", file=sys.stderr)
+
+    print("\nOffline (K=1 is the full copy):")
+    offline_report(diffs, len(ids), [int(k) for k in args.k_values.split(',')])
+    if args.offline:
+        return
+
+    if sim.psycopg2 is None:
+        print("ERROR: psycopg2 required. Install with: pip install psycopg2-binary", file=sys.stderr)
+        sys.exit(1)
+    conn = sim.get_db_connection(args.dsn)
+    try:
+        mismatched, dates, provinces = db_report(conn, diffs, ids, parents, args.keyframe_every,
+                                                 args.samples, args.seed)
+        mismatched += build_report(conn, sim_season, ids, parents, dates, provinces, args.keyframe_every)
+    finally:
+        conn.rollback()
+        conn.close()
+    if mismatched:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""
+Shared fixtures for the simulator benchmarks (pytest-benchmark).
+
+Every benchmark runs at each --scales user count. Worlds are seeded and built
+once per scale. The `bench` fixture times a function with
+benchmark.pedantic, giving each round fresh arguments from a setup factory
+that is not timed. It also measures the function's tracemalloc peak once.
+
+The peak is stored in the benchmark's extra_info and compared with
+memory_baseline.json. A peak more than --memory-tolerance above its baseline
+fails the test. Timing baselines are pytest-benchmark's own:
+--benchmark-save / --benchmark-compare-fail (see README).
+"""
+
+import copy
+import json
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+SIM_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SIM_DIR))
+
+import simulate_day as sim  # noqa: E402
+
+SEED = 42
+TOTAL_DAYS = 40
+SCALES = (100, 10_000, 100_000)
+ROUNDS = {100: 20, 10_000: 5}        # timed rounds per scale; larger scales get 3
+MEMORY_BASELINE = Path(__file__).with_name('memory_baseline.json')
+MEMORY_SLACK = 64 * 1024             # absolute allowance so tiny peaks do not flap
+
+_measured = {}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('simulator benchmarks')
+    group.addoption('--scales', default=','.join(map(str, SCALES)),
+                    help='User counts to benchmark (default: 100,10000,100000)')
+    group.addoption('--memory-save', action='store_true', help='Rewrite memory_baseline.json from this run')
+    group.addoption('--memory-tolerance', type=float, default=0.25,
+                    help='Allowed peak memory growth over memory_baseline.json (default: 0.25)')
+
+
+def pytest_generate_tests(metafunc):
+    if 'scale' in metafunc.fixturenames:
+        scales = [int(s) for s in metafunc.config.getoption('scales').split(',')]
+        metafunc.parametrize('scale', scales, ids=lambda n: f"{n}users", scope='session')
+
+
+def pytest_sessionfinish(session):
+    if not session.config.getoption('memory_save', False) or not _measured:
+        return
+    baseline = json.loads(MEMORY_BASELINE.read_text()) if MEMORY_BASELINE.exists() else {}
+    baseline.update(_measured)
+    MEMORY_BASELINE.write_text(json.dumps(dict(sorted(baseline.items())), indent=2) + '\n')
+
+
+# ==================== Worlds ====================
+
+class World:
+    """A seeded simulate_day season at one scale: the start of day 2 and what day 2 produced."""
+
+    def __init__(self, users):
+        same_hexes, other_hexes = sim.generate_hexes_from_home(sim.DEFAULT_HOME_HEX)
+        state = sim.default_state()
+        state.update(seed=SEED, home_hex=sim.DEFAULT_HOME_HEX, same_hexes=same_hexes, other_hexes=other_hexes,
+                     total_days=TOTAL_DAYS)
+        state['users'] = sim.generate_users(SEED, same_hexes, other_hexes, users)
+        sim.simulate_day_step(state, 1, TOTAL_DAYS)
+        self.day = 2
+        self.run_date = sim.run_date_for_day(self.day, TOTAL_DAYS).strftime('%Y-%m-%d')
+        self.before = copy.deepcopy(state)
+        _, self.runs, self.hex_teams, self.day_flip_points, self.prev_hex_teams = \
+            sim.simulate_day_step(state, self.day, TOTAL_DAYS)
+        self.state = state
+        self.defectors = [u for u in state['users'] if u['team'] != 'purple'][:max(1, users // 100)]
+
+
+_worlds = {}
+
+
+@pytest.fixture(scope='session')
+def world(scale):
+    if scale not in _worlds:
+        _worlds[scale] = World(scale)
+    return _worlds[scale]
+
+
+# ==================== Bench ====================
+
+def peak_memory(fn, args):
+    """tracemalloc peak (bytes) of one fn(*args) call, allocations of `args` excluded."""
+    tracemalloc.start()
+    try:
+        fn(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.fixture
+def bench(benchmark, request, scale):
+    """bench(fn, setup): time fn(*setup()) and check its peak memory against the baseline."""
+    def run(fn, setup, group=None):
+        random.seed(SEED)
+        peak = peak_memory(fn, setup())
+        key = request.node.nodeid.split('::', 1)[-1]
+        _measured[key] = peak
+        benchmark.group = group or request.node.originalname.removeprefix('test_')
+        benchmark.extra_info.update(users=scale, peak_bytes=peak)
+
+        def fresh():
+            random.seed(SEED)
+            return setup(), {}
+
+        result = benchmark.pedantic(fn, setup=fresh, rounds=ROUNDS.get(scale, 3), iterations=1)
+
+        baseline = json.loads(MEMORY_BASELINE.read_text()).get(key) if MEMORY_BASELINE.exists() else None
+        limit = baseline * (1 + request.config.getoption('memory_tolerance')) + MEMORY_SLACK if baseline else None
+        if limit and peak > limit and not request.config.getoption('memory_save'):
+            pytest.fail(f"peak memory {peak:,} B is over the baseline {baseline:,} B "
+                        f"(+{peak / baseline - 1:.0%}; re-baseline with --memory-save if intended)")
+        return result
+
+    return run
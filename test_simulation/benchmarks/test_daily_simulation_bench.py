@@ -0,0 +1,62 @@
+"""Benchmarks for the legacy daily_simulation.py generator at each --scales user count."""
+
+import copy
+import random
+from datetime import datetime, timezone
+
+import pytest
+
+import daily_simulation as daily
+from conftest import SEED
+
+RUN_DATE = datetime(2026, 2, 16, tzinfo=timezone.utc)
+
+
+class Day:
+    """daily_simulation's users and one simulated day (runs, hex teams, points)."""
+
+    def __init__(self, users):
+        random.seed(SEED)
+        self.users = daily.generate_users(users)
+        self.hex_teams, self.user_points = {}, {}
+        self.runs = daily.simulate_day(self.users, RUN_DATE, self.hex_teams, self.user_points)
+
+
+_days = {}
+
+
+@pytest.fixture(scope='session')
+def day(scale):
+    if scale not in _days:
+        _days[scale] = Day(scale)
+    return _days[scale]
+
+
+def test_generate_users(bench, scale):
+    bench(daily.generate_users, lambda: (scale,), group='daily_generate_users')
+
+
+def run_paths(n):
+    return [daily.generate_run_path(20) for _ in range(n)]
+
+
+def test_generate_run_path(bench, scale):
+    bench(run_paths, lambda: (scale,), group='daily_generate_run_path')
+
+
+def test_simulate_day(bench, day):
+    bench(daily.simulate_day, lambda: (day.users, RUN_DATE, dict(day.hex_teams), copy.copy(day.user_points)),
+          group='daily_simulate_day')
+
+
+SQL_BUILDERS = {
+    'generate_users_sql': lambda d: (d.users,),
+    'generate_runs_sql': lambda d: (d.runs,),
+    'generate_hexes_sql': lambda d: (d.hex_teams,),
+    'generate_points_sql': lambda d: (d.user_points,),
+}
+
+
+@pytest.mark.parametrize('builder', SQL_BUILDERS)
+def test_sql_builder(bench, day, builder):
+    bench(getattr(daily, builder), lambda: SQL_BUILDERS[builder](day), group=f"daily_{builder}")
@@ -0,0 +1,70 @@
+"""Benchmarks for simulate_day.py's generator and SQL builders at each --scales user count."""
+
+import copy
+import random
+
+import pytest
+
+import simulate_day as sim
+from conftest import SEED, TOTAL_DAYS
+
+
+def test_generate_users(bench, world, scale):
+    bench(sim.generate_users, lambda: (SEED, world.state['same_hexes'], world.state['other_hexes'], scale))
+
+
+def run_paths(users, same_hexes, other_hexes):
+    """One 20-hex path (an 8 km run) per user."""
+    return [sim.generate_run_path(u, same_hexes, other_hexes, 20) for u in users]
+
+
+def test_generate_run_path(bench, world):
+    bench(run_paths, lambda: (world.before['users'], world.state['same_hexes'], world.state['other_hexes']))
+
+
+def day_buffs(state, day):
+    """calculate_buff for every user, with the day's shared context computed once (as generate_day_data)."""
+    ctx = sim.buff_context(state)
+    return [sim.calculate_buff(u, state, day, ctx) for u in state['users']]
+
+
+def test_calculate_buff(bench, world):
+    bench(day_buffs, lambda: (world.before, world.day))
+
+
+def test_generate_day_data(bench, world):
+    bench(sim.generate_day_data, lambda: (world.before, world.day, TOTAL_DAYS))
+
+
+def test_update_state(bench, world):
+    bench(sim.update_state, lambda: (copy.deepcopy(world.before), world.day, world.runs, world.hex_teams,
+                                     world.day_flip_points))
+
+
+SQL_BUILDERS = {
+    'sql_auth_users_insert': lambda w: (w.state['users'],),
+    'sql_users_insert': lambda w: (w.state['users'],),
+    'sql_runs_insert': lambda w: (w.runs,),
+    'sql_hexes_upsert': lambda w: (w.hex_teams,),
+    'sql_hex_snapshot_insert': lambda w: (w.hex_teams, w.run_date),
+    'sql_hex_snapshot_keyframe_delta_insert': lambda w: (w.hex_teams, w.prev_hex_teams, w.run_date, w.day, 7),
+    'sql_daily_buff_stats_insert': lambda w: (w.state, w.day, w.hex_teams, w.run_date),
+    'sql_daily_all_range_stats_insert': lambda w: (w.hex_teams, w.run_date),
+    'sql_user_points_update': lambda w: (w.state,),
+    'sql_defections': lambda w: (w.defectors,),
+    'sql_verify_queries': lambda w: (w.day, TOTAL_DAYS),
+}
+
+
+@pytest.mark.parametrize('builder', SQL_BUILDERS)
+def test_sql_builder(bench, world, builder):
+    bench(getattr(sim, builder), lambda: SQL_BUILDERS[builder](world), group=builder)
+
+
+def test_generated_sql_is_deterministic(world):
+    """Fixed seeds: the same world gives the same day, so timings compare like with like."""
+    random.seed(SEED)
+    runs, hex_teams, _ = sim.generate_day_data(world.before, world.day, TOTAL_DAYS)
+    assert [(r['user_id'], r['flip_count'], r['distance_km']) for r in runs] == \
+        [(r['user_id'], r['flip_count'], r['distance_km']) for r in world.runs]
+    assert hex_teams == world.hex_teams
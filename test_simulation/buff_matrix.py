@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+RunStrict Buff Matrix Evaluator
+
+Compiles app_config.config_data->'buff' (the keys from
+20260221000000_config_driven_buff_multipliers.sql / BuffConfig in
+lib/data/models/app_config.dart) into one dense lookup table:
+
+    table[team, is_elite, district_win, province_win, purple_bucket] -> multiplier
+
+team: 0 red, 1 blue, 2 purple. purple_bucket: 0 low, 1 mid, 2 high
+participation tier. Evaluating every user is a single array gather, so the
+simulator, monte_carlo.py and the SQL cross-check all share one definition
+of the matrix (docs/01-game-rules.md §3).
+
+Usage:
+    python3 buff_matrix.py                         # Print the compiled matrix (defaults)
+    python3 buff_matrix.py --config buff.json      # Flat buff JSON or a config_data blob
+    python3 buff_matrix.py --from-db               # app_config.config_data->'buff'
+    python3 buff_matrix.py --check                 # Compare get_user_buff() for every user
+
+Requires: pip install numpy (psycopg2-binary for --from-db / --check)
+"""
+
+import argparse
+import json
+import sys
+
+import numpy as np
+
+TEAMS = ('red', 'blue', 'purple')
+TEAM_INDEX = {t: i for i, t in enumerate(TEAMS)}
+RED, BLUE, PURPLE = 0, 1, 2
+PURPLE_BUCKETS = ('low', 'mid', 'high')
+
+# BuffConfig defaults (app_config.dart / 20260221000000_config_driven_buff_multipliers.sql)
+BUFF_DEFAULTS = {
+    'redEliteThreshold': 0.20,
+    'redEliteBase': 2,
+    'redCommonBase': 1,
+    'eliteDistrictWinBonus': 1,
+    'eliteProvinceWinBonus': 1,
+    'commonDistrictWinBonus': 0,
+    'commonProvinceWinBonus': 1,
+    'blueUnionBase': 1,
+    'blueDistrictWinBonus': 1,
+    'blueProvinceWinBonus': 1,
+    'purpleHighTierThreshold': 0.60,
+    'purpleMidTierThreshold': 0.30,
+    'purpleHighTierBuff': 3,
+    'purpleMidTierBuff': 2,
+    'purpleLowTierBuff': 1,
+}
+FLOAT_KEYS = {'redEliteThreshold', 'purpleHighTierThreshold', 'purpleMidTierThreshold'}
+
+
+# ==================== Config ====================
+
+def load_buff_config(source=None):
+    """Merge a buff config onto the defaults, coercing types like BuffConfig.fromJson.
+
+    source: None (defaults), a dict, or a path to JSON. A config_data blob
+    ({"buff": {...}}) or an app_config row ({"config_data": {...}}) also works.
+    Keys starting with '_' (e.g. the Tier 3 `_note`) are ignored.
+    """
+    if source is None:
+        data = {}
+    elif isinstance(source, dict):
+        data = source
+    else:
+        with open(source) as f:
+            data = json.load(f)
+    if 'config_data' in data:
+        data = data['config_data']
+    if 'buff' in data and isinstance(data['buff'], dict):
+        data = data['buff']
+
+    config = dict(BUFF_DEFAULTS)
+    for key, value in data.items():
+        if key.startswith('_'):
+            continue
+        if key not in BUFF_DEFAULTS:
+            raise ValueError(f"Unknown buff config key: {key}")
+        if value is None:
+            continue
+        config[key] = float(value) if key in FLOAT_KEYS else int(value)
+    if config['purpleMidTierThreshold'] > config['purpleHighTierThreshold']:
+        raise ValueError("purpleMidTierThreshold must not exceed purpleHighTierThreshold")
+    return config
+
+
+def load_buff_config_from_db(conn):
+    """Read app_config.config_data->'buff' the way get_user_buff() did; defaults if missing."""
+    cur = conn.cursor()
+    cur.execute("SELECT config_data->'buff' FROM public.app_config LIMIT 1")
+    row = cur.fetchone()
+    return load_buff_config(row[0] if row and row[0] else None)
+
+
+# ==================== Matrix ====================
+
+def elite_cutoff_rank(red_runner_count, threshold):
+    """get_user_buff: GREATEST(1, (count * threshold)::INTEGER). Numeric casts round half away from zero."""
+    return np.maximum(1, np.floor(np.asarray(red_runner_count) * threshold + 0.5).astype(np.int64))
+
+
+class BuffMatrix:
+    """Buff config compiled into a [team, elite, district win, province win, purple bucket] table."""
+
+    def __init__(self, config=None):
+        self.config = load_buff_config(config)
+        self.purple_thresholds = np.array(
+            [self.config['purpleMidTierThreshold'], self.config['purpleHighTierThreshold']])
+        self.table = self._compile()
+
+    def _compile(self):
+        c = self.config
+        table = np.zeros((3, 2, 2, 2, 3), dtype=np.int16)
+        for dw in (0, 1):
+            for pw in (0, 1):
+                table[RED, 1, dw, pw, :] = (c['redEliteBase'] + dw * c['eliteDistrictWinBonus']
+                                            + pw * c['eliteProvinceWinBonus'])
+                table[RED, 0, dw, pw, :] = (c['redCommonBase'] + dw * c['commonDistrictWinBonus']
+                                            + pw * c['commonProvinceWinBonus'])
+                table[BLUE, :, dw, pw, :] = (c['blueUnionBase'] + dw * c['blueDistrictWinBonus']
+                                             + pw * c['blueProvinceWinBonus'])
+        # Purple: participation tier only (no elite, no territory bonus)
+        table[PURPLE, ..., 0] = c['purpleLowTierBuff']
+        table[PURPLE, ..., 1] = c['purpleMidTierBuff']
+        table[PURPLE, ..., 2] = c['purpleHighTierBuff']
+        return table
+
+    def purple_bucket(self, rate):
+        """0/1/2 for rate < mid, mid <= rate < high, rate >= high."""
+        return np.searchsorted(self.purple_thresholds, rate, side='right')
+
+    def lookup(self, team, is_elite, district_win, province_win, purple_rate):
+        """Multiplier for every user in one gather. team is int codes (see TEAM_INDEX)."""
+        return self.table[
+            np.asarray(team, dtype=np.intp),
+            np.asarray(is_elite, dtype=np.intp),
+            np.asarray(district_win, dtype=np.intp),
+            np.asarray(province_win, dtype=np.intp),
+            self.purple_bucket(purple_rate),
+        ]
+
+    def multiplier(self, team, is_elite=False, district_win=False, province_win=False, purple_rate=0.0):
+        """Scalar lookup; team is 'red' / 'blue' / 'purple'."""
+        return int(self.table[TEAM_INDEX[team], int(bool(is_elite)), int(bool(district_win)),
+                              int(bool(province_win)), int(self.purple_bucket(purple_rate))])
+
+    def rows(self):
+        """Distinct matrix cells as dicts (purple rows keyed by bucket only)."""
+        out = []
+        for t, team in enumerate(TEAMS):
+            for e in (0, 1) if t == RED else (0,):
+                for dw in (0, 1) if t != PURPLE else (0,):
+                    for pw in (0, 1) if t != PURPLE else (0,):
+                        for b in (0, 1, 2) if t == PURPLE else (0,):
+                            out.append({'team': team, 'is_elite': bool(e), 'district_win': bool(dw),
+                                        'province_win': bool(pw),
+                                        'purple_bucket': PURPLE_BUCKETS[b] if t == PURPLE else None,
+                                        'multiplier': int(self.table[t, e, dw, pw, b])})
+        return out
+
+
+# ==================== SQL Cross-Check ====================
+
+# get_user_buff() reports the flags it used; purple rate comes from the same
+# daily_buff_stats row it reads. The matrix must reproduce every multiplier.
+CROSSCHECK_SQL = """
+SELECT u.id::text, u.team,
+       (b->>'is_elite')::boolean, (b->>'has_district_win')::boolean,
+       (b->>'has_province_win')::boolean, s.purple_participation_rate,
+       (b->>'multiplier')::int
+FROM public.users u
+CROSS JOIN LATERAL public.get_user_buff(u.id, u.district_hex) b
+LEFT JOIN public.daily_buff_stats s
+  ON s.district_hex = u.district_hex
+ AND s.stat_date = (CURRENT_TIMESTAMP AT TIME ZONE 'Etc/GMT-2')::DATE
+WHERE u.team IN ('red', 'blue', 'purple')
+"""
+
+
+def crosscheck(conn, matrix):
+    """Evaluate every user through the matrix and return rows where get_user_buff() disagrees."""
+    cur = conn.cursor()
+    cur.execute(CROSSCHECK_SQL)
+    rows = cur.fetchall()
+    if not rows:
+        return 0, []
+    team = np.array([TEAM_INDEX[r[1]] for r in rows])
+    rate = np.array([float(r[5]) if r[5] is not None else 0.0 for r in rows])
+    expected = matrix.lookup(team, [bool(r[2]) for r in rows], [bool(r[3]) for r in rows],
+                             [bool(r[4]) for r in rows], rate)
+    actual = np.array([r[6] for r in rows])
+    bad = np.nonzero(expected != actual)[0]
+    return len(rows), [{'user_id': rows[i][0], 'team': rows[i][1], 'expected': int(expected[i]),
+                        'get_user_buff': int(actual[i])} for i in bad]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='RunStrict buff matrix evaluator')
+    parser.add_argument('--config', type=str, help='Buff config JSON (flat, config_data, or app_config row)')
+    parser.add_argument('--from-db', action='store_true', help="Load app_config.config_data->'buff'")
+    parser.add_argument('--check', action='store_true', help='Cross-check get_user_buff() for every user')
+    parser.add_argument('--dsn', type=str, help='Postgres DSN (default: local supabase / $SIM_DB_DSN)')
+    parser.add_argument('--json', action='store_true', help='Print matrix rows as JSON')
+    args = parser.parse_args()
+
+    conn = None
+    if args.from_db or args.check:
+        from simulate_day import LOCAL_DB_DSN, get_db_connection
+        conn = get_db_connection(args.dsn or LOCAL_DB_DSN)
+
+    matrix = BuffMatrix(load_buff_config_from_db(conn) if args.from_db else args.config)
+    rows = matrix.rows()
+    if args.json:
+        print(json.dumps({'config': matrix.config, 'matrix': rows}, indent=2))
+    else:
+        print(f"{'team':<8}{'elite':<7}{'district':<10}{'province':<10}{'purple':<8}mult")
+        for r in rows:
+            print(f"{r['team']:<8}{'Y' if r['is_elite'] else '-':<7}{'win' if r['district_win'] else '-':<10}"
+                  f"{'win' if r['province_win'] else '-':<10}{r['purple_bucket'] or '-':<8}{r['multiplier']}x")
+
+    if args.check:
+        checked, mismatches = crosscheck(conn, matrix)
+        for m in mismatches[:20]:
+            print(f"  MISMATCH {m['user_id']} ({m['team']}): matrix {m['expected']}x, "
+                  f"get_user_buff {m['get_user_buff']}x", file=sys.stderr)
+        print(f"Checked {checked} users: {len(mismatches)} mismatch(es)", file=sys.stderr)
+        conn.close()
+        if mismatches:
+            sys.exit(1)
+    elif conn:
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+RunStrict Capacity Planner
+
+Projects how large the season tables grow, and how long the nightly jobs
+take, at a target user count. The projection is fitted from short
+simulated seasons at several smaller scales.
+
+For each --scales user count, it replays --days days of simulate_day
+against a local Postgres, one committed day at a time:
+
+  load      day 1 users, then each day's defections, run_history, hexes upsert,
+            hex_snapshot and users points, as simulate_day writes them. The
+            Res-6 district_hex of users and of new hexes is filled in too, as
+            finalize_run does; calculate_daily_buffs() groups by it.
+  nightly   VACUUM ANALYZE (what autovacuum would have done by midnight), then
+            calculate_daily_buffs() from 20260308000001_set_based_calculate_daily_buffs.sql.
+            It is loaded as a pg_temp function whose GMT+2 "today" is pinned
+            to run date + 1, so every simulated night writes its own stat_date.
+  measure   rows, heap bytes (pg_table_size) and index bytes (pg_indexes_size)
+            of run_history, hex_snapshot, daily_buff_stats,
+            daily_province_range_stats and hexes. Bytes are summed over
+            partitions. What the tables held before the scale started is subtracted.
+
+The simulator's own daily_buff_stats / daily_all_range_stats inserts are
+left out, because the nightly job owns those tables. The snapshot duration is
+the day's hex_snapshot write: the simulator writes the full hex map per
+day, as the midnight build does.
+
+Growth model. Rows are fitted across scales as a power law a * users^b
+(log-log least squares), or as a straight line when a value is zero. Two
+values are fitted: the rows on the last simulated day, and the rows that
+day added. At U users the projection is
+
+    rows(U) + rows_per_day(U) * (season_days - days)
+
+Bytes are those rows times the bytes per row of the largest scale. hexes
+and hex_snapshot are bounded by the cells of the simulated region
+(simulate_day plays one home region). hexes rows and hex_snapshot rows per
+day are capped at that cell count, so read them as per-region numbers. The
+nightly jobs read one day of runs and the current hex map, which do not
+grow with the season. Their durations are fitted on the last simulated
+night.
+
+The report prints b next to each table: ~1 grows with users, ~0 is bounded.
+
+At the end of each scale, the simulation's rows are deleted and the tables
+are VACUUM FULLed, so the next scale starts from the same sizes. Deleted
+rows: the aaaaaaaa- users with their run_history and auth entries, hexes,
+and the stats and snapshots of the simulated dates. The data goes into the
+real public tables, so point this at a disposable local database. The
+workload defaults to zipf (workload.py), because the uniform pools hold
+only 160 hexes.
+
+Usage:
+    python3 capacity_planner.py                                    # 1k/3k/10k users x 4 days -> 10k, 100k
+    python3 capacity_planner.py --target-users 50000,500000 --season-days 40
+    python3 capacity_planner.py --scales 2000,5000,20000 --days 6 --json capacity.json
+    python3 capacity_planner.py --load capacity.json --target-users 1000000   # Re-project, no DB
+    python3 capacity_planner.py --dsn postgresql://...
+
+Requires: pip install h3 numpy psycopg2-binary
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import timedelta
+
+import numpy as np
+
+from bench_daily_buffs import TODAY_GMT2, function_sql
+import simulate_day as sim
+
+TABLES = ('run_history', 'hex_snapshot', 'daily_buff_stats', 'daily_province_range_stats', 'hexes')
+REGION_BOUND = ('hexes', 'hex_snapshot')   # hexes rows / hex_snapshot rows per day <= region cells
+SIZES = ('rows', 'heap_bytes', 'index_bytes')
+JOBS = ('calculate_daily_buffs', 'hex_snapshot')
+BUFFS_MIGRATION = '20260308000001_set_based_calculate_daily_buffs.sql'
+BUFFS_FUNCTION = '_capacity_daily_buffs'
+VACUUM_TABLES = ('auth.users', 'public.users', 'public.leaderboard_dirty', 'public.daily_all_range_stats') + \
+    tuple(f'public.{t}' for t in TABLES)
+
+# The table itself plus its leaf partitions (a partitioned parent has no storage of its own)
+SIZE_SQL = """
+SELECT SUM(pg_table_size(r)), SUM(pg_indexes_size(r))
+FROM (SELECT relid FROM pg_partition_tree(%(t)s::regclass) WHERE isleaf
+      UNION SELECT %(t)s::regclass) x(r)
+"""
+
+CLEANUP_SQL = """
+DELETE FROM public.daily_buff_stats WHERE stat_date = ANY(%(stat_dates)s::date[]);
+DELETE FROM public.daily_province_range_stats WHERE stat_date = ANY(%(stat_dates)s::date[]);
+DELETE FROM public.daily_all_range_stats WHERE stat_date = ANY(%(stat_dates)s::date[]);
+DELETE FROM public.hex_snapshot WHERE snapshot_date = ANY(%(run_dates)s::date[]);
+DELETE FROM public.hexes;
+DELETE FROM public.leaderboard_dirty WHERE user_id::text LIKE 'aaaaaaaa-%%';
+DELETE FROM public.run_history WHERE user_id::text LIKE 'aaaaaaaa-%%';
+DELETE FROM public.users WHERE id::text LIKE 'aaaaaaaa-%%';
+DELETE FROM auth.users WHERE id::text LIKE 'aaaaaaaa-%%';
+"""
+
+
+def buffs_function_sql():
+    """calculate_daily_buffs() as a pg_temp function whose GMT+2 today is the capacity.today setting."""
+    sql = function_sql(BUFFS_MIGRATION, BUFFS_FUNCTION)
+    if TODAY_GMT2 not in sql:
+        raise RuntimeError(f"GMT+2 today expression not found in {BUFFS_MIGRATION}")
+    return sql.replace(TODAY_GMT2, "current_setting('capacity.today')::DATE")
+
+
+def fmt_bytes(n):
+    for unit in ('B', 'kB', 'MB', 'GB', 'TB'):
+        if abs(n) < 1024 or unit == 'TB':
+            return f"{n:,.0f}B" if unit == 'B' else f"{n:,.1f}{unit}"
+        n /= 1024
+
+
+# ==================== Simulate ====================
+
+def new_state(users, args):
+    """A fresh simulate_day season, as simulate_day.py --days sets one up, and its region's cell count."""
+    same_hexes, other_hexes = sim.generate_hexes_from_home(sim.DEFAULT_HOME_HEX)
+    state = sim.default_state()
+    state.update(seed=args.seed, home_hex=sim.DEFAULT_HOME_HEX, same_hexes=same_hexes, other_hexes=other_hexes,
+                 total_days=args.days)
+    workload = None
+    cells = len(set(same_hexes) | set(other_hexes))
+    if args.workload == 'zipf':
+        from workload import get_workload
+        state['workload'] = {}
+        workload = get_workload(state)
+        cells = workload.summary()['cells']
+    state['users'] = sim.generate_users(args.seed, same_hexes, other_hexes, users, workload)
+    return state, cells
+
+
+def sql_user_districts(users):
+    """users.district_hex / province_hex from each home hex."""
+    vals = ",\n".join(
+        f"  ('{u['id']}'::uuid, '{sim.h3.cell_to_parent(u['home_hex'], sim.CITY_RESOLUTION)}', "
+        f"'{sim.h3.cell_to_parent(u['home_hex'], sim.ALL_RESOLUTION)}')" for u in users)
+    return (f"UPDATE public.users u SET district_hex = v.district, province_hex = v.province FROM (VALUES\n{vals}\n"
+            f") v(id, district, province) WHERE u.id = v.id;")
+
+
+def sql_hex_districts(hex_ids):
+    """hexes.district_hex of hexes first owned today."""
+    if not hex_ids:
+        return "-- No new hexes"
+    vals = ",\n".join(f"  ('{hid}', '{sim.h3.cell_to_parent(hid, sim.CITY_RESOLUTION)}')" for hid in hex_ids)
+    return f"UPDATE public.hexes h SET district_hex = v.district FROM (VALUES\n{vals}\n) v(id, district) WHERE h.id = v.id;"
+
+
+def day_statements(state, day, total_days):
+    """One simulated day's writes, minus the stats tables the nightly job owns."""
+    run_date = sim.run_date_for_day(day, total_days)
+    run_date_str = run_date.strftime('%Y-%m-%d')
+    sections = []
+    if day == 1:
+        sections += [sim.sql_auth_users_insert(state['users']), sim.sql_users_insert(state['users']),
+                     sql_user_districts(state['users'])]
+    defectors, runs, hex_teams, _, prev_hex_teams = sim.simulate_day_step(state, day, total_days)
+    sections += [
+        sim.sql_defections(defectors),
+        sim.sql_runs_insert(runs),
+        sim.sql_hexes_upsert(hex_teams),
+        sql_hex_districts([hid for hid in hex_teams if hid not in prev_hex_teams]),
+        sim.sql_hex_snapshot_insert(hex_teams, run_date_str),
+        sim.sql_user_points_update(state),
+    ]
+    return run_date, [stmt for section in sections for stmt in sim.split_statements(section)], len(runs)
+
+
+def measure(cur):
+    """Rows, heap bytes and index bytes per table (partitions summed)."""
+    out = {}
+    for table in TABLES:
+        cur.execute(f"SELECT count(*) FROM public.{table}")
+        rows = cur.fetchone()[0]
+        cur.execute(SIZE_SQL, {'t': f'public.{table}'})
+        heap, index = cur.fetchone()
+        out[table] = {'rows': rows, 'heap_bytes': int(heap), 'index_bytes': int(index)}
+    return out
+
+
+def vacuum(conn, full=False):
+    """VACUUM ANALYZE the touched tables (FULL: rewrite them compactly)."""
+    conn.commit()
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cur:
+            cur.execute(f"VACUUM {'FULL' if full else ''} ANALYZE {', '.join(VACUUM_TABLES)}")
+    finally:
+        conn.autocommit = False
+
+
+def cleanup(conn, days):
+    """Delete the simulation's rows for `days` simulated days, then compact the tables."""
+    run_dates = [sim.run_date_for_day(d, days) for d in range(1, days + 1)]
+    conn.rollback()
+    with conn.cursor() as cur:
+        cur.execute(CLEANUP_SQL, {'run_dates': run_dates, 'stat_dates': [d + timedelta(days=1) for d in run_dates]})
+    conn.commit()
+    vacuum(conn, full=True)
+
+
+def run_scale(conn, users, args):
+    """Replay --days days at `users` users: one record per day, and the region's cell count."""
+    state, cells = new_state(users, args)
+    cur = conn.cursor()
+    days = []
+    try:
+        base = measure(cur)
+        for day in range(1, args.days + 1):
+            sim.METRICS.start_day(day)
+            run_date, statements, n_runs = day_statements(state, day, args.days)
+            with sim.METRICS.phase('execute'):
+                for stmt in statements:
+                    t0 = time.perf_counter()
+                    cur.execute(stmt)
+                    sim.METRICS.statement(stmt, time.perf_counter() - t0, cur.rowcount)
+                conn.commit()
+            with sim.METRICS.phase('vacuum'):
+                vacuum(conn)
+            cur.execute("SELECT set_config('capacity.today', %s, false)", (str(run_date + timedelta(days=1)),))
+            with sim.METRICS.phase('nightly'):
+                t0 = time.perf_counter()
+                cur.execute(f"SELECT pg_temp.{BUFFS_FUNCTION}()")
+                conn.commit()
+                buffs_s = time.perf_counter() - t0
+            record = sim.METRICS.end_day(run_date=str(run_date))
+            sizes = measure(cur)
+            conn.commit()
+            days.append({
+                'day': day, 'run_date': str(run_date), 'runs': n_runs,
+                'load_s': round(record['phases'].get('execute', 0.0), 3),
+                'tables': {t: {k: sizes[t][k] - base[t][k] for k in SIZES} for t in TABLES},
+                'jobs': {'calculate_daily_buffs': round(buffs_s * 1000, 1),
+                         'hex_snapshot': record['db'].get('INSERT public.hex_snapshot', {}).get('total_ms', 0.0)},
+            })
+            print(f"  {users:,} users day {day}: {n_runs:,} runs, load {days[-1]['load_s']:.1f}s, "
+                  f"calculate_daily_buffs {buffs_s * 1000:,.0f}ms, run_history "
+                  f"{days[-1]['tables']['run_history']['rows']:,} rows", file=sys.stderr)
+    finally:
+        cur.close()
+        cleanup(conn, args.days)
+    return days, cells
+
+
+# ==================== Fit ====================
+
+def fit(users, values):
+    """values ~ a * users^b (log-log least squares); a straight line when a value is <= 0."""
+    x, y = np.asarray(users, dtype=float), np.asarray(values, dtype=float)
+    if (y > 0).all():
+        b, log_a = np.polyfit(np.log(x), np.log(y), 1)
+        return {'model': 'power', 'a': float(np.exp(log_a)), 'b': float(b)}
+    slope, intercept = np.polyfit(x, y, 1)
+    return {'model': 'linear', 'slope': float(slope), 'intercept': float(intercept)}
+
+
+def evaluate(f, users):
+    if f['model'] == 'power':
+        return f['a'] * users ** f['b']
+    return max(0.0, f['slope'] * users + f['intercept'])
+
+
+def exponent(f):
+    return f"{f['b']:.2f}" if f['model'] == 'power' else 'lin'
+
+
+def fit_scales(scales):
+    """Per table: rows and rows added on the last day across scales, bytes per row at the largest scale."""
+    users = sorted(scales)
+    last = [scales[u][-1] for u in users]
+    prev = [scales[u][-2] for u in users]
+    fits = {'days': last[0]['day'], 'tables': {}, 'jobs': {}}
+    for table in TABLES:
+        top = last[-1]['tables'][table]
+        fits['tables'][table] = {
+            'rows': fit(users, [d['tables'][table]['rows'] for d in last]),
+            'rows_per_day': fit(users, [d['tables'][table]['rows'] - p['tables'][table]['rows']
+                                        for d, p in zip(last, prev)]),
+            'heap_per_row': top['heap_bytes'] / max(top['rows'], 1),
+            'index_per_row': top['index_bytes'] / max(top['rows'], 1),
+        }
+    for job in JOBS:
+        fits['jobs'][job] = fit(users, [d['jobs'][job] for d in last])
+    return fits
+
+
+def project(fits, users, season_days, cells):
+    """Projected rows / bytes per table and last-night job durations at `users` users."""
+    out = {'tables': {}, 'jobs': {}}
+    for table, f in fits['tables'].items():
+        rows, per_day = evaluate(f['rows'], users), evaluate(f['rows_per_day'], users)
+        if table in REGION_BOUND:
+            per_day = min(per_day, cells)
+            rows = min(rows, cells * fits['days'] if table == 'hex_snapshot' else cells)
+        rows += per_day * max(0, season_days - fits['days'])
+        if table == 'hexes':
+            rows = min(rows, cells)
+        out['tables'][table] = {'rows': round(rows), 'rows_per_day': round(per_day),
+                                'heap_bytes': round(rows * f['heap_per_row']),
+                                'index_bytes': round(rows * f['index_per_row'])}
+    for job, f in fits['jobs'].items():
+        out['jobs'][job] = round(evaluate(f, users), 1)
+    return out
+
+
+# ==================== Report ====================
+
+def print_measured(scales, file=sys.stderr):
+    print(f"\n{'measured':<10} {'day':>4} " + " ".join(f"{t[:16]:>16}" for t in TABLES)
+          + f" {'buffs ms':>9} {'snap ms':>8}", file=file)
+    for users in sorted(scales):
+        d = scales[users][-1]
+        print(f"{users:<10,} {d['day']:>4} "
+              + " ".join(f"{d['tables'][t]['rows']:>16,}" for t in TABLES)
+              + f" {d['jobs']['calculate_daily_buffs']:>9,.0f} {d['jobs']['hex_snapshot']:>8,.0f}", file=file)
+
+
+def report(scales, fits, projections, season_days, cells, file=sys.stdout):
+    print(f"Capacity projection: {season_days}-day season, fitted on "
+          f"{'/'.join(f'{u:,}' for u in sorted(scales))} users x {fits['days']} days "
+          f"({cells:,}-cell region)", file=file)
+    for target, p in projections.items():
+        print(f"\n{target:,} users", file=file)
+        print(f"{'table':<28} {'rows':>14} {'heap':>10} {'index':>10} {'total':>10} {'rows/day':>12} {'~users^b':>9}",
+              file=file)
+        total = 0
+        for table, t in p['tables'].items():
+            size = t['heap_bytes'] + t['index_bytes']
+            total += size
+            capped = '*' if table in REGION_BOUND else ' '
+            print(f"{table:<28} {t['rows']:>14,} {fmt_bytes(t['heap_bytes']):>10} {fmt_bytes(t['index_bytes']):>10} "
+                  f"{fmt_bytes(size):>10} {t['rows_per_day']:>12,} {exponent(fits['tables'][table]['rows_per_day']):>9}"
+                  f"{capped}", file=file)
+        print(f"{'(total)':<28} {'':>14} {'':>10} {'':>10} {fmt_bytes(total):>10}", file=file)
+        print(f"{'nightly job':<28} {'last night':>14} {'~users^b':>9}", file=file)
+        for job, ms in p['jobs'].items():
+            print(f"{job:<28} {ms:>12,.0f}ms {exponent(fits['jobs'][job]):>9}", file=file)
+    print(f"\n* bounded by the simulated region ({cells:,} cells): per-region numbers", file=file)
+
+
+def int_list(text):
+    return [int(v) for v in text.split(',') if v.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Project season table growth and nightly job cost from simulated load')
+    parser.add_argument('--dsn', default=sim.LOCAL_DB_DSN, help='Postgres DSN (default: local supabase / $SIM_DB_DSN)')
+    parser.add_argument('--scales', type=int_list, default=[1000, 3000, 10000],
+                        help='Simulated user counts to fit on (default: 1000,3000,10000)')
+    parser.add_argument('--days', type=int, default=4, help='Days simulated per scale (default: 4)')
+    parser.add_argument('--target-users', type=int_list, default=[10000, 100000],
+                        help='User counts to project (default: 10000,100000)')
+    parser.add_argument('--season-days', type=int, default=40, help='Season length to project (default: 40)')
+    parser.add_argument('--workload', choices=['uniform', 'zipf'], default='zipf',
+                        help='Geographic workload for simulate_day (default: zipf)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    parser.add_argument('--json', type=str, help='Write measurements, fits and projections as JSON')
+    parser.add_argument('--load', type=str, help='Re-project from a previous --json file instead of simulating')
+    args = parser.parse_args()
+
+    if args.load:
+        saved = json.loads(open(args.load).read())
+        scales = {int(u): days for u, days in saved['scales'].items()}
+        cells = saved['region_cells']
+    else:
+        if len(set(args.scales)) < 2:
+            parser.error("--scales needs at least two user counts to fit a curve")
+        if not 2 <= args.days <= 40:
+            parser.error("--days must be 2-40 (rows per day needs two days)")
+        if sim.psycopg2 is None:
+            print("ERROR: psycopg2 required. Install with: pip install psycopg2-binary", file=sys.stderr)
+            sys.exit(1)
+        conn = sim.get_db_connection(args.dsn)
+        scales = {}
+        try:
+            with conn.cursor() as cur:
+                cur.execute(buffs_function_sql())
+            conn.commit()
+            cleanup(conn, args.days)
+            for users in sorted(set(args.scales)):
+                print(f"Simulating {users:,} users x {args.days} days...", file=sys.stderr)
+                t0 = time.perf_counter()
+                scales[users], cells = run_scale(conn, users, args)
+                print(f"  done in {time.perf_counter() - t0:.1f}s (cleaned up)", file=sys.stderr)
+        finally:
+            conn.close()
+
+    print_measured(scales)
+    fits = fit_scales(scales)
+    projections = {target: project(fits, target, args.season_days, cells) for target in args.target_users}
+    report(scales, fits, projections, args.season_days, cells)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'season_days': args.season_days, 'workload': args.workload, 'seed': args.seed,
+                       'region_cells': cells, 'scales': scales, 'fits': fits, 'projections': projections},
+                      f, indent=2)
+        print(f"\nWritten to {args.json}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
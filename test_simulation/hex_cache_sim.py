@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+RunStrict HexRepository Cache-Sizing Simulator
+
+HexRepository (lib/data/repositories/hex_repository.dart) keeps the map's
+hex colors in one LruCache (lib/core/utils/lru_cache.dart) of
+hexConfig.maxCacheSize entries, plus an eviction-immune local overlay of the
+user's own flips today. This replays per-user client traces against a
+Python model of the same semantics and reports what each maxCacheSize costs.
+
+Modelled behaviour (one model per device):
+  bulkLoadFromSnapshot  PrefetchService._downloadHexData(): clear the LRU, then
+                        put every row of get_hex_snapshot(province), in hex id
+                        order. A snapshot larger than the cache keeps its tail.
+  applyLocalOverlay     the overlay is refilled from today's flips (no LRU puts)
+  getHex                map rendering: LRU get (hit moves to MRU, a miss is NOT
+                        filled), with the overlay merged on top. A miss on a
+                        colored hex renders it neutral until the next reload.
+  updateHexColor        each cell of a run: getHex, then put on a flip or new hex
+  computeHexDominance   TeamScreen: iterate the LRU, then the overlay-only hexes
+                        (whose dedup check is an LRU get, as in the Dart code)
+  midnight              clearLocalOverlay(), then the next session reloads
+
+Each simulated day, every user opens the app --sessions times. A session
+reloads the snapshot and overlay, opens TeamScreen once, and renders --pans
+map views: zone views (k-ring 5 around a camera that wanders from home),
+district views (343 cells) and province views (2,401 cells), weighted by
+--view-mix. The session with the user's run (who runs and how far comes from
+simulate_day) renders half its views before the run. After the run,
+run_provider refreshes the cache, so the session reloads before the other
+half. A --away share of runs start in a neighbouring province.
+
+Province density is the share of the home province's 2,401 Res-9 cells in
+the snapshot (colored yesterday). The user's own flips join their snapshot
+the next day.
+
+The report has one row per (density, cache size):
+  hit rate       LRU hits / lookups from map views
+  lost color     views of a colored hex that rendered neutral (evicted or
+                 never loaded)
+  evictions      per user-day, and how many of them held an overlay hex
+                 (their color survives in the overlay; the LRU entry does not)
+  dominance      mean share of colored province hexes missing from
+                 computeHexDominance()'s province total
+  memory         peak LRU entries and overlay entries x the byte estimates
+                 below (64-bit Dart VM, 15-char hex id keys)
+
+Usage:
+    python3 hex_cache_sim.py                                     # 50 users, 7 days
+    python3 hex_cache_sim.py --sizes 500,1000,2401,4000 --densities 0.2,0.6,1.0
+    python3 hex_cache_sim.py --users 200 --days 14 --pans 12 --away 0.1
+    python3 hex_cache_sim.py --view-mix 0.5,0.3,0.2 --target 0.001
+
+Requires: pip install h3 numpy
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+import simulate_day as sim
+
+# Bytes per entry, 64-bit Dart VM estimates:
+#   LRU      LinkedHashMap slot (~40) + String key (~32) + HexModel (~48)
+#            + LatLng center (~32) + DateTime lastFlippedAt (~24)
+#   overlay  LinkedHashMap slot (~40) + String key (~32); Team is a shared enum
+LRU_ENTRY_BYTES = 176
+OVERLAY_ENTRY_BYTES = 72
+
+MISSING = object()
+TEAMS = ('red', 'blue', 'purple')
+ZONE_K = 5                 # HexagonMap zone view: getHexagonsInArea(center, res, 5)
+CELL_KM = 0.3              # Res-9 center-to-center distance (~sqrt(3) x 174m edge)
+AWAY_STEPS = 60            # grid steps from home that land outside a Res-5 province
+
+
+# ==================== Cache model ====================
+
+class HexCacheModel:
+    """HexRepository's LRU + local overlay, with counters LruCache.clear() does not reset."""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.lru = OrderedDict()   # hex id -> team (None = neutral)
+        self.overlay = {}
+        self.captured = set()
+        self.snapshot = frozenset()
+        self.lookups = self.hits = self.lost = 0
+        self.evictions = self.overlay_evictions = 0
+        self.peak = self.peak_overlay = 0
+
+    def _get(self, hex_id):
+        team = self.lru.get(hex_id, MISSING)
+        if team is not MISSING:
+            self.lru.move_to_end(hex_id)
+        return team
+
+    def _put(self, hex_id, team):
+        if hex_id in self.lru:
+            del self.lru[hex_id]
+        elif len(self.lru) >= self.max_size:
+            evicted, _ = self.lru.popitem(last=False)
+            self.evictions += 1
+            if evicted in self.overlay:
+                self.overlay_evictions += 1
+        self.lru[hex_id] = team
+        if len(self.lru) > self.peak:
+            self.peak = len(self.lru)
+
+    def view(self, cells):
+        """Map render: getCachedHex() for every visible cell."""
+        for hex_id in cells:
+            team = self._get(hex_id)
+            self.lookups += 1
+            if team is not MISSING:
+                self.hits += 1
+            elif hex_id in self.snapshot and hex_id not in self.overlay:
+                self.lost += 1
+
+    def update_hex_color(self, hex_id, team):
+        existing = self.overlay.get(hex_id, self._get(hex_id))   # getHex(): overlay wins
+        if hex_id in self.captured:
+            return
+        self.captured.add(hex_id)
+        if existing is MISSING or existing != team:
+            self._put(hex_id, team)
+            self.overlay[hex_id] = team
+            if len(self.overlay) > self.peak_overlay:
+                self.peak_overlay = len(self.overlay)
+
+    def bulk_load_from_snapshot(self, rows, snapshot):
+        self.lru.clear()
+        self.snapshot = snapshot
+        for hex_id, team in rows:
+            self._put(hex_id, team)
+
+    def dominance_total(self, province, parents):
+        """computeHexDominance()'s province total: LRU entries, then overlay-only hexes."""
+        total = sum(1 for h in self.lru if parents(h)[0] == province)
+        for h in list(self.overlay):
+            if self._get(h) is MISSING and parents(h)[0] == province:
+                total += 1
+        return total
+
+
+# ==================== Traces ====================
+
+class Geography:
+    """One Res-5 province at Res-9, with cached views and parents."""
+
+    def __init__(self):
+        self.province = sim.h3.cell_to_parent(sim.DEFAULT_HOME_HEX, sim.ALL_RESOLUTION)
+        self.cells = sorted(sim.h3.cell_to_children(self.province, sim.BASE_RESOLUTION))
+        self._districts = {}
+        self._parents = {}
+        self._neighbors = {}
+
+    def parents(self, hex_id):
+        p = self._parents.get(hex_id)
+        if p is None:
+            p = (sim.h3.cell_to_parent(hex_id, sim.ALL_RESOLUTION), sim.h3.cell_to_parent(hex_id, sim.CITY_RESOLUTION))
+            self._parents[hex_id] = p
+        return p
+
+    def district_view(self, hex_id):
+        district = self.parents(hex_id)[1]
+        cells = self._districts.get(district)
+        if cells is None:
+            cells = sim.h3.cell_to_children(district, sim.BASE_RESOLUTION)
+            self._districts[district] = cells
+        return cells
+
+    def neighbors(self, hex_id):
+        n = self._neighbors.get(hex_id)
+        if n is None:
+            n = sim.h3.grid_ring(hex_id, 1)
+            self._neighbors[hex_id] = n
+        return n
+
+    def walk(self, start, steps, rng):
+        """A run's path: a random walk that does not step straight back."""
+        path = [start]
+        prev = None
+        for _ in range(steps - 1):
+            options = [c for c in self.neighbors(path[-1]) if c != prev]
+            prev = path[-1]
+            path.append(rng.choice(options))
+        return path
+
+
+def simulated_runs(n_users, days, seed):
+    """simulate_day's runs as {day: [(user index, distance_km)]}."""
+    home_hex = sim.DEFAULT_HOME_HEX
+    same_hexes, other_hexes = sim.generate_hexes_from_home(home_hex)
+    state = sim.default_state()
+    state.update(seed=seed, home_hex=home_hex, same_hexes=same_hexes, other_hexes=other_hexes, total_days=days)
+    state['users'] = sim.generate_users(seed, same_hexes, other_hexes, n_users)
+    index = {u['id']: i for i, u in enumerate(state['users'])}
+    runs = {}
+    for day in range(1, days + 1):
+        _, day_runs, _, _, _ = sim.simulate_day_step(state, day, days)
+        runs[day] = [(index[r['user_id']], float(r['distance_km'])) for r in day_runs]
+    return runs
+
+
+def build_traces(geo, runs, args, density, seed):
+    """Per user, the list of client events for every day at this province density."""
+    rng = random.Random(seed)
+    n_colored = round(len(geo.cells) * density)
+    base = sorted(rng.sample(geo.cells, n_colored))
+    base_teams = {h: rng.choice(TEAMS) for h in base}
+    view_weights = [float(x) for x in args.view_mix.split(',')]
+    province_view = geo.cells
+
+    traces = []
+    for u in range(args.users):
+        home = rng.choice(geo.cells)
+        team = TEAMS[u % 3]
+        own_flips = {}    # the user's flips before today, in their snapshot from tomorrow on
+        events = []
+        for day in range(1, args.days + 1):
+            if day > 1:
+                events.append(('midnight',))
+            extra = {h: t for h, t in own_flips.items() if h not in base_teams}
+            rows = sorted(list(base_teams.items()) + list(extra.items()))
+            snapshot = frozenset(base_teams) | frozenset(extra)
+            today_runs = [km for i, km in runs.get(day, []) if i == u]
+            run_session = {rng.randrange(args.sessions): km for km in today_runs}
+            camera = home
+            for s in range(args.sessions):
+                events.append(('load', rows, snapshot))
+                events.append(('dominance', geo.province))
+                pans = []
+                for _ in range(args.pans):
+                    kind = rng.choices(('zone', 'district', 'province'), weights=view_weights)[0]
+                    if kind == 'zone':
+                        for _ in range(rng.randint(1, 4)):
+                            camera = rng.choice(geo.neighbors(camera))
+                        pans.append(('view', sim.h3.grid_disk(camera, ZONE_K)))
+                    elif kind == 'district':
+                        pans.append(('view', geo.district_view(home)))
+                    else:
+                        pans.append(('view', province_view))
+                if s in run_session:
+                    km = run_session[s]
+                    start = home
+                    if rng.random() < args.away:
+                        start = rng.choice(sim.h3.grid_ring(home, AWAY_STEPS))
+                    path = geo.walk(start, max(3, round(km / CELL_KM)), rng)
+                    half = len(pans) // 2
+                    events += pans[:half]
+                    events.append(('run', path, team))
+                    events.append(('load', rows, snapshot))   # run_provider: post-run PrefetchService().refresh()
+                    events += pans[half:]
+                    for h in path:
+                        own_flips[h] = team
+                else:
+                    events += pans
+        traces.append(events)
+    return traces
+
+
+# ==================== Replay ====================
+
+def replay(traces, size, geo, user_days):
+    totals = {'lookups': 0, 'hits': 0, 'lost': 0, 'evictions': 0, 'overlay_evictions': 0,
+              'peak': 0, 'peak_overlay': 0}
+    dominance_miss = []
+    for events in traces:
+        m = HexCacheModel(size)
+        for ev in events:
+            kind = ev[0]
+            if kind == 'view':
+                m.view(ev[1])
+            elif kind == 'load':
+                m.bulk_load_from_snapshot(ev[1], ev[2])
+            elif kind == 'run':
+                for h in ev[1]:
+                    m.update_hex_color(h, ev[2])
+                m.captured.clear()   # clearUserLocation() -> clearCapturedHexes()
+            elif kind == 'dominance':
+                truth = sum(1 for h in m.snapshot | m.overlay.keys() if geo.parents(h)[0] == ev[1])
+                if truth:
+                    dominance_miss.append(1 - min(m.dominance_total(ev[1], geo.parents), truth) / truth)
+            elif kind == 'midnight':
+                m.overlay.clear()
+        for k in ('lookups', 'hits', 'lost', 'evictions', 'overlay_evictions'):
+            totals[k] += getattr(m, k)
+        totals['peak'] = max(totals['peak'], m.peak)
+        totals['peak_overlay'] = max(totals['peak_overlay'], m.peak_overlay)
+    return {
+        'hit_rate': totals['hits'] / max(totals['lookups'], 1),
+        'lost': totals['lost'] / max(totals['lookups'], 1),
+        'evictions': totals['evictions'] / user_days,
+        'overlay_evictions': totals['overlay_evictions'] / user_days,
+        'dominance_miss': float(np.mean(dominance_miss)) if dominance_miss else 0.0,
+        'peak': totals['peak'],
+        'memory_kb': (totals['peak'] * LRU_ENTRY_BYTES + totals['peak_overlay'] * OVERLAY_ENTRY_BYTES) / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HexRepository LRU sizing: trace-driven cache simulation')
+    parser.add_argument('--users', type=int, default=50, help='Simulated users, one device each (default: 50)')
+    parser.add_argument('--days', type=int, default=7, help='Simulated days (default: 7)')
+    parser.add_argument('--sizes', default='250,500,1000,2000,2401,3000,4000',
+                        help='Comma-separated maxCacheSize values (default: 250,500,1000,2000,2401,3000,4000)')
+    parser.add_argument('--densities', default='0.1,0.25,0.5,0.75,1.0',
+                        help='Comma-separated shares of province cells in the snapshot (default: 0.1,0.25,0.5,0.75,1.0)')
+    parser.add_argument('--sessions', type=int, default=3, help='App sessions per user per day (default: 3)')
+    parser.add_argument('--pans', type=int, default=8, help='Map views rendered per session (default: 8)')
+    parser.add_argument('--view-mix', default='0.6,0.25,0.15',
+                        help='Zone, district, province view weights (default: 0.6,0.25,0.15)')
+    parser.add_argument('--away', type=float, default=0.05,
+                        help='Share of runs starting outside the home province (default: 0.05)')
+    parser.add_argument('--target', type=float, default=0.001,
+                        help='Acceptable lost-color share when recommending a size (default: 0.001)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    args = parser.parse_args()
+
+    sizes = [int(x) for x in args.sizes.split(',')]
+    densities = [float(x) for x in args.densities.split(',')]
+    geo = Geography()
+    runs = simulated_runs(args.users, args.days, args.seed)
+    n_runs = sum(len(r) for r in runs.values())
+    print(f"Province {geo.province}: {len(geo.cells):,} Res-9 cells; {args.users} users x {args.days} days, "
+          f"{n_runs:,} runs", file=sys.stderr)
+
+    user_days = args.users * args.days
+    print(f"\n{'density':>7} {'size':>6} {'hit rate':>9} {'lost color':>10} {'evict/day':>9} {'overlay ev':>10} "
+          f"{'dominance':>9} {'peak':>6} {'memory':>9}")
+    for density in densities:
+        t0 = time.perf_counter()
+        traces = build_traces(geo, runs, args, density, args.seed)
+        recommended = None
+        for size in sizes:
+            r = replay(traces, size, geo, user_days)
+            if recommended is None and r['lost'] <= args.target:
+                recommended = size
+            print(f"{density:>7.0%} {size:>6,} {r['hit_rate']:>9.2%} {r['lost']:>10.3%} {r['evictions']:>9.1f} "
+                  f"{r['overlay_evictions']:>10.2f} {r['dominance_miss']:>9.2%} {r['peak']:>6,} "
+                  f"{r['memory_kb']:>7.0f}kB", flush=True)
+        rec = f"{recommended:,}" if recommended else f"none of {args.sizes}"
+        print(f"        smallest size with lost color <= {args.target:.2%}: {rec} "
+              f"({time.perf_counter() - t0:.1f}s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+RunStrict hex_flip_queue Worker (local stand-in for the pg_cron job)
+
+In buffered mode (20260308000007_buffered_hexes_updates.sql) finalize_run()
+appends each run's hex path to hex_flip_queue instead of upserting hexes.
+In production, pg_cron calls apply_hex_flip_queue() every 10 seconds. This
+worker does the same against a local database, where pg_cron is usually
+not installed.
+
+Every --interval seconds it calls apply_hex_flip_queue(--batch-size) until a
+batch comes back short, so a backlog is drained within one tick. Each tick
+that applied something is logged to stderr.
+
+Usage:
+    python3 hex_flip_worker.py                        # every 10s until Ctrl-C
+    python3 hex_flip_worker.py --interval 2 --batch-size 1000
+    python3 hex_flip_worker.py --enable               # switch finalize_run() to buffered mode first
+    python3 hex_flip_worker.py --once --disable       # drain the queue, back to inline upserts
+    python3 hex_flip_worker.py --dsn postgresql://...
+
+Requires: pip install psycopg2-binary
+"""
+
+import argparse
+import sys
+import threading
+import time
+
+import simulate_day as sim
+
+SET_MODE_SQL = "UPDATE public.hex_flip_queue_meta SET buffered = %s"
+
+
+class HexFlipWorker(threading.Thread):
+    """Applies hex_flip_queue every `interval` seconds until stopped."""
+
+    def __init__(self, dsn, interval=10.0, batch_size=5000, verbose=False):
+        super().__init__(daemon=True)
+        self.conn = sim.get_db_connection(dsn)
+        self.conn.autocommit = True
+        self.interval = interval
+        self.batch_size = batch_size or None   # 0 / None = whole queue in one call
+        self.verbose = verbose
+        self.stop = threading.Event()
+        self.ticks = []   # (runs, hexes, seconds) per tick that applied something
+
+    def drain(self):
+        """Apply batches until the queue is empty. Returns (runs, hexes) applied."""
+        cur = self.conn.cursor()
+        runs = hexes = 0
+        t0 = time.perf_counter()
+        while True:
+            cur.execute("SELECT public.apply_hex_flip_queue(%s)", (self.batch_size,))
+            r = cur.fetchone()[0]
+            if r['mode'] == 'skipped':
+                break
+            runs += r['runs']
+            hexes += r['hexes']
+            if self.batch_size is None or r['runs'] < self.batch_size:
+                break
+        if runs:
+            elapsed = time.perf_counter() - t0
+            self.ticks.append((runs, hexes, elapsed))
+            if self.verbose:
+                print(f"  applied {runs:,} runs -> {hexes:,} hexes ({elapsed * 1000:.0f}ms)", file=sys.stderr)
+        return runs, hexes
+
+    def run(self):
+        while not self.stop.wait(self.interval):
+            self.drain()
+
+    def close(self):
+        self.stop.set()
+        if self.is_alive():
+            self.join()
+        self.drain()
+        self.conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Apply hex_flip_queue on a timer (local pg_cron stand-in)')
+    parser.add_argument('--dsn', default=sim.LOCAL_DB_DSN, help='Postgres DSN (default: local supabase / $SIM_DB_DSN)')
+    parser.add_argument('--interval', type=float, default=10, help='Seconds between ticks (default: 10)')
+    parser.add_argument('--batch-size', type=int, default=5000,
+                        help='Runs per apply_hex_flip_queue() call, 0 = all (default: 5000)')
+    parser.add_argument('--once', action='store_true', help='Drain the queue once and exit')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--enable', action='store_true', help='Set buffered mode before starting')
+    mode.add_argument('--disable', action='store_true', help='Set inline mode (after draining when --once)')
+    args = parser.parse_args()
+
+    if sim.psycopg2 is None:
+        print("ERROR: psycopg2 required. Install with: pip install psycopg2-binary", file=sys.stderr)
+        sys.exit(1)
+
+    worker = HexFlipWorker(args.dsn, args.interval, args.batch_size, verbose=True)
+    cur = worker.conn.cursor()
+    cur.execute("SELECT to_regproc('public.apply_hex_flip_queue')")
+    if cur.fetchone()[0] is None:
+        print("ERROR: apply 20260308000007_buffered_hexes_updates.sql first", file=sys.stderr)
+        sys.exit(1)
+    if args.enable:
+        cur.execute(SET_MODE_SQL, (True,))
+        print("finalize_run(): buffered mode", file=sys.stderr)
+
+    if args.once:
+        runs, hexes = worker.drain()
+        print(f"Drained {runs:,} runs -> {hexes:,} hexes", file=sys.stderr)
+    else:
+        print(f"Applying hex_flip_queue every {args.interval:g}s (Ctrl-C to stop)", file=sys.stderr)
+        try:
+            worker.run()
+        except KeyboardInterrupt:
+            pass
+        worker.drain()
+
+    # Inline mode only after the last drain, so no queued run is left behind
+    if args.disable:
+        cur.execute(SET_MODE_SQL, (False,))
+        print("finalize_run(): inline mode", file=sys.stderr)
+    worker.conn.close()
+
+
+if __name__ == '__main__':
+    main()
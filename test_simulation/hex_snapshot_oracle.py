@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+RunStrict Hex Snapshot Oracle
+
+Reference implementation of the midnight hex_snapshot build (docs §5.3):
+  snapshot(D + 1) = snapshot(D) + every run whose end_time falls on GMT+2
+  date D, with the latest end_time winning per hex.
+
+A season's runs come in as flat arrays (CSR hex paths). They are sorted
+once by (hex, end_time, run), the last entry per (hex, GMT+2 day) is taken,
+and the result is a per-day diff: the hexes touched that day with their new
+team, end_time and previous team. Full snapshots are reconstructed by
+replaying diffs. Runs with equal end_time on the same hex tie-break on run
+order (later run wins).
+
+This is the trusted answer for snapshot-build optimizations:
+bench_hex_snapshot.py runs the equivalent SQL against Postgres and diffs it
+against this module, and --simulate checks how far simulate_day's live-order
+snapshot drifts from it.
+
+Usage:
+    python3 hex_snapshot_oracle.py --synthetic --hexes 1000000 --runs-per-day 100000 --days 5
+    python3 hex_snapshot_oracle.py --simulate --days 10 --users 500   # vs simulate_day's snapshot
+
+Requires: pip install numpy (h3 for --simulate)
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+TEAMS = ('red', 'blue', 'purple')
+TEAM_INDEX = {t: i for i, t in enumerate(TEAMS)}
+NEUTRAL = -1
+DAY_SECONDS = 86400
+GMT2_OFFSET = 2 * 3600
+
+
+def gmt2_day(epoch_seconds):
+    """GMT+2 calendar day number (days since 1970-01-01) of a UTC epoch time."""
+    return (np.asarray(epoch_seconds, dtype=np.int64) + GMT2_OFFSET) // DAY_SECONDS
+
+
+def day_to_date(day):
+    return datetime.fromtimestamp(int(day) * DAY_SECONDS, tz=timezone.utc).date()
+
+
+# ==================== Inputs ====================
+
+def runs_to_arrays(runs, vocab=None):
+    """Simulator/run dicts (hex_path, end_time, team_at_run) -> season arrays.
+
+    vocab maps hex id -> int and is extended in place, so several calls can
+    share one index space. Returns (arrays, vocab).
+    """
+    vocab = {} if vocab is None else vocab
+    offsets = [0]
+    hexes = []
+    end_time = []
+    team = []
+    for r in runs:
+        hexes.extend(vocab.setdefault(h, len(vocab)) for h in r['hex_path'])
+        offsets.append(len(hexes))
+        end = r['end_time']
+        if isinstance(end, str):
+            end = datetime.strptime(end, '%Y-%m-%d %H:%M:%S+00').replace(tzinfo=timezone.utc)
+        end_time.append(int(end.timestamp()) if isinstance(end, datetime) else int(end))
+        team.append(TEAM_INDEX[r['team_at_run']])
+    return {
+        'offsets': np.array(offsets, dtype=np.int64),
+        'hexes': np.array(hexes, dtype=np.int64),
+        'end_time': np.array(end_time, dtype=np.int64),
+        'team': np.array(team, dtype=np.int8),
+    }, vocab
+
+
+def concat_arrays(parts):
+    """Join season arrays built day by day (same hex index space)."""
+    offsets = [np.zeros(1, dtype=np.int64)]
+    base = 0
+    for p in parts:
+        offsets.append(p['offsets'][1:] + base)
+        base += p['offsets'][-1]
+    return {
+        'offsets': np.concatenate(offsets),
+        'hexes': np.concatenate([p['hexes'] for p in parts]),
+        'end_time': np.concatenate([p['end_time'] for p in parts]),
+        'team': np.concatenate([p['team'] for p in parts]),
+    }
+
+
+def synthetic_season(n_hexes, runs_per_day, days, seed=42, first_day=None, path_len=(3, 25)):
+    """Random season with local paths (consecutive hex indices) and end times spread over the GMT+2 day."""
+    rng = np.random.default_rng(seed)
+    first_day = int(gmt2_day(time.time())) - days if first_day is None else first_day
+    n_runs = runs_per_day * days
+    run_day = first_day + np.repeat(np.arange(days), runs_per_day)
+    # Sorted: runs reach the server roughly in end_time order
+    end_time = np.sort(run_day * DAY_SECONDS - GMT2_OFFSET + rng.integers(0, DAY_SECONDS, size=n_runs))
+    lengths = rng.integers(path_len[0], path_len[1] + 1, size=n_runs)
+    offsets = np.r_[0, np.cumsum(lengths)].astype(np.int64)
+    starts = rng.integers(0, n_hexes, size=n_runs)
+    step = np.arange(offsets[-1]) - np.repeat(offsets[:-1], lengths)
+    return {
+        'offsets': offsets,
+        'hexes': ((np.repeat(starts, lengths) + step) % n_hexes).astype(np.int64),
+        'end_time': end_time.astype(np.int64),
+        'team': rng.integers(0, 3, size=n_runs).astype(np.int8),
+    }
+
+
+# ==================== Build ====================
+
+def build_snapshot_diffs(arrays, n_hexes, initial=None):
+    """Per-GMT+2-day diffs for a season.
+
+    initial: optional {'team': int8[n_hexes], 'end_time': int64[n_hexes]} (the
+    snapshot in force before the first run). Returns a dict:
+      days          run days present (snapshot_date = day + 1)
+      day_offsets   diff rows for days[i] are [day_offsets[i], day_offsets[i + 1])
+      hex, team, end_time, prev_team   one row per hex touched that day
+    """
+    offsets = arrays['offsets']
+    lengths = np.diff(offsets)
+    run_of = np.repeat(np.arange(len(lengths)), lengths)
+    hexes = arrays['hexes']
+    end = arrays['end_time'][run_of]
+    day = gmt2_day(end)
+
+    # One sort: hex, then end_time, then run order (later run wins ties)
+    order = np.lexsort((run_of, end, hexes))
+    h = hexes[order]
+    d = day[order]
+    last = np.r_[(h[1:] != h[:-1]) | (d[1:] != d[:-1]), True]
+    win = order[last]                      # winners, sorted by (hex, day)
+
+    win_hex = hexes[win]
+    win_team = arrays['team'][run_of[win]].astype(np.int8)
+    win_end = end[win]
+    win_day = day[win]
+
+    # Previous owner = previous winner of the same hex, else the initial snapshot
+    init_team = initial['team'] if initial is not None else np.full(n_hexes, NEUTRAL, dtype=np.int8)
+    same_hex = np.r_[False, win_hex[1:] == win_hex[:-1]]
+    prev_team = np.where(same_hex, np.r_[NEUTRAL, win_team[:-1]], init_team[win_hex]).astype(np.int8)
+
+    by_day = np.argsort(win_day, kind='stable')  # stays sorted by hex within a day
+    days, starts = np.unique(win_day[by_day], return_index=True)
+    return {
+        'days': days,
+        'day_offsets': np.r_[starts, len(by_day)].astype(np.int64),
+        'hex': win_hex[by_day],
+        'team': win_team[by_day],
+        'end_time': win_end[by_day],
+        'prev_team': prev_team[by_day],
+    }
+
+
+def day_diff(diffs, i):
+    """Diff rows for diffs['days'][i] as a dict of arrays (+ 'flipped' mask)."""
+    lo, hi = diffs['day_offsets'][i], diffs['day_offsets'][i + 1]
+    out = {k: diffs[k][lo:hi] for k in ('hex', 'team', 'end_time', 'prev_team')}
+    out['flipped'] = out['team'] != out['prev_team']
+    return out
+
+
+def iter_snapshots(diffs, n_hexes, initial=None, first_day=None, last_day=None):
+    """Yield (snapshot_day, team, end_time) for every snapshot date in range.
+
+    Days without runs still yield (the snapshot is rewritten unchanged).
+    The yielded arrays are reused between iterations; copy them to keep.
+    """
+    team = initial['team'].copy() if initial is not None else np.full(n_hexes, NEUTRAL, dtype=np.int8)
+    end = initial['end_time'].copy() if initial is not None else np.zeros(n_hexes, dtype=np.int64)
+    if not len(diffs['days']):
+        return
+    first_day = int(diffs['days'][0]) if first_day is None else first_day
+    last_day = int(diffs['days'][-1]) if last_day is None else last_day
+    pos = {int(d): i for i, d in enumerate(diffs['days'])}
+    for run_day in range(first_day, last_day + 1):
+        i = pos.get(run_day)
+        if i is not None:
+            lo, hi = diffs['day_offsets'][i], diffs['day_offsets'][i + 1]
+            team[diffs['hex'][lo:hi]] = diffs['team'][lo:hi]
+            end[diffs['hex'][lo:hi]] = diffs['end_time'][lo:hi]
+        yield run_day + 1, team, end
+
+
+def snapshot_rows(team, end):
+    """Owned hexes of a materialized snapshot as (hex, team, end_time) arrays sorted by hex."""
+    owned = np.nonzero(team != NEUTRAL)[0]
+    return owned, team[owned], end[owned]
+
+
+# ==================== Simulator Check ====================
+
+def check_simulator(days, users, seed, home_hex=None):
+    """Run simulate_day in memory and compare its per-day hex_teams with the oracle."""
+    import simulate_day as sim
+
+    home_hex = home_hex or sim.DEFAULT_HOME_HEX
+    same_hexes, other_hexes = sim.generate_hexes_from_home(home_hex)
+    state = sim.default_state()
+    state.update(seed=seed, home_hex=home_hex, same_hexes=same_hexes, other_hexes=other_hexes, total_days=days)
+    state['users'] = sim.generate_users(seed, same_hexes, other_hexes, users)
+
+    vocab = {}
+    parts = []
+    sim_states = []
+    for day in range(1, days + 1):
+        _, runs, hex_teams, _, _ = sim.simulate_day_step(state, day, days)
+        arrays, vocab = runs_to_arrays(runs, vocab)
+        parts.append(arrays)
+        sim_states.append((sim.run_date_for_day(day, days), dict(hex_teams)))
+
+    diffs = build_snapshot_diffs(concat_arrays(parts), len(vocab))
+    snaps = {}
+    for snap_day, team, _ in iter_snapshots(diffs, len(vocab)):
+        snaps[day_to_date(snap_day)] = team.copy()
+
+    ids = list(vocab)
+    report = []
+    for run_date, hex_teams in sim_states:
+        oracle_team = snaps.get(run_date + timedelta(days=1))
+        if oracle_team is None:
+            continue
+        sim_team = np.full(len(ids), NEUTRAL, dtype=np.int8)
+        for h, t in hex_teams.items():
+            sim_team[vocab[h]] = TEAM_INDEX[t]
+        owned = (sim_team != NEUTRAL) | (oracle_team != NEUTRAL)
+        report.append({
+            'run_date': str(run_date),
+            'hexes': int(owned.sum()),
+            'mismatched': int((sim_team != oracle_team).sum()),
+        })
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='RunStrict hex snapshot oracle')
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument('--synthetic', action='store_true', help='Time the oracle on a synthetic season')
+    mode.add_argument('--simulate', action='store_true', help="Compare simulate_day's snapshot against the oracle")
+    parser.add_argument('--hexes', type=int, default=1_000_000, help='Hex universe (synthetic, default: 1M)')
+    parser.add_argument('--runs-per-day', type=int, default=100_000, help='Runs per day (synthetic, default: 100k)')
+    parser.add_argument('--days', type=int, default=5, help='Days (default: 5)')
+    parser.add_argument('--users', type=int, default=100, help='Simulator users (--simulate, default: 100)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    args = parser.parse_args()
+
+    if args.simulate:
+        report = check_simulator(args.days, args.users, args.seed)
+        for r in report:
+            pct = r['mismatched'] / r['hexes'] * 100 if r['hexes'] else 0
+            print(f"  {r['run_date']}: {r['mismatched']:>5} / {r['hexes']:<5} hexes differ ({pct:.1f}%)")
+        return
+
+    t0 = time.perf_counter()
+    season = synthetic_season(args.hexes, args.runs_per_day, args.days, args.seed)
+    t1 = time.perf_counter()
+    diffs = build_snapshot_diffs(season, args.hexes)
+    t2 = time.perf_counter()
+    n_owned = 0
+    for snap_day, team, _ in iter_snapshots(diffs, args.hexes):
+        n_owned = int((team != NEUTRAL).sum())
+    t3 = time.perf_counter()
+
+    entries = len(season['hexes'])
+    print(f"Season: {len(season['end_time']):,} runs, {entries:,} hex entries ({t1 - t0:.2f}s to generate)",
+          file=sys.stderr)
+    print(f"Diffs:  {len(diffs['hex']):,} rows over {len(diffs['days'])} days in {t2 - t1:.2f}s "
+          f"({entries / (t2 - t1):,.0f} entries/s)", file=sys.stderr)
+    print(f"Replay: {t3 - t2:.2f}s; final snapshot {n_owned:,} hexes", file=sys.stderr)
+    for i, d in enumerate(diffs['days']):
+        dd = day_diff(diffs, i)
+        print(f"  {day_to_date(d + 1)}: {len(dd['hex']):,} touched, {int(dd['flipped'].sum()):,} flipped")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,615 @@
+#!/usr/bin/env python3
+"""
+RunStrict Index Advisor
+
+Replays a simulated season and the client traffic that goes with it against
+local Postgres, then checks the schema's indexes against the real query mix.
+
+  1. Season: days 1 .. N-1 of simulate_day. Each run goes through
+     finalize_run() (--writes rpc, default), or the simulator's bulk SQL
+     (--writes bulk). The midnight jobs follow: hex_snapshot,
+     calculate_daily_buffs(), refresh_leaderboard().
+     Every day, --sessions of the users open the app: launch sync, buff,
+     hex snapshot / delta fetch, yesterday stats, rankings, dominance,
+     leaderboards, own rank, run history.
+  2. Profile: pg_stat_statements (track = all, so statements inside the RPCs
+     are counted) gives the top --top statements by total time. Each one is
+     EXPLAINed with GENERIC_PLAN.
+  3. Advise: scans that filter rows a table has no index for become
+     candidate indexes. Equality columns come first, then the sort keys under
+     a LIMIT (or one range column). Constant predicates (IS NOT NULL, > 0)
+     make the index partial. Short output lists become INCLUDE columns so the
+     scan can be index-only. Candidates an existing index already covers are
+     dropped.
+  4. Measure: day N is replayed once without new indexes, then once per
+     candidate. Each replay runs in a transaction that is rolled back, so
+     every one starts from the same data. Reported:
+       - time of the statements the candidate came from
+       - read and write wall time
+       - WAL written by the writes (the write amplification)
+       - index size
+
+RPCs missing from the target database are listed and skipped. The tool
+wipes season data (run_history, hexes, hex_snapshot, daily stats) and
+creates simulator users, so point it at a disposable local database.
+Supabase's local Postgres preloads pg_stat_statements. GENERIC_PLAN needs
+Postgres 16+.
+
+Usage:
+    python3 index_advisor.py                                  # 1000 users, 10 days
+    python3 index_advisor.py --users 5000 --days 20 --top 15
+    python3 index_advisor.py --writes bulk --sessions 1.0     # simulator SQL instead of finalize_run()
+    python3 index_advisor.py --dsn postgresql://...
+
+Requires: pip install h3 psycopg2-binary
+"""
+
+import argparse
+import copy
+import json
+import random
+import re
+import statistics
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+
+import simulate_day as sim
+
+CLIENT_CALLS = (
+    ('app_launch_sync', "SELECT public.app_launch_sync(%(user_id)s, %(district_hex)s)"),
+    ('get_user_buff', "SELECT public.get_user_buff(%(user_id)s, %(district_hex)s)"),
+    ('get_hex_snapshot', "SELECT * FROM public.get_hex_snapshot(%(province_hex)s, %(snapshot_date)s)"),
+    ('get_hexes_delta', "SELECT * FROM public.get_hexes_delta(%(province_hex)s, %(since)s)"),
+    ('get_user_yesterday_stats', "SELECT public.get_user_yesterday_stats(%(user_id)s, %(yesterday)s)"),
+    ('get_team_rankings', "SELECT public.get_team_rankings(%(user_id)s, %(district_hex)s)"),
+    ('get_hex_dominance', "SELECT public.get_hex_dominance(%(province_hex)s)"),
+    ('get_leaderboard', "SELECT * FROM public.get_leaderboard(200)"),
+    ('get_scoped_leaderboard', "SELECT * FROM public.get_scoped_leaderboard(%(province_hex)s, 5, 100)"),
+    ('get_leaderboard_rank', "SELECT public.get_leaderboard_rank(%(user_id)s)"),
+    # PostgREST shape of SupabaseService.fetchRunHistory()
+    (None, "SELECT * FROM public.run_history WHERE user_id = %(user_id)s ORDER BY start_time DESC LIMIT 50 OFFSET 0"),
+)
+
+MIDNIGHT_JOBS = ('calculate_daily_buffs', 'refresh_leaderboard')
+
+FINALIZE_RUN_SQL = """
+SELECT public.finalize_run(
+  p_user_id := %s, p_start_time := %s, p_end_time := %s, p_distance_km := %s, p_duration_seconds := %s,
+  p_hex_path := %s, p_buff_multiplier := %s, p_cv := %s, p_client_points := %s,
+  p_hex_parents := %s, p_district_hex := %s, p_hex_district_parents := %s)
+"""
+
+CLEANUP_SQL = """
+DELETE FROM public.run_history;
+DELETE FROM public.daily_buff_stats;
+DELETE FROM public.daily_all_range_stats;
+DELETE FROM public.hexes;
+DELETE FROM public.hex_snapshot;
+DELETE FROM public.leaderboard_entries WHERE user_id::text LIKE 'aaaaaaaa-%';
+DELETE FROM public.leaderboard_dirty WHERE user_id::text LIKE 'aaaaaaaa-%';
+DELETE FROM public.users WHERE id::text LIKE 'aaaaaaaa-%';
+DELETE FROM auth.users WHERE id::text LIKE 'aaaaaaaa-%';
+"""
+
+# Statements that are only an RPC call, or not plannable
+SKIP_STATEMENT_RE = re.compile(
+    r"^\s*(SELECT\s+(\*\s+FROM\s+)?(public\.)?\w+\s*\([^()]*\)\s*$|"
+    r"(BEGIN|COMMIT|ROLLBACK|SAVEPOINT|RELEASE|SET|RESET|SHOW|CREATE|DROP|ALTER|ANALYZE|VACUUM|TRUNCATE|EXPLAIN)\b)",
+    re.I | re.S)
+
+SCAN_NODES = {'Seq Scan', 'Index Scan', 'Index Only Scan', 'Bitmap Heap Scan'}
+COLUMN_RE = r"(?:(\w+)\.)?(\w+)"
+MAX_COVERING_COLUMNS = 6
+
+
+# ==================== Workload ====================
+
+class Workload:
+    """simulate_day state plus the client sessions for each day, replayable."""
+
+    def __init__(self, users, days, sessions, writes, seed):
+        self.days = days
+        self.sessions = sessions
+        self.writes = writes
+        self.seed = seed
+        home_hex = sim.DEFAULT_HOME_HEX
+        same_hexes, other_hexes = sim.generate_hexes_from_home(home_hex)
+        self.state = sim.default_state()
+        self.state.update(seed=seed, home_hex=home_hex, same_hexes=same_hexes, other_hexes=other_hexes,
+                          total_days=days)
+        self.state['users'] = sim.generate_users(seed, same_hexes, other_hexes, users)
+        self.available = set()
+
+    def check_rpcs(self, cur):
+        """Which of the client / server RPCs exist in this database."""
+        names = {n for n, _ in CLIENT_CALLS if n} | set(MIDNIGHT_JOBS) | {'finalize_run'}
+        cur.execute("SELECT DISTINCT proname FROM pg_proc WHERE pronamespace = 'public'::regnamespace "
+                    "AND proname = ANY(%s)", (sorted(names),))
+        self.available = {r[0] for r in cur.fetchall()}
+        return sorted(names - self.available)
+
+    def load_users(self, cur):
+        cur.execute(sim.sql_auth_users_insert(self.state['users']))
+        cur.execute(sim.sql_users_insert(self.state['users']))
+
+    def writes_for_day(self, cur, state, day):
+        """One day of server writes: runs, then the midnight jobs. Returns WAL bytes written."""
+        cur.execute("SELECT pg_current_wal_insert_lsn()")
+        lsn0 = cur.fetchone()[0]
+        defectors, runs, hex_teams, _, _ = sim.simulate_day_step(state, day, self.days)
+        run_date_str = sim.run_date_for_day(day, self.days).strftime('%Y-%m-%d')
+        if defectors:
+            cur.execute(sim.sql_defections(defectors))
+
+        if self.writes == 'rpc':
+            district = {u['id']: sim.h3.cell_to_parent(u['home_hex'], sim.CITY_RESOLUTION) for u in state['users']}
+            for run in sorted(runs, key=lambda r: r['end_time']):
+                path = run['hex_path']
+                cur.execute(FINALIZE_RUN_SQL, (
+                    run['user_id'], run['start_time'], run['end_time'], run['distance_km'],
+                    run['duration_seconds'], path, run['buff_multiplier'], run['cv'], run['flip_points'],
+                    [sim.h3.cell_to_parent(h, sim.ALL_RESOLUTION) for h in path], district[run['user_id']],
+                    [sim.h3.cell_to_parent(h, sim.CITY_RESOLUTION) for h in path]))
+            sections = [sim.sql_hex_snapshot_insert(hex_teams, run_date_str)]
+        else:
+            # Daily stats are left to calculate_daily_buffs(), as in production
+            sections = [sim.sql_runs_insert(runs), sim.sql_hexes_upsert(hex_teams),
+                        sim.sql_hex_snapshot_insert(hex_teams, run_date_str), sim.sql_user_points_update(state)]
+        jobs = [j for j in MIDNIGHT_JOBS if j in self.available]
+        for sql in sections:
+            if sql.strip() and not sql.startswith('--'):
+                cur.execute(sql)
+        for job in jobs:
+            cur.execute(f"SELECT public.{job}()")
+
+        cur.execute("SELECT pg_wal_lsn_diff(pg_current_wal_insert_lsn(), %s)", (lsn0,))
+        return int(cur.fetchone()[0])
+
+    def reads_for_day(self, cur, state, day):
+        """Client sessions opening the app after the given day."""
+        rng = random.Random(self.seed * 1000 + day)
+        users = [u for u in state['users'] if not u.get('is_real_user')]
+        run_date = sim.run_date_for_day(day, self.days)
+        since = datetime(run_date.year, run_date.month, run_date.day, tzinfo=timezone.utc)
+        calls = [(name, sql) for name, sql in CLIENT_CALLS if name is None or name in self.available]
+        for user in rng.sample(users, int(len(users) * min(self.sessions, 1.0))):
+            params = {
+                'user_id': user['id'],
+                'district_hex': sim.h3.cell_to_parent(user['home_hex'], sim.CITY_RESOLUTION),
+                'province_hex': sim.h3.cell_to_parent(user['home_hex'], sim.ALL_RESOLUTION),
+                'snapshot_date': run_date + timedelta(days=1),
+                'yesterday': run_date,
+                'since': since,
+            }
+            for _, sql in calls:
+                cur.execute(sql, params)
+                cur.fetchall()
+
+
+def replay_season(conn, workload):
+    """Days 1 .. N-1, committed day by day."""
+    cur = conn.cursor()
+    workload.load_users(cur)
+    conn.commit()
+    for day in range(1, workload.days):
+        t0 = time.perf_counter()
+        workload.writes_for_day(cur, workload.state, day)
+        conn.commit()
+        workload.reads_for_day(cur, workload.state, day)
+        conn.commit()
+        print(f"  day {day}/{workload.days - 1}: {time.perf_counter() - t0:.1f}s", file=sys.stderr)
+    cur.execute("ANALYZE")
+    conn.commit()
+
+
+# ==================== pg_stat_statements ====================
+
+def stat_statements_schema(cur):
+    cur.execute("SELECT extnamespace::regnamespace::text FROM pg_extension WHERE extname = 'pg_stat_statements'")
+    row = cur.fetchone()
+    return row[0] if row else None
+
+
+def statement_stats(cur, schema):
+    """{queryid: {...}} for this database since the last reset."""
+    cur.execute(f"""
+        SELECT queryid, query, toplevel, calls, total_exec_time, rows, wal_bytes
+        FROM {schema}.pg_stat_statements
+        WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database())
+    """)
+    stats = {}
+    for queryid, query, toplevel, calls, total, rows, wal in cur.fetchall():
+        s = stats.setdefault(queryid, {'query': query, 'toplevel': toplevel, 'calls': 0, 'total_ms': 0.0,
+                                       'rows': 0, 'wal_bytes': 0})
+        s['calls'] += calls
+        s['total_ms'] += total
+        s['rows'] += rows
+        s['wal_bytes'] += int(wal)
+    return stats
+
+
+def top_statements(stats, n):
+    """The n statements with the most total time, skipping RPC wrappers and utility statements."""
+    rows = [dict(s, queryid=q) for q, s in stats.items() if not SKIP_STATEMENT_RE.match(s['query'])]
+    rows.sort(key=lambda s: s['total_ms'], reverse=True)
+    return rows[:n]
+
+
+# ==================== Advise ====================
+
+def explain(cur, query):
+    """Generic plan (JSON, VERBOSE) of a normalized statement, or None if it can't be planned here."""
+    cur.execute("SAVEPOINT advisor_explain")
+    try:
+        cur.execute("EXPLAIN (GENERIC_PLAN, VERBOSE, FORMAT JSON) " + query)
+        plan = cur.fetchone()[0]
+        cur.execute("RELEASE SAVEPOINT advisor_explain")
+        return (plan if isinstance(plan, list) else json.loads(plan))[0]['Plan']
+    except sim.psycopg2.Error:
+        cur.execute("ROLLBACK TO SAVEPOINT advisor_explain")
+        return None
+
+
+def walk(node, ancestors=()):
+    yield node, ancestors
+    for child in node.get('Plans', []):
+        yield from walk(child, ancestors + (node,))
+
+
+def plan_summary(plan):
+    """'Seq Scan on users, Index Scan on hexes' — the scans a plan does."""
+    scans = []
+    for node, _ in walk(plan):
+        if node['Node Type'] in SCAN_NODES and 'Relation Name' in node:
+            scans.append(f"{node['Node Type']} on {node['Relation Name']}")
+    return ', '.join(dict.fromkeys(scans)) or plan['Node Type']
+
+
+def strip_parens(expr):
+    expr = expr.strip()
+    while expr.startswith('(') and expr.endswith(')'):
+        depth = 0
+        for i, ch in enumerate(expr):
+            depth += (ch == '(') - (ch == ')')
+            if depth == 0 and i < len(expr) - 1:
+                return expr
+        expr = expr[1:-1].strip()
+    return expr
+
+
+def conjuncts(expr):
+    """Top-level AND terms of a plan condition ([] if it has a top-level OR)."""
+    expr = strip_parens(expr)
+    terms, depth, start = [], 0, 0
+    for i, ch in enumerate(expr):
+        depth += (ch == '(') - (ch == ')')
+        if depth == 0 and expr.startswith(' OR ', i):
+            return []
+        if depth == 0 and expr.startswith(' AND ', i):
+            terms.append(expr[start:i])
+            start = i + 5
+    terms.append(expr[start:])
+    return [strip_parens(t) for t in terms]
+
+
+def classify(term, alias):
+    """(kind, column, predicate) for one condition on `alias`; kind is eq / range / const, or None."""
+    m = re.fullmatch(COLUMN_RE + r" IS (NOT )?NULL", term)
+    if m and m.group(1) in (None, alias):
+        return 'const', m.group(2), f"{m.group(2)} IS {m.group(3) or ''}NULL"
+    m = re.fullmatch(COLUMN_RE + r" (=|<|<=|>|>=) (.+)", term, re.S)
+    if not m or m.group(1) not in (None, alias):
+        return None, None, None
+    column, op, rhs = m.group(2), m.group(3), m.group(4)
+    if re.search(rf"\b{re.escape(alias)}\.\w+", rhs):
+        return None, None, None
+    constant = '$' not in rhs and not re.search(r"\b[A-Za-z_]\w*\.[A-Za-z_]\w*", rhs)
+    if op == '=':
+        return 'eq', column, None
+    if constant:
+        return 'const', column, f"{column} {op} {rhs}"
+    return 'range', column, None
+
+
+def sort_keys(node, ancestors, alias):
+    """Sort keys on this scan's columns, if the scan feeds a Sort under a Limit with no join between."""
+    keys, sort = [], None
+    for parent in reversed(ancestors):
+        if parent['Node Type'] in ('Sort', 'Incremental Sort'):
+            sort = parent
+        elif parent['Node Type'] == 'Limit' and sort is not None:
+            for key in sort.get('Sort Key', []):
+                m = re.fullmatch(COLUMN_RE + r"( DESC)?( NULLS (FIRST|LAST))?", key.strip())
+                # Under an Append the sort names the parent (run_history), the scans its partitions (run_history_1)
+                if not m or m.group(1) not in (None, alias, re.sub(r"_\d+$", '', alias)):
+                    return []
+                keys.append(m.group(2) + (m.group(3) or ''))
+            return keys
+        elif parent['Node Type'] not in ('Append', 'Merge Append', 'Result', 'Subquery Scan', 'Gather',
+                                         'Gather Merge', 'Materialize'):
+            return []
+    return []
+
+
+def output_columns(node, alias):
+    """Plain columns the scan returns, or None if it returns expressions or whole rows."""
+    cols = []
+    for item in node.get('Output', []):
+        m = re.fullmatch(COLUMN_RE, item.strip())
+        if not m or m.group(1) not in (None, alias):
+            return None
+        cols.append(m.group(2))
+    return list(dict.fromkeys(cols))
+
+
+def candidate_for_scan(node, ancestors):
+    """Index suggestion {table, key, include, where} for one scan node, or None."""
+    alias = node.get('Alias', node['Relation Name'])
+    conds = conjuncts(node.get('Filter', '')) if node.get('Filter') else []
+    index_cond = node.get('Index Cond') or node.get('Recheck Cond')
+    order = sort_keys(node, ancestors, alias)
+    if not conds and not order and node['Node Type'] != 'Seq Scan':
+        return None  # already an index path, nothing filtered or sorted after it
+    eq, ranges, preds = [], [], []
+    for term in (conjuncts(index_cond) if index_cond else []) + conds:
+        kind, column, pred = classify(term, alias)
+        if kind == 'eq' and column not in eq:
+            eq.append(column)
+        elif kind == 'range' and column not in ranges:
+            ranges.append(column)
+        elif kind == 'const':
+            preds.append(pred)
+    order = [k for k in order if k.split()[0] not in eq]
+    key = eq + (order or ranges[:1])
+    if not key:
+        return None
+    include = []
+    out = output_columns(node, alias)
+    if out and len(out) <= MAX_COVERING_COLUMNS:
+        key_cols = {k.split()[0] for k in key}
+        include = [c for c in out if c not in key_cols]
+    return {'table': node['Relation Name'], 'key': key, 'include': include, 'where': ' AND '.join(preds) or None}
+
+
+class Catalog:
+    """Root tables of partitions and the indexes that already exist."""
+
+    def __init__(self, cur):
+        cur.execute("""
+            WITH RECURSIVE up(child, root) AS (
+              SELECT c.oid, c.oid FROM pg_class c WHERE c.relkind IN ('r', 'p')
+              UNION ALL
+              SELECT up.child, i.inhparent FROM up JOIN pg_inherits i ON i.inhrelid = up.root
+            )
+            SELECT c.relname, r.relname, rn.nspname, c.relpersistence
+            FROM up
+            JOIN pg_class c ON c.oid = up.child
+            JOIN pg_class r ON r.oid = up.root
+            JOIN pg_namespace rn ON rn.oid = r.relnamespace
+            WHERE NOT EXISTS (SELECT 1 FROM pg_inherits i WHERE i.inhrelid = up.root)
+        """)
+        self.root, self.persistent = {}, set()
+        for child, root, schema, persistence in cur.fetchall():
+            if schema == 'public':
+                self.root[child] = root
+                if persistence == 'p':
+                    self.persistent.add(root)
+        cur.execute("""
+            SELECT t.relname,
+                   ARRAY(SELECT a.attname || CASE WHEN i.indoption[k] & 1 = 1 THEN ' DESC' ELSE '' END
+                         FROM generate_subscripts(i.indkey, 1) k
+                         LEFT JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = i.indkey[k]
+                         WHERE k < i.indnkeyatts ORDER BY k),
+                   ARRAY(SELECT a.attname FROM generate_subscripts(i.indkey, 1) k
+                         JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = i.indkey[k]
+                         WHERE k >= i.indnkeyatts ORDER BY k),
+                   pg_get_expr(i.indpred, i.indrelid), i.indisunique
+            FROM pg_index i
+            JOIN pg_class t ON t.oid = i.indrelid
+            WHERE t.relnamespace = 'public'::regnamespace AND t.relkind IN ('r', 'p')
+        """)
+        self.indexes = defaultdict(list)
+        for table, key, include, pred, unique in cur.fetchall():
+            self.indexes[table].append({'key': [k or '?' for k in key], 'include': include, 'where': pred,
+                                        'unique': unique})
+
+    def covered(self, cand):
+        """True if an existing index already serves this candidate."""
+        key = [k.split()[0] for k in cand['key']]
+        for idx in self.indexes[cand['table']]:
+            idx_key = [k.split()[0] for k in idx['key']]
+            if idx['unique'] and idx['where'] is None and set(idx_key) <= set(key):
+                return True  # point lookup; covering it saves one heap fetch
+            if idx_key[:len(key)] != key:
+                continue
+            have = set(idx_key) | set(idx['include'])
+            if set(cand['include']) <= have and (idx['where'] is None or cand['where'] is not None):
+                return True
+        return False
+
+
+def index_ddl(cand):
+    name = 'idx_advisor_' + cand['table'] + '_' + '_'.join(k.split()[0] for k in cand['key'])
+    ddl = f"CREATE INDEX {name[:63]} ON public.{cand['table']} ({', '.join(cand['key'])})"
+    if cand['include']:
+        ddl += f" INCLUDE ({', '.join(cand['include'])})"
+    if cand['where']:
+        ddl += f" WHERE {cand['where']}"
+    return ddl
+
+
+def advise(cur, statements, min_rows):
+    """Explain each statement and collect candidate indexes ({ddl: candidate with its source queryids})."""
+    catalog = Catalog(cur)
+    cur.execute("SELECT relname, reltuples FROM pg_class WHERE relnamespace = 'public'::regnamespace")
+    tuples = dict(cur.fetchall())
+    candidates = {}
+    for s in statements:
+        plan = explain(cur, s['query'])
+        s['plan'] = plan_summary(plan) if plan else 'not explainable here'
+        if plan is None:
+            continue
+        for node, ancestors in walk(plan):
+            if node['Node Type'] not in SCAN_NODES or 'Relation Name' not in node:
+                continue
+            if node['Node Type'] == 'Seq Scan' and tuples.get(node['Relation Name'], 0) < min_rows:
+                continue
+            cand = candidate_for_scan(node, ancestors)
+            if cand is None:
+                continue
+            cand['table'] = catalog.root.get(cand['table'], cand['table'])
+            if cand['table'] not in catalog.persistent or catalog.covered(cand):
+                continue
+            entry = candidates.setdefault(index_ddl(cand), dict(cand, sources=[]))
+            entry['sources'].append(s['queryid'])
+    cur.connection.rollback()
+    return candidates
+
+
+# ==================== Measure ====================
+
+def trial(conn, workload, schema, ddl=None):
+    """Replay day N inside a rolled-back transaction, with one extra index if ddl is given."""
+    cur = conn.cursor()
+    result = {'ddl': ddl, 'size': 0}
+    if ddl:
+        cur.execute(ddl)
+        cur.execute(f"ANALYZE {ddl.split(' ON ')[1].split()[0]}")
+    if schema:
+        cur.execute(f"SELECT {schema}.pg_stat_statements_reset()")
+    state = copy.deepcopy(workload.state)
+    t0 = time.perf_counter()
+    result['wal_bytes'] = workload.writes_for_day(cur, state, workload.days)
+    t1 = time.perf_counter()
+    workload.reads_for_day(cur, state, workload.days)
+    t2 = time.perf_counter()
+    result['write_ms'] = (t1 - t0) * 1000
+    result['read_ms'] = (t2 - t1) * 1000
+    result['stats'] = statement_stats(cur, schema) if schema else {}
+    if ddl:
+        # Partitioned: the parent index is empty, its partitions hold the data
+        cur.execute("SELECT COALESCE((SELECT sum(pg_relation_size(relid)) FROM pg_partition_tree(%(i)s::regclass)), "
+                    "pg_relation_size(%(i)s::regclass))", {'i': ddl.split()[2]})
+        result['size'] = int(cur.fetchone()[0])
+    conn.rollback()
+    return result
+
+
+def measure(conn, workload, schema, ddl, repeat):
+    """Median wall time / WAL over `repeat` trials; statement times are averaged."""
+    trials = [trial(conn, workload, schema, ddl) for _ in range(repeat)]
+    result = {k: statistics.median(t[k] for t in trials) for k in ('write_ms', 'read_ms', 'wal_bytes')}
+    result['size'] = trials[-1]['size']
+    result['statement_ms'] = defaultdict(float)
+    for t in trials:
+        for queryid, s in t['stats'].items():
+            result['statement_ms'][queryid] += s['total_ms'] / repeat
+    return result
+
+
+def source_ms(result, queryids):
+    return sum(result['statement_ms'].get(q, 0.0) for q in queryids)
+
+
+def pct(new, old):
+    return (new - old) / old * 100 if old else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Suggest and measure indexes for the simulated RunStrict workload')
+    parser.add_argument('--dsn', default=sim.LOCAL_DB_DSN, help='Postgres DSN (default: local supabase / $SIM_DB_DSN)')
+    parser.add_argument('--users', type=int, default=1000, help='Simulator users (default: 1000)')
+    parser.add_argument('--days', type=int, default=10, help='Season days; the last one is the measured day (default: 10)')
+    parser.add_argument('--sessions', type=float, default=0.5,
+                        help='Share of users opening the app each day (default: 0.5)')
+    parser.add_argument('--writes', choices=['rpc', 'bulk'], default='rpc',
+                        help="Runs through finalize_run() (default) or simulate_day's bulk SQL")
+    parser.add_argument('--top', type=int, default=10, help='Statements to EXPLAIN (default: 10)')
+    parser.add_argument('--min-rows', type=int, default=1000,
+                        help='Ignore sequential scans of tables smaller than this (default: 1000)')
+    parser.add_argument('--repeat', type=int, default=3, help='Measured replays per index (default: 3)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    args = parser.parse_args()
+
+    if args.days < 2:
+        parser.error("--days must be at least 2 (the last day is the measured day)")
+    if sim.psycopg2 is None:
+        print("ERROR: psycopg2 required. Install with: pip install psycopg2-binary", file=sys.stderr)
+        sys.exit(1)
+
+    conn = sim.get_db_connection(args.dsn)
+    cur = conn.cursor()
+    cur.execute("SHOW server_version_num")
+    if int(cur.fetchone()[0]) < 160000:
+        print("ERROR: EXPLAIN (GENERIC_PLAN) needs Postgres 16 or later", file=sys.stderr)
+        sys.exit(1)
+    schema = stat_statements_schema(cur)
+    if schema is None:
+        print("ERROR: pg_stat_statements is not installed. Add it to shared_preload_libraries and run "
+              "CREATE EXTENSION pg_stat_statements (supabase start has both).", file=sys.stderr)
+        sys.exit(1)
+    try:
+        cur.execute("SET pg_stat_statements.track = 'all'")
+    except sim.psycopg2.Error:
+        conn.rollback()
+        print("WARNING: cannot SET pg_stat_statements.track = 'all'; statements inside RPCs will not be "
+              "profiled. Set it in postgresql.conf.", file=sys.stderr)
+
+    workload = Workload(args.users, args.days, args.sessions, args.writes, args.seed)
+    missing = workload.check_rpcs(cur)
+    if args.writes == 'rpc' and 'finalize_run' in missing:
+        print("ERROR: finalize_run() is missing; apply the migrations or use --writes bulk", file=sys.stderr)
+        sys.exit(1)
+    if missing:
+        print(f"Skipping RPCs missing from this database: {', '.join(missing)}", file=sys.stderr)
+
+    try:
+        cur.execute(CLEANUP_SQL)
+        cur.execute(f"SELECT {schema}.pg_stat_statements_reset()")
+        conn.commit()
+
+        print(f"Replaying {args.days - 1} days, {args.users:,} users, writes via {args.writes}...", file=sys.stderr)
+        replay_season(conn, workload)
+        stats = statement_stats(cur, schema)
+        top = top_statements(stats, args.top)
+        conn.rollback()
+        candidates = advise(cur, top, args.min_rows)
+
+        print(f"\nTop {len(top)} statements by total time (season replay):")
+        print(f"{'#':>3} {'calls':>8} {'total':>10} {'mean':>9}  statement / plan")
+        for i, s in enumerate(top, 1):
+            text = ' '.join(s['query'].split())
+            print(f"{i:>3} {s['calls']:>8,} {s['total_ms']:>8,.0f}ms {s['total_ms'] / s['calls']:>7.2f}ms  {text[:90]}")
+            print(f"{'':>33}-> {s['plan']}")
+
+        if not candidates:
+            print("\nNo candidate indexes: every top statement already has an index path.")
+            return
+
+        print(f"\nMeasuring day {args.days}: baseline + {len(candidates)} candidate(s)...", file=sys.stderr)
+        trial(conn, workload, schema)  # warm-up
+        base = measure(conn, workload, schema, None, args.repeat)
+        rank = {s['queryid']: i for i, s in enumerate(top, 1)}
+        print(f"\nBaseline day {args.days}: writes {base['write_ms']:,.0f}ms "
+              f"({base['wal_bytes'] / 1e6:,.1f} MB WAL), reads {base['read_ms']:,.0f}ms")
+        print("\nCandidates (change vs baseline; statements = the top statements the index came from,\n"
+              "WAL = bytes written by the day's writes, i.e. write amplification):")
+        for i, (ddl, cand) in enumerate(candidates.items(), 1):
+            r = measure(conn, workload, schema, ddl, args.repeat)
+            src = ','.join(f"#{rank[q]}" for q in sorted(set(cand['sources']), key=rank.get))
+            print(f"\n[{i}] {ddl};")
+            print(f"    from {src}: statements {pct(source_ms(r, cand['sources']), source_ms(base, cand['sources'])):+.0f}%, "
+                  f"reads {pct(r['read_ms'], base['read_ms']):+.0f}%, writes {pct(r['write_ms'], base['write_ms']):+.0f}%, "
+                  f"WAL {pct(r['wal_bytes'], base['wal_bytes']):+.0f}%, size {r['size'] / 1024:,.0f} kB")
+    finally:
+        conn.rollback()
+        cur = conn.cursor()
+        cur.execute(CLEANUP_SQL)
+        conn.commit()
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+RunStrict Leaderboard Rank Index
+
+Reference implementation of leaderboard_rank_buckets
+(20260308000006_leaderboard_rank_buckets.sql): exact per-user rank without
+sorting the board.
+
+Each board keeps a count per (level L, bucket b) of the entries whose
+points >> L == b, for L = 0..30. The number of entries with more points
+than p is the sum of count(L, (p >> L) + 1) over the levels where bit L of
+p is 0. Every x > p is counted once, at the highest bit where x and p
+differ. That is at most 31 lookups and 31 updates per entry, whatever the
+board size. Entries tied on points are ordered by (name, user_id), kept in
+a sorted list per (board, points).
+
+  rank = 1 + entries with more points + tied entries ordered before me
+
+--simulate runs simulate_day in memory and, after every simulated day,
+checks each user's rank on the global, province (Res 5) and district (Res 6)
+boards against a brute-force sort. --db replays the same days into
+Postgres as late syncs: refresh_leaderboard() maintains the buckets, and
+get_leaderboard_rank() is checked against a full sort of
+leaderboard_entries after every day. It writes simulator users into the
+public tables, so point it at a disposable local database. They are deleted
+at the end.
+
+Usage:
+    python3 leaderboard_rank_index.py --simulate --days 40 --users 2000
+    python3 leaderboard_rank_index.py --db --days 10 --users 500
+    python3 leaderboard_rank_index.py --db --dsn postgresql://...
+
+Requires: pip install h3 (psycopg2-binary for --db)
+"""
+
+import argparse
+import sys
+import time
+import uuid
+from bisect import bisect_left, insort
+from collections import defaultdict
+from datetime import timedelta
+
+LEVELS = 31  # season_points is a positive INT
+
+
+class RankIndex:
+    """Bucket counts and tie groups for any number of boards."""
+
+    def __init__(self):
+        self.buckets = defaultdict(int)   # (board, level, bucket) -> entries
+        self.ties = defaultdict(list)     # (board, points) -> sorted (name, user_id)
+        self.entries = {}                 # (board, user_id) -> (points, name)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, board, user_id, name, points):
+        for level in range(LEVELS):
+            self.buckets[(board, level, points >> level)] += 1
+        insort(self.ties[(board, points)], (name, user_id))
+        self.entries[(board, user_id)] = (points, name)
+
+    def remove(self, board, user_id):
+        points, name = self.entries.pop((board, user_id))
+        for level in range(LEVELS):
+            self.buckets[(board, level, points >> level)] -= 1
+        group = self.ties[(board, points)]
+        del group[bisect_left(group, (name, user_id))]
+
+    def set(self, board, user_id, name, points):
+        """Move a user to new points on one board (points <= 0 removes them)."""
+        if (board, user_id) in self.entries:
+            self.remove(board, user_id)
+        if points > 0:
+            self.add(board, user_id, name, points)
+
+    def ahead(self, board, points):
+        """Entries on the board with more points than `points`."""
+        return sum(self.buckets.get((board, level, (points >> level) + 1), 0)
+                   for level in range(LEVELS) if not (points >> level) & 1)
+
+    def rank(self, board, user_id):
+        """1-based rank, or None if the user is not on the board."""
+        entry = self.entries.get((board, user_id))
+        if entry is None:
+            return None
+        points, name = entry
+        return 1 + self.ahead(board, points) + bisect_left(self.ties[(board, points)], (name, user_id))
+
+
+def brute_force_ranks(entries):
+    """{(board, user_id): rank} by sorting each board on (-points, name, user_id)."""
+    boards = defaultdict(list)
+    for (board, user_id), (points, name) in entries.items():
+        boards[board].append((-points, name, user_id))
+    ranks = {}
+    for board, rows in boards.items():
+        rows.sort()
+        for i, (_, _, user_id) in enumerate(rows, 1):
+            ranks[(board, user_id)] = i
+    return ranks
+
+
+# ==================== Simulator ====================
+
+def simulator_state(days, users, seed):
+    import simulate_day as sim
+
+    home_hex = sim.DEFAULT_HOME_HEX
+    same_hexes, other_hexes = sim.generate_hexes_from_home(home_hex)
+    state = sim.default_state()
+    state.update(seed=seed, home_hex=home_hex, same_hexes=same_hexes, other_hexes=other_hexes, total_days=days)
+    state['users'] = sim.generate_users(seed, same_hexes, other_hexes, users)
+    return state
+
+
+def user_boards(user):
+    """The three boards a simulator user is ranked on, keyed like leaderboard_entries."""
+    import simulate_day as sim
+
+    return (('global', ''),
+            ('province', sim.h3.cell_to_parent(user['home_hex'], sim.ALL_RESOLUTION)),
+            ('district', sim.h3.cell_to_parent(user['home_hex'], sim.CITY_RESOLUTION)))
+
+
+def check_simulator(days, users, seed):
+    """Maintain a RankIndex over simulate_day's points; compare with a full sort every day."""
+    import simulate_day as sim
+
+    state = simulator_state(days, users, seed)
+    boards = {u['id']: user_boards(u) for u in state['users']}
+    names = {u['id']: u['name'] for u in state['users']}
+    index = RankIndex()
+    points = {}
+
+    report = []
+    for day in range(1, days + 1):
+        sim.simulate_day_step(state, day, days)
+        changed = [uid for uid, p in state['user_points'].items() if points.get(uid) != p]
+
+        t0 = time.perf_counter()
+        for uid in changed:
+            points[uid] = state['user_points'][uid]
+            for board in boards[uid]:
+                index.set(board, uid, names[uid], points[uid])
+        t1 = time.perf_counter()
+        got = {key: index.rank(*key) for key in index.entries}
+        t2 = time.perf_counter()
+        expected = brute_force_ranks(index.entries)
+        t3 = time.perf_counter()
+
+        report.append({
+            'run_date': str(sim.run_date_for_day(day, days)),
+            'changed': len(changed),
+            'entries': len(index),
+            'mismatched': sum(1 for k in expected.keys() | got.keys() if expected.get(k) != got.get(k)),
+            'update_ms': (t1 - t0) * 1000,
+            'rank_ms': (t2 - t1) * 1000,
+            'sort_ms': (t3 - t2) * 1000,
+        })
+    return report
+
+
+# ==================== Postgres ====================
+
+SORTED_RANK_SQL = """
+SELECT user_id::text, scope, rank FROM (
+  SELECT user_id, scope, ROW_NUMBER() OVER (
+           PARTITION BY scope, scope_hex ORDER BY season_points DESC, name, user_id) AS rank
+  FROM public.leaderboard_entries
+) ranked
+WHERE user_id::text LIKE 'aaaaaaaa-%'
+"""
+
+DB_RANKS_SQL = """
+SELECT le.user_id::text, r.key, (r.value->>'rank')::INT
+FROM (SELECT DISTINCT user_id FROM public.leaderboard_entries WHERE user_id::text LIKE 'aaaaaaaa-%') le,
+     jsonb_each(public.get_leaderboard_rank(le.user_id)) r
+"""
+
+# Buckets left by refresh_leaderboard() vs the ones a rebuild computes (run inside a rolled-back transaction)
+BUCKET_DIFF_SQL = """
+CREATE TEMP TABLE _refreshed_buckets ON COMMIT DROP AS
+  SELECT * FROM public.leaderboard_rank_buckets WHERE n <> 0;
+SELECT public.rebuild_leaderboard();
+SELECT count(*) FROM _refreshed_buckets r
+FULL JOIN public.leaderboard_rank_buckets b USING (scope, scope_hex, level, bucket)
+WHERE r.n IS DISTINCT FROM b.n;
+"""
+
+CLEANUP_SQL = """
+DELETE FROM public.run_history WHERE user_id::text LIKE 'aaaaaaaa-%';
+DELETE FROM public.leaderboard_entries WHERE user_id::text LIKE 'aaaaaaaa-%';
+DELETE FROM public.leaderboard_dirty WHERE user_id::text LIKE 'aaaaaaaa-%';
+DELETE FROM public.users WHERE id::text LIKE 'aaaaaaaa-%';
+"""
+
+
+def check_db(dsn, days, users, seed):
+    """Replay simulator days as late syncs; compare get_leaderboard_rank() with a full sort every day."""
+    import simulate_day as sim
+    from bench_season_reset import copy_into
+
+    state = simulator_state(days, users, seed)
+    conn = sim.get_db_connection(dsn)
+    cur = conn.cursor()
+    cur.execute("SELECT to_regclass('public.leaderboard_rank_buckets')")
+    if cur.fetchone()[0] is None:
+        raise RuntimeError("apply 20260308000006_leaderboard_rank_buckets.sql first")
+
+    report = []
+    try:
+        cur.execute("SET session_replication_role = replica")  # simulator users have no auth.users rows
+        copy_into(cur, 'public.users',
+                  ('id', 'auth_id', 'name', 'team', 'season_points', 'province_hex', 'district_hex',
+                   'total_distance_km', 'total_runs'),
+                  ((u['id'], u['id'], u['name'], u['team'], 0, user_boards(u)[1][1], user_boards(u)[2][1], 0, 0)
+                   for u in state['users']))
+        cur.execute("SET session_replication_role = DEFAULT")
+        cur.execute("SELECT public.rebuild_leaderboard()")
+        conn.commit()
+
+        # Every day lands as runs dated yesterday, so the trigger queues them for the incremental path
+        yesterday = sim.today_gmt2() - timedelta(days=1)
+        stamp = f"{yesterday} 10:00:00+00"
+        points = {}
+        for day in range(1, days + 1):
+            defectors, _, _, _, _ = sim.simulate_day_step(state, day, days)
+            changed = {uid: p - points.get(uid, 0) for uid, p in state['user_points'].items()
+                       if points.get(uid, 0) != p}
+            cur.execute("SET session_replication_role = replica")
+            for u in defectors:
+                cur.execute("UPDATE public.users SET team = 'purple' WHERE id = %s", (u['id'],))
+            for uid, delta in changed.items():
+                cur.execute("UPDATE public.users SET season_points = season_points + %s WHERE id = %s", (delta, uid))
+            cur.execute("SET session_replication_role = DEFAULT")  # the run_history trigger must fire
+            for uid, delta in changed.items():
+                cur.execute("INSERT INTO public.run_history (id, user_id, run_date, start_time, end_time, distance_km, "
+                            "duration_seconds, flip_points, team_at_run) VALUES (%s, %s, %s, %s, %s, 5.0, 1800, %s, 'red')",
+                            (str(uuid.uuid4()), uid, yesterday, stamp, stamp, delta))
+            points.update(state['user_points'])
+            conn.commit()
+
+            t0 = time.perf_counter()
+            cur.execute("SELECT public.refresh_leaderboard()")
+            refresh = cur.fetchone()[0]
+            conn.commit()
+            refresh_ms = (time.perf_counter() - t0) * 1000
+
+            cur.execute(SORTED_RANK_SQL)
+            expected = {(u, scope): rank for u, scope, rank in cur.fetchall()}
+            t0 = time.perf_counter()
+            cur.execute(DB_RANKS_SQL)
+            got = {(u, scope): rank for u, scope, rank in cur.fetchall()}
+            rank_ms = (time.perf_counter() - t0) * 1000
+            conn.rollback()
+
+            report.append({
+                'run_date': str(sim.run_date_for_day(day, days)),
+                'changed': len(changed),
+                'mode': refresh['mode'],
+                'entries': len(expected),
+                'mismatched': sum(1 for k in expected.keys() | got.keys() if expected.get(k) != got.get(k)),
+                'refresh_ms': refresh_ms,
+                'rank_ms': rank_ms,
+            })
+
+        cur.execute(BUCKET_DIFF_SQL)
+        bucket_diff = cur.fetchone()[0]
+        conn.rollback()
+    finally:
+        conn.rollback()
+        cur.execute(CLEANUP_SQL)
+        cur.execute("SELECT public.rebuild_leaderboard()")
+        conn.commit()
+        conn.close()
+    return report, bucket_diff
+
+
+def main():
+    parser = argparse.ArgumentParser(description='RunStrict leaderboard rank index: reference and checks')
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument('--simulate', action='store_true', help='Check the Python reference against a full sort')
+    mode.add_argument('--db', action='store_true', help='Check get_leaderboard_rank() against a full sort')
+    parser.add_argument('--days', type=int, default=40, help='Simulated days (default: 40)')
+    parser.add_argument('--users', type=int, default=1000, help='Simulator users (default: 1000)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    parser.add_argument('--dsn', default=None, help='Postgres DSN for --db (default: local supabase / $SIM_DB_DSN)')
+    args = parser.parse_args()
+
+    if args.simulate:
+        report = check_simulator(args.days, args.users, args.seed)
+        print(f"{'run_date':<12} {'changed':>8} {'entries':>8} {'mismatched':>11} "
+              f"{'update':>9} {'all ranks':>10} {'full sort':>10}")
+        for r in report:
+            print(f"{r['run_date']:<12} {r['changed']:>8,} {r['entries']:>8,} {r['mismatched']:>11,} "
+                  f"{r['update_ms']:>7.1f}ms {r['rank_ms']:>8.1f}ms {r['sort_ms']:>8.1f}ms")
+    else:
+        import simulate_day as sim
+
+        if sim.psycopg2 is None:
+            print("ERROR: psycopg2 required. Install with: pip install psycopg2-binary", file=sys.stderr)
+            sys.exit(1)
+        report, bucket_diff = check_db(args.dsn or sim.LOCAL_DB_DSN, args.days, args.users, args.seed)
+        print(f"{'run_date':<12} {'changed':>8} {'mode':<12} {'entries':>8} {'mismatched':>11} "
+              f"{'refresh':>9} {'all ranks':>10}")
+        for r in report:
+            print(f"{r['run_date']:<12} {r['changed']:>8,} {r['mode']:<12} {r['entries']:>8,} "
+                  f"{r['mismatched']:>11,} {r['refresh_ms']:>7.1f}ms {r['rank_ms']:>8.1f}ms")
+        print(f"buckets vs fresh rebuild: {bucket_diff:,} mismatched")
+
+    total = sum(r['mismatched'] for r in report)
+    print(f"{total:,} mismatched ranks over {len(report)} days")
+    if total:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
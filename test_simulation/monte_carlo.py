@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+RunStrict Monte Carlo Season Balance Engine
+
+One `simulate_day.py --days 40` run is one sample of who wins a season.
+This engine replays thousands of seeded seasons in memory (no DB, no SQL)
+across a process pool and sweeps the buff matrix, archetypes and team mix,
+reporting win-rate and point-spread distributions per team.
+
+Game rules follow the server (not simulate_day's live-order shortcut):
+- Flips are counted against yesterday's snapshot (docs §5.3); within a day
+  the latest end_time wins when building the next snapshot.
+- Buffs follow get_user_buff / calculate_daily_buffs
+  (20260306000003_province_win_scoped_to_res5.sql) with values from
+  app_config.buff compiled by buff_matrix.py:
+  red elite = rank cutoff within district, district win from Res 6 counts,
+  province win from Res 5 counts, purple tiers by district participation.
+
+A season is a handful of numpy passes per day, so 100-10k user seasons
+stay well under a second.
+
+Usage:
+    python3 monte_carlo.py --seasons 2000
+    python3 monte_carlo.py --seasons 500 --sweep redEliteBase=2,3 --sweep purpleHighTierBuff=3,4
+    python3 monte_carlo.py --sweep elite.participation=0.6,0.8 --sweep team.purple=10,20,30
+    python3 monte_carlo.py --users 5000 --sweep zipf_s=0,1.2 --out sweep.json
+
+Requires: pip install h3 numpy
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from simulate_day import (
+    ALL_RESOLUTION, ARCHETYPES, DEFAULT_HOME_HEX, DEFECTION_COUNT, DEFECTION_DAYS,
+    TEAM_DISTRIBUTION, h3,
+)
+from buff_matrix import BUFF_DEFAULTS, PURPLE, RED, TEAMS, BuffMatrix, elite_cutoff_rank
+from workload import WorkloadModel
+
+ENGINE_DEFAULTS = {
+    'users': 100,
+    'days': 40,
+    'zipf_s': 0.0,          # Workload geometry: 0 = uniform district density
+    'hotspot_share': 0.0,
+}
+
+
+def default_params():
+    return {
+        'engine': dict(ENGINE_DEFAULTS),
+        'buff': dict(BUFF_DEFAULTS),
+        'archetypes': {k: dict(v) for k, v in ARCHETYPES.items()},
+        'teams': dict(TEAM_DISTRIBUTION),
+    }
+
+
+def apply_override(params, key, value):
+    """Set one sweep key: buff config key, <archetype>.<field>, team.<team>, or engine key."""
+    if key in params['buff']:
+        params['buff'][key] = value
+    elif key in params['engine']:
+        params['engine'][key] = value
+    elif key.startswith('team.'):
+        params['teams'][key.split('.', 1)[1]] = value
+    elif '.' in key and key.split('.', 1)[0] in params['archetypes']:
+        arch, field = key.split('.', 1)
+        params['archetypes'][arch][field] = value
+    else:
+        raise KeyError(f"Unknown sweep key: {key}")
+
+
+# ==================== Geometry ====================
+
+_GEOMETRY_CACHE = {}
+
+
+def geometry(zipf_s, hotspot_share):
+    """WorkloadModel plus int lookup arrays (cell -> district -> province), cached per process."""
+    key = (zipf_s, hotspot_share)
+    if key not in _GEOMETRY_CACHE:
+        model = WorkloadModel(DEFAULT_HOME_HEX, {'zipf_s': zipf_s, 'hotspot_share': hotspot_share}, seed=42)
+        provinces = {}
+        district_province = np.array(
+            [provinces.setdefault(h3.cell_to_parent(d, ALL_RESOLUTION), len(provinces)) for d in model.districts],
+            dtype=np.int64,
+        )
+        cell_district = np.repeat(np.arange(len(model.districts)), np.diff(model.district_start))
+        _GEOMETRY_CACHE[key] = (model, cell_district, district_province, len(provinces))
+    return _GEOMETRY_CACHE[key]
+
+
+# ==================== Buffs ====================
+
+def team_dominance(counts):
+    """Leading team per row of (n, 3) hex counts with calculate_daily_buffs' tie order (red, blue, purple)."""
+    return np.argmax(counts, axis=1)
+
+
+def compute_buffs(matrix, team, district, province, owner, cell_district, n_districts, n_provinces,
+                  yesterday_points, ran_yesterday, province_of_district):
+    """Start-of-day multiplier per user from yesterday's snapshot and runs."""
+    owned = owner >= 0
+    d_counts = np.bincount(cell_district[owned] * 3 + owner[owned], minlength=n_districts * 3).reshape(-1, 3)
+    p_counts = np.bincount(province_of_district[cell_district[owned]] * 3 + owner[owned],
+                           minlength=n_provinces * 3).reshape(-1, 3)
+
+    # District win: every user district gets a daily_buff_stats row, even with 0 hexes (red leads ties)
+    district_win = team_dominance(d_counts)[district] == team
+    # Province win: only provinces with colored hexes get a row; purple never gets the bonus
+    p_has_hexes = p_counts.sum(axis=1) > 0
+    province_win = p_has_hexes[province] & (team_dominance(p_counts)[province] == team) & (team != PURPLE)
+
+    # Red elite: rank cutoff GREATEST(1, round(n * threshold)) among yesterday's red runners per district
+    is_elite = np.zeros(len(team), dtype=bool)
+    red_runners = np.nonzero((team == RED) & ran_yesterday)[0]
+    if len(red_runners):
+        order = np.lexsort((-yesterday_points[red_runners], district[red_runners]))
+        r_sorted = red_runners[order]
+        d_sorted = district[r_sorted]
+        starts = np.r_[0, np.nonzero(np.diff(d_sorted))[0] + 1]
+        sizes = np.diff(np.r_[starts, len(r_sorted)])
+        cutoff = elite_cutoff_rank(sizes, matrix.config['redEliteThreshold'])
+        threshold = np.zeros(n_districts, dtype=np.int64)
+        threshold[d_sorted[starts]] = yesterday_points[r_sorted[starts + cutoff - 1]]
+        reds = team == RED
+        is_elite = reds & (yesterday_points >= threshold[district]) & (yesterday_points > 0) & ran_yesterday
+
+    # Purple participation per district
+    purples = team == PURPLE
+    p_total = np.bincount(district[purples], minlength=n_districts)
+    p_active = np.bincount(district[purples & ran_yesterday], minlength=n_districts)
+    rate = np.divide(p_active, p_total, out=np.zeros(n_districts), where=p_total > 0)
+
+    return matrix.lookup(team, is_elite, district_win, province_win, rate[district]).astype(np.int64)
+
+
+# ==================== Season ====================
+
+def simulate_season(params, seed):
+    """Play one season in memory. Returns team points, sizes and the final hex split."""
+    eng = params['engine']
+    matrix = BuffMatrix(params['buff'])
+    rng = np.random.default_rng(seed)
+    model, cell_district, province_of_district, n_provinces = geometry(eng['zipf_s'], eng['hotspot_share'])
+    n_districts = len(model.districts)
+    n = int(eng['users'])
+
+    # Users: team mix scaled to n, archetypes by weight, Zipf home cells
+    total = sum(params['teams'].values())
+    team = np.repeat(np.arange(3), [round(n * params['teams'][t] / total) for t in TEAMS])
+    team = np.resize(np.r_[team, np.full(n, PURPLE)][:n], n).astype(np.int64)
+    original_team = team.copy()
+    arch_names = list(params['archetypes'])
+    weights = np.array([params['archetypes'][a]['weight'] for a in arch_names], dtype=float)
+    arch = rng.choice(len(arch_names), size=n, p=weights / weights.sum())
+    participation = np.array([params['archetypes'][a]['participation'] for a in arch_names])[arch]
+    dist_lo = np.array([params['archetypes'][a]['dist'][0] for a in arch_names])[arch]
+    dist_hi = np.array([params['archetypes'][a]['dist'][1] for a in arch_names])[arch]
+    home = model.sample_home_cells(n, rng)
+    district = cell_district[home]
+    province = province_of_district[district]
+
+    owner = np.full(len(model.cells), -1, dtype=np.int64)  # yesterday's snapshot
+    points = np.zeros(n, dtype=np.int64)
+    yesterday_points = np.zeros(n, dtype=np.int64)
+    ran_yesterday = np.zeros(n, dtype=bool)
+    defect_per_day = DEFECTION_COUNT // len(DEFECTION_DAYS) + 1
+
+    for day in range(1, int(eng['days']) + 1):
+        if day in DEFECTION_DAYS:
+            eligible = np.nonzero((team != PURPLE) & (original_team != PURPLE))[0]
+            if len(eligible):
+                team[rng.choice(eligible, size=min(defect_per_day, len(eligible)), replace=False)] = PURPLE
+
+        if day <= 1:
+            buff = np.ones(n, dtype=np.int64)
+        else:
+            buff = compute_buffs(matrix, team, district, province, owner, cell_district, n_districts,
+                                 n_provinces, yesterday_points, ran_yesterday, province_of_district)
+
+        runners = np.nonzero(rng.random(n) < participation)[0]
+        ran_yesterday = np.zeros(n, dtype=bool)
+        yesterday_points = np.zeros(n, dtype=np.int64)
+        if not len(runners):
+            continue
+        distance = rng.uniform(dist_lo[runners], dist_hi[runners])
+        num_hexes = np.maximum(3, (distance * 2.5).astype(np.int64))
+        paths = model.sample_paths(len(runners), int(num_hexes.max()), rng, start_cells=home[runners])
+        paths = np.where(np.arange(paths.shape[1])[None, :] < num_hexes[:, None], paths, -1)
+
+        # Distinct hexes per run
+        paths.sort(axis=1)
+        valid = paths >= 0
+        valid[:, 1:] &= paths[:, 1:] != paths[:, :-1]
+        run_idx, col = np.nonzero(valid)
+        hexes = paths[run_idx, col]
+        run_team = team[runners]
+
+        # Flips against yesterday's snapshot
+        flipped = owner[hexes] != run_team[run_idx]
+        flips = np.bincount(run_idx, weights=flipped, minlength=len(runners)).astype(np.int64)
+        earned = flips * buff[runners]
+        points[runners] += earned
+        yesterday_points[runners] = earned
+        ran_yesterday[runners] = True
+
+        # Tomorrow's snapshot: latest end_time wins per hex
+        end_minute = model.sample_start_minutes(len(runners), rng) + (distance * 6).astype(np.int64)
+        order = np.lexsort((end_minute[run_idx], hexes))
+        last = np.r_[hexes[order][1:] != hexes[order][:-1], True]
+        owner[hexes[order][last]] = run_team[run_idx[order][last]]
+
+    owned = owner >= 0
+    return {
+        'points': np.bincount(team, weights=points, minlength=3).astype(np.int64).tolist(),
+        'sizes': np.bincount(team, minlength=3).tolist(),
+        'hexes': np.bincount(owner[owned], minlength=3).tolist(),
+    }
+
+
+def run_batch(params, seeds):
+    """Worker entry: play a list of seeded seasons for one parameter combo."""
+    return [simulate_season(params, s) for s in seeds]
+
+
+# ==================== Aggregation ====================
+
+def summarize(results):
+    pts = np.array([r['points'] for r in results], dtype=np.float64)
+    sizes = np.array([r['sizes'] for r in results], dtype=np.float64)
+    per_capita = np.divide(pts, sizes, out=np.zeros_like(pts), where=sizes > 0)
+    ranked = np.sort(pts, axis=1)
+    margin = ranked[:, -1] - ranked[:, -2]
+
+    def pct(a):
+        return {f"p{q}": round(float(np.percentile(a, q)), 1) for q in (5, 50, 95)}
+
+    return {
+        'seasons': len(results),
+        'win_rate': {t: round(float(np.mean(pts.argmax(axis=1) == i)), 4) for i, t in enumerate(TEAMS)},
+        'win_rate_per_capita': {t: round(float(np.mean(per_capita.argmax(axis=1) == i)), 4) for i, t in enumerate(TEAMS)},
+        'points': {t: pct(pts[:, i]) for i, t in enumerate(TEAMS)},
+        'points_per_capita': {t: pct(per_capita[:, i]) for i, t in enumerate(TEAMS)},
+        'win_margin': pct(margin),
+    }
+
+
+def parse_sweep(values):
+    """['redEliteBase=2,3', ...] -> [(key, [2, 3]), ...]"""
+    sweep = []
+    for item in values:
+        key, _, raw = item.partition('=')
+        vals = [json.loads(v) for v in raw.split(',') if v]
+        if not vals:
+            raise ValueError(f"No values for sweep key {key}")
+        sweep.append((key, vals))
+    return sweep
+
+
+def main():
+    parser = argparse.ArgumentParser(description='RunStrict Monte Carlo season balance engine')
+    parser.add_argument('--seasons', type=int, default=1000, help='Seasons per parameter combo (default: 1000)')
+    parser.add_argument('--users', type=int, default=ENGINE_DEFAULTS['users'], help='Users per season (default: 100)')
+    parser.add_argument('--days', type=int, default=ENGINE_DEFAULTS['days'], help='Days per season (default: 40)')
+    parser.add_argument('--sweep', action='append', default=[], metavar='KEY=V1,V2',
+                        help='Sweep a buff key (redEliteBase), <archetype>.<field>, team.<team> or engine key')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Worker processes (default: all CPUs)')
+    parser.add_argument('--batch', type=int, default=50, help='Seasons per worker task (default: 50)')
+    parser.add_argument('--seed', type=int, default=42, help='Base seed; season i uses seed + i (default: 42)')
+    parser.add_argument('--out', type=str, help='Write JSON results here (default: stdout)')
+    args = parser.parse_args()
+
+    sweep = parse_sweep(args.sweep)
+    combos = []
+    for values in itertools.product(*[v for _, v in sweep]):
+        params = default_params()
+        params['engine']['users'] = args.users
+        params['engine']['days'] = args.days
+        for (key, _), value in zip(sweep, values):
+            apply_override(params, key, value)
+        combos.append((dict(zip([k for k, _ in sweep], values)), params))
+
+    # Same seeds for every combo (common random numbers) so differences come from the parameters
+    seeds = list(range(args.seed, args.seed + args.seasons))
+    batches = [seeds[i:i + args.batch] for i in range(0, len(seeds), args.batch)]
+    print(f"{len(combos)} combo(s) x {args.seasons} seasons on {args.workers} workers...", file=sys.stderr)
+
+    t0 = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = [[pool.submit(run_batch, params, b) for b in batches] for _, params in combos]
+        for (overrides, _), futs in zip(combos, futures):
+            seasons = [r for f in futs for r in f.result()]
+            summary = summarize(seasons)
+            results.append({'params': overrides, **summary})
+            wr = summary['win_rate']
+            print(f"  {json.dumps(overrides) if overrides else 'defaults'}: "
+                  f"red {wr['red']:.1%} | blue {wr['blue']:.1%} | purple {wr['purple']:.1%}", file=sys.stderr)
+    elapsed = time.perf_counter() - t0
+    total = len(combos) * args.seasons
+    print(f"{total} seasons in {elapsed:.1f}s ({elapsed / total * 1000 * args.workers:.0f} ms/season/worker)",
+          file=sys.stderr)
+
+    output = json.dumps({'users': args.users, 'days': args.days, 'results': results}, indent=2)
+    if args.out:
+        with open(args.out, 'w') as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+RunStrict Season Parquet Export
+
+Columnar sink for simulated seasons, so balance questions (team points,
+buff distribution, hex flapping) can be answered without querying Postgres.
+
+Each simulated day is written as soon as it is generated, one Hive-style
+partition per table, so the season never has to fit in memory:
+
+    <out>/runs/day=01/part-0.parquet
+    <out>/hex_ownership/day=01/part-0.parquet   # every owned hex + flipped flag
+    <out>/buff_stats/day=01/part-0.parquet      # daily_buff_stats rows (Res 6)
+    <out>/user_stats/day=01/part-0.parquet      # cumulative per-user aggregates
+
+Usage:
+    python3 simulate_day.py --days 40 --users 100000 --parquet-dir out/season --export-only
+    python3 simulate_day.py --days 5 --parquet-dir out/season --dry-run   # SQL + Parquet
+    python3 parquet_export.py out/season                                   # Season summary
+
+Requires: pip install pyarrow
+"""
+
+import argparse
+import json
+import shutil
+import sys
+import time
+from pathlib import Path
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    print("ERROR: pyarrow required. Install with: pip install pyarrow", file=sys.stderr)
+    sys.exit(1)
+
+from simulate_day import ALL_RESOLUTION, ARCHETYPES, CITY_RESOLUTION, daily_buff_stats_rows, h3
+
+TABLES = ('runs', 'hex_ownership', 'buff_stats', 'user_stats')
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S+00'
+# Fixed dictionaries: every day partition encodes the same values, so a
+# multi-day dataset reads back (and groups) without unifying dictionaries
+TEAMS = ('red', 'blue', 'purple')
+ARCHETYPE_NAMES = tuple(ARCHETYPES)
+
+
+def enum_array(values, vocab):
+    """dictionary<int8, string> over a fixed value set; None stays null."""
+    index = {v: i for i, v in enumerate(vocab)}
+    return pa.DictionaryArray.from_arrays(pa.array([None if v is None else index[v] for v in values], pa.int8()),
+                                          pa.array(vocab, pa.string()))
+
+
+class ParquetSink:
+    """Writes one partition per table per simulated day.
+
+    Partitions from first_day on are removed up front: this export rewrites
+    them, and any later day left by an earlier, longer export is stale.
+    """
+
+    def __init__(self, out_dir, first_day=1, include_hex_path=True, compression='zstd'):
+        self.out_dir = Path(out_dir)
+        self.include_hex_path = include_hex_path
+        self.compression = compression
+        self._parents = {}  # hex -> (province, district); bounded by hexes ever touched
+        for table in TABLES:
+            for path in (self.out_dir / table).glob('day=*'):
+                if path.is_dir() and path.name[4:].isdigit() and int(path.name[4:]) >= first_day:
+                    shutil.rmtree(path)
+
+    def _write(self, table, day, data):
+        path = self.out_dir / table / f"day={day:02d}"
+        if path.exists():
+            shutil.rmtree(path)  # re-running a day replaces its partition
+        path.mkdir(parents=True)
+        pq.write_table(pa.table(data), path / 'part-0.parquet', compression=self.compression)
+
+    def _parent(self, hid):
+        p = self._parents.get(hid)
+        if p is None:
+            p = self._parents[hid] = (h3.cell_to_parent(hid, ALL_RESOLUTION), h3.cell_to_parent(hid, CITY_RESOLUTION))
+        return p
+
+    def write_day(self, state, day, run_date_str, runs, hex_teams, day_flip_points, prev_hex_teams):
+        self.write_runs(day, runs)
+        self.write_hex_ownership(day, hex_teams, prev_hex_teams)
+        self.write_buff_stats(day, run_date_str, daily_buff_stats_rows(state, hex_teams) if hex_teams else [])
+        self.write_user_stats(day, state, day_flip_points)
+
+    def write_runs(self, day, runs):
+        def col(key):
+            return [r[key] for r in runs]
+
+        data = {
+            'id': pa.array(col('id'), pa.string()),
+            'user_id': pa.array(col('user_id'), pa.string()),
+            'run_date': pc.cast(pc.strptime(pa.array(col('run_date'), pa.string()), '%Y-%m-%d', 's'), pa.date32()),
+            'start_time': pc.strptime(pa.array(col('start_time'), pa.string()), TIME_FORMAT, 's'),
+            'end_time': pc.strptime(pa.array(col('end_time'), pa.string()), TIME_FORMAT, 's'),
+            'distance_km': pa.array(col('distance_km'), pa.float64()),
+            'duration_seconds': pa.array(col('duration_seconds'), pa.int32()),
+            'avg_pace_min_per_km': pa.array(col('avg_pace_min_per_km'), pa.float64()),
+            'hex_count': pa.array([len(r['hex_path']) for r in runs], pa.int32()),
+            'flip_count': pa.array(col('flip_count'), pa.int32()),
+            'flip_points': pa.array(col('flip_points'), pa.int32()),
+            'buff_multiplier': pa.array(col('buff_multiplier'), pa.int8()),
+            'team_at_run': enum_array(col('team_at_run'), TEAMS),
+            'cv': pa.array(col('cv'), pa.float64()),
+        }
+        if self.include_hex_path:
+            data['hex_path'] = pa.array(col('hex_path'), pa.list_(pa.string()))
+        self._write('runs', day, data)
+
+    def write_hex_ownership(self, day, hex_teams, prev_hex_teams):
+        ids = list(hex_teams)
+        parents = [self._parent(h) for h in ids]
+        self._write('hex_ownership', day, {
+            'hex_id': pa.array(ids, pa.string()),
+            'team': enum_array([hex_teams[h] for h in ids], TEAMS),
+            'previous_team': enum_array([prev_hex_teams.get(h) for h in ids], TEAMS),
+            'flipped': pa.array([prev_hex_teams.get(h) != hex_teams[h] for h in ids], pa.bool_()),
+            'parent_hex': pa.array([p[0] for p in parents], pa.string()),
+            'district_hex': pa.array([p[1] for p in parents], pa.string()),
+        })
+
+    def write_buff_stats(self, day, run_date_str, rows):
+        keys = ('city_hex', 'dominant_team', 'red_hex_count', 'blue_hex_count', 'purple_hex_count',
+                'red_elite_threshold_points', 'purple_total_users', 'purple_active_users',
+                'purple_participation_rate')
+        types = (pa.string(), pa.string(), pa.int32(), pa.int32(), pa.int32(),
+                 pa.int32(), pa.int32(), pa.int32(), pa.float64())
+        data = {'stat_date': pa.array([run_date_str] * len(rows), pa.string()).cast(pa.date32())}
+        for key, typ in zip(keys, types):
+            data[key] = pa.array([r[key] for r in rows], typ)
+        self._write('buff_stats', day, data)
+
+    def write_user_stats(self, day, state, day_flip_points):
+        users = state['users']
+        pts = state['user_points']
+        stats = state['user_stats']
+        empty = {}
+
+        def stat(u, key, default=0):
+            return stats.get(u['id'], empty).get(key, default)
+
+        self._write('user_stats', day, {
+            'user_id': pa.array([u['id'] for u in users], pa.string()),
+            'team': enum_array([u['team'] for u in users], TEAMS),
+            'original_team': enum_array([u['original_team'] for u in users], TEAMS),
+            'archetype': enum_array([u['archetype'] for u in users], ARCHETYPE_NAMES),
+            'home_hex': pa.array([u['home_hex'] for u in users], pa.string()),
+            'day_points': pa.array([day_flip_points.get(u['id'], 0) for u in users], pa.int32()),
+            'season_points': pa.array([pts.get(u['id'], 0) for u in users], pa.int64()),
+            'total_runs': pa.array([stat(u, 'total_runs') for u in users], pa.int32()),
+            'total_distance_km': pa.array([stat(u, 'total_distance_km', 0.0) for u in users], pa.float64()),
+        })
+
+
+# ==================== Reading ====================
+
+def open_table(out_dir, table):
+    """pyarrow Dataset over one exported table; `day` comes from the partition path."""
+    return ds.dataset(Path(out_dir) / table, format='parquet', partitioning='hive')
+
+
+def season_summary(out_dir):
+    """Balance summary computed straight from the Parquet files."""
+    out = {}
+
+    users = open_table(out_dir, 'user_stats')
+    last_day = pc.max(users.to_table(columns=['day'])['day']).as_py()
+    final = users.to_table(columns=['team', 'season_points'], filter=ds.field('day') == last_day)
+    by_team = final.group_by('team').aggregate([('season_points', 'sum'), ('season_points', 'count')])
+    out['final_day'] = last_day
+    out['team_points'] = {t: p for t, p in zip(by_team['team'].to_pylist(), by_team['season_points_sum'].to_pylist())}
+    out['team_users'] = {t: n for t, n in zip(by_team['team'].to_pylist(), by_team['season_points_count'].to_pylist())}
+
+    runs = open_table(out_dir, 'runs').to_table(columns=['team_at_run', 'buff_multiplier', 'flip_points'])
+    buffs = runs.group_by(['team_at_run', 'buff_multiplier']).aggregate([('flip_points', 'count')])
+    dist = {}
+    for t, b, n in zip(buffs['team_at_run'].to_pylist(), buffs['buff_multiplier'].to_pylist(),
+                       buffs['flip_points_count'].to_pylist()):
+        dist.setdefault(t, {})[f"{b}x"] = n
+    out['runs'] = runs.num_rows
+    out['buff_distribution'] = {t: dict(sorted(v.items())) for t, v in sorted(dist.items())}
+
+    hexes = open_table(out_dir, 'hex_ownership').to_table(columns=['hex_id', 'flipped'])
+    flips = hexes.group_by('hex_id').aggregate([('flipped', 'sum')])['flipped_sum']
+    out['hexes'] = len(flips)
+    out['hex_flips_mean'] = round(pc.mean(flips).as_py() or 0, 2)
+    out['hex_flips_max'] = pc.max(flips).as_py()
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Summarize a Parquet-exported RunStrict season')
+    parser.add_argument('out_dir', type=str, help='Directory written by --parquet-dir')
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    summary = season_summary(args.out_dir)
+    print(json.dumps(summary, indent=2))
+    print(f"Read in {time.perf_counter() - t0:.2f}s", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
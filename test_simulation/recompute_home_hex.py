@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+RunStrict Home Hex Recomputation
+
+Recomputes every user's home hex columns from their runs in one batch. Use it
+to fix the columns after a rules change or a bad client release, instead of
+one update_home_location() / UPDATE per user.
+
+Rules (docs/01-game-rules.md §7.1, asymmetric definition; finalize_run):
+  home_hex_start   FIRST hex of the user's most recent run (self scope)
+  home_hex_end     LAST hex of the most recent run (what other users see)
+  season_home_hex  FIRST hex of the user's first run in the source. runs holds
+                   the current season; --since narrows it further.
+  home_hex         only filled when NULL, with season_home_hex. A home
+                   declared through update_home_location() is kept.
+  province_hex     Res 5 parent of home_hex (province win)
+  district_hex     Res 6 parent of home_hex (buffs, district leaderboard)
+district_hex / province_hex follow the resulting home_hex, not the latest
+run's start, so they never disagree with a declared home: finalize_run stopped
+moving them with runs in 20260219010000_home_location_consolidation.sql.
+A declared home_hex that is not a valid Res 9 cell keeps its parents.
+Runs with an empty hex_path are ignored, because zero-hex runs never move
+the home hex. Users without any hexed run keep their values.
+
+How it works:
+- One COPY streams (user_id, hex_path[1], hex_path[last], users.home_hex)
+  ordered by user and end_time: three cells per run, never the whole path.
+  pyarrow reads the stream in blocks.
+- Each block is processed vectorized. User boundaries come from comparing
+  neighbouring rows. Each user's first and last row give the season and
+  latest hexes. A user cut by a block boundary is carried into the next block.
+- Parents come from the H3 bit layout on uint64 arrays: set the
+  resolution field, and set the unused digits to 7. No per-cell h3 calls.
+- The results are spooled as CSV and COPYed into a temp staging table.
+  One UPDATE ... FROM merges them and touches only rows whose values
+  changed. A user whose home_hex changed after the export (a concurrent
+  update_home_location()) is skipped, so parents never come from a stale home. Before the merge, the report counts the users whose
+  district_hex / province_hex (their leaderboard and buff scope) changes.
+
+Usage:
+    python3 recompute_home_hex.py --dry-run                          # Report only, roll back
+    python3 recompute_home_hex.py
+    python3 recompute_home_hex.py --since 2026-02-11 --block-mb 64
+    python3 recompute_home_hex.py --source public.runs_archive --dsn postgresql://...
+
+Requires: pip install numpy psycopg2-binary pyarrow
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    print("ERROR: pyarrow required. Install with: pip install pyarrow", file=sys.stderr)
+    sys.exit(1)
+
+from simulate_day import ALL_RESOLUTION, BASE_RESOLUTION, CITY_RESOLUTION, LOCAL_DB_DSN, get_db_connection
+
+STAGE_COLUMNS = ['id', 'exported_home_hex', 'home_hex', 'home_hex_start', 'home_hex_end', 'season_home_hex',
+                 'province_hex', 'district_hex']
+
+# users column -> new value in the merge; NULL staged parents (invalid declared home) keep the old ones
+MERGED = {
+    'home_hex': 's.home_hex',
+    'home_hex_start': 's.home_hex_start',
+    'home_hex_end': 's.home_hex_end',
+    'season_home_hex': 's.season_home_hex',
+    'province_hex': 'COALESCE(s.province_hex, u.province_hex)',
+    'district_hex': 'COALESCE(s.district_hex, u.district_hex)',
+}
+
+# H3 index layout (uint64): mode in bits 59-62, resolution in 52-55, then 15 digits of 3 bits
+H3_CHARS = 15
+H3_CELL_MODE = 1
+HEX_DIGITS = np.frombuffer(b'0123456789abcdef', dtype=np.uint8)
+NIBBLE = np.full(256, 255, dtype=np.uint8)
+NIBBLE[HEX_DIGITS] = np.arange(16)
+NIBBLE[np.frombuffer(b'ABCDEF', dtype=np.uint8)] = np.arange(10, 16)
+SHIFTS = np.arange(H3_CHARS - 1, -1, -1, dtype=np.uint64) * np.uint64(4)
+
+EXPORT_SQL = """
+COPY (
+  SELECT r.user_id, r.hex_path[1], r.hex_path[cardinality(r.hex_path)], u.home_hex
+  FROM {source} r
+  JOIN public.users u ON u.id = r.user_id
+  WHERE cardinality(r.hex_path) > 0 {since}
+  ORDER BY r.user_id, r.end_time, r.id
+) TO STDOUT WITH (FORMAT csv)
+"""
+
+STAGE_SQL = """
+CREATE TEMP TABLE _home_stage (
+  id UUID PRIMARY KEY, exported_home_hex TEXT, home_hex TEXT, home_hex_start TEXT, home_hex_end TEXT,
+  season_home_hex TEXT, province_hex TEXT, district_hex TEXT
+) ON COMMIT DROP
+"""
+
+CHANGED = ' OR '.join(f"u.{c} IS DISTINCT FROM {v}" for c, v in MERGED.items())
+CURRENT = 'u.home_hex IS NOT DISTINCT FROM s.exported_home_hex'
+
+REPORT_SQL = f"""
+SELECT count(*),
+       count(*) FILTER (WHERE NOT ({CURRENT})),
+       count(*) FILTER (WHERE {CURRENT} AND u.district_hex IS DISTINCT FROM {MERGED['district_hex']}),
+       count(*) FILTER (WHERE {CURRENT} AND u.province_hex IS DISTINCT FROM {MERGED['province_hex']}),
+       count(*) FILTER (WHERE {CURRENT} AND (u.district_hex IS NULL OR u.province_hex IS NULL)
+                          AND ({CHANGED}))
+FROM _home_stage s
+JOIN public.users u ON u.id = s.id
+"""
+
+MERGE_SQL = f"""
+UPDATE public.users u
+SET {', '.join(f"{c} = {v}" for c, v in MERGED.items())}
+FROM _home_stage s
+WHERE u.id = s.id AND {CURRENT} AND ({CHANGED})
+"""
+
+
+# ==================== H3 Bits ====================
+
+def cells_to_int(cells):
+    """uint64 H3 indexes of a string array, and a mask of the valid Res 9 cells."""
+    ok = pc.fill_null(pc.equal(pc.utf8_length(cells), H3_CHARS), False)
+    fixed = pc.if_else(ok, cells, '0' * H3_CHARS).cast(pa.binary(H3_CHARS))
+    raw = np.frombuffer(fixed.buffers()[1], dtype=np.uint8)[fixed.offset * H3_CHARS:][:len(fixed) * H3_CHARS]
+    digits = NIBBLE[raw.reshape(-1, H3_CHARS)]
+    h = np.zeros(len(fixed), dtype=np.uint64)
+    for i in range(H3_CHARS):
+        h = (h << np.uint64(4)) | digits[:, i].astype(np.uint64)
+    valid = (ok.to_numpy(zero_copy_only=False) & (digits != 255).all(axis=1)
+             & ((h >> np.uint64(59)) & np.uint64(0xF) == H3_CELL_MODE)
+             & ((h >> np.uint64(52)) & np.uint64(0xF) == BASE_RESOLUTION))
+    return h, valid
+
+
+def parent(h, res):
+    """Parent cells at `res`: resolution field set, digits below `res` set to 7 (unused)."""
+    unused = np.uint64((1 << (3 * (15 - res))) - 1)
+    return (h & ~np.uint64(0xF << 52)) | np.uint64(res << 52) | unused
+
+
+def int_to_cells(h):
+    """Lowercase 15-char H3 strings of uint64 indexes."""
+    raw = HEX_DIGITS[(h[:, None] >> SHIFTS) & np.uint64(0xF)]
+    return pa.FixedSizeBinaryArray.from_buffers(pa.binary(H3_CHARS), len(h), [None, pa.py_buffer(raw.tobytes())]) \
+        .cast(pa.string())
+
+
+# ==================== Stream ====================
+
+def stream_runs(conn, source, since, block_bytes):
+    """Yield RecordBatches (user_id, first_hex, last_hex, home_hex) of the export COPY, as it arrives."""
+    sql = EXPORT_SQL.format(source=source, since='AND r.end_time >= %s' if since else '')
+    sql = conn.cursor().mogrify(sql, (since,) if since else ()).decode()
+    read_fd, write_fd = os.pipe()
+    errors = []
+
+    def produce():
+        with os.fdopen(write_fd, 'wb') as sink:
+            try:
+                conn.cursor().copy_expert(sql, sink, size=1 << 20)
+            except Exception as e:
+                errors.append(e)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    columns = ['user_id', 'first_hex', 'last_hex', 'home_hex']
+    try:
+        with os.fdopen(read_fd, 'rb') as src:
+            try:
+                reader = pacsv.open_csv(
+                    src,
+                    read_options=pacsv.ReadOptions(column_names=columns, block_size=block_bytes),
+                    convert_options=pacsv.ConvertOptions(column_types={c: pa.string() for c in columns},
+                                                         strings_can_be_null=True),
+                )
+            except pa.ArrowInvalid as e:
+                if 'Empty CSV' not in str(e):
+                    raise
+                reader = ()   # no runs to export
+            yield from reader
+    finally:
+        producer.join()
+        if errors:   # a failed COPY ends the stream early; report its error, not the reader's
+            raise errors[0]
+
+
+class HomeHexes:
+    """Folds the ordered (user, first_hex, last_hex, home_hex) stream into one row per user."""
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.carry = None   # (user, home_hex, season_h, start_h, end_h) of the user the last block ended on
+        self.runs = self.skipped = self.users = self.bad_homes = 0
+
+    def add(self, batch):
+        first_h, first_ok = cells_to_int(batch.column('first_hex'))
+        last_h, last_ok = cells_to_int(batch.column('last_hex'))
+        ok = first_ok & last_ok
+        self.runs += len(ok)
+        self.skipped += int((~ok).sum())
+        keep = pa.array(ok)
+        users, homes = batch.column('user_id').filter(keep), batch.column('home_hex').filter(keep)
+        first_h, last_h = first_h[ok], last_h[ok]
+        n = len(users)
+        if n == 0:
+            return
+        new_user = np.ones(n, dtype=bool)
+        new_user[1:] = pc.not_equal(users.slice(1), users.slice(0, n - 1)).to_numpy(zero_copy_only=False)
+        starts = np.flatnonzero(new_user)
+        ends = np.r_[starts[1:] - 1, n - 1]
+        ids, home = users.take(pa.array(starts)), homes.take(pa.array(starts))
+        season, latest_start, latest_end = first_h[starts], first_h[ends], last_h[ends]
+
+        if self.carry is not None:
+            if self.carry[0] == ids[0].as_py():
+                season[0] = self.carry[2]
+            else:
+                self.emit_carry()
+        self.carry = (ids[-1].as_py(), home[-1].as_py(), season[-1], latest_start[-1], latest_end[-1])
+        if len(starts) > 1:
+            last = len(starts) - 1
+            self.emit(ids.slice(0, last), home.slice(0, last), season[:-1], latest_start[:-1], latest_end[:-1])
+
+    def finish(self):
+        if self.carry is not None:
+            self.emit_carry()
+            self.carry = None
+
+    def emit_carry(self):
+        user, home, *cells = self.carry
+        self.emit(pa.array([user]), pa.array([home], pa.string()), *(np.array([v], dtype=np.uint64) for v in cells))
+
+    def emit(self, ids, exported_home, season, start, end):
+        """Stage rows: home_hex is the declared one, else season_home_hex; parents come from it."""
+        undeclared = exported_home.is_null().to_numpy(zero_copy_only=False)
+        declared_h, declared_ok = cells_to_int(exported_home)
+        home_h = np.where(declared_ok, declared_h, season)
+        scoped = pa.array(declared_ok | undeclared)
+        self.bad_homes += len(ids) - int(declared_ok.sum() + undeclared.sum())
+        no_cell = pa.scalar(None, pa.string())
+        self.users += len(ids)
+        self.writer.write_table(pa.table([
+            ids, exported_home, pc.if_else(pa.array(undeclared), int_to_cells(season), exported_home),
+            int_to_cells(start), int_to_cells(end), int_to_cells(season),
+            pc.if_else(scoped, int_to_cells(parent(home_h, ALL_RESOLUTION)), no_cell),
+            pc.if_else(scoped, int_to_cells(parent(home_h, CITY_RESOLUTION)), no_cell),
+        ], names=STAGE_COLUMNS))
+
+
+# ==================== Main ====================
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompute users' home hex columns from runs in one batch")
+    parser.add_argument('--dsn', default=LOCAL_DB_DSN, help='Postgres DSN (default: local supabase / $SIM_DB_DSN)')
+    parser.add_argument('--source', default='public.runs', help='Table with user_id, end_time, hex_path (default: public.runs)')
+    parser.add_argument('--since', type=str, help='Only runs ending on or after this date (YYYY-MM-DD)')
+    parser.add_argument('--block-mb', type=int, default=16, help='Export block size in MB (default: 16)')
+    parser.add_argument('--lock-timeout-ms', type=int, default=5000, help='Merge lock_timeout (default: 5000)')
+    parser.add_argument('--dry-run', action='store_true', help='Stage and report, but roll back the merge')
+    args = parser.parse_args()
+
+    export_conn = get_db_connection(args.dsn)
+    conn = get_db_connection(args.dsn)
+    t0 = time.perf_counter()
+    try:
+        with tempfile.TemporaryFile() as spool:
+            schema = pa.schema([(c, pa.string()) for c in STAGE_COLUMNS])
+            with pacsv.CSVWriter(spool, schema, write_options=pacsv.WriteOptions(include_header=False)) as writer:
+                homes = HomeHexes(writer)
+                for batch in stream_runs(export_conn, args.source, args.since, args.block_mb << 20):
+                    homes.add(batch)
+                homes.finish()
+            export_conn.rollback()
+            t_export = time.perf_counter() - t0
+            print(f"Streamed {homes.runs:,} runs -> {homes.users:,} users in {t_export:.1f}s "
+                  f"({homes.runs / max(t_export, 1e-9):,.0f} runs/s, {homes.skipped:,} runs with invalid cells skipped)",
+                  file=sys.stderr)
+
+            cur = conn.cursor()
+            cur.execute(f"SET LOCAL lock_timeout = '{args.lock_timeout_ms}ms'")
+            cur.execute(STAGE_SQL)
+            spool.seek(0)
+            cur.copy_expert(f"COPY _home_stage ({', '.join(STAGE_COLUMNS)}) FROM STDIN WITH (FORMAT csv)", spool)
+            cur.execute("ANALYZE _home_stage")
+            t_stage = time.perf_counter() - t0 - t_export
+
+            cur.execute(REPORT_SQL)
+            matched, moved, district, province, unscoped = cur.fetchone()
+            t1 = time.perf_counter()
+            cur.execute(MERGE_SQL)
+            updated = cur.rowcount
+            t_merge = time.perf_counter() - t1
+            if args.dry_run:
+                conn.rollback()
+            else:
+                conn.commit()
+    finally:
+        export_conn.close()
+        conn.close()
+
+    print(f"Staged in {t_stage:.1f}s, merged in {t_merge:.1f}s{' (dry run, rolled back)' if args.dry_run else ''}",
+          file=sys.stderr)
+    print("rule: district_hex / province_hex = Res 6 / Res 5 parents of home_hex "
+          "(declared, else season_home_hex)")
+    print(f"users with runs:       {matched:,}")
+    print(f"users updated:         {updated:,}")
+    print(f"district_hex changed:  {district:,}")
+    print(f"province_hex changed:  {province:,}")
+    print(f"  of which unscoped:   {unscoped:,}  (district or province was NULL)")
+    if homes.bad_homes:
+        print(f"invalid home_hex:      {homes.bad_homes:,}  (not a Res 9 cell; parents kept)")
+    if moved:
+        print(f"home moved meanwhile:  {moved:,}  (home_hex changed after the export; skipped, re-run to include)")
+    print(f"total:                 {time.perf_counter() - t0:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -19,6 +19,8 @@ DELETE FROM public.hexes;
 
 -- 5. Wipe ALL hex snapshots
 DELETE FROM public.hex_snapshot;
+DELETE FROM public.hex_snapshot_keyframe;
+DELETE FROM public.hex_snapshot_delta;
 
 -- 6. Wipe ALL leaderboard snapshots
 DELETE FROM public.season_leaderboard_snapshot;
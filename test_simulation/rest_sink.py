@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+RunStrict REST Sink: bulk upserts through PostgREST
+
+Pushes simulated days through the Supabase REST API (PostgREST) instead of
+SQL, for projects where only the API is reachable. Compared to a single
+requests.post() per table (push_day1_rest.py), it:
+
+  - keeps one keep-alive requests.Session per worker thread, so TLS is set
+    up once per worker instead of once per call
+  - splits rows into --chunk-size chunks and uploads a table's chunks from
+    --workers threads
+  - uploads in dependency stages: users first, then run_history / hexes /
+    hex_snapshot / daily_all_range_stats in parallel. A stage starts only when
+    the previous one has fully landed.
+  - upserts with Prefer: resolution=merge-duplicates and ?on_conflict=<key>,
+    so re-pushing a day is idempotent
+  - retries a chunk on connection errors, 429 and 5xx with jittered backoff.
+    On 413 (payload too large) it splits the chunk in half.
+
+users rows are written in full each day (team, season points and stats as of
+that day), so defections and point updates are upserts too. auth.users is
+not reachable over REST: create the simulation auth users first (day 1 SQL,
+or a seed migration). daily_buff_stats is left to calculate_daily_buffs():
+it has no natural key to upsert on. A real user (--user-id) is not pushed.
+
+The sink is used by simulate_day.py (--rest-url). On its own, this script
+simulates a season and pushes it, and reports rows/s per table:
+
+  --url         a real PostgREST / Supabase endpoint (service_role key from
+                --key or $SUPABASE_SERVICE_ROLE_KEY)
+  --mock        an in-process PostgREST stand-in. It keeps rows by conflict
+                key, rejects run_history rows whose user is missing (as the
+                FK would), answers 413 above --mock-max-body and fails
+                --mock-fail-rate of requests with 503. It also counts TCP
+                connections, which shows the keep-alive reuse.
+
+Usage:
+    python3 rest_sink.py --mock                                    # 1000 users, 3 days
+    python3 rest_sink.py --mock --users 20000 --chunk-size 2000 --workers 8 --mock-fail-rate 0.05
+    python3 rest_sink.py --url http://127.0.0.1:54321 --days 5
+    python3 simulate_day.py --days 40 --users 5000 --rest-url http://127.0.0.1:54321 --export-only
+
+Requires: pip install h3 requests
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    print("ERROR: requests required. Install with: pip install requests", file=sys.stderr)
+    sys.exit(1)
+
+import simulate_day as sim
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+# Conflict targets (primary keys) per table
+ON_CONFLICT = {
+    'users': 'id',
+    'run_history': 'id,run_date',
+    'hexes': 'id',
+    'hex_snapshot': 'hex_id,snapshot_date',
+    'hex_snapshot_keyframe': 'keyframe_date,hex_id',
+    'hex_snapshot_delta': 'snapshot_date,hex_id',
+    'daily_all_range_stats': 'stat_date',
+}
+
+RUN_COLUMNS = ('id', 'user_id', 'run_date', 'start_time', 'end_time', 'distance_km', 'duration_seconds',
+               'avg_pace_min_per_km', 'flip_count', 'flip_points', 'team_at_run', 'cv')
+
+
+class RestSinkError(RuntimeError):
+    """A chunk failed for good (non-retryable status, or out of retries)."""
+
+
+class RestSink:
+    """Chunked, parallel, retried PostgREST upserts. Also a simulate_day sink (write_day)."""
+
+    def __init__(self, url, key, chunk_size=1000, workers=4, retries=4, backoff=0.5, timeout=60, verbose=True):
+        self.base = url.rstrip('/') + '/rest/v1'
+        self.headers = {
+            'apikey': key,
+            'Authorization': f"Bearer {key}",
+            'Content-Type': 'application/json',
+            'Prefer': 'resolution=merge-duplicates,return=minimal',
+        }
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.verbose = verbose
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='rest-sink')
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.stats = {}   # table -> {'rows', 'requests', 'retries', 'splits', 'seconds'}
+
+    # ---------- transport ----------
+
+    def _session(self):
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers.update(self.headers)
+            self._local.session = session
+        return session
+
+    def _count(self, table, **deltas):
+        with self._lock:
+            stats = self.stats.setdefault(table, {'rows': 0, 'requests': 0, 'retries': 0, 'splits': 0, 'seconds': 0.0})
+            for k, v in deltas.items():
+                stats[k] += v
+
+    def _post_chunk(self, table, rows):
+        """Upsert one chunk: retry transient failures, halve on 413."""
+        url = f"{self.base}/{table}"
+        params = {'on_conflict': ON_CONFLICT[table]} if table in ON_CONFLICT else None
+        body = json.dumps(rows, separators=(',', ':'))
+        for attempt in range(self.retries + 1):
+            self._count(table, requests=1)
+            try:
+                resp = self._session().post(url, params=params, data=body, timeout=self.timeout)
+            except requests.RequestException as e:
+                status, detail = None, str(e)
+            else:
+                status, detail = resp.status_code, resp.text[:300]
+                if status in (200, 201, 204):
+                    self._count(table, rows=len(rows))
+                    return
+                if status == 413 and len(rows) > 1:
+                    self._count(table, splits=1)
+                    half = len(rows) // 2
+                    self._post_chunk(table, rows[:half])
+                    self._post_chunk(table, rows[half:])
+                    return
+                if status not in RETRY_STATUS:
+                    break
+            if attempt < self.retries:
+                self._count(table, retries=1)
+                time.sleep(self.backoff * 2 ** attempt * random.uniform(0.5, 1.0))
+        raise RestSinkError(f"{table}: {len(rows)} rows failed ({status}): {detail}")
+
+    # ---------- API ----------
+
+    def push(self, stages):
+        """Upload [[(table, rows), ...], ...]: tables within a stage in parallel, stages in order."""
+        for stage in stages:
+            t0 = time.perf_counter()
+            futures = []
+            for table, rows in stage:
+                for i in range(0, len(rows), self.chunk_size):
+                    futures.append((table, self.pool.submit(self._post_chunk, table, rows[i:i + self.chunk_size])))
+            errors = []
+            for table, future in futures:
+                try:
+                    future.result()
+                except RestSinkError as e:
+                    errors.append(str(e))
+            elapsed = time.perf_counter() - t0
+            for table, _ in stage:
+                self._count(table, seconds=elapsed)
+            if errors:
+                raise RestSinkError(f"{len(errors)} chunk(s) failed, later stages not sent. First: {errors[0]}")
+
+    def write_day(self, state, day, run_date_str, runs, hex_teams, day_flip_points, prev_hex_teams):
+        t0 = time.perf_counter()
+        stages = [[('users', users_rows(state))], day_rows(state, day, run_date_str, runs, hex_teams, prev_hex_teams)]
+        self.push(stages)
+        if self.verbose:
+            n = sum(len(rows) for stage in stages for _, rows in stage)
+            print(f"  REST day {day}: {n:,} rows in {time.perf_counter() - t0:.1f}s", file=sys.stderr)
+
+    def report(self):
+        print(f"{'table':<22} {'rows':>10} {'requests':>9} {'retries':>8} {'splits':>7} {'seconds':>8} {'rows/s':>10}")
+        for table, s in self.stats.items():
+            rate = s['rows'] / s['seconds'] if s['seconds'] else 0
+            print(f"{table:<22} {s['rows']:>10,} {s['requests']:>9,} {s['retries']:>8,} {s['splits']:>7,} "
+                  f"{s['seconds']:>8.2f} {rate:>10,.0f}")
+
+    def close(self):
+        self.pool.shutdown()
+
+
+# ==================== Rows ====================
+
+def users_rows(state):
+    """Every simulation user as of now: profile, current team, season stats."""
+    rows = []
+    for u in state['users']:
+        if u.get('is_real_user', False):
+            continue
+        stats = state['user_stats'].get(u['id'], {})
+        runs = stats.get('total_runs', 0)
+        cv_count = stats.get('cv_count', 0)
+        rows.append({
+            'id': u['id'], 'name': u['name'], 'team': u['team'], 'avatar': u['avatar'],
+            'home_hex': u['home_hex'], 'home_hex_start': u['home_hex'], 'home_hex_end': u['home_hex'],
+            'season_home_hex': u['home_hex'], 'nationality': u.get('nationality', 'KR'),
+            'season_points': state['user_points'].get(u['id'], 0),
+            'total_distance_km': stats.get('total_distance_km', 0),
+            'total_runs': runs,
+            'avg_pace_min_per_km': round(stats['sum_pace'] / runs, 2) if runs else None,
+            'avg_cv': round(stats['sum_cv'] / cv_count, 1) if cv_count else None,
+            'cv_run_count': cv_count,
+        })
+    return rows
+
+
+def day_rows(state, day, run_date_str, runs, hex_teams, prev_hex_teams):
+    """The day's tables that only depend on users: [(table, rows), ...]."""
+    tables = [('run_history', [{k: r[k] for k in RUN_COLUMNS} for r in runs])]
+    parents = {h: sim.h3.cell_to_parent(h, sim.ALL_RESOLUTION) for h in hex_teams}
+    tables.append(('hexes', [{'id': h, 'last_runner_team': t, 'parent_hex': parents[h]} for h, t in hex_teams.items()]))
+
+    storage = state.get('snapshot_storage')
+    if storage and prev_hex_teams and (day - 1) % storage['keyframe_every'] != 0:
+        tables.append(('hex_snapshot_delta', [
+            {'snapshot_date': run_date_str, 'hex_id': h, 'last_runner_team': t, 'parent_hex': parents[h]}
+            for h, t in hex_teams.items() if prev_hex_teams.get(h) != t]))
+    elif storage:
+        tables.append(('hex_snapshot_keyframe', [
+            {'keyframe_date': run_date_str, 'hex_id': h, 'last_runner_team': t, 'parent_hex': parents[h]}
+            for h, t in hex_teams.items()]))
+    else:
+        tables.append(('hex_snapshot', [
+            {'hex_id': h, 'last_runner_team': t, 'snapshot_date': run_date_str, 'parent_hex': parents[h]}
+            for h, t in hex_teams.items()]))
+
+    if hex_teams:
+        tc = {'red': 0, 'blue': 0, 'purple': 0}
+        for team in hex_teams.values():
+            if team in tc:
+                tc[team] += 1
+        tables.append(('daily_all_range_stats', [{
+            'stat_date': run_date_str, 'dominant_team': max(tc, key=tc.get),
+            'red_hex_count': tc['red'], 'blue_hex_count': tc['blue'], 'purple_hex_count': tc['purple']}]))
+    return [(table, rows) for table, rows in tables if rows]
+
+
+# ==================== Mock PostgREST ====================
+
+class MockPostgrest(ThreadingHTTPServer):
+    """PostgREST stand-in: keyed upserts, the run_history -> users FK, 413s and injected 503s."""
+
+    daemon_threads = True
+
+    def __init__(self, max_body, fail_rate, latency, seed):
+        super().__init__(('127.0.0.1', 0), MockHandler)
+        self.max_body = max_body
+        self.fail_rate = fail_rate
+        self.latency = latency
+        self.rng = random.Random(seed)
+        self.tables = {}
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.requests = 0
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'   # keep-alive
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, message=''):
+        body = json.dumps({'message': message}).encode() if message else b''
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        srv = self.server
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        with srv.lock:
+            srv.requests += 1
+            fail = srv.rng.random() < srv.fail_rate
+        if srv.latency:
+            time.sleep(srv.latency)
+        if len(body) > srv.max_body:
+            return self._reply(413, 'Payload Too Large')
+        if fail:
+            return self._reply(503, 'injected failure')
+        url = urlsplit(self.path)
+        table = url.path.rsplit('/', 1)[-1]
+        if 'merge-duplicates' not in self.headers.get('Prefer', ''):
+            return self._reply(400, 'expected Prefer: resolution=merge-duplicates')
+        keys = parse_qs(url.query).get('on_conflict', [''])[0].split(',')
+        rows = json.loads(body)
+        with srv.lock:
+            if table == 'run_history':
+                users = srv.tables.get('users', {})
+                missing = [r['user_id'] for r in rows if (r['user_id'],) not in users]
+                if missing:
+                    return self._reply(409, f'insert or update on table "run_history" violates foreign key '
+                                            f'constraint (user_id)=({missing[0]})')
+            store = srv.tables.setdefault(table, {})
+            for r in rows:
+                key = tuple(r[k] for k in keys)
+                store[key] = {**store.get(key, {}), **r}
+        self._reply(201)
+
+
+# ==================== CLI ====================
+
+def main():
+    parser = argparse.ArgumentParser(description='Simulate a season and push it through PostgREST in chunks')
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--url', help='Supabase / PostgREST base URL (e.g. http://127.0.0.1:54321)')
+    target.add_argument('--mock', action='store_true', help='Push to an in-process PostgREST stand-in')
+    parser.add_argument('--key', default=os.environ.get('SUPABASE_SERVICE_ROLE_KEY', ''),
+                        help='service_role key (default: $SUPABASE_SERVICE_ROLE_KEY)')
+    parser.add_argument('--users', type=int, default=1000, help='Simulated users (default: 1000)')
+    parser.add_argument('--days', type=int, default=3, help='Days to simulate and push (default: 3)')
+    parser.add_argument('--chunk-size', type=int, default=1000, help='Rows per request (default: 1000)')
+    parser.add_argument('--workers', type=int, default=4, help='Parallel uploads / sessions (default: 4)')
+    parser.add_argument('--retries', type=int, default=4, help='Retries per chunk (default: 4)')
+    parser.add_argument('--mock-max-body', type=int, default=1 << 20, help='Mock: 413 above this many bytes (default: 1MiB)')
+    parser.add_argument('--mock-fail-rate', type=float, default=0.0, help='Mock: share of requests failing with 503')
+    parser.add_argument('--mock-latency-ms', type=float, default=0.0, help='Mock: added latency per request')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    args = parser.parse_args()
+
+    mock = None
+    url, key = args.url, args.key
+    if args.mock:
+        mock = MockPostgrest(args.mock_max_body, args.mock_fail_rate, args.mock_latency_ms / 1000, args.seed).start()
+        url, key = mock.url, 'mock'
+    elif not key:
+        parser.error('--key or $SUPABASE_SERVICE_ROLE_KEY is required with --url')
+
+    same_hexes, other_hexes = sim.generate_hexes_from_home(sim.DEFAULT_HOME_HEX)
+    state = sim.default_state()
+    state.update(seed=args.seed, home_hex=sim.DEFAULT_HOME_HEX, same_hexes=same_hexes, other_hexes=other_hexes,
+                 total_days=args.days)
+    state['users'] = sim.generate_users(args.seed, same_hexes, other_hexes, args.users)
+
+    sink = RestSink(url, key, args.chunk_size, args.workers, args.retries, backoff=0.05 if mock else 0.5)
+    t0 = time.perf_counter()
+    try:
+        for day in range(1, args.days + 1):
+            run_date_str = sim.run_date_for_day(day, args.days).strftime('%Y-%m-%d')
+            _, runs, hex_teams, day_flip_points, prev_hex_teams = sim.simulate_day_step(state, day, args.days)
+            sink.write_day(state, day, run_date_str, runs, hex_teams, day_flip_points, prev_hex_teams)
+    finally:
+        sink.close()
+    elapsed = time.perf_counter() - t0
+
+    total = sum(s['rows'] for s in sink.stats.values())
+    print(f"\n{args.days} days, {total:,} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/s incl. simulation), "
+          f"chunk {args.chunk_size}, {args.workers} workers")
+    sink.report()
+    if mock is not None:
+        stored = {t: len(rows) for t, rows in mock.tables.items()}
+        print(f"\nmock: {mock.requests:,} requests over {mock.connections} connections; rows stored: "
+              + ', '.join(f"{t} {n:,}" for t, n in stored.items()))
+        mock.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,2637 +0,0 @@
--- ============================================================
--- RunStrict Simulation: D-40 to D-1 (ending 2026-02-04)
--- Generated: 2026-02-04 21:26:56
--- ============================================================
-
--- Run this SQL in Supabase SQL Editor:
--- https://supabase.com/dashboard/project/vhooaslzkmbnzmzwiium/sql
-
--- ============================================================
--- RESET ALL DATA
--- ============================================================
-TRUNCATE public.run_history;
-TRUNCATE public.hexes;
-TRUNCATE public.daily_flips;
-DELETE FROM public.users WHERE id LIKE 'aaaaaaaa-%';
-
--- ============================================================
--- USERS (100 total: 40 Red, 40 Blue, 20 Purple)
--- ============================================================
-INSERT INTO public.users (id, name, team, avatar, season_points) VALUES
-  ('aaaaaaaa-0000-0000-0000-000000000000', 'AlexRunner', 'red', '🏃', 0),
-  ('aaaaaaaa-0001-0001-0001-000000000001', 'JordanDash', 'red', '🏃‍♂️', 0),
-  ('aaaaaaaa-0002-0002-0002-000000000002', 'CaseySwift', 'red', '🏃‍♀️', 0),
-  ('aaaaaaaa-0003-0003-0003-000000000003', 'RileyFlash', 'red', '🦊', 0),
-  ('aaaaaaaa-0004-0004-0004-000000000004', 'MorganBolt', 'red', '🐺', 0),
-  ('aaaaaaaa-0005-0005-0005-000000000005', 'TaylorStride', 'red', '🦅', 0),
-  ('aaaaaaaa-0006-0006-0006-000000000006', 'QuinnPace', 'red', '🐬', 0),
-  ('aaaaaaaa-0007-0007-0007-000000000007', 'AverySprint', 'red', '🔥', 0),
-  ('aaaaaaaa-0008-0008-0008-000000000008', 'BlakeBlaze', 'red', '💨', 0),
-  ('aaaaaaaa-0009-0009-0009-000000000009', 'CameronStorm', 'red', '⚡', 0),
-  ('aaaaaaaa-0010-0010-0010-000000000010', 'DakotaWind', 'red', '🌊', 0),
-  ('aaaaaaaa-0011-0011-0011-000000000011', 'EmeryFire', 'red', '🌪️', 0),
-  ('aaaaaaaa-0012-0012-0012-000000000012', 'FinleyWave', 'red', '💎', 0),
-  ('aaaaaaaa-0013-0013-0013-000000000013', 'GrayTide', 'red', '🚀', 0),
-  ('aaaaaaaa-0014-0014-0014-000000000014', 'HarperFrost', 'red', '🌟', 0),
-  ('aaaaaaaa-0015-0015-0015-000000000015', 'IndigoThunder', 'red', '✨', 0),
-  ('aaaaaaaa-0016-0016-0016-000000000016', 'JamieShadow', 'red', '🏃', 0),
-  ('aaaaaaaa-0017-0017-0017-000000000017', 'KaiNight', 'red', '🏃‍♂️', 0),
-  ('aaaaaaaa-0018-0018-0018-000000000018', 'LoganDawn', 'red', '🏃‍♀️', 0),
-  ('aaaaaaaa-0019-0019-0019-000000000019', 'MasonStar', 'red', '🦊', 0),
-  ('aaaaaaaa-0020-0020-0020-000000000020', 'NoahMoon', 'red', '🐺', 0),
-  ('aaaaaaaa-0021-0021-0021-000000000021', 'OliverSun', 'red', '🦅', 0),
-  ('aaaaaaaa-0022-0022-0022-000000000022', 'ParkerSky', 'red', '🐬', 0),
-  ('aaaaaaaa-0023-0023-0023-000000000023', 'ReeseCloud', 'red', '🔥', 0),
-  ('aaaaaaaa-0024-0024-0024-000000000024', 'SageStone', 'red', '💨', 0),
-  ('aaaaaaaa-0025-0025-0025-000000000025', 'SkylerSteel', 'red', '⚡', 0),
-  ('aaaaaaaa-0026-0026-0026-000000000026', 'TatumIron', 'red', '🌊', 0),
-  ('aaaaaaaa-0027-0027-0027-000000000027', 'RiverGold', 'red', '🌪️', 0),
-  ('aaaaaaaa-0028-0028-0028-000000000028', 'WinterSilver', 'red', '💎', 0),
-  ('aaaaaaaa-0029-0029-0029-000000000029', 'PhoenixBronze', 'red', '🚀', 0),
-  ('aaaaaaaa-0030-0030-0030-000000000030', 'StormCopper', 'red', '🌟', 0),
-  ('aaaaaaaa-0031-0031-0031-000000000031', 'ArrowChrome', 'red', '✨', 0),
-  ('aaaaaaaa-0032-0032-0032-000000000032', 'BlazeRunner', 'red', '🏃', 0),
-  ('aaaaaaaa-0033-0033-0033-000000000033', 'CloudDash', 'red', '🏃‍♂️', 0),
-  ('aaaaaaaa-0034-0034-0034-000000000034', 'DawnSwift', 'red', '🏃‍♀️', 0),
-  ('aaaaaaaa-0035-0035-0035-000000000035', 'EchoFlash', 'red', '🦊', 0),
-  ('aaaaaaaa-0036-0036-0036-000000000036', 'FalconBolt', 'red', '🐺', 0),
-  ('aaaaaaaa-0037-0037-0037-000000000037', 'GalaxyStride', 'red', '🦅', 0),
-  ('aaaaaaaa-0038-0038-0038-000000000038', 'HawkPace', 'red', '🐬', 0),
-  ('aaaaaaaa-0039-0039-0039-000000000039', 'IonSprint', 'red', '🔥', 0),
-  ('aaaaaaaa-0040-0040-0040-000000000040', 'JadeBlaze', 'blue', '💨', 0),
-  ('aaaaaaaa-0041-0041-0041-000000000041', 'KnightStorm', 'blue', '⚡', 0),
-  ('aaaaaaaa-0042-0042-0042-000000000042', 'LunaWind', 'blue', '🌊', 0),
-  ('aaaaaaaa-0043-0043-0043-000000000043', 'MidnightFire', 'blue', '🌪️', 0),
-  ('aaaaaaaa-0044-0044-0044-000000000044', 'NovaWave', 'blue', '💎', 0),
-  ('aaaaaaaa-0045-0045-0045-000000000045', 'OrionTide', 'blue', '🚀', 0),
-  ('aaaaaaaa-0046-0046-0046-000000000046', 'PulseFrost', 'blue', '🌟', 0),
-  ('aaaaaaaa-0047-0047-0047-000000000047', 'QuantumThunder', 'blue', '✨', 0),
-  ('aaaaaaaa-0048-0048-0048-000000000048', 'RavenShadow', 'blue', '🏃', 0),
-  ('aaaaaaaa-0049-0049-0049-000000000049', 'ShadowNight', 'blue', '🏃‍♂️', 0),
-  ('aaaaaaaa-0050-0050-0050-000000000050', 'ThunderDawn', 'blue', '🏃‍♀️', 0),
-  ('aaaaaaaa-0051-0051-0051-000000000051', 'UltraStar', 'blue', '🦊', 0),
-  ('aaaaaaaa-0052-0052-0052-000000000052', 'VegaMoon', 'blue', '🐺', 0),
-  ('aaaaaaaa-0053-0053-0053-000000000053', 'WolfSun', 'blue', '🦅', 0),
-  ('aaaaaaaa-0054-0054-0054-000000000054', 'XenonSky', 'blue', '🐬', 0),
-  ('aaaaaaaa-0055-0055-0055-000000000055', 'ZenCloud', 'blue', '🔥', 0),
-  ('aaaaaaaa-0056-0056-0056-000000000056', 'AlexStone1', 'blue', '💨', 0),
-  ('aaaaaaaa-0057-0057-0057-000000000057', 'JordanSteel1', 'blue', '⚡', 0),
-  ('aaaaaaaa-0058-0058-0058-000000000058', 'CaseyIron1', 'blue', '🌊', 0),
-  ('aaaaaaaa-0059-0059-0059-000000000059', 'RileyGold1', 'blue', '🌪️', 0),
-  ('aaaaaaaa-0060-0060-0060-000000000060', 'MorganSilver1', 'blue', '💎', 0),
-  ('aaaaaaaa-0061-0061-0061-000000000061', 'TaylorBronze1', 'blue', '🚀', 0),
-  ('aaaaaaaa-0062-0062-0062-000000000062', 'QuinnCopper1', 'blue', '🌟', 0),
-  ('aaaaaaaa-0063-0063-0063-000000000063', 'AveryChrome1', 'blue', '✨', 0),
-  ('aaaaaaaa-0064-0064-0064-000000000064', 'BlakeRunner1', 'blue', '🏃', 0),
-  ('aaaaaaaa-0065-0065-0065-000000000065', 'CameronDash1', 'blue', '🏃‍♂️', 0),
-  ('aaaaaaaa-0066-0066-0066-000000000066', 'DakotaSwift1', 'blue', '🏃‍♀️', 0),
-  ('aaaaaaaa-0067-0067-0067-000000000067', 'EmeryFlash1', 'blue', '🦊', 0),
-  ('aaaaaaaa-0068-0068-0068-000000000068', 'FinleyBolt1', 'blue', '🐺', 0),
-  ('aaaaaaaa-0069-0069-0069-000000000069', 'GrayStride1', 'blue', '🦅', 0),
-  ('aaaaaaaa-0070-0070-0070-000000000070', 'HarperPace1', 'blue', '🐬', 0),
-  ('aaaaaaaa-0071-0071-0071-000000000071', 'IndigoSprint1', 'blue', '🔥', 0),
-  ('aaaaaaaa-0072-0072-0072-000000000072', 'JamieBlaze1', 'blue', '💨', 0),
-  ('aaaaaaaa-0073-0073-0073-000000000073', 'KaiStorm1', 'blue', '⚡', 0),
-  ('aaaaaaaa-0074-0074-0074-000000000074', 'LoganWind1', 'blue', '🌊', 0),
-  ('aaaaaaaa-0075-0075-0075-000000000075', 'MasonFire1', 'blue', '🌪️', 0),
-  ('aaaaaaaa-0076-0076-0076-000000000076', 'NoahWave1', 'blue', '💎', 0),
-  ('aaaaaaaa-0077-0077-0077-000000000077', 'OliverTide1', 'blue', '🚀', 0),
-  ('aaaaaaaa-0078-0078-0078-000000000078', 'ParkerFrost1', 'blue', '🌟', 0),
-  ('aaaaaaaa-0079-0079-0079-000000000079', 'ReeseThunder1', 'blue', '✨', 0),
-  ('aaaaaaaa-0080-0080-0080-000000000080', 'SageShadow1', 'purple', '🏃', 0),
-  ('aaaaaaaa-0081-0081-0081-000000000081', 'SkylerNight1', 'purple', '🏃‍♂️', 0),
-  ('aaaaaaaa-0082-0082-0082-000000000082', 'TatumDawn1', 'purple', '🏃‍♀️', 0),
-  ('aaaaaaaa-0083-0083-0083-000000000083', 'RiverStar1', 'purple', '🦊', 0),
-  ('aaaaaaaa-0084-0084-0084-000000000084', 'WinterMoon1', 'purple', '🐺', 0),
-  ('aaaaaaaa-0085-0085-0085-000000000085', 'PhoenixSun1', 'purple', '🦅', 0),
-  ('aaaaaaaa-0086-0086-0086-000000000086', 'StormSky1', 'purple', '🐬', 0),
-  ('aaaaaaaa-0087-0087-0087-000000000087', 'ArrowCloud1', 'purple', '🔥', 0),
-  ('aaaaaaaa-0088-0088-0088-000000000088', 'BlazeStone1', 'purple', '💨', 0),
-  ('aaaaaaaa-0089-0089-0089-000000000089', 'CloudSteel1', 'purple', '⚡', 0),
-  ('aaaaaaaa-0090-0090-0090-000000000090', 'DawnIron1', 'purple', '🌊', 0),
-  ('aaaaaaaa-0091-0091-0091-000000000091', 'EchoGold1', 'purple', '🌪️', 0),
-  ('aaaaaaaa-0092-0092-0092-000000000092', 'FalconSilver1', 'purple', '💎', 0),
-  ('aaaaaaaa-0093-0093-0093-000000000093', 'GalaxyBronze1', 'purple', '🚀', 0),
-  ('aaaaaaaa-0094-0094-0094-000000000094', 'HawkCopper1', 'purple', '🌟', 0),
-  ('aaaaaaaa-0095-0095-0095-000000000095', 'IonChrome1', 'purple', '✨', 0),
-  ('aaaaaaaa-0096-0096-0096-000000000096', 'JadeRunner1', 'purple', '🏃', 0),
-  ('aaaaaaaa-0097-0097-0097-000000000097', 'KnightDash1', 'purple', '🏃‍♂️', 0),
-  ('aaaaaaaa-0098-0098-0098-000000000098', 'LunaSwift1', 'purple', '🏃‍♀️', 0),
-  ('aaaaaaaa-0099-0099-0099-000000000099', 'MidnightFlash1', 'purple', '🦊', 0)
-ON CONFLICT (id) DO UPDATE SET
-  name = EXCLUDED.name,
-  team = EXCLUDED.team,
-  avatar = EXCLUDED.avatar,
-  season_points = 0;
-
--- ============================================================
--- RUN HISTORY (2222 runs)
--- ============================================================
-INSERT INTO public.run_history (id, user_id, run_date, start_time, end_time, distance_km, duration_seconds, avg_pace_min_per_km, flip_count, flip_points, team_at_run, cv) VALUES
-  ('b9c24109-ca29-49a6-95d0-5b3b8859c09a', 'aaaaaaaa-0003-0003-0003-000000000003', '2025-12-27', '2025-12-27 13:04:00+00', '2025-12-27 13:56:00+00', 11.16, 3120, 4.66, 27, 108, 'red', 8.0),
-  ('e81d11bb-5acb-49ec-a5a6-1788cfed87b7', 'aaaaaaaa-0094-0094-0094-000000000094', '2025-12-27', '2025-12-27 18:57:00+00', '2025-12-27 19:33:58+00', 4.74, 2218, 7.8, 11, 22, 'purple', 22.3),
-  ('cac920f4-d808-4857-bbb3-80ac6e856b8c', 'aaaaaaaa-0035-0035-0035-000000000035', '2025-12-27', '2025-12-27 19:00:00+00', '2025-12-27 19:55:20+00', 9.59, 3320, 5.77, 21, 42, 'red', 24.9),
-  ('64c15d9a-90db-4618-a689-db10f441688f', 'aaaaaaaa-0031-0031-0031-000000000031', '2025-12-27', '2025-12-27 11:59:00+00', '2025-12-27 13:48:00+00', 14.4, 6540, 7.57, 27, 108, 'red', 8.8),
-  ('740e19d0-a2d8-467a-b99c-0f5d9aa39e44', 'aaaaaaaa-0028-0028-0028-000000000028', '2025-12-27', '2025-12-27 21:15:00+00', '2025-12-27 22:18:31+00', 9.01, 3811, 7.05, 14, 14, 'red', 7.4),
-  ('80697e81-9629-4cd0-a611-275f64fdfda4', 'aaaaaaaa-0017-0017-0017-000000000017', '2025-12-27', '2025-12-27 17:46:00+00', '2025-12-27 18:20:50+00', 5.62, 2090, 6.2, 7, 7, 'red', 14.9),
-  ('3be59c67-fbe1-4ea5-a936-6d01501814e7', 'aaaaaaaa-0013-0013-0013-000000000013', '2025-12-27', '2025-12-27 12:10:00+00', '2025-12-27 12:58:12+00', 6.41, 2892, 7.52, 6, 6, 'red', 8.5),
-  ('a41a69ed-c2ce-4c9d-8e7b-6eeaf908c533', 'aaaaaaaa-0086-0086-0086-000000000086', '2025-12-27', '2025-12-27 15:03:00+00', '2025-12-27 15:47:59+00', 7.28, 2699, 6.18, 18, 18, 'purple', 22.0),
-  ('264ba770-906f-4e5e-a596-bfeb10539702', 'aaaaaaaa-0069-0069-0069-000000000069', '2025-12-27', '2025-12-27 07:43:00+00', '2025-12-27 07:59:21+00', 2.65, 981, 6.17, 6, 6, 'blue', 23.2),
-  ('ea423657-f550-4096-aa1c-f58780a8ec09', 'aaaaaaaa-0011-0011-0011-000000000011', '2025-12-27', '2025-12-27 16:18:00+00', '2025-12-27 17:36:00+00', 13.2, 4680, 5.91, 19, 38, 'red', 23.7),
-  ('f3ff4e85-d702-47b8-8bcc-1b5d07302a85', 'aaaaaaaa-0075-0075-0075-000000000075', '2025-12-27', '2025-12-27 14:38:00+00', '2025-12-27 15:08:03+00', 4.05, 1803, 7.42, 10, 20, 'blue', 18.5),
-  ('1eb2eef1-76f8-4e5b-bef3-c0f5e7de0373', 'aaaaaaaa-0054-0054-0054-000000000054', '2025-12-27', '2025-12-27 13:10:00+00', '2025-12-27 13:37:01+00', 4.74, 1621, 5.7, 10, 10, 'blue', 18.1),
-  ('299e4f66-55e2-4d0d-88d6-3fd494ac93a8', 'aaaaaaaa-0004-0004-0004-000000000004', '2025-12-27', '2025-12-27 12:17:00+00', '2025-12-27 13:31:50+00', 11.64, 4490, 6.43, 12, 48, 'red', 12.4),
-  ('bf0477d7-c28e-4d55-9453-33f3bd41f543', 'aaaaaaaa-0099-0099-0099-000000000099', '2025-12-27', '2025-12-27 11:25:00+00', '2025-12-27 11:53:17+00', 4.07, 1697, 6.95, 10, 30, 'purple', 11.4),
-  ('5715807e-db95-4788-bcf7-916614a2c3dc', 'aaaaaaaa-0090-0090-0090-000000000090', '2025-12-27', '2025-12-27 16:46:00+00', '2025-12-27 17:33:12+00', 6.27, 2832, 7.53, 13, 26, 'purple', 24.3),
-  ('839c0b54-e8c2-4b1f-8609-557d567e1be5', 'aaaaaaaa-0027-0027-0027-000000000027', '2025-12-27', '2025-12-27 17:35:00+00', '2025-12-27 18:48:41+00', 12.22, 4421, 6.03, 15, 45, 'red', 24.7),
-  ('e85dd684-4e73-48a8-973f-c1b8dbc33caa', 'aaaaaaaa-0029-0029-0029-000000000029', '2025-12-27', '2025-12-27 08:49:00+00', '2025-12-27 10:00:23+00', 12.84, 4283, 5.56, 11, 11, 'red', 7.6),
-  ('625357f2-8bf8-4be3-8b05-376f6c84b5cf', 'aaaaaaaa-0064-0064-0064-000000000064', '2025-12-27', '2025-12-27 20:28:00+00', '2025-12-27 21:06:33+00', 7.53, 2313, 5.12, 15, 45, 'blue', 24.1),
-  ('4e27c42d-acd8-4194-ab6d-54a3600352ae', 'aaaaaaaa-0077-0077-0077-000000000077', '2025-12-27', '2025-12-27 09:14:00+00', '2025-12-27 09:42:50+00', 5.37, 1730, 5.37, 11, 11, 'blue', 17.0),
-  ('50515f77-e0d9-4cc1-b271-38032dd96a66', 'aaaaaaaa-0092-0092-0092-000000000092', '2025-12-27', '2025-12-27 18:34:00+00', '2025-12-27 19:09:06+00', 6.98, 2106, 5.03, 15, 30, 'purple', 7.7),
-  ('49873098-3c82-4377-a292-ab2cfe99ae5d', 'aaaaaaaa-0071-0071-0071-000000000071', '2025-12-27', '2025-12-27 17:17:00+00', '2025-12-27 18:32:07+00', 11.72, 4507, 6.41, 22, 44, 'blue', 16.3),
-  ('9150fedb-b565-4aa6-80f0-7440b8ef76cd', 'aaaaaaaa-0025-0025-0025-000000000025', '2025-12-27', '2025-12-27 17:45:00+00', '2025-12-27 19:12:17+00', 11.78, 5237, 7.41, 17, 68, 'red', 8.5),
-  ('1c4ce10b-2939-48b4-bd2e-bf06087b5c19', 'aaaaaaaa-0091-0091-0091-000000000091', '2025-12-27', '2025-12-27 21:41:00+00', '2025-12-27 22:11:05+00', 4.58, 1805, 6.57, 11, 11, 'purple', 21.3),
-  ('d8b113f5-0f4e-4ddb-9c4e-7ba5daf8df02', 'aaaaaaaa-0053-0053-0053-000000000053', '2025-12-27', '2025-12-27 13:56:00+00', '2025-12-27 14:44:06+00', 6.44, 2886, 7.47, 13, 13, 'blue', 21.1),
-  ('bb5fd41f-a977-4ece-a45d-3328e0692c9a', 'aaaaaaaa-0095-0095-0095-000000000095', '2025-12-27', '2025-12-27 18:31:00+00', '2025-12-27 19:27:02+00', 7.86, 3362, 7.13, 17, 17, 'purple', 15.5),
-  ('3e73128c-ba60-4dcf-bbae-359c8e150e5f', 'aaaaaaaa-0057-0057-0057-000000000057', '2025-12-27', '2025-12-27 11:20:00+00', '2025-12-27 12:09:14+00', 9.22, 2954, 5.34, 11, 11, 'blue', 13.5),
-  ('091511e3-7d73-4b05-8f73-efc5743ed032', 'aaaaaaaa-0097-0097-0097-000000000097', '2025-12-27', '2025-12-27 08:53:00+00', '2025-12-27 09:15:38+00', 3.55, 1358, 6.38, 6, 12, 'purple', 19.8),
-  ('d37a2029-08a8-43b3-934b-848c3c23c817', 'aaaaaaaa-0000-0000-0000-000000000000', '2025-12-27', '2025-12-27 20:30:00+00', '2025-12-27 20:53:57+00', 4.52, 1437, 5.3, 5, 15, 'red', 6.9),
-  ('1d39a01c-d350-49ca-99d5-a3c054056170', 'aaaaaaaa-0020-0020-0020-000000000020', '2025-12-27', '2025-12-27 19:58:00+00', '2025-12-27 20:37:48+00', 7.73, 2388, 5.15, 11, 44, 'red', 4.1),
-  ('9bf65d5d-59c4-4d03-b18b-7b81a79bbeb9', 'aaaaaaaa-0088-0088-0088-000000000088', '2025-12-27', '2025-12-27 12:18:00+00', '2025-12-27 13:16:16+00', 7.76, 3496, 7.51, 15, 15, 'purple', 24.8),
-  ('7d8e8110-22c1-44d2-ab2b-1de36c1fe6d7', 'aaaaaaaa-0043-0043-0043-000000000043', '2025-12-27', '2025-12-27 15:38:00+00', '2025-12-27 16:55:52+00', 11.19, 4672, 6.96, 18, 36, 'blue', 13.0),
-  ('555d1e43-8764-45b0-b3fd-083778039500', 'aaaaaaaa-0073-0073-0073-000000000073', '2025-12-27', '2025-12-27 20:05:00+00', '2025-12-27 20:30:18+00', 5.25, 1518, 4.82, 7, 21, 'blue', 24.2),
-  ('abf1951a-f440-4b12-b9d1-6fd56295a823', 'aaaaaaaa-0019-0019-0019-000000000019', '2025-12-27', '2025-12-27 06:12:00+00', '2025-12-27 07:00:05+00', 8.11, 2885, 5.93, 13, 52, 'red', 10.1),
-  ('cedfc4b3-cd06-43df-ba4f-24ee457e5075', 'aaaaaaaa-0084-0084-0084-000000000084', '2025-12-27', '2025-12-27 08:41:00+00', '2025-12-27 09:39:22+00', 8.74, 3502, 6.68, 14, 28, 'purple', 14.0),
-  ('d43b0be4-d92b-4fc3-8280-388e27979fbf', 'aaaaaaaa-0081-0081-0081-000000000081', '2025-12-27', '2025-12-27 12:36:00+00', '2025-12-27 13:55:59+00', 12.82, 4799, 6.24, 22, 22, 'purple', 18.8),
-  ('66746bae-696b-4739-b419-61ba0fa1c874', 'aaaaaaaa-0093-0093-0093-000000000093', '2025-12-27', '2025-12-27 09:04:00+00', '2025-12-27 09:56:21+00', 6.98, 3141, 7.5, 9, 18, 'purple', 12.0),
-  ('08fae81d-c79b-41e8-952c-7aaaf856772e', 'aaaaaaaa-0085-0085-0085-000000000085', '2025-12-27', '2025-12-27 15:50:00+00', '2025-12-27 16:53:54+00', 8.1, 3834, 7.89, 7, 7, 'purple', 10.4),
-  ('c1dc4dd9-5db9-4fac-878a-efc9d49634f4', 'aaaaaaaa-0024-0024-0024-000000000024', '2025-12-27', '2025-12-27 07:39:00+00', '2025-12-27 07:54:41+00', 2.73, 941, 5.75, 3, 6, 'red', 12.5),
-  ('c5e5a51c-2831-499c-8548-7b4a891ce590', 'aaaaaaaa-0006-0006-0006-000000000006', '2025-12-27', '2025-12-27 13:00:00+00', '2025-12-27 14:28:50+00', 13.32, 5330, 6.67, 28, 112, 'red', 8.3),
-  ('e8845edb-0a5e-40e9-8c04-8e94754c5dab', 'aaaaaaaa-0022-0022-0022-000000000022', '2025-12-27', '2025-12-27 21:32:00+00', '2025-12-27 22:36:35+00', 9.36, 3875, 6.9, 13, 39, 'red', 19.4),
-  ('0f95378d-a4fd-42e4-a3bd-6e0773214ffd', 'aaaaaaaa-0070-0070-0070-000000000070', '2025-12-27', '2025-12-27 18:07:00+00', '2025-12-27 19:49:51+00', 13.88, 6171, 7.41, 29, 58, 'blue', 8.7),
-  ('adbaf07f-932b-40e3-a584-1d76fe53109d', 'aaaaaaaa-0060-0060-0060-000000000060', '2025-12-27', '2025-12-27 18:37:00+00', '2025-12-27 19:06:50+00', 3.82, 1790, 7.81, 4, 12, 'blue', 9.7),
-  ('6a7825f7-ce2a-4da7-9030-86be40c538d3', 'aaaaaaaa-0038-0038-0038-000000000038', '2025-12-27', '2025-12-27 11:37:00+00', '2025-12-27 12:35:42+00', 11.65, 3522, 5.04, 20, 20, 'red', 12.1),
-  ('fb780fb5-9d79-48e1-bf1c-fe46c4fb6c8d', 'aaaaaaaa-0016-0016-0016-000000000016', '2025-12-27', '2025-12-27 15:01:00+00', '2025-12-27 15:37:16+00', 4.81, 2176, 7.54, 6, 12, 'red', 10.2),
-  ('456bae78-578b-4401-bb60-9856168f17ef', 'aaaaaaaa-0051-0051-0051-000000000051', '2025-12-27', '2025-12-27 12:39:00+00', '2025-12-27 12:58:59+00', 4.27, 1199, 4.68, 7, 21, 'blue', 19.3),
-  ('03f8c1c3-e2a3-4a16-a497-49f4bcf203a7', 'aaaaaaaa-0002-0002-0002-000000000002', '2025-12-27', '2025-12-27 18:43:00+00', '2025-12-27 19:01:32+00', 2.56, 1112, 7.24, 2, 8, 'red', 22.1),
-  ('ab7730ee-23ec-4c9c-8acf-e87118b9d444', 'aaaaaaaa-0046-0046-0046-000000000046', '2025-12-27', '2025-12-27 15:24:00+00', '2025-12-27 15:47:45+00', 3.4, 1425, 6.99, 7, 21, 'blue', 12.8),
-  ('a53fd52c-11c8-4afa-b903-bef4a41c9b2c', 'aaaaaaaa-0083-0083-0083-000000000083', '2025-12-27', '2025-12-27 08:26:00+00', '2025-12-27 10:00:57+00', 14.93, 5697, 6.36, 32, 96, 'purple', 13.0),
-  ('749429a1-092d-4d51-b71d-54424f2e5aca', 'aaaaaaaa-0034-0034-0034-000000000034', '2025-12-27', '2025-12-27 13:36:00+00', '2025-12-27 14:21:04+00', 6.6, 2704, 6.83, 10, 10, 'red', 19.5),
-  ('53b3bf4e-b322-4960-9905-a2b0df8ace6f', 'aaaaaaaa-0007-0007-0007-000000000007', '2025-12-27', '2025-12-27 07:09:00+00', '2025-12-27 07:38:38+00', 4.94, 1778, 6.0, 7, 28, 'red', 15.3),
-  ('e854a840-9a63-45ba-a317-a5e6a492e0e4', 'aaaaaaaa-0062-0062-0062-000000000062', '2025-12-27', '2025-12-27 20:33:00+00', '2025-12-27 22:04:52+00', 11.63, 5512, 7.9, 26, 52, 'blue', 5.0),
-  ('3e751622-0b15-49b0-8c3a-9efd4dfb1d88', 'aaaaaaaa-0005-0005-0005-000000000005', '2025-12-27', '2025-12-27 07:55:00+00', '2025-12-27 08:44:43+00', 10.67, 2983, 4.66, 10, 40, 'red', 11.7),
-  ('f292bc86-64df-456b-b9e1-aa49b9df595a', 'aaaaaaaa-0068-0068-0068-000000000068', '2025-12-27', '2025-12-27 07:25:00+00', '2025-12-27 08:01:25+00', 6.07, 2185, 6.0, 12, 36, 'blue', 11.9),
-  ('3810a69c-927b-4009-b297-fd7310184d11', 'aaaaaaaa-0018-0018-0018-000000000018', '2025-12-27', '2025-12-27 16:32:00+00', '2025-12-27 18:06:42+00', 13.32, 5682, 7.11, 20, 20, 'red', 7.9),
-  ('f0da65ff-c00c-4b25-9eaf-d87c8e853e1a', 'aaaaaaaa-0040-0040-0040-000000000040', '2025-12-27', '2025-12-27 06:28:00+00', '2025-12-27 06:46:06+00', 2.96, 1086, 6.12, 6, 12, 'blue', 3.8),
-  ('a582d044-c9d0-4fb7-af2b-7f580ecd63bc', 'aaaaaaaa-0039-0039-0039-000000000039', '2025-12-27', '2025-12-27 15:05:00+00', '2025-12-27 16:34:49+00', 13.82, 5389, 6.5, 16, 32, 'red', 7.1),
-  ('c722637c-7220-49fa-946b-da7ca757544b', 'aaaaaaaa-0023-0023-0023-000000000023', '2025-12-27', '2025-12-27 09:04:00+00', '2025-12-27 09:51:48+00', 9.58, 2868, 4.99, 10, 20, 'red', 10.7),
-  ('d0e6ddb4-0dba-477f-94a2-480f71c50d27', 'aaaaaaaa-0036-0036-0036-000000000036', '2025-12-27', '2025-12-27 12:28:00+00', '2025-12-27 13:10:28+00', 5.85, 2548, 7.26, 5, 15, 'red', 14.2),
-  ('e9a895a8-2dfd-4774-9d06-4c4dce14c3c5', 'aaaaaaaa-0012-0012-0012-000000000012', '2025-12-27', '2025-12-27 14:05:00+00', '2025-12-27 15:15:52+00', 9.94, 4252, 7.13, 4, 4, 'red', 20.2),
-  ('52d67dcb-d31b-453c-a90b-4fc4f6357f3f', 'aaaaaaaa-0034-0034-0034-000000000034', '2025-12-28', '2025-12-28 16:15:00+00', '2025-12-28 17:21:31+00', 10.22, 3991, 6.51, 7, 7, 'red', 18.8),
-  ('d5294771-a1f7-4971-80dd-9290de26ccf9', 'aaaaaaaa-0057-0057-0057-000000000057', '2025-12-28', '2025-12-28 06:55:00+00', '2025-12-28 08:12:15+00', 11.53, 4635, 6.7, 25, 50, 'blue', 20.0),
-  ('d2a70424-27f5-4165-90aa-e118f37d18ea', 'aaaaaaaa-0065-0065-0065-000000000065', '2025-12-28', '2025-12-28 19:22:00+00', '2025-12-28 20:19:26+00', 10.52, 3446, 5.46, 14, 14, 'blue', 20.6),
-  ('be47b5db-fc19-4781-adc4-d66d7f0232df', 'aaaaaaaa-0018-0018-0018-000000000018', '2025-12-28', '2025-12-28 09:43:00+00', '2025-12-28 10:37:58+00', 7.81, 3298, 7.04, 8, 8, 'red', 23.1),
-  ('fc7b2918-6d85-4edc-9e9d-cd2c6c72fdb1', 'aaaaaaaa-0055-0055-0055-000000000055', '2025-12-28', '2025-12-28 19:13:00+00', '2025-12-28 19:58:31+00', 7.85, 2731, 5.8, 13, 39, 'blue', 12.8),
-  ('7142cf0c-1b49-482b-a64f-c176962f58da', 'aaaaaaaa-0011-0011-0011-000000000011', '2025-12-28', '2025-12-28 17:45:00+00', '2025-12-28 19:07:13+00', 14.95, 4933, 5.5, 19, 57, 'red', 23.2),
-  ('40ee6273-2135-4f05-b257-e0e944519784', 'aaaaaaaa-0028-0028-0028-000000000028', '2025-12-28', '2025-12-28 13:08:00+00', '2025-12-28 14:19:57+00', 11.35, 4317, 6.34, 7, 14, 'red', 19.9),
-  ('64c39807-9db1-4672-b111-684137522831', 'aaaaaaaa-0098-0098-0098-000000000098', '2025-12-28', '2025-12-28 06:10:00+00', '2025-12-28 07:17:21+00', 10.13, 4041, 6.65, 24, 72, 'purple', 5.1),
-  ('e1895e54-87a4-4bd7-95f9-6eef4b0cc658', 'aaaaaaaa-0044-0044-0044-000000000044', '2025-12-28', '2025-12-28 17:55:00+00', '2025-12-28 18:42:43+00', 7.71, 2863, 6.19, 13, 26, 'blue', 7.5),
-  ('10508ba8-45f2-4740-97c9-8c5811a62320', 'aaaaaaaa-0003-0003-0003-000000000003', '2025-12-28', '2025-12-28 05:54:00+00', '2025-12-28 06:47:42+00', 10.0, 3222, 5.37, 15, 45, 'red', 22.0),
-  ('7ff36b7b-82c9-4fbd-9162-1b4b9e1c4067', 'aaaaaaaa-0053-0053-0053-000000000053', '2025-12-28', '2025-12-28 14:04:00+00', '2025-12-28 14:20:53+00', 3.4, 1013, 4.97, 5, 10, 'blue', 8.8),
-  ('603ce428-2905-4695-94a0-158f85391176', 'aaaaaaaa-0006-0006-0006-000000000006', '2025-12-28', '2025-12-28 15:51:00+00', '2025-12-28 16:33:40+00', 7.02, 2560, 6.08, 10, 20, 'red', 15.1),
-  ('5cbf1ee2-b5fc-4c01-a992-190b4c0d6692', 'aaaaaaaa-0050-0050-0050-000000000050', '2025-12-28', '2025-12-28 14:50:00+00', '2025-12-28 15:39:46+00', 8.16, 2986, 6.1, 16, 48, 'blue', 16.3),
-  ('fc146a67-7384-4aec-87a3-b2b550c23a42', 'aaaaaaaa-0064-0064-0064-000000000064', '2025-12-28', '2025-12-28 15:11:00+00', '2025-12-28 16:54:17+00', 13.68, 6197, 7.55, 25, 50, 'blue', 16.8),
-  ('c0a05f59-64c6-40ff-9c2a-fda4a760501e', 'aaaaaaaa-0047-0047-0047-000000000047', '2025-12-28', '2025-12-28 17:52:00+00', '2025-12-28 18:42:49+00', 7.98, 3049, 6.37, 6, 12, 'blue', 15.0),
-  ('55001781-c7d7-4ab8-8231-9dbc59347df9', 'aaaaaaaa-0030-0030-0030-000000000030', '2025-12-28', '2025-12-28 06:42:00+00', '2025-12-28 07:28:47+00', 6.49, 2807, 7.21, 9, 18, 'red', 6.2),
-  ('dfae042a-8335-4b4d-881b-c287de0c42d9', 'aaaaaaaa-0049-0049-0049-000000000049', '2025-12-28', '2025-12-28 08:59:00+00', '2025-12-28 10:11:50+00', 13.77, 4370, 5.29, 21, 63, 'blue', 8.1),
-  ('8932d862-73ac-41aa-a36a-a1238403746a', 'aaaaaaaa-0010-0010-0010-000000000010', '2025-12-28', '2025-12-28 13:21:00+00', '2025-12-28 14:42:17+00', 14.78, 4877, 5.5, 24, 96, 'red', 24.8),
-  ('8d680966-9271-4c80-80bf-0aa738eab394', 'aaaaaaaa-0085-0085-0085-000000000085', '2025-12-28', '2025-12-28 09:29:00+00', '2025-12-28 10:10:41+00', 5.93, 2501, 7.03, 14, 28, 'purple', 3.3),
-  ('32bea04d-74c1-4e65-b970-6fd2ef909263', 'aaaaaaaa-0093-0093-0093-000000000093', '2025-12-28', '2025-12-28 09:32:00+00', '2025-12-28 10:49:35+00', 11.72, 4655, 6.62, 27, 54, 'purple', 12.1),
-  ('86a4e463-a330-43fe-b8d8-a63ce6a5a88b', 'aaaaaaaa-0090-0090-0090-000000000090', '2025-12-28', '2025-12-28 10:49:00+00', '2025-12-28 11:36:52+00', 7.4, 2872, 6.47, 12, 24, 'purple', 15.3),
-  ('c79e5ffc-3a9c-450b-b057-73432e1de469', 'aaaaaaaa-0040-0040-0040-000000000040', '2025-12-28', '2025-12-28 10:34:00+00', '2025-12-28 10:59:22+00', 3.76, 1522, 6.75, 6, 6, 'blue', 19.0),
-  ('5b27d27d-5712-461f-a029-6eb6b7132dca', 'aaaaaaaa-0012-0012-0012-000000000012', '2025-12-28', '2025-12-28 05:15:00+00', '2025-12-28 05:50:11+00', 7.11, 2111, 4.95, 15, 60, 'red', 24.5),
-  ('5d312b7a-c09c-4c62-89b3-68c69979e595', 'aaaaaaaa-0042-0042-0042-000000000042', '2025-12-28', '2025-12-28 14:14:00+00', '2025-12-28 14:36:41+00', 4.68, 1361, 4.85, 7, 21, 'blue', 3.7),
-  ('2653c7d4-1617-4fe7-ac26-0effa058db42', 'aaaaaaaa-0096-0096-0096-000000000096', '2025-12-28', '2025-12-28 09:51:00+00', '2025-12-28 11:20:01+00', 12.61, 5341, 7.06, 23, 69, 'purple', 10.0),
-  ('a5626d25-42e8-4399-a131-a70585a01ef0', 'aaaaaaaa-0017-0017-0017-000000000017', '2025-12-28', '2025-12-28 11:51:00+00', '2025-12-28 12:28:41+00', 8.02, 2261, 4.7, 16, 16, 'red', 12.1),
-  ('cb353a08-752d-4f72-9385-c28cb9fc1d9c', 'aaaaaaaa-0004-0004-0004-000000000004', '2025-12-28', '2025-12-28 16:20:00+00', '2025-12-28 17:43:46+00', 11.9, 5026, 7.04, 18, 36, 'red', 15.3),
-  ('03eaf94e-6ed9-4658-bb98-305431cc3b2d', 'aaaaaaaa-0036-0036-0036-000000000036', '2025-12-28', '2025-12-28 20:46:00+00', '2025-12-28 21:33:44+00', 7.38, 2864, 6.47, 6, 18, 'red', 7.9),
-  ('a19f3e14-a88b-497e-948a-409a10e3d40a', 'aaaaaaaa-0060-0060-0060-000000000060', '2025-12-28', '2025-12-28 20:01:00+00', '2025-12-28 21:05:18+00', 10.34, 3858, 6.22, 18, 54, 'blue', 6.7),
-  ('84bc95ea-ce43-4170-aff9-94a075986c08', 'aaaaaaaa-0074-0074-0074-000000000074', '2025-12-28', '2025-12-28 18:51:00+00', '2025-12-28 19:04:26+00', 2.09, 806, 6.43, 5, 15, 'blue', 3.3),
-  ('87a73444-91d9-494c-be2a-44992a7f97b0', 'aaaaaaaa-0071-0071-0071-000000000071', '2025-12-28', '2025-12-28 06:14:00+00', '2025-12-28 07:26:56+00', 14.22, 4376, 5.13, 23, 69, 'blue', 23.2),
-  ('88b17610-0fff-4ca3-aebc-08b789c3921d', 'aaaaaaaa-0092-0092-0092-000000000092', '2025-12-28', '2025-12-28 09:48:00+00', '2025-12-28 10:23:48+00', 4.75, 2148, 7.54, 11, 11, 'purple', 22.5),
-  ('681d3513-c7ec-4c61-8e48-91bc8bd97595', 'aaaaaaaa-0000-0000-0000-000000000000', '2025-12-28', '2025-12-28 07:49:00+00', '2025-12-28 09:22:22+00', 12.67, 5602, 7.37, 19, 76, 'red', 23.4),
-  ('f7ce1c24-aacf-466d-a3bb-3d1526d3b3e9', 'aaaaaaaa-0082-0082-0082-000000000082', '2025-12-28', '2025-12-28 16:35:00+00', '2025-12-28 17:48:11+00', 10.04, 4391, 7.29, 23, 23, 'purple', 18.7),
-  ('73d7af70-93f0-4798-abb9-b8e965ec1d29', 'aaaaaaaa-0002-0002-0002-000000000002', '2025-12-28', '2025-12-28 17:10:00+00', '2025-12-28 17:31:09+00', 3.21, 1269, 6.59, 5, 10, 'red', 10.1),
-  ('f306607a-b06c-458e-b90f-cc73db38d2cc', 'aaaaaaaa-0032-0032-0032-000000000032', '2025-12-28', '2025-12-28 12:46:00+00', '2025-12-28 13:07:05+00', 3.8, 1265, 5.55, 6, 18, 'red', 13.8),
-  ('a3cdc044-d836-4fab-9bb3-cb2f926c05cc', 'aaaaaaaa-0027-0027-0027-000000000027', '2025-12-28', '2025-12-28 17:23:00+00', '2025-12-28 18:29:39+00', 10.13, 3999, 6.58, 12, 36, 'red', 7.3),
-  ('41588fb4-8247-40b0-843e-992d5bdde4b3', 'aaaaaaaa-0089-0089-0089-000000000089', '2025-12-28', '2025-12-28 07:52:00+00', '2025-12-28 08:14:30+00', 3.48, 1350, 6.47, 5, 15, 'purple', 16.0),
-  ('e210cdff-fbba-49b4-8efd-6ebafb332e66', 'aaaaaaaa-0009-0009-0009-000000000009', '2025-12-28', '2025-12-28 19:23:00+00', '2025-12-28 20:57:47+00', 13.02, 5687, 7.28, 13, 26, 'red', 17.8),
-  ('69c5888f-bb8f-4e9c-8bed-8b3a2383e378', 'aaaaaaaa-0035-0035-0035-000000000035', '2025-12-28', '2025-12-28 16:30:00+00', '2025-12-28 17:20:58+00', 7.08, 3058, 7.2, 9, 36, 'red', 15.9),
-  ('20afa90c-803d-419e-a53d-95a6baa8ad55', 'aaaaaaaa-0046-0046-0046-000000000046', '2025-12-28', '2025-12-28 12:33:00+00', '2025-12-28 12:55:59+00', 3.27, 1379, 7.03, 7, 21, 'blue', 13.0),
-  ('538353e5-4967-44ec-b18e-0012f925f9c4', 'aaaaaaaa-0038-0038-0038-000000000038', '2025-12-28', '2025-12-28 17:00:00+00', '2025-12-28 17:21:36+00', 4.27, 1296, 5.06, 3, 12, 'red', 15.3),
-  ('e8d32c69-8791-466d-8914-7b29c6da63a7', 'aaaaaaaa-0033-0033-0033-000000000033', '2025-12-28', '2025-12-28 08:11:00+00', '2025-12-28 09:09:15+00', 11.16, 3495, 5.22, 9, 27, 'red', 19.6),
-  ('b1c01d92-53a7-4aea-baea-d283e99f0230', 'aaaaaaaa-0063-0063-0063-000000000063', '2025-12-28', '2025-12-28 20:08:00+00', '2025-12-28 20:42:10+00', 6.85, 2050, 4.99, 14, 14, 'blue', 11.5),
-  ('7dfa5572-d001-4ae2-b063-2e6653043405', 'aaaaaaaa-0007-0007-0007-000000000007', '2025-12-28', '2025-12-28 13:14:00+00', '2025-12-28 13:40:30+00', 4.54, 1590, 5.84, 7, 7, 'red', 15.4),
-  ('33b9c688-52e4-4cda-8863-b7d56650e165', 'aaaaaaaa-0083-0083-0083-000000000083', '2025-12-28', '2025-12-28 19:55:00+00', '2025-12-28 20:40:45+00', 8.99, 2745, 5.09, 17, 17, 'purple', 13.1),
-  ('04993048-5859-4877-9290-79fe596cf03b', 'aaaaaaaa-0075-0075-0075-000000000075', '2025-12-28', '2025-12-28 13:40:00+00', '2025-12-28 15:27:34+00', 14.92, 6454, 7.21, 31, 93, 'blue', 8.2),
-  ('8e62e347-814b-4c92-a04d-db8f3d04241d', 'aaaaaaaa-0015-0015-0015-000000000015', '2025-12-28', '2025-12-28 13:20:00+00', '2025-12-28 14:04:52+00', 7.38, 2692, 6.08, 9, 36, 'red', 16.9),
-  ('4e25af51-964f-44be-a6f8-00dc9b82e449', 'aaaaaaaa-0019-0019-0019-000000000019', '2025-12-28', '2025-12-28 08:00:00+00', '2025-12-28 09:12:32+00', 12.77, 4352, 5.68, 13, 13, 'red', 15.7),
-  ('6eef93cc-41dc-487c-9e3c-5bf699679fac', 'aaaaaaaa-0095-0095-0095-000000000095', '2025-12-28', '2025-12-28 08:06:00+00', '2025-12-28 08:28:45+00', 4.77, 1365, 4.77, 10, 10, 'purple', 16.1),
-  ('c7784a6d-7f1a-4754-9c0f-c97d3c77e4f1', 'aaaaaaaa-0079-0079-0079-000000000079', '2025-12-28', '2025-12-28 09:48:00+00', '2025-12-28 10:34:00+00', 6.07, 2760, 7.58, 11, 11, 'blue', 6.0),
-  ('841115f6-77ea-4017-b6f0-a07a41848a5a', 'aaaaaaaa-0052-0052-0052-000000000052', '2025-12-28', '2025-12-28 05:54:00+00', '2025-12-28 06:19:24+00', 3.6, 1524, 7.06, 4, 8, 'blue', 10.7),
-  ('9ca98863-e82b-4532-9d09-36f05af18ca2', 'aaaaaaaa-0026-0026-0026-000000000026', '2025-12-28', '2025-12-28 21:18:00+00', '2025-12-28 22:56:29+00', 13.01, 5909, 7.57, 17, 68, 'red', 7.5),
-  ('0bc8e653-c62e-4f4a-980a-6e2319d051ab', 'aaaaaaaa-0078-0078-0078-000000000078', '2025-12-28', '2025-12-28 06:19:00+00', '2025-12-28 07:22:33+00', 10.17, 3813, 6.25, 16, 48, 'blue', 12.1),
-  ('846f3db5-7310-4ba5-90c5-e98b9abe9aad', 'aaaaaaaa-0039-0039-0039-000000000039', '2025-12-28', '2025-12-28 20:54:00+00', '2025-12-28 22:06:29+00', 10.66, 4349, 6.8, 14, 14, 'red', 6.9),
-  ('4100cac3-0743-46fd-98d2-1abcf8f6187d', 'aaaaaaaa-0029-0029-0029-000000000029', '2025-12-28', '2025-12-28 16:07:00+00', '2025-12-28 17:01:15+00', 9.37, 3255, 5.79, 9, 9, 'red', 8.6),
-  ('dfc41084-e313-47ae-add1-566c7f272066', 'aaaaaaaa-0073-0073-0073-000000000073', '2025-12-28', '2025-12-28 12:09:00+00', '2025-12-28 13:14:20+00', 8.53, 3920, 7.66, 14, 14, 'blue', 6.9),
-  ('7bc47f1e-96c0-4e37-814f-97b17cdad8ef', 'aaaaaaaa-0087-0087-0087-000000000087', '2025-12-28', '2025-12-28 14:06:00+00', '2025-12-28 14:18:21+00', 2.08, 741, 5.94, 5, 15, 'purple', 8.1),
-  ('a84802a8-bce1-4da8-b73a-9b3c6ffcf2bb', 'aaaaaaaa-0031-0031-0031-000000000031', '2025-12-28', '2025-12-28 21:08:00+00', '2025-12-28 21:45:04+00', 4.67, 2224, 7.94, 6, 6, 'red', 12.2),
-  ('cd18967b-41ae-4f62-bb10-d7d454c9a5e8', 'aaaaaaaa-0058-0058-0058-000000000058', '2025-12-28', '2025-12-28 16:49:00+00', '2025-12-28 17:49:26+00', 10.28, 3626, 5.88, 14, 42, 'blue', 16.0),
-  ('f93a9e24-f6b7-443d-801d-987f0a5f5bd4', 'aaaaaaaa-0099-0099-0099-000000000099', '2025-12-28', '2025-12-28 21:03:00+00', '2025-12-28 21:29:13+00', 4.7, 1573, 5.58, 10, 20, 'purple', 8.8),
-  ('862fbb4d-1538-4891-83e9-195397c1a093', 'aaaaaaaa-0001-0001-0001-000000000001', '2025-12-28', '2025-12-28 08:02:00+00', '2025-12-28 09:00:25+00', 10.8, 3505, 5.41, 15, 45, 'red', 24.8),
-  ('2a273a84-70c9-43f3-a9f2-14929940a6ba', 'aaaaaaaa-0006-0006-0006-000000000006', '2025-12-29', '2025-12-29 11:53:00+00', '2025-12-29 12:33:11+00', 5.46, 2411, 7.36, 6, 12, 'red', 23.2),
-  ('c204ce0e-f3ca-473a-a070-401262019a48', 'aaaaaaaa-0021-0021-0021-000000000021', '2025-12-29', '2025-12-29 15:11:00+00', '2025-12-29 17:03:38+00', 14.84, 6758, 7.59, 13, 52, 'red', 13.8),
-  ('4b1fc14e-5eb7-4341-9fb6-9f5f60f4c3f3', 'aaaaaaaa-0073-0073-0073-000000000073', '2025-12-29', '2025-12-29 13:13:00+00', '2025-12-29 14:25:23+00', 11.19, 4343, 6.47, 23, 23, 'blue', 22.6),
-  ('ea149ace-b158-480e-9299-ef16e23be556', 'aaaaaaaa-0055-0055-0055-000000000055', '2025-12-29', '2025-12-29 12:10:00+00', '2025-12-29 12:34:50+00', 5.24, 1490, 4.74, 5, 10, 'blue', 8.6),
-  ('8932432d-03fd-495b-8587-ac6d7870edca', 'aaaaaaaa-0092-0092-0092-000000000092', '2025-12-29', '2025-12-29 10:03:00+00', '2025-12-29 11:00:27+00', 7.87, 3447, 7.3, 19, 38, 'purple', 3.7),
-  ('47af3208-5277-40a3-97ee-fedeb185b7d1', 'aaaaaaaa-0050-0050-0050-000000000050', '2025-12-29', '2025-12-29 20:09:00+00', '2025-12-29 20:26:19+00', 3.32, 1039, 5.22, 3, 6, 'blue', 7.2),
-  ('301a0e03-d7a0-4392-aa38-8efdcabe8331', 'aaaaaaaa-0063-0063-0063-000000000063', '2025-12-29', '2025-12-29 14:05:00+00', '2025-12-29 14:17:13+00', 2.71, 733, 4.51, 3, 3, 'blue', 4.9),
-  ('1fba78d7-924b-4e0a-ba3f-9af22fa84b09', 'aaaaaaaa-0003-0003-0003-000000000003', '2025-12-29', '2025-12-29 18:48:00+00', '2025-12-29 19:27:59+00', 8.16, 2399, 4.9, 12, 36, 'red', 20.3),
-  ('0a3b9bfc-1332-47a2-a746-d4e2a428e165', 'aaaaaaaa-0048-0048-0048-000000000048', '2025-12-29', '2025-12-29 18:12:00+00', '2025-12-29 19:14:16+00', 9.67, 3736, 6.44, 15, 45, 'blue', 21.5),
-  ('af7bdb89-8bfa-45b1-94a4-ade038a65009', 'aaaaaaaa-0087-0087-0087-000000000087', '2025-12-29', '2025-12-29 17:02:00+00', '2025-12-29 18:42:13+00', 14.96, 6013, 6.7, 31, 93, 'purple', 21.4),
-  ('9fe2b61a-667e-4c74-9317-9ac4976456a0', 'aaaaaaaa-0054-0054-0054-000000000054', '2025-12-29', '2025-12-29 07:12:00+00', '2025-12-29 08:06:11+00', 7.15, 3251, 7.58, 14, 42, 'blue', 18.2),
-  ('40f23569-d06f-4341-beae-fe3edd13c552', 'aaaaaaaa-0022-0022-0022-000000000022', '2025-12-29', '2025-12-29 06:58:00+00', '2025-12-29 07:57:35+00', 7.74, 3575, 7.7, 12, 48, 'red', 12.0),
-  ('2580eb52-372f-428b-bd10-e136f9b723b3', 'aaaaaaaa-0045-0045-0045-000000000045', '2025-12-29', '2025-12-29 13:47:00+00', '2025-12-29 14:21:44+00', 6.68, 2084, 5.2, 9, 9, 'blue', 11.1),
-  ('e498af80-3711-4078-93a5-9d5dbc429670', 'aaaaaaaa-0027-0027-0027-000000000027', '2025-12-29', '2025-12-29 14:19:00+00', '2025-12-29 15:20:41+00', 12.8, 3701, 4.82, 23, 69, 'red', 3.6),
-  ('6d1fa4a1-3f2b-4e40-89a8-8b38fb33dc99', 'aaaaaaaa-0023-0023-0023-000000000023', '2025-12-29', '2025-12-29 10:53:00+00', '2025-12-29 12:00:28+00', 10.9, 4048, 6.19, 17, 51, 'red', 10.4),
-  ('f966c041-37c6-4324-bc2e-394aa31aa225', 'aaaaaaaa-0035-0035-0035-000000000035', '2025-12-29', '2025-12-29 18:03:00+00', '2025-12-29 19:11:02+00', 10.55, 4082, 6.45, 12, 36, 'red', 9.5),
-  ('6394218f-274c-41c2-9b38-b6d7b3984fa4', 'aaaaaaaa-0084-0084-0084-000000000084', '2025-12-29', '2025-12-29 05:57:00+00', '2025-12-29 07:03:59+00', 13.32, 4019, 5.03, 28, 56, 'purple', 24.8),
-  ('1a625743-46cd-4d8a-8ce1-b81fa4d859ee', 'aaaaaaaa-0057-0057-0057-000000000057', '2025-12-29', '2025-12-29 19:46:00+00', '2025-12-29 20:31:55+00', 6.19, 2755, 7.42, 13, 26, 'blue', 7.2),
-  ('3d1f872c-eb2a-468d-9f35-076c5bf97978', 'aaaaaaaa-0019-0019-0019-000000000019', '2025-12-29', '2025-12-29 06:42:00+00', '2025-12-29 07:37:27+00', 8.76, 3327, 6.33, 12, 12, 'red', 12.5),
-  ('47234732-2923-493d-b335-d5809c5c51c2', 'aaaaaaaa-0004-0004-0004-000000000004', '2025-12-29', '2025-12-29 11:44:00+00', '2025-12-29 12:09:20+00', 3.41, 1520, 7.43, 3, 6, 'red', 4.1),
-  ('589111e0-615d-4159-9c00-5c795645f667', 'aaaaaaaa-0078-0078-0078-000000000078', '2025-12-29', '2025-12-29 05:42:00+00', '2025-12-29 06:31:25+00', 10.91, 2965, 4.53, 22, 22, 'blue', 12.3),
-  ('bdbef3ad-7da9-4f9e-a9cb-945bebd1bb00', 'aaaaaaaa-0079-0079-0079-000000000079', '2025-12-29', '2025-12-29 12:29:00+00', '2025-12-29 12:44:27+00', 3.16, 927, 4.89, 4, 12, 'blue', 15.6),
-  ('a6fdf144-258a-411a-a493-31da23ddc073', 'aaaaaaaa-0031-0031-0031-000000000031', '2025-12-29', '2025-12-29 10:06:00+00', '2025-12-29 11:28:16+00', 14.85, 4936, 5.54, 22, 22, 'red', 13.2),
-  ('be237706-5639-4362-96ad-b8c6e9fb4081', 'aaaaaaaa-0037-0037-0037-000000000037', '2025-12-29', '2025-12-29 15:33:00+00', '2025-12-29 16:21:41+00', 7.41, 2921, 6.57, 8, 16, 'red', 20.6),
-  ('aa414a49-290d-4523-80dc-76eff1f7e523', 'aaaaaaaa-0093-0093-0093-000000000093', '2025-12-29', '2025-12-29 17:25:00+00', '2025-12-29 18:26:09+00', 8.8, 3669, 6.95, 21, 63, 'purple', 5.1),
-  ('9be0ced4-c37a-4570-b6eb-af4f81d47d95', 'aaaaaaaa-0052-0052-0052-000000000052', '2025-12-29', '2025-12-29 08:48:00+00', '2025-12-29 09:48:19+00', 12.62, 3619, 4.78, 25, 25, 'blue', 12.8),
-  ('0cb1500d-884c-4f08-a1fb-daf742525000', 'aaaaaaaa-0070-0070-0070-000000000070', '2025-12-29', '2025-12-29 21:08:00+00', '2025-12-29 21:55:40+00', 10.57, 2860, 4.51, 16, 48, 'blue', 10.8),
-  ('60978b44-c335-4d96-b604-ca6a2332bd74', 'aaaaaaaa-0061-0061-0061-000000000061', '2025-12-29', '2025-12-29 09:45:00+00', '2025-12-29 10:50:40+00', 14.53, 3940, 4.52, 18, 54, 'blue', 19.2),
-  ('667a71c0-2c50-4f97-a5ec-2089e009473d', 'aaaaaaaa-0007-0007-0007-000000000007', '2025-12-29', '2025-12-29 11:48:00+00', '2025-12-29 13:10:01+00', 10.45, 4921, 7.85, 13, 39, 'red', 14.1),
-  ('9c105c9d-c3fb-45e8-a643-b49ae8274e2e', 'aaaaaaaa-0011-0011-0011-000000000011', '2025-12-29', '2025-12-29 19:11:00+00', '2025-12-29 20:03:04+00', 9.04, 3124, 5.76, 10, 30, 'red', 13.0),
-  ('8e39471c-f771-441a-8083-f139a6aada68', 'aaaaaaaa-0083-0083-0083-000000000083', '2025-12-29', '2025-12-29 15:21:00+00', '2025-12-29 16:31:21+00', 14.78, 4221, 4.76, 32, 32, 'purple', 24.2),
-  ('3648cad7-8814-469a-ae4c-747dede4d647', 'aaaaaaaa-0049-0049-0049-000000000049', '2025-12-29', '2025-12-29 21:52:00+00', '2025-12-29 22:27:11+00', 6.69, 2111, 5.26, 9, 9, 'blue', 19.6),
-  ('c7870ac3-5ee8-4b95-8ba0-256bcf4b3db4', 'aaaaaaaa-0017-0017-0017-000000000017', '2025-12-29', '2025-12-29 07:36:00+00', '2025-12-29 08:51:43+00', 12.02, 4543, 6.3, 20, 60, 'red', 14.2),
-  ('33b89ed6-6013-4fc9-a1a3-9e9955c99ac9', 'aaaaaaaa-0053-0053-0053-000000000053', '2025-12-29', '2025-12-29 14:43:00+00', '2025-12-29 16:20:30+00', 12.68, 5850, 7.69, 19, 19, 'blue', 12.0),
-  ('0e543986-d1fe-40d6-b7d4-e9a6f6e20ff6', 'aaaaaaaa-0025-0025-0025-000000000025', '2025-12-29', '2025-12-29 13:06:00+00', '2025-12-29 14:52:36+00', 13.53, 6396, 7.88, 19, 19, 'red', 22.1),
-  ('6869fb15-af89-4905-aeae-43d563b1c8a0', 'aaaaaaaa-0077-0077-0077-000000000077', '2025-12-29', '2025-12-29 14:44:00+00', '2025-12-29 15:13:50+00', 4.57, 1790, 6.53, 6, 18, 'blue', 23.9),
-  ('99c40ac3-eec1-4793-b2b9-3ca86d99a977', 'aaaaaaaa-0002-0002-0002-000000000002', '2025-12-29', '2025-12-29 13:46:00+00', '2025-12-29 14:48:08+00', 9.59, 3728, 6.48, 14, 28, 'red', 11.0),
-  ('46ac6cd6-445d-45e9-b112-827b7c7ffb8f', 'aaaaaaaa-0024-0024-0024-000000000024', '2025-12-29', '2025-12-29 10:36:00+00', '2025-12-29 11:40:29+00', 13.52, 3869, 4.77, 18, 36, 'red', 4.7),
-  ('f129b61f-2836-4868-bc27-239368021288', 'aaaaaaaa-0094-0094-0094-000000000094', '2025-12-29', '2025-12-29 16:52:00+00', '2025-12-29 18:29:35+00', 14.33, 5855, 6.81, 32, 64, 'purple', 24.3),
-  ('a5974d9e-0e5a-462b-8fe3-58898ff7f3b4', 'aaaaaaaa-0090-0090-0090-000000000090', '2025-12-29', '2025-12-29 21:02:00+00', '2025-12-29 22:24:20+00', 13.28, 4940, 6.2, 27, 27, 'purple', 13.6),
-  ('75a40e31-f158-4130-ad1e-5dd87f6d3ed8', 'aaaaaaaa-0088-0088-0088-000000000088', '2025-12-29', '2025-12-29 18:52:00+00', '2025-12-29 20:00:02+00', 13.58, 4082, 5.01, 19, 57, 'purple', 6.7),
-  ('17f7d594-1c72-4bdf-9663-a00a24e2d3fa', 'aaaaaaaa-0030-0030-0030-000000000030', '2025-12-29', '2025-12-29 18:33:00+00', '2025-12-29 18:52:04+00', 3.94, 1144, 4.84, 7, 7, 'red', 13.5),
-  ('f2748036-5eb2-420a-a6b4-caab53c35ed9', 'aaaaaaaa-0034-0034-0034-000000000034', '2025-12-29', '2025-12-29 11:00:00+00', '2025-12-29 11:56:28+00', 7.47, 3388, 7.56, 10, 30, 'red', 18.3),
-  ('ad5a1bc2-34d3-47dd-b65f-1523ed21e649', 'aaaaaaaa-0072-0072-0072-000000000072', '2025-12-29', '2025-12-29 09:54:00+00', '2025-12-29 11:15:27+00', 11.22, 4887, 7.26, 27, 81, 'blue', 15.7),
-  ('f8f13bd2-0439-4600-93ec-af8ef78ae083', 'aaaaaaaa-0064-0064-0064-000000000064', '2025-12-29', '2025-12-29 14:12:00+00', '2025-12-29 15:17:05+00', 13.23, 3905, 4.92, 27, 81, 'blue', 8.1),
-  ('c7c04ac4-4dc1-4643-9714-4800f9d9e824', 'aaaaaaaa-0059-0059-0059-000000000059', '2025-12-29', '2025-12-29 07:17:00+00', '2025-12-29 07:33:06+00', 2.44, 966, 6.6, 3, 3, 'blue', 14.3),
-  ('18c02335-3498-4dae-a0de-61c5a43afd5b', 'aaaaaaaa-0036-0036-0036-000000000036', '2025-12-29', '2025-12-29 17:36:00+00', '2025-12-29 18:45:41+00', 12.14, 4181, 5.74, 22, 88, 'red', 11.7),
-  ('98875a59-4fdd-496a-b129-f0db5d801bb5', 'aaaaaaaa-0032-0032-0032-000000000032', '2025-12-29', '2025-12-29 15:04:00+00', '2025-12-29 15:48:21+00', 8.29, 2661, 5.35, 7, 28, 'red', 10.5),
-  ('4504de9a-1f54-4b1f-adc5-777697380bee', 'aaaaaaaa-0020-0020-0020-000000000020', '2025-12-29', '2025-12-29 15:31:00+00', '2025-12-29 16:18:09+00', 9.21, 2829, 5.12, 15, 45, 'red', 9.9),
-  ('4287cc5f-5850-4429-873f-084f4d76c0e3', 'aaaaaaaa-0062-0062-0062-000000000062', '2025-12-29', '2025-12-29 13:15:00+00', '2025-12-29 14:58:41+00', 13.68, 6221, 7.58, 26, 26, 'blue', 15.6),
-  ('6da5733f-a738-41c4-97a0-a09664a94b49', 'aaaaaaaa-0067-0067-0067-000000000067', '2025-12-29', '2025-12-29 12:52:00+00', '2025-12-29 13:35:10+00', 5.5, 2590, 7.85, 4, 12, 'blue', 10.5),
-  ('1fcb453c-c9f4-4834-81c7-db7404562187', 'aaaaaaaa-0097-0097-0097-000000000097', '2025-12-29', '2025-12-29 20:08:00+00', '2025-12-29 20:25:57+00', 3.3, 1077, 5.44, 7, 14, 'purple', 8.2),
-  ('8ffb0d04-cbc3-4e27-8551-842b07c0a2e6', 'aaaaaaaa-0001-0001-0001-000000000001', '2025-12-29', '2025-12-29 17:39:00+00', '2025-12-29 19:30:36+00', 14.94, 6696, 7.47, 22, 22, 'red', 14.4),
-  ('07e349eb-7a8c-46a2-a786-7575407fcfba', 'aaaaaaaa-0051-0051-0051-000000000051', '2025-12-29', '2025-12-29 17:17:00+00', '2025-12-29 17:55:22+00', 5.72, 2302, 6.71, 12, 36, 'blue', 6.2),
-  ('6372fcd8-a830-4d6a-9f0f-69887b48bc90', 'aaaaaaaa-0038-0038-0038-000000000038', '2025-12-29', '2025-12-29 09:08:00+00', '2025-12-29 10:45:53+00', 13.54, 5873, 7.23, 13, 52, 'red', 23.7),
-  ('0234364a-bd36-41e5-bcbe-d63527e6184a', 'aaaaaaaa-0014-0014-0014-000000000014', '2025-12-29', '2025-12-29 18:16:00+00', '2025-12-29 19:01:08+00', 8.85, 2708, 5.1, 10, 30, 'red', 3.8),
-  ('c8173f2d-750a-4d5d-9742-99c031a4aa36', 'aaaaaaaa-0047-0047-0047-000000000047', '2025-12-29', '2025-12-29 12:50:00+00', '2025-12-29 13:08:15+00', 4.02, 1095, 4.54, 7, 14, 'blue', 14.5),
-  ('10aa8a8f-9445-463a-a72f-356268482fb2', 'aaaaaaaa-0068-0068-0068-000000000068', '2025-12-29', '2025-12-29 17:53:00+00', '2025-12-29 18:05:08+00', 2.09, 728, 5.81, 4, 12, 'blue', 12.1),
-  ('9cdc61c3-f0bf-44b1-87de-4b2029cdbef6', 'aaaaaaaa-0095-0095-0095-000000000095', '2025-12-29', '2025-12-29 09:03:00+00', '2025-12-29 09:40:30+00', 6.92, 2250, 5.42, 15, 15, 'purple', 12.3),
-  ('ae18477f-128b-41f6-ba8d-f4388edbc4cc', 'aaaaaaaa-0058-0058-0058-000000000058', '2025-12-29', '2025-12-29 17:49:00+00', '2025-12-29 18:55:54+00', 14.61, 4014, 4.58, 21, 21, 'blue', 24.4),
-  ('c7175ab3-42d4-4e78-91be-db978f35915e', 'aaaaaaaa-0033-0033-0033-000000000033', '2025-12-29', '2025-12-29 09:23:00+00', '2025-12-29 10:41:46+00', 14.67, 4726, 5.37, 17, 68, 'red', 24.9),
-  ('a0c54ed9-cdae-4069-8c07-fe742c032d03', 'aaaaaaaa-0089-0089-0089-000000000089', '2025-12-29', '2025-12-29 13:55:00+00', '2025-12-29 14:59:32+00', 12.02, 3872, 5.37, 28, 56, 'purple', 14.0),
-  ('0eebaf84-02ea-4528-bc38-cfa1808eb383', 'aaaaaaaa-0076-0076-0076-000000000076', '2025-12-29', '2025-12-29 06:53:00+00', '2025-12-29 08:31:38+00', 12.81, 5918, 7.7, 25, 25, 'blue', 15.2),
-  ('ac8aa6b4-d26f-4d51-ade4-ccc4d6e3016e', 'aaaaaaaa-0044-0044-0044-000000000044', '2025-12-29', '2025-12-29 12:34:00+00', '2025-12-29 13:46:47+00', 14.19, 4367, 5.13, 18, 54, 'blue', 3.7),
-  ('33e8e3f5-9a5d-4aa6-923e-d546de076516', 'aaaaaaaa-0010-0010-0010-000000000010', '2025-12-29', '2025-12-29 16:57:00+00', '2025-12-29 17:33:18+00', 7.01, 2178, 5.18, 11, 44, 'red', 17.5),
-  ('3d4c37a7-3491-4b64-af93-e97109a702a1', 'aaaaaaaa-0099-0099-0099-000000000099', '2025-12-29', '2025-12-29 05:46:00+00', '2025-12-29 06:34:37+00', 6.1, 2917, 7.97, 11, 22, 'purple', 10.1),
-  ('a5077f1b-2ada-4669-8ba5-c5e0e5c7e551', 'aaaaaaaa-0015-0015-0015-000000000015', '2025-12-29', '2025-12-29 05:49:00+00', '2025-12-29 06:02:28+00', 2.45, 808, 5.5, 4, 12, 'red', 3.4),
-  ('180d8369-01dd-4e1c-b8a6-f607cf1fa2e6', 'aaaaaaaa-0039-0039-0039-000000000039', '2025-12-29', '2025-12-29 07:49:00+00', '2025-12-29 09:16:41+00', 12.69, 5261, 6.91, 18, 72, 'red', 9.1),
-  ('358b8d3d-ad9e-4f98-a645-aaad9d38d1a6', 'aaaaaaaa-0098-0098-0098-000000000098', '2025-12-30', '2025-12-30 20:25:00+00', '2025-12-30 20:40:34+00', 2.64, 934, 5.9, 6, 6, 'purple', 4.9),
-  ('b0a22ad5-2e23-45fc-b010-102f90621b98', 'aaaaaaaa-0042-0042-0042-000000000042', '2025-12-30', '2025-12-30 16:09:00+00', '2025-12-30 17:03:23+00', 10.48, 3263, 5.19, 18, 18, 'blue', 16.6),
-  ('96048b9b-9904-4ccb-bde8-b29216b9e340', 'aaaaaaaa-0044-0044-0044-000000000044', '2025-12-30', '2025-12-30 13:03:00+00', '2025-12-30 14:31:38+00', 11.85, 5318, 7.48, 12, 36, 'blue', 5.5),
-  ('4975424b-acad-4c31-9e00-aacfc37f45c3', 'aaaaaaaa-0055-0055-0055-000000000055', '2025-12-30', '2025-12-30 05:02:00+00', '2025-12-30 06:04:47+00', 8.04, 3767, 7.81, 12, 36, 'blue', 4.5),
-  ('e4d240f9-83c6-4364-8a3e-54b9d00e23d5', 'aaaaaaaa-0053-0053-0053-000000000053', '2025-12-30', '2025-12-30 13:14:00+00', '2025-12-30 13:47:08+00', 5.22, 1988, 6.35, 7, 21, 'blue', 10.3),
-  ('0e8a6c20-6eeb-4ac5-acae-9dd92d9db755', 'aaaaaaaa-0015-0015-0015-000000000015', '2025-12-30', '2025-12-30 15:28:00+00', '2025-12-30 15:58:19+00', 3.97, 1819, 7.64, 4, 12, 'red', 17.5),
-  ('1041ad27-fa2b-4ddd-b2d1-d59cf74e85f1', 'aaaaaaaa-0029-0029-0029-000000000029', '2025-12-30', '2025-12-30 19:47:00+00', '2025-12-30 20:34:14+00', 9.05, 2834, 5.22, 16, 48, 'red', 6.0),
-  ('91b03946-116d-44b7-b5a2-7c0bd70b83d3', 'aaaaaaaa-0083-0083-0083-000000000083', '2025-12-30', '2025-12-30 12:47:00+00', '2025-12-30 14:34:53+00', 14.14, 6473, 7.63, 33, 66, 'purple', 23.5),
-  ('a7a71f44-e7ae-4fa5-85bf-a4c7aafd5186', 'aaaaaaaa-0077-0077-0077-000000000077', '2025-12-30', '2025-12-30 14:28:00+00', '2025-12-30 15:23:54+00', 10.73, 3354, 5.21, 15, 15, 'blue', 7.5),
-  ('d65232cf-2b00-43fd-8075-4929ec990b2b', 'aaaaaaaa-0001-0001-0001-000000000001', '2025-12-30', '2025-12-30 19:01:00+00', '2025-12-30 19:40:56+00', 7.17, 2396, 5.57, 13, 39, 'red', 21.2),
-  ('f00a66da-94d7-4ef2-a3c5-15f058731a72', 'aaaaaaaa-0081-0081-0081-000000000081', '2025-12-30', '2025-12-30 21:45:00+00', '2025-12-30 22:13:26+00', 4.33, 1706, 6.57, 8, 8, 'purple', 18.7),
-  ('f426dc46-84b3-4365-b2ea-895a8b2187df', 'aaaaaaaa-0080-0080-0080-000000000080', '2025-12-30', '2025-12-30 10:07:00+00', '2025-12-30 10:57:49+00', 6.99, 3049, 7.27, 13, 26, 'purple', 14.3),
-  ('893e9d51-732d-43e8-b274-2e63e0c7707f', 'aaaaaaaa-0048-0048-0048-000000000048', '2025-12-30', '2025-12-30 10:43:00+00', '2025-12-30 12:30:31+00', 13.68, 6451, 7.86, 16, 16, 'blue', 3.1),
-  ('d2b47826-b256-4257-a5c3-80e70b1a1e22', 'aaaaaaaa-0006-0006-0006-000000000006', '2025-12-30', '2025-12-30 14:30:00+00', '2025-12-30 15:08:49+00', 5.7, 2329, 6.81, 12, 12, 'red', 18.4),
-  ('70452c02-3442-4147-8d1e-0754a3a6ee02', 'aaaaaaaa-0039-0039-0039-000000000039', '2025-12-30', '2025-12-30 18:38:00+00', '2025-12-30 19:03:59+00', 3.75, 1559, 6.93, 5, 15, 'red', 9.0),
-  ('b72d4760-f96a-46af-9d05-246e14c4df1c', 'aaaaaaaa-0067-0067-0067-000000000067', '2025-12-30', '2025-12-30 05:07:00+00', '2025-12-30 06:17:26+00', 13.02, 4226, 5.41, 16, 32, 'blue', 15.7),
-  ('97025aef-4b66-4732-949f-d6194bf33639', 'aaaaaaaa-0005-0005-0005-000000000005', '2025-12-30', '2025-12-30 15:24:00+00', '2025-12-30 16:26:08+00', 10.92, 3728, 5.69, 17, 17, 'red', 18.9),
-  ('fde711b7-b513-4a36-a137-1142457a804f', 'aaaaaaaa-0040-0040-0040-000000000040', '2025-12-30', '2025-12-30 05:51:00+00', '2025-12-30 07:06:32+00', 10.14, 4532, 7.45, 13, 39, 'blue', 15.6),
-  ('e1858601-d598-451b-ba0f-48b2edf4d360', 'aaaaaaaa-0069-0069-0069-000000000069', '2025-12-30', '2025-12-30 08:33:00+00', '2025-12-30 09:24:41+00', 8.27, 3101, 6.25, 8, 8, 'blue', 7.2),
-  ('55c9f6fb-68e9-47a1-89f7-11eb9633524b', 'aaaaaaaa-0072-0072-0072-000000000072', '2025-12-30', '2025-12-30 15:34:00+00', '2025-12-30 16:59:02+00', 11.96, 5102, 7.11, 10, 30, 'blue', 3.5),
-  ('a3e7e322-6640-4e7e-b87e-a6ebf1edf9b9', 'aaaaaaaa-0019-0019-0019-000000000019', '2025-12-30', '2025-12-30 07:52:00+00', '2025-12-30 08:30:32+00', 7.77, 2312, 4.96, 14, 28, 'red', 13.4),
-  ('a823959c-d7d6-450b-ac46-efaf61639f1b', 'aaaaaaaa-0041-0041-0041-000000000041', '2025-12-30', '2025-12-30 07:50:00+00', '2025-12-30 09:16:23+00', 12.43, 5183, 6.95, 18, 54, 'blue', 5.1),
-  ('e786d267-03e6-46ae-8b95-0b618fe9297d', 'aaaaaaaa-0064-0064-0064-000000000064', '2025-12-30', '2025-12-30 12:11:00+00', '2025-12-30 12:47:13+00', 5.93, 2173, 6.11, 7, 21, 'blue', 16.0),
-  ('05bc55ec-f8cb-46f0-9a68-3f2159837a12', 'aaaaaaaa-0028-0028-0028-000000000028', '2025-12-30', '2025-12-30 19:12:00+00', '2025-12-30 20:02:36+00', 10.61, 3036, 4.77, 21, 84, 'red', 23.5),
-  ('84510448-66c4-4ab4-ba87-b7237a376061', 'aaaaaaaa-0079-0079-0079-000000000079', '2025-12-30', '2025-12-30 06:00:00+00', '2025-12-30 06:35:21+00', 4.67, 2121, 7.57, 4, 8, 'blue', 9.6),
-  ('c23271fa-2d27-4cdb-9209-031ed4619ef5', 'aaaaaaaa-0086-0086-0086-000000000086', '2025-12-30', '2025-12-30 20:42:00+00', '2025-12-30 22:04:06+00', 11.14, 4926, 7.37, 26, 26, 'purple', 10.9),
-  ('853b4930-a26e-4fba-a8de-42b6f8877ceb', 'aaaaaaaa-0050-0050-0050-000000000050', '2025-12-30', '2025-12-30 16:02:00+00', '2025-12-30 17:03:12+00', 7.68, 3672, 7.97, 8, 24, 'blue', 4.9),
-  ('10ba3d18-c203-45b4-8784-babf0ac8cb6a', 'aaaaaaaa-0057-0057-0057-000000000057', '2025-12-30', '2025-12-30 13:03:00+00', '2025-12-30 14:38:31+00', 14.72, 5731, 6.49, 16, 32, 'blue', 18.5),
-  ('31cf78e9-e193-40ec-abe1-99afe71288b5', 'aaaaaaaa-0091-0091-0091-000000000091', '2025-12-30', '2025-12-30 06:21:00+00', '2025-12-30 07:27:22+00', 10.18, 3982, 6.52, 21, 63, 'purple', 15.6),
-  ('97b378fc-f69c-4b35-bd5e-05a48cd49434', 'aaaaaaaa-0011-0011-0011-000000000011', '2025-12-30', '2025-12-30 08:58:00+00', '2025-12-30 10:54:41+00', 14.79, 7001, 7.89, 30, 30, 'red', 16.1),
-  ('74994722-4e0f-41df-856e-515792131f2e', 'aaaaaaaa-0076-0076-0076-000000000076', '2025-12-30', '2025-12-30 08:43:00+00', '2025-12-30 09:34:08+00', 8.91, 3068, 5.74, 13, 39, 'blue', 21.6),
-  ('8111fd6a-8c3e-41d8-b803-8ecee2325c85', 'aaaaaaaa-0096-0096-0096-000000000096', '2025-12-30', '2025-12-30 07:40:00+00', '2025-12-30 08:21:06+00', 7.8, 2466, 5.27, 12, 24, 'purple', 9.2),
-  ('3024b5e7-1f81-418a-812e-3f448ca5daf8', 'aaaaaaaa-0037-0037-0037-000000000037', '2025-12-30', '2025-12-30 11:39:00+00', '2025-12-30 12:41:57+00', 7.89, 3777, 7.98, 13, 52, 'red', 19.9),
-  ('4bbec901-d6c6-4c44-be6c-8263d25dab0c', 'aaaaaaaa-0073-0073-0073-000000000073', '2025-12-30', '2025-12-30 17:44:00+00', '2025-12-30 19:03:40+00', 10.36, 4780, 7.69, 17, 17, 'blue', 18.7),
-  ('410a8bc3-e161-471a-8899-68caa6ea2862', 'aaaaaaaa-0018-0018-0018-000000000018', '2025-12-30', '2025-12-30 20:24:00+00', '2025-12-30 21:42:10+00', 12.63, 4690, 6.19, 19, 38, 'red', 15.5),
-  ('1d1fe59a-f995-4f78-a44b-8d2ee4495b6f', 'aaaaaaaa-0016-0016-0016-000000000016', '2025-12-30', '2025-12-30 08:13:00+00', '2025-12-30 08:31:01+00', 2.82, 1081, 6.39, 3, 12, 'red', 9.8),
-  ('b02a448f-0a45-480a-b443-713150a01ee5', 'aaaaaaaa-0043-0043-0043-000000000043', '2025-12-30', '2025-12-30 17:20:00+00', '2025-12-30 18:45:25+00', 12.49, 5125, 6.84, 17, 51, 'blue', 13.1),
-  ('473b6dab-71bf-420e-a5d9-034921598bcb', 'aaaaaaaa-0092-0092-0092-000000000092', '2025-12-30', '2025-12-30 09:48:00+00', '2025-12-30 10:12:35+00', 3.57, 1475, 6.89, 6, 12, 'purple', 15.0),
-  ('772fbb6e-b358-489d-ad83-e15299136ff7', 'aaaaaaaa-0030-0030-0030-000000000030', '2025-12-30', '2025-12-30 11:09:00+00', '2025-12-30 12:00:21+00', 7.4, 3081, 6.94, 11, 22, 'red', 15.2),
-  ('f7fc4cf4-d4d0-46ef-bc7c-4ef97d00b292', 'aaaaaaaa-0036-0036-0036-000000000036', '2025-12-30', '2025-12-30 09:43:00+00', '2025-12-30 10:48:19+00', 10.32, 3919, 6.33, 15, 15, 'red', 12.1),
-  ('2bd3b5c1-398c-4b45-9a87-513777f26d08', 'aaaaaaaa-0047-0047-0047-000000000047', '2025-12-30', '2025-12-30 18:55:00+00', '2025-12-30 20:34:44+00', 12.97, 5984, 7.69, 21, 21, 'blue', 13.9),
-  ('67179445-fe6d-43ff-9212-fbf02a16f2a7', 'aaaaaaaa-0028-0028-0028-000000000028', '2025-12-31', '2025-12-31 11:08:00+00', '2025-12-31 12:10:58+00', 13.12, 3778, 4.8, 17, 68, 'red', 21.9),
-  ('140ffd5e-0cbb-46fd-958e-adfb3c51c1db', 'aaaaaaaa-0009-0009-0009-000000000009', '2025-12-31', '2025-12-31 15:33:00+00', '2025-12-31 16:08:33+00', 6.66, 2133, 5.34, 11, 44, 'red', 25.0),
-  ('52a022d0-044b-4eee-a0ac-47e2ed6dc619', 'aaaaaaaa-0060-0060-0060-000000000060', '2025-12-31', '2025-12-31 16:56:00+00', '2025-12-31 17:10:33+00', 2.43, 873, 5.99, 4, 12, 'blue', 8.9),
-  ('5a669329-b55e-47c6-8d7b-33032dd5111d', 'aaaaaaaa-0074-0074-0074-000000000074', '2025-12-31', '2025-12-31 15:15:00+00', '2025-12-31 15:30:35+00', 2.67, 935, 5.84, 3, 3, 'blue', 13.2),
-  ('0252b878-f66f-47d8-a4fe-1d1f21e4b313', 'aaaaaaaa-0062-0062-0062-000000000062', '2025-12-31', '2025-12-31 16:51:00+00', '2025-12-31 17:52:03+00', 9.02, 3663, 6.77, 12, 36, 'blue', 19.2),
-  ('d02c626b-daae-4542-ba85-e44b3db1d4f8', 'aaaaaaaa-0006-0006-0006-000000000006', '2025-12-31', '2025-12-31 14:12:00+00', '2025-12-31 15:26:29+00', 10.75, 4469, 6.93, 15, 15, 'red', 24.5),
-  ('0352a696-bc0f-47d1-b226-477f662f601d', 'aaaaaaaa-0055-0055-0055-000000000055', '2025-12-31', '2025-12-31 21:53:00+00', '2025-12-31 22:14:17+00', 2.82, 1277, 7.55, 3, 9, 'blue', 8.1),
-  ('325d768c-d5f6-42fa-acd1-a4230d55e354', 'aaaaaaaa-0018-0018-0018-000000000018', '2025-12-31', '2025-12-31 15:36:00+00', '2025-12-31 16:31:41+00', 9.13, 3341, 6.1, 13, 13, 'red', 15.5),
-  ('f0ed74f3-4cb5-476d-ad5a-f1ae4bb85678', 'aaaaaaaa-0027-0027-0027-000000000027', '2025-12-31', '2025-12-31 08:58:00+00', '2025-12-31 09:17:41+00', 3.64, 1181, 5.41, 4, 12, 'red', 7.1),
-  ('1516a201-da0a-4625-af80-d438dde43749', 'aaaaaaaa-0078-0078-0078-000000000078', '2025-12-31', '2025-12-31 15:41:00+00', '2025-12-31 15:59:00+00', 2.32, 1080, 7.76, 4, 12, 'blue', 19.9),
-  ('4b1773f6-5c10-4c1f-bdec-bb77cab21ae8', 'aaaaaaaa-0058-0058-0058-000000000058', '2025-12-31', '2025-12-31 19:43:00+00', '2025-12-31 20:51:48+00', 11.17, 4128, 6.16, 20, 60, 'blue', 9.4),
-  ('d83994d8-795a-40a4-83ea-e1643fa07005', 'aaaaaaaa-0022-0022-0022-000000000022', '2025-12-31', '2025-12-31 09:53:00+00', '2025-12-31 10:44:36+00', 10.73, 3096, 4.81, 10, 40, 'red', 14.3),
-  ('88f48aba-07d9-4de9-9d1b-a2d01c7c6845', 'aaaaaaaa-0049-0049-0049-000000000049', '2025-12-31', '2025-12-31 19:14:00+00', '2025-12-31 20:00:13+00', 9.63, 2773, 4.8, 14, 42, 'blue', 7.6),
-  ('5561b3cb-0b37-464b-8b3f-1716cf069118', 'aaaaaaaa-0047-0047-0047-000000000047', '2025-12-31', '2025-12-31 12:01:00+00', '2025-12-31 12:11:35+00', 2.35, 635, 4.51, 2, 4, 'blue', 8.8),
-  ('81ed7a52-6918-4a01-8aa2-ba85d6d1df12', 'aaaaaaaa-0017-0017-0017-000000000017', '2025-12-31', '2025-12-31 08:23:00+00', '2025-12-31 08:42:25+00', 3.55, 1165, 5.47, 4, 16, 'red', 24.9),
-  ('cdbc253c-b6d2-43db-be60-a760520f9673', 'aaaaaaaa-0089-0089-0089-000000000089', '2025-12-31', '2025-12-31 15:55:00+00', '2025-12-31 16:51:22+00', 8.66, 3382, 6.51, 21, 21, 'purple', 21.6),
-  ('09ca4ada-c518-4a6d-a6d3-c01908628a10', 'aaaaaaaa-0024-0024-0024-000000000024', '2025-12-31', '2025-12-31 08:13:00+00', '2025-12-31 08:58:34+00', 6.11, 2734, 7.46, 11, 22, 'red', 20.6),
-  ('78bde6f4-cb1a-4de4-8ff6-1b5184e18b05', 'aaaaaaaa-0080-0080-0080-000000000080', '2025-12-31', '2025-12-31 16:19:00+00', '2025-12-31 16:40:07+00', 4.01, 1267, 5.27, 9, 18, 'purple', 7.1),
-  ('e5c001d4-403d-4e08-bac1-b0a6214e542f', 'aaaaaaaa-0045-0045-0045-000000000045', '2025-12-31', '2025-12-31 08:58:00+00', '2025-12-31 09:52:47+00', 10.98, 3287, 4.99, 17, 34, 'blue', 12.7),
-  ('89d29388-7e2f-446a-9c05-67538d0d058a', 'aaaaaaaa-0034-0034-0034-000000000034', '2025-12-31', '2025-12-31 16:10:00+00', '2025-12-31 16:35:01+00', 5.29, 1501, 4.73, 8, 24, 'red', 17.7),
-  ('d5e40c7b-3141-4fec-b1f0-516b72a0d656', 'aaaaaaaa-0025-0025-0025-000000000025', '2025-12-31', '2025-12-31 08:33:00+00', '2025-12-31 10:07:51+00', 13.12, 5691, 7.23, 19, 76, 'red', 16.5),
-  ('7c175b8d-ba2b-4dca-af09-cb24f1ad7bcf', 'aaaaaaaa-0042-0042-0042-000000000042', '2025-12-31', '2025-12-31 14:43:00+00', '2025-12-31 15:10:01+00', 3.77, 1621, 7.17, 4, 12, 'blue', 18.5),
-  ('0af0af49-8ccb-4a30-8621-5b67b97ffd30', 'aaaaaaaa-0016-0016-0016-000000000016', '2025-12-31', '2025-12-31 17:22:00+00', '2025-12-31 18:50:52+00', 14.69, 5332, 6.05, 16, 48, 'red', 15.2),
-  ('217c7fa5-5deb-448c-9043-63b3d02c996e', 'aaaaaaaa-0004-0004-0004-000000000004', '2025-12-31', '2025-12-31 09:19:00+00', '2025-12-31 10:13:08+00', 8.19, 3248, 6.61, 5, 15, 'red', 11.9),
-  ('c56aefd4-124f-49c3-a55b-3d9afc8bfa1b', 'aaaaaaaa-0072-0072-0072-000000000072', '2025-12-31', '2025-12-31 14:56:00+00', '2025-12-31 15:44:50+00', 10.09, 2930, 4.84, 15, 15, 'blue', 4.7),
-  ('d4b03d2b-f94b-4bd7-92fd-9d3294298c32', 'aaaaaaaa-0007-0007-0007-000000000007', '2025-12-31', '2025-12-31 15:24:00+00', '2025-12-31 16:33:32+00', 11.18, 4172, 6.22, 13, 13, 'red', 6.0),
-  ('31bf1971-0d6f-4fac-a749-89e3a51d1c14', 'aaaaaaaa-0035-0035-0035-000000000035', '2025-12-31', '2025-12-31 14:07:00+00', '2025-12-31 14:25:40+00', 3.27, 1120, 5.71, 2, 2, 'red', 10.9),
-  ('e8ac666f-b07e-48d0-8b92-68a9c00baf1f', 'aaaaaaaa-0085-0085-0085-000000000085', '2025-12-31', '2025-12-31 08:44:00+00', '2025-12-31 09:13:12+00', 6.39, 1752, 4.57, 12, 24, 'purple', 10.2),
-  ('47a22c77-f8cb-472a-8fb5-3c7e33c13082', 'aaaaaaaa-0014-0014-0014-000000000014', '2025-12-31', '2025-12-31 21:51:00+00', '2025-12-31 22:52:13+00', 10.78, 3673, 5.68, 8, 24, 'red', 14.1),
-  ('8f0e41b7-e6a2-43b9-8920-efd5f2970c11', 'aaaaaaaa-0059-0059-0059-000000000059', '2025-12-31', '2025-12-31 18:59:00+00', '2025-12-31 19:39:14+00', 5.9, 2414, 6.82, 10, 20, 'blue', 9.9),
-  ('a1494ff6-7e8f-4385-b62d-9ca8968cb9a2', 'aaaaaaaa-0084-0084-0084-000000000084', '2025-12-31', '2025-12-31 14:29:00+00', '2025-12-31 15:31:37+00', 9.36, 3757, 6.69, 19, 19, 'purple', 14.5),
-  ('0ad88272-9b32-4d20-90c9-6cbcfc852832', 'aaaaaaaa-0053-0053-0053-000000000053', '2025-12-31', '2025-12-31 07:25:00+00', '2025-12-31 08:31:13+00', 8.31, 3973, 7.97, 15, 30, 'blue', 12.3),
-  ('663d58f3-f566-4005-84be-811caae99e05', 'aaaaaaaa-0021-0021-0021-000000000021', '2025-12-31', '2025-12-31 12:17:00+00', '2025-12-31 13:57:14+00', 14.26, 6014, 7.03, 21, 84, 'red', 6.1),
-  ('f24860d9-c819-429a-8fc3-0bc816d4d3e0', 'aaaaaaaa-0043-0043-0043-000000000043', '2025-12-31', '2025-12-31 20:47:00+00', '2025-12-31 22:31:29+00', 13.43, 6269, 7.78, 22, 44, 'blue', 11.0),
-  ('69ecef27-0551-4799-89cc-5933bcef8f36', 'aaaaaaaa-0099-0099-0099-000000000099', '2025-12-31', '2025-12-31 14:20:00+00', '2025-12-31 15:14:49+00', 7.37, 3289, 7.44, 16, 16, 'purple', 18.8),
-  ('bbdf9e61-8bb2-4370-b3f4-0f752073df8d', 'aaaaaaaa-0037-0037-0037-000000000037', '2025-12-31', '2025-12-31 11:16:00+00', '2025-12-31 12:02:24+00', 9.49, 2784, 4.89, 18, 72, 'red', 8.5),
-  ('64b3712b-a277-4b94-9d88-b78e139f408f', 'aaaaaaaa-0020-0020-0020-000000000020', '2025-12-31', '2025-12-31 18:11:00+00', '2025-12-31 19:07:36+00', 11.12, 3396, 5.09, 10, 20, 'red', 11.8),
-  ('2bdc9d13-80b4-4438-8c23-9c1d961d93cd', 'aaaaaaaa-0050-0050-0050-000000000050', '2025-12-31', '2025-12-31 08:35:00+00', '2025-12-31 09:11:37+00', 7.31, 2197, 5.01, 14, 14, 'blue', 9.4),
-  ('51841065-b447-433c-966b-a8fd692477d3', 'aaaaaaaa-0095-0095-0095-000000000095', '2025-12-31', '2025-12-31 17:19:00+00', '2025-12-31 17:34:38+00', 2.76, 938, 5.67, 5, 15, 'purple', 8.2),
-  ('da60336a-1c5e-4972-ba4a-368237bfdf48', 'aaaaaaaa-0040-0040-0040-000000000040', '2025-12-31', '2025-12-31 19:03:00+00', '2025-12-31 20:43:45+00', 14.71, 6045, 6.85, 27, 27, 'blue', 5.9),
-  ('d0d7d7aa-04c2-483f-ac8f-0f220d95de49', 'aaaaaaaa-0039-0039-0039-000000000039', '2025-12-31', '2025-12-31 19:31:00+00', '2025-12-31 19:51:55+00', 4.46, 1255, 4.69, 9, 36, 'red', 7.0),
-  ('b8650551-9e21-4654-979b-295c69fe557d', 'aaaaaaaa-0057-0057-0057-000000000057', '2025-12-31', '2025-12-31 11:37:00+00', '2025-12-31 12:01:17+00', 3.46, 1457, 7.02, 5, 15, 'blue', 6.3),
-  ('2dfa29cc-09a3-4e1e-8208-8f6498d1e2e6', 'aaaaaaaa-0010-0010-0010-000000000010', '2025-12-31', '2025-12-31 07:25:00+00', '2025-12-31 08:32:30+00', 14.97, 4050, 4.51, 20, 80, 'red', 19.9),
-  ('351cea94-91e7-4409-bc9a-ae6e606a1751', 'aaaaaaaa-0036-0036-0036-000000000036', '2025-12-31', '2025-12-31 09:22:00+00', '2025-12-31 09:50:24+00', 5.32, 1704, 5.34, 6, 18, 'red', 20.0),
-  ('238e478a-0e8d-42ee-99ff-24e7d975906f', 'aaaaaaaa-0073-0073-0073-000000000073', '2025-12-31', '2025-12-31 20:19:00+00', '2025-12-31 21:37:54+00', 10.65, 4734, 7.41, 18, 18, 'blue', 14.3),
-  ('7c4e6997-6018-4ff7-8437-c5271741fffb', 'aaaaaaaa-0016-0016-0016-000000000016', '2026-01-01', '2026-01-01 05:13:00+00', '2026-01-01 06:24:07+00', 12.5, 4267, 5.69, 13, 26, 'red', 23.2),
-  ('47e610de-6c66-4d42-ac49-b6d819b26aeb', 'aaaaaaaa-0087-0087-0087-000000000087', '2026-01-01', '2026-01-01 17:03:00+00', '2026-01-01 17:44:19+00', 8.25, 2479, 5.01, 19, 57, 'purple', 8.3),
-  ('a301cf0d-4bd9-49ea-915b-fb53e22efb2e', 'aaaaaaaa-0038-0038-0038-000000000038', '2026-01-01', '2026-01-01 18:36:00+00', '2026-01-01 19:06:48+00', 6.34, 1848, 4.86, 9, 9, 'red', 21.6),
-  ('1cb8411d-238f-49d0-b0be-58b0bc6fdcb2', 'aaaaaaaa-0031-0031-0031-000000000031', '2026-01-01', '2026-01-01 15:58:00+00', '2026-01-01 16:26:50+00', 6.11, 1730, 4.72, 8, 16, 'red', 22.6),
-  ('0f0d2969-5f06-4744-a979-2a52c06bc485', 'aaaaaaaa-0066-0066-0066-000000000066', '2026-01-01', '2026-01-01 13:22:00+00', '2026-01-01 14:35:14+00', 9.83, 4394, 7.45, 19, 38, 'blue', 17.5),
-  ('d8f359cf-e04e-414a-8f2b-ea53e6c0cbf3', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-01-01', '2026-01-01 10:40:00+00', '2026-01-01 11:35:11+00', 10.8, 3311, 5.11, 19, 19, 'blue', 21.9),
-  ('d97da136-fa84-40cb-8208-070bc18db5ef', 'aaaaaaaa-0037-0037-0037-000000000037', '2026-01-01', '2026-01-01 08:54:00+00', '2026-01-01 09:12:25+00', 3.53, 1105, 5.22, 6, 12, 'red', 11.0),
-  ('992f5bdc-03b0-4819-8ea2-51f186047d88', 'aaaaaaaa-0072-0072-0072-000000000072', '2026-01-01', '2026-01-01 12:09:00+00', '2026-01-01 12:45:27+00', 4.62, 2187, 7.89, 7, 14, 'blue', 19.9),
-  ('e2b4e181-0afb-4a69-b4b1-b16ea6c90128', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-01-01', '2026-01-01 05:52:00+00', '2026-01-01 07:06:51+00', 11.79, 4491, 6.35, 17, 51, 'red', 20.3),
-  ('33347628-e950-41fd-8d11-898fa6580e92', 'aaaaaaaa-0070-0070-0070-000000000070', '2026-01-01', '2026-01-01 14:13:00+00', '2026-01-01 14:48:48+00', 5.64, 2148, 6.35, 11, 33, 'blue', 23.2),
-  ('0aa8343e-dcd7-4a1b-96ad-ddb52b28973f', 'aaaaaaaa-0009-0009-0009-000000000009', '2026-01-01', '2026-01-01 21:07:00+00', '2026-01-01 21:27:38+00', 3.21, 1238, 6.43, 4, 16, 'red', 14.5),
-  ('426aea57-a79f-4dc0-9d48-70c7c7f8c1b9', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-01-01', '2026-01-01 18:53:00+00', '2026-01-01 20:18:49+00', 11.52, 5149, 7.45, 11, 22, 'red', 8.7),
-  ('12c00431-b7ce-4ac5-91a1-cafdb6389010', 'aaaaaaaa-0065-0065-0065-000000000065', '2026-01-01', '2026-01-01 18:52:00+00', '2026-01-01 19:27:28+00', 7.36, 2128, 4.82, 9, 27, 'blue', 12.3),
-  ('8ab1a18b-6929-4236-875e-c5609a32a802', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-01-01', '2026-01-01 08:38:00+00', '2026-01-01 09:03:49+00', 4.12, 1549, 6.27, 6, 18, 'red', 13.7),
-  ('214a713e-80fa-4ae0-96b9-7d4b6f791b4f', 'aaaaaaaa-0098-0098-0098-000000000098', '2026-01-01', '2026-01-01 17:30:00+00', '2026-01-01 18:33:57+00', 13.08, 3837, 4.89, 30, 60, 'purple', 11.1),
-  ('d29b7f73-28f6-4b57-88f2-3e3e51a007b3', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-01-01', '2026-01-01 10:01:00+00', '2026-01-01 11:36:20+00', 12.85, 5720, 7.42, 25, 75, 'purple', 5.9),
-  ('43439ad6-e6a9-4ca3-9efd-45f3b3714d89', 'aaaaaaaa-0052-0052-0052-000000000052', '2026-01-01', '2026-01-01 18:01:00+00', '2026-01-01 18:30:04+00', 5.57, 1744, 5.22, 11, 11, 'blue', 21.3),
-  ('086a54e3-cfa2-479d-8216-9e7ab11512fc', 'aaaaaaaa-0012-0012-0012-000000000012', '2026-01-01', '2026-01-01 20:32:00+00', '2026-01-01 21:45:56+00', 13.18, 4436, 5.61, 25, 50, 'red', 8.7),
-  ('329478bb-ea96-4d00-bd66-6fc46912e51d', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-01-01', '2026-01-01 19:53:00+00', '2026-01-01 21:01:54+00', 11.78, 4134, 5.85, 22, 22, 'blue', 5.5),
-  ('821cd29b-055b-440d-bdef-51f72c7b5850', 'aaaaaaaa-0092-0092-0092-000000000092', '2026-01-01', '2026-01-01 19:17:00+00', '2026-01-01 20:25:22+00', 10.07, 4102, 6.79, 17, 51, 'purple', 6.7),
-  ('b447454f-cbf3-4fde-b34b-629264fd5fca', 'aaaaaaaa-0032-0032-0032-000000000032', '2026-01-01', '2026-01-01 17:34:00+00', '2026-01-01 18:15:17+00', 5.2, 2477, 7.94, 7, 28, 'red', 10.5),
-  ('440e9932-dca2-4115-bf0d-1c41eef9c19c', 'aaaaaaaa-0045-0045-0045-000000000045', '2026-01-01', '2026-01-01 17:11:00+00', '2026-01-01 17:34:05+00', 3.05, 1385, 7.57, 4, 8, 'blue', 17.3),
-  ('a15531dd-f0b1-4ac0-93b7-0225a0062e3e', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-01-01', '2026-01-01 10:04:00+00', '2026-01-01 11:38:45+00', 12.91, 5685, 7.34, 14, 42, 'blue', 24.6),
-  ('3deb7906-707c-43b8-b605-67f4b0a1a9f0', 'aaaaaaaa-0074-0074-0074-000000000074', '2026-01-01', '2026-01-01 12:03:00+00', '2026-01-01 13:11:36+00', 9.65, 4116, 7.11, 12, 36, 'blue', 5.8),
-  ('e9f1ca0b-262b-4c23-9bda-03bbcdb94d0d', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-01-01', '2026-01-01 07:40:00+00', '2026-01-01 08:13:29+00', 5.61, 2009, 5.97, 10, 30, 'red', 12.9),
-  ('4440f3bc-49cf-49ce-9088-0012d3936775', 'aaaaaaaa-0064-0064-0064-000000000064', '2026-01-01', '2026-01-01 19:03:00+00', '2026-01-01 19:49:35+00', 10.13, 2795, 4.6, 11, 11, 'blue', 12.5),
-  ('0da2b07f-c415-40a9-a931-277667d8f868', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-01-01', '2026-01-01 08:21:00+00', '2026-01-01 09:00:36+00', 5.92, 2376, 6.69, 12, 48, 'red', 4.4),
-  ('d4cecf50-5481-4279-86d0-db77454df9d5', 'aaaaaaaa-0014-0014-0014-000000000014', '2026-01-01', '2026-01-01 09:09:00+00', '2026-01-01 10:20:51+00', 10.46, 4311, 6.87, 18, 54, 'red', 3.6),
-  ('717be274-622c-4ecb-99c9-318077d3d518', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-01-01', '2026-01-01 15:39:00+00', '2026-01-01 16:32:32+00', 8.1, 3212, 6.61, 18, 54, 'purple', 9.4),
-  ('0b832a74-a5b9-4f62-90d2-439a31090e6b', 'aaaaaaaa-0022-0022-0022-000000000022', '2026-01-01', '2026-01-01 05:23:00+00', '2026-01-01 05:56:20+00', 5.9, 2000, 5.65, 11, 22, 'red', 5.3),
-  ('c7aa60ca-9690-4a42-95d9-422d71d5b342', 'aaaaaaaa-0023-0023-0023-000000000023', '2026-01-01', '2026-01-01 06:01:00+00', '2026-01-01 06:13:14+00', 2.13, 734, 5.75, 4, 12, 'red', 15.2),
-  ('97274bf6-47d9-4244-ad30-3b7f9063d809', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-01-01', '2026-01-01 08:21:00+00', '2026-01-01 08:46:11+00', 4.59, 1511, 5.49, 6, 18, 'blue', 7.8),
-  ('ee183467-fe6c-4cae-81dd-c64fcde6fed5', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-01-01', '2026-01-01 21:24:00+00', '2026-01-01 22:42:55+00', 14.17, 4735, 5.57, 30, 30, 'purple', 8.3),
-  ('83dbe32c-6eaf-426e-9205-b87b0bb3deb3', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-01-01', '2026-01-01 19:33:00+00', '2026-01-01 20:52:33+00', 11.77, 4773, 6.76, 22, 44, 'blue', 14.2),
-  ('c99d02f9-e295-4144-bccc-a90d5f149b43', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-01-01', '2026-01-01 07:22:00+00', '2026-01-01 08:04:58+00', 6.57, 2578, 6.54, 6, 18, 'blue', 13.2),
-  ('9365647b-362d-46cb-b5f9-b03b82b00ca6', 'aaaaaaaa-0097-0097-0097-000000000097', '2026-01-01', '2026-01-01 11:30:00+00', '2026-01-01 12:45:52+00', 13.72, 4552, 5.53, 20, 60, 'purple', 14.0),
-  ('189dfaf4-288b-450d-8625-1709a9bfc9b2', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-01-01', '2026-01-01 16:08:00+00', '2026-01-01 16:41:00+00', 5.04, 1980, 6.55, 5, 5, 'blue', 15.2),
-  ('d6d901ac-0b5b-40fd-bff2-e10fbe701456', 'aaaaaaaa-0093-0093-0093-000000000093', '2026-01-01', '2026-01-01 08:21:00+00', '2026-01-01 09:08:04+00', 9.51, 2824, 4.95, 12, 24, 'purple', 23.8),
-  ('3c01bbed-998a-44bc-aa1f-43c1aa844232', 'aaaaaaaa-0046-0046-0046-000000000046', '2026-01-01', '2026-01-01 15:55:00+00', '2026-01-01 16:52:09+00', 9.4, 3429, 6.08, 15, 15, 'blue', 22.7),
-  ('0c1f8d68-693b-4f87-a5cd-6812510b2a5b', 'aaaaaaaa-0029-0029-0029-000000000029', '2026-01-01', '2026-01-01 16:44:00+00', '2026-01-01 18:05:10+00', 13.83, 4870, 5.87, 25, 100, 'red', 24.8),
-  ('09513992-fdbd-42e3-9d6e-c92cfcfd3e88', 'aaaaaaaa-0048-0048-0048-000000000048', '2026-01-01', '2026-01-01 06:29:00+00', '2026-01-01 08:03:08+00', 12.95, 5648, 7.27, 18, 54, 'blue', 11.6),
-  ('2826c7fb-03d3-40ac-a005-b0fed2eee309', 'aaaaaaaa-0042-0042-0042-000000000042', '2026-01-01', '2026-01-01 06:00:00+00', '2026-01-01 06:15:50+00', 2.35, 950, 6.74, 4, 8, 'blue', 17.9),
-  ('5bb152bb-ecb2-48f2-8b11-2d36e42f65c4', 'aaaaaaaa-0028-0028-0028-000000000028', '2026-01-01', '2026-01-01 10:18:00+00', '2026-01-01 10:54:42+00', 5.26, 2202, 6.98, 12, 12, 'red', 6.0),
-  ('70ac235c-bfaf-441e-b027-ea68ac4ed2de', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-01-01', '2026-01-01 19:44:00+00', '2026-01-01 20:09:37+00', 3.61, 1537, 7.1, 7, 14, 'red', 6.7),
-  ('c91d210f-70d8-4fac-8e7c-d26ef2ec3790', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-01-02', '2026-01-02 10:16:00+00', '2026-01-02 11:34:37+00', 10.12, 4717, 7.77, 20, 20, 'purple', 11.7),
-  ('37639bae-d810-45bf-a6e1-a1beece29d34', 'aaaaaaaa-0066-0066-0066-000000000066', '2026-01-02', '2026-01-02 19:47:00+00', '2026-01-02 21:22:30+00', 14.47, 5730, 6.6, 27, 81, 'blue', 24.6),
-  ('ef414daa-b70f-4526-a10c-fc571be62745', 'aaaaaaaa-0082-0082-0082-000000000082', '2026-01-02', '2026-01-02 12:32:00+00', '2026-01-02 13:38:38+00', 13.41, 3998, 4.97, 28, 28, 'purple', 10.0),
-  ('ab852abb-b042-4e19-953d-250d0eed2f31', 'aaaaaaaa-0084-0084-0084-000000000084', '2026-01-02', '2026-01-02 19:40:00+00', '2026-01-02 20:01:15+00', 3.02, 1275, 7.04, 3, 6, 'purple', 9.9),
-  ('3d9cce45-11e6-42db-b3b1-6a74e87a94c2', 'aaaaaaaa-0091-0091-0091-000000000091', '2026-01-02', '2026-01-02 17:27:00+00', '2026-01-02 18:01:44+00', 4.62, 2084, 7.52, 9, 9, 'purple', 13.6),
-  ('44ef3a4e-8143-4bc2-9214-44ec8133b56d', 'aaaaaaaa-0096-0096-0096-000000000096', '2026-01-02', '2026-01-02 20:19:00+00', '2026-01-02 21:52:47+00', 13.1, 5627, 7.16, 18, 36, 'purple', 23.3),
-  ('2789efc3-e0ee-4317-9465-ac603b00defc', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-01-02', '2026-01-02 12:38:00+00', '2026-01-02 13:45:45+00', 10.33, 4065, 6.56, 22, 66, 'red', 12.0),
-  ('5f4967ba-658c-439d-a5f1-6a8d9d55c1b7', 'aaaaaaaa-0049-0049-0049-000000000049', '2026-01-02', '2026-01-02 11:59:00+00', '2026-01-02 13:03:55+00', 9.52, 3895, 6.82, 18, 54, 'blue', 6.6),
-  ('65121ad6-d54d-4f37-9190-da7c1f75de3c', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-01-02', '2026-01-02 08:55:00+00', '2026-01-02 10:16:31+00', 11.73, 4891, 6.95, 15, 30, 'purple', 3.1),
-  ('2b73763b-e9cb-45c1-8f5a-46dd34d6b89d', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-01-02', '2026-01-02 15:23:00+00', '2026-01-02 16:12:05+00', 10.27, 2945, 4.78, 19, 76, 'red', 4.9),
-  ('cbec9ce5-dde0-4f83-badf-93134bf860e2', 'aaaaaaaa-0056-0056-0056-000000000056', '2026-01-02', '2026-01-02 15:43:00+00', '2026-01-02 16:44:54+00', 10.86, 3714, 5.7, 22, 22, 'blue', 9.9),
-  ('1f9ef312-bc25-4630-8b9b-84eef6e9f456', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-01-02', '2026-01-02 10:57:00+00', '2026-01-02 11:48:30+00', 7.78, 3090, 6.62, 15, 60, 'red', 11.8),
-  ('b3ab7658-3ac5-4387-94d0-21dbe36822c5', 'aaaaaaaa-0076-0076-0076-000000000076', '2026-01-02', '2026-01-02 15:55:00+00', '2026-01-02 16:33:13+00', 7.8, 2293, 4.9, 13, 13, 'blue', 17.6),
-  ('190a4e98-0457-44d2-9677-697e1aecebac', 'aaaaaaaa-0000-0000-0000-000000000000', '2026-01-02', '2026-01-02 07:21:00+00', '2026-01-02 07:53:00+00', 4.91, 1920, 6.52, 9, 9, 'red', 23.3),
-  ('fb46e9b1-36ac-4857-bcee-25585c389b98', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-01-02', '2026-01-02 14:09:00+00', '2026-01-02 15:39:28+00', 11.63, 5428, 7.78, 25, 25, 'purple', 19.4),
-  ('a4f2e009-d6ba-4eca-9e85-e8f83d18fa45', 'aaaaaaaa-0048-0048-0048-000000000048', '2026-01-02', '2026-01-02 17:25:00+00', '2026-01-02 18:52:28+00', 11.71, 5248, 7.47, 21, 42, 'blue', 21.2),
-  ('4546a687-d229-4e7c-87c4-9bca289fa8a6', 'aaaaaaaa-0025-0025-0025-000000000025', '2026-01-02', '2026-01-02 14:29:00+00', '2026-01-02 14:49:37+00', 2.93, 1237, 7.04, 3, 3, 'red', 9.2),
-  ('ca37a9dc-0d6f-4476-acb6-7b189f572e3e', 'aaaaaaaa-0031-0031-0031-000000000031', '2026-01-02', '2026-01-02 06:07:00+00', '2026-01-02 07:15:31+00', 10.51, 4111, 6.52, 23, 46, 'red', 12.7),
-  ('0e0946f1-de5a-4797-8d01-c858aab69f39', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-01-02', '2026-01-02 20:41:00+00', '2026-01-02 21:12:51+00', 5.13, 1911, 6.21, 11, 11, 'blue', 18.1),
-  ('a4305957-1845-4e95-a72c-4a1461206327', 'aaaaaaaa-0030-0030-0030-000000000030', '2026-01-02', '2026-01-02 10:00:00+00', '2026-01-02 11:07:07+00', 10.69, 4027, 6.28, 16, 32, 'red', 3.5),
-  ('ba835292-8459-4e1e-84f9-ff89233fc3b6', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-01-02', '2026-01-02 20:44:00+00', '2026-01-02 21:51:13+00', 9.21, 4033, 7.3, 18, 18, 'purple', 5.7),
-  ('fd6c4410-a76d-4cee-9999-b73c54f52a81', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-01-02', '2026-01-02 16:17:00+00', '2026-01-02 17:03:40+00', 6.07, 2800, 7.69, 6, 12, 'red', 24.9),
-  ('e6d98223-f57f-4287-8edc-b3b79abd9569', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-01-02', '2026-01-02 07:40:00+00', '2026-01-02 08:04:30+00', 3.67, 1470, 6.68, 7, 14, 'red', 4.6),
-  ('5c8857f7-590d-48e0-9984-e2737462bb90', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-01-02', '2026-01-02 17:14:00+00', '2026-01-02 18:45:55+00', 11.52, 5515, 7.98, 20, 20, 'blue', 18.3),
-  ('2b10867f-617c-4309-a3eb-c677c8b80d66', 'aaaaaaaa-0003-0003-0003-000000000003', '2026-01-02', '2026-01-02 10:22:00+00', '2026-01-02 10:55:42+00', 6.92, 2022, 4.87, 9, 36, 'red', 23.4),
-  ('940d447c-6cc8-476d-956e-53662635b02b', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-01-02', '2026-01-02 14:26:00+00', '2026-01-02 15:51:44+00', 12.48, 5144, 6.87, 18, 18, 'red', 20.4),
-  ('32a902ab-3843-4118-81db-255932e388eb', 'aaaaaaaa-0043-0043-0043-000000000043', '2026-01-02', '2026-01-02 12:11:00+00', '2026-01-02 13:40:40+00', 12.02, 5380, 7.46, 18, 54, 'blue', 17.0),
-  ('49cee41f-a392-44f7-b11c-5e2e99bd3529', 'aaaaaaaa-0024-0024-0024-000000000024', '2026-01-02', '2026-01-02 12:53:00+00', '2026-01-02 13:15:10+00', 2.98, 1330, 7.44, 6, 18, 'red', 14.3),
-  ('ada63073-1f4d-4f99-b881-50ece97794c3', 'aaaaaaaa-0008-0008-0008-000000000008', '2026-01-02', '2026-01-02 16:56:00+00', '2026-01-02 18:00:41+00', 9.01, 3881, 7.18, 12, 12, 'red', 5.6),
-  ('0adf9778-f7af-42e3-a674-f80e9ce6e35f', 'aaaaaaaa-0028-0028-0028-000000000028', '2026-01-02', '2026-01-02 05:22:00+00', '2026-01-02 06:29:18+00', 11.39, 4038, 5.91, 12, 48, 'red', 3.2),
-  ('b9470f14-e968-4e31-a781-33bb01b1e558', 'aaaaaaaa-0012-0012-0012-000000000012', '2026-01-02', '2026-01-02 18:38:00+00', '2026-01-02 20:12:09+00', 13.49, 5649, 6.98, 10, 30, 'red', 5.4),
-  ('c4659c3f-cfef-4c50-bf8f-0d16883ca8a3', 'aaaaaaaa-0021-0021-0021-000000000021', '2026-01-02', '2026-01-02 05:39:00+00', '2026-01-02 06:48:46+00', 11.59, 4186, 6.02, 6, 24, 'red', 9.4),
-  ('f0aa7251-158e-4439-9b77-cc0aaa4fb80c', 'aaaaaaaa-0068-0068-0068-000000000068', '2026-01-02', '2026-01-02 13:23:00+00', '2026-01-02 13:57:38+00', 4.6, 2078, 7.53, 9, 9, 'blue', 11.4),
-  ('dff3bd1e-6163-4984-b0d4-c05af21a14f2', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-01-02', '2026-01-02 13:31:00+00', '2026-01-02 14:03:22+00', 5.65, 1942, 5.73, 2, 4, 'red', 12.2),
-  ('4f3d9989-c4d4-4809-8e23-513bffab0504', 'aaaaaaaa-0087-0087-0087-000000000087', '2026-01-02', '2026-01-02 08:02:00+00', '2026-01-02 08:39:29+00', 6.73, 2249, 5.57, 16, 16, 'purple', 5.1),
-  ('a49dda1d-548f-49d7-9e23-0c2e191ce2df', 'aaaaaaaa-0093-0093-0093-000000000093', '2026-01-02', '2026-01-02 21:59:00+00', '2026-01-02 23:13:03+00', 9.63, 4443, 7.69, 21, 42, 'purple', 17.4),
-  ('a0d6c14a-6c74-48e3-8788-a4d782f852e4', 'aaaaaaaa-0041-0041-0041-000000000041', '2026-01-02', '2026-01-02 10:14:00+00', '2026-01-02 11:58:32+00', 14.38, 6272, 7.27, 29, 29, 'blue', 6.7),
-  ('8e941f8e-70c8-4e81-bf32-c475d3d17250', 'aaaaaaaa-0020-0020-0020-000000000020', '2026-01-02', '2026-01-02 08:00:00+00', '2026-01-02 08:13:48+00', 2.59, 828, 5.33, 3, 6, 'red', 3.9),
-  ('68cccafc-d69e-46c1-a5b2-59ff90695047', 'aaaaaaaa-0035-0035-0035-000000000035', '2026-01-02', '2026-01-02 09:28:00+00', '2026-01-02 10:37:59+00', 10.43, 4199, 6.71, 11, 44, 'red', 24.4),
-  ('27f5951b-d9d1-4a23-a7db-484417f4bcc7', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-01-02', '2026-01-02 10:56:00+00', '2026-01-02 11:31:16+00', 5.01, 2116, 7.04, 7, 14, 'blue', 11.1),
-  ('1c6b2b63-0b0a-4867-b0ad-a95c0ad88d07', 'aaaaaaaa-0069-0069-0069-000000000069', '2026-01-02', '2026-01-02 05:38:00+00', '2026-01-02 06:03:20+00', 4.31, 1520, 5.88, 5, 15, 'blue', 16.4),
-  ('734b4c1c-e40f-47c6-a967-ce8493a79dcb', 'aaaaaaaa-0049-0049-0049-000000000049', '2026-01-03', '2026-01-03 12:06:00+00', '2026-01-03 12:35:31+00', 3.84, 1771, 7.69, 4, 4, 'blue', 3.5),
-  ('0311084e-8c53-4734-aab0-16102ffbbba3', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-01-03', '2026-01-03 13:09:00+00', '2026-01-03 14:28:13+00', 14.43, 4753, 5.49, 21, 84, 'red', 4.7),
-  ('81a754b5-5124-4f1f-b1ba-379334bc11e6', 'aaaaaaaa-0014-0014-0014-000000000014', '2026-01-03', '2026-01-03 09:51:00+00', '2026-01-03 10:16:22+00', 3.18, 1522, 7.98, 4, 12, 'red', 7.0),
-  ('b79a9143-a793-4097-b3b0-e85bd6b3aa24', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-01-03', '2026-01-03 12:13:00+00', '2026-01-03 14:03:18+00', 14.27, 6618, 7.73, 14, 56, 'red', 11.4),
-  ('b6fe4c15-d48c-466f-be86-d1e0922ed047', 'aaaaaaaa-0082-0082-0082-000000000082', '2026-01-03', '2026-01-03 05:18:00+00', '2026-01-03 06:17:58+00', 12.76, 3598, 4.7, 27, 81, 'purple', 6.0),
-  ('542de538-05ef-4e83-b0a6-ef49d0809981', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-01-03', '2026-01-03 21:19:00+00', '2026-01-03 21:35:14+00', 3.45, 974, 4.71, 3, 9, 'red', 17.1),
-  ('a59a2a3d-1979-433d-b2c9-f96ba9c24946', 'aaaaaaaa-0016-0016-0016-000000000016', '2026-01-03', '2026-01-03 12:18:00+00', '2026-01-03 13:25:05+00', 11.22, 4025, 5.98, 16, 16, 'red', 6.4),
-  ('c0d18783-5cfe-4c06-930a-18764e129724', 'aaaaaaaa-0031-0031-0031-000000000031', '2026-01-03', '2026-01-03 20:02:00+00', '2026-01-03 20:22:03+00', 4.12, 1203, 4.87, 4, 4, 'red', 7.7),
-  ('d0b1d452-340b-4900-99a7-6e32577f2b5d', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-01-03', '2026-01-03 16:08:00+00', '2026-01-03 16:20:39+00', 2.62, 759, 4.83, 1, 4, 'red', 9.8),
-  ('1e84ecee-3a42-4cf7-922e-04cb9fbea594', 'aaaaaaaa-0034-0034-0034-000000000034', '2026-01-03', '2026-01-03 18:02:00+00', '2026-01-03 18:55:52+00', 11.13, 3232, 4.84, 12, 36, 'red', 12.0),
-  ('c777949e-50cb-4440-a1c7-d0cc207bacef', 'aaaaaaaa-0018-0018-0018-000000000018', '2026-01-03', '2026-01-03 08:36:00+00', '2026-01-03 10:13:54+00', 13.58, 5874, 7.21, 9, 18, 'red', 11.5),
-  ('3b59a6d6-bbd6-4593-8f4f-0e145c4bc5f0', 'aaaaaaaa-0080-0080-0080-000000000080', '2026-01-03', '2026-01-03 10:36:00+00', '2026-01-03 11:24:10+00', 8.35, 2890, 5.77, 18, 36, 'purple', 9.3),
-  ('cce4eaae-ab32-4fbd-b9ab-66e7da5ae102', 'aaaaaaaa-0076-0076-0076-000000000076', '2026-01-03', '2026-01-03 11:44:00+00', '2026-01-03 12:18:13+00', 7.19, 2053, 4.76, 16, 32, 'blue', 11.5),
-  ('b754df6c-1e83-4f48-8a85-4baef1494ba8', 'aaaaaaaa-0096-0096-0096-000000000096', '2026-01-03', '2026-01-03 21:13:00+00', '2026-01-03 22:10:02+00', 11.64, 3422, 4.9, 22, 44, 'purple', 13.0),
-  ('1371f50e-355e-4052-90b7-893b22978240', 'aaaaaaaa-0086-0086-0086-000000000086', '2026-01-03', '2026-01-03 08:50:00+00', '2026-01-03 09:47:56+00', 10.71, 3476, 5.41, 18, 36, 'purple', 21.3),
-  ('b0d63240-07f7-436a-9f8c-da9b296bb8e6', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-01-03', '2026-01-03 08:59:00+00', '2026-01-03 10:25:29+00', 14.61, 5189, 5.92, 19, 57, 'red', 14.5),
-  ('3b914746-4661-485d-84a4-858a416a2b86', 'aaaaaaaa-0069-0069-0069-000000000069', '2026-01-03', '2026-01-03 18:06:00+00', '2026-01-03 18:31:44+00', 4.29, 1544, 6.0, 10, 30, 'blue', 6.9),
-  ('b0a72da0-6fd3-40e3-a90e-65a87eeb60da', 'aaaaaaaa-0043-0043-0043-000000000043', '2026-01-03', '2026-01-03 12:32:00+00', '2026-01-03 13:32:14+00', 8.45, 3614, 7.13, 16, 32, 'blue', 23.4),
-  ('0d33a687-b9ae-49f0-8cba-6ed0ab324c26', 'aaaaaaaa-0091-0091-0091-000000000091', '2026-01-03', '2026-01-03 12:35:00+00', '2026-01-03 13:18:07+00', 5.69, 2587, 7.58, 11, 22, 'purple', 8.8),
-  ('15bd7557-1336-432f-9d37-dab8ba8b5bc2', 'aaaaaaaa-0025-0025-0025-000000000025', '2026-01-03', '2026-01-03 10:15:00+00', '2026-01-03 11:30:47+00', 14.66, 4547, 5.17, 23, 69, 'red', 17.2),
-  ('923b6e6b-45bb-4c49-9695-899961b240f3', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-01-03', '2026-01-03 07:31:00+00', '2026-01-03 08:26:20+00', 10.48, 3320, 5.28, 17, 68, 'red', 7.3),
-  ('1405156a-c070-4a98-8e00-2b42daed3e10', 'aaaaaaaa-0061-0061-0061-000000000061', '2026-01-03', '2026-01-03 09:17:00+00', '2026-01-03 10:26:01+00', 14.47, 4141, 4.77, 34, 102, 'blue', 18.1),
-  ('2eabb7d5-8237-4e3d-9be0-4fef4cf722aa', 'aaaaaaaa-0072-0072-0072-000000000072', '2026-01-03', '2026-01-03 14:10:00+00', '2026-01-03 14:38:54+00', 5.56, 1734, 5.2, 7, 7, 'blue', 5.0),
-  ('844664ee-90ad-4126-a166-fcb663a44323', 'aaaaaaaa-0056-0056-0056-000000000056', '2026-01-03', '2026-01-03 07:13:00+00', '2026-01-03 08:49:35+00', 12.32, 5795, 7.84, 16, 16, 'blue', 13.7),
-  ('bd25d9d2-eca4-469c-b749-ab6badb49a16', 'aaaaaaaa-0020-0020-0020-000000000020', '2026-01-03', '2026-01-03 20:31:00+00', '2026-01-03 21:32:07+00', 10.54, 3667, 5.8, 20, 20, 'red', 20.1),
-  ('d400a013-f201-4442-874d-ccd5742cf338', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-01-03', '2026-01-03 05:18:00+00', '2026-01-03 05:32:15+00', 2.61, 855, 5.46, 2, 4, 'red', 5.6),
-  ('25bff859-5b0a-40ac-bf94-28ad5db5a63f', 'aaaaaaaa-0042-0042-0042-000000000042', '2026-01-03', '2026-01-03 21:02:00+00', '2026-01-03 21:18:08+00', 2.23, 968, 7.24, 3, 3, 'blue', 15.7),
-  ('3f0515be-cd2b-441a-960e-3498ef5c4eca', 'aaaaaaaa-0078-0078-0078-000000000078', '2026-01-03', '2026-01-03 08:01:00+00', '2026-01-03 08:30:08+00', 6.39, 1748, 4.56, 8, 16, 'blue', 13.3),
-  ('fa5ec1b5-33a6-451d-bdd0-6a73d5aeae5e', 'aaaaaaaa-0019-0019-0019-000000000019', '2026-01-03', '2026-01-03 06:19:00+00', '2026-01-03 06:55:17+00', 4.91, 2177, 7.39, 4, 4, 'red', 6.1),
-  ('4220453d-b2f5-44c5-8c2d-033cb91d3f4e', 'aaaaaaaa-0092-0092-0092-000000000092', '2026-01-03', '2026-01-03 15:55:00+00', '2026-01-03 16:11:50+00', 2.98, 1010, 5.65, 6, 6, 'purple', 16.5),
-  ('17c0e687-a5a5-4d14-9ac4-4ed57cc5c346', 'aaaaaaaa-0007-0007-0007-000000000007', '2026-01-03', '2026-01-03 15:49:00+00', '2026-01-03 16:14:38+00', 3.92, 1538, 6.54, 5, 15, 'red', 21.7),
-  ('c4ba52e8-f127-445e-9f1b-4e4a9c08b118', 'aaaaaaaa-0090-0090-0090-000000000090', '2026-01-03', '2026-01-03 12:58:00+00', '2026-01-03 13:58:50+00', 11.5, 3650, 5.29, 26, 26, 'purple', 8.8),
-  ('557ad5ef-4202-47b9-8c3a-821a7408b280', 'aaaaaaaa-0015-0015-0015-000000000015', '2026-01-03', '2026-01-03 19:11:00+00', '2026-01-03 20:04:14+00', 6.73, 3194, 7.91, 12, 12, 'red', 22.1),
-  ('e20b933a-0867-4c0c-b6fc-03fcbe802aa7', 'aaaaaaaa-0098-0098-0098-000000000098', '2026-01-03', '2026-01-03 13:23:00+00', '2026-01-03 13:56:44+00', 5.47, 2024, 6.17, 6, 12, 'purple', 14.7),
-  ('04184471-e721-4a4c-8f47-72595494bd26', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-01-03', '2026-01-03 20:33:00+00', '2026-01-03 20:55:08+00', 3.27, 1328, 6.77, 7, 21, 'purple', 19.1),
-  ('e9dbd4b8-85b1-4e62-a12f-43646396f877', 'aaaaaaaa-0084-0084-0084-000000000084', '2026-01-03', '2026-01-03 14:45:00+00', '2026-01-03 15:37:33+00', 7.64, 3153, 6.88, 13, 39, 'purple', 17.2),
-  ('fbf945ff-78a2-42ea-9372-afca52f533de', 'aaaaaaaa-0037-0037-0037-000000000037', '2026-01-03', '2026-01-03 20:55:00+00', '2026-01-03 22:03:55+00', 9.75, 4135, 7.07, 17, 17, 'red', 5.1),
-  ('8575c0be-ed6b-4c99-aebd-7ccdcf991127', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-01-03', '2026-01-03 13:42:00+00', '2026-01-03 14:07:28+00', 5.22, 1528, 4.88, 3, 9, 'red', 21.0),
-  ('d089b6a1-207a-4117-b2fc-359a87bdf0c6', 'aaaaaaaa-0032-0032-0032-000000000032', '2026-01-03', '2026-01-03 07:12:00+00', '2026-01-03 08:00:05+00', 8.32, 2885, 5.78, 10, 20, 'red', 3.3),
-  ('17798f32-1f48-4ac8-be86-dfd03e4ac608', 'aaaaaaaa-0087-0087-0087-000000000087', '2026-01-03', '2026-01-03 05:29:00+00', '2026-01-03 06:50:18+00', 13.97, 4878, 5.82, 25, 50, 'purple', 5.4),
-  ('72d01a9a-7a6f-47fe-b97f-84bb5b32a92c', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-01-03', '2026-01-03 05:03:00+00', '2026-01-03 05:16:53+00', 2.53, 833, 5.49, 6, 18, 'blue', 16.0),
-  ('b3f128a3-9462-4819-ac1a-ec3f0fe60f0e', 'aaaaaaaa-0026-0026-0026-000000000026', '2026-01-03', '2026-01-03 16:15:00+00', '2026-01-03 16:45:11+00', 5.27, 1811, 5.73, 7, 28, 'red', 9.2),
-  ('c930d5ad-aadf-4fb5-9731-a61004fabd49', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-01-04', '2026-01-04 11:07:00+00', '2026-01-04 12:16:23+00', 11.82, 4163, 5.87, 16, 48, 'purple', 11.9),
-  ('feea6206-bfec-45b2-be20-1d52ea5bf5b5', 'aaaaaaaa-0049-0049-0049-000000000049', '2026-01-04', '2026-01-04 19:25:00+00', '2026-01-04 19:39:27+00', 2.87, 867, 5.04, 7, 21, 'blue', 22.4),
-  ('b4eeade6-8269-4b97-9776-e95a20c8c246', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-01-04', '2026-01-04 09:40:00+00', '2026-01-04 09:53:24+00', 2.72, 804, 4.93, 6, 12, 'blue', 11.9),
-  ('04b995b5-203b-4b31-ae08-d2f12e48cb0d', 'aaaaaaaa-0051-0051-0051-000000000051', '2026-01-04', '2026-01-04 20:18:00+00', '2026-01-04 20:29:23+00', 2.28, 683, 5.0, 4, 8, 'blue', 19.4),
-  ('aa898c15-d2bf-438b-bdfa-e8f59e655058', 'aaaaaaaa-0012-0012-0012-000000000012', '2026-01-04', '2026-01-04 05:37:00+00', '2026-01-04 06:04:56+00', 5.76, 1676, 4.85, 11, 44, 'red', 16.0),
-  ('c04304f5-d008-42df-ba55-38816d626c67', 'aaaaaaaa-0033-0033-0033-000000000033', '2026-01-04', '2026-01-04 21:04:00+00', '2026-01-04 21:44:09+00', 5.94, 2409, 6.76, 10, 40, 'red', 22.7),
-  ('d8d4c46d-19b6-4182-85f9-dfb80f5538a6', 'aaaaaaaa-0038-0038-0038-000000000038', '2026-01-04', '2026-01-04 10:36:00+00', '2026-01-04 10:57:28+00', 4.27, 1288, 5.03, 3, 12, 'red', 17.4),
-  ('83208fe0-f0de-4810-abf0-a3c19b1df78d', 'aaaaaaaa-0076-0076-0076-000000000076', '2026-01-04', '2026-01-04 07:28:00+00', '2026-01-04 08:38:17+00', 11.21, 4217, 6.27, 20, 20, 'blue', 17.5),
-  ('ca15f058-a586-4ee8-9e6d-42d987f98ad6', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-01-04', '2026-01-04 15:11:00+00', '2026-01-04 16:29:54+00', 11.92, 4734, 6.62, 19, 19, 'red', 21.5),
-  ('02624497-f5ed-41cc-9dc8-27ae11e18d25', 'aaaaaaaa-0022-0022-0022-000000000022', '2026-01-04', '2026-01-04 14:59:00+00', '2026-01-04 16:24:19+00', 10.87, 5119, 7.85, 10, 20, 'red', 19.0),
-  ('a817557c-8ae1-4b8e-9c4f-dc317150edef', 'aaaaaaaa-0072-0072-0072-000000000072', '2026-01-04', '2026-01-04 06:22:00+00', '2026-01-04 07:36:57+00', 12.77, 4497, 5.87, 20, 60, 'blue', 10.9),
-  ('05fcb7e1-d2b8-4b19-889a-76fc63eed3fb', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-01-04', '2026-01-04 16:12:00+00', '2026-01-04 18:07:20+00', 14.75, 6920, 7.82, 25, 50, 'blue', 16.2),
-  ('99214330-ffde-4e7b-a559-68bb5e4290f9', 'aaaaaaaa-0086-0086-0086-000000000086', '2026-01-04', '2026-01-04 15:22:00+00', '2026-01-04 16:11:48+00', 6.46, 2988, 7.71, 16, 16, 'purple', 8.2),
-  ('6c1c2f5b-cd68-4e19-9a44-aa228e45524d', 'aaaaaaaa-0041-0041-0041-000000000041', '2026-01-04', '2026-01-04 20:17:00+00', '2026-01-04 21:31:54+00', 9.83, 4494, 7.62, 11, 22, 'blue', 25.0),
-  ('f589004c-ddea-433c-8e9f-f3c21aae1c83', 'aaaaaaaa-0074-0074-0074-000000000074', '2026-01-04', '2026-01-04 09:02:00+00', '2026-01-04 09:25:13+00', 3.02, 1393, 7.69, 2, 6, 'blue', 21.5),
-  ('d8a39050-6536-409e-8dbe-82874dbccc65', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-01-04', '2026-01-04 11:48:00+00', '2026-01-04 13:30:05+00', 14.71, 6125, 6.94, 32, 96, 'red', 17.3),
-  ('c4bae68f-12fe-4619-8cdb-e7bfeb4571a2', 'aaaaaaaa-0025-0025-0025-000000000025', '2026-01-04', '2026-01-04 19:27:00+00', '2026-01-04 19:43:36+00', 2.36, 996, 7.04, 4, 12, 'red', 16.7),
-  ('6b542c5a-a7ad-4297-82c9-894db6d36e77', 'aaaaaaaa-0032-0032-0032-000000000032', '2026-01-04', '2026-01-04 10:28:00+00', '2026-01-04 11:29:15+00', 9.44, 3675, 6.49, 14, 42, 'red', 14.4),
-  ('c794539c-e305-4a2f-95ce-0e69f35863f5', 'aaaaaaaa-0084-0084-0084-000000000084', '2026-01-04', '2026-01-04 06:14:00+00', '2026-01-04 07:02:26+00', 8.02, 2906, 6.04, 15, 45, 'purple', 13.3),
-  ('be7c0961-c051-4f0f-a466-64aaae75d0eb', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-01-04', '2026-01-04 05:43:00+00', '2026-01-04 05:59:09+00', 3.49, 969, 4.63, 6, 12, 'blue', 18.1),
-  ('fe4b8634-cee9-4e3b-bef4-6de55088830f', 'aaaaaaaa-0070-0070-0070-000000000070', '2026-01-04', '2026-01-04 09:58:00+00', '2026-01-04 11:34:57+00', 12.98, 5817, 7.47, 22, 44, 'blue', 14.9),
-  ('9b62c1ab-7611-4c5a-9e6d-2771d5d48cf7', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-01-04', '2026-01-04 13:12:00+00', '2026-01-04 13:59:11+00', 9.69, 2831, 4.87, 20, 40, 'purple', 7.7),
-  ('263edf8c-dcc8-4398-a8d9-f5a9d437b495', 'aaaaaaaa-0093-0093-0093-000000000093', '2026-01-04', '2026-01-04 21:09:00+00', '2026-01-04 22:20:10+00', 12.87, 4270, 5.53, 25, 50, 'purple', 8.4),
-  ('2597cf53-8a81-4041-af5f-baafc8599f03', 'aaaaaaaa-0091-0091-0091-000000000091', '2026-01-04', '2026-01-04 12:45:00+00', '2026-01-04 13:48:40+00', 9.49, 3820, 6.71, 14, 28, 'purple', 20.0),
-  ('dc45193c-225f-4660-a6e8-a1c1d04ce449', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-01-04', '2026-01-04 21:05:00+00', '2026-01-04 21:38:00+00', 5.81, 1980, 5.68, 10, 20, 'red', 21.1),
-  ('3749792b-e5cd-4e44-9a5a-62308d342ff6', 'aaaaaaaa-0077-0077-0077-000000000077', '2026-01-04', '2026-01-04 14:31:00+00', '2026-01-04 14:49:01+00', 3.98, 1081, 4.53, 8, 8, 'blue', 16.0),
-  ('1db5f8c1-30f0-4192-8b4a-8b0eab07a3f6', 'aaaaaaaa-0089-0089-0089-000000000089', '2026-01-04', '2026-01-04 16:18:00+00', '2026-01-04 16:59:36+00', 6.43, 2496, 6.47, 10, 10, 'purple', 22.7),
-  ('af3fc4b7-30a1-4c2f-8eff-fb038894860e', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-01-04', '2026-01-04 21:48:00+00', '2026-01-04 22:10:51+00', 4.15, 1371, 5.51, 9, 9, 'blue', 13.7),
-  ('75aa594c-8aa3-4f5e-8ac3-aa4267ab4e22', 'aaaaaaaa-0069-0069-0069-000000000069', '2026-01-04', '2026-01-04 19:33:00+00', '2026-01-04 20:00:40+00', 4.2, 1660, 6.59, 9, 18, 'blue', 3.9),
-  ('7386337e-92ba-4071-8768-fbec8d121625', 'aaaaaaaa-0023-0023-0023-000000000023', '2026-01-04', '2026-01-04 07:47:00+00', '2026-01-04 08:09:10+00', 3.64, 1330, 6.09, 8, 24, 'red', 23.2),
-  ('f257fcb4-2282-4d8b-a0b3-693642bb6fe7', 'aaaaaaaa-0048-0048-0048-000000000048', '2026-01-04', '2026-01-04 07:33:00+00', '2026-01-04 08:59:47+00', 12.31, 5207, 7.05, 22, 66, 'blue', 10.2),
-  ('da7e5010-2935-4713-b22a-0982a07e9da9', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-01-04', '2026-01-04 08:11:00+00', '2026-01-04 09:44:33+00', 13.14, 5613, 7.12, 23, 46, 'purple', 3.1),
-  ('eb446255-d5de-44ae-bbb4-884f280bf175', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-01-04', '2026-01-04 17:16:00+00', '2026-01-04 18:01:11+00', 8.04, 2711, 5.62, 9, 18, 'purple', 5.5),
-  ('388f8a81-5008-4576-9711-b2d87f8b9812', 'aaaaaaaa-0099-0099-0099-000000000099', '2026-01-04', '2026-01-04 18:13:00+00', '2026-01-04 19:28:23+00', 13.86, 4523, 5.44, 17, 34, 'purple', 19.0),
-  ('a45abb1b-4e0e-4c24-8b4f-c17d880911b6', 'aaaaaaaa-0056-0056-0056-000000000056', '2026-01-04', '2026-01-04 21:46:00+00', '2026-01-04 22:35:21+00', 9.19, 2961, 5.37, 18, 18, 'blue', 3.3),
-  ('b5fe08aa-1aec-428d-b3c7-ef7678e0444c', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-01-04', '2026-01-04 21:15:00+00', '2026-01-04 22:33:43+00', 11.15, 4723, 7.06, 15, 30, 'blue', 3.4),
-  ('2dcda880-5e1e-434e-8a6f-efb7438c687b', 'aaaaaaaa-0045-0045-0045-000000000045', '2026-01-04', '2026-01-04 10:13:00+00', '2026-01-04 11:08:37+00', 6.97, 3337, 7.98, 7, 7, 'blue', 19.0),
-  ('feb53d86-83de-4747-8a0d-67562ad209b5', 'aaaaaaaa-0029-0029-0029-000000000029', '2026-01-04', '2026-01-04 10:33:00+00', '2026-01-04 11:55:13+00', 13.24, 4933, 6.21, 29, 29, 'red', 8.5),
-  ('bed126de-d279-4e1a-bca7-1afe802c0c11', 'aaaaaaaa-0090-0090-0090-000000000090', '2026-01-04', '2026-01-04 09:10:00+00', '2026-01-04 10:09:35+00', 11.73, 3575, 5.08, 23, 46, 'purple', 12.6),
-  ('67a0e02e-80a0-4930-9cc9-323a7c9b1ea5', 'aaaaaaaa-0027-0027-0027-000000000027', '2026-01-04', '2026-01-04 13:18:00+00', '2026-01-04 14:23:16+00', 8.82, 3916, 7.4, 14, 28, 'red', 3.2),
-  ('418ae2be-6b47-40c1-9081-55e6ef938900', 'aaaaaaaa-0062-0062-0062-000000000062', '2026-01-04', '2026-01-04 15:04:00+00', '2026-01-04 16:39:31+00', 12.67, 5731, 7.54, 22, 22, 'blue', 15.9),
-  ('f20c95e7-51ff-4e3a-9326-8806b9ec5c62', 'aaaaaaaa-0026-0026-0026-000000000026', '2026-01-04', '2026-01-04 19:49:00+00', '2026-01-04 20:52:52+00', 13.65, 3832, 4.68, 28, 84, 'red', 14.3),
-  ('e4789bea-1e92-4b38-a906-4fa641d176eb', 'aaaaaaaa-0058-0058-0058-000000000058', '2026-01-04', '2026-01-04 06:36:00+00', '2026-01-04 07:51:30+00', 10.71, 4530, 7.05, 17, 34, 'blue', 7.7),
-  ('518e37b7-ac49-474c-b3c4-cc4e6b906987', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-01-04', '2026-01-04 18:53:00+00', '2026-01-04 20:28:30+00', 12.7, 5730, 7.52, 15, 30, 'blue', 23.4),
-  ('b0f06aab-7e8b-4cef-9653-aa55087de02f', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-01-04', '2026-01-04 15:37:00+00', '2026-01-04 16:27:24+00', 10.68, 3024, 4.72, 20, 40, 'red', 7.2),
-  ('c32b643e-cd80-4e2f-8751-82a226284a80', 'aaaaaaaa-0035-0035-0035-000000000035', '2026-01-04', '2026-01-04 13:05:00+00', '2026-01-04 13:51:23+00', 10.15, 2783, 4.57, 18, 72, 'red', 6.7),
-  ('2242813f-ab35-4232-a1a6-4bf44bb988dc', 'aaaaaaaa-0068-0068-0068-000000000068', '2026-01-04', '2026-01-04 19:16:00+00', '2026-01-04 20:10:39+00', 8.37, 3279, 6.53, 13, 13, 'blue', 10.7),
-  ('9687f0ae-2720-4e05-b3f6-e432ab105414', 'aaaaaaaa-0098-0098-0098-000000000098', '2026-01-04', '2026-01-04 17:42:00+00', '2026-01-04 17:53:48+00', 2.41, 708, 4.9, 4, 8, 'purple', 17.5),
-  ('08619fd1-dfa3-4cc9-bfcf-aef665caa0ea', 'aaaaaaaa-0057-0057-0057-000000000057', '2026-01-04', '2026-01-04 15:30:00+00', '2026-01-04 16:14:34+00', 9.65, 2674, 4.62, 13, 39, 'blue', 18.4),
-  ('c3d3f973-628b-478d-9ed6-2085e6d25902', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-01-04', '2026-01-04 09:12:00+00', '2026-01-04 10:12:03+00', 10.82, 3603, 5.55, 17, 17, 'red', 24.4),
-  ('73311ff2-7ee9-471e-bf2c-5d59c721a298', 'aaaaaaaa-0071-0071-0071-000000000071', '2026-01-04', '2026-01-04 17:34:00+00', '2026-01-04 18:48:48+00', 13.48, 4488, 5.55, 15, 30, 'blue', 4.8),
-  ('bfcdbaa1-b753-4ce4-bf0f-87a2ad63dc45', 'aaaaaaaa-0008-0008-0008-000000000008', '2026-01-04', '2026-01-04 15:32:00+00', '2026-01-04 15:50:11+00', 2.93, 1091, 6.21, 6, 18, 'red', 19.3),
-  ('1b44afbf-83e0-4304-b71f-e3e20d7e17f3', 'aaaaaaaa-0092-0092-0092-000000000092', '2026-01-04', '2026-01-04 17:51:00+00', '2026-01-04 19:15:19+00', 12.7, 5059, 6.64, 31, 31, 'purple', 19.5),
-  ('497e0da5-9c1b-4ffc-9105-4a1e5c43e1f8', 'aaaaaaaa-0019-0019-0019-000000000019', '2026-01-04', '2026-01-04 18:03:00+00', '2026-01-04 19:06:11+00', 12.49, 3791, 5.06, 24, 96, 'red', 5.8),
-  ('b2452d56-fcc3-4025-86f9-3f72e976cc66', 'aaaaaaaa-0015-0015-0015-000000000015', '2026-01-04', '2026-01-04 16:46:00+00', '2026-01-04 17:23:18+00', 8.04, 2238, 4.64, 9, 9, 'red', 22.1),
-  ('a6568812-b1e6-4d5a-abc4-6cb47b53c66d', 'aaaaaaaa-0037-0037-0037-000000000037', '2026-01-04', '2026-01-04 13:22:00+00', '2026-01-04 13:39:34+00', 2.48, 1054, 7.09, 4, 16, 'red', 8.5),
-  ('83fca411-baa4-4dce-ae43-b9ba0aeae714', 'aaaaaaaa-0082-0082-0082-000000000082', '2026-01-04', '2026-01-04 10:17:00+00', '2026-01-04 11:58:05+00', 14.63, 6065, 6.91, 32, 96, 'purple', 8.4),
-  ('58da0d2f-2a0b-4cbd-8335-a78cecde8a91', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-01-04', '2026-01-04 18:40:00+00', '2026-01-04 19:19:42+00', 8.52, 2382, 4.66, 18, 36, 'blue', 11.8),
-  ('ffb563fb-1d5b-4c08-aca8-012598912c05', 'aaaaaaaa-0052-0052-0052-000000000052', '2026-01-04', '2026-01-04 15:28:00+00', '2026-01-04 16:30:20+00', 9.74, 3740, 6.4, 16, 32, 'blue', 13.5),
-  ('028b941b-60ee-43a2-ae06-6e3a8514a3e7', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-01-04', '2026-01-04 18:57:00+00', '2026-01-04 19:46:32+00', 10.77, 2972, 4.6, 14, 14, 'blue', 16.7),
-  ('4f2ae87d-2823-4f6c-a108-4958da55d60a', 'aaaaaaaa-0034-0034-0034-000000000034', '2026-01-04', '2026-01-04 18:12:00+00', '2026-01-04 19:07:01+00', 9.79, 3301, 5.62, 16, 64, 'red', 11.0),
-  ('126771a2-5bbe-4395-9434-e3e515e6b6d7', 'aaaaaaaa-0036-0036-0036-000000000036', '2026-01-04', '2026-01-04 14:04:00+00', '2026-01-04 15:12:30+00', 10.27, 4110, 6.67, 17, 34, 'red', 6.0),
-  ('c204496e-afbb-4f1e-b88f-d5b998a21998', 'aaaaaaaa-0018-0018-0018-000000000018', '2026-01-04', '2026-01-04 17:45:00+00', '2026-01-04 18:56:08+00', 13.63, 4268, 5.22, 18, 54, 'red', 13.1),
-  ('85fe981c-f356-466c-a64b-d096abe0c1dc', 'aaaaaaaa-0003-0003-0003-000000000003', '2026-01-04', '2026-01-04 05:14:00+00', '2026-01-04 06:48:12+00', 14.06, 5652, 6.7, 16, 48, 'red', 12.7),
-  ('ef1f4514-b3fc-4166-a8d2-2f42798cb796', 'aaaaaaaa-0072-0072-0072-000000000072', '2026-01-05', '2026-01-05 13:51:00+00', '2026-01-05 14:46:02+00', 8.48, 3302, 6.49, 18, 18, 'blue', 17.1),
-  ('3ae47403-7510-40d7-a0ae-c16add09dfc5', 'aaaaaaaa-0046-0046-0046-000000000046', '2026-01-05', '2026-01-05 11:06:00+00', '2026-01-05 12:26:13+00', 11.61, 4813, 6.91, 18, 36, 'blue', 17.3),
-  ('5d6409f2-e80a-4e91-94e4-a32c2f135d05', 'aaaaaaaa-0091-0091-0091-000000000091', '2026-01-05', '2026-01-05 13:43:00+00', '2026-01-05 14:30:30+00', 9.05, 2850, 5.25, 21, 42, 'purple', 13.7),
-  ('88d658f3-5000-43f8-9b15-e0a38b1fe119', 'aaaaaaaa-0037-0037-0037-000000000037', '2026-01-05', '2026-01-05 15:49:00+00', '2026-01-05 16:40:53+00', 9.3, 3113, 5.58, 14, 42, 'red', 12.7),
-  ('2737f28d-9696-4057-8de9-0cb5716c9929', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-01-05', '2026-01-05 16:53:00+00', '2026-01-05 17:36:15+00', 8.9, 2595, 4.86, 5, 15, 'red', 9.6),
-  ('aa99e2c8-d9f4-4f43-9c8b-b4afee2b9164', 'aaaaaaaa-0097-0097-0097-000000000097', '2026-01-05', '2026-01-05 15:46:00+00', '2026-01-05 16:56:57+00', 11.69, 4257, 6.07, 24, 24, 'purple', 12.4),
-  ('8e03c0f7-a683-49be-8a4a-78d654aeeefe', 'aaaaaaaa-0020-0020-0020-000000000020', '2026-01-05', '2026-01-05 15:49:00+00', '2026-01-05 16:46:50+00', 8.24, 3470, 7.02, 12, 12, 'red', 13.3),
-  ('4f8e17b7-89aa-411a-90a9-f1a04e8393f3', 'aaaaaaaa-0099-0099-0099-000000000099', '2026-01-05', '2026-01-05 11:43:00+00', '2026-01-05 13:08:07+00', 11.52, 5107, 7.39, 19, 38, 'purple', 22.2),
-  ('bc84ab43-e22d-40f8-9fdb-29fd02ff9625', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-01-05', '2026-01-05 19:56:00+00', '2026-01-05 21:15:08+00', 14.63, 4748, 5.41, 18, 36, 'purple', 16.3),
-  ('4d1af592-f486-427a-aa63-7f85c0ad0c27', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-01-05', '2026-01-05 06:49:00+00', '2026-01-05 08:24:21+00', 13.45, 5721, 7.09, 16, 48, 'purple', 17.3),
-  ('136b684e-52db-4319-86ac-ea75c3e18c84', 'aaaaaaaa-0060-0060-0060-000000000060', '2026-01-05', '2026-01-05 16:01:00+00', '2026-01-05 16:21:56+00', 3.66, 1256, 5.72, 9, 9, 'blue', 4.5),
-  ('8a6b117e-cb7e-44fa-99c5-9e8206e8c7e5', 'aaaaaaaa-0056-0056-0056-000000000056', '2026-01-05', '2026-01-05 11:49:00+00', '2026-01-05 12:17:59+00', 3.79, 1739, 7.65, 8, 8, 'blue', 12.7),
-  ('d8aa4563-f62b-4336-aa38-9d2e0cc3985e', 'aaaaaaaa-0086-0086-0086-000000000086', '2026-01-05', '2026-01-05 21:07:00+00', '2026-01-05 21:58:04+00', 6.95, 3064, 7.35, 8, 16, 'purple', 5.0),
-  ('5ae83e74-1cc1-43c6-a35f-97631226a17f', 'aaaaaaaa-0096-0096-0096-000000000096', '2026-01-05', '2026-01-05 10:26:00+00', '2026-01-05 11:31:07+00', 14.28, 3907, 4.56, 14, 28, 'purple', 11.4),
-  ('9d929db5-b8ad-4b2b-8bf8-565300b19e4f', 'aaaaaaaa-0019-0019-0019-000000000019', '2026-01-05', '2026-01-05 15:01:00+00', '2026-01-05 15:33:59+00', 4.24, 1979, 7.78, 9, 27, 'red', 24.2),
-  ('be064b57-d7ce-4f98-b92a-bd3810d28b8b', 'aaaaaaaa-0016-0016-0016-000000000016', '2026-01-05', '2026-01-05 08:30:00+00', '2026-01-05 09:38:56+00', 12.18, 4136, 5.66, 23, 69, 'red', 22.6),
-  ('69e65cb1-c490-43c0-8fb9-1bee38f675ed', 'aaaaaaaa-0018-0018-0018-000000000018', '2026-01-05', '2026-01-05 09:20:00+00', '2026-01-05 10:22:19+00', 8.41, 3739, 7.41, 12, 36, 'red', 15.6),
-  ('d93bb2eb-9041-491e-b722-71ba69edde8c', 'aaaaaaaa-0077-0077-0077-000000000077', '2026-01-05', '2026-01-05 11:29:00+00', '2026-01-05 12:20:00+00', 7.49, 3060, 6.81, 14, 28, 'blue', 15.7),
-  ('e453b298-4996-48a5-8437-002fe95121bc', 'aaaaaaaa-0087-0087-0087-000000000087', '2026-01-05', '2026-01-05 16:19:00+00', '2026-01-05 17:23:36+00', 10.08, 3876, 6.41, 13, 13, 'purple', 5.6),
-  ('a982bb0e-4f03-4496-bded-8072277b0e82', 'aaaaaaaa-0049-0049-0049-000000000049', '2026-01-05', '2026-01-05 21:10:00+00', '2026-01-05 22:00:44+00', 7.88, 3044, 6.44, 14, 14, 'blue', 23.7),
-  ('92b056e4-7bd1-492c-b5b2-352550e1f5f6', 'aaaaaaaa-0032-0032-0032-000000000032', '2026-01-05', '2026-01-05 07:16:00+00', '2026-01-05 07:49:19+00', 6.87, 1999, 4.85, 12, 12, 'red', 6.6),
-  ('a670e847-5c97-4bb1-95d4-3c6dab029de0', 'aaaaaaaa-0029-0029-0029-000000000029', '2026-01-05', '2026-01-05 08:33:00+00', '2026-01-05 09:49:40+00', 11.21, 4600, 6.84, 18, 18, 'red', 7.6),
-  ('ac3f7424-b560-4ba4-bd7c-d9585956ccc6', 'aaaaaaaa-0003-0003-0003-000000000003', '2026-01-05', '2026-01-05 18:37:00+00', '2026-01-05 19:06:24+00', 6.05, 1764, 4.86, 9, 36, 'red', 16.8),
-  ('877ca3c3-7b92-4e61-8c70-ec0bed5fe6c5', 'aaaaaaaa-0027-0027-0027-000000000027', '2026-01-05', '2026-01-05 18:26:00+00', '2026-01-05 18:55:14+00', 4.19, 1754, 6.98, 6, 24, 'red', 22.0),
-  ('9122a8a7-b4f2-40bc-a21c-3c40df52601a', 'aaaaaaaa-0074-0074-0074-000000000074', '2026-01-05', '2026-01-05 05:06:00+00', '2026-01-05 05:19:20+00', 2.74, 800, 4.87, 5, 5, 'blue', 19.9),
-  ('73ad0edb-c303-4d99-ae7b-00abb43d55ad', 'aaaaaaaa-0038-0038-0038-000000000038', '2026-01-05', '2026-01-05 10:01:00+00', '2026-01-05 11:10:52+00', 11.27, 4192, 6.2, 16, 32, 'red', 15.9),
-  ('e06dadd2-193d-42b5-8fbf-f6136d75c702', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-01-05', '2026-01-05 14:06:00+00', '2026-01-05 15:03:37+00', 10.2, 3457, 5.65, 19, 38, 'purple', 9.4),
-  ('1aed91ec-9525-4d18-b139-9a3fc3462939', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-01-05', '2026-01-05 08:54:00+00', '2026-01-05 10:00:54+00', 13.88, 4014, 4.82, 17, 68, 'red', 11.9),
-  ('06f7c46c-ba35-46e1-af51-dbecffffcbd9', 'aaaaaaaa-0033-0033-0033-000000000033', '2026-01-05', '2026-01-05 13:45:00+00', '2026-01-05 15:31:03+00', 14.43, 6363, 7.35, 11, 44, 'red', 22.5),
-  ('b9f1d159-6f8a-4be5-808e-2dbe265025e2', 'aaaaaaaa-0098-0098-0098-000000000098', '2026-01-05', '2026-01-05 05:35:00+00', '2026-01-05 06:46:19+00', 12.36, 4279, 5.77, 23, 23, 'purple', 20.6),
-  ('f293340b-167e-4850-94c6-b63d15465764', 'aaaaaaaa-0065-0065-0065-000000000065', '2026-01-05', '2026-01-05 21:26:00+00', '2026-01-05 22:19:05+00', 7.83, 3185, 6.78, 18, 18, 'blue', 22.7),
-  ('2b7cc794-7f9c-4131-aebe-5c334d8e0fe9', 'aaaaaaaa-0066-0066-0066-000000000066', '2026-01-05', '2026-01-05 10:46:00+00', '2026-01-05 11:10:47+00', 3.88, 1487, 6.39, 7, 14, 'blue', 18.0),
-  ('969a8936-d1a2-4ee7-9c34-caa6fe863637', 'aaaaaaaa-0051-0051-0051-000000000051', '2026-01-05', '2026-01-05 17:44:00+00', '2026-01-05 18:19:55+00', 4.53, 2155, 7.93, 7, 14, 'blue', 20.0),
-  ('c009f108-0936-4794-b2cc-5efad4cf050f', 'aaaaaaaa-0061-0061-0061-000000000061', '2026-01-05', '2026-01-05 06:35:00+00', '2026-01-05 07:36:01+00', 8.17, 3661, 7.47, 11, 33, 'blue', 7.0),
-  ('07056ce0-a53e-4475-956c-3113e00e4d5d', 'aaaaaaaa-0021-0021-0021-000000000021', '2026-01-05', '2026-01-05 16:54:00+00', '2026-01-05 17:10:05+00', 2.77, 965, 5.81, 4, 4, 'red', 6.7),
-  ('5b71c555-4e85-4049-be18-63d2a8358724', 'aaaaaaaa-0044-0044-0044-000000000044', '2026-01-05', '2026-01-05 16:36:00+00', '2026-01-05 16:50:47+00', 2.9, 887, 5.1, 2, 6, 'blue', 17.0),
-  ('bbf27002-ed5a-4e8c-9ddf-59f48556ea1b', 'aaaaaaaa-0085-0085-0085-000000000085', '2026-01-05', '2026-01-05 16:43:00+00', '2026-01-05 17:08:58+00', 4.3, 1558, 6.04, 9, 9, 'purple', 21.6),
-  ('12ec3ee6-4e23-4481-a097-e3985bd101ad', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-01-05', '2026-01-05 07:21:00+00', '2026-01-05 07:48:26+00', 4.35, 1646, 6.31, 8, 24, 'purple', 22.8),
-  ('cf59ef87-48ca-42e2-b34d-d26f783e5f4d', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-01-05', '2026-01-05 21:25:00+00', '2026-01-05 21:50:56+00', 5.2, 1556, 4.99, 7, 21, 'blue', 24.1),
-  ('217e3700-086f-4262-af65-0daa76d320ca', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-01-05', '2026-01-05 14:24:00+00', '2026-01-05 15:43:55+00', 11.84, 4795, 6.75, 20, 20, 'blue', 9.2),
-  ('e4706300-0157-4f41-ac72-1906cd30b3d5', 'aaaaaaaa-0093-0093-0093-000000000093', '2026-01-05', '2026-01-05 15:04:00+00', '2026-01-05 15:39:01+00', 4.45, 2101, 7.87, 7, 21, 'purple', 4.2),
-  ('eaa2277a-5ffb-44cd-9399-fb2afded8a5a', 'aaaaaaaa-0071-0071-0071-000000000071', '2026-01-05', '2026-01-05 11:52:00+00', '2026-01-05 13:02:16+00', 11.28, 4216, 6.23, 20, 40, 'blue', 15.6),
-  ('caa44ee0-37e1-420c-a6de-246d3faec480', 'aaaaaaaa-0023-0023-0023-000000000023', '2026-01-05', '2026-01-05 20:30:00+00', '2026-01-05 21:35:22+00', 12.13, 3922, 5.39, 22, 22, 'red', 3.2),
-  ('521e14a3-f0a0-4ba9-9f35-d7d43bc66e39', 'aaaaaaaa-0024-0024-0024-000000000024', '2026-01-05', '2026-01-05 06:42:00+00', '2026-01-05 07:00:07+00', 3.42, 1087, 5.3, 7, 28, 'red', 21.3),
-  ('72aba9f2-153d-4879-a67f-d2c6bd275df7', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-01-05', '2026-01-05 07:26:00+00', '2026-01-05 09:07:31+00', 14.14, 6091, 7.18, 20, 20, 'blue', 7.2),
-  ('da302bb7-8422-4983-b942-f2c17368e803', 'aaaaaaaa-0031-0031-0031-000000000031', '2026-01-05', '2026-01-05 17:28:00+00', '2026-01-05 18:07:48+00', 8.73, 2388, 4.56, 14, 42, 'red', 18.9),
-  ('a7724fef-8367-4c64-bde5-1874d5c79fd5', 'aaaaaaaa-0041-0041-0041-000000000041', '2026-01-05', '2026-01-05 19:24:00+00', '2026-01-05 20:37:42+00', 13.83, 4422, 5.33, 18, 36, 'blue', 13.8),
-  ('15136568-52ed-4ca8-9682-9fc7f3146760', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-01-05', '2026-01-05 14:57:00+00', '2026-01-05 15:42:36+00', 8.03, 2736, 5.68, 16, 64, 'red', 17.6),
-  ('e5e95767-4a3e-43a9-95f1-58dff21b614c', 'aaaaaaaa-0058-0058-0058-000000000058', '2026-01-05', '2026-01-05 05:58:00+00', '2026-01-05 07:30:30+00', 12.83, 5550, 7.21, 15, 15, 'blue', 16.7),
-  ('fb11095a-74bd-4a9a-b0d6-f862a9df0329', 'aaaaaaaa-0030-0030-0030-000000000030', '2026-01-05', '2026-01-05 20:24:00+00', '2026-01-05 21:25:49+00', 13.21, 3709, 4.68, 23, 92, 'red', 21.8),
-  ('0049d65e-f2ee-4101-b5f9-851842c996cc', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-01-05', '2026-01-05 15:18:00+00', '2026-01-05 16:16:52+00', 8.2, 3532, 7.18, 9, 18, 'red', 15.9),
-  ('67431d0c-a04d-4e68-941c-9e18239b1c82', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-01-05', '2026-01-05 06:08:00+00', '2026-01-05 07:35:58+00', 11.25, 5278, 7.82, 14, 42, 'blue', 4.8),
-  ('0127369b-d34e-4e99-9cd5-a4237f8ded0b', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-01-05', '2026-01-05 12:04:00+00', '2026-01-05 13:47:15+00', 13.34, 6195, 7.74, 31, 31, 'purple', 3.2),
-  ('e95acd5e-dc17-4db5-88e1-f39ffb1b4007', 'aaaaaaaa-0000-0000-0000-000000000000', '2026-01-05', '2026-01-05 08:39:00+00', '2026-01-05 08:59:20+00', 4.3, 1220, 4.73, 7, 21, 'red', 15.6),
-  ('000035b8-8e01-436f-8b28-7a6967c045be', 'aaaaaaaa-0042-0042-0042-000000000042', '2026-01-05', '2026-01-05 07:24:00+00', '2026-01-05 07:48:59+00', 3.59, 1499, 6.96, 3, 9, 'blue', 7.4),
-  ('78cb3b3a-1019-4589-9333-946d5cc07735', 'aaaaaaaa-0004-0004-0004-000000000004', '2026-01-05', '2026-01-05 08:44:00+00', '2026-01-05 09:23:10+00', 6.17, 2350, 6.35, 11, 22, 'red', 13.5),
-  ('af981f1b-847c-4b7d-84f3-64bf82c1151b', 'aaaaaaaa-0069-0069-0069-000000000069', '2026-01-05', '2026-01-05 16:44:00+00', '2026-01-05 17:45:24+00', 11.9, 3684, 5.16, 20, 40, 'blue', 21.7),
-  ('8cf473fe-ec2c-4160-b747-2731b98669bd', 'aaaaaaaa-0014-0014-0014-000000000014', '2026-01-05', '2026-01-05 05:55:00+00', '2026-01-05 07:09:32+00', 10.85, 4472, 6.87, 15, 60, 'red', 4.4),
-  ('c3b69c43-5dce-4033-a980-baf37dcdd3c8', 'aaaaaaaa-0063-0063-0063-000000000063', '2026-01-05', '2026-01-05 05:25:00+00', '2026-01-05 05:46:22+00', 3.81, 1282, 5.61, 5, 5, 'blue', 24.8),
-  ('2c05a3b2-2248-4483-9a85-e7148be3772a', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-01-05', '2026-01-05 21:31:00+00', '2026-01-05 22:15:21+00', 8.14, 2661, 5.45, 6, 12, 'red', 7.4),
-  ('09135dc6-664d-4813-96b6-004eef917f09', 'aaaaaaaa-0045-0045-0045-000000000045', '2026-01-05', '2026-01-05 12:45:00+00', '2026-01-05 13:59:12+00', 12.45, 4452, 5.96, 17, 34, 'blue', 3.3),
-  ('0bf0cee6-f38d-4371-8b37-1bccf38500d7', 'aaaaaaaa-0009-0009-0009-000000000009', '2026-01-05', '2026-01-05 12:40:00+00', '2026-01-05 13:31:45+00', 9.71, 3105, 5.33, 13, 26, 'red', 21.0),
-  ('1018571e-d97d-4c8f-9566-da6933fd9448', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-01-05', '2026-01-05 11:52:00+00', '2026-01-05 12:03:43+00', 2.04, 703, 5.75, 2, 6, 'red', 16.7),
-  ('0474c00b-d7cb-431f-af41-66cf5b04ecf7', 'aaaaaaaa-0007-0007-0007-000000000007', '2026-01-05', '2026-01-05 19:17:00+00', '2026-01-05 20:21:42+00', 12.54, 3882, 5.16, 17, 51, 'red', 23.3),
-  ('ae90a4af-81aa-45a6-a690-328035d3c245', 'aaaaaaaa-0012-0012-0012-000000000012', '2026-01-05', '2026-01-05 17:35:00+00', '2026-01-05 18:05:15+00', 4.57, 1815, 6.62, 5, 15, 'red', 9.3),
-  ('e104bc65-05f4-418d-a7c7-da58757303f1', 'aaaaaaaa-0022-0022-0022-000000000022', '2026-01-05', '2026-01-05 21:03:00+00', '2026-01-05 21:17:01+00', 2.33, 841, 6.02, 1, 1, 'red', 10.1),
-  ('447e4e14-df15-4fe4-8a28-7cd4f58067f8', 'aaaaaaaa-0091-0091-0091-000000000091', '2026-01-06', '2026-01-06 05:58:00+00', '2026-01-06 06:45:33+00', 8.63, 2853, 5.51, 19, 57, 'purple', 3.5),
-  ('8fa991e0-8b1f-4f23-a186-c6edb2937cdc', 'aaaaaaaa-0016-0016-0016-000000000016', '2026-01-06', '2026-01-06 14:53:00+00', '2026-01-06 16:00:52+00', 10.16, 4072, 6.68, 9, 18, 'red', 8.8),
-  ('0b79f933-56a7-4286-ac4c-f19ce8636de4', 'aaaaaaaa-0063-0063-0063-000000000063', '2026-01-06', '2026-01-06 08:56:00+00', '2026-01-06 09:53:35+00', 10.97, 3455, 5.25, 22, 66, 'blue', 16.1),
-  ('200fa9d8-0a8c-40eb-9d0d-44eb29d3de10', 'aaaaaaaa-0008-0008-0008-000000000008', '2026-01-06', '2026-01-06 10:06:00+00', '2026-01-06 10:15:13+00', 2.0, 553, 4.61, 2, 8, 'red', 4.1),
-  ('915649f2-ac16-493c-bf59-f91f4a77ec6e', 'aaaaaaaa-0096-0096-0096-000000000096', '2026-01-06', '2026-01-06 06:57:00+00', '2026-01-06 07:11:10+00', 2.7, 850, 5.25, 5, 10, 'purple', 7.2),
-  ('7c687e54-8fb7-41a1-8813-8bc2baf50f8b', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-01-06', '2026-01-06 19:55:00+00', '2026-01-06 20:12:48+00', 3.56, 1068, 5.0, 4, 8, 'red', 13.1),
-  ('4c2752c2-3137-41c0-8243-88d9f0281586', 'aaaaaaaa-0019-0019-0019-000000000019', '2026-01-06', '2026-01-06 20:50:00+00', '2026-01-06 22:23:41+00', 13.52, 5621, 6.93, 14, 56, 'red', 9.0),
-  ('6ca95d13-b3f9-4aa8-be77-1b9db6612af1', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-01-06', '2026-01-06 16:26:00+00', '2026-01-06 17:03:25+00', 5.01, 2245, 7.47, 4, 12, 'red', 4.0),
-  ('c108d48b-8ade-4e58-a743-4d21c0c168c3', 'aaaaaaaa-0066-0066-0066-000000000066', '2026-01-06', '2026-01-06 09:21:00+00', '2026-01-06 09:46:10+00', 4.26, 1510, 5.91, 7, 14, 'blue', 13.3),
-  ('fe099c89-6a88-41f8-83e3-94363844ac2e', 'aaaaaaaa-0020-0020-0020-000000000020', '2026-01-06', '2026-01-06 12:36:00+00', '2026-01-06 14:10:46+00', 14.02, 5686, 6.76, 15, 60, 'red', 12.9),
-  ('9b6f18f9-1e32-472e-b386-433b60d7dd3c', 'aaaaaaaa-0030-0030-0030-000000000030', '2026-01-06', '2026-01-06 11:01:00+00', '2026-01-06 11:39:54+00', 6.56, 2334, 5.93, 5, 5, 'red', 19.5),
-  ('235da5f5-334a-49df-8dd2-a267b29db31a', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-01-06', '2026-01-06 16:42:00+00', '2026-01-06 16:54:14+00', 2.21, 734, 5.54, 2, 8, 'red', 7.6),
-  ('058d1f43-aedf-4c93-8e96-85e0c36ef7a2', 'aaaaaaaa-0046-0046-0046-000000000046', '2026-01-06', '2026-01-06 08:27:00+00', '2026-01-06 09:17:14+00', 7.24, 3014, 6.94, 15, 45, 'blue', 9.6),
-  ('8c3a7894-77e7-4f58-8cad-5f9607b6215a', 'aaaaaaaa-0045-0045-0045-000000000045', '2026-01-06', '2026-01-06 05:59:00+00', '2026-01-06 07:12:02+00', 10.95, 4382, 6.67, 19, 57, 'blue', 10.7),
-  ('65dfcf8f-7df8-4b1e-a7af-453b08a4f197', 'aaaaaaaa-0043-0043-0043-000000000043', '2026-01-06', '2026-01-06 11:30:00+00', '2026-01-06 12:10:40+00', 8.58, 2440, 4.74, 11, 11, 'blue', 7.0),
-  ('df5912b5-e7af-4116-b317-61ee811538c8', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-01-06', '2026-01-06 16:50:00+00', '2026-01-06 17:27:36+00', 8.32, 2256, 4.52, 6, 24, 'red', 20.1),
-  ('cb9dfc7e-0836-47f0-a76a-fb5f7dbe138f', 'aaaaaaaa-0052-0052-0052-000000000052', '2026-01-06', '2026-01-06 16:35:00+00', '2026-01-06 17:25:40+00', 11.09, 3040, 4.57, 16, 48, 'blue', 14.6),
-  ('8f5904d7-30c6-49c6-9f5e-eabfa719b897', 'aaaaaaaa-0085-0085-0085-000000000085', '2026-01-06', '2026-01-06 06:32:00+00', '2026-01-06 06:57:38+00', 5.42, 1538, 4.73, 13, 26, 'purple', 20.4),
-  ('c7bba66d-172c-4889-ad74-7d34126cfd63', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-01-06', '2026-01-06 16:14:00+00', '2026-01-06 17:13:54+00', 12.25, 3594, 4.89, 24, 72, 'purple', 17.7),
-  ('80ef376b-3c76-434e-8cca-46404413e497', 'aaaaaaaa-0097-0097-0097-000000000097', '2026-01-06', '2026-01-06 15:19:00+00', '2026-01-06 16:34:32+00', 12.76, 4532, 5.92, 20, 60, 'purple', 19.6),
-  ('d305d13e-6600-41d0-b8da-6b1295fb42bc', 'aaaaaaaa-0051-0051-0051-000000000051', '2026-01-06', '2026-01-06 18:17:00+00', '2026-01-06 19:42:11+00', 12.87, 5111, 6.62, 22, 66, 'blue', 23.2),
-  ('85b16d66-fc40-4836-b0bb-c04e3ca82c73', 'aaaaaaaa-0069-0069-0069-000000000069', '2026-01-06', '2026-01-06 14:40:00+00', '2026-01-06 15:12:28+00', 5.43, 1948, 5.98, 6, 18, 'blue', 17.5),
-  ('ea4e71f1-da3c-490b-b925-c6562d3bf1f9', 'aaaaaaaa-0007-0007-0007-000000000007', '2026-01-06', '2026-01-06 07:16:00+00', '2026-01-06 07:50:20+00', 5.21, 2060, 6.59, 12, 36, 'red', 16.9),
-  ('2cc12776-5f2b-4733-a07a-17f03f918f6c', 'aaaaaaaa-0067-0067-0067-000000000067', '2026-01-06', '2026-01-06 21:36:00+00', '2026-01-06 21:57:04+00', 3.62, 1264, 5.82, 6, 12, 'blue', 15.1),
-  ('88b48ca4-3c28-4754-9c52-a2b6ce8a1257', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-01-06', '2026-01-06 09:50:00+00', '2026-01-06 10:30:33+00', 7.47, 2433, 5.43, 8, 16, 'blue', 24.6),
-  ('3c204ce8-42b6-4c03-92ff-182a234b11bf', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-01-06', '2026-01-06 12:14:00+00', '2026-01-06 12:37:04+00', 3.25, 1384, 7.1, 5, 10, 'blue', 12.3),
-  ('2630d071-35be-42c8-81db-657095584e91', 'aaaaaaaa-0093-0093-0093-000000000093', '2026-01-06', '2026-01-06 05:10:00+00', '2026-01-06 05:42:11+00', 4.87, 1931, 6.61, 9, 27, 'purple', 19.5),
-  ('785cb67b-b032-4e56-adb9-0dddc47c434a', 'aaaaaaaa-0070-0070-0070-000000000070', '2026-01-06', '2026-01-06 19:39:00+00', '2026-01-06 20:01:37+00', 3.19, 1357, 7.09, 4, 4, 'blue', 24.5),
-  ('bbec5f0c-f892-46b3-8d02-3b9169be1245', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-01-06', '2026-01-06 08:54:00+00', '2026-01-06 09:15:12+00', 4.15, 1272, 5.11, 8, 8, 'purple', 7.8),
-  ('41f48081-164f-4b81-bd09-1727d8f3450e', 'aaaaaaaa-0026-0026-0026-000000000026', '2026-01-06', '2026-01-06 21:21:00+00', '2026-01-06 21:42:27+00', 3.07, 1287, 6.99, 7, 28, 'red', 12.7),
-  ('4ddfe9a2-e0e2-41e5-828a-7e95e28e71a6', 'aaaaaaaa-0057-0057-0057-000000000057', '2026-01-06', '2026-01-06 14:57:00+00', '2026-01-06 15:35:41+00', 6.19, 2321, 6.25, 10, 10, 'blue', 16.5),
-  ('9f4849d7-d64f-4c25-bf7f-b3a59a6d9f0f', 'aaaaaaaa-0090-0090-0090-000000000090', '2026-01-06', '2026-01-06 19:58:00+00', '2026-01-06 20:31:00+00', 5.0, 1980, 6.6, 10, 20, 'purple', 13.3),
-  ('428f7f89-34bb-4a72-956a-3800ede55253', 'aaaaaaaa-0014-0014-0014-000000000014', '2026-01-06', '2026-01-06 13:05:00+00', '2026-01-06 13:50:17+00', 7.51, 2717, 6.03, 17, 17, 'red', 10.7),
-  ('79e2c057-f734-49f3-b89a-33a1e2931257', 'aaaaaaaa-0033-0033-0033-000000000033', '2026-01-06', '2026-01-06 07:49:00+00', '2026-01-06 08:36:35+00', 8.83, 2855, 5.39, 17, 17, 'red', 6.3),
-  ('409421d7-a96c-4483-9124-77d8dc3cf5a6', 'aaaaaaaa-0029-0029-0029-000000000029', '2026-01-06', '2026-01-06 05:20:00+00', '2026-01-06 05:44:26+00', 3.32, 1466, 7.36, 5, 10, 'red', 6.9),
-  ('8541c2fd-b29f-4128-b82b-916204cc7cf8', 'aaaaaaaa-0089-0089-0089-000000000089', '2026-01-06', '2026-01-06 17:56:00+00', '2026-01-06 19:30:12+00', 13.12, 5652, 7.18, 26, 78, 'purple', 14.3),
-  ('882b0b39-8e75-418f-a1d4-c1b8f9e2b4f5', 'aaaaaaaa-0077-0077-0077-000000000077', '2026-01-06', '2026-01-06 20:12:00+00', '2026-01-06 21:21:29+00', 8.83, 4169, 7.87, 16, 32, 'blue', 23.8),
-  ('6cdb24e6-4761-43de-be06-0b2b686a443d', 'aaaaaaaa-0041-0041-0041-000000000041', '2026-01-06', '2026-01-06 17:56:00+00', '2026-01-06 18:57:41+00', 11.75, 3701, 5.25, 16, 32, 'blue', 20.1),
-  ('8386cf12-a69c-4f9c-b412-ac796ab2f5e7', 'aaaaaaaa-0082-0082-0082-000000000082', '2026-01-06', '2026-01-06 19:22:00+00', '2026-01-06 20:25:08+00', 10.49, 3788, 6.02, 22, 44, 'purple', 16.2),
-  ('da3c2b45-c2f7-4a6f-b8f7-5331b486d3cb', 'aaaaaaaa-0035-0035-0035-000000000035', '2026-01-06', '2026-01-06 06:19:00+00', '2026-01-06 07:14:26+00', 10.08, 3326, 5.5, 18, 18, 'red', 4.1),
-  ('13351ee9-7785-4664-b62b-1c9ef2d3a2a8', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-01-06', '2026-01-06 11:00:00+00', '2026-01-06 11:10:44+00', 2.16, 644, 4.97, 4, 12, 'red', 12.2),
-  ('b728908e-cadd-4498-801c-5124c6e240e8', 'aaaaaaaa-0003-0003-0003-000000000003', '2026-01-06', '2026-01-06 08:52:00+00', '2026-01-06 10:07:26+00', 14.88, 4526, 5.07, 25, 75, 'red', 3.8),
-  ('6710a1a4-be15-4654-a32d-aa94d1fa97ab', 'aaaaaaaa-0062-0062-0062-000000000062', '2026-01-06', '2026-01-06 15:19:00+00', '2026-01-06 15:39:41+00', 3.92, 1241, 5.28, 6, 12, 'blue', 20.2),
-  ('cc6099ae-8d98-4f3e-a64a-4e45c0742973', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-01-06', '2026-01-06 20:01:00+00', '2026-01-06 20:16:27+00', 3.05, 927, 5.07, 5, 10, 'blue', 13.6),
-  ('5af22610-4485-4d3a-96e7-2698d9722564', 'aaaaaaaa-0044-0044-0044-000000000044', '2026-01-06', '2026-01-06 17:54:00+00', '2026-01-06 18:30:46+00', 6.34, 2206, 5.8, 12, 36, 'blue', 9.8),
-  ('e53816e0-bcea-44b6-991e-f7f1e19ee5c5', 'aaaaaaaa-0076-0076-0076-000000000076', '2026-01-06', '2026-01-06 20:11:00+00', '2026-01-06 20:25:45+00', 3.08, 885, 4.79, 5, 5, 'blue', 20.5),
-  ('bde90d7e-5e99-461b-97cd-4853338553b1', 'aaaaaaaa-0064-0064-0064-000000000064', '2026-01-06', '2026-01-06 08:02:00+00', '2026-01-06 08:15:21+00', 2.42, 801, 5.52, 3, 6, 'blue', 21.6),
-  ('4422d843-21e0-4d4d-9c50-0ef3af733bc0', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-01-06', '2026-01-06 14:42:00+00', '2026-01-06 15:53:36+00', 14.95, 4296, 4.79, 25, 50, 'red', 3.9),
-  ('03914d0b-51f4-4e0e-9d12-4bda2bd3e5b8', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-01-06', '2026-01-06 12:45:00+00', '2026-01-06 13:18:22+00', 6.25, 2002, 5.34, 12, 36, 'purple', 6.3),
-  ('f00ec77c-ee8d-4246-9d17-f71a5b782b25', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-01-06', '2026-01-06 09:52:00+00', '2026-01-06 10:40:58+00', 8.26, 2938, 5.93, 16, 32, 'blue', 23.5),
-  ('5660479f-ae3b-490f-a8ae-6b52b2213a1d', 'aaaaaaaa-0048-0048-0048-000000000048', '2026-01-06', '2026-01-06 20:17:00+00', '2026-01-06 21:06:15+00', 6.25, 2955, 7.88, 8, 24, 'blue', 12.3),
-  ('0abb31d8-0303-4c70-86c8-c0d433bda724', 'aaaaaaaa-0074-0074-0074-000000000074', '2026-01-06', '2026-01-06 18:59:00+00', '2026-01-06 20:35:48+00', 13.79, 5808, 7.02, 19, 38, 'blue', 12.2),
-  ('178b6dda-76d6-4867-ad5a-064cb87c0a9f', 'aaaaaaaa-0009-0009-0009-000000000009', '2026-01-06', '2026-01-06 18:01:00+00', '2026-01-06 19:02:01+00', 8.03, 3661, 7.6, 16, 48, 'red', 15.6),
-  ('1600933a-01e7-4ed3-9c39-68e3646eac41', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-01-06', '2026-01-06 05:06:00+00', '2026-01-06 06:12:42+00', 8.52, 4002, 7.83, 20, 40, 'purple', 20.5),
-  ('181b0fbd-58c6-4385-b5d3-4e73a2e42300', 'aaaaaaaa-0032-0032-0032-000000000032', '2026-01-06', '2026-01-06 07:04:00+00', '2026-01-06 07:30:16+00', 3.69, 1576, 7.12, 6, 18, 'red', 8.7),
-  ('9d4c6ced-ac5d-4db2-a33e-99a7fe03e4a0', 'aaaaaaaa-0068-0068-0068-000000000068', '2026-01-06', '2026-01-06 16:01:00+00', '2026-01-06 17:52:44+00', 14.78, 6704, 7.56, 23, 46, 'blue', 21.8),
-  ('a18883bd-2a8a-48cb-9ae6-21c73a4d53d5', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-01-06', '2026-01-06 06:02:00+00', '2026-01-06 06:39:37+00', 6.42, 2257, 5.86, 6, 6, 'blue', 19.6),
-  ('c806993b-d6d7-464b-b824-1009a6b7cbc9', 'aaaaaaaa-0024-0024-0024-000000000024', '2026-01-06', '2026-01-06 15:15:00+00', '2026-01-06 15:50:35+00', 7.89, 2135, 4.51, 14, 14, 'red', 10.8),
-  ('95127455-ef83-4222-a3dd-d7e472924749', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-01-06', '2026-01-06 14:26:00+00', '2026-01-06 15:10:43+00', 6.06, 2683, 7.38, 8, 24, 'blue', 9.5),
-  ('f7caedbc-a8a9-4cd5-a64a-1bedbc5bbef4', 'aaaaaaaa-0025-0025-0025-000000000025', '2026-01-06', '2026-01-06 16:07:00+00', '2026-01-06 16:25:14+00', 2.3, 1094, 7.93, 4, 4, 'red', 10.2),
-  ('500708d6-e3a5-4d40-ba53-d4c74693f9dc', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-01-06', '2026-01-06 14:53:00+00', '2026-01-06 15:10:33+00', 3.24, 1053, 5.42, 3, 6, 'blue', 10.3),
-  ('23e682dd-8e95-4dae-abd8-cf4053f2e866', 'aaaaaaaa-0096-0096-0096-000000000096', '2026-01-07', '2026-01-07 11:47:00+00', '2026-01-07 12:53:58+00', 9.5, 4018, 7.05, 20, 40, 'purple', 21.5),
-  ('aca1cb17-7a8a-42a0-b08e-d416925e815c', 'aaaaaaaa-0069-0069-0069-000000000069', '2026-01-07', '2026-01-07 05:41:00+00', '2026-01-07 06:07:11+00', 5.29, 1571, 4.95, 9, 27, 'blue', 7.1),
-  ('0a93aaa0-eeb6-4d2b-893a-3289336a146f', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-01-07', '2026-01-07 19:42:00+00', '2026-01-07 20:05:07+00', 4.73, 1387, 4.89, 7, 21, 'red', 18.3),
-  ('1fca9948-155e-4089-a18c-d19f34c65b6c', 'aaaaaaaa-0091-0091-0091-000000000091', '2026-01-07', '2026-01-07 06:50:00+00', '2026-01-07 07:21:02+00', 4.62, 1862, 6.72, 8, 8, 'purple', 7.5),
-  ('35aee547-d9b5-4d80-b39a-3d167c112262', 'aaaaaaaa-0070-0070-0070-000000000070', '2026-01-07', '2026-01-07 17:14:00+00', '2026-01-07 18:17:52+00', 13.56, 3832, 4.71, 18, 36, 'blue', 13.1),
-  ('c5a77813-1555-4772-87aa-cf3da06f3573', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-01-07', '2026-01-07 13:37:00+00', '2026-01-07 15:12:17+00', 14.82, 5717, 6.43, 22, 44, 'blue', 17.1),
-  ('e9c0ca42-f52d-4520-b8cc-5147c59947b2', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-01-07', '2026-01-07 20:48:00+00', '2026-01-07 21:15:07+00', 4.59, 1627, 5.91, 11, 22, 'purple', 21.5),
-  ('7e4131d1-c5c3-4e51-809a-bddb02ca0273', 'aaaaaaaa-0098-0098-0098-000000000098', '2026-01-07', '2026-01-07 07:06:00+00', '2026-01-07 07:35:08+00', 5.14, 1748, 5.67, 10, 30, 'purple', 8.0),
-  ('dc9789e9-d192-48fd-baed-35b597d70829', 'aaaaaaaa-0038-0038-0038-000000000038', '2026-01-07', '2026-01-07 18:56:00+00', '2026-01-07 20:21:55+00', 10.85, 5155, 7.92, 24, 48, 'red', 12.7),
-  ('6b98a341-55d4-4cf3-a8ec-54757031940c', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-01-07', '2026-01-07 10:14:00+00', '2026-01-07 10:44:18+00', 6.3, 1818, 4.81, 13, 13, 'purple', 15.8),
-  ('6952de73-0d17-410f-878b-f065bff98f9d', 'aaaaaaaa-0084-0084-0084-000000000084', '2026-01-07', '2026-01-07 11:04:00+00', '2026-01-07 12:25:49+00', 11.59, 4909, 7.06, 21, 21, 'purple', 7.3),
-  ('ba193de3-7172-408d-bd7e-cbfec41a5e68', 'aaaaaaaa-0099-0099-0099-000000000099', '2026-01-07', '2026-01-07 11:28:00+00', '2026-01-07 11:47:31+00', 4.0, 1171, 4.88, 5, 15, 'purple', 8.0),
-  ('fec9e98d-4e89-492a-acf3-3bb972ff8a0a', 'aaaaaaaa-0012-0012-0012-000000000012', '2026-01-07', '2026-01-07 20:25:00+00', '2026-01-07 21:14:55+00', 7.52, 2995, 6.64, 14, 14, 'red', 20.5),
-  ('f443e069-8610-49cc-b0ad-63743439c9bb', 'aaaaaaaa-0051-0051-0051-000000000051', '2026-01-07', '2026-01-07 07:33:00+00', '2026-01-07 09:03:14+00', 13.82, 5414, 6.53, 23, 69, 'blue', 19.2),
-  ('36e9ea2a-d3a7-4ee1-8ea4-05acdab6d8a3', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-01-07', '2026-01-07 05:49:00+00', '2026-01-07 06:12:42+00', 3.92, 1422, 6.05, 9, 9, 'red', 12.3),
-  ('c7648542-c989-4a18-94df-d28628c3668c', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-01-07', '2026-01-07 20:18:00+00', '2026-01-07 21:06:43+00', 10.64, 2923, 4.58, 20, 40, 'red', 20.8),
-  ('71837d17-bad1-4387-b1ed-f31a1fd1599a', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-01-07', '2026-01-07 16:46:00+00', '2026-01-07 17:50:26+00', 8.38, 3866, 7.69, 15, 15, 'blue', 4.7),
-  ('f16c43f6-5d41-410c-946c-4a4d71c1179d', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-01-07', '2026-01-07 12:26:00+00', '2026-01-07 13:21:23+00', 8.71, 3323, 6.36, 14, 28, 'red', 11.9),
-  ('2eecc6ef-c8db-4a0a-b934-e71e35f178fb', 'aaaaaaaa-0042-0042-0042-000000000042', '2026-01-07', '2026-01-07 11:33:00+00', '2026-01-07 12:38:22+00', 9.83, 3922, 6.65, 15, 30, 'blue', 13.1),
-  ('b51ce1bd-ac90-4de8-80f1-57db70a7cd5f', 'aaaaaaaa-0034-0034-0034-000000000034', '2026-01-07', '2026-01-07 17:10:00+00', '2026-01-07 18:11:28+00', 10.42, 3688, 5.9, 16, 48, 'red', 8.3),
-  ('8193f0ee-23e0-47ca-8ac4-aac20f06c661', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-01-07', '2026-01-07 21:36:00+00', '2026-01-07 22:23:07+00', 6.61, 2827, 7.13, 4, 12, 'red', 19.7),
-  ('cbc63b54-0f8f-40e1-8604-71b8a440e355', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-01-07', '2026-01-07 19:33:00+00', '2026-01-07 21:05:05+00', 14.48, 5525, 6.36, 21, 21, 'red', 23.2),
-  ('19b49036-cd8d-4486-9986-f6734b99ee60', 'aaaaaaaa-0008-0008-0008-000000000008', '2026-01-07', '2026-01-07 08:29:00+00', '2026-01-07 09:30:05+00', 8.06, 3665, 7.58, 8, 32, 'red', 5.7),
-  ('a454dfb6-c320-4088-8c59-cc94493400a6', 'aaaaaaaa-0087-0087-0087-000000000087', '2026-01-07', '2026-01-07 21:40:00+00', '2026-01-07 23:28:40+00', 14.49, 6520, 7.5, 33, 33, 'purple', 20.1),
-  ('c0bebbd1-6cc5-4a40-b011-c06b8e62a736', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-01-07', '2026-01-07 06:53:00+00', '2026-01-07 07:59:09+00', 12.03, 3969, 5.5, 27, 81, 'blue', 14.9),
-  ('e6dcff69-a684-4156-ae07-9a6921f06ce9', 'aaaaaaaa-0000-0000-0000-000000000000', '2026-01-07', '2026-01-07 17:25:00+00', '2026-01-07 17:55:56+00', 6.77, 1856, 4.57, 7, 21, 'red', 20.4),
-  ('060582f5-df68-4266-a340-8153c5b06253', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-01-07', '2026-01-07 11:21:00+00', '2026-01-07 12:25:56+00', 13.5, 3896, 4.81, 18, 72, 'red', 22.2),
-  ('11fc4379-d289-4378-a469-aa25ee73d819', 'aaaaaaaa-0061-0061-0061-000000000061', '2026-01-07', '2026-01-07 06:32:00+00', '2026-01-07 07:08:16+00', 5.88, 2176, 6.17, 10, 30, 'blue', 17.7),
-  ('61a35de8-0cd3-4682-ae78-1e2011751437', 'aaaaaaaa-0085-0085-0085-000000000085', '2026-01-07', '2026-01-07 19:05:00+00', '2026-01-07 19:48:59+00', 6.79, 2639, 6.48, 12, 36, 'purple', 18.6),
-  ('a9e431a0-7f17-4469-9fd8-109757529e9a', 'aaaaaaaa-0060-0060-0060-000000000060', '2026-01-07', '2026-01-07 05:41:00+00', '2026-01-07 06:55:59+00', 13.56, 4499, 5.53, 25, 50, 'blue', 14.8),
-  ('1730013d-56a5-43ba-9506-badb0ae0fe42', 'aaaaaaaa-0046-0046-0046-000000000046', '2026-01-07', '2026-01-07 05:35:00+00', '2026-01-07 06:30:10+00', 7.75, 3310, 7.12, 12, 24, 'blue', 9.8),
-  ('8edecc9e-b88b-420b-84ce-cddab37867bd', 'aaaaaaaa-0086-0086-0086-000000000086', '2026-01-07', '2026-01-07 21:17:00+00', '2026-01-07 22:47:12+00', 12.46, 5412, 7.24, 27, 54, 'purple', 11.9),
-  ('bb8d139f-4845-4fbb-9ebe-a1e991dd1d6e', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-01-07', '2026-01-07 14:40:00+00', '2026-01-07 15:27:02+00', 10.14, 2822, 4.64, 19, 19, 'purple', 3.6),
-  ('a71b00b6-dd1d-4d1b-a578-f499dcb92875', 'aaaaaaaa-0033-0033-0033-000000000033', '2026-01-07', '2026-01-07 18:42:00+00', '2026-01-07 19:56:06+00', 9.88, 4446, 7.5, 17, 68, 'red', 10.1),
-  ('469bab3d-ad32-4414-841d-bcdd4bf61dcc', 'aaaaaaaa-0020-0020-0020-000000000020', '2026-01-07', '2026-01-07 05:25:00+00', '2026-01-07 05:43:22+00', 3.69, 1102, 4.98, 7, 21, 'red', 3.4),
-  ('4bd658d3-13c3-44ab-8030-8afcb2944ed1', 'aaaaaaaa-0031-0031-0031-000000000031', '2026-01-07', '2026-01-07 20:34:00+00', '2026-01-07 22:11:16+00', 14.18, 5836, 6.86, 26, 104, 'red', 8.8),
-  ('46165261-8dc0-4738-8612-205d2952d63a', 'aaaaaaaa-0097-0097-0097-000000000097', '2026-01-07', '2026-01-07 13:53:00+00', '2026-01-07 14:46:57+00', 9.45, 3237, 5.71, 18, 18, 'purple', 5.7),
-  ('049d6940-d7ea-4304-bbf5-86081596271b', 'aaaaaaaa-0021-0021-0021-000000000021', '2026-01-07', '2026-01-07 07:56:00+00', '2026-01-07 08:16:25+00', 3.32, 1225, 6.15, 7, 14, 'red', 5.4),
-  ('730b3ecc-25f0-4b84-b4fb-ec38f028cdb1', 'aaaaaaaa-0063-0063-0063-000000000063', '2026-01-07', '2026-01-07 15:26:00+00', '2026-01-07 16:27:50+00', 8.39, 3710, 7.37, 16, 48, 'blue', 14.8),
-  ('21654d42-1747-4004-9c4d-2f4f95c79488', 'aaaaaaaa-0082-0082-0082-000000000082', '2026-01-07', '2026-01-07 08:29:00+00', '2026-01-07 08:41:36+00', 2.38, 756, 5.3, 5, 10, 'purple', 19.5),
-  ('63731d38-c50d-47d8-9a10-05a74c9d8a20', 'aaaaaaaa-0041-0041-0041-000000000041', '2026-01-07', '2026-01-07 16:00:00+00', '2026-01-07 16:38:42+00', 8.22, 2322, 4.71, 12, 36, 'blue', 21.9),
-  ('3b164420-5845-4aef-aa7f-3dbda4a938af', 'aaaaaaaa-0058-0058-0058-000000000058', '2026-01-07', '2026-01-07 09:19:00+00', '2026-01-07 10:36:19+00', 12.1, 4639, 6.39, 19, 38, 'blue', 12.8),
-  ('772d6b65-39c4-4482-af0d-363a1d1d75e7', 'aaaaaaaa-0036-0036-0036-000000000036', '2026-01-07', '2026-01-07 20:24:00+00', '2026-01-07 21:40:30+00', 13.47, 4590, 5.68, 20, 80, 'red', 19.2),
-  ('e3f9c3ce-6b4c-4076-9518-96151c44547f', 'aaaaaaaa-0044-0044-0044-000000000044', '2026-01-07', '2026-01-07 16:48:00+00', '2026-01-07 17:55:52+00', 9.05, 4072, 7.5, 14, 42, 'blue', 15.6),
-  ('4e2aa0f2-0f25-4c1c-a5fd-c2376d8ef9cd', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-01-07', '2026-01-07 10:16:00+00', '2026-01-07 11:43:02+00', 14.93, 5222, 5.83, 15, 30, 'blue', 16.6),
-  ('e0d3aff7-8dbc-4cb5-8564-0c2d11b8c2a1', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-01-07', '2026-01-07 10:25:00+00', '2026-01-07 10:45:50+00', 3.03, 1250, 6.88, 3, 9, 'blue', 10.2),
-  ('07d3f631-b63d-459e-9760-9504a0df243b', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-01-07', '2026-01-07 21:53:00+00', '2026-01-07 23:08:30+00', 14.3, 4530, 5.28, 16, 16, 'blue', 18.3),
-  ('076350ab-ae12-4845-b128-9b5f1b764503', 'aaaaaaaa-0068-0068-0068-000000000068', '2026-01-07', '2026-01-07 05:39:00+00', '2026-01-07 06:51:59+00', 11.16, 4379, 6.54, 8, 8, 'blue', 8.9),
-  ('5ecfa4f4-715b-471e-b4f4-51202588e9be', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-01-07', '2026-01-07 09:48:00+00', '2026-01-07 10:28:39+00', 5.45, 2439, 7.46, 12, 12, 'red', 18.3),
-  ('78f08aaf-e976-4fde-b7bf-c2441faf91b5', 'aaaaaaaa-0030-0030-0030-000000000030', '2026-01-07', '2026-01-07 20:45:00+00', '2026-01-07 21:29:44+00', 8.21, 2684, 5.45, 12, 24, 'red', 5.9),
-  ('2e9ede73-2653-49c9-a8ce-455db2c1cf9f', 'aaaaaaaa-0067-0067-0067-000000000067', '2026-01-07', '2026-01-07 05:08:00+00', '2026-01-07 05:44:17+00', 6.39, 2177, 5.68, 6, 12, 'blue', 19.3),
-  ('096a5ffd-06ca-4e4b-94d3-1bd3ef3c4212', 'aaaaaaaa-0092-0092-0092-000000000092', '2026-01-07', '2026-01-07 12:27:00+00', '2026-01-07 13:30:49+00', 14.12, 3829, 4.52, 34, 102, 'purple', 3.9),
-  ('584168a3-b1ba-4ff7-a977-f287a96afe7c', 'aaaaaaaa-0045-0045-0045-000000000045', '2026-01-07', '2026-01-07 09:12:00+00', '2026-01-07 10:04:45+00', 7.84, 3165, 6.73, 12, 12, 'blue', 12.7),
-  ('d99b94e1-f2e5-4909-b1d4-d8bd92de4419', 'aaaaaaaa-0077-0077-0077-000000000077', '2026-01-07', '2026-01-07 10:57:00+00', '2026-01-07 12:11:57+00', 9.89, 4497, 7.58, 11, 11, 'blue', 17.2),
-  ('5e53a812-0e62-444f-b705-10da690274a0', 'aaaaaaaa-0072-0072-0072-000000000072', '2026-01-07', '2026-01-07 08:25:00+00', '2026-01-07 09:05:05+00', 6.55, 2405, 6.12, 7, 21, 'blue', 8.7),
-  ('dafe8911-c2b8-41da-ba11-415953e66868', 'aaaaaaaa-0043-0043-0043-000000000043', '2026-01-07', '2026-01-07 19:50:00+00', '2026-01-07 20:10:16+00', 2.69, 1216, 7.54, 1, 1, 'blue', 18.8),
-  ('c1680a1e-a92d-451a-87c6-620b2c3f033a', 'aaaaaaaa-0032-0032-0032-000000000032', '2026-01-07', '2026-01-07 08:31:00+00', '2026-01-07 09:30:32+00', 11.32, 3572, 5.26, 28, 112, 'red', 15.4),
-  ('dfdd547e-0bbc-4975-ad7d-253f7229ded0', 'aaaaaaaa-0015-0015-0015-000000000015', '2026-01-07', '2026-01-07 20:45:00+00', '2026-01-07 21:54:53+00', 11.42, 4193, 6.12, 20, 40, 'red', 19.4),
-  ('5d78a0b3-07b6-4e41-b9dd-ff77b7762202', 'aaaaaaaa-0026-0026-0026-000000000026', '2026-01-07', '2026-01-07 11:01:00+00', '2026-01-07 12:17:55+00', 13.64, 4615, 5.64, 17, 17, 'red', 15.8),
-  ('3a3ec26e-6205-4ace-bd96-6f978f6fd34b', 'aaaaaaaa-0074-0074-0074-000000000074', '2026-01-07', '2026-01-07 16:42:00+00', '2026-01-07 17:13:14+00', 5.62, 1874, 5.56, 11, 33, 'blue', 23.3),
-  ('217deb5d-49b6-424f-b8e8-42f3148a186b', 'aaaaaaaa-0066-0066-0066-000000000066', '2026-01-07', '2026-01-07 18:30:00+00', '2026-01-07 18:42:50+00', 2.31, 770, 5.56, 2, 6, 'blue', 13.5),
-  ('69cf16ee-c152-4177-a75d-e0414aec637c', 'aaaaaaaa-0078-0078-0078-000000000078', '2026-01-07', '2026-01-07 08:55:00+00', '2026-01-07 09:16:10+00', 3.07, 1270, 6.9, 3, 3, 'blue', 14.0),
-  ('0b6ccde5-b8da-47b3-bc71-843eb6ddb363', 'aaaaaaaa-0089-0089-0089-000000000089', '2026-01-08', '2026-01-08 11:27:00+00', '2026-01-08 12:17:32+00', 10.13, 3032, 4.99, 24, 48, 'purple', 10.4),
-  ('3aa39193-4fc6-4f10-9b64-0dbd630c0047', 'aaaaaaaa-0058-0058-0058-000000000058', '2026-01-08', '2026-01-08 08:21:00+00', '2026-01-08 09:51:54+00', 14.16, 5454, 6.42, 20, 60, 'blue', 14.9),
-  ('c4cf8fef-f8d0-4d82-8ac4-cf98b7db4175', 'aaaaaaaa-0052-0052-0052-000000000052', '2026-01-08', '2026-01-08 07:23:00+00', '2026-01-08 08:11:12+00', 6.15, 2892, 7.84, 7, 14, 'blue', 6.5),
-  ('0c16aead-b46e-4b85-9e9a-f76a76edc0fa', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-01-08', '2026-01-08 11:01:00+00', '2026-01-08 11:54:18+00', 7.76, 3198, 6.87, 10, 10, 'blue', 25.0),
-  ('e4b05cf5-79f6-4a9e-bbd9-24d6e883262d', 'aaaaaaaa-0084-0084-0084-000000000084', '2026-01-08', '2026-01-08 19:45:00+00', '2026-01-08 21:13:21+00', 12.48, 5301, 7.08, 27, 27, 'purple', 12.1),
-  ('b90c6aab-0f34-45b7-9264-a647dc981dcd', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-01-08', '2026-01-08 18:11:00+00', '2026-01-08 18:34:48+00', 4.98, 1428, 4.78, 11, 11, 'red', 4.1),
-  ('eecb14a4-3d32-402b-beef-15e9755f26ee', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-01-08', '2026-01-08 13:53:00+00', '2026-01-08 14:42:06+00', 6.54, 2946, 7.51, 11, 44, 'red', 17.9),
-  ('6a28e034-57e0-42bf-a5f3-94c59eaa3009', 'aaaaaaaa-0014-0014-0014-000000000014', '2026-01-08', '2026-01-08 07:50:00+00', '2026-01-08 08:35:13+00', 7.69, 2713, 5.88, 12, 12, 'red', 21.1),
-  ('bd8e67a6-d16a-405c-8f56-ff0016d71c15', 'aaaaaaaa-0077-0077-0077-000000000077', '2026-01-08', '2026-01-08 07:52:00+00', '2026-01-08 08:13:16+00', 3.51, 1276, 6.06, 6, 18, 'blue', 13.7),
-  ('09420931-a502-41d5-a740-521467136554', 'aaaaaaaa-0086-0086-0086-000000000086', '2026-01-08', '2026-01-08 08:09:00+00', '2026-01-08 09:29:43+00', 11.29, 4843, 7.15, 24, 48, 'purple', 21.9),
-  ('60e0a4ac-10eb-46b9-ab97-6dc7233a2ee5', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-01-08', '2026-01-08 08:39:00+00', '2026-01-08 09:05:27+00', 4.81, 1587, 5.5, 10, 30, 'red', 4.1),
-  ('53631932-f619-4724-94fd-75e3a71d5826', 'aaaaaaaa-0092-0092-0092-000000000092', '2026-01-08', '2026-01-08 07:15:00+00', '2026-01-08 07:50:29+00', 7.8, 2129, 4.55, 15, 15, 'purple', 18.7),
-  ('333f51f2-0f30-4309-8864-dec42ee532ed', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-01-08', '2026-01-08 17:57:00+00', '2026-01-08 18:44:19+00', 6.8, 2839, 6.96, 9, 27, 'purple', 16.5),
-  ('bc6fc30c-ea26-4734-a3cd-a06da5be0ce9', 'aaaaaaaa-0048-0048-0048-000000000048', '2026-01-08', '2026-01-08 05:16:00+00', '2026-01-08 05:50:16+00', 5.38, 2056, 6.37, 11, 11, 'blue', 6.5),
-  ('59a3aa38-4f76-447d-a4dc-8355d571ce88', 'aaaaaaaa-0051-0051-0051-000000000051', '2026-01-08', '2026-01-08 06:37:00+00', '2026-01-08 07:30:50+00', 9.02, 3230, 5.97, 19, 38, 'blue', 10.0),
-  ('c05a4b7e-2796-44d5-9342-76ffe28e687e', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-01-08', '2026-01-08 16:06:00+00', '2026-01-08 16:52:16+00', 6.61, 2776, 7.0, 11, 44, 'red', 8.7),
-  ('b9a063b7-741e-4a22-acd8-13af66cb05b1', 'aaaaaaaa-0016-0016-0016-000000000016', '2026-01-08', '2026-01-08 13:34:00+00', '2026-01-08 14:48:06+00', 12.13, 4446, 6.11, 22, 88, 'red', 20.6),
-  ('3054d117-f44a-4a34-a3fd-a26c4eb94a96', 'aaaaaaaa-0023-0023-0023-000000000023', '2026-01-08', '2026-01-08 11:53:00+00', '2026-01-08 12:33:59+00', 9.11, 2459, 4.5, 12, 12, 'red', 24.3),
-  ('b3d555cc-5d26-47ab-a761-8249f9566900', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-01-08', '2026-01-08 20:46:00+00', '2026-01-08 21:12:30+00', 3.47, 1590, 7.64, 4, 8, 'red', 24.9),
-  ('2c9d4e95-3767-438f-8d55-b348e7ef6a63', 'aaaaaaaa-0015-0015-0015-000000000015', '2026-01-08', '2026-01-08 18:20:00+00', '2026-01-08 18:52:51+00', 7.3, 1971, 4.5, 6, 6, 'red', 7.1),
-  ('dd4531a9-1d59-4e4c-8a76-f4c6dafe8cf5', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-01-08', '2026-01-08 21:54:00+00', '2026-01-08 23:13:00+00', 10.45, 4740, 7.56, 19, 38, 'blue', 18.3),
-  ('232522d0-cdb0-4e6e-a987-0eaa760108b9', 'aaaaaaaa-0004-0004-0004-000000000004', '2026-01-08', '2026-01-08 20:05:00+00', '2026-01-08 21:53:27+00', 14.94, 6507, 7.26, 21, 21, 'red', 21.5),
-  ('3514581c-f76d-4b1f-b5db-bbe22e1d0002', 'aaaaaaaa-0057-0057-0057-000000000057', '2026-01-08', '2026-01-08 20:00:00+00', '2026-01-08 20:52:48+00', 7.49, 3168, 7.05, 14, 28, 'blue', 8.0),
-  ('4f9634b1-8c3d-47ef-8e0d-2b14146fde23', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-01-08', '2026-01-08 06:18:00+00', '2026-01-08 06:35:22+00', 2.64, 1042, 6.58, 5, 5, 'purple', 17.3),
-  ('19e6ced2-030b-4f01-936e-d10eeb985f47', 'aaaaaaaa-0043-0043-0043-000000000043', '2026-01-08', '2026-01-08 17:50:00+00', '2026-01-08 19:41:45+00', 13.97, 6705, 8.0, 23, 46, 'blue', 18.0),
-  ('3cfc1b74-9fe0-420e-ab3a-93e61a37d31d', 'aaaaaaaa-0067-0067-0067-000000000067', '2026-01-08', '2026-01-08 06:00:00+00', '2026-01-08 06:24:51+00', 3.7, 1491, 6.72, 7, 7, 'blue', 19.9),
-  ('77888bef-5778-47ec-a3fe-fe1c8b5cd10b', 'aaaaaaaa-0056-0056-0056-000000000056', '2026-01-08', '2026-01-08 05:48:00+00', '2026-01-08 07:03:39+00', 11.03, 4539, 6.86, 15, 15, 'blue', 6.5),
-  ('12efae8b-6f5e-4dcb-8801-a4512f6f9bd6', 'aaaaaaaa-0031-0031-0031-000000000031', '2026-01-08', '2026-01-08 06:29:00+00', '2026-01-08 07:56:47+00', 13.76, 5267, 6.38, 24, 96, 'red', 5.4),
-  ('c99d9f81-18ff-4172-9d46-af5c61217106', 'aaaaaaaa-0025-0025-0025-000000000025', '2026-01-08', '2026-01-08 11:54:00+00', '2026-01-08 13:06:46+00', 9.2, 4366, 7.91, 13, 26, 'red', 17.0),
-  ('84130c64-3381-4e30-ac33-5f66b872c6f5', 'aaaaaaaa-0027-0027-0027-000000000027', '2026-01-08', '2026-01-08 06:24:00+00', '2026-01-08 07:29:43+00', 13.44, 3943, 4.89, 17, 34, 'red', 23.8),
-  ('bcb4326b-2647-4534-9854-7e032ab961f1', 'aaaaaaaa-0078-0078-0078-000000000078', '2026-01-08', '2026-01-08 13:58:00+00', '2026-01-08 15:10:07+00', 9.92, 4327, 7.27, 20, 40, 'blue', 8.0),
-  ('bfee5a29-5735-4448-86e0-f6f29186decd', 'aaaaaaaa-0037-0037-0037-000000000037', '2026-01-08', '2026-01-08 15:30:00+00', '2026-01-08 16:31:41+00', 10.71, 3701, 5.76, 12, 36, 'red', 8.8),
-  ('90a4fc49-1994-41ae-a489-b2cd27271e73', 'aaaaaaaa-0024-0024-0024-000000000024', '2026-01-08', '2026-01-08 20:01:00+00', '2026-01-08 20:48:13+00', 9.52, 2833, 4.96, 11, 11, 'red', 13.5),
-  ('14e04a6f-4bd6-47ef-be91-3d60dcc9983a', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-01-08', '2026-01-08 05:01:00+00', '2026-01-08 05:53:10+00', 7.09, 3130, 7.36, 14, 14, 'blue', 23.8),
-  ('0488ba1f-8a65-408d-aa28-c4520f289b7d', 'aaaaaaaa-0090-0090-0090-000000000090', '2026-01-08', '2026-01-08 20:45:00+00', '2026-01-08 21:02:51+00', 2.82, 1071, 6.33, 7, 21, 'purple', 13.1),
-  ('148166fb-8aa7-4b51-882d-babc360f24c0', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-01-08', '2026-01-08 18:50:00+00', '2026-01-08 19:21:52+00', 7.02, 1912, 4.54, 12, 24, 'blue', 4.8),
-  ('20ed64ab-8634-4025-99a4-edf5736d238e', 'aaaaaaaa-0026-0026-0026-000000000026', '2026-01-08', '2026-01-08 07:00:00+00', '2026-01-08 08:28:12+00', 11.76, 5292, 7.5, 15, 15, 'red', 17.1),
-  ('043bc62c-7932-4b64-8aff-fa330c78d7b1', 'aaaaaaaa-0034-0034-0034-000000000034', '2026-01-08', '2026-01-08 20:33:00+00', '2026-01-08 21:53:54+00', 13.76, 4854, 5.88, 8, 8, 'red', 11.2),
-  ('74ff94c9-a326-4f17-9286-27d30376cd52', 'aaaaaaaa-0000-0000-0000-000000000000', '2026-01-08', '2026-01-08 16:21:00+00', '2026-01-08 18:02:44+00', 14.94, 6104, 6.81, 13, 52, 'red', 13.7),
-  ('24ad6143-5518-4811-98b4-44ba652facbf', 'aaaaaaaa-0042-0042-0042-000000000042', '2026-01-08', '2026-01-08 09:38:00+00', '2026-01-08 10:46:15+00', 8.64, 4095, 7.9, 16, 16, 'blue', 5.6),
-  ('d51feeff-4917-4e95-9cbf-700afbfa716b', 'aaaaaaaa-0099-0099-0099-000000000099', '2026-01-08', '2026-01-08 09:17:00+00', '2026-01-08 10:37:51+00', 14.26, 4851, 5.67, 34, 34, 'purple', 15.9),
-  ('87aa5845-6b19-4db7-99b7-51e69a54c212', 'aaaaaaaa-0029-0029-0029-000000000029', '2026-01-08', '2026-01-08 10:54:00+00', '2026-01-08 12:14:04+00', 13.02, 4804, 6.15, 17, 17, 'red', 6.9),
-  ('5430c163-f551-475b-aceb-e10ad017d62b', 'aaaaaaaa-0041-0041-0041-000000000041', '2026-01-08', '2026-01-08 13:57:00+00', '2026-01-08 14:55:51+00', 8.03, 3531, 7.33, 20, 40, 'blue', 24.6),
-  ('867199d3-ac76-4557-8f57-d3ec8e1085ed', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-01-08', '2026-01-08 07:13:00+00', '2026-01-08 08:41:26+00', 11.11, 5306, 7.96, 21, 42, 'blue', 4.9),
-  ('013852fc-6082-429e-8531-f88a44037e35', 'aaaaaaaa-0060-0060-0060-000000000060', '2026-01-08', '2026-01-08 21:12:00+00', '2026-01-08 22:48:35+00', 13.72, 5795, 7.04, 22, 44, 'blue', 4.6),
-  ('4ba46db5-50a4-44be-8f90-bc785518446e', 'aaaaaaaa-0085-0085-0085-000000000085', '2026-01-08', '2026-01-08 11:36:00+00', '2026-01-08 12:47:52+00', 9.11, 4312, 7.89, 17, 17, 'purple', 10.0),
-  ('bae8f494-7216-493a-84c2-5effa62fb805', 'aaaaaaaa-0019-0019-0019-000000000019', '2026-01-08', '2026-01-08 08:05:00+00', '2026-01-08 08:37:22+00', 4.38, 1942, 7.39, 6, 12, 'red', 16.1),
-  ('a34ec848-7f91-4b4d-b21b-fcf7c09ccf14', 'aaaaaaaa-0049-0049-0049-000000000049', '2026-01-08', '2026-01-08 15:07:00+00', '2026-01-08 16:38:33+00', 14.96, 5493, 6.12, 23, 23, 'blue', 14.2),
-  ('df1622a6-864a-48a1-b23f-7f37f53ba01e', 'aaaaaaaa-0033-0033-0033-000000000033', '2026-01-08', '2026-01-08 16:45:00+00', '2026-01-08 17:32:58+00', 6.38, 2878, 7.52, 11, 11, 'red', 23.5),
-  ('149152d0-3331-4cbb-bf95-b4439082df20', 'aaaaaaaa-0093-0093-0093-000000000093', '2026-01-08', '2026-01-08 12:58:00+00', '2026-01-08 14:17:59+00', 11.66, 4799, 6.86, 25, 50, 'purple', 17.2),
-  ('c2d8161b-b692-40ff-906a-a082a1e49e80', 'aaaaaaaa-0009-0009-0009-000000000009', '2026-01-08', '2026-01-08 13:02:00+00', '2026-01-08 13:46:27+00', 6.86, 2667, 6.48, 13, 52, 'red', 6.2),
-  ('4734084d-ade0-4883-aa47-3016414e72b9', 'aaaaaaaa-0065-0065-0065-000000000065', '2026-01-08', '2026-01-08 17:11:00+00', '2026-01-08 18:43:28+00', 12.12, 5548, 7.63, 23, 23, 'blue', 24.9),
-  ('355a58be-cfb3-478a-a79c-2f69e1aa5c47', 'aaaaaaaa-0018-0018-0018-000000000018', '2026-01-08', '2026-01-08 16:15:00+00', '2026-01-08 16:49:56+00', 5.72, 2096, 6.11, 9, 9, 'red', 8.6),
-  ('92032fe4-0537-4c38-9652-d8f20883ec45', 'aaaaaaaa-0096-0096-0096-000000000096', '2026-01-08', '2026-01-08 08:05:00+00', '2026-01-08 08:19:51+00', 2.07, 891, 7.18, 5, 5, 'purple', 14.9),
-  ('a1cbcb19-6836-415e-91b7-411f8d8d16a7', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-01-08', '2026-01-08 12:53:00+00', '2026-01-08 13:35:17+00', 6.99, 2537, 6.05, 8, 8, 'blue', 20.5),
-  ('f8d44d51-fc9b-4dee-bbc9-392c525ddd03', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-01-08', '2026-01-08 05:58:00+00', '2026-01-08 06:33:04+00', 5.12, 2104, 6.85, 11, 11, 'purple', 22.4),
-  ('01550653-244c-4194-8e85-719d6a427952', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-01-08', '2026-01-08 18:06:00+00', '2026-01-08 18:43:29+00', 7.78, 2249, 4.82, 8, 8, 'blue', 10.6),
-  ('afda70e2-f293-496e-9864-48714c147368', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-01-08', '2026-01-08 06:42:00+00', '2026-01-08 07:57:25+00', 12.05, 4525, 6.26, 23, 69, 'red', 7.7),
-  ('552eaeef-053b-4003-b05d-24239c25cbb4', 'aaaaaaaa-0035-0035-0035-000000000035', '2026-01-08', '2026-01-08 12:08:00+00', '2026-01-08 12:28:28+00', 3.25, 1228, 6.3, 7, 14, 'red', 6.7),
-  ('0edb0a4f-0c82-4650-a07a-15e711d3845a', 'aaaaaaaa-0071-0071-0071-000000000071', '2026-01-08', '2026-01-08 09:44:00+00', '2026-01-08 10:37:28+00', 10.61, 3208, 5.04, 19, 38, 'blue', 8.5),
-  ('84a221bd-f8a3-4d70-a8c3-dac050108e5b', 'aaaaaaaa-0031-0031-0031-000000000031', '2026-01-09', '2026-01-09 18:25:00+00', '2026-01-09 19:17:03+00', 8.33, 3123, 6.25, 17, 68, 'red', 11.1),
-  ('f8b99cb4-3e0a-4929-b642-5ce6ce572063', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-01-09', '2026-01-09 20:38:00+00', '2026-01-09 22:19:42+00', 14.74, 6102, 6.9, 18, 54, 'blue', 16.3),
-  ('88fca265-8367-4208-8081-9e34c4fec6e2', 'aaaaaaaa-0091-0091-0091-000000000091', '2026-01-09', '2026-01-09 17:01:00+00', '2026-01-09 18:36:34+00', 14.35, 5734, 6.66, 32, 64, 'purple', 19.3),
-  ('c4c7316a-d988-403c-a0f1-cdbd2ce2edc0', 'aaaaaaaa-0024-0024-0024-000000000024', '2026-01-09', '2026-01-09 17:59:00+00', '2026-01-09 18:47:09+00', 6.86, 2889, 7.02, 12, 48, 'red', 11.1),
-  ('3486f575-51d2-47e9-b7e9-ad94075be0a5', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-01-09', '2026-01-09 12:00:00+00', '2026-01-09 13:22:48+00', 11.47, 4968, 7.22, 20, 20, 'red', 11.4),
-  ('b30c82c6-e408-4f03-8e8f-bd927a63829a', 'aaaaaaaa-0016-0016-0016-000000000016', '2026-01-09', '2026-01-09 11:45:00+00', '2026-01-09 12:47:34+00', 7.89, 3754, 7.93, 10, 30, 'red', 6.0),
-  ('ad692f99-fd4c-4212-92ad-a670f4ff75b4', 'aaaaaaaa-0064-0064-0064-000000000064', '2026-01-09', '2026-01-09 20:03:00+00', '2026-01-09 21:19:07+00', 12.52, 4567, 6.08, 27, 81, 'blue', 12.1),
-  ('364fdeef-451f-498f-8d2d-eda8106d812d', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-01-09', '2026-01-09 09:36:00+00', '2026-01-09 09:53:55+00', 3.46, 1075, 5.18, 6, 24, 'red', 24.2),
-  ('061ff673-3d59-49e3-bab3-1e31afb3bae5', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-01-09', '2026-01-09 10:46:00+00', '2026-01-09 11:38:17+00', 7.59, 3137, 6.89, 9, 18, 'blue', 11.9),
-  ('18d27719-b5ec-4b73-9dd6-8bb87c414bb2', 'aaaaaaaa-0042-0042-0042-000000000042', '2026-01-09', '2026-01-09 17:33:00+00', '2026-01-09 17:53:25+00', 3.66, 1225, 5.58, 3, 3, 'blue', 10.0),
-  ('6a15e6c0-0ec1-478f-8170-9c4421db7437', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-01-09', '2026-01-09 20:44:00+00', '2026-01-09 22:10:29+00', 12.48, 5189, 6.93, 21, 63, 'red', 13.9),
-  ('f27605c6-42b3-4b4f-8c8d-b168996f7e07', 'aaaaaaaa-0052-0052-0052-000000000052', '2026-01-09', '2026-01-09 05:31:00+00', '2026-01-09 06:55:04+00', 11.02, 5044, 7.63, 16, 16, 'blue', 21.3),
-  ('a86cadcd-b2ad-4d23-a740-af7384fda912', 'aaaaaaaa-0032-0032-0032-000000000032', '2026-01-09', '2026-01-09 17:30:00+00', '2026-01-09 17:51:19+00', 3.62, 1279, 5.89, 4, 12, 'red', 10.8),
-  ('20791195-6be5-4f11-975d-e9b456c2a012', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-01-09', '2026-01-09 09:22:00+00', '2026-01-09 09:49:49+00', 4.6, 1669, 6.05, 5, 10, 'blue', 8.8),
-  ('664345ce-f50b-4409-b0d3-432307e19611', 'aaaaaaaa-0025-0025-0025-000000000025', '2026-01-09', '2026-01-09 08:52:00+00', '2026-01-09 09:55:34+00', 9.28, 3814, 6.85, 12, 36, 'red', 19.3),
-  ('aaeb715c-ed42-4756-80b0-dd1d27bfa563', 'aaaaaaaa-0000-0000-0000-000000000000', '2026-01-09', '2026-01-09 17:14:00+00', '2026-01-09 17:45:26+00', 5.07, 1886, 6.2, 2, 6, 'red', 9.9),
-  ('0ed2da75-0d61-4bf2-8ccd-ef980e83c3f0', 'aaaaaaaa-0007-0007-0007-000000000007', '2026-01-09', '2026-01-09 07:36:00+00', '2026-01-09 08:42:07+00', 9.42, 3967, 7.02, 13, 13, 'red', 17.5),
-  ('bf761928-2752-48fc-9144-2fd0a7c0313a', 'aaaaaaaa-0044-0044-0044-000000000044', '2026-01-09', '2026-01-09 19:25:00+00', '2026-01-09 20:39:42+00', 11.37, 4482, 6.57, 18, 36, 'blue', 7.7),
-  ('09f80802-4685-4493-bd8a-a07e80727a6b', 'aaaaaaaa-0076-0076-0076-000000000076', '2026-01-09', '2026-01-09 10:08:00+00', '2026-01-09 10:27:21+00', 2.47, 1161, 7.84, 5, 5, 'blue', 13.4),
-  ('b2fe9ccc-a554-4b91-84b4-abcf52d8a069', 'aaaaaaaa-0029-0029-0029-000000000029', '2026-01-09', '2026-01-09 11:01:00+00', '2026-01-09 11:46:03+00', 7.69, 2703, 5.86, 9, 27, 'red', 19.8),
-  ('eb473de8-b518-4d7d-bbd0-ab1b1fbf8f62', 'aaaaaaaa-0056-0056-0056-000000000056', '2026-01-09', '2026-01-09 07:26:00+00', '2026-01-09 09:04:38+00', 14.4, 5918, 6.85, 20, 40, 'blue', 20.3),
-  ('fbe6aef8-93e5-4f3f-869f-d88fc59d9ef4', 'aaaaaaaa-0058-0058-0058-000000000058', '2026-01-09', '2026-01-09 05:11:00+00', '2026-01-09 06:24:46+00', 12.61, 4426, 5.85, 10, 30, 'blue', 10.6),
-  ('1612ab17-dc9d-4874-8061-0f6f99aa4935', 'aaaaaaaa-0078-0078-0078-000000000078', '2026-01-09', '2026-01-09 18:15:00+00', '2026-01-09 18:48:09+00', 6.78, 1989, 4.89, 6, 12, 'blue', 14.6),
-  ('63f771ea-7a8d-488b-8bf7-eb17db048959', 'aaaaaaaa-0045-0045-0045-000000000045', '2026-01-09', '2026-01-09 19:18:00+00', '2026-01-09 19:51:16+00', 5.88, 1996, 5.66, 3, 9, 'blue', 8.8),
-  ('ac276ba5-f7ed-447f-9d07-40ef7a748441', 'aaaaaaaa-0086-0086-0086-000000000086', '2026-01-09', '2026-01-09 20:46:00+00', '2026-01-09 21:23:26+00', 4.94, 2246, 7.58, 12, 12, 'purple', 22.3),
-  ('5d939c78-72cb-40ea-bf7a-49b426939547', 'aaaaaaaa-0074-0074-0074-000000000074', '2026-01-09', '2026-01-09 14:17:00+00', '2026-01-09 16:09:42+00', 14.16, 6762, 7.96, 12, 12, 'blue', 17.7),
-  ('aa825bc8-3696-40c1-bd38-57e0f7780e2f', 'aaaaaaaa-0012-0012-0012-000000000012', '2026-01-09', '2026-01-09 07:59:00+00', '2026-01-09 09:08:59+00', 9.37, 4199, 7.47, 19, 76, 'red', 11.4),
-  ('972d64b4-edb1-4bcb-bcec-c525f8faad6b', 'aaaaaaaa-0068-0068-0068-000000000068', '2026-01-09', '2026-01-09 12:12:00+00', '2026-01-09 13:01:45+00', 9.46, 2985, 5.26, 9, 9, 'blue', 4.5),
-  ('ee9c6654-eccd-4202-ab16-89a48d2cfe76', 'aaaaaaaa-0028-0028-0028-000000000028', '2026-01-09', '2026-01-09 13:24:00+00', '2026-01-09 13:57:17+00', 6.03, 1997, 5.52, 10, 20, 'red', 8.8),
-  ('d5d99c67-0189-49d9-a193-694900e32637', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-01-09', '2026-01-09 09:33:00+00', '2026-01-09 11:05:40+00', 11.79, 5560, 7.86, 27, 27, 'purple', 6.4),
-  ('048411f9-691b-4f61-9978-2032e75bf4dd', 'aaaaaaaa-0009-0009-0009-000000000009', '2026-01-09', '2026-01-09 16:13:00+00', '2026-01-09 17:52:39+00', 14.92, 5979, 6.68, 26, 78, 'red', 8.1),
-  ('db5baa71-af91-4ae0-8856-a7796db52429', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-01-09', '2026-01-09 05:13:00+00', '2026-01-09 05:34:17+00', 2.73, 1277, 7.8, 3, 6, 'red', 6.8),
-  ('b79253f6-5c25-4b0f-812c-bf96386acd8f', 'aaaaaaaa-0020-0020-0020-000000000020', '2026-01-09', '2026-01-09 16:03:00+00', '2026-01-09 16:45:33+00', 5.52, 2553, 7.71, 5, 5, 'red', 20.4),
-  ('8e42a1e9-570c-4fde-88fb-38869c62ed1b', 'aaaaaaaa-0092-0092-0092-000000000092', '2026-01-09', '2026-01-09 20:40:00+00', '2026-01-09 21:38:26+00', 7.71, 3506, 7.58, 15, 15, 'purple', 12.1),
-  ('072854db-3f92-45fd-8f67-0e7be65d87d3', 'aaaaaaaa-0097-0097-0097-000000000097', '2026-01-09', '2026-01-09 14:45:00+00', '2026-01-09 15:09:38+00', 3.93, 1478, 6.27, 3, 9, 'purple', 23.5),
-  ('bac53688-e764-4a5f-8132-50e165304b45', 'aaaaaaaa-0069-0069-0069-000000000069', '2026-01-09', '2026-01-09 19:32:00+00', '2026-01-09 20:05:17+00', 5.31, 1997, 6.27, 8, 24, 'blue', 19.3),
-  ('ed3241db-d9a0-42b8-bf51-a569a5efe4b0', 'aaaaaaaa-0060-0060-0060-000000000060', '2026-01-09', '2026-01-09 06:51:00+00', '2026-01-09 07:08:41+00', 2.55, 1061, 6.94, 3, 6, 'blue', 24.6),
-  ('ae4b81c3-05e4-4827-af87-b9fbc71949d7', 'aaaaaaaa-0019-0019-0019-000000000019', '2026-01-09', '2026-01-09 17:11:00+00', '2026-01-09 18:04:51+00', 10.18, 3231, 5.29, 15, 15, 'red', 6.3),
-  ('bc020286-6ca7-497d-833d-47583cdc98fe', 'aaaaaaaa-0096-0096-0096-000000000096', '2026-01-09', '2026-01-09 15:00:00+00', '2026-01-09 15:38:46+00', 6.9, 2326, 5.62, 12, 36, 'purple', 20.8),
-  ('b665bae8-79f7-4ca2-bd3d-326dcaa52aa6', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-01-09', '2026-01-09 11:10:00+00', '2026-01-09 11:35:13+00', 5.52, 1513, 4.57, 10, 30, 'blue', 6.7),
-  ('0ce5425d-3372-4c77-888e-a8125cb5e9f1', 'aaaaaaaa-0038-0038-0038-000000000038', '2026-01-09', '2026-01-09 06:09:00+00', '2026-01-09 07:43:22+00', 14.32, 5662, 6.59, 18, 36, 'red', 10.0),
-  ('ceccc3a6-13da-46e1-9623-e79c0acbe37f', 'aaaaaaaa-0072-0072-0072-000000000072', '2026-01-09', '2026-01-09 06:02:00+00', '2026-01-09 06:56:21+00', 9.69, 3261, 5.61, 17, 17, 'blue', 17.6),
-  ('f2c624a9-0a3b-4e8b-a880-b313f6196825', 'aaaaaaaa-0063-0063-0063-000000000063', '2026-01-09', '2026-01-09 18:34:00+00', '2026-01-09 19:09:17+00', 5.54, 2117, 6.37, 8, 8, 'blue', 21.7),
-  ('dc9ac7f8-4d93-4168-ab87-95d1a774705f', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-01-09', '2026-01-09 19:40:00+00', '2026-01-09 20:26:22+00', 7.42, 2782, 6.25, 11, 44, 'red', 11.8),
-  ('a814e884-0d27-46c7-b125-f8bbb41e54f1', 'aaaaaaaa-0037-0037-0037-000000000037', '2026-01-09', '2026-01-09 06:18:00+00', '2026-01-09 07:05:16+00', 8.82, 2836, 5.36, 11, 11, 'red', 9.9),
-  ('1568a40f-d0cb-409a-ba56-60ffac997cd6', 'aaaaaaaa-0098-0098-0098-000000000098', '2026-01-09', '2026-01-09 13:36:00+00', '2026-01-09 13:58:12+00', 4.12, 1332, 5.39, 10, 30, 'purple', 7.8),
-  ('d1ab8f27-5cdc-45e4-8267-db20e1ec75ff', 'aaaaaaaa-0033-0033-0033-000000000033', '2026-01-09', '2026-01-09 13:15:00+00', '2026-01-09 14:08:08+00', 10.98, 3188, 4.84, 12, 24, 'red', 6.5),
-  ('2111ad75-6158-4515-a0fa-cfaa6ab9ea8c', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-01-09', '2026-01-09 10:25:00+00', '2026-01-09 12:08:25+00', 13.52, 6205, 7.65, 12, 48, 'red', 15.1),
-  ('29f77de5-b786-4c54-aec4-69e03f3fed31', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-01-09', '2026-01-09 15:45:00+00', '2026-01-09 16:27:28+00', 7.91, 2548, 5.37, 16, 32, 'purple', 15.1),
-  ('9951b2fb-4d1d-4c57-88e4-e5e5e00989c1', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-01-09', '2026-01-09 09:44:00+00', '2026-01-09 11:24:27+00', 14.19, 6027, 7.08, 30, 90, 'blue', 18.4),
-  ('c65023df-777c-45c9-94fc-bc9c20b0e01e', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-01-09', '2026-01-09 12:38:00+00', '2026-01-09 13:18:59+00', 7.08, 2459, 5.79, 8, 24, 'red', 24.0),
-  ('e0cb6ce2-7c9b-4148-8586-df68a28ae2db', 'aaaaaaaa-0070-0070-0070-000000000070', '2026-01-09', '2026-01-09 19:36:00+00', '2026-01-09 20:09:24+00', 5.55, 2004, 6.02, 8, 8, 'blue', 17.0),
-  ('c39e65dd-e154-409e-8812-3e445b36f3a3', 'aaaaaaaa-0015-0015-0015-000000000015', '2026-01-09', '2026-01-09 17:46:00+00', '2026-01-09 18:48:14+00', 10.04, 3734, 6.2, 15, 30, 'red', 15.4),
-  ('914ba9a6-bfea-4ce5-9675-6a79ad0dd70b', 'aaaaaaaa-0034-0034-0034-000000000034', '2026-01-09', '2026-01-09 14:35:00+00', '2026-01-09 15:45:04+00', 9.56, 4204, 7.33, 6, 24, 'red', 5.3),
-  ('0caa0806-b7fe-4b1c-b59b-6325e63e34c1', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-01-09', '2026-01-09 05:09:00+00', '2026-01-09 05:55:15+00', 9.82, 2775, 4.71, 10, 20, 'red', 21.5),
-  ('f44262af-efdc-4e0f-b599-5a3885c0f1b6', 'aaaaaaaa-0004-0004-0004-000000000004', '2026-01-09', '2026-01-09 11:27:00+00', '2026-01-09 12:52:01+00', 14.03, 5101, 6.06, 10, 10, 'red', 11.2),
-  ('4a7135ba-d4e5-420f-a2ae-927db59a777e', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-01-09', '2026-01-09 06:24:00+00', '2026-01-09 07:11:15+00', 6.84, 2835, 6.91, 2, 6, 'red', 4.0),
-  ('33dedae6-2dcf-453d-85d8-7b85088bc607', 'aaaaaaaa-0061-0061-0061-000000000061', '2026-01-09', '2026-01-09 08:38:00+00', '2026-01-09 09:05:43+00', 3.84, 1663, 7.22, 9, 9, 'blue', 5.6),
-  ('a27eb363-b56f-48dc-9d34-0bddc1748748', 'aaaaaaaa-0085-0085-0085-000000000085', '2026-01-09', '2026-01-09 20:57:00+00', '2026-01-09 21:08:11+00', 2.1, 671, 5.33, 5, 10, 'purple', 23.5),
-  ('7059ceb5-b00c-4b8b-81c0-7dad9ee52e73', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-01-09', '2026-01-09 16:13:00+00', '2026-01-09 16:58:02+00', 7.05, 2702, 6.39, 9, 27, 'blue', 18.1),
-  ('bfafc19a-73b8-4d35-942d-4b6d287e5996', 'aaaaaaaa-0093-0093-0093-000000000093', '2026-01-09', '2026-01-09 20:15:00+00', '2026-01-09 20:38:06+00', 3.32, 1386, 6.96, 7, 7, 'purple', 22.0),
-  ('ab4029c5-2b35-4043-9ac8-f03e30f0c50b', 'aaaaaaaa-0036-0036-0036-000000000036', '2026-01-09', '2026-01-09 16:19:00+00', '2026-01-09 17:53:21+00', 14.0, 5661, 6.74, 17, 17, 'red', 16.9),
-  ('066dec79-0b0a-465d-a350-37c2da78fb16', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-01-09', '2026-01-09 21:34:00+00', '2026-01-09 22:26:51+00', 9.79, 3171, 5.4, 18, 36, 'purple', 13.0),
-  ('09a63ab4-9c5d-4b34-a53a-fc626c51e072', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-01-09', '2026-01-09 21:58:00+00', '2026-01-09 22:10:22+00', 2.39, 742, 5.18, 4, 12, 'blue', 14.7),
-  ('01cf523d-94ee-4fa7-bca3-8c23f974c997', 'aaaaaaaa-0051-0051-0051-000000000051', '2026-01-09', '2026-01-09 15:53:00+00', '2026-01-09 16:43:25+00', 9.81, 3025, 5.14, 16, 32, 'blue', 23.6),
-  ('5cb8504c-f7da-4219-b7f7-80d512038b14', 'aaaaaaaa-0026-0026-0026-000000000026', '2026-01-09', '2026-01-09 13:56:00+00', '2026-01-09 15:17:57+00', 10.59, 4917, 7.74, 12, 24, 'red', 19.0),
-  ('11b0dfa3-1873-4fa7-a17b-f92272f70c7d', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-01-10', '2026-01-10 20:48:00+00', '2026-01-10 22:08:16+00', 13.84, 4816, 5.8, 27, 54, 'blue', 20.1),
-  ('c8c86aa2-50b1-4d5d-bbc4-8612777c0e86', 'aaaaaaaa-0033-0033-0033-000000000033', '2026-01-10', '2026-01-10 11:14:00+00', '2026-01-10 12:38:34+00', 13.36, 5074, 6.33, 19, 76, 'red', 11.6),
-  ('bd557866-4ca9-4499-9e1f-8a75046a1749', 'aaaaaaaa-0043-0043-0043-000000000043', '2026-01-10', '2026-01-10 08:54:00+00', '2026-01-10 10:07:47+00', 12.7, 4427, 5.81, 17, 34, 'blue', 16.8),
-  ('774c9954-5d79-4877-8470-b0e2c411c89d', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-01-10', '2026-01-10 16:15:00+00', '2026-01-10 16:57:03+00', 8.53, 2523, 4.93, 12, 24, 'red', 9.2),
-  ('ae6a4157-5917-4950-892c-de0768e64830', 'aaaaaaaa-0078-0078-0078-000000000078', '2026-01-10', '2026-01-10 05:54:00+00', '2026-01-10 06:52:18+00', 12.38, 3498, 4.71, 19, 38, 'blue', 3.2),
-  ('156bdb9c-9203-4cea-bf1e-e3fdb4c7af4e', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-01-10', '2026-01-10 07:52:00+00', '2026-01-10 08:18:42+00', 4.06, 1602, 6.58, 5, 10, 'blue', 24.9),
-  ('2a6aa9fc-da57-4b40-abe2-156820ecc623', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-01-10', '2026-01-10 08:16:00+00', '2026-01-10 09:22:17+00', 11.16, 3977, 5.94, 10, 30, 'blue', 3.8),
-  ('9a79bf53-fc63-42ec-abb7-6e1ec3c970ff', 'aaaaaaaa-0074-0074-0074-000000000074', '2026-01-10', '2026-01-10 12:53:00+00', '2026-01-10 14:03:20+00', 10.24, 4220, 6.87, 13, 13, 'blue', 13.0),
-  ('f0d0c957-3c06-4699-9741-b4e2548fa385', 'aaaaaaaa-0003-0003-0003-000000000003', '2026-01-10', '2026-01-10 14:48:00+00', '2026-01-10 16:00:22+00', 12.81, 4342, 5.65, 25, 100, 'red', 19.5),
-  ('75ba7efb-e843-49b5-8e10-45171817fe4d', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-01-10', '2026-01-10 07:39:00+00', '2026-01-10 08:16:10+00', 8.17, 2230, 4.55, 19, 19, 'purple', 8.5),
-  ('9bba4864-8f38-44f3-b420-b646b93dec5e', 'aaaaaaaa-0004-0004-0004-000000000004', '2026-01-10', '2026-01-10 20:44:00+00', '2026-01-10 21:00:36+00', 2.45, 996, 6.78, 4, 4, 'red', 12.9),
-  ('7ddd32c4-0e4e-4298-9af4-52373bfccbd3', 'aaaaaaaa-0014-0014-0014-000000000014', '2026-01-10', '2026-01-10 16:05:00+00', '2026-01-10 17:12:26+00', 9.69, 4046, 6.96, 10, 20, 'red', 5.2),
-  ('270c1791-afbd-4560-b9e2-7ce243d9f80a', 'aaaaaaaa-0096-0096-0096-000000000096', '2026-01-10', '2026-01-10 18:46:00+00', '2026-01-10 20:36:55+00', 14.89, 6655, 7.45, 27, 54, 'purple', 20.5),
-  ('edbb973e-42cf-49fd-8752-89a989c538f1', 'aaaaaaaa-0068-0068-0068-000000000068', '2026-01-10', '2026-01-10 06:06:00+00', '2026-01-10 06:30:26+00', 3.76, 1466, 6.5, 7, 7, 'blue', 7.3),
-  ('8dcbb223-4f1c-421d-99ab-bfb1a022ce9b', 'aaaaaaaa-0076-0076-0076-000000000076', '2026-01-10', '2026-01-10 09:11:00+00', '2026-01-10 09:52:58+00', 8.43, 2518, 4.98, 14, 28, 'blue', 24.0),
-  ('00c553a1-aff6-4503-9022-f76d491803cb', 'aaaaaaaa-0070-0070-0070-000000000070', '2026-01-10', '2026-01-10 05:29:00+00', '2026-01-10 05:55:01+00', 3.56, 1561, 7.31, 7, 14, 'blue', 8.6),
-  ('023d99ac-6b96-4d70-b6ed-b8274fafae4c', 'aaaaaaaa-0097-0097-0097-000000000097', '2026-01-10', '2026-01-10 13:48:00+00', '2026-01-10 14:16:37+00', 5.34, 1717, 5.36, 11, 11, 'purple', 4.2),
-  ('28099ab0-5faf-497b-abe5-62cc5983d42a', 'aaaaaaaa-0061-0061-0061-000000000061', '2026-01-10', '2026-01-10 05:13:00+00', '2026-01-10 05:37:04+00', 3.07, 1444, 7.84, 5, 10, 'blue', 23.1),
-  ('fb5563b9-b18a-45b2-a980-9426efde42a5', 'aaaaaaaa-0029-0029-0029-000000000029', '2026-01-10', '2026-01-10 18:34:00+00', '2026-01-10 19:38:17+00', 10.77, 3857, 5.97, 23, 46, 'red', 16.8),
-  ('eb7c7ae9-a3f2-4843-94ea-be93babe20bf', 'aaaaaaaa-0093-0093-0093-000000000093', '2026-01-10', '2026-01-10 07:27:00+00', '2026-01-10 09:14:19+00', 13.45, 6439, 7.98, 26, 26, 'purple', 18.5),
-  ('9f910812-f96f-4086-90c8-19ad45899b25', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-01-10', '2026-01-10 06:32:00+00', '2026-01-10 06:59:39+00', 5.91, 1659, 4.68, 8, 32, 'red', 15.6),
-  ('0725499e-1e1c-4550-a534-9dd34f4f26ce', 'aaaaaaaa-0086-0086-0086-000000000086', '2026-01-10', '2026-01-10 20:43:00+00', '2026-01-10 21:04:23+00', 4.05, 1283, 5.28, 5, 5, 'purple', 24.2),
-  ('ee402e58-3ad1-45e5-9f89-77bcd29fa9bd', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-01-10', '2026-01-10 09:43:00+00', '2026-01-10 10:54:17+00', 14.2, 4277, 5.02, 23, 23, 'purple', 3.3),
-  ('569af7f8-1f51-412a-a4e1-0f88e9ddf252', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-01-10', '2026-01-10 21:17:00+00', '2026-01-10 22:22:30+00', 8.43, 3930, 7.77, 11, 33, 'purple', 19.3),
-  ('36bc5aa8-0277-4407-80fd-e5e3dc74bc27', 'aaaaaaaa-0020-0020-0020-000000000020', '2026-01-10', '2026-01-10 18:01:00+00', '2026-01-10 18:59:31+00', 10.9, 3511, 5.37, 24, 96, 'red', 5.6),
-  ('1d8fa12f-6633-4937-a499-cbd6a267875a', 'aaaaaaaa-0012-0012-0012-000000000012', '2026-01-10', '2026-01-10 09:41:00+00', '2026-01-10 10:26:19+00', 7.8, 2719, 5.81, 10, 20, 'red', 15.6),
-  ('c965966c-a618-4053-9a8b-375369fade52', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-01-10', '2026-01-10 09:29:00+00', '2026-01-10 09:58:38+00', 4.89, 1778, 6.06, 4, 12, 'red', 23.3),
-  ('0ddc9d82-efac-4a29-a3ad-e7f165eccc2a', 'aaaaaaaa-0069-0069-0069-000000000069', '2026-01-10', '2026-01-10 09:35:00+00', '2026-01-10 10:13:08+00', 4.96, 2288, 7.69, 12, 36, 'blue', 17.0),
-  ('1042306c-4062-4c1a-bc68-1844767b5410', 'aaaaaaaa-0052-0052-0052-000000000052', '2026-01-10', '2026-01-10 07:46:00+00', '2026-01-10 08:40:15+00', 11.12, 3255, 4.88, 22, 22, 'blue', 5.6),
-  ('391958d7-0936-4dc7-868b-ecedefa228cf', 'aaaaaaaa-0066-0066-0066-000000000066', '2026-01-10', '2026-01-10 07:21:00+00', '2026-01-10 09:04:08+00', 13.43, 6188, 7.68, 17, 51, 'blue', 7.4),
-  ('e7be60c0-d8c2-4dc6-8d5c-3e7f39ae33c1', 'aaaaaaaa-0037-0037-0037-000000000037', '2026-01-10', '2026-01-10 10:20:00+00', '2026-01-10 10:49:21+00', 5.08, 1761, 5.78, 8, 16, 'red', 18.8),
-  ('1fdfe4e8-f5bb-4902-933a-977742eeb2fc', 'aaaaaaaa-0036-0036-0036-000000000036', '2026-01-10', '2026-01-10 18:59:00+00', '2026-01-10 20:23:18+00', 11.84, 5058, 7.12, 16, 16, 'red', 5.8),
-  ('47241600-ede0-4849-9a9a-eb8c97381905', 'aaaaaaaa-0021-0021-0021-000000000021', '2026-01-10', '2026-01-10 06:19:00+00', '2026-01-10 06:40:30+00', 3.42, 1290, 6.29, 4, 12, 'red', 14.0),
-  ('e9acff6f-06bb-4660-ac57-a4db1e330918', 'aaaaaaaa-0072-0072-0072-000000000072', '2026-01-10', '2026-01-10 14:14:00+00', '2026-01-10 15:40:42+00', 11.44, 5202, 7.58, 21, 21, 'blue', 19.6),
-  ('8b6fb327-8d5a-4044-abed-e265f47f9dbb', 'aaaaaaaa-0049-0049-0049-000000000049', '2026-01-10', '2026-01-10 06:11:00+00', '2026-01-10 06:52:51+00', 6.39, 2511, 6.55, 10, 10, 'blue', 9.3),
-  ('4b2c0737-406d-4c19-9655-911397d16f33', 'aaaaaaaa-0035-0035-0035-000000000035', '2026-01-10', '2026-01-10 06:19:00+00', '2026-01-10 06:42:22+00', 3.18, 1402, 7.35, 5, 20, 'red', 11.2),
-  ('aa8e8215-291b-45bd-ac01-3896ba9551a1', 'aaaaaaaa-0038-0038-0038-000000000038', '2026-01-10', '2026-01-10 12:06:00+00', '2026-01-10 13:23:54+00', 9.95, 4674, 7.83, 16, 16, 'red', 12.3),
-  ('e7089dac-8c9a-4f63-b49a-9476e857e3d3', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-01-10', '2026-01-10 21:43:00+00', '2026-01-10 22:56:19+00', 11.75, 4399, 6.24, 15, 30, 'red', 5.2),
-  ('1e2dfbe0-a6cc-4998-b2d6-46cb4c429a09', 'aaaaaaaa-0048-0048-0048-000000000048', '2026-01-10', '2026-01-10 05:11:00+00', '2026-01-10 06:31:17+00', 13.27, 4817, 6.05, 27, 27, 'blue', 19.4),
-  ('4e093228-51d8-437c-8577-0f9c463905ad', 'aaaaaaaa-0060-0060-0060-000000000060', '2026-01-10', '2026-01-10 16:04:00+00', '2026-01-10 17:23:21+00', 12.38, 4761, 6.41, 19, 57, 'blue', 17.8),
-  ('711d1aa6-2764-4a7f-89ff-6f4066c11e7c', 'aaaaaaaa-0057-0057-0057-000000000057', '2026-01-10', '2026-01-10 14:54:00+00', '2026-01-10 15:47:08+00', 7.68, 3188, 6.92, 12, 12, 'blue', 8.4),
-  ('47aba514-5352-4867-b233-57aedafb495d', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-01-10', '2026-01-10 08:47:00+00', '2026-01-10 09:20:49+00', 4.75, 2029, 7.12, 4, 8, 'blue', 5.5),
-  ('95fce100-38d9-47b6-ad0e-9ffc100d7a79', 'aaaaaaaa-0042-0042-0042-000000000042', '2026-01-10', '2026-01-10 14:35:00+00', '2026-01-10 15:30:11+00', 7.53, 3311, 7.33, 7, 7, 'blue', 4.6),
-  ('3cb77667-2561-4cfd-8cd4-f30ccbcb6bf0', 'aaaaaaaa-0062-0062-0062-000000000062', '2026-01-10', '2026-01-10 18:54:00+00', '2026-01-10 19:08:20+00', 3.18, 860, 4.51, 2, 6, 'blue', 3.4),
-  ('07662397-957f-4842-bd53-b368a3ef5457', 'aaaaaaaa-0046-0046-0046-000000000046', '2026-01-10', '2026-01-10 18:49:00+00', '2026-01-10 20:10:19+00', 14.47, 4879, 5.62, 6, 12, 'blue', 8.4),
-  ('645802a1-2648-4524-acbe-24b7dce66478', 'aaaaaaaa-0077-0077-0077-000000000077', '2026-01-10', '2026-01-10 21:01:00+00', '2026-01-10 21:40:58+00', 8.01, 2398, 4.99, 5, 5, 'blue', 10.9),
-  ('40c232e1-7e90-4a43-b568-0fe96b6fc488', 'aaaaaaaa-0084-0084-0084-000000000084', '2026-01-10', '2026-01-10 11:09:00+00', '2026-01-10 12:41:00+00', 12.09, 5520, 7.61, 30, 60, 'purple', 9.5),
-  ('bc9f23c9-01c6-4576-959e-edb00fb1cec0', 'aaaaaaaa-0023-0023-0023-000000000023', '2026-01-10', '2026-01-10 12:11:00+00', '2026-01-10 12:49:57+00', 8.22, 2337, 4.74, 18, 72, 'red', 21.4),
-  ('1ef2ab7f-36c9-434e-97e2-eab8435b5c2f', 'aaaaaaaa-0028-0028-0028-000000000028', '2026-01-10', '2026-01-10 20:12:00+00', '2026-01-10 20:27:35+00', 2.75, 935, 5.67, 4, 8, 'red', 11.2),
-  ('47425bf7-a373-4a71-9b12-cebb1aef9785', 'aaaaaaaa-0080-0080-0080-000000000080', '2026-01-10', '2026-01-10 21:16:00+00', '2026-01-10 22:23:31+00', 9.51, 4051, 7.1, 17, 17, 'purple', 24.1),
-  ('3db55d6e-d9bc-44f7-8488-ceebecdd35d3', 'aaaaaaaa-0064-0064-0064-000000000064', '2026-01-10', '2026-01-10 08:06:00+00', '2026-01-10 08:26:03+00', 3.91, 1203, 5.13, 5, 10, 'blue', 7.6),
-  ('eb3e0057-cfe3-41f8-a3f6-af4c53668865', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-01-11', '2026-01-11 15:06:00+00', '2026-01-11 16:30:54+00', 14.01, 5094, 6.06, 16, 48, 'blue', 20.1),
-  ('b0c7c52b-627a-4337-bdeb-1bf3d5d6fe97', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-01-11', '2026-01-11 11:37:00+00', '2026-01-11 12:35:26+00', 11.09, 3506, 5.27, 10, 20, 'blue', 16.3),
-  ('375ae6c6-f144-4e00-bc3a-f4cade0a1064', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-01-11', '2026-01-11 16:49:00+00', '2026-01-11 17:44:50+00', 8.36, 3350, 6.68, 16, 16, 'purple', 16.8),
-  ('c25041e8-6abb-4d8e-b1b2-27f548818630', 'aaaaaaaa-0062-0062-0062-000000000062', '2026-01-11', '2026-01-11 06:14:00+00', '2026-01-11 07:24:39+00', 12.73, 4239, 5.55, 9, 27, 'blue', 20.9),
-  ('0ddae34b-7f64-4c49-8b9b-74c8e9179585', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-01-11', '2026-01-11 09:03:00+00', '2026-01-11 10:28:40+00', 13.12, 5140, 6.53, 11, 33, 'blue', 20.9),
-  ('7f783093-352a-413f-87ba-d160c0b5a04f', 'aaaaaaaa-0077-0077-0077-000000000077', '2026-01-11', '2026-01-11 07:58:00+00', '2026-01-11 08:16:53+00', 3.53, 1133, 5.35, 2, 2, 'blue', 13.9),
-  ('9eb9bba7-8a3f-4879-a11c-93fd515dfd6e', 'aaaaaaaa-0015-0015-0015-000000000015', '2026-01-11', '2026-01-11 08:37:00+00', '2026-01-11 08:48:15+00', 2.19, 675, 5.14, 5, 15, 'red', 20.0),
-  ('4f489503-e1a9-4b8d-b5e9-4349252a971b', 'aaaaaaaa-0096-0096-0096-000000000096', '2026-01-11', '2026-01-11 15:09:00+00', '2026-01-11 15:30:52+00', 3.72, 1312, 5.88, 8, 16, 'purple', 4.7),
-  ('7503f26b-a625-400b-b343-7f57b31c2c1d', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-01-11', '2026-01-11 15:06:00+00', '2026-01-11 16:13:04+00', 10.68, 4024, 6.28, 22, 22, 'red', 23.2),
-  ('f232ac2e-b42e-4733-aa7d-6d96c071aafa', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-01-11', '2026-01-11 09:23:00+00', '2026-01-11 10:01:45+00', 5.52, 2325, 7.02, 12, 36, 'purple', 6.1),
-  ('797ab63a-f7b6-4c17-8f01-6aec66b7d473', 'aaaaaaaa-0021-0021-0021-000000000021', '2026-01-11', '2026-01-11 15:29:00+00', '2026-01-11 16:28:10+00', 11.0, 3550, 5.38, 23, 46, 'red', 5.9),
-  ('986eee51-2f23-477d-8775-51d8b0f3f983', 'aaaaaaaa-0007-0007-0007-000000000007', '2026-01-11', '2026-01-11 07:50:00+00', '2026-01-11 09:07:14+00', 11.31, 4634, 6.83, 15, 45, 'red', 24.1),
-  ('844ca25e-be65-424f-b063-0cec21f6b3be', 'aaaaaaaa-0037-0037-0037-000000000037', '2026-01-11', '2026-01-11 10:38:00+00', '2026-01-11 11:26:54+00', 9.61, 2934, 5.09, 11, 33, 'red', 6.5),
-  ('ad5be388-9e3f-4c9b-bc82-18882db00669', 'aaaaaaaa-0020-0020-0020-000000000020', '2026-01-11', '2026-01-11 18:25:00+00', '2026-01-11 18:34:46+00', 2.15, 586, 4.55, 2, 4, 'red', 18.4),
-  ('2767263d-846c-4c89-89f7-2f102d524360', 'aaaaaaaa-0078-0078-0078-000000000078', '2026-01-11', '2026-01-11 07:30:00+00', '2026-01-11 07:45:25+00', 2.0, 925, 7.71, 5, 5, 'blue', 22.6),
-  ('40ef9108-4869-4caa-8534-74637f9fdf42', 'aaaaaaaa-0069-0069-0069-000000000069', '2026-01-11', '2026-01-11 18:53:00+00', '2026-01-11 20:20:00+00', 12.87, 5220, 6.76, 25, 75, 'blue', 3.4),
-  ('f3f73874-8a27-4f7c-94d6-bdea18ee3bc3', 'aaaaaaaa-0098-0098-0098-000000000098', '2026-01-11', '2026-01-11 14:08:00+00', '2026-01-11 15:27:38+00', 12.93, 4778, 6.16, 31, 62, 'purple', 12.6),
-  ('3bab7751-5221-4ad1-8fee-a5b8938ab38e', 'aaaaaaaa-0014-0014-0014-000000000014', '2026-01-11', '2026-01-11 10:19:00+00', '2026-01-11 11:58:23+00', 14.2, 5963, 7.0, 26, 52, 'red', 11.6),
-  ('80fea694-a825-4b1e-9b82-ddca41475655', 'aaaaaaaa-0036-0036-0036-000000000036', '2026-01-11', '2026-01-11 06:17:00+00', '2026-01-11 07:08:21+00', 11.07, 3081, 4.64, 15, 60, 'red', 6.7),
-  ('2334bc5b-e080-487f-adf5-80773afc03d7', 'aaaaaaaa-0034-0034-0034-000000000034', '2026-01-11', '2026-01-11 08:18:00+00', '2026-01-11 09:13:57+00', 10.95, 3357, 5.11, 11, 44, 'red', 14.3),
-  ('4d9b84d8-9acd-44b4-883e-962614abdc84', 'aaaaaaaa-0070-0070-0070-000000000070', '2026-01-11', '2026-01-11 18:54:00+00', '2026-01-11 19:24:39+00', 4.89, 1839, 6.27, 9, 18, 'blue', 22.9),
-  ('0706e95d-61ff-4dcb-91a7-d2730b3439c1', 'aaaaaaaa-0051-0051-0051-000000000051', '2026-01-11', '2026-01-11 14:21:00+00', '2026-01-11 15:16:35+00', 8.08, 3335, 6.88, 14, 42, 'blue', 11.5),
-  ('a147ebac-126b-491e-b718-9a8602994dcb', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-01-11', '2026-01-11 18:02:00+00', '2026-01-11 18:17:24+00', 2.53, 924, 6.09, 6, 12, 'blue', 21.5),
-  ('eeb5f166-5d59-4cd2-ac69-b58896bb725e', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-01-11', '2026-01-11 09:11:00+00', '2026-01-11 09:40:35+00', 6.39, 1775, 4.63, 10, 30, 'blue', 18.5),
-  ('95e87ace-836c-4c9a-a8f6-1056cf4f8d0f', 'aaaaaaaa-0029-0029-0029-000000000029', '2026-01-11', '2026-01-11 05:54:00+00', '2026-01-11 07:02:57+00', 11.55, 4137, 5.97, 17, 51, 'red', 22.5),
-  ('3c3cbe0e-704c-4799-a842-78860ac79246', 'aaaaaaaa-0004-0004-0004-000000000004', '2026-01-11', '2026-01-11 08:35:00+00', '2026-01-11 09:34:36+00', 10.72, 3576, 5.56, 12, 48, 'red', 6.0),
-  ('92a554b9-09c7-481b-87e1-e3cdc398a957', 'aaaaaaaa-0097-0097-0097-000000000097', '2026-01-11', '2026-01-11 17:37:00+00', '2026-01-11 18:04:50+00', 4.0, 1670, 6.96, 10, 10, 'purple', 24.2),
-  ('5fffb0b8-d120-4b6b-9abb-3585ef9c35f3', 'aaaaaaaa-0022-0022-0022-000000000022', '2026-01-11', '2026-01-11 17:38:00+00', '2026-01-11 18:04:44+00', 5.8, 1604, 4.61, 6, 6, 'red', 18.8),
-  ('cc56ea69-1b24-4abb-834f-117b72d54f4b', 'aaaaaaaa-0091-0091-0091-000000000091', '2026-01-11', '2026-01-11 21:47:00+00', '2026-01-11 22:15:54+00', 4.34, 1734, 6.66, 7, 21, 'purple', 21.0),
-  ('f11a9fa6-6112-4129-8570-a3c313523988', 'aaaaaaaa-0090-0090-0090-000000000090', '2026-01-11', '2026-01-11 06:59:00+00', '2026-01-11 08:21:19+00', 12.09, 4939, 6.81, 20, 40, 'purple', 8.4),
-  ('a096c3ae-f200-4813-aab1-90ffebdf4313', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-01-11', '2026-01-11 09:33:00+00', '2026-01-11 10:22:26+00', 9.79, 2966, 5.05, 10, 40, 'red', 16.9),
-  ('e12ff09a-6b37-4e6c-b222-45a1a0bc744c', 'aaaaaaaa-0026-0026-0026-000000000026', '2026-01-11', '2026-01-11 21:08:00+00', '2026-01-11 22:04:09+00', 8.6, 3369, 6.53, 10, 10, 'red', 10.5),
-  ('50f1a595-25f5-489e-9bda-261965eb7fa3', 'aaaaaaaa-0072-0072-0072-000000000072', '2026-01-11', '2026-01-11 12:00:00+00', '2026-01-11 13:09:02+00', 12.93, 4142, 5.34, 27, 54, 'blue', 5.6),
-  ('cb6999ea-f764-41fc-938b-5dc5bafbd518', 'aaaaaaaa-0023-0023-0023-000000000023', '2026-01-11', '2026-01-11 14:02:00+00', '2026-01-11 14:35:33+00', 4.37, 2013, 7.68, 3, 6, 'red', 15.5),
-  ('feaba850-95a8-406a-b751-99802c52fd55', 'aaaaaaaa-0003-0003-0003-000000000003', '2026-01-11', '2026-01-11 20:15:00+00', '2026-01-11 20:49:44+00', 6.58, 2084, 5.28, 11, 44, 'red', 19.8),
-  ('0a056d7b-872d-4a6b-b370-a5c8dc432275', 'aaaaaaaa-0066-0066-0066-000000000066', '2026-01-11', '2026-01-11 10:08:00+00', '2026-01-11 10:55:45+00', 8.73, 2865, 5.47, 16, 32, 'blue', 18.7),
-  ('4fa9364d-aa69-4217-a953-372558c7c5f7', 'aaaaaaaa-0052-0052-0052-000000000052', '2026-01-11', '2026-01-11 18:00:00+00', '2026-01-11 19:31:50+00', 11.73, 5510, 7.83, 17, 34, 'blue', 7.1),
-  ('73fcc530-1a53-4700-96c9-a2d4adc2441c', 'aaaaaaaa-0061-0061-0061-000000000061', '2026-01-11', '2026-01-11 17:00:00+00', '2026-01-11 17:31:40+00', 5.91, 1900, 5.36, 4, 4, 'blue', 14.6),
-  ('8f537e31-cc91-45ed-b6e3-ce3d6b5c47ee', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-01-11', '2026-01-11 12:54:00+00', '2026-01-11 13:12:10+00', 2.38, 1090, 7.64, 5, 10, 'purple', 9.4),
-  ('b31c00ae-7c19-4ea9-a645-1b4f0b157674', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-01-11', '2026-01-11 20:20:00+00', '2026-01-11 20:33:23+00', 2.44, 803, 5.49, 3, 9, 'blue', 23.6),
-  ('eebcbda8-e8b6-48d5-96f6-83c3df38bbdb', 'aaaaaaaa-0035-0035-0035-000000000035', '2026-01-11', '2026-01-11 14:58:00+00', '2026-01-11 15:24:44+00', 3.98, 1604, 6.72, 4, 8, 'red', 15.0),
-  ('08756a72-7742-42c7-b9c9-e1a4d5b15135', 'aaaaaaaa-0000-0000-0000-000000000000', '2026-01-11', '2026-01-11 12:01:00+00', '2026-01-11 12:15:20+00', 2.15, 860, 6.67, 3, 9, 'red', 18.6),
-  ('d2852f3a-80c8-4dad-9241-b6080dce1494', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-01-11', '2026-01-11 15:30:00+00', '2026-01-11 16:28:20+00', 9.41, 3500, 6.2, 11, 44, 'red', 12.4),
-  ('0e35d6a1-ad5d-4866-a6a0-5281e09698b5', 'aaaaaaaa-0056-0056-0056-000000000056', '2026-01-11', '2026-01-11 12:04:00+00', '2026-01-11 12:32:38+00', 3.99, 1718, 7.18, 4, 8, 'blue', 23.1),
-  ('f20f4d7a-646a-469b-9616-68078cb3a949', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-01-11', '2026-01-11 06:12:00+00', '2026-01-11 07:17:14+00', 10.54, 3914, 6.19, 16, 64, 'red', 16.6),
-  ('915a8c3a-8984-4e73-808d-ddd930231ae2', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-01-11', '2026-01-11 12:20:00+00', '2026-01-11 12:50:13+00', 5.88, 1813, 5.14, 3, 6, 'red', 9.5),
-  ('3e99b883-5290-45ac-8b85-ebcc3f038460', 'aaaaaaaa-0043-0043-0043-000000000043', '2026-01-11', '2026-01-11 13:45:00+00', '2026-01-11 15:39:33+00', 14.82, 6873, 7.73, 27, 54, 'blue', 22.5),
-  ('0de50dcc-1a03-4249-813c-2023556f6032', 'aaaaaaaa-0025-0025-0025-000000000025', '2026-01-11', '2026-01-11 17:43:00+00', '2026-01-11 18:55:50+00', 12.41, 4370, 5.87, 16, 48, 'red', 11.0),
-  ('753fee7c-cdc2-42f7-8d11-31ee678861e2', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-01-11', '2026-01-11 20:02:00+00', '2026-01-11 21:38:00+00', 14.33, 5760, 6.7, 21, 63, 'blue', 18.3),
-  ('e480380b-f054-4476-82f1-5fbc849635f0', 'aaaaaaaa-0031-0031-0031-000000000031', '2026-01-11', '2026-01-11 08:38:00+00', '2026-01-11 09:23:17+00', 9.76, 2717, 4.64, 13, 13, 'red', 17.9),
-  ('d3085223-2481-42a7-a4c6-a03c44b47abe', 'aaaaaaaa-0074-0074-0074-000000000074', '2026-01-11', '2026-01-11 13:26:00+00', '2026-01-11 14:14:32+00', 10.53, 2912, 4.61, 14, 42, 'blue', 24.9),
-  ('4f6e3333-65ba-4fbc-9e31-4eb8b6671639', 'aaaaaaaa-0065-0065-0065-000000000065', '2026-01-11', '2026-01-11 12:27:00+00', '2026-01-11 13:50:01+00', 13.39, 4981, 6.2, 14, 28, 'blue', 11.5),
-  ('385e419c-928e-4095-bd9a-5b8fbf71aea9', 'aaaaaaaa-0027-0027-0027-000000000027', '2026-01-11', '2026-01-11 17:02:00+00', '2026-01-11 18:16:07+00', 12.78, 4447, 5.8, 22, 44, 'red', 5.8),
-  ('d410d77f-c771-458a-9651-4f71d87bd9bf', 'aaaaaaaa-0080-0080-0080-000000000080', '2026-01-11', '2026-01-11 13:40:00+00', '2026-01-11 13:58:30+00', 2.64, 1110, 7.01, 6, 12, 'purple', 12.5),
-  ('7848474d-8590-4c34-91de-6f188b037eb9', 'aaaaaaaa-0084-0084-0084-000000000084', '2026-01-11', '2026-01-11 10:38:00+00', '2026-01-11 11:26:12+00', 9.68, 2892, 4.98, 23, 23, 'purple', 10.0),
-  ('e9b1b00d-4b08-4d94-a474-7b44d20a7ad6', 'aaaaaaaa-0049-0049-0049-000000000049', '2026-01-11', '2026-01-11 16:12:00+00', '2026-01-11 17:23:27+00', 12.32, 4287, 5.8, 16, 16, 'blue', 5.7),
-  ('b619b517-8fb9-4b8a-9c14-c47cd6d1384a', 'aaaaaaaa-0028-0028-0028-000000000028', '2026-01-11', '2026-01-11 08:43:00+00', '2026-01-11 09:34:25+00', 10.85, 3085, 4.74, 18, 36, 'red', 8.1),
-  ('96ce9a84-4f8f-484f-86b2-6d236e9d7a69', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-01-11', '2026-01-11 12:47:00+00', '2026-01-11 14:13:58+00', 12.55, 5218, 6.93, 20, 20, 'blue', 24.7),
-  ('7031961f-2e67-48fc-89ee-730ec34e3534', 'aaaaaaaa-0045-0045-0045-000000000045', '2026-01-11', '2026-01-11 12:48:00+00', '2026-01-11 14:10:19+00', 11.02, 4939, 7.47, 16, 32, 'blue', 20.6),
-  ('1d8961e0-0856-4e2b-b1f4-f5b3ca0689df', 'aaaaaaaa-0071-0071-0071-000000000071', '2026-01-11', '2026-01-11 15:41:00+00', '2026-01-11 16:05:17+00', 4.13, 1457, 5.88, 4, 4, 'blue', 20.7),
-  ('531e12f3-8f7d-4462-aace-24746d3524fc', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-01-11', '2026-01-11 21:17:00+00', '2026-01-11 21:36:04+00', 3.83, 1144, 4.98, 6, 12, 'red', 18.1),
-  ('d21d7d8d-ebc2-4039-b177-dfc9b07d7318', 'aaaaaaaa-0063-0063-0063-000000000063', '2026-01-11', '2026-01-11 06:58:00+00', '2026-01-11 07:28:26+00', 5.81, 1826, 5.24, 5, 10, 'blue', 9.5),
-  ('3e9a774c-7055-4246-be9c-919167cd74a6', 'aaaaaaaa-0041-0041-0041-000000000041', '2026-01-12', '2026-01-12 09:23:00+00', '2026-01-12 09:38:09+00', 2.24, 909, 6.77, 1, 2, 'blue', 12.6),
-  ('575bb01b-6adb-47d2-b277-0bb89b599d02', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-01-12', '2026-01-12 07:16:00+00', '2026-01-12 07:58:23+00', 9.4, 2543, 4.51, 5, 15, 'blue', 23.4),
-  ('02dbad79-d3bc-41e9-98f5-00b24389dab0', 'aaaaaaaa-0072-0072-0072-000000000072', '2026-01-12', '2026-01-12 15:14:00+00', '2026-01-12 16:22:09+00', 9.78, 4089, 6.97, 6, 18, 'blue', 12.4),
-  ('52f0ae74-2a99-4cbe-84a1-28de7e3de0dc', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-01-12', '2026-01-12 19:47:00+00', '2026-01-12 20:10:46+00', 5.27, 1426, 4.51, 12, 36, 'purple', 4.6),
-  ('15bea504-9727-40a3-a8d8-4aab5988befb', 'aaaaaaaa-0077-0077-0077-000000000077', '2026-01-12', '2026-01-12 14:29:00+00', '2026-01-12 15:22:10+00', 8.55, 3190, 6.22, 6, 12, 'blue', 21.6),
-  ('67bab707-e486-47c5-903a-6745c0ed2e48', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-01-12', '2026-01-12 15:22:00+00', '2026-01-12 16:38:17+00', 11.72, 4577, 6.51, 8, 16, 'blue', 14.8),
-  ('66b6c8ab-580c-4956-9387-6af0ed296ad8', 'aaaaaaaa-0008-0008-0008-000000000008', '2026-01-12', '2026-01-12 08:09:00+00', '2026-01-12 09:45:47+00', 13.71, 5807, 7.06, 31, 93, 'red', 18.1),
-  ('ebae83e2-eea1-4e3b-a25b-fd79c1098290', 'aaaaaaaa-0025-0025-0025-000000000025', '2026-01-12', '2026-01-12 05:32:00+00', '2026-01-12 05:55:06+00', 4.28, 1386, 5.4, 7, 28, 'red', 9.7),
-  ('570cfcd6-9c54-4047-8743-cd44e7e2f5ab', 'aaaaaaaa-0070-0070-0070-000000000070', '2026-01-12', '2026-01-12 20:38:00+00', '2026-01-12 22:07:45+00', 12.08, 5385, 7.43, 13, 39, 'blue', 21.1),
-  ('c1341ae9-e6bb-46c2-b750-02253e0beb4d', 'aaaaaaaa-0028-0028-0028-000000000028', '2026-01-12', '2026-01-12 20:19:00+00', '2026-01-12 21:20:55+00', 8.3, 3715, 7.46, 14, 56, 'red', 21.1),
-  ('2befe1b4-dee2-41f6-bc31-b2fb698e3ef6', 'aaaaaaaa-0015-0015-0015-000000000015', '2026-01-12', '2026-01-12 14:34:00+00', '2026-01-12 16:31:23+00', 14.84, 7043, 7.91, 20, 80, 'red', 3.3),
-  ('faf3c429-2a77-44d0-a10c-480ece4725a3', 'aaaaaaaa-0003-0003-0003-000000000003', '2026-01-12', '2026-01-12 12:41:00+00', '2026-01-12 13:25:18+00', 7.68, 2658, 5.77, 7, 14, 'red', 11.0),
-  ('72f1242d-8b23-4d96-826b-3ed5e3cfa2d8', 'aaaaaaaa-0000-0000-0000-000000000000', '2026-01-12', '2026-01-12 16:52:00+00', '2026-01-12 17:52:52+00', 11.96, 3652, 5.09, 12, 48, 'red', 22.6),
-  ('78f48f94-bd58-4061-a9fb-e5412b184814', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-01-12', '2026-01-12 12:30:00+00', '2026-01-12 13:05:53+00', 6.42, 2153, 5.59, 10, 10, 'blue', 16.7),
-  ('02881516-f194-4d9a-a47d-16f52e950573', 'aaaaaaaa-0036-0036-0036-000000000036', '2026-01-12', '2026-01-12 15:31:00+00', '2026-01-12 16:41:30+00', 10.83, 4230, 6.51, 12, 12, 'red', 3.8),
-  ('bcc1ef57-1718-4e8d-b62c-fb3474e2a1c8', 'aaaaaaaa-0031-0031-0031-000000000031', '2026-01-12', '2026-01-12 08:59:00+00', '2026-01-12 10:02:24+00', 9.83, 3804, 6.45, 10, 20, 'red', 9.7),
-  ('ed4a54b6-17e3-4a8a-8454-2bc31ba7fa35', 'aaaaaaaa-0027-0027-0027-000000000027', '2026-01-12', '2026-01-12 09:24:00+00', '2026-01-12 10:33:50+00', 10.21, 4190, 6.84, 7, 14, 'red', 3.6),
-  ('c31fe2e3-54f3-462d-91a0-fc9d1725407d', 'aaaaaaaa-0019-0019-0019-000000000019', '2026-01-12', '2026-01-12 12:47:00+00', '2026-01-12 13:57:07+00', 9.19, 4207, 7.63, 4, 16, 'red', 7.9),
-  ('7b46d697-b4ad-41a0-897a-4e581e7a9309', 'aaaaaaaa-0023-0023-0023-000000000023', '2026-01-12', '2026-01-12 16:08:00+00', '2026-01-12 16:24:55+00', 3.32, 1015, 5.1, 3, 3, 'red', 20.7),
-  ('f547f33e-466c-44c1-b049-99027ae71f1e', 'aaaaaaaa-0098-0098-0098-000000000098', '2026-01-12', '2026-01-12 19:07:00+00', '2026-01-12 20:12:44+00', 10.37, 3944, 6.34, 25, 75, 'purple', 16.6),
-  ('f24ec9ff-05cc-49bf-9686-5b50437a9e7a', 'aaaaaaaa-0082-0082-0082-000000000082', '2026-01-12', '2026-01-12 21:18:00+00', '2026-01-12 22:02:20+00', 6.22, 2660, 7.13, 11, 22, 'purple', 21.0),
-  ('e1b21e7c-173a-461b-8907-90f3d7268078', 'aaaaaaaa-0016-0016-0016-000000000016', '2026-01-12', '2026-01-12 20:32:00+00', '2026-01-12 21:14:55+00', 5.42, 2575, 7.92, 2, 4, 'red', 15.6),
-  ('a5c0f47c-536a-4256-817c-7c74cbfe2a56', 'aaaaaaaa-0063-0063-0063-000000000063', '2026-01-12', '2026-01-12 16:40:00+00', '2026-01-12 17:59:55+00', 10.6, 4795, 7.54, 22, 22, 'blue', 10.8),
-  ('df9f798d-abe4-43f5-8bfb-77b9db108311', 'aaaaaaaa-0057-0057-0057-000000000057', '2026-01-12', '2026-01-12 08:25:00+00', '2026-01-12 09:39:04+00', 11.61, 4444, 6.38, 24, 72, 'blue', 15.8),
-  ('0cd59be2-87ca-4ed0-9a22-7455e19af523', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-01-12', '2026-01-12 18:54:00+00', '2026-01-12 19:38:21+00', 9.34, 2661, 4.75, 12, 12, 'blue', 21.4),
-  ('55ea46e8-b6c1-4396-bd54-8d480ee27e08', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-01-12', '2026-01-12 09:08:00+00', '2026-01-12 10:28:52+00', 10.25, 4852, 7.89, 10, 10, 'blue', 19.5),
-  ('2f24c974-9734-4430-8fee-6d4c78dfe59b', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-01-12', '2026-01-12 12:49:00+00', '2026-01-12 14:14:57+00', 10.84, 5157, 7.93, 26, 26, 'purple', 8.9),
-  ('fcbdcd20-b83a-41cb-a657-2dd2f7d56b68', 'aaaaaaaa-0026-0026-0026-000000000026', '2026-01-12', '2026-01-12 05:11:00+00', '2026-01-12 06:13:06+00', 13.16, 3726, 4.72, 21, 63, 'red', 9.7),
-  ('c280cdc4-da93-48cc-bc94-df65b6ddfed3', 'aaaaaaaa-0009-0009-0009-000000000009', '2026-01-12', '2026-01-12 08:16:00+00', '2026-01-12 09:22:06+00', 11.66, 3966, 5.67, 21, 21, 'red', 4.4),
-  ('9d021f15-3cac-4fd3-8605-6d062b024211', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-01-12', '2026-01-12 07:19:00+00', '2026-01-12 08:31:33+00', 11.06, 4353, 6.56, 20, 20, 'blue', 14.6),
-  ('7cc1d2a6-cbea-44d7-91ae-a6b80000ac7d', 'aaaaaaaa-0064-0064-0064-000000000064', '2026-01-12', '2026-01-12 07:35:00+00', '2026-01-12 07:57:27+00', 4.68, 1347, 4.8, 6, 18, 'blue', 5.0),
-  ('563cf26e-a12a-4149-984c-505d88f06d3f', 'aaaaaaaa-0004-0004-0004-000000000004', '2026-01-12', '2026-01-12 11:00:00+00', '2026-01-12 11:36:57+00', 7.93, 2217, 4.66, 10, 20, 'red', 17.8),
-  ('1c23fb6f-5faf-4017-8063-7455d27418dd', 'aaaaaaaa-0086-0086-0086-000000000086', '2026-01-12', '2026-01-12 07:16:00+00', '2026-01-12 07:49:58+00', 7.26, 2038, 4.68, 13, 26, 'purple', 7.3),
-  ('1e20f176-bf97-45bc-b15f-f3cdd38c67d1', 'aaaaaaaa-0051-0051-0051-000000000051', '2026-01-12', '2026-01-12 10:42:00+00', '2026-01-12 11:22:24+00', 6.16, 2424, 6.56, 10, 10, 'blue', 6.1),
-  ('5d1c5c03-1ae6-4f8c-917d-24d511767f54', 'aaaaaaaa-0038-0038-0038-000000000038', '2026-01-12', '2026-01-12 11:14:00+00', '2026-01-12 11:38:52+00', 4.29, 1492, 5.8, 5, 5, 'red', 6.1),
-  ('3c4216cd-84ad-495a-b458-291446913966', 'aaaaaaaa-0061-0061-0061-000000000061', '2026-01-12', '2026-01-12 13:11:00+00', '2026-01-12 14:10:39+00', 10.34, 3579, 5.77, 16, 16, 'blue', 14.4),
-  ('1fcbc3ea-83c6-4ff9-bdc5-3adb277432cc', 'aaaaaaaa-0096-0096-0096-000000000096', '2026-01-12', '2026-01-12 21:03:00+00', '2026-01-12 22:25:24+00', 11.69, 4944, 7.05, 25, 75, 'purple', 15.8),
-  ('ebe1cd72-0e9d-4401-a3e3-84768ebb849d', 'aaaaaaaa-0074-0074-0074-000000000074', '2026-01-12', '2026-01-12 17:31:00+00', '2026-01-12 18:30:53+00', 10.05, 3593, 5.96, 19, 57, 'blue', 9.6),
-  ('cecb09e0-67d4-498c-aaee-2621f20ecf75', 'aaaaaaaa-0066-0066-0066-000000000066', '2026-01-12', '2026-01-12 08:25:00+00', '2026-01-12 09:35:28+00', 14.01, 4228, 5.03, 16, 16, 'blue', 5.3),
-  ('1c4c3fef-13d8-4129-8f29-2b4335bcca76', 'aaaaaaaa-0090-0090-0090-000000000090', '2026-01-12', '2026-01-12 17:11:00+00', '2026-01-12 18:37:03+00', 13.66, 5163, 6.3, 27, 54, 'purple', 7.3),
-  ('92ec7d03-c360-460b-9c80-470f410d7bfa', 'aaaaaaaa-0087-0087-0087-000000000087', '2026-01-12', '2026-01-12 11:25:00+00', '2026-01-12 11:58:54+00', 6.2, 2034, 5.47, 10, 10, 'purple', 6.2),
-  ('2ec1cb72-bd08-4983-ba70-6f2fb8a27510', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-01-12', '2026-01-12 06:48:00+00', '2026-01-12 07:56:40+00', 12.67, 4120, 5.42, 30, 90, 'red', 21.6),
-  ('69fcb179-d5af-423c-9212-73a4c70cf264', 'aaaaaaaa-0035-0035-0035-000000000035', '2026-01-12', '2026-01-12 06:54:00+00', '2026-01-12 07:55:10+00', 11.81, 3670, 5.18, 19, 19, 'red', 8.1),
-  ('11adce77-3420-494b-a8fd-5badaf8e1f02', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-01-12', '2026-01-12 11:16:00+00', '2026-01-12 12:02:16+00', 6.05, 2776, 7.65, 10, 10, 'purple', 6.6),
-  ('5a668310-da80-4be5-bca7-1a5992b2ec2d', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-01-12', '2026-01-12 07:50:00+00', '2026-01-12 08:50:33+00', 8.53, 3633, 7.1, 13, 13, 'purple', 10.2),
-  ('aceeb6f3-3dac-4c22-95af-3ad9b47d29e9', 'aaaaaaaa-0089-0089-0089-000000000089', '2026-01-12', '2026-01-12 07:49:00+00', '2026-01-12 08:32:58+00', 8.44, 2638, 5.21, 9, 27, 'purple', 6.0),
-  ('e82848c0-004f-4373-8244-db283e5f005a', 'aaaaaaaa-0024-0024-0024-000000000024', '2026-01-12', '2026-01-12 10:24:00+00', '2026-01-12 11:37:55+00', 14.08, 4435, 5.25, 24, 96, 'red', 12.6),
-  ('d857ea87-3aa5-42e6-86b2-925465770159', 'aaaaaaaa-0069-0069-0069-000000000069', '2026-01-12', '2026-01-12 09:40:00+00', '2026-01-12 09:58:21+00', 2.86, 1101, 6.42, 5, 5, 'blue', 20.9),
-  ('22dbcf4b-9414-43b2-a54b-5ca83c2d8fd2', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-01-12', '2026-01-12 05:23:00+00', '2026-01-12 06:04:39+00', 6.72, 2499, 6.2, 7, 7, 'red', 20.8),
-  ('9ffdc8d6-ec29-4fee-a9b7-5deffa1de4dc', 'aaaaaaaa-0021-0021-0021-000000000021', '2026-01-12', '2026-01-12 09:54:00+00', '2026-01-12 10:20:56+00', 3.38, 1616, 7.97, 3, 9, 'red', 18.4),
-  ('50d645a2-ad31-41c1-a856-7f8a3ba63e1f', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-01-12', '2026-01-12 13:51:00+00', '2026-01-12 15:21:19+00', 14.88, 5419, 6.07, 14, 14, 'red', 18.9),
-  ('755b372f-b5a1-4a52-aab0-55ac905e6a3e', 'aaaaaaaa-0020-0020-0020-000000000020', '2026-01-12', '2026-01-12 07:02:00+00', '2026-01-12 08:15:39+00', 11.88, 4419, 6.2, 13, 39, 'red', 14.8),
-  ('045ac43c-4b89-4a7a-bdf1-b7c3cb2b358b', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-01-12', '2026-01-12 05:57:00+00', '2026-01-12 07:10:40+00', 11.44, 4420, 6.44, 11, 11, 'red', 13.0),
-  ('80365f57-4aa0-4246-94b2-f4a047385937', 'aaaaaaaa-0049-0049-0049-000000000049', '2026-01-12', '2026-01-12 09:35:00+00', '2026-01-12 10:14:24+00', 5.9, 2364, 6.68, 13, 26, 'blue', 23.0),
-  ('bac2751d-1c8f-426c-b6ee-bc0b591d01b3', 'aaaaaaaa-0032-0032-0032-000000000032', '2026-01-12', '2026-01-12 05:43:00+00', '2026-01-12 05:54:51+00', 2.47, 711, 4.8, 1, 4, 'red', 14.2),
-  ('942c8ba0-317d-40f6-b730-e96999e37dc1', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-01-12', '2026-01-12 12:14:00+00', '2026-01-12 13:45:34+00', 14.94, 5494, 6.13, 36, 72, 'purple', 15.9),
-  ('6167ee7c-05bd-4d67-bb19-8c8e3f3c3e49', 'aaaaaaaa-0093-0093-0093-000000000093', '2026-01-12', '2026-01-12 05:32:00+00', '2026-01-12 06:15:01+00', 7.88, 2581, 5.46, 8, 24, 'purple', 12.8),
-  ('2c95ede5-b3be-4454-97b9-53b680cf13ff', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-01-12', '2026-01-12 09:57:00+00', '2026-01-12 10:31:51+00', 5.64, 2091, 6.18, 11, 33, 'blue', 11.8),
-  ('a43f2eb3-c785-4bf0-acf8-4803b77217f2', 'aaaaaaaa-0018-0018-0018-000000000018', '2026-01-12', '2026-01-12 15:20:00+00', '2026-01-12 15:47:33+00', 5.26, 1653, 5.24, 6, 18, 'red', 14.3),
-  ('fc9793f5-6f7a-4831-8738-59a33695e29e', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-01-12', '2026-01-12 16:11:00+00', '2026-01-12 17:10:22+00', 7.96, 3562, 7.46, 12, 36, 'red', 15.9),
-  ('f3627f7c-8d1d-48c0-a1ac-ee615d9386cf', 'aaaaaaaa-0052-0052-0052-000000000052', '2026-01-12', '2026-01-12 11:30:00+00', '2026-01-12 13:15:19+00', 14.1, 6319, 7.47, 27, 54, 'blue', 10.1),
-  ('28a03055-8e04-4fc0-b6cb-02d840681bad', 'aaaaaaaa-0030-0030-0030-000000000030', '2026-01-12', '2026-01-12 10:45:00+00', '2026-01-12 12:22:38+00', 13.16, 5858, 7.42, 20, 20, 'red', 11.7),
-  ('2320d42f-2304-4433-b8fe-fafd49fa0877', 'aaaaaaaa-0044-0044-0044-000000000044', '2026-01-12', '2026-01-12 19:29:00+00', '2026-01-12 20:23:29+00', 9.56, 3269, 5.7, 17, 51, 'blue', 5.2),
-  ('4bd30835-7777-4b40-a936-58f08818000c', 'aaaaaaaa-0080-0080-0080-000000000080', '2026-01-12', '2026-01-12 20:35:00+00', '2026-01-12 22:03:36+00', 13.91, 5316, 6.37, 29, 58, 'purple', 4.7),
-  ('416b71ec-c60b-4975-8d57-8105f54c195c', 'aaaaaaaa-0043-0043-0043-000000000043', '2026-01-12', '2026-01-12 20:40:00+00', '2026-01-12 20:58:28+00', 2.71, 1108, 6.82, 5, 10, 'blue', 20.5),
-  ('8f821ad8-aa76-4c79-9a73-c3c13f8acaa0', 'aaaaaaaa-0084-0084-0084-000000000084', '2026-01-12', '2026-01-12 07:05:00+00', '2026-01-12 08:15:36+00', 9.11, 4236, 7.75, 16, 32, 'purple', 3.5),
-  ('e070fbca-2b91-4e5e-b816-837733c3246c', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-01-12', '2026-01-12 16:38:00+00', '2026-01-12 17:06:46+00', 5.72, 1726, 5.03, 8, 32, 'red', 9.9),
-  ('608e897d-012d-4183-89ab-735ce3b97922', 'aaaaaaaa-0064-0064-0064-000000000064', '2026-01-13', '2026-01-13 20:11:00+00', '2026-01-13 21:33:25+00', 14.09, 4945, 5.85, 28, 84, 'blue', 13.3),
-  ('7ce9672b-5562-4e4b-a2b8-ea661c668a22', 'aaaaaaaa-0048-0048-0048-000000000048', '2026-01-13', '2026-01-13 19:54:00+00', '2026-01-13 20:45:49+00', 9.76, 3109, 5.31, 9, 27, 'blue', 10.0),
-  ('f11f4bb3-8e9f-49e6-8156-4801ac24cc42', 'aaaaaaaa-0098-0098-0098-000000000098', '2026-01-13', '2026-01-13 18:12:00+00', '2026-01-13 19:29:51+00', 13.4, 4671, 5.81, 21, 63, 'purple', 22.0),
-  ('930f475e-e24b-4afc-9a8b-692d5b2af54b', 'aaaaaaaa-0078-0078-0078-000000000078', '2026-01-13', '2026-01-13 13:08:00+00', '2026-01-13 13:17:45+00', 2.06, 585, 4.74, 4, 12, 'blue', 6.0),
-  ('e425fc42-1fbd-4a00-93d9-886d3b729a59', 'aaaaaaaa-0026-0026-0026-000000000026', '2026-01-13', '2026-01-13 14:57:00+00', '2026-01-13 15:34:56+00', 7.04, 2276, 5.39, 14, 42, 'red', 24.2),
-  ('8000c7ac-8bdc-4656-89ca-5b3c44d0f788', 'aaaaaaaa-0016-0016-0016-000000000016', '2026-01-13', '2026-01-13 17:07:00+00', '2026-01-13 18:05:58+00', 7.65, 3538, 7.71, 16, 48, 'red', 5.9),
-  ('a425d95f-ec79-4645-bc16-5e0fe9df5417', 'aaaaaaaa-0061-0061-0061-000000000061', '2026-01-13', '2026-01-13 11:53:00+00', '2026-01-13 12:52:18+00', 8.18, 3558, 7.25, 16, 48, 'blue', 14.7),
-  ('210eec3a-04a0-43e7-a024-b890243cbba2', 'aaaaaaaa-0068-0068-0068-000000000068', '2026-01-13', '2026-01-13 15:24:00+00', '2026-01-13 16:03:48+00', 6.29, 2388, 6.33, 11, 33, 'blue', 17.4),
-  ('066326ea-8d28-43c8-bc74-4f03922e5cc4', 'aaaaaaaa-0091-0091-0091-000000000091', '2026-01-13', '2026-01-13 08:27:00+00', '2026-01-13 08:54:37+00', 5.66, 1657, 4.88, 11, 33, 'purple', 21.5),
-  ('1b0605f4-912f-4569-acc8-653e26ddebae', 'aaaaaaaa-0033-0033-0033-000000000033', '2026-01-13', '2026-01-13 16:37:00+00', '2026-01-13 16:55:33+00', 3.21, 1113, 5.78, 4, 16, 'red', 23.4),
-  ('9f0ffc22-c86c-417a-8679-34e8e3ebab52', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-01-13', '2026-01-13 17:25:00+00', '2026-01-13 18:38:07+00', 11.57, 4387, 6.32, 18, 36, 'red', 17.6),
-  ('c76f38af-7602-4f76-8565-fd37cb7f63a7', 'aaaaaaaa-0062-0062-0062-000000000062', '2026-01-13', '2026-01-13 12:16:00+00', '2026-01-13 13:07:03+00', 10.57, 3063, 4.83, 19, 57, 'blue', 22.9),
-  ('4893505e-667e-4d90-bdf1-63c03a13f4cd', 'aaaaaaaa-0084-0084-0084-000000000084', '2026-01-13', '2026-01-13 20:08:00+00', '2026-01-13 20:49:11+00', 6.12, 2471, 6.73, 13, 39, 'purple', 20.8),
-  ('9fcd9bdb-4e6b-43e8-88bf-43373f14c0f0', 'aaaaaaaa-0070-0070-0070-000000000070', '2026-01-13', '2026-01-13 11:56:00+00', '2026-01-13 13:36:43+00', 13.52, 6043, 7.45, 20, 40, 'blue', 17.1),
-  ('3a278678-6ed6-4e52-8486-8658d35f7951', 'aaaaaaaa-0025-0025-0025-000000000025', '2026-01-13', '2026-01-13 09:10:00+00', '2026-01-13 10:00:35+00', 10.81, 3035, 4.68, 20, 60, 'red', 19.3),
-  ('e7bb2974-1a62-4287-85bf-51693fee989f', 'aaaaaaaa-0063-0063-0063-000000000063', '2026-01-13', '2026-01-13 05:01:00+00', '2026-01-13 06:46:25+00', 14.17, 6325, 7.44, 16, 32, 'blue', 23.8),
-  ('c53eb8ef-d05d-4647-b195-eb5a9d9e1b6e', 'aaaaaaaa-0052-0052-0052-000000000052', '2026-01-13', '2026-01-13 07:52:00+00', '2026-01-13 08:34:29+00', 8.55, 2549, 4.97, 7, 14, 'blue', 10.7),
-  ('cc3944ab-39e1-4bcf-9737-cb48c0ab3ddc', 'aaaaaaaa-0043-0043-0043-000000000043', '2026-01-13', '2026-01-13 09:49:00+00', '2026-01-13 10:17:14+00', 5.28, 1694, 5.35, 5, 10, 'blue', 22.7),
-  ('c9b44f90-18a9-4149-acd1-d64f6436d00a', 'aaaaaaaa-0072-0072-0072-000000000072', '2026-01-13', '2026-01-13 15:17:00+00', '2026-01-13 16:05:51+00', 8.74, 2931, 5.59, 8, 24, 'blue', 14.9),
-  ('9e4cda47-74aa-4d53-82c7-57509ef1a765', 'aaaaaaaa-0009-0009-0009-000000000009', '2026-01-13', '2026-01-13 06:03:00+00', '2026-01-13 06:26:33+00', 4.71, 1413, 5.0, 9, 9, 'red', 22.3),
-  ('7b2b4081-9d40-4aaa-86b3-1eb1960b008b', 'aaaaaaaa-0082-0082-0082-000000000082', '2026-01-13', '2026-01-13 12:49:00+00', '2026-01-13 14:03:43+00', 11.39, 4483, 6.56, 26, 26, 'purple', 14.6),
-  ('d665740c-06b4-4694-ba9e-e4523ddd23dd', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-01-13', '2026-01-13 11:43:00+00', '2026-01-13 12:20:53+00', 7.43, 2273, 5.1, 15, 30, 'purple', 23.2),
-  ('8425c632-a59a-490c-bb67-fc56e9f3fbbe', 'aaaaaaaa-0067-0067-0067-000000000067', '2026-01-13', '2026-01-13 11:26:00+00', '2026-01-13 12:31:04+00', 12.14, 3904, 5.36, 13, 39, 'blue', 22.0),
-  ('9860dc8c-40dc-477a-b117-06ac7fa18d0c', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-01-13', '2026-01-13 15:39:00+00', '2026-01-13 17:03:26+00', 14.05, 5066, 6.01, 27, 81, 'red', 14.6),
-  ('e13546fa-89dc-476e-a7ec-cce92b6d3d71', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-01-13', '2026-01-13 07:52:00+00', '2026-01-13 08:42:15+00', 8.2, 3015, 6.13, 12, 24, 'red', 12.5),
-  ('7f70846d-2c28-4d89-a9e6-2fa1c4427fac', 'aaaaaaaa-0012-0012-0012-000000000012', '2026-01-13', '2026-01-13 06:03:00+00', '2026-01-13 06:32:54+00', 3.81, 1794, 7.85, 6, 24, 'red', 22.0),
-  ('b1f6176f-a1fe-40d4-9e04-e7f7f6694a2f', 'aaaaaaaa-0074-0074-0074-000000000074', '2026-01-13', '2026-01-13 16:09:00+00', '2026-01-13 17:25:53+00', 13.35, 4613, 5.76, 17, 34, 'blue', 4.0),
-  ('3447d07c-4edb-4bc9-a183-dbc5c0df5ebb', 'aaaaaaaa-0035-0035-0035-000000000035', '2026-01-13', '2026-01-13 18:43:00+00', '2026-01-13 19:58:44+00', 14.94, 4544, 5.07, 23, 69, 'red', 21.7),
-  ('ed8ea1a1-8d80-47db-80c8-20e979385a25', 'aaaaaaaa-0003-0003-0003-000000000003', '2026-01-13', '2026-01-13 20:13:00+00', '2026-01-13 21:28:30+00', 12.1, 4530, 6.24, 16, 64, 'red', 4.1),
-  ('4ac8c418-820b-4c7b-883e-ac1498cb44b5', 'aaaaaaaa-0049-0049-0049-000000000049', '2026-01-13', '2026-01-13 12:55:00+00', '2026-01-13 13:39:50+00', 7.64, 2690, 5.87, 16, 32, 'blue', 9.6),
-  ('cef12228-48f7-4830-88de-7848836ac859', 'aaaaaaaa-0045-0045-0045-000000000045', '2026-01-13', '2026-01-13 05:15:00+00', '2026-01-13 06:43:13+00', 14.68, 5293, 6.01, 21, 42, 'blue', 16.1),
-  ('31ed9751-14d5-4ba7-a1db-c9457dec5182', 'aaaaaaaa-0020-0020-0020-000000000020', '2026-01-13', '2026-01-13 20:39:00+00', '2026-01-13 21:21:49+00', 9.31, 2569, 4.6, 14, 28, 'red', 12.3),
-  ('b6480344-666c-4950-973d-1a133d2f2e62', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-01-13', '2026-01-13 18:02:00+00', '2026-01-13 19:36:05+00', 13.16, 5645, 7.15, 15, 30, 'blue', 7.1),
-  ('cc48f58e-3250-4dfe-b4c1-f342f1fdf8a9', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-01-13', '2026-01-13 16:27:00+00', '2026-01-13 17:58:21+00', 12.38, 5481, 7.38, 14, 28, 'blue', 16.8),
-  ('460342c2-9600-4a82-819d-57dc7ec27c81', 'aaaaaaaa-0037-0037-0037-000000000037', '2026-01-13', '2026-01-13 15:02:00+00', '2026-01-13 16:23:22+00', 11.35, 4882, 7.17, 19, 57, 'red', 19.4),
-  ('01b0caac-7e0a-42ba-b17b-a59d7587811e', 'aaaaaaaa-0023-0023-0023-000000000023', '2026-01-13', '2026-01-13 09:35:00+00', '2026-01-13 10:54:02+00', 11.26, 4742, 7.02, 15, 15, 'red', 21.1),
-  ('a5aa5e30-161b-4690-9322-2810dc0ca231', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-01-13', '2026-01-13 07:07:00+00', '2026-01-13 07:37:05+00', 4.28, 1805, 7.03, 5, 15, 'blue', 5.4),
-  ('fae4ba18-4c0d-4d84-b8ab-2abf23cb70b4', 'aaaaaaaa-0028-0028-0028-000000000028', '2026-01-13', '2026-01-13 11:54:00+00', '2026-01-13 12:56:35+00', 11.34, 3755, 5.52, 10, 40, 'red', 3.5),
-  ('57f71295-9df9-4e8a-a922-11af0b5053df', 'aaaaaaaa-0087-0087-0087-000000000087', '2026-01-13', '2026-01-13 17:36:00+00', '2026-01-13 17:56:02+00', 4.1, 1202, 4.89, 10, 10, 'purple', 12.4),
-  ('1d2ce4bc-f97a-4654-a356-171b85320eba', 'aaaaaaaa-0066-0066-0066-000000000066', '2026-01-13', '2026-01-13 14:40:00+00', '2026-01-13 16:19:19+00', 13.7, 5959, 7.25, 19, 19, 'blue', 12.7),
-  ('d50278c6-7872-4f04-a57c-97e5351bf0ed', 'aaaaaaaa-0056-0056-0056-000000000056', '2026-01-13', '2026-01-13 09:15:00+00', '2026-01-13 09:45:29+00', 6.5, 1829, 4.69, 8, 24, 'blue', 16.1),
-  ('0e803195-1f9f-4271-a099-981ac7e80819', 'aaaaaaaa-0014-0014-0014-000000000014', '2026-01-13', '2026-01-13 17:33:00+00', '2026-01-13 18:51:24+00', 12.25, 4704, 6.4, 20, 20, 'red', 5.1),
-  ('4ab980ea-e40b-42a3-95e2-9abc97016370', 'aaaaaaaa-0093-0093-0093-000000000093', '2026-01-13', '2026-01-13 17:38:00+00', '2026-01-13 18:03:53+00', 3.58, 1553, 7.23, 8, 24, 'purple', 12.0),
-  ('e291a712-3bd8-4596-bfec-5c266e3d6640', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-01-13', '2026-01-13 06:01:00+00', '2026-01-13 06:16:22+00', 2.16, 922, 7.12, 1, 1, 'blue', 16.0),
-  ('02ac7d4e-4e91-4b2a-b9a3-0f103347c342', 'aaaaaaaa-0099-0099-0099-000000000099', '2026-01-13', '2026-01-13 11:29:00+00', '2026-01-13 12:00:32+00', 6.6, 1892, 4.78, 15, 15, 'purple', 18.4),
-  ('6f9e519e-56f7-4738-b8bb-23b3b8621bc5', 'aaaaaaaa-0004-0004-0004-000000000004', '2026-01-13', '2026-01-13 16:26:00+00', '2026-01-13 16:38:03+00', 2.08, 723, 5.8, 4, 12, 'red', 19.8),
-  ('0e758231-ba7a-4909-80b0-38fa72aeb7db', 'aaaaaaaa-0051-0051-0051-000000000051', '2026-01-13', '2026-01-13 12:01:00+00', '2026-01-13 12:50:20+00', 9.87, 2960, 5.0, 17, 34, 'blue', 11.7),
-  ('50baf1f3-d504-4411-9da5-aaef91a510b8', 'aaaaaaaa-0080-0080-0080-000000000080', '2026-01-13', '2026-01-13 11:00:00+00', '2026-01-13 11:42:36+00', 6.84, 2556, 6.23, 16, 16, 'purple', 13.1),
-  ('8eb02e0e-52bf-49cc-af1c-e99b78a00146', 'aaaaaaaa-0031-0031-0031-000000000031', '2026-01-13', '2026-01-13 11:56:00+00', '2026-01-13 12:36:19+00', 5.86, 2419, 6.88, 12, 48, 'red', 4.6),
-  ('8d882e0a-5392-4a27-a936-840338bfd664', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-01-13', '2026-01-13 13:04:00+00', '2026-01-13 14:19:52+00', 14.0, 4552, 5.42, 17, 34, 'red', 3.6),
-  ('2734f2da-a777-49dd-a6c6-2098be88c4fc', 'aaaaaaaa-0076-0076-0076-000000000076', '2026-01-13', '2026-01-13 09:32:00+00', '2026-01-13 09:45:55+00', 2.57, 835, 5.42, 5, 5, 'blue', 11.3),
-  ('d4736b4a-a823-4ae2-885a-5ad2111c4607', 'aaaaaaaa-0092-0092-0092-000000000092', '2026-01-13', '2026-01-13 19:33:00+00', '2026-01-13 19:57:58+00', 4.04, 1498, 6.18, 8, 24, 'purple', 14.4),
-  ('12d146c1-3d4a-4551-9413-0e2da47180b7', 'aaaaaaaa-0022-0022-0022-000000000022', '2026-01-13', '2026-01-13 07:31:00+00', '2026-01-13 08:43:28+00', 9.97, 4348, 7.27, 16, 64, 'red', 19.0),
-  ('664ee547-07ac-4dfe-8dd9-6ee3a0024dcd', 'aaaaaaaa-0058-0058-0058-000000000058', '2026-01-13', '2026-01-13 18:06:00+00', '2026-01-13 18:40:40+00', 4.75, 2080, 7.3, 10, 10, 'blue', 21.8),
-  ('cd75dd12-18ca-4b44-985d-9fd10adc118b', 'aaaaaaaa-0015-0015-0015-000000000015', '2026-01-13', '2026-01-13 20:04:00+00', '2026-01-13 20:45:26+00', 7.44, 2486, 5.57, 10, 10, 'red', 12.0),
-  ('9f8916af-964a-4e2a-8848-dff8fe633ffc', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-01-13', '2026-01-13 12:30:00+00', '2026-01-13 13:16:58+00', 7.54, 2818, 6.23, 16, 16, 'blue', 7.1),
-  ('7c3cc365-49b5-4ab2-9920-55e6d298e46b', 'aaaaaaaa-0057-0057-0057-000000000057', '2026-01-13', '2026-01-13 18:57:00+00', '2026-01-13 20:07:53+00', 10.74, 4253, 6.6, 18, 36, 'blue', 19.5),
-  ('e2af92db-337e-4369-89b4-87c85aa34794', 'aaaaaaaa-0085-0085-0085-000000000085', '2026-01-13', '2026-01-13 16:16:00+00', '2026-01-13 16:49:38+00', 4.33, 2018, 7.77, 10, 20, 'purple', 21.0),
-  ('b8aa063a-888e-4539-b75b-0959d716140a', 'aaaaaaaa-0097-0097-0097-000000000097', '2026-01-13', '2026-01-13 12:00:00+00', '2026-01-13 12:17:06+00', 3.27, 1026, 5.23, 7, 21, 'purple', 20.0),
-  ('56931be9-0273-4e8e-924a-2f114efa2efc', 'aaaaaaaa-0060-0060-0060-000000000060', '2026-01-14', '2026-01-14 13:15:00+00', '2026-01-14 14:11:31+00', 7.35, 3391, 7.69, 9, 27, 'blue', 7.1),
-  ('561e9220-8f80-49b3-930e-a86395a64ea5', 'aaaaaaaa-0076-0076-0076-000000000076', '2026-01-14', '2026-01-14 06:32:00+00', '2026-01-14 08:01:19+00', 12.51, 5359, 7.14, 17, 51, 'blue', 3.2),
-  ('b33090bd-6c24-43ca-9d72-4a080fb24cd3', 'aaaaaaaa-0051-0051-0051-000000000051', '2026-01-14', '2026-01-14 14:08:00+00', '2026-01-14 15:18:53+00', 13.82, 4253, 5.13, 14, 14, 'blue', 21.9),
-  ('f643e421-36f3-47ff-922e-c8ad967468ef', 'aaaaaaaa-0066-0066-0066-000000000066', '2026-01-14', '2026-01-14 13:13:00+00', '2026-01-14 13:50:54+00', 5.65, 2274, 6.71, 6, 6, 'blue', 6.3),
-  ('3c545756-2419-4e5f-a948-699ba0063753', 'aaaaaaaa-0084-0084-0084-000000000084', '2026-01-14', '2026-01-14 11:21:00+00', '2026-01-14 12:00:33+00', 8.14, 2373, 4.86, 18, 36, 'purple', 24.1),
-  ('c174227c-3f8b-49d1-a715-550df0cc3a4e', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-01-14', '2026-01-14 11:59:00+00', '2026-01-14 12:57:04+00', 12.68, 3484, 4.58, 21, 42, 'purple', 22.0),
-  ('0587dcf1-5fd4-4ef9-a6f3-50fa74354752', 'aaaaaaaa-0043-0043-0043-000000000043', '2026-01-14', '2026-01-14 08:29:00+00', '2026-01-14 08:59:38+00', 5.57, 1838, 5.5, 4, 12, 'blue', 19.1),
-  ('48a7e143-fb1c-4373-8941-9673a96447cf', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-01-14', '2026-01-14 08:24:00+00', '2026-01-14 09:47:08+00', 11.1, 4988, 7.49, 14, 42, 'blue', 3.5),
-  ('839761be-9444-464c-a829-842c5cb69fea', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-01-14', '2026-01-14 10:50:00+00', '2026-01-14 11:36:18+00', 8.39, 2778, 5.52, 19, 57, 'red', 15.4),
-  ('5183103f-b67a-4f5b-8c34-af48a09c0498', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-01-14', '2026-01-14 14:36:00+00', '2026-01-14 15:20:07+00', 9.29, 2647, 4.75, 18, 54, 'purple', 21.3),
-  ('f9e48ecd-1c11-41df-bc69-e196e1611ebe', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-01-14', '2026-01-14 17:38:00+00', '2026-01-14 18:14:52+00', 5.18, 2212, 7.12, 5, 10, 'blue', 21.9),
-  ('64794263-f109-4c33-b6cb-ef8be528797e', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-01-14', '2026-01-14 18:09:00+00', '2026-01-14 18:58:57+00', 6.34, 2997, 7.88, 9, 18, 'blue', 16.4),
-  ('8c5df4fe-7539-4c83-a58c-183ee67ff121', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-01-14', '2026-01-14 21:49:00+00', '2026-01-14 22:02:49+00', 2.67, 829, 5.18, 4, 8, 'purple', 12.3),
-  ('62d6a46e-2e87-449a-890a-0ad117bdb77c', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-01-14', '2026-01-14 09:24:00+00', '2026-01-14 10:33:33+00', 9.77, 4173, 7.12, 19, 76, 'red', 18.8),
-  ('cc8f653a-7b2b-4f40-83dd-04e3c9204d27', 'aaaaaaaa-0046-0046-0046-000000000046', '2026-01-14', '2026-01-14 15:08:00+00', '2026-01-14 15:38:27+00', 5.19, 1827, 5.87, 6, 18, 'blue', 14.8),
-  ('4f001b26-0fde-40d8-8b12-a694f49ac2bf', 'aaaaaaaa-0074-0074-0074-000000000074', '2026-01-14', '2026-01-14 07:04:00+00', '2026-01-14 08:16:00+00', 9.64, 4320, 7.47, 8, 16, 'blue', 12.8),
-  ('9235d33f-e7eb-46cf-9b92-f73432f7e7d1', 'aaaaaaaa-0068-0068-0068-000000000068', '2026-01-14', '2026-01-14 14:46:00+00', '2026-01-14 15:23:38+00', 6.12, 2258, 6.15, 9, 27, 'blue', 7.6),
-  ('6af1abcf-d3d1-4d3d-948f-f5ff39513006', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-01-14', '2026-01-14 19:01:00+00', '2026-01-14 19:29:59+00', 5.42, 1739, 5.35, 6, 12, 'blue', 24.6),
-  ('1c7943e7-cf62-4b63-ac61-a26bb8b394a1', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-01-14', '2026-01-14 21:31:00+00', '2026-01-14 22:56:16+00', 13.12, 5116, 6.5, 25, 100, 'red', 4.7),
-  ('0828f2f6-2985-4ee1-8e9b-d11abb45ff33', 'aaaaaaaa-0080-0080-0080-000000000080', '2026-01-14', '2026-01-14 15:17:00+00', '2026-01-14 16:15:38+00', 10.7, 3518, 5.48, 23, 23, 'purple', 13.2),
-  ('b683a3de-3289-4bab-a01d-310dc04ac040', 'aaaaaaaa-0035-0035-0035-000000000035', '2026-01-14', '2026-01-14 05:12:00+00', '2026-01-14 06:40:45+00', 12.9, 5325, 6.88, 23, 46, 'red', 16.7),
-  ('42995247-c781-4060-9922-d873bc9ea5b5', 'aaaaaaaa-0004-0004-0004-000000000004', '2026-01-14', '2026-01-14 11:58:00+00', '2026-01-14 12:31:55+00', 6.26, 2035, 5.42, 10, 10, 'red', 5.3),
-  ('c4abbff4-82bb-4632-9683-2ba028157698', 'aaaaaaaa-0071-0071-0071-000000000071', '2026-01-14', '2026-01-14 08:31:00+00', '2026-01-14 09:13:23+00', 6.76, 2543, 6.27, 10, 30, 'blue', 7.1),
-  ('03f157a2-5bb5-4694-9ff6-3bbcecd670c0', 'aaaaaaaa-0022-0022-0022-000000000022', '2026-01-14', '2026-01-14 06:46:00+00', '2026-01-14 07:37:41+00', 9.15, 3101, 5.65, 7, 7, 'red', 22.3),
-  ('c87691c1-85d9-4714-99b8-3e73c5b3209a', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-01-14', '2026-01-14 10:06:00+00', '2026-01-14 10:20:07+00', 2.72, 847, 5.19, 3, 9, 'red', 14.7),
-  ('57da75de-c9b5-4f42-8a9d-f6471b6d0e55', 'aaaaaaaa-0058-0058-0058-000000000058', '2026-01-14', '2026-01-14 06:12:00+00', '2026-01-14 07:34:58+00', 10.96, 4978, 7.57, 13, 13, 'blue', 15.6),
-  ('41048fac-f9fc-4483-a817-3aa10d5c9665', 'aaaaaaaa-0061-0061-0061-000000000061', '2026-01-14', '2026-01-14 14:42:00+00', '2026-01-14 14:57:27+00', 2.77, 927, 5.58, 3, 6, 'blue', 3.2),
-  ('570715dd-2bd6-4495-9834-0a81b2e0ae7d', 'aaaaaaaa-0024-0024-0024-000000000024', '2026-01-14', '2026-01-14 09:51:00+00', '2026-01-14 10:58:19+00', 11.98, 4039, 5.62, 21, 63, 'red', 11.9),
-  ('f167d868-60e6-4ded-8eea-9b8685232500', 'aaaaaaaa-0042-0042-0042-000000000042', '2026-01-14', '2026-01-14 11:10:00+00', '2026-01-14 12:18:47+00', 11.62, 4127, 5.92, 19, 57, 'blue', 6.1),
-  ('c02f44a5-304b-4cfe-abf8-bbd87df21783', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-01-14', '2026-01-14 08:09:00+00', '2026-01-14 08:27:07+00', 3.89, 1087, 4.66, 3, 12, 'red', 17.2),
-  ('954c6fd2-35d2-4c30-9f8b-efb88d33a0b6', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-01-14', '2026-01-14 15:02:00+00', '2026-01-14 15:49:45+00', 9.93, 2865, 4.81, 15, 45, 'blue', 10.4),
-  ('91acb971-b88c-4fa9-aebe-2158d8a476f7', 'aaaaaaaa-0097-0097-0097-000000000097', '2026-01-14', '2026-01-14 06:26:00+00', '2026-01-14 07:17:53+00', 11.33, 3113, 4.58, 27, 54, 'purple', 22.2),
-  ('667511fb-c39e-4381-934a-25afdc1a5185', 'aaaaaaaa-0065-0065-0065-000000000065', '2026-01-14', '2026-01-14 07:37:00+00', '2026-01-14 08:56:06+00', 10.41, 4746, 7.6, 13, 26, 'blue', 6.0),
-  ('e0e99f12-53d8-4f7d-b6e2-cd4ceb7d7629', 'aaaaaaaa-0008-0008-0008-000000000008', '2026-01-14', '2026-01-14 10:23:00+00', '2026-01-14 11:18:27+00', 11.25, 3327, 4.93, 19, 38, 'red', 13.1),
-  ('74ed3aff-fba4-48eb-a14b-9dd592674985', 'aaaaaaaa-0096-0096-0096-000000000096', '2026-01-14', '2026-01-14 12:30:00+00', '2026-01-14 14:04:01+00', 12.07, 5641, 7.79, 25, 75, 'purple', 14.8),
-  ('1891bab9-59bc-49aa-ba8b-a884afed30a8', 'aaaaaaaa-0026-0026-0026-000000000026', '2026-01-14', '2026-01-14 18:16:00+00', '2026-01-14 19:59:38+00', 14.66, 6218, 7.07, 25, 100, 'red', 15.6),
-  ('0bbb8c8f-c3a6-4cfa-9019-6c794b759a6a', 'aaaaaaaa-0027-0027-0027-000000000027', '2026-01-14', '2026-01-14 16:47:00+00', '2026-01-14 17:21:32+00', 6.35, 2072, 5.44, 7, 14, 'red', 11.9),
-  ('3da068e0-0cee-4966-8d36-8a3fbd73a19a', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-01-14', '2026-01-14 06:36:00+00', '2026-01-14 07:19:59+00', 8.56, 2639, 5.14, 17, 51, 'blue', 21.4),
-  ('eda613a8-6f2d-4cb0-a47f-b8ba3a4ad858', 'aaaaaaaa-0086-0086-0086-000000000086', '2026-01-14', '2026-01-14 18:56:00+00', '2026-01-14 20:09:01+00', 10.17, 4381, 7.18, 18, 36, 'purple', 12.6),
-  ('032b5710-de2c-4c6c-bba9-35e6a9bca83c', 'aaaaaaaa-0030-0030-0030-000000000030', '2026-01-14', '2026-01-14 09:31:00+00', '2026-01-14 09:42:50+00', 2.21, 710, 5.36, 2, 8, 'red', 6.4),
-  ('1e9967eb-85c3-499a-9cc6-3215e5bafbc9', 'aaaaaaaa-0012-0012-0012-000000000012', '2026-01-14', '2026-01-14 19:47:00+00', '2026-01-14 20:12:15+00', 3.77, 1515, 6.7, 6, 24, 'red', 19.5),
-  ('dec41a4b-65d8-4832-88d4-29a29c846d40', 'aaaaaaaa-0063-0063-0063-000000000063', '2026-01-14', '2026-01-14 21:17:00+00', '2026-01-14 22:26:51+00', 10.14, 4191, 6.89, 17, 34, 'blue', 20.7),
-  ('12250820-0bb2-4750-89e9-8f5cf895f4dd', 'aaaaaaaa-0028-0028-0028-000000000028', '2026-01-14', '2026-01-14 13:19:00+00', '2026-01-14 13:52:48+00', 5.75, 2028, 5.88, 10, 20, 'red', 12.8),
-  ('d68f17b7-560b-49c7-a467-b75d96975f3d', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-01-14', '2026-01-14 21:49:00+00', '2026-01-14 22:07:06+00', 3.25, 1086, 5.57, 4, 8, 'red', 20.2),
-  ('738b00b5-cce6-41aa-851c-58028152b559', 'aaaaaaaa-0099-0099-0099-000000000099', '2026-01-14', '2026-01-14 05:53:00+00', '2026-01-14 07:03:43+00', 10.37, 4243, 6.82, 16, 16, 'purple', 13.5),
-  ('3df97557-33d3-4d65-abf9-c634fd68ec23', 'aaaaaaaa-0044-0044-0044-000000000044', '2026-01-14', '2026-01-14 07:52:00+00', '2026-01-14 09:00:48+00', 9.57, 4128, 7.19, 17, 17, 'blue', 21.9),
-  ('f6d3b91d-c6ba-49aa-8404-1cf2acec5e90', 'aaaaaaaa-0067-0067-0067-000000000067', '2026-01-14', '2026-01-14 16:31:00+00', '2026-01-14 17:44:52+00', 13.63, 4432, 5.42, 25, 75, 'blue', 14.8),
-  ('22424fdb-1df2-481d-935a-803469f6a4d2', 'aaaaaaaa-0007-0007-0007-000000000007', '2026-01-14', '2026-01-14 08:35:00+00', '2026-01-14 09:39:59+00', 11.71, 3899, 5.55, 24, 72, 'red', 13.7),
-  ('223dea04-ace2-4088-8c9a-cc139c0da67f', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-01-14', '2026-01-14 19:22:00+00', '2026-01-14 19:58:45+00', 6.54, 2205, 5.62, 6, 6, 'blue', 10.5),
-  ('8e8eb3f1-bc60-48bd-82ca-c6a0470a7f87', 'aaaaaaaa-0077-0077-0077-000000000077', '2026-01-14', '2026-01-14 12:22:00+00', '2026-01-14 13:08:08+00', 10.01, 2768, 4.61, 14, 42, 'blue', 21.6),
-  ('967aadb6-fb99-42ee-882d-0addd4daefd4', 'aaaaaaaa-0014-0014-0014-000000000014', '2026-01-14', '2026-01-14 15:30:00+00', '2026-01-14 17:18:54+00', 14.98, 6534, 7.27, 23, 46, 'red', 13.7),
-  ('94c63fbe-43ff-425c-90e7-d3d5b96fe70a', 'aaaaaaaa-0045-0045-0045-000000000045', '2026-01-14', '2026-01-14 08:05:00+00', '2026-01-14 09:24:22+00', 11.26, 4762, 7.05, 16, 32, 'blue', 12.1),
-  ('31183383-0315-43b2-ad70-79db9209d5e6', 'aaaaaaaa-0018-0018-0018-000000000018', '2026-01-14', '2026-01-14 07:13:00+00', '2026-01-14 08:38:49+00', 12.53, 5149, 6.85, 18, 54, 'red', 24.1),
-  ('35b116a0-636e-49ab-976d-cfe65a9c5aa7', 'aaaaaaaa-0000-0000-0000-000000000000', '2026-01-14', '2026-01-14 13:24:00+00', '2026-01-14 14:06:22+00', 6.97, 2542, 6.08, 10, 10, 'red', 14.2),
-  ('c36d201d-462a-4030-9d0c-148881fe4b37', 'aaaaaaaa-0048-0048-0048-000000000048', '2026-01-14', '2026-01-14 05:26:00+00', '2026-01-14 06:20:27+00', 10.72, 3267, 5.08, 17, 51, 'blue', 23.8),
-  ('31b085bc-589b-436a-b142-7685bd03c635', 'aaaaaaaa-0070-0070-0070-000000000070', '2026-01-14', '2026-01-14 12:02:00+00', '2026-01-14 13:07:36+00', 10.6, 3936, 6.19, 12, 36, 'blue', 5.4),
-  ('8bd11ccf-e0bb-42e3-838b-e1f836dda493', 'aaaaaaaa-0019-0019-0019-000000000019', '2026-01-14', '2026-01-14 17:50:00+00', '2026-01-14 18:26:30+00', 4.94, 2190, 7.39, 7, 7, 'red', 6.6),
-  ('bc81b324-01d1-4c5f-9df1-873833af01ed', 'aaaaaaaa-0069-0069-0069-000000000069', '2026-01-14', '2026-01-14 10:25:00+00', '2026-01-14 12:05:57+00', 13.85, 6057, 7.29, 13, 26, 'blue', 15.5),
-  ('484dd789-7b3e-41fa-a0d5-837e19a99a1c', 'aaaaaaaa-0041-0041-0041-000000000041', '2026-01-14', '2026-01-14 17:36:00+00', '2026-01-14 18:37:37+00', 12.35, 3697, 4.99, 13, 26, 'blue', 5.5),
-  ('06246f9b-4b00-4951-ac44-2ad478d50088', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-01-14', '2026-01-14 21:40:00+00', '2026-01-14 22:13:25+00', 4.83, 2005, 6.92, 9, 27, 'red', 10.6),
-  ('2215cdba-e786-42f1-a522-2a5391c55bdb', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-01-14', '2026-01-14 17:16:00+00', '2026-01-14 18:15:18+00', 9.58, 3558, 6.19, 13, 13, 'blue', 15.7),
-  ('5eeecc85-5152-4e5f-81f7-ea1d4f37d668', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-01-14', '2026-01-14 19:43:00+00', '2026-01-14 20:30:56+00', 9.03, 2876, 5.31, 22, 44, 'purple', 17.0),
-  ('90e09210-5b49-4955-baad-d218ea4f8e2f', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-01-14', '2026-01-14 16:24:00+00', '2026-01-14 17:40:26+00', 10.26, 4586, 7.45, 21, 21, 'red', 21.5),
-  ('b8d12017-ba37-4f9e-9430-dbbb4b9e8c52', 'aaaaaaaa-0033-0033-0033-000000000033', '2026-01-14', '2026-01-14 14:51:00+00', '2026-01-14 15:03:48+00', 2.25, 768, 5.69, 4, 12, 'red', 9.4),
-  ('741fb52d-c2ed-490e-9f89-fb4e79b17580', 'aaaaaaaa-0049-0049-0049-000000000049', '2026-01-14', '2026-01-14 21:21:00+00', '2026-01-14 22:21:50+00', 8.21, 3650, 7.41, 12, 24, 'blue', 5.3),
-  ('8fc63822-5b5c-4d18-9471-5bf89846fa57', 'aaaaaaaa-0003-0003-0003-000000000003', '2026-01-14', '2026-01-14 18:04:00+00', '2026-01-14 18:47:42+00', 5.49, 2622, 7.96, 10, 20, 'red', 3.5),
-  ('928af4b3-83b4-4dcc-ad27-d68b3ede1bf7', 'aaaaaaaa-0016-0016-0016-000000000016', '2026-01-15', '2026-01-15 17:36:00+00', '2026-01-15 18:00:31+00', 4.62, 1471, 5.31, 5, 5, 'red', 18.1),
-  ('7c3a16e0-5df1-42df-bc2b-b963ac9ae284', 'aaaaaaaa-0052-0052-0052-000000000052', '2026-01-15', '2026-01-15 13:10:00+00', '2026-01-15 14:30:04+00', 14.8, 4804, 5.41, 21, 21, 'blue', 8.0),
-  ('4bf18bf9-006b-4694-8b98-238a29ba07b4', 'aaaaaaaa-0070-0070-0070-000000000070', '2026-01-15', '2026-01-15 17:01:00+00', '2026-01-15 17:53:48+00', 6.71, 3168, 7.87, 5, 15, 'blue', 22.9),
-  ('110608c3-27f1-466a-a379-32c268f294b9', 'aaaaaaaa-0060-0060-0060-000000000060', '2026-01-15', '2026-01-15 10:36:00+00', '2026-01-15 11:26:18+00', 10.82, 3018, 4.65, 10, 20, 'blue', 18.9),
-  ('df74f664-83c2-42aa-aff0-8371696e6fe6', 'aaaaaaaa-0004-0004-0004-000000000004', '2026-01-15', '2026-01-15 07:46:00+00', '2026-01-15 09:03:48+00', 12.63, 4668, 6.16, 22, 22, 'red', 17.7),
-  ('382b8678-bc07-4e3e-b562-cdf250be5217', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-01-15', '2026-01-15 11:12:00+00', '2026-01-15 12:29:59+00', 13.54, 4679, 5.76, 12, 24, 'blue', 11.1),
-  ('60367e8f-e4ab-4b21-a304-3e00c929d1a0', 'aaaaaaaa-0056-0056-0056-000000000056', '2026-01-15', '2026-01-15 05:27:00+00', '2026-01-15 05:44:07+00', 2.17, 1027, 7.89, 4, 8, 'blue', 14.2),
-  ('bf77a23c-e506-4e74-b6c1-0e689c274dfc', 'aaaaaaaa-0093-0093-0093-000000000093', '2026-01-15', '2026-01-15 07:17:00+00', '2026-01-15 07:29:41+00', 2.64, 761, 4.81, 6, 12, 'purple', 8.7),
-  ('bce6338a-6aea-4788-bdac-16efc57d1d96', 'aaaaaaaa-0058-0058-0058-000000000058', '2026-01-15', '2026-01-15 15:32:00+00', '2026-01-15 16:46:01+00', 11.64, 4441, 6.36, 11, 22, 'blue', 14.0),
-  ('543c228e-e4b6-417d-b262-3fc3769966f6', 'aaaaaaaa-0092-0092-0092-000000000092', '2026-01-15', '2026-01-15 10:01:00+00', '2026-01-15 10:32:29+00', 4.1, 1889, 7.68, 10, 30, 'purple', 10.6),
-  ('914cb415-9499-4dd4-91e1-90fab3a34bf7', 'aaaaaaaa-0076-0076-0076-000000000076', '2026-01-15', '2026-01-15 15:55:00+00', '2026-01-15 17:19:17+00', 13.75, 5057, 6.13, 10, 30, 'blue', 21.3),
-  ('a75b2fff-bbf4-48e0-8942-68046a56dc03', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-01-15', '2026-01-15 12:17:00+00', '2026-01-15 13:02:32+00', 5.96, 2732, 7.64, 3, 3, 'blue', 14.4),
-  ('0bc3b08d-8b0b-4813-839f-94f83f2b87ef', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-01-15', '2026-01-15 07:45:00+00', '2026-01-15 09:20:15+00', 14.07, 5715, 6.77, 4, 12, 'blue', 17.1),
-  ('4a2266f1-cb57-4dbb-8d4c-e69b4005eb46', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-01-15', '2026-01-15 15:39:00+00', '2026-01-15 17:30:41+00', 14.45, 6701, 7.73, 31, 62, 'red', 16.8),
-  ('f919cb9a-77d8-4301-affd-f9c351b82272', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-01-15', '2026-01-15 05:36:00+00', '2026-01-15 06:20:08+00', 7.42, 2648, 5.95, 16, 16, 'purple', 18.3),
-  ('798fc5e4-881c-4d85-8089-11b4f2c63a76', 'aaaaaaaa-0026-0026-0026-000000000026', '2026-01-15', '2026-01-15 19:32:00+00', '2026-01-15 19:51:40+00', 2.49, 1180, 7.9, 5, 10, 'red', 4.2),
-  ('52fce5a0-a331-4507-80c8-c0e27e2506ca', 'aaaaaaaa-0072-0072-0072-000000000072', '2026-01-15', '2026-01-15 17:37:00+00', '2026-01-15 18:39:16+00', 8.36, 3736, 7.45, 11, 11, 'blue', 18.5),
-  ('58522626-b207-4b7c-b771-6c539cca1663', 'aaaaaaaa-0085-0085-0085-000000000085', '2026-01-15', '2026-01-15 12:21:00+00', '2026-01-15 12:33:38+00', 2.25, 758, 5.62, 5, 10, 'purple', 7.7),
-  ('b362133a-4aa8-49c3-84f8-1755b832c094', 'aaaaaaaa-0098-0098-0098-000000000098', '2026-01-15', '2026-01-15 05:40:00+00', '2026-01-15 06:22:38+00', 7.94, 2558, 5.37, 17, 34, 'purple', 20.6),
-  ('abd7105f-4cf0-4770-b857-271838f93c73', 'aaaaaaaa-0018-0018-0018-000000000018', '2026-01-15', '2026-01-15 13:40:00+00', '2026-01-15 14:34:40+00', 9.41, 3280, 5.81, 17, 17, 'red', 18.7),
-  ('7a9746d0-495b-443f-afea-90450550d47b', 'aaaaaaaa-0048-0048-0048-000000000048', '2026-01-15', '2026-01-15 17:27:00+00', '2026-01-15 18:37:03+00', 14.97, 4203, 4.68, 25, 25, 'blue', 6.3),
-  ('aef288f9-5f46-4979-8210-eb5dbdce8a16', 'aaaaaaaa-0028-0028-0028-000000000028', '2026-01-15', '2026-01-15 19:29:00+00', '2026-01-15 20:32:12+00', 12.37, 3792, 5.11, 21, 84, 'red', 14.3),
-  ('b8e636b8-abe0-42c1-aa51-d2ca6a5f0cd3', 'aaaaaaaa-0063-0063-0063-000000000063', '2026-01-15', '2026-01-15 16:05:00+00', '2026-01-15 17:19:38+00', 13.4, 4478, 5.57, 23, 69, 'blue', 18.1),
-  ('573e1e62-829e-402c-b2c9-4a9db475c6b4', 'aaaaaaaa-0087-0087-0087-000000000087', '2026-01-15', '2026-01-15 08:43:00+00', '2026-01-15 09:44:08+00', 8.86, 3668, 6.9, 19, 57, 'purple', 23.5),
-  ('60399024-15fd-407f-91be-f69040115409', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-01-15', '2026-01-15 17:30:00+00', '2026-01-15 18:50:29+00', 10.69, 4829, 7.53, 11, 22, 'blue', 12.8),
-  ('526911fd-c55e-4ab6-835b-7440538b2e7c', 'aaaaaaaa-0023-0023-0023-000000000023', '2026-01-15', '2026-01-15 18:02:00+00', '2026-01-15 18:27:02+00', 5.42, 1502, 4.62, 11, 33, 'red', 12.6),
-  ('9f347dfc-c258-4148-b916-d85eba1e08d5', 'aaaaaaaa-0090-0090-0090-000000000090', '2026-01-15', '2026-01-15 15:48:00+00', '2026-01-15 16:31:29+00', 6.56, 2609, 6.63, 14, 28, 'purple', 11.0),
-  ('5ce4932f-9bd7-4274-827b-7fa942f65eb3', 'aaaaaaaa-0008-0008-0008-000000000008', '2026-01-15', '2026-01-15 15:18:00+00', '2026-01-15 16:23:34+00', 12.28, 3934, 5.34, 21, 21, 'red', 13.3),
-  ('cd3b0a58-81a4-4686-a6c5-59b93e9d2046', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-01-15', '2026-01-15 05:01:00+00', '2026-01-15 05:45:34+00', 9.67, 2674, 4.61, 17, 17, 'red', 24.9),
-  ('8d3b014c-2723-4411-8dd4-b3b012ad4042', 'aaaaaaaa-0007-0007-0007-000000000007', '2026-01-15', '2026-01-15 15:09:00+00', '2026-01-15 16:01:39+00', 9.54, 3159, 5.52, 8, 16, 'red', 9.9),
-  ('271b11b4-b8c3-4dd0-ac8e-97769e75f9f4', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-01-15', '2026-01-15 06:52:00+00', '2026-01-15 07:36:31+00', 7.88, 2671, 5.65, 12, 36, 'blue', 11.9),
-  ('63b7fa71-9995-4677-8de2-29ed30509b2a', 'aaaaaaaa-0030-0030-0030-000000000030', '2026-01-15', '2026-01-15 20:33:00+00', '2026-01-15 21:14:49+00', 5.41, 2509, 7.73, 8, 16, 'red', 21.7),
-  ('66d9e8a0-d448-4c89-8941-65860c5755eb', 'aaaaaaaa-0045-0045-0045-000000000045', '2026-01-15', '2026-01-15 17:12:00+00', '2026-01-15 18:18:10+00', 9.19, 3970, 7.2, 18, 36, 'blue', 13.7),
-  ('324e3d48-ac7c-476a-98af-4b093e772298', 'aaaaaaaa-0015-0015-0015-000000000015', '2026-01-15', '2026-01-15 15:54:00+00', '2026-01-15 16:55:09+00', 11.41, 3669, 5.36, 21, 42, 'red', 13.2),
-  ('2c8c6343-db43-425c-8b1d-63b32da8a3e0', 'aaaaaaaa-0099-0099-0099-000000000099', '2026-01-15', '2026-01-15 19:02:00+00', '2026-01-15 20:54:24+00', 14.32, 6744, 7.85, 30, 60, 'purple', 17.9),
-  ('3da288f8-f8e4-412b-9cd9-0ac89ba62490', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-01-15', '2026-01-15 19:20:00+00', '2026-01-15 20:10:45+00', 8.53, 3045, 5.95, 17, 17, 'blue', 15.6),
-  ('790bad42-577d-45f6-9f35-318f1464ec07', 'aaaaaaaa-0022-0022-0022-000000000022', '2026-01-15', '2026-01-15 10:27:00+00', '2026-01-15 11:32:11+00', 10.6, 3911, 6.15, 17, 34, 'red', 8.9),
-  ('ace7d312-f38a-4e97-9f36-1d212de28258', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-01-15', '2026-01-15 19:38:00+00', '2026-01-15 20:50:10+00', 11.87, 4330, 6.08, 15, 60, 'red', 8.1),
-  ('15724daa-cf31-4dfa-932f-fa5e6bd57664', 'aaaaaaaa-0042-0042-0042-000000000042', '2026-01-15', '2026-01-15 19:00:00+00', '2026-01-15 19:38:10+00', 5.9, 2290, 6.47, 9, 18, 'blue', 20.0),
-  ('82281ab2-a0bd-4a81-a291-1ec2efa3985f', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-01-15', '2026-01-15 13:14:00+00', '2026-01-15 14:25:30+00', 11.8, 4290, 6.06, 21, 42, 'blue', 23.9),
-  ('11fe2d19-5e26-44d7-a40d-46d65e384180', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-01-15', '2026-01-15 12:58:00+00', '2026-01-15 13:32:17+00', 5.02, 2057, 6.83, 6, 18, 'red', 14.4),
-  ('a7035f0a-6973-472b-ad1d-18f38d40bd9d', 'aaaaaaaa-0084-0084-0084-000000000084', '2026-01-15', '2026-01-15 17:45:00+00', '2026-01-15 18:00:42+00', 2.02, 942, 7.78, 5, 5, 'purple', 4.2),
-  ('5c0ec108-9870-43f1-8929-7d68123aeb0a', 'aaaaaaaa-0034-0034-0034-000000000034', '2026-01-15', '2026-01-15 21:31:00+00', '2026-01-15 21:55:27+00', 3.45, 1467, 7.09, 4, 12, 'red', 13.5),
-  ('e4177e31-34d9-4a15-ba98-78f62de8b8f9', 'aaaaaaaa-0041-0041-0041-000000000041', '2026-01-15', '2026-01-15 15:29:00+00', '2026-01-15 16:25:59+00', 11.33, 3419, 5.03, 20, 20, 'blue', 23.2),
-  ('ae3c8369-132d-4226-b836-3dee14de7e89', 'aaaaaaaa-0071-0071-0071-000000000071', '2026-01-15', '2026-01-15 12:16:00+00', '2026-01-15 13:04:36+00', 9.9, 2916, 4.91, 15, 45, 'blue', 18.8),
-  ('9930c443-c4e9-4224-9cb6-e4bee144873a', 'aaaaaaaa-0080-0080-0080-000000000080', '2026-01-15', '2026-01-15 19:12:00+00', '2026-01-15 20:17:17+00', 10.6, 3917, 6.16, 23, 69, 'purple', 21.5),
-  ('c9249f16-d731-433e-9edf-26fc50f37d98', 'aaaaaaaa-0032-0032-0032-000000000032', '2026-01-16', '2026-01-16 15:58:00+00', '2026-01-16 16:50:20+00', 7.34, 3140, 7.13, 13, 26, 'red', 14.6),
-  ('58fea30c-9a88-403f-a820-dbf16610a944', 'aaaaaaaa-0098-0098-0098-000000000098', '2026-01-16', '2026-01-16 10:20:00+00', '2026-01-16 11:26:33+00', 10.13, 3993, 6.57, 20, 20, 'purple', 12.1),
-  ('b63dfbce-cfbe-42f2-a17a-3423f95283d1', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-01-16', '2026-01-16 14:50:00+00', '2026-01-16 15:19:19+00', 4.41, 1759, 6.65, 7, 7, 'purple', 19.8),
-  ('07300277-0ee9-4385-b3e1-8682dfa489ca', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-01-16', '2026-01-16 05:13:00+00', '2026-01-16 06:30:02+00', 14.62, 4622, 5.27, 18, 54, 'blue', 12.4),
-  ('9cea5611-804f-4465-8c67-8eb2ee3edac5', 'aaaaaaaa-0080-0080-0080-000000000080', '2026-01-16', '2026-01-16 19:58:00+00', '2026-01-16 20:19:54+00', 3.89, 1314, 5.63, 5, 5, 'purple', 9.5),
-  ('c59af04e-185a-4dd3-916c-63f513af0938', 'aaaaaaaa-0065-0065-0065-000000000065', '2026-01-16', '2026-01-16 14:46:00+00', '2026-01-16 15:50:01+00', 12.36, 3841, 5.18, 18, 54, 'blue', 21.3),
-  ('e4ffec4c-cf76-42c1-ab7d-61afd1f09d87', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-01-16', '2026-01-16 09:11:00+00', '2026-01-16 10:19:07+00', 13.05, 4087, 5.22, 30, 90, 'red', 3.7),
-  ('87f100d5-abc6-42ef-bf60-93f6f0519f15', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-01-16', '2026-01-16 13:53:00+00', '2026-01-16 14:03:05+00', 2.03, 605, 4.97, 3, 12, 'red', 4.4),
-  ('3b923cb7-a7c3-4112-bdce-4146ed5cbecf', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-01-16', '2026-01-16 11:26:00+00', '2026-01-16 12:30:49+00', 10.75, 3889, 6.03, 21, 21, 'red', 18.8),
-  ('7b203f81-5a63-4978-88f0-1ddec8d52961', 'aaaaaaaa-0029-0029-0029-000000000029', '2026-01-16', '2026-01-16 11:42:00+00', '2026-01-16 11:55:00+00', 2.14, 780, 6.08, 3, 3, 'red', 5.8),
-  ('8902336e-2b5b-4229-80eb-11d3821329fa', 'aaaaaaaa-0000-0000-0000-000000000000', '2026-01-16', '2026-01-16 18:45:00+00', '2026-01-16 19:12:39+00', 5.53, 1659, 5.0, 8, 8, 'red', 21.0),
-  ('70e18de8-22ec-41b8-8cfb-3a1b040c669e', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-01-16', '2026-01-16 17:16:00+00', '2026-01-16 17:51:14+00', 7.15, 2114, 4.93, 5, 20, 'red', 21.5),
-  ('1de711b8-1d6e-4ee2-9dcf-e551fba55b15', 'aaaaaaaa-0086-0086-0086-000000000086', '2026-01-16', '2026-01-16 18:39:00+00', '2026-01-16 19:22:01+00', 9.54, 2581, 4.51, 20, 20, 'purple', 18.1),
-  ('1955c522-a804-4928-a1b9-4f76fa6fc09b', 'aaaaaaaa-0071-0071-0071-000000000071', '2026-01-16', '2026-01-16 14:31:00+00', '2026-01-16 15:36:51+00', 9.45, 3951, 6.97, 14, 42, 'blue', 5.2),
-  ('dac1992c-a124-4977-8074-a2235e0b92df', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-01-16', '2026-01-16 05:45:00+00', '2026-01-16 07:01:20+00', 14.94, 4580, 5.11, 31, 93, 'purple', 10.5),
-  ('06f7ce94-eab9-481c-9d29-db4704a4bacf', 'aaaaaaaa-0092-0092-0092-000000000092', '2026-01-16', '2026-01-16 19:55:00+00', '2026-01-16 21:08:00+00', 11.87, 4380, 6.15, 11, 11, 'purple', 21.4),
-  ('857a357f-cd20-48e6-a36e-e171c449f828', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-01-16', '2026-01-16 08:49:00+00', '2026-01-16 09:26:41+00', 5.25, 2261, 7.18, 6, 6, 'purple', 18.0),
-  ('c297f03f-60be-4948-b894-e750809237db', 'aaaaaaaa-0024-0024-0024-000000000024', '2026-01-16', '2026-01-16 05:43:00+00', '2026-01-16 06:10:13+00', 4.67, 1633, 5.83, 8, 16, 'red', 14.5),
-  ('c8ad6240-724c-4b99-a08b-001707b4761c', 'aaaaaaaa-0067-0067-0067-000000000067', '2026-01-16', '2026-01-16 05:30:00+00', '2026-01-16 07:02:39+00', 14.85, 5559, 6.24, 28, 28, 'blue', 11.6),
-  ('c63e0774-7e72-401e-b324-bd33726fbc07', 'aaaaaaaa-0038-0038-0038-000000000038', '2026-01-16', '2026-01-16 09:24:00+00', '2026-01-16 09:57:19+00', 5.08, 1999, 6.56, 10, 40, 'red', 16.5),
-  ('916bffb2-fe7c-400e-a071-8d598ae01d76', 'aaaaaaaa-0048-0048-0048-000000000048', '2026-01-16', '2026-01-16 18:42:00+00', '2026-01-16 20:01:52+00', 10.32, 4792, 7.74, 13, 26, 'blue', 9.3),
-  ('85c160e5-86ba-4130-b062-2b5d00cbce94', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-01-16', '2026-01-16 09:35:00+00', '2026-01-16 11:10:17+00', 14.82, 5717, 6.43, 21, 42, 'blue', 11.3),
-  ('b9a15dd4-af88-4f4b-8bf8-a4e5879d2fd6', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-01-16', '2026-01-16 06:12:00+00', '2026-01-16 06:57:26+00', 6.33, 2726, 7.18, 14, 42, 'purple', 19.0),
-  ('d64544aa-65f6-46c9-a419-af1521debf33', 'aaaaaaaa-0087-0087-0087-000000000087', '2026-01-16', '2026-01-16 16:22:00+00', '2026-01-16 16:40:54+00', 3.82, 1134, 4.95, 8, 16, 'purple', 8.9),
-  ('9eb914a8-17d8-442c-a2b4-242c90b85daf', 'aaaaaaaa-0051-0051-0051-000000000051', '2026-01-16', '2026-01-16 17:06:00+00', '2026-01-16 18:33:41+00', 11.03, 5261, 7.95, 14, 28, 'blue', 3.9),
-  ('906d1b45-24c0-4a86-bda4-a6b8299110fb', 'aaaaaaaa-0061-0061-0061-000000000061', '2026-01-16', '2026-01-16 20:26:00+00', '2026-01-16 21:36:08+00', 13.78, 4208, 5.09, 9, 9, 'blue', 6.3),
-  ('ced733dd-6a1f-4317-9048-2b4e7476c348', 'aaaaaaaa-0016-0016-0016-000000000016', '2026-01-16', '2026-01-16 08:11:00+00', '2026-01-16 09:18:59+00', 13.15, 4079, 5.17, 28, 84, 'red', 18.9),
-  ('905db08b-ba38-4ce6-837c-941e2f225e0f', 'aaaaaaaa-0025-0025-0025-000000000025', '2026-01-16', '2026-01-16 10:58:00+00', '2026-01-16 11:11:04+00', 2.5, 784, 5.23, 4, 16, 'red', 21.7),
-  ('28a69c80-4594-4193-ba81-465a26c27182', 'aaaaaaaa-0027-0027-0027-000000000027', '2026-01-16', '2026-01-16 09:07:00+00', '2026-01-16 09:24:56+00', 3.49, 1076, 5.14, 6, 24, 'red', 4.6),
-  ('befb1b49-d077-4769-8266-c332fa0dec8e', 'aaaaaaaa-0009-0009-0009-000000000009', '2026-01-16', '2026-01-16 09:56:00+00', '2026-01-16 10:07:31+00', 2.03, 691, 5.68, 3, 3, 'red', 3.5),
-  ('2572873f-3f80-4616-8e22-036ae0164576', 'aaaaaaaa-0007-0007-0007-000000000007', '2026-01-16', '2026-01-16 10:57:00+00', '2026-01-16 11:17:41+00', 3.89, 1241, 5.32, 8, 32, 'red', 13.2),
-  ('ee816b23-80c5-4db8-946d-7435251b3961', 'aaaaaaaa-0033-0033-0033-000000000033', '2026-01-16', '2026-01-16 05:41:00+00', '2026-01-16 06:26:41+00', 9.12, 2741, 5.01, 11, 44, 'red', 11.8),
-  ('4c92afad-c456-4ed4-ba8c-d8951d93cebf', 'aaaaaaaa-0068-0068-0068-000000000068', '2026-01-16', '2026-01-16 13:26:00+00', '2026-01-16 14:21:56+00', 7.55, 3356, 7.41, 11, 33, 'blue', 8.8),
-  ('34096504-7581-4ada-92c5-75ce98e9d085', 'aaaaaaaa-0015-0015-0015-000000000015', '2026-01-16', '2026-01-16 21:50:00+00', '2026-01-16 22:27:41+00', 6.14, 2261, 6.14, 4, 8, 'red', 20.1),
-  ('2214a862-d0b8-4bc4-affc-cf3bc2a2e1fa', 'aaaaaaaa-0063-0063-0063-000000000063', '2026-01-16', '2026-01-16 09:35:00+00', '2026-01-16 11:28:22+00', 14.86, 6802, 7.63, 24, 48, 'blue', 18.1),
-  ('0a92c60b-4a4a-4961-b8f3-c625aa6163bf', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-01-16', '2026-01-16 06:30:00+00', '2026-01-16 07:28:05+00', 10.9, 3485, 5.33, 12, 36, 'blue', 11.2),
-  ('504d4755-cd40-4f72-8b4a-1eb34e05755f', 'aaaaaaaa-0031-0031-0031-000000000031', '2026-01-16', '2026-01-16 20:10:00+00', '2026-01-16 21:09:55+00', 12.75, 3595, 4.7, 22, 66, 'red', 8.0),
-  ('e962cfbe-eefe-49f0-8c36-cfa17696f4da', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-01-16', '2026-01-16 08:22:00+00', '2026-01-16 09:46:44+00', 10.92, 5084, 7.76, 19, 38, 'blue', 8.1),
-  ('61a37265-2ede-4866-a3b1-18280dcd78cf', 'aaaaaaaa-0026-0026-0026-000000000026', '2026-01-16', '2026-01-16 21:03:00+00', '2026-01-16 22:06:30+00', 12.12, 3810, 5.24, 24, 24, 'red', 9.4),
-  ('89a6f704-6b71-48a6-9916-7434e905a1d3', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-01-16', '2026-01-16 18:13:00+00', '2026-01-16 18:48:00+00', 4.75, 2100, 7.37, 5, 15, 'blue', 10.4),
-  ('743f4569-3f52-46ca-bf0f-0808e1917abe', 'aaaaaaaa-0057-0057-0057-000000000057', '2026-01-16', '2026-01-16 07:34:00+00', '2026-01-16 07:59:23+00', 4.37, 1523, 5.81, 5, 15, 'blue', 8.4),
-  ('a5f1cc27-a7fe-41a8-a6c3-1d1519d436f6', 'aaaaaaaa-0023-0023-0023-000000000023', '2026-01-16', '2026-01-16 19:46:00+00', '2026-01-16 20:22:04+00', 5.25, 2164, 6.87, 8, 8, 'red', 22.7),
-  ('0385a725-9e1f-407c-a49c-a690f61351d9', 'aaaaaaaa-0020-0020-0020-000000000020', '2026-01-16', '2026-01-16 17:00:00+00', '2026-01-16 18:14:47+00', 11.03, 4487, 6.78, 18, 54, 'red', 18.2),
-  ('25b9e4e0-51c5-48ec-b816-dfc4cf18f42f', 'aaaaaaaa-0046-0046-0046-000000000046', '2026-01-16', '2026-01-16 16:51:00+00', '2026-01-16 17:29:07+00', 5.83, 2287, 6.54, 11, 22, 'blue', 23.6),
-  ('f08908bb-22b0-462d-831b-da16e14c5c92', 'aaaaaaaa-0074-0074-0074-000000000074', '2026-01-16', '2026-01-16 15:18:00+00', '2026-01-16 15:46:40+00', 3.87, 1720, 7.41, 5, 10, 'blue', 7.0),
-  ('4e80da70-130c-41a8-82f4-132dcc51e5c3', 'aaaaaaaa-0004-0004-0004-000000000004', '2026-01-16', '2026-01-16 19:21:00+00', '2026-01-16 19:56:20+00', 5.62, 2120, 6.29, 2, 4, 'red', 22.4),
-  ('924c280e-0168-40bc-b832-7140b00dca6a', 'aaaaaaaa-0097-0097-0097-000000000097', '2026-01-16', '2026-01-16 05:42:00+00', '2026-01-16 06:32:10+00', 10.63, 3010, 4.72, 26, 52, 'purple', 18.4),
-  ('1ad512d5-c8a3-43a7-aa8d-f148dea1c0bc', 'aaaaaaaa-0008-0008-0008-000000000008', '2026-01-16', '2026-01-16 14:19:00+00', '2026-01-16 15:08:32+00', 7.45, 2972, 6.65, 11, 22, 'red', 14.4),
-  ('c314bb1b-bc4b-4b20-9a58-3fd2d1e32db5', 'aaaaaaaa-0052-0052-0052-000000000052', '2026-01-16', '2026-01-16 21:25:00+00', '2026-01-16 22:25:01+00', 7.94, 3601, 7.56, 13, 26, 'blue', 12.2),
-  ('7fe89b23-4855-4da8-954c-35693c465838', 'aaaaaaaa-0060-0060-0060-000000000060', '2026-01-16', '2026-01-16 13:24:00+00', '2026-01-16 14:03:36+00', 6.9, 2376, 5.74, 10, 30, 'blue', 10.2),
-  ('5fda64dc-7f05-4273-b813-24da0d3b45b9', 'aaaaaaaa-0049-0049-0049-000000000049', '2026-01-16', '2026-01-16 17:33:00+00', '2026-01-16 18:40:37+00', 9.66, 4057, 7.0, 10, 20, 'blue', 14.6),
-  ('1dc696e6-9283-446b-970c-9c820064842e', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-01-16', '2026-01-16 12:53:00+00', '2026-01-16 13:35:24+00', 7.67, 2544, 5.53, 18, 54, 'purple', 20.3),
-  ('3a090183-ee45-46f4-954f-986b56b09c97', 'aaaaaaaa-0035-0035-0035-000000000035', '2026-01-16', '2026-01-16 11:41:00+00', '2026-01-16 12:24:18+00', 5.49, 2598, 7.89, 11, 22, 'red', 24.0),
-  ('8bc7b8fa-b917-4f41-911e-0f17a51026ef', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-01-16', '2026-01-16 20:13:00+00', '2026-01-16 20:39:54+00', 3.68, 1614, 7.31, 5, 15, 'blue', 21.5),
-  ('aeb34cbf-7b47-49ca-a018-cd4b20ea946f', 'aaaaaaaa-0056-0056-0056-000000000056', '2026-01-16', '2026-01-16 10:50:00+00', '2026-01-16 11:03:46+00', 2.79, 826, 4.94, 2, 4, 'blue', 13.2),
-  ('22910e9e-084e-49f0-80a0-2930304bb53d', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-01-16', '2026-01-16 08:26:00+00', '2026-01-16 09:04:04+00', 5.31, 2284, 7.17, 8, 8, 'red', 24.4),
-  ('ba739344-ae7e-410c-8ccb-648fc98f4ad7', 'aaaaaaaa-0071-0071-0071-000000000071', '2026-01-17', '2026-01-17 06:14:00+00', '2026-01-17 06:28:18+00', 2.41, 858, 5.94, 3, 9, 'blue', 17.0),
-  ('fdb53c76-2582-498f-b68e-83bf6d9fc7c6', 'aaaaaaaa-0068-0068-0068-000000000068', '2026-01-17', '2026-01-17 19:31:00+00', '2026-01-17 20:41:35+00', 13.17, 4235, 5.36, 19, 57, 'blue', 14.3),
-  ('5d428ab1-a49a-4eae-8bad-c33454a181c6', 'aaaaaaaa-0008-0008-0008-000000000008', '2026-01-17', '2026-01-17 15:36:00+00', '2026-01-17 16:05:47+00', 4.15, 1787, 7.18, 7, 28, 'red', 4.6),
-  ('09b350fd-3c28-4a3a-aa16-d3a916d27ec7', 'aaaaaaaa-0046-0046-0046-000000000046', '2026-01-17', '2026-01-17 16:10:00+00', '2026-01-17 16:51:59+00', 6.46, 2519, 6.5, 5, 5, 'blue', 24.5),
-  ('6f6c80f0-5ad2-42e3-b244-271c4ee80ef0', 'aaaaaaaa-0074-0074-0074-000000000074', '2026-01-17', '2026-01-17 13:29:00+00', '2026-01-17 14:23:24+00', 10.97, 3264, 4.96, 9, 27, 'blue', 21.8),
-  ('e0945565-94a7-4feb-a4c0-ba87fbf89af7', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-01-17', '2026-01-17 10:37:00+00', '2026-01-17 11:06:10+00', 4.63, 1750, 6.3, 3, 3, 'blue', 20.0),
-  ('70b7bc1d-2aa7-41be-ad1e-271007dbb410', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-01-17', '2026-01-17 15:37:00+00', '2026-01-17 16:10:09+00', 4.6, 1989, 7.21, 10, 20, 'purple', 8.1),
-  ('e44783f4-aab7-4b76-b730-7bba329b172d', 'aaaaaaaa-0036-0036-0036-000000000036', '2026-01-17', '2026-01-17 18:44:00+00', '2026-01-17 19:49:32+00', 9.39, 3932, 6.98, 17, 34, 'red', 9.2),
-  ('60dc6291-ebfa-4570-894c-42d0af74078c', 'aaaaaaaa-0051-0051-0051-000000000051', '2026-01-17', '2026-01-17 07:56:00+00', '2026-01-17 08:22:15+00', 4.29, 1575, 6.12, 5, 15, 'blue', 15.0),
-  ('0dbb2369-df61-4e8d-915f-cccb8901c79b', 'aaaaaaaa-0082-0082-0082-000000000082', '2026-01-17', '2026-01-17 11:12:00+00', '2026-01-17 12:09:34+00', 11.05, 3454, 5.21, 24, 72, 'purple', 4.8),
-  ('c4f5ba32-b746-476e-a191-281f8ea951e5', 'aaaaaaaa-0058-0058-0058-000000000058', '2026-01-17', '2026-01-17 07:39:00+00', '2026-01-17 08:27:33+00', 6.17, 2913, 7.87, 7, 21, 'blue', 19.0),
-  ('fd89f9b3-c61b-4e6a-bd33-bcbb9e0088a0', 'aaaaaaaa-0029-0029-0029-000000000029', '2026-01-17', '2026-01-17 12:17:00+00', '2026-01-17 12:38:56+00', 3.5, 1316, 6.27, 8, 8, 'red', 19.8),
-  ('073db651-5c26-432b-8d7a-98fa9db01b93', 'aaaaaaaa-0067-0067-0067-000000000067', '2026-01-17', '2026-01-17 11:48:00+00', '2026-01-17 13:05:56+00', 14.38, 4676, 5.42, 13, 13, 'blue', 11.1),
-  ('c4031966-5ab5-4dc9-b45b-aa3dabaa6ef8', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-01-17', '2026-01-17 10:13:00+00', '2026-01-17 11:40:14+00', 13.14, 5234, 6.64, 10, 10, 'blue', 21.9),
-  ('ba13a8f0-f7a2-4792-a1b6-58dd0ffbbb4e', 'aaaaaaaa-0043-0043-0043-000000000043', '2026-01-17', '2026-01-17 05:53:00+00', '2026-01-17 06:36:51+00', 5.88, 2631, 7.46, 5, 15, 'blue', 20.6),
-  ('54fb3678-c3cf-4b37-bfc8-26f2096d1e88', 'aaaaaaaa-0048-0048-0048-000000000048', '2026-01-17', '2026-01-17 17:56:00+00', '2026-01-17 18:44:58+00', 9.51, 2938, 5.15, 6, 6, 'blue', 14.5),
-  ('f5b92f2e-540e-4198-a370-23d272cb9cb5', 'aaaaaaaa-0077-0077-0077-000000000077', '2026-01-17', '2026-01-17 09:02:00+00', '2026-01-17 10:04:33+00', 9.31, 3753, 6.72, 7, 7, 'blue', 6.2),
-  ('491b776d-a653-4ba7-8701-2420e2c7cfb6', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-01-17', '2026-01-17 10:34:00+00', '2026-01-17 11:09:03+00', 7.2, 2103, 4.87, 14, 56, 'red', 10.3),
-  ('454cc3cb-edc2-4c69-b184-5c87d10def58', 'aaaaaaaa-0038-0038-0038-000000000038', '2026-01-17', '2026-01-17 05:55:00+00', '2026-01-17 06:14:23+00', 3.47, 1163, 5.59, 7, 28, 'red', 7.7),
-  ('2bef80c0-75df-4c4a-b078-c06ad8a69a36', 'aaaaaaaa-0035-0035-0035-000000000035', '2026-01-17', '2026-01-17 17:32:00+00', '2026-01-17 17:58:36+00', 4.58, 1596, 5.81, 7, 14, 'red', 5.0),
-  ('622e40b2-7a84-40b4-94a4-170054c7668c', 'aaaaaaaa-0065-0065-0065-000000000065', '2026-01-17', '2026-01-17 19:47:00+00', '2026-01-17 21:12:10+00', 14.61, 5110, 5.83, 12, 36, 'blue', 19.6),
-  ('d115709a-6c15-4009-b270-3fee3da77abc', 'aaaaaaaa-0033-0033-0033-000000000033', '2026-01-17', '2026-01-17 20:59:00+00', '2026-01-17 22:08:46+00', 13.34, 4186, 5.23, 25, 50, 'red', 20.6),
-  ('c51aae4f-a8a3-42cd-8adf-5d5739acc369', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-01-17', '2026-01-17 18:59:00+00', '2026-01-17 20:04:50+00', 9.42, 3950, 6.99, 9, 9, 'blue', 15.7),
-  ('036ca7eb-14fe-4907-b982-5404b8874014', 'aaaaaaaa-0063-0063-0063-000000000063', '2026-01-17', '2026-01-17 14:40:00+00', '2026-01-17 16:13:05+00', 11.65, 5585, 7.99, 13, 13, 'blue', 23.5),
-  ('2f0e3c36-3ea2-42c7-a001-7cc1cf9aa840', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-01-17', '2026-01-17 09:26:00+00', '2026-01-17 10:29:55+00', 10.53, 3835, 6.07, 24, 24, 'purple', 23.9),
-  ('e53bdf8d-be2c-4791-94c4-481eddab5871', 'aaaaaaaa-0026-0026-0026-000000000026', '2026-01-17', '2026-01-17 14:11:00+00', '2026-01-17 15:29:37+00', 13.51, 4717, 5.82, 23, 69, 'red', 17.0),
-  ('30303bfd-c604-4a51-a81c-743d5c62cf35', 'aaaaaaaa-0023-0023-0023-000000000023', '2026-01-17', '2026-01-17 06:39:00+00', '2026-01-17 07:42:59+00', 11.51, 3839, 5.56, 15, 60, 'red', 23.2),
-  ('58712def-cb33-44b4-afb5-0e9755f0c4da', 'aaaaaaaa-0022-0022-0022-000000000022', '2026-01-17', '2026-01-17 20:00:00+00', '2026-01-17 20:43:20+00', 7.32, 2600, 5.92, 11, 22, 'red', 19.0),
-  ('e38c2d7c-0a17-49a4-a776-95437867f257', 'aaaaaaaa-0009-0009-0009-000000000009', '2026-01-17', '2026-01-17 14:43:00+00', '2026-01-17 16:14:16+00', 12.82, 5476, 7.12, 17, 68, 'red', 21.5),
-  ('8af04c86-2d30-4dca-a5bd-202b5e91d4eb', 'aaaaaaaa-0020-0020-0020-000000000020', '2026-01-17', '2026-01-17 09:54:00+00', '2026-01-17 11:31:06+00', 13.23, 5826, 7.34, 7, 14, 'red', 11.7),
-  ('6a969bda-90d1-41f6-a834-e3bf13f72eac', 'aaaaaaaa-0092-0092-0092-000000000092', '2026-01-17', '2026-01-17 05:03:00+00', '2026-01-17 06:22:31+00', 11.66, 4771, 6.82, 26, 52, 'purple', 22.9),
-  ('286c6173-5992-48d4-a913-f6971b1bfe76', 'aaaaaaaa-0042-0042-0042-000000000042', '2026-01-17', '2026-01-17 12:51:00+00', '2026-01-17 13:56:19+00', 11.36, 3919, 5.75, 21, 21, 'blue', 21.4),
-  ('546610dd-baa4-4dea-83d2-f875648912a8', 'aaaaaaaa-0045-0045-0045-000000000045', '2026-01-17', '2026-01-17 11:12:00+00', '2026-01-17 11:42:37+00', 4.98, 1837, 6.15, 7, 14, 'blue', 19.9),
-  ('41cf2011-6365-4ef9-82c2-f5b16b819655', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-01-17', '2026-01-17 05:17:00+00', '2026-01-17 05:53:03+00', 5.03, 2163, 7.17, 8, 24, 'blue', 18.0),
-  ('4ccc7688-4613-43a1-927d-6d839a303700', 'aaaaaaaa-0056-0056-0056-000000000056', '2026-01-17', '2026-01-17 05:20:00+00', '2026-01-17 06:08:33+00', 8.04, 2913, 6.04, 13, 26, 'blue', 16.0),
-  ('a8b46df9-9385-49ef-bb78-3498c492c428', 'aaaaaaaa-0003-0003-0003-000000000003', '2026-01-17', '2026-01-17 06:14:00+00', '2026-01-17 06:37:26+00', 4.68, 1406, 5.01, 7, 14, 'red', 21.1),
-  ('5afc0527-a843-4dd7-870f-78e018de0f88', 'aaaaaaaa-0090-0090-0090-000000000090', '2026-01-17', '2026-01-17 19:14:00+00', '2026-01-17 20:19:26+00', 9.84, 3926, 6.65, 23, 46, 'purple', 16.4),
-  ('4677fed9-7821-4811-992e-f2aa0799c466', 'aaaaaaaa-0098-0098-0098-000000000098', '2026-01-17', '2026-01-17 14:00:00+00', '2026-01-17 15:32:42+00', 14.88, 5562, 6.23, 28, 56, 'purple', 13.4),
-  ('67df2026-6bb7-4d1c-b079-d5de12491895', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-01-17', '2026-01-17 06:03:00+00', '2026-01-17 06:32:49+00', 4.61, 1789, 6.47, 8, 8, 'blue', 10.0),
-  ('05264127-8c9b-4e83-8d7e-6f9cbcc98c9b', 'aaaaaaaa-0027-0027-0027-000000000027', '2026-01-17', '2026-01-17 11:46:00+00', '2026-01-17 12:15:32+00', 3.95, 1772, 7.48, 8, 32, 'red', 3.3),
-  ('69191e0e-63d9-490b-a231-ce24e88bff4d', 'aaaaaaaa-0057-0057-0057-000000000057', '2026-01-17', '2026-01-17 11:42:00+00', '2026-01-17 12:39:28+00', 11.16, 3448, 5.15, 21, 63, 'blue', 23.8),
-  ('7d2585a9-d456-4096-bca4-cc30b3c6f833', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-01-17', '2026-01-17 18:27:00+00', '2026-01-17 19:13:34+00', 8.1, 2794, 5.75, 15, 45, 'red', 11.0),
-  ('7f2b665b-ea2f-4ee6-9122-931c7c3322f1', 'aaaaaaaa-0015-0015-0015-000000000015', '2026-01-17', '2026-01-17 21:02:00+00', '2026-01-17 22:49:35+00', 14.5, 6455, 7.42, 23, 46, 'red', 8.6),
-  ('99f7c160-b974-4b79-a18d-b815c2242c16', 'aaaaaaaa-0085-0085-0085-000000000085', '2026-01-17', '2026-01-17 15:11:00+00', '2026-01-17 16:01:45+00', 7.14, 3045, 7.11, 11, 22, 'purple', 4.3),
-  ('ffae3c51-e71b-4f55-84b5-317db809c17d', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-01-17', '2026-01-17 07:11:00+00', '2026-01-17 08:28:02+00', 14.96, 4622, 5.15, 21, 84, 'red', 5.2),
-  ('1af17469-17e2-45d4-b6b4-78fb3a6688ad', 'aaaaaaaa-0016-0016-0016-000000000016', '2026-01-17', '2026-01-17 06:50:00+00', '2026-01-17 07:21:38+00', 4.31, 1898, 7.34, 5, 5, 'red', 4.0),
-  ('5eadc3f0-bc55-4a9c-9d2f-f2f82250bfae', 'aaaaaaaa-0070-0070-0070-000000000070', '2026-01-17', '2026-01-17 07:58:00+00', '2026-01-17 09:00:57+00', 12.77, 3777, 4.93, 24, 72, 'blue', 14.5),
-  ('74a0b0f9-355a-44bf-85fc-1685c42cd96d', 'aaaaaaaa-0037-0037-0037-000000000037', '2026-01-17', '2026-01-17 18:34:00+00', '2026-01-17 19:06:13+00', 6.87, 1933, 4.69, 11, 22, 'red', 19.4),
-  ('179c222d-68f2-4516-bbab-9e1e806013a3', 'aaaaaaaa-0052-0052-0052-000000000052', '2026-01-17', '2026-01-17 12:13:00+00', '2026-01-17 13:01:08+00', 7.69, 2888, 6.26, 10, 10, 'blue', 20.5),
-  ('8ffa8cef-4da6-4b35-96e8-b8fcf348a2f1', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-01-17', '2026-01-17 12:58:00+00', '2026-01-17 13:57:49+00', 12.57, 3589, 4.76, 14, 42, 'blue', 7.3),
-  ('a45b6c33-5c7e-4fd2-b93a-e55e32206c13', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-01-17', '2026-01-17 08:07:00+00', '2026-01-17 08:23:13+00', 2.77, 973, 5.86, 3, 6, 'red', 24.9),
-  ('bec58224-594f-4985-a1f8-51f449d34cbc', 'aaaaaaaa-0089-0089-0089-000000000089', '2026-01-17', '2026-01-17 08:54:00+00', '2026-01-17 09:37:00+00', 9.21, 2580, 4.67, 20, 60, 'purple', 17.2),
-  ('1e7f6a44-4333-4cd7-8cf9-612e3dea9bf2', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-01-17', '2026-01-17 16:01:00+00', '2026-01-17 16:15:46+00', 2.26, 886, 6.54, 4, 8, 'purple', 11.5),
-  ('42d1c9f8-36f5-413b-8806-582edde4c842', 'aaaaaaaa-0049-0049-0049-000000000049', '2026-01-17', '2026-01-17 07:44:00+00', '2026-01-17 08:15:07+00', 6.47, 1867, 4.81, 9, 27, 'blue', 6.1),
-  ('3ff555c0-6bb9-4bc7-92c3-d83b945d403a', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-01-18', '2026-01-18 09:50:00+00', '2026-01-18 10:32:44+00', 7.28, 2564, 5.87, 10, 10, 'red', 4.9),
-  ('228b4bfd-9755-4361-a9f2-75d0ddb75ff9', 'aaaaaaaa-0032-0032-0032-000000000032', '2026-01-18', '2026-01-18 11:05:00+00', '2026-01-18 12:30:01+00', 14.51, 5101, 5.86, 21, 42, 'red', 16.4),
-  ('3f79ba16-ba43-4773-827d-8376453665ab', 'aaaaaaaa-0004-0004-0004-000000000004', '2026-01-18', '2026-01-18 21:17:00+00', '2026-01-18 22:13:49+00', 11.32, 3409, 5.02, 11, 11, 'red', 6.3),
-  ('303bda9a-8593-4604-8be5-bcfc77a0a8ee', 'aaaaaaaa-0070-0070-0070-000000000070', '2026-01-18', '2026-01-18 05:51:00+00', '2026-01-18 06:31:38+00', 6.83, 2438, 5.95, 12, 24, 'blue', 10.2),
-  ('8131f906-aa13-4297-b4d7-0713507c8330', 'aaaaaaaa-0030-0030-0030-000000000030', '2026-01-18', '2026-01-18 11:43:00+00', '2026-01-18 13:29:20+00', 13.74, 6380, 7.74, 19, 76, 'red', 13.7),
-  ('4e7541f1-afd9-46f1-8afb-571b44a50916', 'aaaaaaaa-0034-0034-0034-000000000034', '2026-01-18', '2026-01-18 10:08:00+00', '2026-01-18 10:47:33+00', 6.32, 2373, 6.26, 6, 18, 'red', 12.9),
-  ('54bc2589-e324-41c6-893a-fde7142a83bf', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-01-18', '2026-01-18 17:45:00+00', '2026-01-18 18:38:42+00', 10.31, 3222, 5.21, 16, 32, 'blue', 5.6),
-  ('264862f4-6b12-46b2-bd84-aec1f3e23e93', 'aaaaaaaa-0072-0072-0072-000000000072', '2026-01-18', '2026-01-18 09:03:00+00', '2026-01-18 09:15:46+00', 2.58, 766, 4.95, 6, 18, 'blue', 15.0),
-  ('4d780b41-3b67-4749-96a5-2ac53e19e0c4', 'aaaaaaaa-0041-0041-0041-000000000041', '2026-01-18', '2026-01-18 09:37:00+00', '2026-01-18 10:33:43+00', 10.13, 3403, 5.6, 15, 30, 'blue', 4.6),
-  ('5c861d1c-27f9-42c2-8de2-192f5ab8ab90', 'aaaaaaaa-0033-0033-0033-000000000033', '2026-01-18', '2026-01-18 18:40:00+00', '2026-01-18 20:00:43+00', 12.25, 4843, 6.59, 22, 66, 'red', 23.5),
-  ('a1d43524-d0d1-4b99-adb9-74601ae68b05', 'aaaaaaaa-0035-0035-0035-000000000035', '2026-01-18', '2026-01-18 20:38:00+00', '2026-01-18 20:56:22+00', 2.89, 1102, 6.36, 5, 10, 'red', 14.1),
-  ('c9deed7c-73b1-4318-bcba-aa43a14604dc', 'aaaaaaaa-0092-0092-0092-000000000092', '2026-01-18', '2026-01-18 15:16:00+00', '2026-01-18 15:48:27+00', 5.32, 1947, 6.1, 13, 13, 'purple', 24.5),
-  ('b227fa57-a066-439d-b220-d35d6a9f0c22', 'aaaaaaaa-0045-0045-0045-000000000045', '2026-01-18', '2026-01-18 05:00:00+00', '2026-01-18 06:11:36+00', 9.24, 4296, 7.75, 15, 30, 'blue', 12.7),
-  ('7db4d781-9121-4d1f-aac6-8ed8eb98e78b', 'aaaaaaaa-0003-0003-0003-000000000003', '2026-01-18', '2026-01-18 10:42:00+00', '2026-01-18 11:47:11+00', 10.74, 3911, 6.07, 17, 68, 'red', 24.2),
-  ('9703a5da-c2d8-46ee-a156-5f5d59c82992', 'aaaaaaaa-0051-0051-0051-000000000051', '2026-01-18', '2026-01-18 07:30:00+00', '2026-01-18 09:00:57+00', 11.89, 5457, 7.65, 18, 36, 'blue', 11.8),
-  ('68a37100-e721-4a44-9f0f-ad1dcc0de904', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-01-18', '2026-01-18 21:31:00+00', '2026-01-18 22:25:06+00', 11.84, 3246, 4.57, 18, 72, 'red', 15.3),
-  ('7e382409-6510-4e74-afe9-8a439a4abcbb', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-01-18', '2026-01-18 11:12:00+00', '2026-01-18 11:59:20+00', 8.19, 2840, 5.78, 12, 12, 'blue', 7.6),
-  ('5e4efdcd-fe95-4f60-93e1-447af4d39eb0', 'aaaaaaaa-0042-0042-0042-000000000042', '2026-01-18', '2026-01-18 05:05:00+00', '2026-01-18 05:50:02+00', 9.9, 2702, 4.55, 13, 39, 'blue', 20.9),
-  ('ec5515f6-4bc9-495b-a911-2e1ef8c7ba41', 'aaaaaaaa-0064-0064-0064-000000000064', '2026-01-18', '2026-01-18 14:53:00+00', '2026-01-18 15:07:17+00', 2.03, 857, 7.04, 1, 1, 'blue', 23.9),
-  ('2e37222c-135b-4d52-a4b2-70f725cf168a', 'aaaaaaaa-0097-0097-0097-000000000097', '2026-01-18', '2026-01-18 10:03:00+00', '2026-01-18 11:17:14+00', 10.17, 4454, 7.3, 24, 24, 'purple', 16.3),
-  ('9cb1e977-cefb-4b94-9bc7-884c07f36672', 'aaaaaaaa-0052-0052-0052-000000000052', '2026-01-18', '2026-01-18 08:53:00+00', '2026-01-18 09:42:03+00', 6.73, 2943, 7.29, 7, 21, 'blue', 15.5),
-  ('23335bcb-479d-4106-aa24-ebe9ce30a4cd', 'aaaaaaaa-0016-0016-0016-000000000016', '2026-01-18', '2026-01-18 17:53:00+00', '2026-01-18 19:32:57+00', 14.55, 5997, 6.87, 23, 92, 'red', 7.5),
-  ('5a771a12-5939-44d2-9d90-07307dd9f3fc', 'aaaaaaaa-0058-0058-0058-000000000058', '2026-01-18', '2026-01-18 19:31:00+00', '2026-01-18 20:21:22+00', 8.41, 3022, 5.99, 13, 13, 'blue', 20.6),
-  ('64f85f77-182f-4b39-b589-87cca6c62b4e', 'aaaaaaaa-0090-0090-0090-000000000090', '2026-01-18', '2026-01-18 13:35:00+00', '2026-01-18 14:03:30+00', 4.21, 1710, 6.77, 10, 20, 'purple', 15.3),
-  ('87cc3de7-6d87-466f-baf1-c9170bbd5412', 'aaaaaaaa-0043-0043-0043-000000000043', '2026-01-18', '2026-01-18 10:51:00+00', '2026-01-18 11:52:10+00', 13.27, 3670, 4.61, 22, 22, 'blue', 24.3),
-  ('94b2508d-94ae-4cad-9584-65acf0ce3f4c', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-01-18', '2026-01-18 07:03:00+00', '2026-01-18 08:23:14+00', 14.86, 4814, 5.4, 13, 26, 'blue', 3.6),
-  ('4dc175e2-63c9-498f-9473-3315e6664dd0', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-01-18', '2026-01-18 05:51:00+00', '2026-01-18 06:52:14+00', 13.4, 3674, 4.57, 8, 16, 'blue', 16.8),
-  ('02d8f0db-a802-486e-bf1b-7823789bf410', 'aaaaaaaa-0071-0071-0071-000000000071', '2026-01-18', '2026-01-18 08:44:00+00', '2026-01-18 10:18:44+00', 13.85, 5684, 6.84, 11, 22, 'blue', 19.9),
-  ('ad3efa99-c7ac-4a0f-8307-5959cf057b34', 'aaaaaaaa-0028-0028-0028-000000000028', '2026-01-18', '2026-01-18 21:53:00+00', '2026-01-18 22:53:23+00', 11.57, 3623, 5.22, 24, 72, 'red', 23.1),
-  ('0283a0a7-2006-4e10-9e18-76a8ebca4f27', 'aaaaaaaa-0069-0069-0069-000000000069', '2026-01-18', '2026-01-18 15:47:00+00', '2026-01-18 17:00:22+00', 11.99, 4402, 6.12, 13, 13, 'blue', 12.5),
-  ('a956b248-f38d-492e-ac08-f1b4e9d5b3bc', 'aaaaaaaa-0044-0044-0044-000000000044', '2026-01-18', '2026-01-18 13:00:00+00', '2026-01-18 13:44:09+00', 9.64, 2649, 4.58, 8, 16, 'blue', 24.9),
-  ('99cce8b1-c4bb-4f36-827f-c49f20116ffc', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-01-18', '2026-01-18 14:33:00+00', '2026-01-18 15:40:42+00', 14.72, 4062, 4.6, 27, 81, 'red', 16.1),
-  ('4ab1e9c9-9fb0-46b5-a0ac-905ce936802a', 'aaaaaaaa-0062-0062-0062-000000000062', '2026-01-18', '2026-01-18 07:34:00+00', '2026-01-18 08:08:50+00', 5.74, 2090, 6.07, 5, 10, 'blue', 23.1),
-  ('546b58dc-5215-491e-82b3-5f6d2443d263', 'aaaaaaaa-0076-0076-0076-000000000076', '2026-01-18', '2026-01-18 16:23:00+00', '2026-01-18 16:43:14+00', 4.04, 1214, 5.01, 4, 4, 'blue', 17.9),
-  ('34bb5258-67c4-45fc-9c56-c99c49343b27', 'aaaaaaaa-0018-0018-0018-000000000018', '2026-01-18', '2026-01-18 13:18:00+00', '2026-01-18 14:29:45+00', 10.4, 4305, 6.9, 17, 34, 'red', 20.0),
-  ('286671c8-f4c6-4487-8d08-b5237f039e51', 'aaaaaaaa-0089-0089-0089-000000000089', '2026-01-18', '2026-01-18 15:19:00+00', '2026-01-18 15:59:14+00', 7.29, 2414, 5.52, 18, 36, 'purple', 8.2),
-  ('2aa26437-b785-4e80-898e-f0bcb51bdd57', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-01-18', '2026-01-18 05:31:00+00', '2026-01-18 06:29:01+00', 7.81, 3481, 7.43, 11, 11, 'red', 16.8),
-  ('1e40b62d-f19b-42a5-9348-dfb468f27c39', 'aaaaaaaa-0019-0019-0019-000000000019', '2026-01-18', '2026-01-18 13:59:00+00', '2026-01-18 14:14:27+00', 2.81, 927, 5.5, 3, 12, 'red', 10.3),
-  ('3bd8b47a-b568-44a0-949d-d8fc20f93fc6', 'aaaaaaaa-0009-0009-0009-000000000009', '2026-01-18', '2026-01-18 11:51:00+00', '2026-01-18 13:17:33+00', 11.36, 5193, 7.62, 11, 33, 'red', 12.6),
-  ('e4c31b82-6e05-4164-b3d8-cac9ae1f9440', 'aaaaaaaa-0082-0082-0082-000000000082', '2026-01-18', '2026-01-18 14:23:00+00', '2026-01-18 14:38:28+00', 2.82, 928, 5.49, 7, 14, 'purple', 11.1),
-  ('e136b578-8d9a-4d49-84cc-07f2e748bb47', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-01-18', '2026-01-18 05:19:00+00', '2026-01-18 05:53:00+00', 6.37, 2040, 5.34, 6, 18, 'red', 9.4),
-  ('9b61b6db-60d2-4c68-b640-783608eb699d', 'aaaaaaaa-0060-0060-0060-000000000060', '2026-01-18', '2026-01-18 07:06:00+00', '2026-01-18 08:51:26+00', 14.85, 6326, 7.1, 28, 28, 'blue', 5.0),
-  ('4c0b3567-72fd-4e01-81e7-d030cda2264d', 'aaaaaaaa-0084-0084-0084-000000000084', '2026-01-18', '2026-01-18 19:33:00+00', '2026-01-18 20:08:29+00', 6.8, 2129, 5.22, 15, 45, 'purple', 4.0),
-  ('5de71a8f-cc46-4c4b-b03c-32448984fce2', 'aaaaaaaa-0065-0065-0065-000000000065', '2026-01-18', '2026-01-18 18:25:00+00', '2026-01-18 18:53:31+00', 4.2, 1711, 6.79, 7, 14, 'blue', 23.9),
-  ('5db884e4-128b-4120-9962-0d62e2e6fdd6', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-01-18', '2026-01-18 09:46:00+00', '2026-01-18 10:25:41+00', 5.23, 2381, 7.59, 8, 16, 'blue', 22.4),
-  ('f7b95c21-17b8-4166-ab2e-02125bce8bf3', 'aaaaaaaa-0022-0022-0022-000000000022', '2026-01-18', '2026-01-18 15:51:00+00', '2026-01-18 17:01:14+00', 12.61, 4214, 5.57, 19, 57, 'red', 21.7),
-  ('b0a64f87-ef31-4ef4-9ecd-1bd6eae219c9', 'aaaaaaaa-0029-0029-0029-000000000029', '2026-01-18', '2026-01-18 09:17:00+00', '2026-01-18 09:59:55+00', 7.68, 2575, 5.59, 8, 16, 'red', 6.2),
-  ('39f510b0-223d-44c3-9d4d-772aa41e0574', 'aaaaaaaa-0091-0091-0091-000000000091', '2026-01-18', '2026-01-18 21:15:00+00', '2026-01-18 21:58:28+00', 6.99, 2608, 6.22, 16, 32, 'purple', 7.1),
-  ('e541338c-e4f5-431d-99b1-ec143ff860d4', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-01-18', '2026-01-18 21:24:00+00', '2026-01-18 21:38:29+00', 2.67, 869, 5.43, 5, 10, 'purple', 10.3),
-  ('4a5655a4-833e-4839-af32-18f4364110dc', 'aaaaaaaa-0027-0027-0027-000000000027', '2026-01-18', '2026-01-18 10:02:00+00', '2026-01-18 10:43:56+00', 9.3, 2516, 4.51, 15, 45, 'red', 22.5),
-  ('90d6e47c-871b-48c9-9ecc-d31272ca423f', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-01-18', '2026-01-18 06:15:00+00', '2026-01-18 06:29:05+00', 2.8, 845, 5.03, 3, 6, 'red', 24.6),
-  ('3e0e926e-da97-475d-9449-911859280446', 'aaaaaaaa-0020-0020-0020-000000000020', '2026-01-18', '2026-01-18 10:53:00+00', '2026-01-18 11:34:52+00', 6.24, 2512, 6.71, 7, 14, 'red', 5.0),
-  ('399f590b-2464-4fba-a0b9-657cb6232ed9', 'aaaaaaaa-0012-0012-0012-000000000012', '2026-01-18', '2026-01-18 08:00:00+00', '2026-01-18 08:28:35+00', 4.42, 1715, 6.47, 4, 8, 'red', 22.1),
-  ('d2e539b4-b9fd-400f-abdd-c08d736f594e', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-01-18', '2026-01-18 05:21:00+00', '2026-01-18 06:16:48+00', 7.23, 3348, 7.72, 16, 48, 'purple', 19.4),
-  ('d0c727b4-ddb8-4c88-a8eb-98d1bccf69a9', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-01-18', '2026-01-18 19:15:00+00', '2026-01-18 20:35:08+00', 13.01, 4808, 6.16, 26, 52, 'blue', 18.5),
-  ('7dff8d77-ac39-4b83-936a-2e1d63e8091d', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-01-18', '2026-01-18 12:25:00+00', '2026-01-18 13:38:22+00', 14.56, 4402, 5.04, 33, 33, 'purple', 9.2),
-  ('5cc8b6df-3ff7-4f4a-917a-9a2cffa8bfb9', 'aaaaaaaa-0056-0056-0056-000000000056', '2026-01-18', '2026-01-18 11:36:00+00', '2026-01-18 12:38:42+00', 10.18, 3762, 6.16, 19, 38, 'blue', 4.3),
-  ('adb436a7-58a6-48a1-808d-e05503b138be', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-01-18', '2026-01-18 06:19:00+00', '2026-01-18 07:48:08+00', 12.45, 5348, 7.16, 22, 22, 'blue', 23.2),
-  ('52f973e1-b9b9-4dc9-b887-aec15c35a77c', 'aaaaaaaa-0099-0099-0099-000000000099', '2026-01-19', '2026-01-19 12:44:00+00', '2026-01-19 13:34:23+00', 10.41, 3023, 4.84, 21, 42, 'purple', 13.2),
-  ('e0e0cb24-10fc-4b60-9b51-67c39e672095', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-01-19', '2026-01-19 20:54:00+00', '2026-01-19 21:58:24+00', 12.06, 3864, 5.34, 18, 18, 'purple', 19.8),
-  ('0226d69e-49ae-4789-8c25-e18ea7f7fb40', 'aaaaaaaa-0008-0008-0008-000000000008', '2026-01-19', '2026-01-19 19:03:00+00', '2026-01-19 20:26:06+00', 14.23, 4986, 5.84, 31, 31, 'red', 11.1),
-  ('279336d4-7c3d-4618-bf39-7f74a2d26953', 'aaaaaaaa-0041-0041-0041-000000000041', '2026-01-19', '2026-01-19 19:52:00+00', '2026-01-19 20:05:42+00', 2.64, 822, 5.19, 5, 10, 'blue', 6.0),
-  ('bc987f0d-b881-4313-b9a7-6c22746292ff', 'aaaaaaaa-0090-0090-0090-000000000090', '2026-01-19', '2026-01-19 15:38:00+00', '2026-01-19 16:30:17+00', 8.38, 3137, 6.24, 11, 33, 'purple', 4.1),
-  ('4e4e3a84-fcec-42ee-912d-3627f5c3cc99', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-01-19', '2026-01-19 06:03:00+00', '2026-01-19 06:49:30+00', 6.71, 2790, 6.93, 10, 30, 'red', 15.4),
-  ('a921eb51-c562-4209-9bf3-ed15f75ef529', 'aaaaaaaa-0069-0069-0069-000000000069', '2026-01-19', '2026-01-19 14:13:00+00', '2026-01-19 14:54:09+00', 8.45, 2469, 4.87, 18, 54, 'blue', 13.3),
-  ('faf71899-5df2-437f-bc90-6d1eedf5229f', 'aaaaaaaa-0064-0064-0064-000000000064', '2026-01-19', '2026-01-19 12:43:00+00', '2026-01-19 13:35:05+00', 8.98, 3125, 5.8, 16, 32, 'blue', 16.3),
-  ('c515b694-0da4-4765-a6a1-4f143cbf8a10', 'aaaaaaaa-0004-0004-0004-000000000004', '2026-01-19', '2026-01-19 21:51:00+00', '2026-01-19 22:07:39+00', 2.49, 999, 6.69, 4, 8, 'red', 8.4),
-  ('27a550fb-fddd-44d2-9c56-001f326619dd', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-01-19', '2026-01-19 12:05:00+00', '2026-01-19 13:28:54+00', 11.59, 5034, 7.24, 17, 51, 'blue', 11.2),
-  ('f56b7ef6-8b95-426f-a2a3-1290b487404d', 'aaaaaaaa-0012-0012-0012-000000000012', '2026-01-19', '2026-01-19 14:41:00+00', '2026-01-19 15:28:13+00', 7.73, 2833, 6.11, 16, 32, 'red', 12.5),
-  ('de4b6903-7a5f-41d0-ad9a-8428d485c725', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-01-19', '2026-01-19 19:41:00+00', '2026-01-19 20:16:10+00', 6.15, 2110, 5.72, 9, 27, 'red', 14.1),
-  ('d0a37208-d144-4a86-9017-00adb6b23533', 'aaaaaaaa-0077-0077-0077-000000000077', '2026-01-19', '2026-01-19 12:49:00+00', '2026-01-19 13:28:13+00', 6.58, 2353, 5.96, 9, 18, 'blue', 22.4),
-  ('cb4bbf20-c41f-49b3-ae83-bc8d35cb9a84', 'aaaaaaaa-0028-0028-0028-000000000028', '2026-01-19', '2026-01-19 15:45:00+00', '2026-01-19 17:19:30+00', 14.0, 5670, 6.75, 26, 26, 'red', 9.0),
-  ('7fbdf60b-a75f-4e12-b877-7c1e6aefacb0', 'aaaaaaaa-0024-0024-0024-000000000024', '2026-01-19', '2026-01-19 09:42:00+00', '2026-01-19 10:45:35+00', 8.49, 3815, 7.49, 11, 22, 'red', 9.6),
-  ('c6c5820c-1b40-4c82-93a1-5febe857c52e', 'aaaaaaaa-0036-0036-0036-000000000036', '2026-01-19', '2026-01-19 12:59:00+00', '2026-01-19 13:27:52+00', 5.25, 1732, 5.5, 4, 4, 'red', 13.8),
-  ('dc56d923-1afb-4eac-821e-9ec3410421ce', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-01-19', '2026-01-19 15:27:00+00', '2026-01-19 16:37:33+00', 9.42, 4233, 7.49, 16, 16, 'blue', 4.7),
-  ('e0720bfd-d8dd-4597-9915-c29088b69566', 'aaaaaaaa-0046-0046-0046-000000000046', '2026-01-19', '2026-01-19 07:21:00+00', '2026-01-19 08:00:11+00', 5.29, 2351, 7.41, 9, 27, 'blue', 14.6),
-  ('8d4aa229-1f04-4f75-b051-c301fadf1841', 'aaaaaaaa-0031-0031-0031-000000000031', '2026-01-19', '2026-01-19 11:37:00+00', '2026-01-19 13:12:29+00', 13.76, 5729, 6.94, 21, 84, 'red', 22.3),
-  ('2d72c3aa-1c9a-48db-8523-34e80938f5f7', 'aaaaaaaa-0086-0086-0086-000000000086', '2026-01-19', '2026-01-19 09:03:00+00', '2026-01-19 09:29:44+00', 3.57, 1604, 7.49, 7, 7, 'purple', 12.1),
-  ('b6a491da-7d9b-46b0-b723-0afd850e23fb', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-01-19', '2026-01-19 11:50:00+00', '2026-01-19 12:53:00+00', 10.05, 3780, 6.27, 14, 28, 'blue', 9.7),
-  ('e777675a-2716-4549-8cea-16119c7b4b62', 'aaaaaaaa-0025-0025-0025-000000000025', '2026-01-19', '2026-01-19 17:53:00+00', '2026-01-19 18:12:18+00', 3.94, 1158, 4.9, 6, 18, 'red', 17.4),
-  ('cc03a710-ddd0-423a-bd19-79f577481764', 'aaaaaaaa-0030-0030-0030-000000000030', '2026-01-19', '2026-01-19 20:40:00+00', '2026-01-19 22:16:25+00', 13.41, 5785, 7.19, 15, 30, 'red', 22.5),
-  ('ed9da742-0803-4918-8d1d-9b15918c8112', 'aaaaaaaa-0000-0000-0000-000000000000', '2026-01-19', '2026-01-19 10:27:00+00', '2026-01-19 11:52:31+00', 11.18, 5131, 7.65, 9, 27, 'red', 18.6),
-  ('c3f6162e-bfd5-480a-b6aa-703c93136eae', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-01-19', '2026-01-19 11:58:00+00', '2026-01-19 12:47:24+00', 6.5, 2964, 7.6, 16, 48, 'purple', 12.6),
-  ('657d0dfa-b358-4402-a471-510286fc22f7', 'aaaaaaaa-0061-0061-0061-000000000061', '2026-01-19', '2026-01-19 12:04:00+00', '2026-01-19 12:39:58+00', 6.96, 2158, 5.17, 13, 39, 'blue', 17.8),
-  ('1980ced8-237a-4289-8b3d-9ebc3c57e3c5', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-01-19', '2026-01-19 15:58:00+00', '2026-01-19 17:27:11+00', 12.67, 5351, 7.04, 19, 19, 'blue', 18.0),
-  ('6f6f5e35-83cc-4ddb-86ea-296c7dddb896', 'aaaaaaaa-0038-0038-0038-000000000038', '2026-01-19', '2026-01-19 05:38:00+00', '2026-01-19 06:23:18+00', 9.52, 2718, 4.76, 11, 11, 'red', 20.2),
-  ('ce54655e-f811-4c27-b14f-b4fba9c1dd72', 'aaaaaaaa-0085-0085-0085-000000000085', '2026-01-19', '2026-01-19 19:55:00+00', '2026-01-19 20:35:57+00', 7.34, 2457, 5.58, 16, 48, 'purple', 5.4),
-  ('3f14f342-8bd0-43a8-9926-dfc33ea6bc10', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-01-19', '2026-01-19 21:25:00+00', '2026-01-19 22:32:14+00', 14.49, 4034, 4.64, 24, 24, 'blue', 18.6),
-  ('079f95c6-ba9b-4424-9b8d-3ad281856be8', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-01-19', '2026-01-19 18:19:00+00', '2026-01-19 18:40:56+00', 4.11, 1316, 5.34, 6, 18, 'purple', 21.0),
-  ('0b5fe761-7d13-4fbb-a741-edae8381e213', 'aaaaaaaa-0076-0076-0076-000000000076', '2026-01-19', '2026-01-19 11:11:00+00', '2026-01-19 12:03:50+00', 9.11, 3170, 5.8, 9, 27, 'blue', 5.0),
-  ('6718ab56-facb-41a2-b2ef-32e54415d822', 'aaaaaaaa-0084-0084-0084-000000000084', '2026-01-19', '2026-01-19 08:15:00+00', '2026-01-19 09:20:09+00', 11.87, 3909, 5.49, 27, 27, 'purple', 16.3),
-  ('93296b08-c584-4479-b250-9e0bc64f0472', 'aaaaaaaa-0015-0015-0015-000000000015', '2026-01-19', '2026-01-19 07:45:00+00', '2026-01-19 08:21:07+00', 6.37, 2167, 5.67, 11, 44, 'red', 19.4),
-  ('8b4d7b51-3198-40b5-a551-733ce2ad638f', 'aaaaaaaa-0051-0051-0051-000000000051', '2026-01-19', '2026-01-19 10:02:00+00', '2026-01-19 11:05:05+00', 8.8, 3785, 7.17, 16, 48, 'blue', 22.6),
-  ('9186bce9-59fe-4ca0-91b7-9aa9f9a8e354', 'aaaaaaaa-0033-0033-0033-000000000033', '2026-01-19', '2026-01-19 20:37:00+00', '2026-01-19 21:11:36+00', 5.61, 2076, 6.17, 12, 12, 'red', 3.9),
-  ('84b0d27e-75ea-4de9-b375-68e84673e6de', 'aaaaaaaa-0029-0029-0029-000000000029', '2026-01-19', '2026-01-19 05:26:00+00', '2026-01-19 06:42:16+00', 10.55, 4576, 7.23, 15, 45, 'red', 19.0),
-  ('f4676bd6-ed04-4f64-9bbd-c90718ee52fa', 'aaaaaaaa-0080-0080-0080-000000000080', '2026-01-19', '2026-01-19 16:22:00+00', '2026-01-19 16:49:46+00', 4.96, 1666, 5.6, 11, 11, 'purple', 12.3),
-  ('ee845d7d-9327-4a23-9eb2-49870442ef67', 'aaaaaaaa-0070-0070-0070-000000000070', '2026-01-19', '2026-01-19 14:25:00+00', '2026-01-19 15:27:10+00', 10.87, 3730, 5.72, 18, 18, 'blue', 10.4),
-  ('e5a32276-8be9-41f6-b572-61921bd37c8c', 'aaaaaaaa-0062-0062-0062-000000000062', '2026-01-19', '2026-01-19 20:05:00+00', '2026-01-19 20:25:23+00', 3.37, 1223, 6.05, 4, 8, 'blue', 17.7),
-  ('4e0714eb-f10f-40b9-ada1-51fae1043314', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-01-19', '2026-01-19 15:29:00+00', '2026-01-19 16:16:24+00', 8.78, 2844, 5.4, 14, 28, 'red', 9.0),
-  ('cc6552f8-3bd9-4a82-bfc8-0cddb319aa76', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-01-19', '2026-01-19 08:06:00+00', '2026-01-19 09:29:51+00', 12.1, 5031, 6.93, 17, 51, 'blue', 17.5),
-  ('ddd0dd99-2c92-48ae-8245-1b23111ef4fb', 'aaaaaaaa-0087-0087-0087-000000000087', '2026-01-20', '2026-01-20 10:41:00+00', '2026-01-20 11:04:34+00', 3.33, 1414, 7.08, 4, 8, 'purple', 17.3),
-  ('9ac77a65-7f68-47ee-ae70-c8dd91c77bcd', 'aaaaaaaa-0024-0024-0024-000000000024', '2026-01-20', '2026-01-20 06:11:00+00', '2026-01-20 07:46:51+00', 13.24, 5751, 7.24, 26, 78, 'red', 12.6),
-  ('62bb6f83-23eb-4d25-bf79-2d8e68fab8b9', 'aaaaaaaa-0007-0007-0007-000000000007', '2026-01-20', '2026-01-20 20:31:00+00', '2026-01-20 21:32:34+00', 12.39, 3694, 4.97, 18, 72, 'red', 10.6),
-  ('3101b449-c0ed-42f8-abe0-686033aa973b', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-01-20', '2026-01-20 09:47:00+00', '2026-01-20 10:32:29+00', 8.27, 2729, 5.5, 7, 28, 'red', 23.0),
-  ('a7e17530-9551-4ff0-ad6e-a842d35cf674', 'aaaaaaaa-0065-0065-0065-000000000065', '2026-01-20', '2026-01-20 12:09:00+00', '2026-01-20 13:10:54+00', 10.73, 3714, 5.77, 18, 18, 'blue', 11.0),
-  ('a1d28e1d-bd13-41e5-9a36-d66630916e8d', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-01-20', '2026-01-20 13:36:00+00', '2026-01-20 15:07:56+00', 12.95, 5516, 7.1, 25, 50, 'blue', 13.3),
-  ('f0446f39-5cc3-4a06-8b49-acf7d282dcf5', 'aaaaaaaa-0036-0036-0036-000000000036', '2026-01-20', '2026-01-20 05:10:00+00', '2026-01-20 05:49:59+00', 7.38, 2399, 5.42, 10, 30, 'red', 23.4),
-  ('832dcd8e-4315-4675-a21f-1be30e68c1bf', 'aaaaaaaa-0031-0031-0031-000000000031', '2026-01-20', '2026-01-20 15:42:00+00', '2026-01-20 16:19:35+00', 4.77, 2255, 7.88, 3, 12, 'red', 11.7),
-  ('06e98211-d468-4935-bd68-3e6facfa69c7', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-01-20', '2026-01-20 10:50:00+00', '2026-01-20 11:22:21+00', 6.77, 1941, 4.78, 8, 24, 'red', 15.2),
-  ('906355db-32d9-4396-aef0-d8ad9d99ebd4', 'aaaaaaaa-0092-0092-0092-000000000092', '2026-01-20', '2026-01-20 13:44:00+00', '2026-01-20 15:14:39+00', 14.3, 5439, 6.34, 33, 33, 'purple', 18.8),
-  ('fda9ad41-7040-4c95-9e6d-2484b9c70998', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-01-20', '2026-01-20 06:30:00+00', '2026-01-20 07:39:00+00', 8.79, 4140, 7.85, 16, 48, 'red', 15.5),
-  ('2055f479-d7f1-431d-ad03-c924d89474d6', 'aaaaaaaa-0033-0033-0033-000000000033', '2026-01-20', '2026-01-20 07:55:00+00', '2026-01-20 09:10:08+00', 10.1, 4508, 7.44, 8, 32, 'red', 13.3),
-  ('d9dc7496-e82c-4e98-b818-585edb4df304', 'aaaaaaaa-0045-0045-0045-000000000045', '2026-01-20', '2026-01-20 11:04:00+00', '2026-01-20 11:32:50+00', 4.04, 1730, 7.14, 10, 10, 'blue', 14.5),
-  ('6cea4823-41e2-4bb3-a13a-b1b0e86dbc2f', 'aaaaaaaa-0048-0048-0048-000000000048', '2026-01-20', '2026-01-20 18:31:00+00', '2026-01-20 20:03:15+00', 12.57, 5535, 7.34, 20, 60, 'blue', 23.0),
-  ('d45fd5a6-3fcd-4516-a797-fde7623db373', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-01-20', '2026-01-20 08:18:00+00', '2026-01-20 09:23:50+00', 10.45, 3950, 6.3, 13, 13, 'blue', 20.2),
-  ('c6c8f285-5265-4e39-91e6-c38ffea9cab1', 'aaaaaaaa-0012-0012-0012-000000000012', '2026-01-20', '2026-01-20 07:03:00+00', '2026-01-20 08:02:29+00', 11.97, 3569, 4.97, 20, 20, 'red', 9.8),
-  ('734f7acb-7877-401b-899f-8f61a26fbc1a', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-01-20', '2026-01-20 11:56:00+00', '2026-01-20 12:48:24+00', 7.14, 3144, 7.34, 15, 30, 'purple', 12.6),
-  ('2cbefe31-8a30-466b-892f-b3238f1b3492', 'aaaaaaaa-0015-0015-0015-000000000015', '2026-01-20', '2026-01-20 20:07:00+00', '2026-01-20 21:24:56+00', 12.97, 4676, 6.01, 20, 60, 'red', 8.9),
-  ('623d57d7-07c3-49ea-828f-37eb38457ff9', 'aaaaaaaa-0021-0021-0021-000000000021', '2026-01-20', '2026-01-20 08:23:00+00', '2026-01-20 08:45:26+00', 3.83, 1346, 5.86, 7, 21, 'red', 13.6),
-  ('a748e59c-300c-4445-9b9e-c40c12adebdd', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-01-20', '2026-01-20 06:44:00+00', '2026-01-20 07:19:07+00', 5.04, 2107, 6.97, 9, 27, 'blue', 7.0),
-  ('9e81603b-179b-45cd-8087-80a7ee9a09ea', 'aaaaaaaa-0085-0085-0085-000000000085', '2026-01-20', '2026-01-20 20:19:00+00', '2026-01-20 21:25:23+00', 14.4, 3983, 4.61, 34, 102, 'purple', 22.8),
-  ('8437f630-3033-4ba6-bec4-be515abee0c2', 'aaaaaaaa-0076-0076-0076-000000000076', '2026-01-20', '2026-01-20 07:16:00+00', '2026-01-20 08:30:36+00', 13.59, 4476, 5.49, 20, 20, 'blue', 11.5),
-  ('86113a2b-df44-4fe6-9a14-155c61832022', 'aaaaaaaa-0089-0089-0089-000000000089', '2026-01-20', '2026-01-20 11:45:00+00', '2026-01-20 12:09:06+00', 3.41, 1446, 7.07, 7, 7, 'purple', 14.1),
-  ('8695cb00-8980-49b9-9ee1-069b2c1933b4', 'aaaaaaaa-0060-0060-0060-000000000060', '2026-01-20', '2026-01-20 13:32:00+00', '2026-01-20 14:08:29+00', 4.84, 2189, 7.54, 5, 15, 'blue', 21.4),
-  ('2562feaf-b587-42a8-8b82-b8cdb8f4a871', 'aaaaaaaa-0097-0097-0097-000000000097', '2026-01-20', '2026-01-20 12:36:00+00', '2026-01-20 13:14:45+00', 5.36, 2325, 7.23, 7, 21, 'purple', 12.2),
-  ('1a50b00a-a35f-4892-b863-9e8258fb1265', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-01-20', '2026-01-20 18:24:00+00', '2026-01-20 18:39:02+00', 3.1, 902, 4.85, 4, 16, 'red', 18.1),
-  ('411a1944-f1b4-48e4-8075-350f7baf2050', 'aaaaaaaa-0090-0090-0090-000000000090', '2026-01-20', '2026-01-20 21:31:00+00', '2026-01-20 22:09:47+00', 7.21, 2327, 5.38, 12, 24, 'purple', 24.4),
-  ('8d764553-883f-4dee-9c53-ec83772c1b4d', 'aaaaaaaa-0034-0034-0034-000000000034', '2026-01-20', '2026-01-20 17:51:00+00', '2026-01-20 18:49:25+00', 8.88, 3505, 6.58, 14, 14, 'red', 14.0),
-  ('768544a8-909e-4d02-867c-999da11c036b', 'aaaaaaaa-0030-0030-0030-000000000030', '2026-01-20', '2026-01-20 05:25:00+00', '2026-01-20 06:10:50+00', 8.23, 2750, 5.57, 14, 42, 'red', 21.9),
-  ('eb277345-bcf3-4da2-9265-9cfebaddf5d1', 'aaaaaaaa-0058-0058-0058-000000000058', '2026-01-20', '2026-01-20 19:59:00+00', '2026-01-20 20:40:18+00', 6.6, 2478, 6.26, 12, 36, 'blue', 10.1),
-  ('5cedd45b-22dc-4262-a8eb-81cd3f574f93', 'aaaaaaaa-0072-0072-0072-000000000072', '2026-01-20', '2026-01-20 18:58:00+00', '2026-01-20 19:30:12+00', 5.29, 1932, 6.09, 10, 20, 'blue', 24.0),
-  ('031ec5e4-3c5b-4a37-9f31-cb5ca72228fa', 'aaaaaaaa-0025-0025-0025-000000000025', '2026-01-20', '2026-01-20 14:08:00+00', '2026-01-20 15:27:20+00', 10.03, 4760, 7.91, 18, 72, 'red', 8.4),
-  ('5ce86916-86fe-4082-9cb7-a4152e04d20d', 'aaaaaaaa-0019-0019-0019-000000000019', '2026-01-20', '2026-01-20 10:06:00+00', '2026-01-20 11:03:09+00', 7.61, 3429, 7.51, 8, 32, 'red', 21.4),
-  ('1c642a74-e8c3-4ecf-a027-dd1bd0e558e5', 'aaaaaaaa-0099-0099-0099-000000000099', '2026-01-20', '2026-01-20 13:00:00+00', '2026-01-20 14:08:31+00', 13.9, 4111, 4.93, 25, 25, 'purple', 21.9),
-  ('2ed2f868-b3fd-4b4f-983b-905b85a170af', 'aaaaaaaa-0086-0086-0086-000000000086', '2026-01-20', '2026-01-20 20:17:00+00', '2026-01-20 20:51:09+00', 5.06, 2049, 6.75, 8, 8, 'purple', 9.9),
-  ('d191e6c9-fe3c-45f4-8c26-d9e4f611c820', 'aaaaaaaa-0078-0078-0078-000000000078', '2026-01-20', '2026-01-20 05:29:00+00', '2026-01-20 06:17:41+00', 6.8, 2921, 7.16, 13, 13, 'blue', 19.4),
-  ('ac51448b-469c-4b96-8ba2-73128c1d6f6b', 'aaaaaaaa-0037-0037-0037-000000000037', '2026-01-20', '2026-01-20 14:29:00+00', '2026-01-20 15:25:42+00', 8.29, 3402, 6.84, 13, 13, 'red', 6.8),
-  ('500e72c8-e40e-40b3-9b9f-85472e2c5ccf', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-01-20', '2026-01-20 09:38:00+00', '2026-01-20 10:50:47+00', 14.19, 4367, 5.13, 19, 19, 'red', 11.6),
-  ('6843f0ea-a85e-4373-8d2b-b4b8de4ea98f', 'aaaaaaaa-0052-0052-0052-000000000052', '2026-01-20', '2026-01-20 14:16:00+00', '2026-01-20 15:55:41+00', 13.24, 5981, 7.53, 27, 54, 'blue', 7.9),
-  ('5bf36e5d-465f-4775-ab94-ef01c576b675', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-01-20', '2026-01-20 17:45:00+00', '2026-01-20 18:08:56+00', 4.73, 1436, 5.06, 6, 12, 'blue', 20.1),
-  ('79266083-5017-40fb-ad84-b0676580709f', 'aaaaaaaa-0064-0064-0064-000000000064', '2026-01-20', '2026-01-20 21:46:00+00', '2026-01-20 22:33:46+00', 8.5, 2866, 5.62, 12, 24, 'blue', 13.2),
-  ('89ff0a04-272d-48f7-b6d5-d1f7db7f6a80', 'aaaaaaaa-0044-0044-0044-000000000044', '2026-01-20', '2026-01-20 15:07:00+00', '2026-01-20 16:36:09+00', 13.19, 5349, 6.76, 16, 16, 'blue', 13.5),
-  ('b8e8e89d-e8d9-4791-970a-7d1d0d16d31e', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-01-20', '2026-01-20 15:09:00+00', '2026-01-20 15:59:09+00', 8.05, 3009, 6.23, 17, 51, 'purple', 9.9),
-  ('8f3aa213-95fc-4e7f-8795-4f223c3a08ae', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-01-20', '2026-01-20 13:21:00+00', '2026-01-20 13:53:33+00', 4.37, 1953, 7.45, 8, 8, 'red', 19.2),
-  ('5cb45ed5-7052-49ca-bbc6-4fafa5df30c7', 'aaaaaaaa-0098-0098-0098-000000000098', '2026-01-20', '2026-01-20 20:02:00+00', '2026-01-20 20:52:48+00', 6.59, 3048, 7.71, 10, 10, 'purple', 16.9),
-  ('ffbb1653-d2f2-4b70-bc24-a43f770fe56e', 'aaaaaaaa-0008-0008-0008-000000000008', '2026-01-20', '2026-01-20 15:12:00+00', '2026-01-20 15:59:54+00', 9.09, 2874, 5.27, 18, 72, 'red', 13.7),
-  ('07189860-29d2-44e3-ad3f-afb60c2aea48', 'aaaaaaaa-0020-0020-0020-000000000020', '2026-01-20', '2026-01-20 16:57:00+00', '2026-01-20 18:12:57+00', 9.84, 4557, 7.72, 15, 30, 'red', 13.3),
-  ('43fdcec7-7da0-484b-83fb-b1818b571797', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-01-20', '2026-01-20 13:56:00+00', '2026-01-20 15:08:50+00', 11.47, 4370, 6.35, 16, 48, 'red', 10.4),
-  ('f5ea5d69-8d92-433f-87ed-6e405577fe1e', 'aaaaaaaa-0041-0041-0041-000000000041', '2026-01-20', '2026-01-20 13:03:00+00', '2026-01-20 14:23:35+00', 13.41, 4835, 6.01, 25, 50, 'blue', 11.8),
-  ('d93c738f-cd0f-4491-a21e-a7b9f5e06574', 'aaaaaaaa-0042-0042-0042-000000000042', '2026-01-20', '2026-01-20 09:15:00+00', '2026-01-20 10:58:13+00', 13.05, 6193, 7.91, 16, 48, 'blue', 8.0),
-  ('8a2f1b8e-f174-477e-9b4f-2245aaf7572e', 'aaaaaaaa-0009-0009-0009-000000000009', '2026-01-20', '2026-01-20 12:06:00+00', '2026-01-20 13:01:02+00', 9.54, 3302, 5.77, 14, 14, 'red', 7.8),
-  ('c0fdd35f-2d3f-4acf-88da-feaf7fa53f03', 'aaaaaaaa-0056-0056-0056-000000000056', '2026-01-20', '2026-01-20 20:19:00+00', '2026-01-20 21:23:46+00', 10.62, 3886, 6.1, 14, 42, 'blue', 17.0),
-  ('172a9668-cc5a-4ef3-baf1-cc6394eda6a8', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-01-20', '2026-01-20 08:11:00+00', '2026-01-20 08:48:32+00', 7.66, 2252, 4.9, 10, 30, 'blue', 13.2),
-  ('797dc853-d822-4c8c-8e49-eb85115f66f0', 'aaaaaaaa-0004-0004-0004-000000000004', '2026-01-20', '2026-01-20 05:06:00+00', '2026-01-20 06:11:36+00', 12.89, 3936, 5.09, 19, 76, 'red', 11.4),
-  ('8f681e2a-1efe-4f84-b8ba-e26247a18a94', 'aaaaaaaa-0057-0057-0057-000000000057', '2026-01-20', '2026-01-20 05:18:00+00', '2026-01-20 06:14:14+00', 11.74, 3374, 4.79, 15, 45, 'blue', 12.8),
-  ('f264ff31-52ec-41eb-bb89-35492507f894', 'aaaaaaaa-0016-0016-0016-000000000016', '2026-01-20', '2026-01-20 19:25:00+00', '2026-01-20 20:29:52+00', 14.29, 3892, 4.54, 23, 23, 'red', 20.4),
-  ('3e655c3d-9446-4148-bb4f-49f5ac6cf10e', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-01-20', '2026-01-20 10:36:00+00', '2026-01-20 11:06:38+00', 5.54, 1838, 5.53, 6, 12, 'red', 3.9),
-  ('3a82b0dd-4489-4782-b5be-774d518a95ab', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-01-20', '2026-01-20 10:04:00+00', '2026-01-20 10:21:27+00', 2.34, 1047, 7.46, 3, 3, 'blue', 15.0),
-  ('f241f67f-421a-4c6e-a089-eb270070b4af', 'aaaaaaaa-0046-0046-0046-000000000046', '2026-01-20', '2026-01-20 10:57:00+00', '2026-01-20 12:05:40+00', 12.74, 4120, 5.39, 18, 18, 'blue', 12.4),
-  ('2aec83dc-4be2-46f9-a8f5-eef0ccb5feaf', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-01-20', '2026-01-20 14:21:00+00', '2026-01-20 16:05:58+00', 14.42, 6298, 7.28, 12, 24, 'blue', 21.2),
-  ('6fa1a7a0-3193-4c17-98c5-355c1a301940', 'aaaaaaaa-0063-0063-0063-000000000063', '2026-01-20', '2026-01-20 16:14:00+00', '2026-01-20 16:36:47+00', 2.98, 1367, 7.65, 2, 4, 'blue', 22.1),
-  ('70d1be19-af4b-48aa-ac24-c1a61903e791', 'aaaaaaaa-0062-0062-0062-000000000062', '2026-01-20', '2026-01-20 12:23:00+00', '2026-01-20 13:00:25+00', 5.97, 2245, 6.27, 3, 6, 'blue', 6.6),
-  ('73ee6334-d20c-4181-8ded-786e0ef75132', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-01-20', '2026-01-20 12:38:00+00', '2026-01-20 13:48:03+00', 11.21, 4203, 6.25, 28, 28, 'purple', 24.5),
-  ('4bb106a0-883a-4fe6-95de-26797b143c90', 'aaaaaaaa-0038-0038-0038-000000000038', '2026-01-20', '2026-01-20 12:54:00+00', '2026-01-20 13:15:16+00', 3.01, 1276, 7.07, 6, 12, 'red', 12.2),
-  ('1e1f4227-8c05-43c7-83eb-4da11401dab1', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-01-20', '2026-01-20 11:16:00+00', '2026-01-20 11:43:17+00', 6.05, 1637, 4.51, 7, 21, 'blue', 11.6),
-  ('58f40e2b-c717-49f8-8605-250531cab223', 'aaaaaaaa-0000-0000-0000-000000000000', '2026-01-20', '2026-01-20 15:30:00+00', '2026-01-20 17:17:05+00', 13.47, 6425, 7.95, 27, 81, 'red', 6.9),
-  ('e1df59e3-0709-4b81-94e8-2105c44dcf5d', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-01-20', '2026-01-20 19:46:00+00', '2026-01-20 20:38:31+00', 10.34, 3151, 5.08, 15, 30, 'blue', 20.9),
-  ('5868a381-e3da-48f0-b7d8-e7dbe066f72e', 'aaaaaaaa-0027-0027-0027-000000000027', '2026-01-21', '2026-01-21 05:27:00+00', '2026-01-21 06:43:15+00', 10.32, 4575, 7.39, 15, 45, 'red', 11.4),
-  ('09258de6-280a-4166-b750-19545aacb68a', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-01-21', '2026-01-21 09:46:00+00', '2026-01-21 10:07:40+00', 3.01, 1300, 7.2, 6, 6, 'purple', 12.6),
-  ('0090d4a5-f23f-447e-80f8-af30cd809979', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-01-21', '2026-01-21 09:16:00+00', '2026-01-21 10:27:07+00', 14.88, 4267, 4.78, 17, 34, 'blue', 4.0),
-  ('00f02182-8106-4a53-bf2b-602493208fcb', 'aaaaaaaa-0097-0097-0097-000000000097', '2026-01-21', '2026-01-21 21:10:00+00', '2026-01-21 21:57:55+00', 7.1, 2875, 6.75, 15, 30, 'purple', 7.9),
-  ('d34fa45a-f9a5-4f50-a3bd-88effeb0fce9', 'aaaaaaaa-0067-0067-0067-000000000067', '2026-01-21', '2026-01-21 18:47:00+00', '2026-01-21 19:31:39+00', 9.71, 2679, 4.6, 13, 26, 'blue', 9.9),
-  ('af7ba03f-088c-4115-b7da-28850b4855a5', 'aaaaaaaa-0063-0063-0063-000000000063', '2026-01-21', '2026-01-21 18:13:00+00', '2026-01-21 18:24:34+00', 2.33, 694, 4.97, 3, 9, 'blue', 10.8),
-  ('6d1fe578-8f63-4a90-ad0d-2154db1abacc', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-01-21', '2026-01-21 14:58:00+00', '2026-01-21 15:43:37+00', 6.64, 2737, 6.87, 5, 15, 'blue', 23.0),
-  ('c28efc18-8797-403c-aa36-0b090ea4d2d7', 'aaaaaaaa-0082-0082-0082-000000000082', '2026-01-21', '2026-01-21 12:20:00+00', '2026-01-21 12:35:20+00', 3.35, 920, 4.58, 6, 18, 'purple', 20.3),
-  ('03f7d218-3ada-4ac7-9b68-59a6512197c7', 'aaaaaaaa-0072-0072-0072-000000000072', '2026-01-21', '2026-01-21 07:10:00+00', '2026-01-21 07:48:49+00', 7.27, 2329, 5.34, 10, 20, 'blue', 6.5),
-  ('b199ef7c-f2de-4452-a850-db41426be3ca', 'aaaaaaaa-0015-0015-0015-000000000015', '2026-01-21', '2026-01-21 20:37:00+00', '2026-01-21 21:00:53+00', 4.22, 1433, 5.66, 8, 16, 'red', 21.0),
-  ('b2bdc2fe-bc6b-46e1-8ecc-25cd0838325e', 'aaaaaaaa-0046-0046-0046-000000000046', '2026-01-21', '2026-01-21 15:14:00+00', '2026-01-21 16:44:23+00', 11.77, 5423, 7.68, 14, 28, 'blue', 16.7),
-  ('aa4465e9-d913-4110-99ad-91d8de002db7', 'aaaaaaaa-0030-0030-0030-000000000030', '2026-01-21', '2026-01-21 17:57:00+00', '2026-01-21 19:19:25+00', 12.88, 4945, 6.4, 26, 52, 'red', 4.5),
-  ('46407bcb-9244-4b29-9275-b564a0d14a6d', 'aaaaaaaa-0000-0000-0000-000000000000', '2026-01-21', '2026-01-21 07:33:00+00', '2026-01-21 08:16:13+00', 6.54, 2593, 6.61, 9, 27, 'red', 21.3),
-  ('b112e9c4-a128-488d-8a2c-22c12665c17d', 'aaaaaaaa-0007-0007-0007-000000000007', '2026-01-21', '2026-01-21 14:22:00+00', '2026-01-21 15:18:06+00', 10.45, 3366, 5.37, 16, 64, 'red', 17.4),
-  ('192a5296-27cc-49de-b568-e2f0943491a1', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-01-21', '2026-01-21 09:12:00+00', '2026-01-21 09:48:57+00', 6.53, 2217, 5.66, 8, 8, 'blue', 22.5),
-  ('5d9a16b3-9c4c-41c0-bdb0-e8dd0d6e7f25', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-01-21', '2026-01-21 20:27:00+00', '2026-01-21 21:23:39+00', 10.98, 3399, 5.16, 12, 36, 'blue', 23.8),
-  ('cb6a4440-405d-46ef-a61d-612bca7576e2', 'aaaaaaaa-0090-0090-0090-000000000090', '2026-01-21', '2026-01-21 14:03:00+00', '2026-01-21 14:34:21+00', 4.04, 1881, 7.76, 9, 9, 'purple', 22.9),
-  ('8d476309-9884-409d-ba75-bf97a14be7a8', 'aaaaaaaa-0033-0033-0033-000000000033', '2026-01-21', '2026-01-21 14:53:00+00', '2026-01-21 15:36:23+00', 7.68, 2603, 5.65, 11, 11, 'red', 13.5),
-  ('8cd3bd97-f757-41bf-abca-121e5a3bea21', 'aaaaaaaa-0093-0093-0093-000000000093', '2026-01-21', '2026-01-21 16:21:00+00', '2026-01-21 17:38:02+00', 9.84, 4622, 7.83, 22, 66, 'purple', 11.5),
-  ('63c4bd1e-4678-448e-b14c-870fc2963e9e', 'aaaaaaaa-0009-0009-0009-000000000009', '2026-01-21', '2026-01-21 09:48:00+00', '2026-01-21 10:28:32+00', 5.32, 2432, 7.62, 9, 36, 'red', 20.3),
-  ('ff024ae2-269a-4a51-a996-7872ed62b608', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-01-21', '2026-01-21 16:30:00+00', '2026-01-21 17:28:56+00', 10.34, 3536, 5.7, 21, 42, 'purple', 4.0),
-  ('cb74bf6c-579d-4f79-9dbe-ef3a8eefadb5', 'aaaaaaaa-0028-0028-0028-000000000028', '2026-01-21', '2026-01-21 16:22:00+00', '2026-01-21 16:53:47+00', 6.21, 1907, 5.12, 11, 11, 'red', 10.6),
-  ('eedb01e9-e48a-4a7b-8002-46dbcb83e321', 'aaaaaaaa-0035-0035-0035-000000000035', '2026-01-21', '2026-01-21 09:16:00+00', '2026-01-21 10:12:54+00', 11.66, 3414, 4.88, 20, 40, 'red', 10.2),
-  ('c23a0d67-e24e-4c07-876c-984226c1d368', 'aaaaaaaa-0061-0061-0061-000000000061', '2026-01-21', '2026-01-21 10:48:00+00', '2026-01-21 12:34:55+00', 13.78, 6415, 7.76, 32, 32, 'blue', 14.2),
-  ('43177068-8ae2-494d-8e9d-dda6855d6bff', 'aaaaaaaa-0091-0091-0091-000000000091', '2026-01-21', '2026-01-21 21:55:00+00', '2026-01-21 22:37:11+00', 6.52, 2531, 6.47, 11, 11, 'purple', 4.7),
-  ('099b3f3b-b362-4674-9819-851e2989afd9', 'aaaaaaaa-0022-0022-0022-000000000022', '2026-01-21', '2026-01-21 20:29:00+00', '2026-01-21 21:15:09+00', 7.53, 2769, 6.13, 11, 33, 'red', 18.0),
-  ('8d17236f-965b-4bb3-811e-08c6fa62fb54', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-01-21', '2026-01-21 19:19:00+00', '2026-01-21 20:04:45+00', 6.86, 2745, 6.67, 14, 42, 'purple', 9.4),
-  ('7180d9f2-910b-4b40-b661-01662bece804', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-01-21', '2026-01-21 17:27:00+00', '2026-01-21 19:12:15+00', 13.24, 6315, 7.95, 21, 42, 'red', 7.6),
-  ('e18aa3fa-e3cb-4f7f-b6d5-2a9eaedf5fb9', 'aaaaaaaa-0043-0043-0043-000000000043', '2026-01-21', '2026-01-21 06:45:00+00', '2026-01-21 07:22:06+00', 7.0, 2226, 5.3, 16, 48, 'blue', 17.3),
-  ('2d7e8260-cc98-493a-99c6-48ed4993f3fe', 'aaaaaaaa-0085-0085-0085-000000000085', '2026-01-21', '2026-01-21 13:47:00+00', '2026-01-21 14:15:59+00', 4.25, 1739, 6.82, 6, 18, 'purple', 9.1),
-  ('cc4a01da-fbd4-4729-ad6d-8f676417c8a1', 'aaaaaaaa-0021-0021-0021-000000000021', '2026-01-21', '2026-01-21 17:21:00+00', '2026-01-21 18:09:11+00', 6.46, 2891, 7.46, 7, 14, 'red', 12.9),
-  ('d9ff849a-cd96-47b1-a7d5-82acee203def', 'aaaaaaaa-0092-0092-0092-000000000092', '2026-01-21', '2026-01-21 21:57:00+00', '2026-01-21 22:26:39+00', 3.97, 1779, 7.47, 8, 24, 'purple', 16.7),
-  ('07435ee2-065d-493b-8ccd-9820b65a8a86', 'aaaaaaaa-0041-0041-0041-000000000041', '2026-01-21', '2026-01-21 12:25:00+00', '2026-01-21 12:43:56+00', 4.2, 1136, 4.51, 7, 7, 'blue', 18.7),
-  ('87a4f6d2-e98f-4415-997c-4f48124a6288', 'aaaaaaaa-0025-0025-0025-000000000025', '2026-01-21', '2026-01-21 05:49:00+00', '2026-01-21 06:56:50+00', 11.44, 4070, 5.93, 15, 45, 'red', 10.7),
-  ('50e917a1-9514-4262-af6d-6512a00dfb05', 'aaaaaaaa-0080-0080-0080-000000000080', '2026-01-21', '2026-01-21 21:31:00+00', '2026-01-21 22:58:53+00', 11.58, 5273, 7.59, 22, 22, 'purple', 3.7),
-  ('b8383fca-7541-437b-bdf2-210c466ffbda', 'aaaaaaaa-0003-0003-0003-000000000003', '2026-01-21', '2026-01-21 13:32:00+00', '2026-01-21 14:43:25+00', 8.95, 4285, 7.98, 11, 33, 'red', 12.6),
-  ('5fefb76c-aff6-4974-83d3-df01bff98060', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-01-21', '2026-01-21 20:30:00+00', '2026-01-21 21:07:30+00', 4.91, 2250, 7.64, 8, 32, 'red', 11.0),
-  ('78112a5d-4c68-4bac-962c-10835cf86cd2', 'aaaaaaaa-0008-0008-0008-000000000008', '2026-01-21', '2026-01-21 15:17:00+00', '2026-01-21 15:30:12+00', 2.44, 792, 5.41, 2, 2, 'red', 21.0),
-  ('54ae48a8-d068-4362-bfef-7c1634a0ffeb', 'aaaaaaaa-0016-0016-0016-000000000016', '2026-01-21', '2026-01-21 05:02:00+00', '2026-01-21 06:55:13+00', 14.84, 6793, 7.63, 13, 52, 'red', 17.4),
-  ('7800e749-6a03-47e4-b089-938d22c7e191', 'aaaaaaaa-0066-0066-0066-000000000066', '2026-01-21', '2026-01-21 13:25:00+00', '2026-01-21 13:42:57+00', 2.33, 1077, 7.71, 5, 10, 'blue', 17.8),
-  ('7ed2e6f3-d98e-4f2c-9cca-25f7189ee7e9', 'aaaaaaaa-0019-0019-0019-000000000019', '2026-01-21', '2026-01-21 09:06:00+00', '2026-01-21 10:01:16+00', 7.73, 3316, 7.15, 12, 24, 'red', 8.1),
-  ('572977dd-d72b-4c98-ab1f-cf8321e35969', 'aaaaaaaa-0057-0057-0057-000000000057', '2026-01-21', '2026-01-21 14:55:00+00', '2026-01-21 15:15:58+00', 4.61, 1258, 4.55, 10, 30, 'blue', 9.5),
-  ('1135b91f-ba94-4ffa-9bb8-612a0944e7bb', 'aaaaaaaa-0098-0098-0098-000000000098', '2026-01-21', '2026-01-21 11:34:00+00', '2026-01-21 12:50:24+00', 11.72, 4584, 6.52, 23, 69, 'purple', 6.7),
-  ('8d595e34-b802-4882-8633-324df644f4ff', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-01-21', '2026-01-21 08:22:00+00', '2026-01-21 09:06:06+00', 7.99, 2646, 5.52, 13, 26, 'purple', 18.4),
-  ('bd9db056-1488-4a47-94cd-fd0797317cc2', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-01-21', '2026-01-21 17:28:00+00', '2026-01-21 18:59:16+00', 14.13, 5476, 6.46, 28, 28, 'blue', 15.1),
-  ('e6c7bb76-6a57-42d2-ba1b-f9e1fae1e523', 'aaaaaaaa-0034-0034-0034-000000000034', '2026-01-21', '2026-01-21 12:28:00+00', '2026-01-21 13:19:41+00', 8.35, 3101, 6.19, 16, 48, 'red', 16.1),
-  ('2cf9a60a-5047-4705-ab99-c532b26b05e9', 'aaaaaaaa-0022-0022-0022-000000000022', '2026-01-22', '2026-01-22 12:58:00+00', '2026-01-22 13:30:44+00', 4.63, 1964, 7.07, 6, 6, 'red', 24.8),
-  ('51abd24c-08fc-40c9-b735-b292d1328299', 'aaaaaaaa-0045-0045-0045-000000000045', '2026-01-22', '2026-01-22 11:51:00+00', '2026-01-22 13:03:01+00', 10.13, 4321, 7.11, 19, 57, 'blue', 22.8),
-  ('2c63e57d-d7e5-4ca4-ad73-1239ead71617', 'aaaaaaaa-0056-0056-0056-000000000056', '2026-01-22', '2026-01-22 13:30:00+00', '2026-01-22 13:52:37+00', 4.16, 1357, 5.44, 8, 16, 'blue', 17.9),
-  ('d1d160a2-7d17-460f-aff1-5faabe59cc20', 'aaaaaaaa-0092-0092-0092-000000000092', '2026-01-22', '2026-01-22 13:05:00+00', '2026-01-22 13:59:23+00', 7.43, 3263, 7.32, 16, 48, 'purple', 24.0),
-  ('455324c2-5d7f-41fe-8b46-cf81cbcd6566', 'aaaaaaaa-0038-0038-0038-000000000038', '2026-01-22', '2026-01-22 11:57:00+00', '2026-01-22 13:21:05+00', 12.03, 5045, 6.99, 18, 18, 'red', 6.9),
-  ('303d5d53-5e79-4f8d-bec8-0072bc8a6a58', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-01-22', '2026-01-22 21:52:00+00', '2026-01-22 23:19:05+00', 13.89, 5225, 6.27, 22, 66, 'purple', 12.5),
-  ('a7a45b8a-068d-4804-8378-bf52f7e143f3', 'aaaaaaaa-0086-0086-0086-000000000086', '2026-01-22', '2026-01-22 06:32:00+00', '2026-01-22 07:57:10+00', 13.35, 5110, 6.38, 19, 57, 'purple', 7.6),
-  ('a76c5ba4-4cb2-481e-9894-b9ab163c1b3e', 'aaaaaaaa-0066-0066-0066-000000000066', '2026-01-22', '2026-01-22 19:39:00+00', '2026-01-22 20:48:53+00', 12.73, 4193, 5.49, 27, 54, 'blue', 22.5),
-  ('a463359d-4e62-4d6a-97e7-865dd4788d80', 'aaaaaaaa-0068-0068-0068-000000000068', '2026-01-22', '2026-01-22 07:01:00+00', '2026-01-22 08:44:57+00', 13.88, 6237, 7.49, 22, 44, 'blue', 11.3),
-  ('b9a8636c-2e2b-496f-b857-8e8fdd4d5278', 'aaaaaaaa-0018-0018-0018-000000000018', '2026-01-22', '2026-01-22 05:29:00+00', '2026-01-22 06:18:34+00', 7.41, 2974, 6.69, 16, 48, 'red', 15.0),
-  ('351d00d8-da05-481e-ae18-df1e92c8935d', 'aaaaaaaa-0041-0041-0041-000000000041', '2026-01-22', '2026-01-22 05:53:00+00', '2026-01-22 06:07:10+00', 2.99, 850, 4.74, 4, 12, 'blue', 23.4),
-  ('04bd5734-08e4-4529-aba4-91ae98b94ebf', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-01-22', '2026-01-22 10:00:00+00', '2026-01-22 10:45:37+00', 7.53, 2737, 6.06, 11, 22, 'red', 8.6),
-  ('89dc15f6-e2a3-4cd8-bf9d-8f77a7083560', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-01-22', '2026-01-22 10:23:00+00', '2026-01-22 11:27:59+00', 12.67, 3899, 5.13, 18, 18, 'blue', 24.1),
-  ('8e4a4fba-65e3-4fa6-a266-bbc9a103a05e', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-01-22', '2026-01-22 14:18:00+00', '2026-01-22 14:36:33+00', 2.6, 1113, 7.14, 4, 12, 'purple', 13.7),
-  ('3abc4778-f7c1-4c01-a072-2793068f3e2d', 'aaaaaaaa-0077-0077-0077-000000000077', '2026-01-22', '2026-01-22 13:09:00+00', '2026-01-22 13:29:04+00', 2.61, 1204, 7.69, 3, 9, 'blue', 23.9),
-  ('2e63d6f9-b844-4120-853c-94fc6c2b2f1a', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-01-22', '2026-01-22 10:06:00+00', '2026-01-22 11:29:51+00', 12.96, 5031, 6.47, 12, 24, 'blue', 10.8),
-  ('83f7e514-a84f-4bf0-9c3c-e15e166b228f', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-01-22', '2026-01-22 20:07:00+00', '2026-01-22 20:19:57+00', 2.77, 777, 4.68, 4, 4, 'red', 8.6),
-  ('4ee54176-72c5-4e50-956b-3e15104189fb', 'aaaaaaaa-0014-0014-0014-000000000014', '2026-01-22', '2026-01-22 12:25:00+00', '2026-01-22 13:09:39+00', 8.3, 2679, 5.38, 15, 30, 'red', 18.7),
-  ('0f063826-28a4-4382-99d4-badca669fb63', 'aaaaaaaa-0096-0096-0096-000000000096', '2026-01-22', '2026-01-22 14:00:00+00', '2026-01-22 14:32:31+00', 6.92, 1951, 4.7, 14, 14, 'purple', 9.4),
-  ('85d190e2-9043-47b6-90c2-1a693cbaeb73', 'aaaaaaaa-0046-0046-0046-000000000046', '2026-01-22', '2026-01-22 06:13:00+00', '2026-01-22 06:52:02+00', 5.98, 2342, 6.53, 6, 12, 'blue', 20.0),
-  ('22223665-1fad-4ab2-8bab-4c4cf7735c13', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-01-22', '2026-01-22 21:41:00+00', '2026-01-22 22:32:42+00', 10.66, 3102, 4.85, 18, 18, 'red', 7.3),
-  ('ba5129cf-e49e-48c5-a764-9d2a914d1a37', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-01-22', '2026-01-22 07:38:00+00', '2026-01-22 08:29:16+00', 8.98, 3076, 5.71, 12, 36, 'blue', 7.0),
-  ('e518965c-7b6c-4ede-b005-0f45ec2e392e', 'aaaaaaaa-0082-0082-0082-000000000082', '2026-01-22', '2026-01-22 08:59:00+00', '2026-01-22 09:43:30+00', 6.03, 2670, 7.38, 14, 42, 'purple', 11.6),
-  ('2c12c11e-719c-4965-8acc-4bde909adb48', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-01-22', '2026-01-22 20:54:00+00', '2026-01-22 21:14:06+00', 2.67, 1206, 7.53, 4, 4, 'blue', 3.4),
-  ('9d4b92e7-7c22-446c-aa83-5f02c91545a3', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-01-22', '2026-01-22 20:44:00+00', '2026-01-22 21:41:08+00', 11.27, 3428, 5.07, 14, 28, 'blue', 5.3),
-  ('089a0e72-728d-478c-a702-f5c591ad565f', 'aaaaaaaa-0060-0060-0060-000000000060', '2026-01-22', '2026-01-22 07:39:00+00', '2026-01-22 08:09:13+00', 4.08, 1813, 7.41, 3, 9, 'blue', 15.2),
-  ('e4763b55-3828-4ede-b80b-53ca7f7b38e9', 'aaaaaaaa-0031-0031-0031-000000000031', '2026-01-22', '2026-01-22 06:50:00+00', '2026-01-22 07:51:38+00', 13.43, 3698, 4.59, 25, 75, 'red', 14.7),
-  ('f5e05022-8838-4a8b-ae1e-f7c9effa0f03', 'aaaaaaaa-0029-0029-0029-000000000029', '2026-01-22', '2026-01-22 11:47:00+00', '2026-01-22 12:33:12+00', 7.78, 2772, 5.94, 10, 40, 'red', 6.3),
-  ('15e74b51-b329-4f23-a89d-e8dd46a69988', 'aaaaaaaa-0069-0069-0069-000000000069', '2026-01-22', '2026-01-22 16:32:00+00', '2026-01-22 17:15:43+00', 5.48, 2623, 7.98, 8, 24, 'blue', 18.6),
-  ('03ac7bb9-90e7-4b9d-b149-24b978aea861', 'aaaaaaaa-0044-0044-0044-000000000044', '2026-01-22', '2026-01-22 18:43:00+00', '2026-01-22 20:06:57+00', 13.72, 5037, 6.12, 17, 17, 'blue', 15.3),
-  ('ccd66ac8-6748-44c2-a47f-f067a93bc4ed', 'aaaaaaaa-0009-0009-0009-000000000009', '2026-01-22', '2026-01-22 05:44:00+00', '2026-01-22 06:28:36+00', 7.16, 2676, 6.23, 11, 22, 'red', 10.7),
-  ('b4af7ebd-14b5-4410-a059-7c5e4130bd43', 'aaaaaaaa-0076-0076-0076-000000000076', '2026-01-22', '2026-01-22 07:20:00+00', '2026-01-22 07:56:36+00', 5.82, 2196, 6.29, 5, 15, 'blue', 16.8),
-  ('3b51b15e-47c3-45e4-8f3d-df9b5f3b7976', 'aaaaaaaa-0058-0058-0058-000000000058', '2026-01-22', '2026-01-22 13:01:00+00', '2026-01-22 14:09:52+00', 8.63, 4132, 7.98, 7, 7, 'blue', 9.0),
-  ('ed8b624d-2fbd-48e4-8f02-0fc12f2510a8', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-01-22', '2026-01-22 05:23:00+00', '2026-01-22 06:46:57+00', 11.12, 5037, 7.55, 11, 22, 'blue', 13.4),
-  ('7f940b7c-4085-4b79-8af8-9cbc6ba7ce8a', 'aaaaaaaa-0036-0036-0036-000000000036', '2026-01-22', '2026-01-22 05:47:00+00', '2026-01-22 06:30:36+00', 9.2, 2616, 4.74, 17, 68, 'red', 24.5),
-  ('3c1e862c-d200-4cbf-b1cb-df9e246f2c00', 'aaaaaaaa-0087-0087-0087-000000000087', '2026-01-22', '2026-01-22 18:41:00+00', '2026-01-22 19:18:41+00', 6.52, 2261, 5.78, 15, 45, 'purple', 13.9),
-  ('91b77cfd-ae1a-44e5-8fa4-be85f3624c4f', 'aaaaaaaa-0063-0063-0063-000000000063', '2026-01-22', '2026-01-22 16:04:00+00', '2026-01-22 16:37:01+00', 4.25, 1981, 7.77, 5, 10, 'blue', 15.3),
-  ('bdc09125-2446-4d63-8d49-6a42a4e84ffc', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-01-22', '2026-01-22 15:33:00+00', '2026-01-22 16:14:50+00', 6.76, 2510, 6.19, 11, 33, 'red', 19.8),
-  ('acd9cb2e-5a6f-4816-b6a9-30e0b6594248', 'aaaaaaaa-0089-0089-0089-000000000089', '2026-01-22', '2026-01-22 13:33:00+00', '2026-01-22 14:44:08+00', 10.4, 4268, 6.84, 23, 23, 'purple', 16.7),
-  ('8ab885d0-f006-40d8-940e-15e926238cf3', 'aaaaaaaa-0023-0023-0023-000000000023', '2026-01-22', '2026-01-22 13:01:00+00', '2026-01-22 13:56:53+00', 10.98, 3353, 5.09, 17, 17, 'red', 18.9),
-  ('334191d2-3f71-4f61-905c-c70af9ff0a58', 'aaaaaaaa-0003-0003-0003-000000000003', '2026-01-22', '2026-01-22 10:06:00+00', '2026-01-22 10:30:42+00', 4.5, 1482, 5.49, 7, 7, 'red', 21.5),
-  ('43cca92e-edc3-4094-a4d1-bdca8095b8fb', 'aaaaaaaa-0042-0042-0042-000000000042', '2026-01-22', '2026-01-22 17:00:00+00', '2026-01-22 18:36:52+00', 12.11, 5812, 8.0, 23, 23, 'blue', 5.1),
-  ('777c5a81-47f7-4f43-9313-d37d17ed541a', 'aaaaaaaa-0026-0026-0026-000000000026', '2026-01-22', '2026-01-22 11:50:00+00', '2026-01-22 12:56:18+00', 13.21, 3978, 5.02, 23, 69, 'red', 8.4),
-  ('f8e6a488-eed2-42cc-95a3-96300198a54c', 'aaaaaaaa-0048-0048-0048-000000000048', '2026-01-22', '2026-01-22 09:43:00+00', '2026-01-22 11:20:21+00', 13.54, 5841, 7.19, 24, 48, 'blue', 21.6),
-  ('24d6698b-30e6-4a93-a7b1-d972a6f63810', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-01-22', '2026-01-22 12:57:00+00', '2026-01-22 14:01:57+00', 10.31, 3897, 6.3, 12, 24, 'blue', 10.8),
-  ('bb15b13c-8311-4771-9b82-ffe6066f6996', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-01-22', '2026-01-22 05:26:00+00', '2026-01-22 05:59:46+00', 5.31, 2026, 6.36, 11, 11, 'purple', 16.5),
-  ('7e99561c-d340-4853-89c9-26c1622778a1', 'aaaaaaaa-0034-0034-0034-000000000034', '2026-01-22', '2026-01-22 13:06:00+00', '2026-01-22 13:26:26+00', 3.69, 1226, 5.54, 7, 14, 'red', 22.1),
-  ('28cd579d-51a7-461e-9e09-689940748229', 'aaaaaaaa-0000-0000-0000-000000000000', '2026-01-22', '2026-01-22 20:45:00+00', '2026-01-22 22:36:00+00', 14.92, 6660, 7.44, 25, 100, 'red', 9.2),
-  ('15d88969-3bfd-4b18-aecb-511507fc316c', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-01-22', '2026-01-22 15:03:00+00', '2026-01-22 15:57:33+00', 8.18, 3273, 6.67, 18, 54, 'purple', 10.6),
-  ('c0219d7e-e71b-4d70-841a-10edf7afba27', 'aaaaaaaa-0064-0064-0064-000000000064', '2026-01-22', '2026-01-22 17:12:00+00', '2026-01-22 17:32:09+00', 4.14, 1209, 4.87, 7, 21, 'blue', 20.7),
-  ('70af90c3-43c7-4e68-92b6-89f6c506d671', 'aaaaaaaa-0074-0074-0074-000000000074', '2026-01-23', '2026-01-23 17:56:00+00', '2026-01-23 19:13:47+00', 12.31, 4667, 6.32, 22, 66, 'blue', 19.8),
-  ('a227d0a8-ef85-40ce-85d5-169cf79e1400', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-01-23', '2026-01-23 06:36:00+00', '2026-01-23 07:46:39+00', 12.8, 4239, 5.52, 14, 42, 'blue', 24.1),
-  ('0dd98376-acee-4703-9a02-598d026e23fb', 'aaaaaaaa-0091-0091-0091-000000000091', '2026-01-23', '2026-01-23 15:04:00+00', '2026-01-23 16:11:12+00', 11.09, 4032, 6.06, 24, 24, 'purple', 16.9),
-  ('cb1b3d19-5150-454d-baa0-964d8471fb02', 'aaaaaaaa-0068-0068-0068-000000000068', '2026-01-23', '2026-01-23 11:16:00+00', '2026-01-23 11:38:49+00', 4.34, 1369, 5.26, 4, 8, 'blue', 23.0),
-  ('3e2cb614-3fcf-4219-bb64-3d672b8dd885', 'aaaaaaaa-0062-0062-0062-000000000062', '2026-01-23', '2026-01-23 07:29:00+00', '2026-01-23 09:08:36+00', 13.74, 5976, 7.25, 16, 48, 'blue', 5.9),
-  ('a968b4ef-15c7-4294-ab92-760b2b557ac8', 'aaaaaaaa-0069-0069-0069-000000000069', '2026-01-23', '2026-01-23 16:48:00+00', '2026-01-23 17:15:41+00', 3.56, 1661, 7.78, 1, 1, 'blue', 9.4),
-  ('b03df288-9779-4f0d-9a44-4f26392b66e6', 'aaaaaaaa-0064-0064-0064-000000000064', '2026-01-23', '2026-01-23 05:30:00+00', '2026-01-23 06:05:23+00', 4.56, 2123, 7.76, 2, 6, 'blue', 21.6),
-  ('02938af5-a1a0-45a2-a475-dbe6ef8a1b63', 'aaaaaaaa-0038-0038-0038-000000000038', '2026-01-23', '2026-01-23 05:03:00+00', '2026-01-23 06:47:32+00', 14.6, 6272, 7.16, 26, 52, 'red', 19.4),
-  ('aae9f2bf-1a99-4e45-839e-85d1de44efd9', 'aaaaaaaa-0022-0022-0022-000000000022', '2026-01-23', '2026-01-23 19:29:00+00', '2026-01-23 20:23:29+00', 10.48, 3269, 5.2, 14, 56, 'red', 6.2),
-  ('70734566-8736-41c3-8567-a27319b4518a', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-01-23', '2026-01-23 11:49:00+00', '2026-01-23 12:27:06+00', 8.09, 2286, 4.71, 11, 22, 'red', 10.9),
-  ('1d4b4eda-adde-450e-a685-a203f063d117', 'aaaaaaaa-0085-0085-0085-000000000085', '2026-01-23', '2026-01-23 07:30:00+00', '2026-01-23 08:23:45+00', 11.04, 3225, 4.87, 25, 50, 'purple', 24.6),
-  ('82f017ca-a7d1-4e56-8229-4d479fce119d', 'aaaaaaaa-0036-0036-0036-000000000036', '2026-01-23', '2026-01-23 12:22:00+00', '2026-01-23 13:22:58+00', 7.66, 3658, 7.96, 17, 34, 'red', 11.0),
-  ('873763b4-daf5-4fae-8cc7-45e32bbd1251', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-01-23', '2026-01-23 16:48:00+00', '2026-01-23 18:19:54+00', 14.36, 5514, 6.4, 26, 52, 'blue', 12.7),
-  ('acc9ed4d-abde-40ef-a07f-8710748676d8', 'aaaaaaaa-0042-0042-0042-000000000042', '2026-01-23', '2026-01-23 18:31:00+00', '2026-01-23 18:47:00+00', 2.33, 960, 6.87, 4, 4, 'blue', 14.9),
-  ('b8b0988e-36b7-43a3-9f61-d5d875094c16', 'aaaaaaaa-0080-0080-0080-000000000080', '2026-01-23', '2026-01-23 20:36:00+00', '2026-01-23 21:47:07+00', 9.73, 4267, 7.31, 23, 23, 'purple', 8.7),
-  ('686e8ccc-d55f-4e2a-bde8-363510765d9d', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-01-23', '2026-01-23 18:10:00+00', '2026-01-23 19:18:22+00', 13.62, 4102, 5.02, 17, 51, 'blue', 20.5),
-  ('262ed988-6736-4e80-bbd0-a9381a1b3a3a', 'aaaaaaaa-0071-0071-0071-000000000071', '2026-01-23', '2026-01-23 21:47:00+00', '2026-01-23 22:39:59+00', 9.74, 3179, 5.44, 15, 30, 'blue', 23.9),
-  ('9013b71a-958e-485f-8e3c-426de865bfb2', 'aaaaaaaa-0031-0031-0031-000000000031', '2026-01-23', '2026-01-23 07:09:00+00', '2026-01-23 08:16:00+00', 9.74, 4020, 6.88, 21, 42, 'red', 22.9),
-  ('df75065f-c406-4988-b343-fd56df4aaafd', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-01-23', '2026-01-23 12:08:00+00', '2026-01-23 12:34:41+00', 4.89, 1601, 5.46, 7, 21, 'blue', 13.0),
-  ('1c8ca6ce-aec9-4cba-8030-ccfc6fd6e252', 'aaaaaaaa-0093-0093-0093-000000000093', '2026-01-23', '2026-01-23 11:39:00+00', '2026-01-23 13:03:31+00', 11.5, 5071, 7.35, 25, 25, 'purple', 3.9),
-  ('269dcf70-79bf-4f3b-9bfb-97400fd921c0', 'aaaaaaaa-0076-0076-0076-000000000076', '2026-01-23', '2026-01-23 17:51:00+00', '2026-01-23 18:30:17+00', 5.05, 2357, 7.78, 7, 21, 'blue', 23.0),
-  ('f98cf6b8-e574-49ac-acb4-41a17bfaf6cd', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-01-23', '2026-01-23 20:12:00+00', '2026-01-23 20:32:45+00', 4.03, 1245, 5.15, 6, 12, 'red', 18.5),
-  ('b77a0ee9-1887-4576-bad4-3f2dbde1be77', 'aaaaaaaa-0057-0057-0057-000000000057', '2026-01-23', '2026-01-23 06:28:00+00', '2026-01-23 07:30:42+00', 8.05, 3762, 7.79, 11, 22, 'blue', 8.4),
-  ('965f3175-e354-4bc2-ac50-8bc381869a4b', 'aaaaaaaa-0060-0060-0060-000000000060', '2026-01-23', '2026-01-23 15:13:00+00', '2026-01-23 16:26:39+00', 11.16, 4419, 6.6, 11, 22, 'blue', 6.5),
-  ('ef194322-6f4c-448f-9abe-bd9320305445', 'aaaaaaaa-0007-0007-0007-000000000007', '2026-01-23', '2026-01-23 18:33:00+00', '2026-01-23 19:44:20+00', 9.59, 4280, 7.44, 16, 32, 'red', 24.1),
-  ('4b815a48-9b94-4f5d-b069-23a187f6d651', 'aaaaaaaa-0049-0049-0049-000000000049', '2026-01-23', '2026-01-23 08:20:00+00', '2026-01-23 08:52:08+00', 4.82, 1928, 6.67, 4, 4, 'blue', 11.2),
-  ('748961ec-91a2-414c-82d7-8dbd11b53ce2', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-01-23', '2026-01-23 20:15:00+00', '2026-01-23 20:52:43+00', 7.05, 2263, 5.35, 7, 7, 'blue', 12.9),
-  ('2fd513ed-cd11-4672-b4d0-53612944747b', 'aaaaaaaa-0082-0082-0082-000000000082', '2026-01-23', '2026-01-23 18:35:00+00', '2026-01-23 18:50:25+00', 2.03, 925, 7.6, 5, 5, 'purple', 18.1),
-  ('d38a3413-1780-4d98-a72e-e9220178366b', 'aaaaaaaa-0097-0097-0097-000000000097', '2026-01-23', '2026-01-23 16:59:00+00', '2026-01-23 17:40:36+00', 5.39, 2496, 7.72, 13, 26, 'purple', 7.5),
-  ('435e50be-d4e5-4c96-bcff-21e118248e73', 'aaaaaaaa-0067-0067-0067-000000000067', '2026-01-23', '2026-01-23 07:01:00+00', '2026-01-23 07:38:39+00', 6.55, 2259, 5.75, 9, 27, 'blue', 20.3),
-  ('bc78cc06-9aa6-4eff-b120-36701e76d005', 'aaaaaaaa-0043-0043-0043-000000000043', '2026-01-23', '2026-01-23 17:24:00+00', '2026-01-23 18:42:12+00', 10.17, 4692, 7.69, 10, 10, 'blue', 20.7),
-  ('de5bb9a2-3bd1-4f96-aab0-dfaed95dbf0c', 'aaaaaaaa-0030-0030-0030-000000000030', '2026-01-23', '2026-01-23 07:14:00+00', '2026-01-23 07:28:55+00', 2.18, 895, 6.85, 3, 12, 'red', 12.4),
-  ('edaa02e4-a3cb-4e73-a34f-3a25f62fe6c9', 'aaaaaaaa-0016-0016-0016-000000000016', '2026-01-23', '2026-01-23 11:35:00+00', '2026-01-23 12:22:30+00', 10.42, 2850, 4.56, 19, 76, 'red', 9.1),
-  ('7d8a40a0-d9b3-4a32-a93a-92c7e639f281', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-01-23', '2026-01-23 14:55:00+00', '2026-01-23 15:21:42+00', 4.83, 1602, 5.53, 7, 7, 'red', 6.1),
-  ('b94f3cac-24d4-49f6-90a0-d68af6f89fef', 'aaaaaaaa-0019-0019-0019-000000000019', '2026-01-23', '2026-01-23 11:04:00+00', '2026-01-23 11:57:15+00', 10.36, 3195, 5.14, 14, 56, 'red', 9.0),
-  ('0ef96c0b-34a7-4651-aefb-96825a506969', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-01-23', '2026-01-23 13:59:00+00', '2026-01-23 14:37:32+00', 8.47, 2312, 4.55, 15, 30, 'blue', 16.0),
-  ('8198ad75-3aad-406e-bba7-7c2c89271a71', 'aaaaaaaa-0078-0078-0078-000000000078', '2026-01-23', '2026-01-23 14:31:00+00', '2026-01-23 15:29:24+00', 7.32, 3504, 7.98, 11, 22, 'blue', 11.1),
-  ('f354c0a6-ccbf-4dd4-a547-8c43050f69b4', 'aaaaaaaa-0026-0026-0026-000000000026', '2026-01-23', '2026-01-23 17:52:00+00', '2026-01-23 18:18:06+00', 5.64, 1566, 4.63, 9, 18, 'red', 4.3),
-  ('0c5948d9-2c8b-4d9e-b18f-ddc34a8cba68', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-01-23', '2026-01-23 10:27:00+00', '2026-01-23 10:49:46+00', 3.07, 1366, 7.42, 2, 6, 'red', 19.9),
-  ('f59d8679-aa98-4acc-b534-649c32b64be0', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-01-23', '2026-01-23 06:16:00+00', '2026-01-23 06:58:36+00', 5.4, 2556, 7.89, 8, 24, 'blue', 18.0),
-  ('858195a7-0a08-4ad3-9567-cb608586ebb2', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-01-23', '2026-01-23 08:12:00+00', '2026-01-23 09:12:19+00', 9.73, 3619, 6.2, 22, 44, 'purple', 12.4),
-  ('8f5a11c3-b27f-432d-8282-c2347417972a', 'aaaaaaaa-0045-0045-0045-000000000045', '2026-01-23', '2026-01-23 16:17:00+00', '2026-01-23 16:53:07+00', 6.58, 2167, 5.49, 7, 21, 'blue', 10.2),
-  ('f283358c-3a9b-4ed0-a1a5-428a8a25717d', 'aaaaaaaa-0086-0086-0086-000000000086', '2026-01-23', '2026-01-23 09:56:00+00', '2026-01-23 11:42:22+00', 14.09, 6382, 7.55, 29, 29, 'purple', 16.8),
-  ('3be315d5-0661-4f9a-842c-593e4056d7cf', 'aaaaaaaa-0058-0058-0058-000000000058', '2026-01-23', '2026-01-23 11:50:00+00', '2026-01-23 12:34:25+00', 7.32, 2665, 6.07, 11, 33, 'blue', 23.1),
-  ('98d729d8-6488-4739-a3f8-00796685c555', 'aaaaaaaa-0041-0041-0041-000000000041', '2026-01-23', '2026-01-23 15:14:00+00', '2026-01-23 15:31:34+00', 2.95, 1054, 5.96, 4, 4, 'blue', 10.6),
-  ('71724300-1acb-43ca-a65c-82ae494f75ab', 'aaaaaaaa-0096-0096-0096-000000000096', '2026-01-23', '2026-01-23 12:12:00+00', '2026-01-23 12:55:24+00', 7.26, 2604, 5.98, 10, 10, 'purple', 12.7),
-  ('7aa8f0d8-71ff-490d-b188-ef59bb3dda51', 'aaaaaaaa-0037-0037-0037-000000000037', '2026-01-23', '2026-01-23 09:34:00+00', '2026-01-23 10:05:14+00', 4.6, 1874, 6.79, 9, 36, 'red', 20.5),
-  ('e24154d7-2a67-422f-9a85-77ba33687489', 'aaaaaaaa-0018-0018-0018-000000000018', '2026-01-23', '2026-01-23 13:49:00+00', '2026-01-23 14:02:34+00', 2.76, 814, 4.92, 6, 18, 'red', 16.1),
-  ('325caac6-2818-48e5-ad99-3107af894472', 'aaaaaaaa-0087-0087-0087-000000000087', '2026-01-23', '2026-01-23 15:06:00+00', '2026-01-23 16:49:04+00', 13.51, 6184, 7.63, 20, 20, 'purple', 15.4),
-  ('3f46faa1-c99a-4ac6-afe9-aa9d84e90924', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-01-23', '2026-01-23 21:25:00+00', '2026-01-23 22:31:13+00', 10.3, 3973, 6.43, 7, 14, 'purple', 18.3),
-  ('90f9de74-537c-418a-9d33-87ffc8a10517', 'aaaaaaaa-0028-0028-0028-000000000028', '2026-01-23', '2026-01-23 11:37:00+00', '2026-01-23 12:20:13+00', 7.44, 2593, 5.81, 17, 51, 'red', 24.6),
-  ('5eb2fe94-5d40-427b-bd95-c6d883de497d', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-01-23', '2026-01-23 17:50:00+00', '2026-01-23 18:04:52+00', 2.23, 892, 6.67, 3, 3, 'blue', 16.3),
-  ('a55b1cfb-8eee-427c-909d-cdac9474e2a8', 'aaaaaaaa-0099-0099-0099-000000000099', '2026-01-23', '2026-01-23 21:45:00+00', '2026-01-23 21:56:22+00', 2.51, 682, 4.53, 3, 9, 'purple', 6.9),
-  ('3e08e2f9-a9ad-48c6-a408-ca44a862b411', 'aaaaaaaa-0033-0033-0033-000000000033', '2026-01-23', '2026-01-23 14:15:00+00', '2026-01-23 15:11:49+00', 8.95, 3409, 6.35, 18, 54, 'red', 6.8),
-  ('f9bf1faa-06a9-4501-9502-b0d7c8b52e2c', 'aaaaaaaa-0077-0077-0077-000000000077', '2026-01-23', '2026-01-23 12:34:00+00', '2026-01-23 13:38:46+00', 10.33, 3886, 6.27, 17, 51, 'blue', 11.8),
-  ('88d5e9b7-8d2f-4d34-90c8-16ae4d6cd0c6', 'aaaaaaaa-0004-0004-0004-000000000004', '2026-01-24', '2026-01-24 11:06:00+00', '2026-01-24 11:43:19+00', 4.69, 2239, 7.96, 6, 12, 'red', 19.4),
-  ('878bf7a8-a2ac-49d5-a7a9-50077fcf376b', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-01-24', '2026-01-24 13:02:00+00', '2026-01-24 13:14:56+00', 2.1, 776, 6.16, 3, 12, 'red', 18.2),
-  ('932d52d7-f576-472a-877f-44e8836b36fe', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-01-24', '2026-01-24 16:38:00+00', '2026-01-24 17:09:03+00', 6.35, 1863, 4.89, 13, 13, 'purple', 17.6),
-  ('47bea03f-4a34-4a2a-94fc-dd0486d08957', 'aaaaaaaa-0063-0063-0063-000000000063', '2026-01-24', '2026-01-24 10:18:00+00', '2026-01-24 10:59:49+00', 6.8, 2509, 6.15, 14, 14, 'blue', 12.5),
-  ('8cc3a904-239c-4490-85c1-679125c2f666', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-01-24', '2026-01-24 19:58:00+00', '2026-01-24 21:13:15+00', 9.55, 4515, 7.88, 12, 36, 'purple', 11.1),
-  ('e8a1b3e7-086f-4386-8fcc-17814419a9be', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-01-24', '2026-01-24 19:13:00+00', '2026-01-24 20:14:10+00', 8.79, 3670, 6.96, 14, 28, 'blue', 21.6),
-  ('7ce6248b-b5de-4707-bb9c-abe3640ab899', 'aaaaaaaa-0099-0099-0099-000000000099', '2026-01-24', '2026-01-24 15:19:00+00', '2026-01-24 15:39:20+00', 2.97, 1220, 6.85, 3, 6, 'purple', 7.5),
-  ('6e02040e-8815-45f8-b33c-1195c97df924', 'aaaaaaaa-0078-0078-0078-000000000078', '2026-01-24', '2026-01-24 18:16:00+00', '2026-01-24 19:33:11+00', 13.76, 4631, 5.61, 25, 50, 'blue', 4.2),
-  ('3937967b-b39d-45dc-a49b-8a593bcc4e08', 'aaaaaaaa-0074-0074-0074-000000000074', '2026-01-24', '2026-01-24 19:35:00+00', '2026-01-24 19:45:11+00', 2.16, 611, 4.72, 1, 3, 'blue', 4.4),
-  ('781497ad-9b09-487a-b965-d0d5b21535d5', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-01-24', '2026-01-24 21:51:00+00', '2026-01-24 22:54:33+00', 12.66, 3813, 5.02, 27, 54, 'red', 9.4),
-  ('4f672e57-a7df-4289-b946-9ee01606629d', 'aaaaaaaa-0024-0024-0024-000000000024', '2026-01-24', '2026-01-24 18:47:00+00', '2026-01-24 20:21:30+00', 14.34, 5670, 6.59, 24, 72, 'red', 10.6),
-  ('2bff483b-211a-48a2-bab4-5e7fe7ba4179', 'aaaaaaaa-0014-0014-0014-000000000014', '2026-01-24', '2026-01-24 12:27:00+00', '2026-01-24 13:39:13+00', 13.5, 4333, 5.35, 18, 72, 'red', 5.3),
-  ('176fe40b-a9b4-40f1-ab7a-e055a03d89d9', 'aaaaaaaa-0056-0056-0056-000000000056', '2026-01-24', '2026-01-24 16:30:00+00', '2026-01-24 17:43:14+00', 11.87, 4394, 6.17, 20, 60, 'blue', 5.1),
-  ('f1990b33-f351-4b6a-968c-fc06d33c1e29', 'aaaaaaaa-0018-0018-0018-000000000018', '2026-01-24', '2026-01-24 19:59:00+00', '2026-01-24 21:09:27+00', 13.98, 4227, 5.04, 23, 23, 'red', 4.5),
-  ('edf591b4-253f-473d-9d5c-6b61b0daf895', 'aaaaaaaa-0012-0012-0012-000000000012', '2026-01-24', '2026-01-24 11:17:00+00', '2026-01-24 12:20:15+00', 9.57, 3795, 6.61, 7, 7, 'red', 22.3),
-  ('b3e0f323-0b22-4700-9db2-e9b7069102f4', 'aaaaaaaa-0080-0080-0080-000000000080', '2026-01-24', '2026-01-24 15:36:00+00', '2026-01-24 16:52:41+00', 12.29, 4601, 6.24, 28, 84, 'purple', 18.6),
-  ('60ebb867-004d-4a58-8971-f066ad69aa86', 'aaaaaaaa-0009-0009-0009-000000000009', '2026-01-24', '2026-01-24 17:18:00+00', '2026-01-24 17:47:37+00', 3.77, 1777, 7.86, 3, 6, 'red', 20.5),
-  ('56e7a812-1a66-4549-8dee-073d5c377fe1', 'aaaaaaaa-0029-0029-0029-000000000029', '2026-01-24', '2026-01-24 10:55:00+00', '2026-01-24 11:50:09+00', 10.73, 3309, 5.14, 15, 15, 'red', 7.6),
-  ('394e6294-3613-46f0-8634-76b1139a35e7', 'aaaaaaaa-0046-0046-0046-000000000046', '2026-01-24', '2026-01-24 15:56:00+00', '2026-01-24 16:38:33+00', 5.38, 2553, 7.91, 11, 33, 'blue', 9.1),
-  ('f0db936f-c80f-49b7-8f9c-62c4fb479dba', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-01-24', '2026-01-24 16:06:00+00', '2026-01-24 17:27:37+00', 11.15, 4897, 7.32, 19, 19, 'blue', 4.3),
-  ('0e32b74b-e388-4068-a720-de803e964519', 'aaaaaaaa-0064-0064-0064-000000000064', '2026-01-24', '2026-01-24 15:19:00+00', '2026-01-24 16:07:10+00', 10.12, 2890, 4.76, 15, 30, 'blue', 12.9),
-  ('4286b7c1-20e3-4cd8-8260-f73ccd776072', 'aaaaaaaa-0000-0000-0000-000000000000', '2026-01-24', '2026-01-24 11:58:00+00', '2026-01-24 12:16:04+00', 2.41, 1084, 7.5, 3, 6, 'red', 22.4),
-  ('28ae9401-9691-4c00-beed-9071ce0d0ee2', 'aaaaaaaa-0036-0036-0036-000000000036', '2026-01-24', '2026-01-24 10:21:00+00', '2026-01-24 10:59:10+00', 5.43, 2290, 7.03, 4, 16, 'red', 17.7),
-  ('f6091fcf-c062-4b92-b318-0b35c11440e2', 'aaaaaaaa-0089-0089-0089-000000000089', '2026-01-24', '2026-01-24 18:44:00+00', '2026-01-24 19:45:35+00', 8.7, 3695, 7.08, 19, 19, 'purple', 7.8),
-  ('e5f192fd-972d-486b-99c4-c32b728a69f5', 'aaaaaaaa-0026-0026-0026-000000000026', '2026-01-24', '2026-01-24 11:16:00+00', '2026-01-24 11:31:37+00', 3.21, 937, 4.87, 3, 3, 'red', 24.2),
-  ('8a6cceb0-d12d-47a6-a5a7-ab2b60ecaf7c', 'aaaaaaaa-0030-0030-0030-000000000030', '2026-01-24', '2026-01-24 14:27:00+00', '2026-01-24 15:24:55+00', 10.91, 3475, 5.31, 16, 32, 'red', 13.8),
-  ('7c2145c4-3a7e-41f7-926f-3f7ac91e9127', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-01-24', '2026-01-24 15:00:00+00', '2026-01-24 16:11:56+00', 9.27, 4316, 7.76, 18, 54, 'purple', 8.4),
-  ('4714afd3-3849-4019-b71f-24705d4f82e1', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-01-24', '2026-01-24 12:02:00+00', '2026-01-24 13:31:07+00', 13.97, 5347, 6.38, 26, 52, 'blue', 15.5),
-  ('631ef2ba-e2e3-4f82-a8ce-dba26e6354bb', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-01-24', '2026-01-24 14:46:00+00', '2026-01-24 15:50:12+00', 14.02, 3852, 4.58, 22, 22, 'blue', 7.9),
-  ('17a1b1a1-33f6-4f79-9708-20fabdaec499', 'aaaaaaaa-0071-0071-0071-000000000071', '2026-01-24', '2026-01-24 16:36:00+00', '2026-01-24 18:22:52+00', 14.58, 6412, 7.33, 18, 18, 'blue', 10.7),
-  ('8b914ae6-2f21-4902-a041-0b1f9aae4bb6', 'aaaaaaaa-0033-0033-0033-000000000033', '2026-01-24', '2026-01-24 08:37:00+00', '2026-01-24 09:05:48+00', 6.29, 1728, 4.58, 12, 24, 'red', 8.3),
-  ('35e3c53c-e08b-424c-8df4-84a5b5cf7626', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-01-24', '2026-01-24 10:32:00+00', '2026-01-24 11:20:57+00', 7.96, 2937, 6.15, 15, 30, 'red', 6.6),
-  ('5773125e-c1f2-4a11-a5c2-6372c14c387c', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-01-24', '2026-01-24 20:26:00+00', '2026-01-24 21:30:36+00', 13.63, 3876, 4.74, 19, 57, 'blue', 4.9),
-  ('90663247-7724-46eb-87c4-ff7476a1e781', 'aaaaaaaa-0090-0090-0090-000000000090', '2026-01-24', '2026-01-24 10:24:00+00', '2026-01-24 11:57:10+00', 12.44, 5590, 7.49, 29, 58, 'purple', 13.3),
-  ('271ea814-a502-4779-af53-2e2e6958d217', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-01-24', '2026-01-24 06:08:00+00', '2026-01-24 07:11:43+00', 12.9, 3823, 4.94, 26, 104, 'red', 15.7),
-  ('77ad9493-8c1a-45d7-bfb6-adfa4cf2b5ae', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-01-24', '2026-01-24 11:49:00+00', '2026-01-24 13:45:39+00', 14.6, 6999, 7.99, 19, 57, 'red', 19.5),
-  ('763e7db2-fb38-48b4-b45b-71def5f08269', 'aaaaaaaa-0051-0051-0051-000000000051', '2026-01-24', '2026-01-24 15:43:00+00', '2026-01-24 15:55:55+00', 2.13, 775, 6.07, 3, 6, 'blue', 13.3),
-  ('a5c1be4d-6ab9-4c50-8863-e86278e97eac', 'aaaaaaaa-0098-0098-0098-000000000098', '2026-01-24', '2026-01-24 16:02:00+00', '2026-01-24 16:57:28+00', 8.6, 3328, 6.45, 19, 57, 'purple', 4.3),
-  ('97353a02-6af8-4c13-931d-30c29fa95b7e', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-01-24', '2026-01-24 21:16:00+00', '2026-01-24 21:32:57+00', 2.74, 1017, 6.19, 3, 12, 'red', 21.3),
-  ('bc7a9f15-a12e-494f-b363-5e7766a34195', 'aaaaaaaa-0087-0087-0087-000000000087', '2026-01-24', '2026-01-24 05:54:00+00', '2026-01-24 06:17:41+00', 3.81, 1421, 6.22, 4, 8, 'purple', 12.2),
-  ('3f89509b-e80e-4317-b28d-a7c2eb69a27e', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-01-24', '2026-01-24 10:48:00+00', '2026-01-24 12:07:09+00', 12.87, 4749, 6.15, 23, 46, 'blue', 6.8),
-  ('71777891-a87f-44bb-ac0e-53039f1b93da', 'aaaaaaaa-0043-0043-0043-000000000043', '2026-01-24', '2026-01-24 06:23:00+00', '2026-01-24 07:44:05+00', 12.14, 4865, 6.68, 25, 25, 'blue', 5.1),
-  ('b3387f81-de9b-4a08-a9c3-ffad399d92e5', 'aaaaaaaa-0085-0085-0085-000000000085', '2026-01-24', '2026-01-24 12:00:00+00', '2026-01-24 12:57:33+00', 9.84, 3453, 5.85, 20, 20, 'purple', 12.5),
-  ('df3c0974-47d5-4433-b873-a097c5b12809', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-01-24', '2026-01-24 10:54:00+00', '2026-01-24 12:23:01+00', 12.61, 5341, 7.06, 25, 25, 'red', 22.2),
-  ('2e89b184-6275-42e4-b034-b3fd4950721f', 'aaaaaaaa-0020-0020-0020-000000000020', '2026-01-24', '2026-01-24 21:03:00+00', '2026-01-24 21:56:21+00', 8.85, 3201, 6.03, 13, 13, 'red', 6.6),
-  ('ae2a13ea-14dc-47e9-88bf-e19fcbae1a2b', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-01-24', '2026-01-24 19:03:00+00', '2026-01-24 19:24:03+00', 3.83, 1263, 5.5, 3, 6, 'red', 8.8),
-  ('53fcce92-b9d0-46a0-a5ae-5797e7f56982', 'aaaaaaaa-0092-0092-0092-000000000092', '2026-01-24', '2026-01-24 16:26:00+00', '2026-01-24 17:42:10+00', 14.85, 4570, 5.13, 30, 60, 'purple', 11.0),
-  ('18b0419e-8f99-4295-956b-b0cd57dae72d', 'aaaaaaaa-0027-0027-0027-000000000027', '2026-01-24', '2026-01-24 10:58:00+00', '2026-01-24 12:43:02+00', 14.37, 6302, 7.31, 20, 20, 'red', 25.0),
-  ('ab948298-839f-4391-b53d-3dbc325e5e61', 'aaaaaaaa-0065-0065-0065-000000000065', '2026-01-24', '2026-01-24 11:51:00+00', '2026-01-24 13:09:16+00', 10.45, 4696, 7.49, 22, 66, 'blue', 24.5),
-  ('62d8967d-2d85-42d1-98fa-5527b8e9bd8e', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-01-24', '2026-01-24 21:10:00+00', '2026-01-24 22:51:53+00', 13.55, 6113, 7.52, 15, 45, 'blue', 20.5),
-  ('3eafecde-3e3f-4286-b2e6-37d0b1b58448', 'aaaaaaaa-0076-0076-0076-000000000076', '2026-01-24', '2026-01-24 14:05:00+00', '2026-01-24 14:58:00+00', 8.48, 3180, 6.25, 11, 22, 'blue', 20.5),
-  ('f77afeba-0a6a-4298-b71c-28cb6f1c1102', 'aaaaaaaa-0003-0003-0003-000000000003', '2026-01-24', '2026-01-24 09:55:00+00', '2026-01-24 11:40:18+00', 13.73, 6318, 7.67, 22, 66, 'red', 9.1),
-  ('b7762ec5-af63-4517-ae3d-256d90125a88', 'aaaaaaaa-0058-0058-0058-000000000058', '2026-01-24', '2026-01-24 16:48:00+00', '2026-01-24 17:50:17+00', 13.78, 3737, 4.52, 22, 44, 'blue', 24.5),
-  ('c6e19692-1fb2-4dc2-ac2a-5e372e4233b3', 'aaaaaaaa-0077-0077-0077-000000000077', '2026-01-24', '2026-01-24 08:23:00+00', '2026-01-24 10:04:21+00', 14.5, 6081, 6.99, 17, 17, 'blue', 14.8),
-  ('8ff92a54-459c-4733-8d99-cef03be0c0a1', 'aaaaaaaa-0022-0022-0022-000000000022', '2026-01-25', '2026-01-25 15:39:00+00', '2026-01-25 16:03:26+00', 3.93, 1466, 6.22, 6, 18, 'red', 17.5),
-  ('82ebfa5d-18ba-46b1-b95b-ab49b4f38511', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-01-25', '2026-01-25 16:15:00+00', '2026-01-25 17:04:51+00', 6.57, 2991, 7.59, 14, 14, 'purple', 5.3),
-  ('ed86bed4-f879-4f74-ab5f-6ccbc24451f2', 'aaaaaaaa-0046-0046-0046-000000000046', '2026-01-25', '2026-01-25 12:01:00+00', '2026-01-25 13:26:50+00', 14.75, 5150, 5.82, 19, 57, 'blue', 13.7),
-  ('1b681c69-ad3f-49b6-8f6c-fc5581394ec8', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-01-25', '2026-01-25 16:07:00+00', '2026-01-25 17:11:42+00', 11.83, 3882, 5.47, 9, 18, 'blue', 4.4),
-  ('5e8ca22c-d33e-4839-b597-2bd78c4964ed', 'aaaaaaaa-0062-0062-0062-000000000062', '2026-01-25', '2026-01-25 16:04:00+00', '2026-01-25 17:11:39+00', 14.97, 4059, 4.52, 13, 39, 'blue', 23.8),
-  ('8fa6890c-edda-491f-8af2-976e32737516', 'aaaaaaaa-0068-0068-0068-000000000068', '2026-01-25', '2026-01-25 08:56:00+00', '2026-01-25 09:31:36+00', 6.15, 2136, 5.79, 2, 2, 'blue', 4.2),
-  ('697288ac-fbb1-4149-a54b-29ad687d7859', 'aaaaaaaa-0028-0028-0028-000000000028', '2026-01-25', '2026-01-25 19:14:00+00', '2026-01-25 20:02:24+00', 8.9, 2904, 5.44, 20, 60, 'red', 14.3),
-  ('d016c52a-03d8-4e2d-92cd-5b28e289023d', 'aaaaaaaa-0025-0025-0025-000000000025', '2026-01-25', '2026-01-25 07:36:00+00', '2026-01-25 08:40:11+00', 8.64, 3851, 7.43, 18, 54, 'red', 7.5),
-  ('17aea24b-8059-4362-b9f8-34e5f5d5bc50', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-01-25', '2026-01-25 18:35:00+00', '2026-01-25 19:04:19+00', 4.88, 1759, 6.01, 4, 8, 'blue', 15.7),
-  ('eba5c565-e269-47b6-b635-d3a4495ed91b', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-01-25', '2026-01-25 05:39:00+00', '2026-01-25 06:47:50+00', 11.89, 4130, 5.79, 12, 24, 'blue', 19.6),
-  ('bc746177-6e3d-43a5-8406-7a34371da14d', 'aaaaaaaa-0035-0035-0035-000000000035', '2026-01-25', '2026-01-25 11:31:00+00', '2026-01-25 12:48:54+00', 11.44, 4674, 6.81, 24, 72, 'red', 13.9),
-  ('405cf351-c271-42b0-9e64-b4f8cc33fd64', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-01-25', '2026-01-25 10:18:00+00', '2026-01-25 10:39:14+00', 4.52, 1274, 4.7, 11, 33, 'purple', 15.2),
-  ('a4779396-3e03-40f9-aef5-eee14c282276', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-01-25', '2026-01-25 05:24:00+00', '2026-01-25 06:01:34+00', 8.03, 2254, 4.68, 12, 12, 'red', 18.1),
-  ('ab28befa-fe7e-48c3-87c8-12b416adfc41', 'aaaaaaaa-0067-0067-0067-000000000067', '2026-01-25', '2026-01-25 06:33:00+00', '2026-01-25 08:05:24+00', 12.08, 5544, 7.65, 20, 60, 'blue', 21.8),
-  ('791a600d-45c7-43f5-9c65-b86026b122e6', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-01-25', '2026-01-25 11:16:00+00', '2026-01-25 11:46:44+00', 4.76, 1844, 6.46, 4, 4, 'blue', 3.1),
-  ('56a8c2c4-e89f-4ab5-aaa4-292912cd0acc', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-01-25', '2026-01-25 12:40:00+00', '2026-01-25 13:34:01+00', 7.41, 3241, 7.29, 13, 39, 'red', 14.9),
-  ('a4f16b77-142a-4fee-8310-20c0b4834f86', 'aaaaaaaa-0021-0021-0021-000000000021', '2026-01-25', '2026-01-25 19:06:00+00', '2026-01-25 19:20:29+00', 2.32, 869, 6.25, 2, 4, 'red', 15.2),
-  ('93e56f41-4458-4d43-aab9-61ed9bc81c49', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-01-25', '2026-01-25 12:40:00+00', '2026-01-25 13:05:48+00', 3.65, 1548, 7.07, 5, 5, 'red', 22.2),
-  ('4be8a39b-2492-494b-b1f4-98d0e2a384c1', 'aaaaaaaa-0044-0044-0044-000000000044', '2026-01-25', '2026-01-25 13:45:00+00', '2026-01-25 14:45:00+00', 11.54, 3600, 5.2, 10, 30, 'blue', 4.7),
-  ('fab27480-94ad-4c12-8c0a-307797968f7b', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-01-25', '2026-01-25 13:02:00+00', '2026-01-25 14:16:55+00', 13.9, 4495, 5.39, 19, 57, 'blue', 3.3),
-  ('5829964a-25bb-45e8-91ae-808255b1bd9d', 'aaaaaaaa-0074-0074-0074-000000000074', '2026-01-25', '2026-01-25 13:27:00+00', '2026-01-25 14:01:56+00', 7.63, 2096, 4.58, 5, 10, 'blue', 9.9),
-  ('21c6c087-ed01-4df3-bf6a-f2856ba11d50', 'aaaaaaaa-0034-0034-0034-000000000034', '2026-01-25', '2026-01-25 06:46:00+00', '2026-01-25 08:00:01+00', 10.44, 4441, 7.09, 16, 16, 'red', 7.1),
-  ('be81b897-3514-4638-8575-68ea51311465', 'aaaaaaaa-0036-0036-0036-000000000036', '2026-01-25', '2026-01-25 07:00:00+00', '2026-01-25 07:22:08+00', 3.0, 1328, 7.38, 5, 5, 'red', 12.1),
-  ('6ba2e7a8-c26d-4e97-817f-381faa232031', 'aaaaaaaa-0090-0090-0090-000000000090', '2026-01-25', '2026-01-25 08:30:00+00', '2026-01-25 08:42:42+00', 2.61, 762, 4.87, 6, 6, 'purple', 11.6),
-  ('fb394a14-4e80-4edd-a9d6-39dd33f46afb', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-01-25', '2026-01-25 13:00:00+00', '2026-01-25 14:41:51+00', 13.51, 6111, 7.54, 16, 48, 'blue', 21.8),
-  ('93080e4d-0f78-4324-a33f-66d031818b7e', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-01-25', '2026-01-25 10:32:00+00', '2026-01-25 11:31:16+00', 10.31, 3556, 5.75, 23, 23, 'purple', 23.9),
-  ('1833bea9-4f98-46ac-af89-472973033ec4', 'aaaaaaaa-0069-0069-0069-000000000069', '2026-01-25', '2026-01-25 10:48:00+00', '2026-01-25 11:32:39+00', 6.86, 2679, 6.51, 7, 21, 'blue', 10.8),
-  ('44ac6cf2-5e02-4de7-962d-f1e33eb17858', 'aaaaaaaa-0003-0003-0003-000000000003', '2026-01-25', '2026-01-25 09:37:00+00', '2026-01-25 10:13:22+00', 4.97, 2182, 7.32, 8, 16, 'red', 5.2),
-  ('fb870b83-1a16-4e54-bcc8-b7825976fe85', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-01-25', '2026-01-25 12:04:00+00', '2026-01-25 13:07:33+00', 11.13, 3813, 5.71, 18, 36, 'red', 13.0),
-  ('acda917c-891d-4e4f-bb36-72657520cfb5', 'aaaaaaaa-0099-0099-0099-000000000099', '2026-01-25', '2026-01-25 07:23:00+00', '2026-01-25 08:00:29+00', 6.93, 2249, 5.41, 17, 34, 'purple', 5.7),
-  ('2df4bf36-92ff-4aae-b4f1-075fdc0115f6', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-01-25', '2026-01-25 20:13:00+00', '2026-01-25 21:41:34+00', 11.97, 5314, 7.4, 25, 75, 'purple', 19.4),
-  ('68ec0b5a-83f3-41ee-b889-1f3ea2de3650', 'aaaaaaaa-0043-0043-0043-000000000043', '2026-01-25', '2026-01-25 17:11:00+00', '2026-01-25 18:56:28+00', 14.96, 6328, 7.05, 27, 54, 'blue', 5.7),
-  ('18dc7129-1d2c-44dd-98de-6df52b2f4d77', 'aaaaaaaa-0051-0051-0051-000000000051', '2026-01-25', '2026-01-25 12:32:00+00', '2026-01-25 14:10:46+00', 14.11, 5926, 7.0, 20, 60, 'blue', 22.2),
-  ('727348bb-9887-48f7-b74f-be28e9acd00b', 'aaaaaaaa-0016-0016-0016-000000000016', '2026-01-25', '2026-01-25 07:39:00+00', '2026-01-25 09:03:27+00', 13.89, 5067, 6.08, 30, 120, 'red', 18.8),
-  ('45241460-d387-4ed8-8f58-acc96b000375', 'aaaaaaaa-0007-0007-0007-000000000007', '2026-01-25', '2026-01-25 17:38:00+00', '2026-01-25 19:09:12+00', 12.81, 5472, 7.12, 25, 100, 'red', 21.9),
-  ('31a39a83-fbcd-4e4b-8826-4a64c72a71e4', 'aaaaaaaa-0027-0027-0027-000000000027', '2026-01-25', '2026-01-25 07:04:00+00', '2026-01-25 07:37:15+00', 4.71, 1995, 7.06, 6, 12, 'red', 13.3),
-  ('d6363fb7-72d1-4485-9279-dcab48657e04', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-01-25', '2026-01-25 12:42:00+00', '2026-01-25 13:48:58+00', 11.71, 4018, 5.72, 20, 40, 'blue', 17.7),
-  ('b7c7bf50-e178-4ec2-bca7-d52ef568685e', 'aaaaaaaa-0087-0087-0087-000000000087', '2026-01-25', '2026-01-25 18:51:00+00', '2026-01-25 19:56:12+00', 10.27, 3912, 6.35, 23, 23, 'purple', 3.1),
-  ('08630edc-2940-4d66-8e04-84677fa183e8', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-01-25', '2026-01-25 17:23:00+00', '2026-01-25 18:07:10+00', 7.23, 2650, 6.11, 9, 27, 'blue', 11.3),
-  ('3235b9ce-9e8d-4d81-ae71-d0696457cb00', 'aaaaaaaa-0000-0000-0000-000000000000', '2026-01-25', '2026-01-25 05:20:00+00', '2026-01-25 06:48:48+00', 11.7, 5328, 7.59, 23, 46, 'red', 19.0),
-  ('ce6eb7cc-7420-4390-968a-b9c227e1d0df', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-01-25', '2026-01-25 17:07:00+00', '2026-01-25 17:42:09+00', 4.65, 2109, 7.56, 8, 24, 'blue', 9.5),
-  ('2a98f006-dea8-4612-a742-c38c386f1fdc', 'aaaaaaaa-0089-0089-0089-000000000089', '2026-01-25', '2026-01-25 18:43:00+00', '2026-01-25 19:13:52+00', 6.57, 1852, 4.7, 15, 30, 'purple', 5.5),
-  ('b94ec2f8-2476-44e3-8911-650f83f517ea', 'aaaaaaaa-0078-0078-0078-000000000078', '2026-01-25', '2026-01-25 09:38:00+00', '2026-01-25 10:08:31+00', 4.64, 1831, 6.58, 7, 7, 'blue', 24.5),
-  ('9f44f207-4ca3-486f-a22f-e90e02d92434', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-01-25', '2026-01-25 15:37:00+00', '2026-01-25 17:00:09+00', 13.22, 4989, 6.29, 27, 108, 'red', 3.4),
-  ('4dc613be-de8f-4f91-b179-9ebadea474d8', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-01-26', '2026-01-26 09:53:00+00', '2026-01-26 11:15:44+00', 12.01, 4964, 6.89, 15, 60, 'red', 15.0),
-  ('4135742c-20fa-4aca-8fa1-098d0bbf33cb', 'aaaaaaaa-0014-0014-0014-000000000014', '2026-01-26', '2026-01-26 07:47:00+00', '2026-01-26 08:37:17+00', 9.92, 3017, 5.07, 9, 27, 'red', 3.0),
-  ('87d527d2-0666-48dc-940e-f4cfed8b9889', 'aaaaaaaa-0024-0024-0024-000000000024', '2026-01-26', '2026-01-26 20:03:00+00', '2026-01-26 21:35:00+00', 12.22, 5520, 7.53, 12, 48, 'red', 5.0),
-  ('6f9a2fde-dd60-4ca9-be8e-d6110a0b25c9', 'aaaaaaaa-0027-0027-0027-000000000027', '2026-01-26', '2026-01-26 13:49:00+00', '2026-01-26 14:47:05+00', 8.91, 3485, 6.52, 4, 16, 'red', 21.7),
-  ('bd388b80-d6ef-4d3c-8a77-74633d17aea3', 'aaaaaaaa-0049-0049-0049-000000000049', '2026-01-26', '2026-01-26 16:00:00+00', '2026-01-26 16:26:00+00', 3.3, 1560, 7.88, 5, 10, 'blue', 22.1),
-  ('b3c8420f-dd38-48f2-82ac-7a73e8a9da2c', 'aaaaaaaa-0057-0057-0057-000000000057', '2026-01-26', '2026-01-26 11:56:00+00', '2026-01-26 12:40:56+00', 8.56, 2696, 5.25, 19, 38, 'blue', 13.9),
-  ('25b37c47-1b64-40fa-a0c2-5be60fe29362', 'aaaaaaaa-0019-0019-0019-000000000019', '2026-01-26', '2026-01-26 10:23:00+00', '2026-01-26 10:45:20+00', 4.89, 1340, 4.57, 4, 16, 'red', 12.2),
-  ('0199f360-cfdc-46be-888f-837b81d8aa3b', 'aaaaaaaa-0084-0084-0084-000000000084', '2026-01-26', '2026-01-26 16:12:00+00', '2026-01-26 17:25:06+00', 11.55, 4386, 6.33, 25, 25, 'purple', 19.5),
-  ('cdf6c025-6790-4792-abbc-a939842b8b9a', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-01-26', '2026-01-26 17:51:00+00', '2026-01-26 19:18:49+00', 13.05, 5269, 6.73, 14, 28, 'red', 12.9),
-  ('969e2c46-3689-45b6-9d89-bc32e029de7d', 'aaaaaaaa-0008-0008-0008-000000000008', '2026-01-26', '2026-01-26 11:38:00+00', '2026-01-26 12:55:42+00', 12.76, 4662, 6.09, 16, 64, 'red', 19.5),
-  ('e8bf3504-0d69-4339-b124-adc1d801bf6d', 'aaaaaaaa-0041-0041-0041-000000000041', '2026-01-26', '2026-01-26 17:38:00+00', '2026-01-26 18:33:38+00', 9.78, 3338, 5.69, 23, 46, 'blue', 3.8),
-  ('cb6f4edf-8a70-4582-ac63-7f75bf3cd03f', 'aaaaaaaa-0048-0048-0048-000000000048', '2026-01-26', '2026-01-26 05:43:00+00', '2026-01-26 06:32:37+00', 6.33, 2977, 7.84, 9, 27, 'blue', 19.6),
-  ('76b20f08-3f50-45f1-ba7c-664f7b7bcd4e', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-01-26', '2026-01-26 18:13:00+00', '2026-01-26 19:46:28+00', 14.56, 5608, 6.42, 31, 62, 'purple', 14.3),
-  ('1816da8f-f8f1-42d4-a751-89374b1a2a91', 'aaaaaaaa-0066-0066-0066-000000000066', '2026-01-26', '2026-01-26 19:19:00+00', '2026-01-26 20:54:39+00', 13.23, 5739, 7.23, 21, 42, 'blue', 7.9),
-  ('62f786b7-f064-4145-b137-1916f5cdd1ac', 'aaaaaaaa-0090-0090-0090-000000000090', '2026-01-26', '2026-01-26 07:55:00+00', '2026-01-26 08:32:01+00', 7.04, 2221, 5.26, 13, 39, 'purple', 5.9),
-  ('c2ec1a10-b234-4ebd-9006-1d9caac94c86', 'aaaaaaaa-0035-0035-0035-000000000035', '2026-01-26', '2026-01-26 19:10:00+00', '2026-01-26 19:26:59+00', 3.03, 1019, 5.61, 6, 12, 'red', 20.9),
-  ('87064232-1088-47f9-8a33-ea186babbb48', 'aaaaaaaa-0099-0099-0099-000000000099', '2026-01-26', '2026-01-26 17:05:00+00', '2026-01-26 18:09:27+00', 13.4, 3867, 4.81, 23, 46, 'purple', 22.5),
-  ('0f9ce307-6de8-44f1-b6d9-96e8a3fa09eb', 'aaaaaaaa-0068-0068-0068-000000000068', '2026-01-26', '2026-01-26 08:31:00+00', '2026-01-26 09:41:37+00', 13.25, 4237, 5.33, 24, 48, 'blue', 11.9),
-  ('9da76d1b-5e0f-4754-aba9-0ed7bc8dd678', 'aaaaaaaa-0020-0020-0020-000000000020', '2026-01-26', '2026-01-26 14:00:00+00', '2026-01-26 14:39:12+00', 5.18, 2352, 7.57, 9, 18, 'red', 11.0),
-  ('01d193be-d3d3-4a1e-9b84-13042d51487f', 'aaaaaaaa-0082-0082-0082-000000000082', '2026-01-26', '2026-01-26 05:44:00+00', '2026-01-26 06:23:39+00', 8.21, 2379, 4.83, 18, 54, 'purple', 21.5),
-  ('48f7f2f2-0888-4274-888c-f2b18015be45', 'aaaaaaaa-0023-0023-0023-000000000023', '2026-01-26', '2026-01-26 07:45:00+00', '2026-01-26 08:00:39+00', 2.15, 939, 7.28, 4, 4, 'red', 9.6),
-  ('087a31e5-8a18-465e-8cd1-dc2c9c490195', 'aaaaaaaa-0037-0037-0037-000000000037', '2026-01-26', '2026-01-26 21:06:00+00', '2026-01-26 21:44:06+00', 6.03, 2286, 6.32, 8, 8, 'red', 17.3),
-  ('75fc3479-9853-4661-ac2d-49267ca0cb04', 'aaaaaaaa-0051-0051-0051-000000000051', '2026-01-26', '2026-01-26 10:42:00+00', '2026-01-26 12:13:47+00', 11.92, 5507, 7.7, 22, 66, 'blue', 3.5),
-  ('b376d9ec-c587-4203-b681-9c32ea7fbc82', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-01-26', '2026-01-26 05:09:00+00', '2026-01-26 05:35:10+00', 3.89, 1570, 6.73, 7, 14, 'red', 14.3),
-  ('040e1185-f4d4-4409-8a47-e06a0931187c', 'aaaaaaaa-0015-0015-0015-000000000015', '2026-01-26', '2026-01-26 18:46:00+00', '2026-01-26 19:59:10+00', 13.55, 4390, 5.4, 21, 21, 'red', 24.3),
-  ('62a3638e-8f84-4798-b4ed-12e3eac9cd41', 'aaaaaaaa-0030-0030-0030-000000000030', '2026-01-26', '2026-01-26 09:53:00+00', '2026-01-26 10:46:21+00', 9.58, 3201, 5.57, 11, 11, 'red', 7.3),
-  ('3eadab93-9491-4706-a0d9-089e4269d082', 'aaaaaaaa-0087-0087-0087-000000000087', '2026-01-26', '2026-01-26 07:12:00+00', '2026-01-26 07:32:42+00', 4.58, 1242, 4.52, 7, 21, 'purple', 9.5),
-  ('9f8c096e-2515-4bc4-b1fe-6488148eed97', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-01-26', '2026-01-26 19:39:00+00', '2026-01-26 20:04:38+00', 5.31, 1538, 4.83, 7, 14, 'red', 12.3),
-  ('9d84b226-e7f7-4360-8b1f-3087b8e038d8', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-01-26', '2026-01-26 17:39:00+00', '2026-01-26 17:56:47+00', 2.47, 1067, 7.2, 4, 4, 'blue', 8.9),
-  ('97b3565b-000d-4fff-8cf7-032f122ef021', 'aaaaaaaa-0089-0089-0089-000000000089', '2026-01-26', '2026-01-26 07:41:00+00', '2026-01-26 08:30:34+00', 10.2, 2974, 4.86, 20, 20, 'purple', 19.7),
-  ('a6308e71-b2c6-4524-b658-c2984424b863', 'aaaaaaaa-0007-0007-0007-000000000007', '2026-01-26', '2026-01-26 21:02:00+00', '2026-01-26 22:42:51+00', 13.27, 6051, 7.6, 22, 22, 'red', 9.7),
-  ('67204d6a-0278-4f82-8a95-84652f5c3fe3', 'aaaaaaaa-0092-0092-0092-000000000092', '2026-01-26', '2026-01-26 06:38:00+00', '2026-01-26 07:40:28+00', 12.13, 3748, 5.15, 21, 42, 'purple', 21.8),
-  ('1cb796c5-f553-49b9-9b36-acd90661190d', 'aaaaaaaa-0021-0021-0021-000000000021', '2026-01-26', '2026-01-26 18:31:00+00', '2026-01-26 19:11:55+00', 6.6, 2455, 6.2, 11, 33, 'red', 24.4),
-  ('02ba31e4-c38e-48ee-bbe2-987ab413344a', 'aaaaaaaa-0096-0096-0096-000000000096', '2026-01-26', '2026-01-26 08:59:00+00', '2026-01-26 09:41:06+00', 7.52, 2526, 5.6, 11, 33, 'purple', 23.1),
-  ('504cc0cd-8eb5-4f90-b665-ccd8750afff1', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-01-26', '2026-01-26 21:16:00+00', '2026-01-26 22:22:52+00', 14.17, 4012, 4.72, 23, 23, 'red', 8.1),
-  ('205dc1de-f97d-440e-a27c-d33520549d4b', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-01-26', '2026-01-26 10:01:00+00', '2026-01-26 10:22:28+00', 4.51, 1288, 4.76, 11, 22, 'blue', 10.6),
-  ('9dcf89bb-ed2e-4786-b9bd-d2accd878129', 'aaaaaaaa-0052-0052-0052-000000000052', '2026-01-26', '2026-01-26 17:14:00+00', '2026-01-26 17:55:59+00', 7.79, 2519, 5.39, 17, 34, 'blue', 14.9),
-  ('c2ee7006-8432-428d-8fc2-bf22a2d538f7', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-01-26', '2026-01-26 13:57:00+00', '2026-01-26 14:54:22+00', 8.15, 3442, 7.04, 16, 48, 'blue', 3.3),
-  ('b670ab91-b6d1-4d16-a8ef-b04511b0342e', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-01-26', '2026-01-26 07:29:00+00', '2026-01-26 07:48:54+00', 2.89, 1194, 6.89, 6, 12, 'blue', 3.8),
-  ('9e3a2698-4449-4dd7-b8eb-87c07a9d3f34', 'aaaaaaaa-0074-0074-0074-000000000074', '2026-01-26', '2026-01-26 11:28:00+00', '2026-01-26 12:00:18+00', 4.67, 1938, 6.92, 8, 8, 'blue', 3.7),
-  ('94bd5ce7-395b-4f91-bf0c-40465673379e', 'aaaaaaaa-0034-0034-0034-000000000034', '2026-01-26', '2026-01-26 16:22:00+00', '2026-01-26 18:01:13+00', 13.84, 5953, 7.17, 26, 26, 'red', 16.0),
-  ('7d294e17-9f4d-4e17-be8b-09561d84bb21', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-01-26', '2026-01-26 05:21:00+00', '2026-01-26 06:54:05+00', 13.67, 5585, 6.81, 12, 12, 'red', 7.1),
-  ('cd28a553-d7d5-4c6e-a95b-9e7bcca5d973', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-01-26', '2026-01-26 10:02:00+00', '2026-01-26 11:01:13+00', 11.03, 3553, 5.37, 22, 22, 'blue', 4.9),
-  ('513498d3-a29a-44ef-b87f-46a785d940c7', 'aaaaaaaa-0098-0098-0098-000000000098', '2026-01-26', '2026-01-26 07:54:00+00', '2026-01-26 08:45:40+00', 7.7, 3100, 6.71, 19, 57, 'purple', 20.9),
-  ('adc42ea4-01d1-42c3-aa4f-863f11fd0dcb', 'aaaaaaaa-0069-0069-0069-000000000069', '2026-01-26', '2026-01-26 19:19:00+00', '2026-01-26 19:49:08+00', 3.96, 1808, 7.61, 6, 12, 'blue', 3.0),
-  ('8b355671-c4fa-4923-a3be-75a22938c265', 'aaaaaaaa-0070-0070-0070-000000000070', '2026-01-26', '2026-01-26 20:18:00+00', '2026-01-26 21:08:31+00', 8.55, 3031, 5.91, 11, 22, 'blue', 7.7),
-  ('8187b03c-8471-4413-9518-6e2c315d8f0c', 'aaaaaaaa-0071-0071-0071-000000000071', '2026-01-26', '2026-01-26 07:57:00+00', '2026-01-26 08:14:40+00', 2.97, 1060, 5.95, 2, 4, 'blue', 15.1),
-  ('89c01a52-9e1b-484d-a40b-7ecab086dd91', 'aaaaaaaa-0076-0076-0076-000000000076', '2026-01-26', '2026-01-26 20:40:00+00', '2026-01-26 21:51:53+00', 13.19, 4313, 5.45, 15, 30, 'blue', 7.9),
-  ('ce087b21-9ac7-4333-99ff-a1acdb9986e2', 'aaaaaaaa-0004-0004-0004-000000000004', '2026-01-26', '2026-01-26 08:46:00+00', '2026-01-26 08:59:49+00', 2.81, 829, 4.92, 5, 20, 'red', 13.5),
-  ('e173f5ff-fc96-48b9-b4bc-6aab996285cb', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-01-26', '2026-01-26 21:52:00+00', '2026-01-26 22:02:51+00', 2.04, 651, 5.32, 3, 3, 'blue', 18.9),
-  ('5b64309c-4dbd-4c0a-9509-d08bc1872a83', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-01-26', '2026-01-26 14:11:00+00', '2026-01-26 15:03:44+00', 11.44, 3164, 4.61, 18, 54, 'red', 7.7),
-  ('f4657a60-2c5c-4797-a36d-c2da9d1ac1f3', 'aaaaaaaa-0032-0032-0032-000000000032', '2026-01-26', '2026-01-26 17:03:00+00', '2026-01-26 17:34:00+00', 6.67, 1860, 4.65, 7, 21, 'red', 22.5),
-  ('1f131600-5f56-4c57-a142-b242a22a2c1b', 'aaaaaaaa-0046-0046-0046-000000000046', '2026-01-26', '2026-01-26 17:55:00+00', '2026-01-26 19:10:42+00', 13.33, 4542, 5.68, 19, 57, 'blue', 9.9),
-  ('d7564122-576f-45af-bb5f-66063a860c2f', 'aaaaaaaa-0077-0077-0077-000000000077', '2026-01-26', '2026-01-26 21:35:00+00', '2026-01-26 22:36:09+00', 10.06, 3669, 6.08, 12, 24, 'blue', 13.1),
-  ('9c98518a-3136-4e24-8f97-9178e7a40df8', 'aaaaaaaa-0045-0045-0045-000000000045', '2026-01-26', '2026-01-26 15:06:00+00', '2026-01-26 15:18:03+00', 2.47, 723, 4.88, 1, 2, 'blue', 17.1),
-  ('253c961e-ef66-4864-9383-f59f49dfdc6a', 'aaaaaaaa-0061-0061-0061-000000000061', '2026-01-26', '2026-01-26 14:18:00+00', '2026-01-26 14:44:58+00', 3.8, 1618, 7.1, 0, 0, 'blue', 5.7),
-  ('dfaec103-34ea-42d6-9da8-ff9c87980c24', 'aaaaaaaa-0097-0097-0097-000000000097', '2026-01-26', '2026-01-26 17:24:00+00', '2026-01-26 18:01:23+00', 4.8, 2243, 7.79, 11, 22, 'purple', 18.1),
-  ('e67b0976-0210-43ec-8ca1-99fecdf3cf64', 'aaaaaaaa-0078-0078-0078-000000000078', '2026-01-26', '2026-01-26 17:30:00+00', '2026-01-26 19:00:57+00', 12.16, 5457, 7.48, 12, 36, 'blue', 15.3),
-  ('e4a300a3-9712-4d90-bcf5-de47474b9875', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-01-26', '2026-01-26 13:57:00+00', '2026-01-26 14:20:08+00', 4.84, 1388, 4.78, 8, 16, 'red', 12.3),
-  ('edd025dd-7538-4ebf-a63b-697951c2559d', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-01-26', '2026-01-26 21:38:00+00', '2026-01-26 22:15:59+00', 5.88, 2279, 6.46, 3, 6, 'blue', 19.2),
-  ('031e4480-5306-4bca-9eb0-a8773f54e5a8', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-01-26', '2026-01-26 13:29:00+00', '2026-01-26 14:56:17+00', 14.87, 5237, 5.87, 29, 87, 'red', 22.2),
-  ('fee74ecc-0dfc-4ac1-b620-bc2066d04674', 'aaaaaaaa-0028-0028-0028-000000000028', '2026-01-26', '2026-01-26 10:20:00+00', '2026-01-26 11:24:38+00', 12.75, 3878, 5.07, 16, 32, 'red', 13.5),
-  ('6ee85bc2-a8ed-4985-8662-73031ae57eeb', 'aaaaaaaa-0003-0003-0003-000000000003', '2026-01-26', '2026-01-26 11:50:00+00', '2026-01-26 12:45:40+00', 7.12, 3340, 7.82, 10, 40, 'red', 21.4),
-  ('c4d8dea2-5da0-465d-ba01-aed8bc3bbcf8', 'aaaaaaaa-0093-0093-0093-000000000093', '2026-01-26', '2026-01-26 15:18:00+00', '2026-01-26 16:05:49+00', 8.94, 2869, 5.35, 21, 42, 'purple', 23.6),
-  ('01360fc0-4e3a-468c-b1ad-e4c0bcdc2f17', 'aaaaaaaa-0086-0086-0086-000000000086', '2026-01-26', '2026-01-26 21:10:00+00', '2026-01-26 21:26:17+00', 3.34, 977, 4.88, 7, 14, 'purple', 13.2),
-  ('6ea991b4-7e1b-447d-a4ee-87563da3e684', 'aaaaaaaa-0036-0036-0036-000000000036', '2026-01-26', '2026-01-26 14:00:00+00', '2026-01-26 15:08:46+00', 8.92, 4126, 7.71, 15, 30, 'red', 20.4),
-  ('e27f8ac8-7988-4d65-8f70-5d7ca4bfcd84', 'aaaaaaaa-0018-0018-0018-000000000018', '2026-01-26', '2026-01-26 16:03:00+00', '2026-01-26 17:52:16+00', 14.34, 6556, 7.62, 16, 32, 'red', 5.7),
-  ('000168ff-f430-4456-932a-f53146ea0ed6', 'aaaaaaaa-0016-0016-0016-000000000016', '2026-01-26', '2026-01-26 07:55:00+00', '2026-01-26 08:58:04+00', 11.51, 3784, 5.48, 8, 8, 'red', 3.3),
-  ('0782682b-9626-434e-b718-bb5f3fcc71e4', 'aaaaaaaa-0042-0042-0042-000000000042', '2026-01-26', '2026-01-26 12:47:00+00', '2026-01-26 13:59:32+00', 9.83, 4352, 7.38, 21, 21, 'blue', 14.3),
-  ('15f27030-889d-4cae-bda8-30b8d0491449', 'aaaaaaaa-0099-0099-0099-000000000099', '2026-01-27', '2026-01-27 06:15:00+00', '2026-01-27 06:34:30+00', 3.4, 1170, 5.74, 8, 8, 'purple', 23.3),
-  ('47663196-4fba-429e-9517-f417c0d27f36', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-01-27', '2026-01-27 19:33:00+00', '2026-01-27 20:52:45+00', 11.87, 4785, 6.72, 13, 52, 'red', 19.8),
-  ('c87d6ffb-3121-4615-9271-3ee2cbf2d461', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-01-27', '2026-01-27 21:28:00+00', '2026-01-27 23:09:16+00', 13.97, 6076, 7.25, 28, 84, 'blue', 14.6),
-  ('b5568e0d-7fa1-4374-a902-4f0037821083', 'aaaaaaaa-0086-0086-0086-000000000086', '2026-01-27', '2026-01-27 17:52:00+00', '2026-01-27 18:32:22+00', 6.64, 2422, 6.08, 12, 36, 'purple', 10.2),
-  ('7ed556eb-887a-47bb-9384-e59bb7eb1d8a', 'aaaaaaaa-0034-0034-0034-000000000034', '2026-01-27', '2026-01-27 07:58:00+00', '2026-01-27 08:32:16+00', 5.38, 2056, 6.37, 6, 24, 'red', 13.6),
-  ('c829dda4-fbd7-4a22-9ee1-155c82f246ec', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-01-27', '2026-01-27 12:22:00+00', '2026-01-27 13:22:23+00', 9.04, 3623, 6.68, 12, 36, 'blue', 17.8),
-  ('cbf70223-796b-444f-ad36-987d631c4a41', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-01-27', '2026-01-27 10:05:00+00', '2026-01-27 10:29:57+00', 4.38, 1497, 5.7, 4, 8, 'red', 11.1),
-  ('c2e4cc3e-eb1d-4932-a18f-cb9896fe029f', 'aaaaaaaa-0064-0064-0064-000000000064', '2026-01-27', '2026-01-27 20:08:00+00', '2026-01-27 20:58:08+00', 6.3, 3008, 7.96, 12, 24, 'blue', 23.6),
-  ('71dfa557-d9a1-4aa0-bce9-cc5462063f9a', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-01-27', '2026-01-27 12:31:00+00', '2026-01-27 13:06:36+00', 4.76, 2136, 7.48, 4, 12, 'blue', 9.6),
-  ('cbdb7aa0-ece4-4366-9972-8dd1cc5263dc', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-01-27', '2026-01-27 17:40:00+00', '2026-01-27 19:07:37+00', 13.8, 5257, 6.35, 16, 32, 'red', 22.5),
-  ('c7ee8fe9-a1db-489b-9591-03381d256df0', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-01-27', '2026-01-27 11:01:00+00', '2026-01-27 11:57:24+00', 8.0, 3384, 7.05, 12, 24, 'blue', 16.9),
-  ('10d0cb0f-9c74-4087-8682-945997c40ffc', 'aaaaaaaa-0068-0068-0068-000000000068', '2026-01-27', '2026-01-27 18:51:00+00', '2026-01-27 19:30:57+00', 5.43, 2397, 7.36, 8, 24, 'blue', 6.8),
-  ('e7e55ac5-a4b7-4df4-a69a-d79a31601fe5', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-01-27', '2026-01-27 20:51:00+00', '2026-01-27 21:31:24+00', 5.78, 2424, 6.99, 7, 7, 'red', 23.9),
-  ('3bc52da2-a2bb-4f20-97b8-52fa9a0a8075', 'aaaaaaaa-0085-0085-0085-000000000085', '2026-01-27', '2026-01-27 08:54:00+00', '2026-01-27 10:48:43+00', 14.45, 6883, 7.94, 34, 102, 'purple', 24.0),
-  ('317b4882-cd20-4f3b-b5b6-49f86e251c42', 'aaaaaaaa-0033-0033-0033-000000000033', '2026-01-27', '2026-01-27 12:22:00+00', '2026-01-27 13:26:22+00', 10.57, 3862, 6.09, 18, 72, 'red', 12.1),
-  ('4a36aa82-e80b-4d6c-b93a-e696ea0c0423', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-01-27', '2026-01-27 19:50:00+00', '2026-01-27 21:29:28+00', 13.37, 5968, 7.44, 14, 14, 'red', 12.4),
-  ('59cd6708-dd0c-493b-8840-a5bb35d0ffa0', 'aaaaaaaa-0044-0044-0044-000000000044', '2026-01-27', '2026-01-27 21:05:00+00', '2026-01-27 21:54:36+00', 10.4, 2976, 4.77, 20, 60, 'blue', 17.2),
-  ('a326337e-2d79-4d6d-adef-778e4fe00df9', 'aaaaaaaa-0091-0091-0091-000000000091', '2026-01-27', '2026-01-27 12:20:00+00', '2026-01-27 13:02:45+00', 6.17, 2565, 6.93, 13, 26, 'purple', 12.0),
-  ('2795c627-4269-49b3-bac1-4bf6519ee8fa', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-01-27', '2026-01-27 18:18:00+00', '2026-01-27 18:54:04+00', 7.66, 2164, 4.71, 14, 42, 'purple', 24.9),
-  ('69976833-384e-45d5-bce9-fdeaa2e510e9', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-01-27', '2026-01-27 21:50:00+00', '2026-01-27 22:32:09+00', 8.5, 2529, 4.96, 13, 26, 'blue', 17.1),
-  ('8e93fab2-0a4e-495a-ab62-e6eddb8806b5', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-01-27', '2026-01-27 17:14:00+00', '2026-01-27 17:34:00+00', 4.01, 1200, 4.99, 7, 14, 'purple', 13.5),
-  ('a2304715-40e1-4660-955f-a4dc83ef9f3c', 'aaaaaaaa-0009-0009-0009-000000000009', '2026-01-27', '2026-01-27 10:04:00+00', '2026-01-27 10:33:29+00', 5.46, 1769, 5.4, 10, 40, 'red', 5.3),
-  ('17c272cb-b5c7-4b1c-899c-f3d77755da41', 'aaaaaaaa-0016-0016-0016-000000000016', '2026-01-27', '2026-01-27 21:19:00+00', '2026-01-27 21:57:56+00', 8.2, 2336, 4.75, 10, 40, 'red', 5.3),
-  ('82361dd4-964f-4345-aef3-048da03190e3', 'aaaaaaaa-0007-0007-0007-000000000007', '2026-01-27', '2026-01-27 14:34:00+00', '2026-01-27 14:56:26+00', 3.5, 1346, 6.41, 5, 15, 'red', 8.5),
-  ('e1c6ed6b-7e79-4f8b-99e7-3436455ebfca', 'aaaaaaaa-0051-0051-0051-000000000051', '2026-01-27', '2026-01-27 12:19:00+00', '2026-01-27 12:52:04+00', 4.29, 1984, 7.71, 6, 12, 'blue', 20.2),
-  ('e62954ad-466d-4ef4-b330-d3a1e918ab19', 'aaaaaaaa-0090-0090-0090-000000000090', '2026-01-27', '2026-01-27 08:18:00+00', '2026-01-27 08:38:19+00', 3.4, 1219, 5.98, 5, 15, 'purple', 21.3),
-  ('31390f1e-10f7-42f1-adad-caec3a6f83be', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-01-27', '2026-01-27 08:43:00+00', '2026-01-27 09:48:51+00', 10.76, 3951, 6.12, 22, 66, 'blue', 7.9),
-  ('422757c0-50ee-4f38-8900-1b6e9a45c227', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-01-27', '2026-01-27 06:09:00+00', '2026-01-27 06:51:50+00', 7.86, 2570, 5.45, 14, 42, 'red', 15.5),
-  ('4d5df948-8c88-4e26-9cda-f3ad75cb999e', 'aaaaaaaa-0012-0012-0012-000000000012', '2026-01-27', '2026-01-27 05:21:00+00', '2026-01-27 06:20:07+00', 11.03, 3547, 5.36, 13, 13, 'red', 12.3),
-  ('96c8aa06-30ce-4891-98ce-f54ee1ee8d17', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-01-27', '2026-01-27 09:39:00+00', '2026-01-27 11:04:45+00', 14.06, 5145, 6.1, 29, 58, 'purple', 6.4),
-  ('f88a622b-0899-4672-b294-233ac40be6bc', 'aaaaaaaa-0058-0058-0058-000000000058', '2026-01-27', '2026-01-27 19:54:00+00', '2026-01-27 21:12:41+00', 10.62, 4721, 7.41, 21, 42, 'blue', 18.3),
-  ('af5aab38-979d-4fe9-a11a-6e0413799b05', 'aaaaaaaa-0027-0027-0027-000000000027', '2026-01-27', '2026-01-27 13:21:00+00', '2026-01-27 15:11:56+00', 14.56, 6656, 7.62, 24, 24, 'red', 17.3),
-  ('7f001b2f-f351-4608-aea1-331d0a00fe4c', 'aaaaaaaa-0056-0056-0056-000000000056', '2026-01-27', '2026-01-27 20:18:00+00', '2026-01-27 21:58:57+00', 13.06, 6057, 7.73, 24, 24, 'blue', 4.8),
-  ('ecd03860-fe19-426b-be1c-bde108c7d2b6', 'aaaaaaaa-0019-0019-0019-000000000019', '2026-01-27', '2026-01-27 08:36:00+00', '2026-01-27 10:20:15+00', 13.23, 6255, 7.88, 25, 75, 'red', 17.5),
-  ('8052293a-8432-4401-b40e-70c84148cced', 'aaaaaaaa-0042-0042-0042-000000000042', '2026-01-27', '2026-01-27 18:15:00+00', '2026-01-27 19:19:40+00', 11.0, 3880, 5.88, 17, 51, 'blue', 17.3),
-  ('549f4983-2785-413d-b4ce-11ecaa4205aa', 'aaaaaaaa-0030-0030-0030-000000000030', '2026-01-27', '2026-01-27 12:13:00+00', '2026-01-27 12:46:25+00', 5.47, 2005, 6.11, 6, 24, 'red', 16.8),
-  ('32d2d572-a687-4c2f-9cb9-efbc00e06627', 'aaaaaaaa-0000-0000-0000-000000000000', '2026-01-27', '2026-01-27 17:41:00+00', '2026-01-27 19:30:17+00', 14.79, 6557, 7.39, 19, 57, 'red', 24.8),
-  ('f104f6b7-5056-4602-9032-f3c80b342578', 'aaaaaaaa-0014-0014-0014-000000000014', '2026-01-27', '2026-01-27 17:13:00+00', '2026-01-27 17:53:42+00', 5.45, 2442, 7.47, 4, 12, 'red', 8.3),
-  ('91f2e197-65ca-46ef-9043-686574e77ad5', 'aaaaaaaa-0076-0076-0076-000000000076', '2026-01-27', '2026-01-27 17:28:00+00', '2026-01-27 18:41:58+00', 11.95, 4438, 6.19, 21, 63, 'blue', 12.4),
-  ('99a8d5d0-27c0-484b-8551-9828c1929e19', 'aaaaaaaa-0020-0020-0020-000000000020', '2026-01-27', '2026-01-27 21:42:00+00', '2026-01-27 22:49:34+00', 11.06, 4054, 6.11, 12, 12, 'red', 23.7),
-  ('63873510-9697-4def-973d-28e16d2934d2', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-01-27', '2026-01-27 16:20:00+00', '2026-01-27 17:10:24+00', 8.25, 3024, 6.11, 19, 19, 'purple', 9.8),
-  ('dbb55e3a-d225-4336-b852-2826f97d2d10', 'aaaaaaaa-0087-0087-0087-000000000087', '2026-01-27', '2026-01-27 10:47:00+00', '2026-01-27 11:55:47+00', 11.06, 4127, 6.22, 23, 23, 'purple', 4.4),
-  ('443064c1-a47d-4a10-9d90-168bb19a1341', 'aaaaaaaa-0024-0024-0024-000000000024', '2026-01-27', '2026-01-27 08:49:00+00', '2026-01-27 09:24:59+00', 5.07, 2159, 7.1, 8, 8, 'red', 8.8),
-  ('2fad0225-7bf3-4325-b6be-4f91ecdd26a3', 'aaaaaaaa-0066-0066-0066-000000000066', '2026-01-27', '2026-01-27 06:08:00+00', '2026-01-27 06:43:48+00', 6.98, 2148, 5.13, 12, 24, 'blue', 18.4),
-  ('145193a3-6f26-489e-b26e-dfa13bc4965f', 'aaaaaaaa-0062-0062-0062-000000000062', '2026-01-27', '2026-01-27 10:21:00+00', '2026-01-27 11:02:58+00', 8.82, 2518, 4.76, 13, 13, 'blue', 24.2),
-  ('2c3c99b3-a8cf-427b-8c8e-e7b8f0e1a172', 'aaaaaaaa-0048-0048-0048-000000000048', '2026-01-27', '2026-01-27 16:02:00+00', '2026-01-27 16:24:48+00', 3.96, 1368, 5.76, 6, 18, 'blue', 18.9),
-  ('b2300c97-b52a-4d70-9a86-12630c62815e', 'aaaaaaaa-0038-0038-0038-000000000038', '2026-01-27', '2026-01-27 16:51:00+00', '2026-01-27 17:29:32+00', 5.42, 2312, 7.11, 10, 30, 'red', 17.5),
-  ('d7acd498-db53-4708-9760-b495175023ff', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-01-27', '2026-01-27 13:56:00+00', '2026-01-27 15:02:59+00', 12.57, 4019, 5.33, 20, 20, 'blue', 19.8),
-  ('f28fa3d8-28f3-49fb-ab87-b7bacab705bb', 'aaaaaaaa-0077-0077-0077-000000000077', '2026-01-27', '2026-01-27 05:29:00+00', '2026-01-27 05:59:36+00', 4.73, 1836, 6.47, 4, 12, 'blue', 12.7),
-  ('2a4d6807-f069-4cc4-a115-e3fda0fc8779', 'aaaaaaaa-0069-0069-0069-000000000069', '2026-01-27', '2026-01-27 09:10:00+00', '2026-01-27 10:21:28+00', 10.11, 4288, 7.07, 13, 39, 'blue', 5.8),
-  ('c4969381-2d5b-4960-bb38-709805145b81', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-01-27', '2026-01-27 12:24:00+00', '2026-01-27 12:49:30+00', 4.63, 1530, 5.51, 5, 5, 'blue', 3.9),
-  ('38763f23-993f-40ed-a5c6-a79c25595f7f', 'aaaaaaaa-0008-0008-0008-000000000008', '2026-01-27', '2026-01-27 12:44:00+00', '2026-01-27 13:51:29+00', 11.86, 4049, 5.69, 18, 36, 'red', 4.7),
-  ('2a3f9c23-a1fc-4545-9132-246d0e7fa9b7', 'aaaaaaaa-0035-0035-0035-000000000035', '2026-01-27', '2026-01-27 12:21:00+00', '2026-01-27 12:46:49+00', 3.71, 1549, 6.96, 6, 18, 'red', 3.3),
-  ('f08762a2-6bf3-442a-bc49-9f063c2fefa3', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-01-27', '2026-01-27 08:40:00+00', '2026-01-27 08:58:20+00', 2.8, 1100, 6.55, 4, 16, 'red', 13.7),
-  ('d8d089b6-1c4d-40ea-8252-556da4f230f7', 'aaaaaaaa-0070-0070-0070-000000000070', '2026-01-27', '2026-01-27 20:53:00+00', '2026-01-27 22:46:41+00', 14.23, 6821, 7.99, 14, 28, 'blue', 7.0),
-  ('a4d7e604-26c5-4dbf-a160-804a16dd71fc', 'aaaaaaaa-0060-0060-0060-000000000060', '2026-01-27', '2026-01-27 21:46:00+00', '2026-01-27 22:54:07+00', 11.41, 4087, 5.97, 13, 13, 'blue', 13.8),
-  ('a917cd31-cc7e-4fef-bd58-1276545c349e', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-01-27', '2026-01-27 16:02:00+00', '2026-01-27 17:05:25+00', 12.22, 3805, 5.19, 6, 18, 'blue', 23.7),
-  ('ff05a876-39b2-422f-ada5-a422e9c52938', 'aaaaaaaa-0046-0046-0046-000000000046', '2026-01-27', '2026-01-27 07:46:00+00', '2026-01-27 08:29:14+00', 5.63, 2594, 7.68, 7, 14, 'blue', 18.3),
-  ('f66c2cb9-77fb-420b-b975-5197807961da', 'aaaaaaaa-0003-0003-0003-000000000003', '2026-01-27', '2026-01-27 10:47:00+00', '2026-01-27 12:33:34+00', 13.77, 6394, 7.74, 27, 81, 'red', 3.5),
-  ('209d9221-1623-441e-8339-7d4764addfb5', 'aaaaaaaa-0037-0037-0037-000000000037', '2026-01-27', '2026-01-27 18:42:00+00', '2026-01-27 19:36:43+00', 10.06, 3283, 5.44, 14, 28, 'red', 8.5),
-  ('0e96961b-aded-4458-8ffc-a2a380953ebb', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-01-27', '2026-01-27 18:20:00+00', '2026-01-27 19:03:38+00', 7.31, 2618, 5.97, 12, 12, 'red', 17.2),
-  ('1c8ed164-8779-4c8e-9c69-3f2f49fd0f2e', 'aaaaaaaa-0072-0072-0072-000000000072', '2026-01-27', '2026-01-27 06:38:00+00', '2026-01-27 07:16:51+00', 5.52, 2331, 7.04, 8, 8, 'blue', 7.9),
-  ('15c44d24-3ddf-4ba8-a734-1bda1a639c54', 'aaaaaaaa-0086-0086-0086-000000000086', '2026-01-28', '2026-01-28 18:18:00+00', '2026-01-28 19:14:15+00', 11.53, 3375, 4.88, 27, 27, 'purple', 9.5),
-  ('a467bbda-44d2-409f-8522-be2f444d78bb', 'aaaaaaaa-0052-0052-0052-000000000052', '2026-01-28', '2026-01-28 16:23:00+00', '2026-01-28 16:37:52+00', 2.74, 892, 5.43, 3, 3, 'blue', 5.9),
-  ('d65b935c-c7e1-4566-b43f-7e9603edfeaf', 'aaaaaaaa-0068-0068-0068-000000000068', '2026-01-28', '2026-01-28 09:04:00+00', '2026-01-28 10:08:16+00', 12.22, 3856, 5.26, 14, 42, 'blue', 11.0),
-  ('68c71fae-9e2d-421f-ab12-62dad034eb7f', 'aaaaaaaa-0031-0031-0031-000000000031', '2026-01-28', '2026-01-28 08:41:00+00', '2026-01-28 09:15:18+00', 6.46, 2058, 5.31, 13, 52, 'red', 11.5),
-  ('4f699122-2911-41a5-be87-64c2d4f6a70d', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-01-28', '2026-01-28 18:02:00+00', '2026-01-28 19:45:24+00', 13.14, 6204, 7.87, 27, 27, 'purple', 3.2),
-  ('4433ac4d-2ce7-457e-ac69-aba0ad2dad3b', 'aaaaaaaa-0003-0003-0003-000000000003', '2026-01-28', '2026-01-28 10:53:00+00', '2026-01-28 11:07:58+00', 3.29, 898, 4.55, 7, 7, 'red', 23.5),
-  ('35e793a9-f92f-4dbf-b1c9-d0626316f845', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-01-28', '2026-01-28 07:56:00+00', '2026-01-28 09:11:55+00', 11.35, 4555, 6.69, 17, 34, 'blue', 23.7),
-  ('55a0282b-4cbe-4ca3-b426-761858527478', 'aaaaaaaa-0046-0046-0046-000000000046', '2026-01-28', '2026-01-28 18:31:00+00', '2026-01-28 18:48:27+00', 3.08, 1047, 5.67, 3, 3, 'blue', 23.9),
-  ('6bd21b20-148d-4856-aac4-3194bac43807', 'aaaaaaaa-0030-0030-0030-000000000030', '2026-01-28', '2026-01-28 10:03:00+00', '2026-01-28 10:57:04+00', 8.12, 3244, 6.66, 15, 60, 'red', 8.1),
-  ('92f1b5c4-aad5-48d6-9f59-a55b06921d8a', 'aaaaaaaa-0009-0009-0009-000000000009', '2026-01-28', '2026-01-28 20:25:00+00', '2026-01-28 21:28:46+00', 9.31, 3826, 6.85, 12, 24, 'red', 20.4),
-  ('8eb766e7-d925-459d-a517-4ee81497add1', 'aaaaaaaa-0023-0023-0023-000000000023', '2026-01-28', '2026-01-28 16:23:00+00', '2026-01-28 17:34:57+00', 13.68, 4317, 5.26, 17, 17, 'red', 12.1),
-  ('1629929d-e6ab-453c-b52e-258860b48e72', 'aaaaaaaa-0020-0020-0020-000000000020', '2026-01-28', '2026-01-28 19:17:00+00', '2026-01-28 21:02:14+00', 13.58, 6314, 7.75, 12, 48, 'red', 9.9),
-  ('41b897d4-304e-4b37-9036-dd536a516a32', 'aaaaaaaa-0092-0092-0092-000000000092', '2026-01-28', '2026-01-28 11:37:00+00', '2026-01-28 12:50:08+00', 9.33, 4388, 7.84, 20, 20, 'purple', 5.1),
-  ('5cbe1595-69ba-4ead-afa3-72786eff1cbb', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-01-28', '2026-01-28 15:04:00+00', '2026-01-28 15:20:35+00', 2.77, 995, 5.99, 5, 5, 'purple', 9.4),
-  ('49e24947-fc1a-4cee-9ec0-cf1bbd5656b0', 'aaaaaaaa-0051-0051-0051-000000000051', '2026-01-28', '2026-01-28 05:36:00+00', '2026-01-28 06:48:45+00', 13.55, 4365, 5.37, 27, 81, 'blue', 17.6),
-  ('51707ddd-c39a-4733-87fb-0fa0081aba7c', 'aaaaaaaa-0035-0035-0035-000000000035', '2026-01-28', '2026-01-28 10:29:00+00', '2026-01-28 11:18:51+00', 8.03, 2991, 6.21, 10, 20, 'red', 14.4),
-  ('2705d95c-bda9-4d29-9020-5bddb4ce39ba', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-01-28', '2026-01-28 07:34:00+00', '2026-01-28 08:57:15+00', 10.97, 4995, 7.59, 19, 19, 'blue', 5.9),
-  ('db221456-4c7b-4bf4-9ac1-0f8aca1385d5', 'aaaaaaaa-0056-0056-0056-000000000056', '2026-01-28', '2026-01-28 12:42:00+00', '2026-01-28 12:55:33+00', 2.55, 813, 5.32, 3, 9, 'blue', 9.5),
-  ('bafb184f-7e41-456c-ba72-3de9d24a5968', 'aaaaaaaa-0036-0036-0036-000000000036', '2026-01-28', '2026-01-28 17:46:00+00', '2026-01-28 18:51:10+00', 10.79, 3910, 6.04, 22, 66, 'red', 8.1),
-  ('6da17dd3-3d5f-4494-889c-3f267599f1ec', 'aaaaaaaa-0082-0082-0082-000000000082', '2026-01-28', '2026-01-28 17:12:00+00', '2026-01-28 18:20:29+00', 14.36, 4109, 4.77, 28, 28, 'purple', 4.5),
-  ('09c6f5ad-9c30-4ce1-bbbe-61e594f70770', 'aaaaaaaa-0070-0070-0070-000000000070', '2026-01-28', '2026-01-28 08:39:00+00', '2026-01-28 09:46:52+00', 8.85, 4072, 7.67, 22, 44, 'blue', 19.4),
-  ('99bf02c9-b277-4d13-a884-eee68a8023af', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-01-28', '2026-01-28 21:45:00+00', '2026-01-28 21:59:04+00', 2.55, 844, 5.52, 2, 2, 'blue', 14.6),
-  ('2780e096-c4c0-4425-b6c4-f1eba49a53db', 'aaaaaaaa-0007-0007-0007-000000000007', '2026-01-28', '2026-01-28 06:41:00+00', '2026-01-28 08:08:21+00', 11.95, 5241, 7.31, 24, 72, 'red', 23.1),
-  ('c8e5bd0e-530f-4646-b4a3-8da2344e9b52', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-01-28', '2026-01-28 12:09:00+00', '2026-01-28 13:01:42+00', 11.24, 3162, 4.69, 17, 51, 'blue', 14.2),
-  ('45e8c2da-fd83-49dc-9507-e75f6f92abf8', 'aaaaaaaa-0080-0080-0080-000000000080', '2026-01-28', '2026-01-28 13:49:00+00', '2026-01-28 14:49:21+00', 10.01, 3621, 6.03, 22, 44, 'purple', 18.6),
-  ('44560b7e-4ca7-4f9c-8abd-7da98817aa35', 'aaaaaaaa-0048-0048-0048-000000000048', '2026-01-28', '2026-01-28 15:59:00+00', '2026-01-28 16:17:09+00', 3.12, 1089, 5.82, 5, 15, 'blue', 3.6),
-  ('7aa2273b-ad04-4cfe-b8f6-742f7b31e951', 'aaaaaaaa-0037-0037-0037-000000000037', '2026-01-28', '2026-01-28 18:52:00+00', '2026-01-28 20:07:43+00', 9.81, 4543, 7.72, 17, 34, 'red', 21.2),
-  ('835322d5-5c22-4919-a7dd-c4cdc7d140ac', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-01-28', '2026-01-28 21:48:00+00', '2026-01-28 22:36:43+00', 6.63, 2923, 7.35, 12, 36, 'purple', 20.0),
-  ('1f9f192b-d7ff-43a8-a4c6-2a984c063030', 'aaaaaaaa-0099-0099-0099-000000000099', '2026-01-28', '2026-01-28 19:04:00+00', '2026-01-28 20:40:23+00', 14.83, 5783, 6.5, 26, 78, 'purple', 16.3),
-  ('391f950a-79be-4514-9cb9-e795022cdc6f', 'aaaaaaaa-0064-0064-0064-000000000064', '2026-01-28', '2026-01-28 10:19:00+00', '2026-01-28 11:34:01+00', 13.07, 4501, 5.74, 26, 52, 'blue', 18.2),
-  ('8df34bb5-944d-4e25-a204-1b2a11316bef', 'aaaaaaaa-0098-0098-0098-000000000098', '2026-01-28', '2026-01-28 20:12:00+00', '2026-01-28 20:59:15+00', 7.71, 2835, 6.13, 10, 30, 'purple', 5.5),
-  ('cda46c26-f7f0-48ff-99e5-7bd9da1dcfb5', 'aaaaaaaa-0029-0029-0029-000000000029', '2026-01-28', '2026-01-28 18:10:00+00', '2026-01-28 18:22:53+00', 2.82, 773, 4.57, 7, 7, 'red', 17.1),
-  ('d060f987-aa37-45c6-a239-6a9989190d1e', 'aaaaaaaa-0004-0004-0004-000000000004', '2026-01-28', '2026-01-28 20:25:00+00', '2026-01-28 21:06:26+00', 6.04, 2486, 6.86, 10, 30, 'red', 11.7),
-  ('f33b7207-9114-438c-9f70-61815306244a', 'aaaaaaaa-0078-0078-0078-000000000078', '2026-01-28', '2026-01-28 12:49:00+00', '2026-01-28 14:08:45+00', 10.48, 4785, 7.61, 18, 18, 'blue', 15.1),
-  ('e639a90e-e8ae-48fa-be1f-93da0384eac7', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-01-28', '2026-01-28 18:29:00+00', '2026-01-28 19:10:38+00', 7.74, 2498, 5.38, 15, 15, 'purple', 8.9),
-  ('f5ca7328-2f49-4326-b71c-79e26b15dec9', 'aaaaaaaa-0058-0058-0058-000000000058', '2026-01-28', '2026-01-28 08:10:00+00', '2026-01-28 08:58:50+00', 8.14, 2930, 6.0, 10, 10, 'blue', 17.7),
-  ('83392f15-8114-4670-92db-25461bd5eae6', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-01-28', '2026-01-28 16:27:00+00', '2026-01-28 17:02:24+00', 6.38, 2124, 5.55, 13, 13, 'red', 11.9),
-  ('44b520b8-46ca-4695-8615-6424e3510833', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-01-28', '2026-01-28 14:46:00+00', '2026-01-28 15:48:52+00', 8.93, 3772, 7.04, 13, 39, 'blue', 11.1),
-  ('cea01d27-21eb-4b12-86fd-7da348209ed4', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-01-28', '2026-01-28 07:05:00+00', '2026-01-28 07:44:18+00', 6.02, 2358, 6.53, 11, 22, 'red', 22.3),
-  ('596647e9-d38a-4692-b932-ac07a0e279fe', 'aaaaaaaa-0087-0087-0087-000000000087', '2026-01-28', '2026-01-28 05:49:00+00', '2026-01-28 06:39:59+00', 9.98, 3059, 5.11, 19, 38, 'purple', 12.8),
-  ('71e9dbc0-3b6d-40f1-914d-6aae5317237e', 'aaaaaaaa-0067-0067-0067-000000000067', '2026-01-28', '2026-01-28 18:00:00+00', '2026-01-28 19:17:04+00', 10.66, 4624, 7.23, 15, 15, 'blue', 24.5),
-  ('5a09e00e-8d55-46de-95dd-5525c4e1cfc5', 'aaaaaaaa-0063-0063-0063-000000000063', '2026-01-29', '2026-01-29 14:02:00+00', '2026-01-29 15:26:54+00', 13.63, 5094, 6.23, 17, 17, 'blue', 5.8),
-  ('c790763c-d62a-4771-8533-265be718019e', 'aaaaaaaa-0033-0033-0033-000000000033', '2026-01-29', '2026-01-29 06:50:00+00', '2026-01-29 08:28:45+00', 12.96, 5925, 7.62, 23, 23, 'red', 17.0),
-  ('49964288-5454-4b01-a62b-101500374bbb', 'aaaaaaaa-0025-0025-0025-000000000025', '2026-01-29', '2026-01-29 14:33:00+00', '2026-01-29 15:32:10+00', 8.69, 3550, 6.81, 14, 56, 'red', 15.9),
-  ('c2a30e44-1df1-416d-b876-115f09bb81e3', 'aaaaaaaa-0023-0023-0023-000000000023', '2026-01-29', '2026-01-29 17:04:00+00', '2026-01-29 17:49:44+00', 6.61, 2744, 6.92, 9, 18, 'red', 13.1),
-  ('fa215d3c-8856-4f99-ada5-a81c9489eace', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-01-29', '2026-01-29 18:05:00+00', '2026-01-29 18:43:56+00', 8.43, 2336, 4.62, 10, 30, 'red', 3.8),
-  ('43a5010b-f552-406a-8a12-7d5888c76437', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-01-29', '2026-01-29 20:51:00+00', '2026-01-29 21:17:49+00', 5.53, 1609, 4.85, 11, 11, 'purple', 6.4),
-  ('e82f0a88-c144-4c2d-8cf4-1df1e77593d0', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-01-29', '2026-01-29 06:00:00+00', '2026-01-29 06:37:12+00', 7.61, 2232, 4.89, 14, 42, 'purple', 22.5),
-  ('734ee9e4-7e62-462b-ad37-64a791f53c31', 'aaaaaaaa-0015-0015-0015-000000000015', '2026-01-29', '2026-01-29 17:41:00+00', '2026-01-29 17:56:14+00', 3.0, 914, 5.08, 3, 9, 'red', 7.6),
-  ('003ba274-175a-4ac1-9c1b-cd91ce5e6b0a', 'aaaaaaaa-0044-0044-0044-000000000044', '2026-01-29', '2026-01-29 05:21:00+00', '2026-01-29 06:04:05+00', 8.04, 2585, 5.36, 15, 45, 'blue', 7.9),
-  ('8200bd61-3c62-4c17-b9fe-0d3229605603', 'aaaaaaaa-0034-0034-0034-000000000034', '2026-01-29', '2026-01-29 15:05:00+00', '2026-01-29 16:11:31+00', 11.49, 3991, 5.79, 16, 48, 'red', 16.5),
-  ('2b319854-9bec-4543-8f23-8f9386a30ecc', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-01-29', '2026-01-29 09:39:00+00', '2026-01-29 10:39:20+00', 9.17, 3620, 6.58, 18, 18, 'blue', 18.8),
-  ('2560c4b5-6856-4fda-a7b6-3ce901bb554b', 'aaaaaaaa-0042-0042-0042-000000000042', '2026-01-29', '2026-01-29 15:53:00+00', '2026-01-29 16:16:10+00', 2.99, 1390, 7.75, 3, 6, 'blue', 24.8),
-  ('03beaceb-4e68-4617-9aea-d4e80f79b055', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-01-29', '2026-01-29 14:11:00+00', '2026-01-29 15:10:49+00', 8.38, 3589, 7.14, 9, 18, 'blue', 24.7),
-  ('fb973e86-ab58-4747-8c8b-aa7b189f0c1c', 'aaaaaaaa-0080-0080-0080-000000000080', '2026-01-29', '2026-01-29 05:42:00+00', '2026-01-29 05:58:35+00', 3.09, 995, 5.37, 5, 10, 'purple', 17.1),
-  ('75127b71-dcff-474c-803e-37477230e683', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-01-29', '2026-01-29 18:41:00+00', '2026-01-29 18:58:07+00', 3.65, 1027, 4.69, 6, 18, 'purple', 9.7),
-  ('040796f9-6443-4d25-a470-921a8f752993', 'aaaaaaaa-0082-0082-0082-000000000082', '2026-01-29', '2026-01-29 05:46:00+00', '2026-01-29 06:43:54+00', 12.14, 3474, 4.77, 24, 48, 'purple', 7.7),
-  ('a70aba8b-b927-4219-b272-b7b9f60bdbe2', 'aaaaaaaa-0087-0087-0087-000000000087', '2026-01-29', '2026-01-29 20:19:00+00', '2026-01-29 20:47:03+00', 5.67, 1683, 4.95, 10, 20, 'purple', 18.4),
-  ('d0120de0-53b9-40ce-a6d6-39ec801cbd5a', 'aaaaaaaa-0016-0016-0016-000000000016', '2026-01-29', '2026-01-29 14:08:00+00', '2026-01-29 15:31:12+00', 10.82, 4992, 7.69, 17, 68, 'red', 12.1),
-  ('5db2f1bc-b7b8-479d-9789-6cca15a7864f', 'aaaaaaaa-0089-0089-0089-000000000089', '2026-01-29', '2026-01-29 20:22:00+00', '2026-01-29 20:57:42+00', 4.73, 2142, 7.55, 8, 16, 'purple', 18.9),
-  ('896106a4-ab52-48f6-9dd7-2fd056eb2184', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-01-29', '2026-01-29 18:04:00+00', '2026-01-29 19:27:40+00', 13.24, 5020, 6.32, 24, 24, 'red', 3.5),
-  ('078cf012-0c32-4052-a40b-40ff7cf1e37e', 'aaaaaaaa-0060-0060-0060-000000000060', '2026-01-29', '2026-01-29 14:07:00+00', '2026-01-29 15:09:40+00', 8.84, 3760, 7.09, 17, 34, 'blue', 18.8),
-  ('19f1fd6c-79be-4893-9a98-d15ec610d141', 'aaaaaaaa-0076-0076-0076-000000000076', '2026-01-29', '2026-01-29 16:24:00+00', '2026-01-29 17:55:57+00', 12.65, 5517, 7.27, 23, 69, 'blue', 9.1),
-  ('1598c4ab-b30c-4fcb-a7db-c5466c7f5801', 'aaaaaaaa-0093-0093-0093-000000000093', '2026-01-29', '2026-01-29 09:50:00+00', '2026-01-29 10:28:42+00', 7.82, 2322, 4.95, 16, 48, 'purple', 4.1),
-  ('64fd1da6-6e9f-4633-a7e2-f23f2a605a7d', 'aaaaaaaa-0078-0078-0078-000000000078', '2026-01-29', '2026-01-29 10:45:00+00', '2026-01-29 11:05:36+00', 4.0, 1236, 5.15, 7, 14, 'blue', 4.1),
-  ('5c1432cd-88db-41d2-8958-2826bcbb01a6', 'aaaaaaaa-0048-0048-0048-000000000048', '2026-01-29', '2026-01-29 19:10:00+00', '2026-01-29 19:30:43+00', 2.8, 1243, 7.4, 4, 4, 'blue', 18.1),
-  ('4b3352b8-6b80-4f1d-ba6e-c05fa294590a', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-01-29', '2026-01-29 13:42:00+00', '2026-01-29 14:14:10+00', 6.86, 1930, 4.69, 11, 33, 'red', 8.2),
-  ('341ca562-cafe-468f-8da7-82dd3e96acba', 'aaaaaaaa-0008-0008-0008-000000000008', '2026-01-29', '2026-01-29 08:53:00+00', '2026-01-29 09:27:33+00', 6.57, 2073, 5.26, 13, 26, 'red', 8.5),
-  ('854920b8-ae22-4d8d-98fa-1e849ce93c4d', 'aaaaaaaa-0030-0030-0030-000000000030', '2026-01-29', '2026-01-29 11:17:00+00', '2026-01-29 12:03:34+00', 6.71, 2794, 6.94, 10, 30, 'red', 21.3),
-  ('8b52e427-29bb-4d2d-8ae0-4c7c3f68bda1', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-01-29', '2026-01-29 16:11:00+00', '2026-01-29 17:21:10+00', 13.68, 4210, 5.13, 28, 28, 'blue', 13.9),
-  ('b025f0df-58ac-4b7b-8778-97803ec787e7', 'aaaaaaaa-0037-0037-0037-000000000037', '2026-01-29', '2026-01-29 17:46:00+00', '2026-01-29 18:57:22+00', 10.93, 4282, 6.53, 21, 21, 'red', 23.8),
-  ('0fa0dbb1-069e-415a-8139-0755ba898a5c', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-01-29', '2026-01-29 19:55:00+00', '2026-01-29 21:00:49+00', 11.67, 3949, 5.64, 26, 52, 'purple', 9.8),
-  ('da4e3a11-366e-41d9-a05e-46e68bd64cc4', 'aaaaaaaa-0062-0062-0062-000000000062', '2026-01-29', '2026-01-29 12:28:00+00', '2026-01-29 12:44:11+00', 2.43, 971, 6.66, 6, 6, 'blue', 12.1),
-  ('8a6e1658-0bb1-4c1a-83fd-91627fb91773', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-01-29', '2026-01-29 07:25:00+00', '2026-01-29 09:05:09+00', 12.63, 6009, 7.93, 22, 66, 'blue', 9.0),
-  ('dbfbd531-7ba9-4126-bdb8-391d507c903e', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-01-29', '2026-01-29 18:00:00+00', '2026-01-29 19:16:07+00', 9.76, 4567, 7.8, 14, 28, 'blue', 19.8),
-  ('0661bbef-093d-44ec-ba09-02e1011f7615', 'aaaaaaaa-0084-0084-0084-000000000084', '2026-01-29', '2026-01-29 20:37:00+00', '2026-01-29 21:31:54+00', 8.5, 3294, 6.46, 16, 16, 'purple', 8.2),
-  ('d74eedb2-1115-421d-9bf1-0b91a14ddb6e', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-01-29', '2026-01-29 07:16:00+00', '2026-01-29 07:54:37+00', 6.8, 2317, 5.68, 14, 56, 'red', 4.1),
-  ('03954ab4-f335-4acc-82a4-e85da1a8dede', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-01-29', '2026-01-29 18:46:00+00', '2026-01-29 19:04:49+00', 3.85, 1129, 4.89, 3, 9, 'blue', 20.7),
-  ('629e383c-c208-4e88-9441-21e80f79a36a', 'aaaaaaaa-0068-0068-0068-000000000068', '2026-01-29', '2026-01-29 06:16:00+00', '2026-01-29 07:30:24+00', 11.14, 4464, 6.68, 12, 12, 'blue', 22.2),
-  ('02d40c9d-03d0-4aef-bc51-f9547e2f28a6', 'aaaaaaaa-0036-0036-0036-000000000036', '2026-01-29', '2026-01-29 09:11:00+00', '2026-01-29 09:22:46+00', 2.25, 706, 5.23, 4, 12, 'red', 11.7),
-  ('e599588f-78bf-484f-8014-34b976256ea9', 'aaaaaaaa-0019-0019-0019-000000000019', '2026-01-29', '2026-01-29 08:05:00+00', '2026-01-29 08:59:47+00', 8.29, 3287, 6.61, 12, 36, 'red', 6.0),
-  ('ad8438d8-341b-4c06-b4cc-54411120bcff', 'aaaaaaaa-0090-0090-0090-000000000090', '2026-01-29', '2026-01-29 05:29:00+00', '2026-01-29 06:34:37+00', 11.16, 3937, 5.88, 22, 22, 'purple', 20.9),
-  ('d9e9fa48-7a5e-40d1-b626-99159ca4db49', 'aaaaaaaa-0066-0066-0066-000000000066', '2026-01-29', '2026-01-29 21:21:00+00', '2026-01-29 21:49:27+00', 4.02, 1707, 7.08, 5, 15, 'blue', 5.6),
-  ('deefef2b-2648-4b32-a77d-d5f1620e8e6d', 'aaaaaaaa-0077-0077-0077-000000000077', '2026-01-29', '2026-01-29 13:45:00+00', '2026-01-29 15:33:36+00', 14.96, 6516, 7.26, 25, 50, 'blue', 24.3),
-  ('cbd4fc2c-595b-4394-8d6a-06172fc8432b', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-01-29', '2026-01-29 15:05:00+00', '2026-01-29 16:13:49+00', 13.71, 4129, 5.02, 14, 42, 'blue', 6.2),
-  ('c34d0e72-152e-4310-ade2-3ee129428047', 'aaaaaaaa-0097-0097-0097-000000000097', '2026-01-29', '2026-01-29 13:21:00+00', '2026-01-29 14:42:37+00', 14.55, 4897, 5.61, 23, 69, 'purple', 12.4),
-  ('e5f8bfb3-f4b0-49a1-899e-c0a66767e002', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-01-29', '2026-01-29 14:54:00+00', '2026-01-29 16:17:11+00', 12.04, 4991, 6.91, 29, 116, 'red', 6.8),
-  ('471800a3-60ae-4968-8ad9-87c65861fd8b', 'aaaaaaaa-0061-0061-0061-000000000061', '2026-01-29', '2026-01-29 16:15:00+00', '2026-01-29 16:57:11+00', 7.02, 2531, 6.01, 8, 24, 'blue', 12.4),
-  ('3f4fc53b-2f36-44e2-8c1a-81c326bc3f41', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-01-29', '2026-01-29 16:22:00+00', '2026-01-29 17:25:40+00', 12.46, 3820, 5.11, 17, 17, 'blue', 13.0),
-  ('dbbfd5eb-fa4b-45e5-8117-402a39f92e58', 'aaaaaaaa-0004-0004-0004-000000000004', '2026-01-29', '2026-01-29 09:54:00+00', '2026-01-29 10:19:37+00', 5.21, 1537, 4.92, 9, 36, 'red', 24.4),
-  ('66f37e61-192b-4728-b0c7-c6b5f9a1e8af', 'aaaaaaaa-0026-0026-0026-000000000026', '2026-01-29', '2026-01-29 10:32:00+00', '2026-01-29 11:11:18+00', 6.92, 2358, 5.68, 11, 33, 'red', 10.6),
-  ('430a13da-2bfc-467c-b860-62e8cbd9aa79', 'aaaaaaaa-0098-0098-0098-000000000098', '2026-01-29', '2026-01-29 10:32:00+00', '2026-01-29 11:32:52+00', 11.82, 3652, 5.15, 25, 50, 'purple', 5.5),
-  ('a15bbc18-e515-4b1a-a2af-b7edaf9ca754', 'aaaaaaaa-0000-0000-0000-000000000000', '2026-01-29', '2026-01-29 19:45:00+00', '2026-01-29 20:25:24+00', 8.47, 2424, 4.77, 15, 15, 'red', 20.9),
-  ('5de62e03-f45d-4f4b-a592-ad8e2c44b62d', 'aaaaaaaa-0074-0074-0074-000000000074', '2026-01-29', '2026-01-29 08:16:00+00', '2026-01-29 08:38:27+00', 3.96, 1347, 5.67, 6, 18, 'blue', 18.3),
-  ('83281cc5-3dd1-4a8b-9a76-5ca58520ac27', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-01-29', '2026-01-29 13:02:00+00', '2026-01-29 13:21:19+00', 4.07, 1159, 4.75, 10, 40, 'red', 8.6),
-  ('37d1404b-078a-4a1d-99f2-1ed171109611', 'aaaaaaaa-0021-0021-0021-000000000021', '2026-01-29', '2026-01-29 15:04:00+00', '2026-01-29 15:51:04+00', 6.02, 2824, 7.82, 9, 36, 'red', 11.1),
-  ('8069bbf1-72f9-4708-890d-18bcd301ff63', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-01-29', '2026-01-29 05:00:00+00', '2026-01-29 05:48:00+00', 10.67, 2880, 4.5, 19, 57, 'purple', 3.6),
-  ('e74adf57-f109-401b-8ea5-90d24c0cef60', 'aaaaaaaa-0057-0057-0057-000000000057', '2026-01-29', '2026-01-29 09:15:00+00', '2026-01-29 09:44:55+00', 4.33, 1795, 6.91, 6, 12, 'blue', 4.0),
-  ('c61c317c-b6d9-42a9-93a7-1fdb6a1e9fbe', 'aaaaaaaa-0056-0056-0056-000000000056', '2026-01-29', '2026-01-29 06:13:00+00', '2026-01-29 06:55:37+00', 8.26, 2557, 5.16, 13, 39, 'blue', 16.6),
-  ('14829e15-8005-44cf-98d0-6bab6705fcc3', 'aaaaaaaa-0052-0052-0052-000000000052', '2026-01-29', '2026-01-29 10:05:00+00', '2026-01-29 11:17:55+00', 11.27, 4375, 6.47, 17, 17, 'blue', 20.4),
-  ('c1af8643-bba1-463b-8cad-9184a5c75d2d', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-01-29', '2026-01-29 07:38:00+00', '2026-01-29 09:03:00+00', 12.41, 5100, 6.85, 19, 19, 'red', 22.5),
-  ('a966e701-7769-4cac-975e-78c977bb7b43', 'aaaaaaaa-0024-0024-0024-000000000024', '2026-01-29', '2026-01-29 16:49:00+00', '2026-01-29 17:43:16+00', 10.52, 3256, 5.16, 17, 34, 'red', 9.4),
-  ('ea73a29e-368d-4fcd-93da-91c7b7a7ce23', 'aaaaaaaa-0018-0018-0018-000000000018', '2026-01-29', '2026-01-29 17:25:00+00', '2026-01-29 18:17:00+00', 8.23, 3120, 6.32, 8, 24, 'red', 11.3),
-  ('abbb6f8b-4652-4a6c-be1f-143b2ee5da8f', 'aaaaaaaa-0043-0043-0043-000000000043', '2026-01-29', '2026-01-29 08:51:00+00', '2026-01-29 09:48:05+00', 8.77, 3425, 6.51, 15, 30, 'blue', 6.8),
-  ('9bc3709a-3c98-4edb-8fb4-554903df3c7f', 'aaaaaaaa-0085-0085-0085-000000000085', '2026-01-29', '2026-01-29 19:11:00+00', '2026-01-29 20:30:18+00', 11.46, 4758, 6.92, 24, 24, 'purple', 21.8),
-  ('1eab5c54-cac7-411c-8b20-8ddabb04ec2d', 'aaaaaaaa-0096-0096-0096-000000000096', '2026-01-29', '2026-01-29 14:26:00+00', '2026-01-29 15:37:41+00', 9.74, 4301, 7.36, 14, 28, 'purple', 12.9),
-  ('433d9213-02be-4123-93c0-014f48b3376e', 'aaaaaaaa-0012-0012-0012-000000000012', '2026-01-29', '2026-01-29 15:54:00+00', '2026-01-29 16:24:33+00', 4.08, 1833, 7.49, 8, 16, 'red', 7.7),
-  ('5aae253d-8d1c-46d5-8265-134f8d839b54', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-01-29', '2026-01-29 20:31:00+00', '2026-01-29 21:34:57+00', 9.78, 3837, 6.54, 19, 57, 'red', 19.1),
-  ('f616929d-0501-47f2-97d4-1812d1d3dd08', 'aaaaaaaa-0041-0041-0041-000000000041', '2026-01-30', '2026-01-30 12:46:00+00', '2026-01-30 14:14:14+00', 13.17, 5294, 6.7, 23, 69, 'blue', 6.6),
-  ('25683547-5da7-4d91-ba39-a5151c5e52a4', 'aaaaaaaa-0015-0015-0015-000000000015', '2026-01-30', '2026-01-30 08:59:00+00', '2026-01-30 10:21:52+00', 14.8, 4972, 5.6, 22, 22, 'red', 22.7),
-  ('05c7e499-fb3e-43e5-839d-d92af533ed1d', 'aaaaaaaa-0071-0071-0071-000000000071', '2026-01-30', '2026-01-30 19:11:00+00', '2026-01-30 20:25:32+00', 13.31, 4472, 5.6, 22, 44, 'blue', 3.1),
-  ('d9299a92-2a06-4e6b-88c1-01ba5afa988e', 'aaaaaaaa-0052-0052-0052-000000000052', '2026-01-30', '2026-01-30 17:05:00+00', '2026-01-30 17:33:44+00', 6.22, 1724, 4.62, 8, 24, 'blue', 11.2),
-  ('942f0f77-7ba5-40ec-8bc3-c6846a6f8db2', 'aaaaaaaa-0046-0046-0046-000000000046', '2026-01-30', '2026-01-30 12:22:00+00', '2026-01-30 13:44:35+00', 13.81, 4955, 5.98, 14, 14, 'blue', 9.1),
-  ('3ef4a6fb-53a2-4336-8453-430dd5410f8b', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-01-30', '2026-01-30 12:50:00+00', '2026-01-30 14:15:36+00', 12.59, 5136, 6.8, 21, 42, 'red', 3.6),
-  ('be7e3cba-838f-4be5-9b7b-f6a1dc6a5938', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-01-30', '2026-01-30 21:31:00+00', '2026-01-30 22:16:57+00', 8.15, 2757, 5.64, 9, 9, 'blue', 17.7),
-  ('2e0bf2e1-39b3-4af0-84ee-6d0ebc707be9', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-01-30', '2026-01-30 05:00:00+00', '2026-01-30 06:19:03+00', 11.87, 4743, 6.66, 14, 42, 'blue', 3.9),
-  ('e8a5d3c2-7cd6-4ad6-a9eb-dd9169bd2b00', 'aaaaaaaa-0076-0076-0076-000000000076', '2026-01-30', '2026-01-30 12:58:00+00', '2026-01-30 14:21:53+00', 11.14, 5033, 7.53, 10, 10, 'blue', 7.1),
-  ('ac492070-c6cc-46f6-a003-46f8f1fa0e05', 'aaaaaaaa-0074-0074-0074-000000000074', '2026-01-30', '2026-01-30 06:26:00+00', '2026-01-30 06:57:56+00', 6.52, 1916, 4.9, 4, 12, 'blue', 12.0),
-  ('a6acfa00-8e30-4d97-8a98-8ca9fb596468', 'aaaaaaaa-0096-0096-0096-000000000096', '2026-01-30', '2026-01-30 09:07:00+00', '2026-01-30 09:33:01+00', 4.13, 1561, 6.3, 10, 10, 'purple', 23.8),
-  ('19688ff1-37a6-48d5-a3fb-e2901a595c3d', 'aaaaaaaa-0035-0035-0035-000000000035', '2026-01-30', '2026-01-30 14:08:00+00', '2026-01-30 15:11:24+00', 11.83, 3804, 5.36, 25, 75, 'red', 18.9),
-  ('492d59c7-f154-429d-b36f-282c44756d91', 'aaaaaaaa-0043-0043-0043-000000000043', '2026-01-30', '2026-01-30 17:20:00+00', '2026-01-30 18:25:44+00', 10.83, 3944, 6.07, 15, 30, 'blue', 10.9),
-  ('8f931042-47e5-438a-b026-117bfbe65a45', 'aaaaaaaa-0008-0008-0008-000000000008', '2026-01-30', '2026-01-30 11:54:00+00', '2026-01-30 13:34:37+00', 13.24, 6037, 7.6, 21, 21, 'red', 16.4),
-  ('d582fad4-f3c2-40d8-971b-0e369b99613c', 'aaaaaaaa-0012-0012-0012-000000000012', '2026-01-30', '2026-01-30 19:13:00+00', '2026-01-30 19:59:22+00', 8.85, 2782, 5.24, 9, 36, 'red', 19.7),
-  ('85261932-4f43-47f8-8c41-321b9752ad98', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-01-30', '2026-01-30 21:38:00+00', '2026-01-30 22:06:39+00', 4.94, 1719, 5.8, 7, 7, 'blue', 5.1),
-  ('c6a5b118-d3b7-4afb-84cd-56dc3390c762', 'aaaaaaaa-0090-0090-0090-000000000090', '2026-01-30', '2026-01-30 08:31:00+00', '2026-01-30 09:15:58+00', 5.65, 2698, 7.96, 14, 14, 'purple', 19.8),
-  ('8094eb64-ba07-4642-9d61-9f463eb0e9f7', 'aaaaaaaa-0082-0082-0082-000000000082', '2026-01-30', '2026-01-30 12:07:00+00', '2026-01-30 13:35:17+00', 12.63, 5297, 6.99, 28, 56, 'purple', 8.2),
-  ('c442e50b-1a32-438a-9600-e3458507807e', 'aaaaaaaa-0000-0000-0000-000000000000', '2026-01-30', '2026-01-30 20:39:00+00', '2026-01-30 21:15:22+00', 6.89, 2182, 5.28, 11, 33, 'red', 9.5),
-  ('2ff71d13-8e7a-4dc7-a985-6c279b33f1ee', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-01-30', '2026-01-30 06:59:00+00', '2026-01-30 08:36:53+00', 12.55, 5873, 7.8, 23, 46, 'blue', 12.5),
-  ('7ef1c3b6-a699-4c61-8d7e-815192f517f8', 'aaaaaaaa-0078-0078-0078-000000000078', '2026-01-30', '2026-01-30 09:14:00+00', '2026-01-30 09:35:35+00', 3.39, 1295, 6.37, 5, 5, 'blue', 4.2),
-  ('5d3a77a5-cb28-49bc-85ea-c6c7d0a86954', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-01-30', '2026-01-30 20:55:00+00', '2026-01-30 21:11:14+00', 3.26, 974, 4.98, 8, 24, 'red', 21.6),
-  ('e58fc37b-5ae6-409a-892b-38b224873ae8', 'aaaaaaaa-0042-0042-0042-000000000042', '2026-01-30', '2026-01-30 10:37:00+00', '2026-01-30 11:16:41+00', 6.06, 2381, 6.55, 7, 7, 'blue', 23.5),
-  ('bab98c7b-9658-43b6-abdb-0d5363ad1f48', 'aaaaaaaa-0089-0089-0089-000000000089', '2026-01-30', '2026-01-30 15:52:00+00', '2026-01-30 17:11:29+00', 12.46, 4769, 6.38, 29, 58, 'purple', 7.2),
-  ('2c76ae2f-e444-4e06-b3f5-f219457b8ea5', 'aaaaaaaa-0064-0064-0064-000000000064', '2026-01-30', '2026-01-30 14:41:00+00', '2026-01-30 16:01:58+00', 11.82, 4858, 6.85, 22, 44, 'blue', 13.9),
-  ('0de6b1d6-b27c-4a18-bc45-3f9e95ac98fc', 'aaaaaaaa-0058-0058-0058-000000000058', '2026-01-30', '2026-01-30 20:05:00+00', '2026-01-30 20:40:02+00', 7.72, 2102, 4.54, 10, 10, 'blue', 20.7),
-  ('3b842677-96a5-4e58-8139-6f2daf76fde3', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-01-30', '2026-01-30 16:01:00+00', '2026-01-30 17:19:14+00', 10.03, 4694, 7.8, 17, 17, 'purple', 17.4),
-  ('ba94345d-1544-4262-81af-8c0ac3db4a61', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-01-30', '2026-01-30 06:46:00+00', '2026-01-30 07:44:25+00', 10.8, 3505, 5.41, 25, 50, 'red', 21.5),
-  ('ff89ea80-e659-45d1-a3df-e3470fb74fc9', 'aaaaaaaa-0021-0021-0021-000000000021', '2026-01-30', '2026-01-30 10:51:00+00', '2026-01-30 11:57:39+00', 11.99, 3999, 5.56, 19, 38, 'red', 11.5),
-  ('e9f2665c-3557-40c2-8a6f-0e49fe073e88', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-01-30', '2026-01-30 15:04:00+00', '2026-01-30 15:39:09+00', 5.68, 2109, 6.19, 9, 9, 'blue', 17.2),
-  ('2402fff7-0991-455a-a4fe-fa3bf370ec03', 'aaaaaaaa-0033-0033-0033-000000000033', '2026-01-30', '2026-01-30 09:45:00+00', '2026-01-30 11:05:13+00', 12.42, 4813, 6.46, 21, 42, 'red', 13.7),
-  ('ab837b87-c5d0-46b6-b9e8-3796fa94d03c', 'aaaaaaaa-0048-0048-0048-000000000048', '2026-01-30', '2026-01-30 10:31:00+00', '2026-01-30 11:53:50+00', 11.49, 4970, 7.21, 21, 42, 'blue', 14.5),
-  ('9f5338ea-b0d2-4730-bd79-1d9ac1c3eed0', 'aaaaaaaa-0063-0063-0063-000000000063', '2026-01-30', '2026-01-30 17:24:00+00', '2026-01-30 18:10:35+00', 6.02, 2795, 7.74, 9, 18, 'blue', 4.9),
-  ('1897b68a-80c0-4e37-a9d2-86016ee7e347', 'aaaaaaaa-0045-0045-0045-000000000045', '2026-01-30', '2026-01-30 08:00:00+00', '2026-01-30 08:55:25+00', 11.67, 3325, 4.75, 19, 38, 'blue', 3.2),
-  ('2fb05e16-9215-4104-a66e-88f5eebb9658', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-01-30', '2026-01-30 05:55:00+00', '2026-01-30 07:28:54+00', 12.18, 5634, 7.71, 20, 80, 'red', 12.6),
-  ('b980e2cf-676b-4461-bc2b-6dc72c948c23', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-01-30', '2026-01-30 10:14:00+00', '2026-01-30 11:43:24+00', 12.18, 5364, 7.34, 29, 58, 'purple', 8.6),
-  ('833b315e-c627-4448-b03a-1c778d963182', 'aaaaaaaa-0038-0038-0038-000000000038', '2026-01-30', '2026-01-30 07:44:00+00', '2026-01-30 08:05:25+00', 3.5, 1285, 6.12, 6, 24, 'red', 10.0),
-  ('1b177fe2-c52a-4e64-ad56-23e647a739c8', 'aaaaaaaa-0044-0044-0044-000000000044', '2026-01-30', '2026-01-30 21:47:00+00', '2026-01-30 22:21:12+00', 4.68, 2052, 7.31, 9, 9, 'blue', 5.9),
-  ('0ac7e956-75e5-416d-aeca-dd7289b34fe4', 'aaaaaaaa-0025-0025-0025-000000000025', '2026-01-30', '2026-01-30 13:50:00+00', '2026-01-30 14:27:57+00', 8.36, 2277, 4.54, 13, 13, 'red', 23.1),
-  ('9c9003bd-f608-4d53-90a5-74820c2d4e99', 'aaaaaaaa-0026-0026-0026-000000000026', '2026-01-30', '2026-01-30 18:20:00+00', '2026-01-30 19:15:39+00', 11.29, 3339, 4.93, 14, 56, 'red', 12.1),
-  ('03d92ee7-436a-4b22-81d5-94e8694e1bed', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-01-30', '2026-01-30 12:24:00+00', '2026-01-30 13:01:45+00', 5.34, 2265, 7.07, 7, 14, 'blue', 16.9),
-  ('e3d1119f-7978-4551-b7f3-925e338f459f', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-01-30', '2026-01-30 18:52:00+00', '2026-01-30 19:44:54+00', 7.4, 3174, 7.15, 10, 30, 'blue', 22.6),
-  ('5cb08528-9ad7-4593-8551-e295847b03b9', 'aaaaaaaa-0062-0062-0062-000000000062', '2026-01-30', '2026-01-30 08:58:00+00', '2026-01-30 09:39:43+00', 6.74, 2503, 6.19, 9, 9, 'blue', 11.1),
-  ('5e844bdb-20a9-4451-b750-1b65e6a45542', 'aaaaaaaa-0080-0080-0080-000000000080', '2026-01-30', '2026-01-30 17:21:00+00', '2026-01-30 17:50:03+00', 6.04, 1743, 4.81, 14, 28, 'purple', 23.4),
-  ('0c9e8dcc-b40f-4576-88bd-9c2f5fbe78d5', 'aaaaaaaa-0024-0024-0024-000000000024', '2026-01-30', '2026-01-30 08:55:00+00', '2026-01-30 09:13:07+00', 2.51, 1087, 7.22, 4, 8, 'red', 11.3),
-  ('95f7d1db-3046-4092-b5a4-023ac1132ffd', 'aaaaaaaa-0014-0014-0014-000000000014', '2026-01-30', '2026-01-30 19:26:00+00', '2026-01-30 20:24:47+00', 12.43, 3527, 4.73, 21, 84, 'red', 17.4),
-  ('1eb248e7-0e2d-4598-a0f5-4a1c1a1d0fc9', 'aaaaaaaa-0032-0032-0032-000000000032', '2026-01-30', '2026-01-30 20:19:00+00', '2026-01-30 21:39:14+00', 11.58, 4814, 6.93, 10, 40, 'red', 5.2),
-  ('108b3ca6-bead-4377-a473-e3ceb3590641', 'aaaaaaaa-0066-0066-0066-000000000066', '2026-01-30', '2026-01-30 13:09:00+00', '2026-01-30 14:04:42+00', 11.21, 3342, 4.97, 23, 69, 'blue', 14.9),
-  ('c94aa96c-3085-4b77-a32d-0f7d6f7bf62c', 'aaaaaaaa-0093-0093-0093-000000000093', '2026-01-30', '2026-01-30 16:13:00+00', '2026-01-30 16:29:15+00', 3.59, 975, 4.53, 8, 16, 'purple', 9.6),
-  ('2d36d367-175f-41fc-98de-5a9295c90baf', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-01-30', '2026-01-30 19:53:00+00', '2026-01-30 21:02:32+00', 9.36, 4172, 7.43, 11, 22, 'red', 3.7),
-  ('b801fca5-751d-4b4e-a0c9-d2c16c435696', 'aaaaaaaa-0092-0092-0092-000000000092', '2026-01-30', '2026-01-30 14:14:00+00', '2026-01-30 15:40:47+00', 12.69, 5207, 6.84, 25, 50, 'purple', 7.8),
-  ('c6727452-f721-4d05-8a63-11ab541c051c', 'aaaaaaaa-0023-0023-0023-000000000023', '2026-01-30', '2026-01-30 18:05:00+00', '2026-01-30 19:14:50+00', 9.19, 4190, 7.6, 16, 16, 'red', 13.5),
-  ('9a651703-c9eb-472d-955a-f55c843a5e84', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-01-30', '2026-01-30 07:26:00+00', '2026-01-30 08:19:51+00', 11.97, 3231, 4.5, 14, 42, 'red', 16.2),
-  ('32b9c238-af6d-48b0-9a48-e13b826f96a9', 'aaaaaaaa-0091-0091-0091-000000000091', '2026-01-30', '2026-01-30 05:45:00+00', '2026-01-30 06:22:06+00', 5.71, 2226, 6.5, 11, 33, 'purple', 7.5),
-  ('d7d5c6d2-7185-42f1-9637-abe88988d01f', 'aaaaaaaa-0018-0018-0018-000000000018', '2026-01-30', '2026-01-30 11:44:00+00', '2026-01-30 12:25:06+00', 5.19, 2466, 7.92, 5, 5, 'red', 8.5),
-  ('61062145-d2fb-4b24-8049-b7cb0acb02f3', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-01-30', '2026-01-30 12:54:00+00', '2026-01-30 14:35:20+00', 13.64, 6080, 7.43, 30, 60, 'blue', 19.2),
-  ('81ad0e41-f1a9-4311-aefc-73538d061987', 'aaaaaaaa-0060-0060-0060-000000000060', '2026-01-30', '2026-01-30 18:23:00+00', '2026-01-30 19:55:55+00', 12.21, 5575, 7.61, 22, 66, 'blue', 18.5),
-  ('1a685f7c-c51f-4623-8c7b-0b466396e695', 'aaaaaaaa-0009-0009-0009-000000000009', '2026-01-30', '2026-01-30 17:03:00+00', '2026-01-30 17:51:33+00', 6.5, 2913, 7.47, 10, 30, 'red', 7.6),
-  ('b66410ed-967a-4488-ad68-adcb57fe9c7c', 'aaaaaaaa-0029-0029-0029-000000000029', '2026-01-30', '2026-01-30 11:33:00+00', '2026-01-30 11:48:51+00', 2.09, 951, 7.59, 1, 4, 'red', 15.1),
-  ('7365af75-e6a4-4016-84d6-c12c8ebb0fc2', 'aaaaaaaa-0097-0097-0097-000000000097', '2026-01-30', '2026-01-30 09:08:00+00', '2026-01-30 10:14:45+00', 13.54, 4005, 4.93, 27, 54, 'purple', 7.7),
-  ('61448650-f92d-48ca-8468-bddbf1b86211', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-01-30', '2026-01-30 12:07:00+00', '2026-01-30 12:47:56+00', 7.35, 2456, 5.57, 11, 22, 'purple', 20.2),
-  ('bef6a389-6f6a-4d41-b221-327290eba99c', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-01-31', '2026-01-31 14:45:00+00', '2026-01-31 15:09:22+00', 4.44, 1462, 5.49, 8, 24, 'red', 3.3),
-  ('6d27e168-f786-4ff7-9658-1fe027fd6e14', 'aaaaaaaa-0091-0091-0091-000000000091', '2026-01-31', '2026-01-31 06:13:00+00', '2026-01-31 06:39:27+00', 5.29, 1587, 5.0, 8, 16, 'purple', 14.3),
-  ('cf962a4a-d218-444d-8cf1-4c835469b207', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-01-31', '2026-01-31 09:39:00+00', '2026-01-31 10:47:16+00', 12.0, 4096, 5.69, 19, 38, 'purple', 7.6),
-  ('03c29528-52f6-4ee3-a53d-622e287b9bb0', 'aaaaaaaa-0062-0062-0062-000000000062', '2026-01-31', '2026-01-31 11:42:00+00', '2026-01-31 13:13:00+00', 11.49, 5460, 7.92, 23, 23, 'blue', 16.7),
-  ('cd0f3627-c897-4892-bf66-3be141e63a66', 'aaaaaaaa-0086-0086-0086-000000000086', '2026-01-31', '2026-01-31 16:29:00+00', '2026-01-31 17:45:00+00', 13.92, 4560, 5.46, 17, 34, 'purple', 16.7),
-  ('f6bfa8e1-01cf-45a8-a8c6-872c9b0fe5cf', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-01-31', '2026-01-31 17:51:00+00', '2026-01-31 18:59:32+00', 11.11, 4112, 6.17, 24, 24, 'blue', 5.2),
-  ('9b368c15-4b36-484d-afed-086d5a263ef5', 'aaaaaaaa-0023-0023-0023-000000000023', '2026-01-31', '2026-01-31 16:30:00+00', '2026-01-31 17:12:31+00', 6.3, 2551, 6.75, 11, 33, 'red', 24.9),
-  ('7c149207-928e-469c-ba26-ee89fa3c0495', 'aaaaaaaa-0044-0044-0044-000000000044', '2026-01-31', '2026-01-31 19:26:00+00', '2026-01-31 20:07:14+00', 7.68, 2474, 5.37, 8, 24, 'blue', 24.8),
-  ('7a4596e0-dff4-4ff8-97e5-527137d7c302', 'aaaaaaaa-0043-0043-0043-000000000043', '2026-01-31', '2026-01-31 06:33:00+00', '2026-01-31 07:15:09+00', 8.38, 2529, 5.03, 16, 16, 'blue', 23.9),
-  ('db9125fe-4e7e-40de-8719-e0c5df1a1ee4', 'aaaaaaaa-0078-0078-0078-000000000078', '2026-01-31', '2026-01-31 20:38:00+00', '2026-01-31 21:55:58+00', 11.96, 4678, 6.52, 11, 22, 'blue', 3.9),
-  ('2daef3f3-bdef-4b27-b50a-e71802e510a1', 'aaaaaaaa-0031-0031-0031-000000000031', '2026-01-31', '2026-01-31 07:39:00+00', '2026-01-31 09:08:12+00', 13.1, 5352, 6.81, 27, 81, 'red', 19.1),
-  ('4d415168-798f-4eea-a61a-c9836320a991', 'aaaaaaaa-0096-0096-0096-000000000096', '2026-01-31', '2026-01-31 19:07:00+00', '2026-01-31 19:43:27+00', 7.15, 2187, 5.1, 11, 33, 'purple', 5.0),
-  ('aafbc118-f36f-44ea-a688-944c9551b59f', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-01-31', '2026-01-31 19:36:00+00', '2026-01-31 20:04:03+00', 4.31, 1683, 6.51, 7, 7, 'purple', 15.6),
-  ('47596c64-02d1-4e22-ab2e-6198b5bf6cdc', 'aaaaaaaa-0084-0084-0084-000000000084', '2026-01-31', '2026-01-31 17:32:00+00', '2026-01-31 19:07:10+00', 13.2, 5710, 7.21, 17, 34, 'purple', 19.2),
-  ('dace4a7d-45cb-4bd7-8675-a063299278b1', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-01-31', '2026-01-31 09:11:00+00', '2026-01-31 10:05:58+00', 8.12, 3298, 6.77, 16, 16, 'blue', 7.6),
-  ('b9f7780c-6b47-4afa-8253-5e4c458c449e', 'aaaaaaaa-0008-0008-0008-000000000008', '2026-01-31', '2026-01-31 09:42:00+00', '2026-01-31 10:21:42+00', 6.5, 2382, 6.11, 14, 42, 'red', 3.4),
-  ('a0e3896a-9534-4be6-b496-0b0edf778e1f', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-01-31', '2026-01-31 21:13:00+00', '2026-01-31 22:39:21+00', 14.44, 5181, 5.98, 27, 108, 'red', 6.2),
-  ('a332247b-ab0c-42ce-ae4b-e7b6fb026a86', 'aaaaaaaa-0066-0066-0066-000000000066', '2026-01-31', '2026-01-31 16:08:00+00', '2026-01-31 17:14:50+00', 9.17, 4010, 7.29, 17, 17, 'blue', 14.5),
-  ('aafc2630-b586-4231-a7a8-d561738cb370', 'aaaaaaaa-0016-0016-0016-000000000016', '2026-01-31', '2026-01-31 16:03:00+00', '2026-01-31 16:26:00+00', 3.48, 1380, 6.61, 6, 12, 'red', 3.6),
-  ('31a905cb-1e6c-45d4-afd2-e00c1c0431b4', 'aaaaaaaa-0041-0041-0041-000000000041', '2026-01-31', '2026-01-31 19:16:00+00', '2026-01-31 20:11:19+00', 9.04, 3319, 6.12, 13, 39, 'blue', 24.9),
-  ('f88a7080-6f58-4c16-8751-b1d545d8f43b', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-01-31', '2026-01-31 14:01:00+00', '2026-01-31 15:27:15+00', 13.8, 5175, 6.25, 18, 54, 'blue', 20.3),
-  ('113686e5-c202-475f-9305-ebdd3c90fc8e', 'aaaaaaaa-0087-0087-0087-000000000087', '2026-01-31', '2026-01-31 21:41:00+00', '2026-01-31 22:37:13+00', 7.2, 3373, 7.81, 14, 14, 'purple', 24.4),
-  ('1a4d2975-f428-46ec-a248-5be71920a631', 'aaaaaaaa-0098-0098-0098-000000000098', '2026-01-31', '2026-01-31 14:39:00+00', '2026-01-31 15:43:37+00', 11.26, 3877, 5.74, 24, 48, 'purple', 20.0),
-  ('6d1acc0a-ae02-4f89-bcd0-311728a8ef5b', 'aaaaaaaa-0014-0014-0014-000000000014', '2026-01-31', '2026-01-31 20:53:00+00', '2026-01-31 21:38:20+00', 9.35, 2720, 4.85, 19, 19, 'red', 4.4),
-  ('925e3cb7-1603-495f-b369-da75b96aae99', 'aaaaaaaa-0049-0049-0049-000000000049', '2026-01-31', '2026-01-31 06:31:00+00', '2026-01-31 07:27:19+00', 7.45, 3379, 7.56, 11, 11, 'blue', 24.8),
-  ('2e376501-5b34-4de7-9292-0391b651a68a', 'aaaaaaaa-0027-0027-0027-000000000027', '2026-01-31', '2026-01-31 11:11:00+00', '2026-01-31 11:40:09+00', 6.45, 1749, 4.52, 12, 24, 'red', 3.6),
-  ('5c2a3aa2-83aa-45fb-8a00-de675e2e49ea', 'aaaaaaaa-0076-0076-0076-000000000076', '2026-01-31', '2026-01-31 11:13:00+00', '2026-01-31 11:33:17+00', 3.65, 1217, 5.56, 4, 12, 'blue', 24.4),
-  ('08f36f9e-3b5a-43f5-a9f8-840ed28002db', 'aaaaaaaa-0058-0058-0058-000000000058', '2026-01-31', '2026-01-31 07:17:00+00', '2026-01-31 08:32:37+00', 14.19, 4537, 5.33, 27, 27, 'blue', 4.7),
-  ('0b6470d3-7858-41ad-908e-9c5dd22ed4e6', 'aaaaaaaa-0021-0021-0021-000000000021', '2026-01-31', '2026-01-31 09:04:00+00', '2026-01-31 09:42:58+00', 6.08, 2338, 6.41, 13, 39, 'red', 22.6),
-  ('87dfd09b-5b27-4ab5-bb78-db8895131df2', 'aaaaaaaa-0060-0060-0060-000000000060', '2026-01-31', '2026-01-31 18:22:00+00', '2026-01-31 19:01:50+00', 8.53, 2390, 4.67, 8, 8, 'blue', 11.4),
-  ('4580e1c8-44a1-434f-b0ae-ef49dd05a290', 'aaaaaaaa-0012-0012-0012-000000000012', '2026-01-31', '2026-01-31 06:26:00+00', '2026-01-31 07:56:51+00', 14.87, 5451, 6.11, 27, 81, 'red', 16.7),
-  ('c688f920-7629-448d-a48a-37db47907f09', 'aaaaaaaa-0042-0042-0042-000000000042', '2026-01-31', '2026-01-31 08:59:00+00', '2026-01-31 09:40:25+00', 7.13, 2485, 5.81, 11, 33, 'blue', 11.3),
-  ('7e053d8f-d1d0-4a26-9af3-835bd22fdedb', 'aaaaaaaa-0032-0032-0032-000000000032', '2026-01-31', '2026-01-31 08:04:00+00', '2026-01-31 09:04:58+00', 9.82, 3658, 6.21, 13, 13, 'red', 8.0),
-  ('1687eddb-fc78-4826-9573-1a6abeddf71b', 'aaaaaaaa-0024-0024-0024-000000000024', '2026-01-31', '2026-01-31 18:20:00+00', '2026-01-31 19:42:04+00', 12.57, 4924, 6.53, 19, 57, 'red', 5.9),
-  ('40f96bc9-4c8a-49a7-a102-b91ea171db06', 'aaaaaaaa-0052-0052-0052-000000000052', '2026-01-31', '2026-01-31 15:17:00+00', '2026-01-31 16:12:23+00', 7.24, 3323, 7.65, 9, 9, 'blue', 15.2),
-  ('6660c8b6-26e8-4edb-be9a-a48457242cca', 'aaaaaaaa-0022-0022-0022-000000000022', '2026-01-31', '2026-01-31 08:18:00+00', '2026-01-31 08:49:10+00', 4.87, 1870, 6.4, 7, 21, 'red', 18.1),
-  ('d8aa56f4-affb-43ea-b7ae-118f2e1e00d9', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-01-31', '2026-01-31 18:34:00+00', '2026-01-31 19:06:40+00', 5.52, 1960, 5.92, 12, 24, 'purple', 22.5),
-  ('7b23c17f-0ff6-4ccd-869b-faf8d223a667', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-01-31', '2026-01-31 13:32:00+00', '2026-01-31 14:22:43+00', 9.19, 3043, 5.52, 15, 30, 'blue', 20.2),
-  ('5c817950-2c06-4546-9434-fb62184f7287', 'aaaaaaaa-0085-0085-0085-000000000085', '2026-01-31', '2026-01-31 11:19:00+00', '2026-01-31 12:45:27+00', 13.0, 5187, 6.65, 29, 58, 'purple', 5.4),
-  ('6ad6571b-ca84-4cdb-b961-00780422c75f', 'aaaaaaaa-0070-0070-0070-000000000070', '2026-01-31', '2026-01-31 15:42:00+00', '2026-01-31 16:29:26+00', 5.99, 2846, 7.92, 8, 24, 'blue', 15.7),
-  ('930070ab-1fcd-49d8-9a86-3bc457754c7b', 'aaaaaaaa-0069-0069-0069-000000000069', '2026-01-31', '2026-01-31 15:07:00+00', '2026-01-31 17:00:54+00', 14.31, 6834, 7.96, 21, 21, 'blue', 23.5),
-  ('4b4ec565-75c2-40dc-859a-7fcface5075c', 'aaaaaaaa-0018-0018-0018-000000000018', '2026-01-31', '2026-01-31 09:32:00+00', '2026-01-31 09:46:26+00', 3.12, 866, 4.63, 6, 18, 'red', 10.0),
-  ('54775e67-2591-413e-8795-d8821f12b59b', 'aaaaaaaa-0007-0007-0007-000000000007', '2026-01-31', '2026-01-31 05:46:00+00', '2026-01-31 07:03:04+00', 14.46, 4624, 5.33, 30, 90, 'red', 15.0),
-  ('2a1a63a5-0e07-49e4-ae77-95b056ce49c5', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-01-31', '2026-01-31 10:38:00+00', '2026-01-31 11:30:21+00', 10.05, 3141, 5.21, 17, 34, 'blue', 4.6),
-  ('9cedfac4-c013-4ef2-97b6-a6b0a0ecda7a', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-01-31', '2026-01-31 06:29:00+00', '2026-01-31 07:19:07+00', 7.12, 3007, 7.04, 10, 30, 'blue', 21.6),
-  ('e66ea984-7d89-4dd7-95da-1ffa1c260fff', 'aaaaaaaa-0071-0071-0071-000000000071', '2026-01-31', '2026-01-31 15:03:00+00', '2026-01-31 16:45:04+00', 14.06, 6124, 7.26, 14, 28, 'blue', 18.9),
-  ('5110f95d-9c15-4fd8-934a-a9a6345b1da1', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-01-31', '2026-01-31 16:16:00+00', '2026-01-31 16:44:14+00', 5.4, 1694, 5.23, 11, 44, 'red', 23.2),
-  ('e3f5e93a-de6d-4f98-9dca-709eb59c9923', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-02-01', '2026-02-01 10:32:00+00', '2026-02-01 11:41:02+00', 13.51, 4142, 5.11, 21, 21, 'red', 3.9),
-  ('fc199144-391f-49de-8d2e-1ea3a8b959f5', 'aaaaaaaa-0097-0097-0097-000000000097', '2026-02-01', '2026-02-01 15:18:00+00', '2026-02-01 16:53:25+00', 13.0, 5725, 7.34, 31, 31, 'purple', 17.8),
-  ('b1ad5d28-5a40-4d21-9f48-639a7258c39c', 'aaaaaaaa-0044-0044-0044-000000000044', '2026-02-01', '2026-02-01 14:50:00+00', '2026-02-01 16:07:08+00', 10.79, 4628, 7.15, 15, 15, 'blue', 19.6),
-  ('1b92ec80-7a6a-41f7-8f7e-7201db35cfcd', 'aaaaaaaa-0026-0026-0026-000000000026', '2026-02-01', '2026-02-01 05:10:00+00', '2026-02-01 06:04:12+00', 6.94, 3252, 7.81, 13, 26, 'red', 3.5),
-  ('5f136868-8f66-45f3-9a10-35a4127acd21', 'aaaaaaaa-0072-0072-0072-000000000072', '2026-02-01', '2026-02-01 11:09:00+00', '2026-02-01 11:30:02+00', 4.33, 1262, 4.86, 8, 8, 'blue', 6.1),
-  ('3edcad7d-a765-49fa-85fc-5431b18646f2', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-02-01', '2026-02-01 21:51:00+00', '2026-02-01 23:01:54+00', 9.22, 4254, 7.69, 14, 42, 'blue', 5.2),
-  ('59170284-158e-4a8e-9738-1235e653db77', 'aaaaaaaa-0024-0024-0024-000000000024', '2026-02-01', '2026-02-01 14:11:00+00', '2026-02-01 14:28:54+00', 2.42, 1074, 7.4, 6, 24, 'red', 4.7),
-  ('b9278424-52a9-4d59-9886-02b9d02731e3', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-02-01', '2026-02-01 15:28:00+00', '2026-02-01 15:51:11+00', 4.54, 1391, 5.11, 6, 6, 'red', 18.1),
-  ('49a70734-3132-40b7-81b1-93ceb807f9ef', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-02-01', '2026-02-01 20:27:00+00', '2026-02-01 20:45:45+00', 3.08, 1125, 6.09, 3, 6, 'blue', 6.9),
-  ('254af3c0-b1a2-4f9f-aa44-1ff2ade68510', 'aaaaaaaa-0012-0012-0012-000000000012', '2026-02-01', '2026-02-01 17:07:00+00', '2026-02-01 17:59:13+00', 10.3, 3133, 5.07, 15, 45, 'red', 11.4),
-  ('cd7554c9-c237-4b28-8ce7-77a5aa839b47', 'aaaaaaaa-0093-0093-0093-000000000093', '2026-02-01', '2026-02-01 17:57:00+00', '2026-02-01 18:30:26+00', 4.25, 2006, 7.87, 8, 24, 'purple', 4.8),
-  ('ab2b6bc1-116c-4a4c-a5cb-1cfe8c7ad304', 'aaaaaaaa-0086-0086-0086-000000000086', '2026-02-01', '2026-02-01 21:27:00+00', '2026-02-01 22:04:20+00', 4.83, 2240, 7.73, 11, 22, 'purple', 13.0),
-  ('a2fdc2a2-12eb-401d-814f-3995e6f37683', 'aaaaaaaa-0084-0084-0084-000000000084', '2026-02-01', '2026-02-01 09:29:00+00', '2026-02-01 11:06:16+00', 12.52, 5836, 7.77, 25, 75, 'purple', 11.1),
-  ('d4515d03-7b69-4058-a53c-e950ac97ac14', 'aaaaaaaa-0098-0098-0098-000000000098', '2026-02-01', '2026-02-01 13:49:00+00', '2026-02-01 14:26:29+00', 6.3, 2249, 5.95, 10, 30, 'purple', 15.3),
-  ('afa333e7-2322-4a51-b70e-eff507146551', 'aaaaaaaa-0078-0078-0078-000000000078', '2026-02-01', '2026-02-01 14:47:00+00', '2026-02-01 15:31:56+00', 6.33, 2696, 7.1, 8, 8, 'blue', 6.7),
-  ('e746f18e-aae7-458d-96c7-217cee8aeea8', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-02-01', '2026-02-01 10:38:00+00', '2026-02-01 10:53:06+00', 3.35, 906, 4.51, 5, 15, 'blue', 20.3),
-  ('b3fb7d7d-32b3-4d56-81c7-ab5e878b3c15', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-02-01', '2026-02-01 12:59:00+00', '2026-02-01 14:23:01+00', 10.94, 5041, 7.68, 15, 45, 'blue', 20.2),
-  ('bf8779a9-7f4f-4038-9f5d-76798e3d4455', 'aaaaaaaa-0037-0037-0037-000000000037', '2026-02-01', '2026-02-01 05:10:00+00', '2026-02-01 06:15:37+00', 9.43, 3937, 6.96, 15, 60, 'red', 19.1),
-  ('452a66c0-013f-410c-854d-c6d1f0afc051', 'aaaaaaaa-0018-0018-0018-000000000018', '2026-02-01', '2026-02-01 15:39:00+00', '2026-02-01 15:54:03+00', 2.1, 903, 7.17, 3, 3, 'red', 13.3),
-  ('5423819e-c1b4-4e76-a762-db985b237d2a', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-02-01', '2026-02-01 20:38:00+00', '2026-02-01 20:56:28+00', 3.01, 1108, 6.14, 4, 4, 'blue', 17.3),
-  ('26e6adb2-a535-4626-a1c9-6fdd9f149275', 'aaaaaaaa-0007-0007-0007-000000000007', '2026-02-01', '2026-02-01 15:24:00+00', '2026-02-01 16:15:53+00', 8.16, 3113, 6.36, 17, 34, 'red', 4.1),
-  ('6e9403c8-331a-40ab-9531-f47172a0c33f', 'aaaaaaaa-0048-0048-0048-000000000048', '2026-02-01', '2026-02-01 05:13:00+00', '2026-02-01 06:22:29+00', 9.48, 4169, 7.33, 17, 17, 'blue', 9.0),
-  ('63be0bd3-0ddf-4db0-ab67-c308c239cb4c', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-02-01', '2026-02-01 09:56:00+00', '2026-02-01 11:06:16+00', 10.35, 4216, 6.79, 11, 11, 'blue', 9.8),
-  ('918daca7-2b82-4a7d-bdb8-2c33b10ce4ec', 'aaaaaaaa-0003-0003-0003-000000000003', '2026-02-01', '2026-02-01 10:07:00+00', '2026-02-01 10:39:46+00', 6.23, 1966, 5.26, 10, 30, 'red', 9.8),
-  ('e51f5aa3-9dc9-4b72-85dc-9fa543388f67', 'aaaaaaaa-0071-0071-0071-000000000071', '2026-02-01', '2026-02-01 05:12:00+00', '2026-02-01 06:18:46+00', 10.7, 4006, 6.24, 12, 24, 'blue', 24.5),
-  ('f96bfef5-e332-4ecc-8073-0fd1d15a5247', 'aaaaaaaa-0058-0058-0058-000000000058', '2026-02-01', '2026-02-01 20:40:00+00', '2026-02-01 21:47:59+00', 10.46, 4079, 6.5, 13, 26, 'blue', 8.6),
-  ('7ec1c5fb-968e-4408-bfd8-472459709eff', 'aaaaaaaa-0020-0020-0020-000000000020', '2026-02-01', '2026-02-01 06:50:00+00', '2026-02-01 07:57:34+00', 13.12, 4054, 5.15, 24, 96, 'red', 16.1),
-  ('d292662b-b80f-4cfd-9968-49728633e37d', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-02-01', '2026-02-01 17:04:00+00', '2026-02-01 17:29:54+00', 4.72, 1554, 5.49, 10, 30, 'purple', 23.9),
-  ('2f37ba93-8cac-4958-9b34-68cd385b65b6', 'aaaaaaaa-0032-0032-0032-000000000032', '2026-02-01', '2026-02-01 18:36:00+00', '2026-02-01 19:04:45+00', 5.99, 1725, 4.8, 9, 9, 'red', 3.2),
-  ('25025b68-ac08-4345-9828-0c53aa5ab01a', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-02-01', '2026-02-01 06:08:00+00', '2026-02-01 06:18:16+00', 2.19, 616, 4.69, 2, 4, 'red', 18.5),
-  ('28343f4e-a976-4ad8-8306-cdd5a3836cdc', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-02-01', '2026-02-01 16:04:00+00', '2026-02-01 16:41:07+00', 8.09, 2227, 4.59, 14, 14, 'blue', 21.5),
-  ('f768f75f-0b2b-4a64-9665-60fd4ec907a9', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-02-01', '2026-02-01 19:24:00+00', '2026-02-01 19:40:34+00', 3.37, 994, 4.92, 6, 24, 'red', 8.3),
-  ('84d682ce-2edb-477e-a431-782e641a82d2', 'aaaaaaaa-0033-0033-0033-000000000033', '2026-02-01', '2026-02-01 07:13:00+00', '2026-02-01 09:07:58+00', 14.74, 6898, 7.8, 18, 18, 'red', 21.1),
-  ('d5d818d9-630d-4cfb-89ed-bbaea488c85a', 'aaaaaaaa-0031-0031-0031-000000000031', '2026-02-01', '2026-02-01 07:44:00+00', '2026-02-01 07:53:37+00', 2.13, 577, 4.52, 2, 2, 'red', 9.0),
-  ('1e8a9451-c541-4171-84b6-acb651795508', 'aaaaaaaa-0014-0014-0014-000000000014', '2026-02-01', '2026-02-01 18:14:00+00', '2026-02-01 19:41:18+00', 14.48, 5238, 6.03, 11, 11, 'red', 12.0),
-  ('ffb61f55-56df-4b8e-b78e-2747ef1f0631', 'aaaaaaaa-0049-0049-0049-000000000049', '2026-02-01', '2026-02-01 10:26:00+00', '2026-02-01 10:49:23+00', 3.73, 1403, 6.27, 4, 4, 'blue', 7.3),
-  ('2fc0957f-8b68-4202-966b-77305101f387', 'aaaaaaaa-0082-0082-0082-000000000082', '2026-02-01', '2026-02-01 08:21:00+00', '2026-02-01 09:35:13+00', 13.09, 4453, 5.67, 29, 87, 'purple', 8.9),
-  ('5f41eba7-6ecf-4ebc-870f-000021015216', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-02-01', '2026-02-01 13:03:00+00', '2026-02-01 14:08:56+00', 8.78, 3956, 7.51, 10, 10, 'red', 21.9),
-  ('7f2e8130-0761-4764-a0a8-bbba404e8d52', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-02-01', '2026-02-01 11:54:00+00', '2026-02-01 13:01:09+00', 8.99, 4029, 7.47, 16, 48, 'blue', 18.3),
-  ('bf93253f-8401-427f-8bc0-2de765f08d85', 'aaaaaaaa-0004-0004-0004-000000000004', '2026-02-01', '2026-02-01 15:36:00+00', '2026-02-01 16:52:22+00', 14.41, 4582, 5.3, 21, 42, 'red', 14.0),
-  ('62f187b4-4215-4e82-bec4-3906e6b57dfb', 'aaaaaaaa-0038-0038-0038-000000000038', '2026-02-01', '2026-02-01 11:40:00+00', '2026-02-01 12:20:54+00', 7.37, 2454, 5.55, 7, 7, 'red', 23.5),
-  ('4d99aa65-e1d9-417a-a169-8d49507240ea', 'aaaaaaaa-0092-0092-0092-000000000092', '2026-02-01', '2026-02-01 13:54:00+00', '2026-02-01 14:05:47+00', 2.57, 707, 4.59, 3, 9, 'purple', 20.1),
-  ('544caec1-1d40-4899-a2e5-97e850ea3a5d', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-02-01', '2026-02-01 13:57:00+00', '2026-02-01 14:50:48+00', 7.38, 3228, 7.29, 15, 30, 'blue', 14.8),
-  ('528c5341-5fc8-4dbb-a22b-f706c54c6930', 'aaaaaaaa-0062-0062-0062-000000000062', '2026-02-01', '2026-02-01 18:00:00+00', '2026-02-01 18:30:03+00', 5.33, 1803, 5.64, 10, 10, 'blue', 12.7),
-  ('93f91ffb-3152-40ce-bd39-8ee5c0adfe37', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-02-01', '2026-02-01 15:24:00+00', '2026-02-01 17:17:13+00', 14.35, 6793, 7.89, 31, 62, 'purple', 15.9),
-  ('d7a3bf79-2f28-40da-adf0-2d8407412256', 'aaaaaaaa-0090-0090-0090-000000000090', '2026-02-01', '2026-02-01 07:22:00+00', '2026-02-01 08:46:40+00', 14.5, 5080, 5.84, 27, 54, 'purple', 23.0),
-  ('68654600-f0d3-42db-8d3d-87cbe2cdead3', 'aaaaaaaa-0027-0027-0027-000000000027', '2026-02-01', '2026-02-01 06:53:00+00', '2026-02-01 07:09:33+00', 2.37, 993, 6.99, 3, 9, 'red', 21.6),
-  ('61679378-e2a5-4128-8d46-10fc898f57ae', 'aaaaaaaa-0023-0023-0023-000000000023', '2026-02-01', '2026-02-01 05:36:00+00', '2026-02-01 06:17:09+00', 8.7, 2469, 4.73, 12, 24, 'red', 12.5),
-  ('2831a3ea-cf6f-4da1-b234-1270e4c7f697', 'aaaaaaaa-0096-0096-0096-000000000096', '2026-02-01', '2026-02-01 05:06:00+00', '2026-02-01 05:15:52+00', 2.18, 592, 4.53, 4, 12, 'purple', 8.4),
-  ('e9f29e39-40ce-4057-a4ae-49224203aa85', 'aaaaaaaa-0019-0019-0019-000000000019', '2026-02-01', '2026-02-01 18:44:00+00', '2026-02-01 19:47:11+00', 13.59, 3791, 4.65, 24, 24, 'red', 10.5),
-  ('2bc9102f-97a7-4484-a76a-dc74d6d9eac7', 'aaaaaaaa-0045-0045-0045-000000000045', '2026-02-01', '2026-02-01 17:39:00+00', '2026-02-01 18:14:26+00', 4.52, 2126, 7.84, 8, 24, 'blue', 17.8),
-  ('48c9e1fc-144d-4322-ad58-5a1c8752ed74', 'aaaaaaaa-0076-0076-0076-000000000076', '2026-02-01', '2026-02-01 10:50:00+00', '2026-02-01 11:14:38+00', 3.29, 1478, 7.49, 8, 16, 'blue', 18.6),
-  ('574139e7-bc33-459b-8f0b-ac0d23cad520', 'aaaaaaaa-0041-0041-0041-000000000041', '2026-02-01', '2026-02-01 12:56:00+00', '2026-02-01 13:53:24+00', 7.78, 3444, 7.38, 14, 14, 'blue', 3.8),
-  ('ace5b35a-ebe2-484d-bc8e-98457b705b2b', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-02-01', '2026-02-01 20:34:00+00', '2026-02-01 21:47:01+00', 9.46, 4381, 7.72, 14, 42, 'red', 7.4),
-  ('d2cbd0eb-cadd-4aa0-b022-02bab7045451', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-02-01', '2026-02-01 10:53:00+00', '2026-02-01 11:47:12+00', 7.69, 3252, 7.05, 16, 16, 'purple', 20.5),
-  ('b8402a32-f7fe-4426-a949-b20ad636f8ee', 'aaaaaaaa-0052-0052-0052-000000000052', '2026-02-01', '2026-02-01 20:29:00+00', '2026-02-01 20:49:04+00', 2.82, 1204, 7.12, 5, 5, 'blue', 24.7),
-  ('c19df66a-6304-4786-a4d3-7c2a0b831481', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-02-01', '2026-02-01 16:29:00+00', '2026-02-01 17:53:53+00', 12.43, 5093, 6.83, 19, 19, 'purple', 4.3),
-  ('84cd1dc2-027b-4150-9333-665f50ab0e03', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-02-02', '2026-02-02 13:08:00+00', '2026-02-02 14:31:06+00', 13.92, 4986, 5.97, 25, 25, 'blue', 13.5),
-  ('a0d176a0-a8f0-4f9c-934d-87f7068e745c', 'aaaaaaaa-0089-0089-0089-000000000089', '2026-02-02', '2026-02-02 13:40:00+00', '2026-02-02 14:21:53+00', 7.83, 2513, 5.35, 14, 14, 'purple', 11.5),
-  ('80ba6d3b-b87f-4648-9548-8013a91422c1', 'aaaaaaaa-0043-0043-0043-000000000043', '2026-02-02', '2026-02-02 07:01:00+00', '2026-02-02 07:16:50+00', 2.88, 950, 5.5, 2, 4, 'blue', 22.9),
-  ('73b656e6-d600-4cbc-bfdb-6327f0b7f5c5', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-02-02', '2026-02-02 14:46:00+00', '2026-02-02 15:14:32+00', 4.51, 1712, 6.33, 6, 12, 'blue', 12.7),
-  ('575952d7-b8f1-4096-92cc-21aa08685c19', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-02-02', '2026-02-02 21:27:00+00', '2026-02-02 23:16:13+00', 13.95, 6553, 7.83, 28, 112, 'red', 10.3),
-  ('87404e9f-fcb7-4da3-925b-d4f0c80ad016', 'aaaaaaaa-0003-0003-0003-000000000003', '2026-02-02', '2026-02-02 10:24:00+00', '2026-02-02 10:53:43+00', 6.09, 1783, 4.88, 8, 16, 'red', 17.1),
-  ('d9d565ff-3f18-464d-a71b-d32d6170852d', 'aaaaaaaa-0007-0007-0007-000000000007', '2026-02-02', '2026-02-02 05:52:00+00', '2026-02-02 06:34:33+00', 6.01, 2553, 7.08, 10, 20, 'red', 8.8),
-  ('66a7b5dc-3bd7-40bc-b1a2-7f7721ede0a9', 'aaaaaaaa-0032-0032-0032-000000000032', '2026-02-02', '2026-02-02 06:46:00+00', '2026-02-02 07:17:38+00', 4.34, 1898, 7.29, 3, 3, 'red', 13.2),
-  ('2b04f967-3edb-4a2e-922e-8d1290ac1ea1', 'aaaaaaaa-0038-0038-0038-000000000038', '2026-02-02', '2026-02-02 19:57:00+00', '2026-02-02 21:13:03+00', 11.94, 4563, 6.37, 15, 30, 'red', 12.7),
-  ('438ed645-c5a9-4443-9570-f0c18b427df7', 'aaaaaaaa-0035-0035-0035-000000000035', '2026-02-02', '2026-02-02 17:25:00+00', '2026-02-02 17:58:18+00', 6.1, 1998, 5.46, 9, 9, 'red', 10.4),
-  ('1aed8a36-4da6-443b-bf12-5c69b5e6faa6', 'aaaaaaaa-0009-0009-0009-000000000009', '2026-02-02', '2026-02-02 07:09:00+00', '2026-02-02 08:13:48+00', 14.09, 3888, 4.6, 10, 10, 'red', 9.5),
-  ('a18a7f1b-6268-4a78-a69b-7db58fcbb82f', 'aaaaaaaa-0044-0044-0044-000000000044', '2026-02-02', '2026-02-02 06:20:00+00', '2026-02-02 06:39:31+00', 3.8, 1171, 5.14, 6, 12, 'blue', 19.5),
-  ('c9f86439-165e-460b-93ea-34190f9f2c73', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-02-02', '2026-02-02 10:10:00+00', '2026-02-02 10:38:12+00', 5.78, 1692, 4.88, 13, 13, 'blue', 11.5),
-  ('9996c839-89bb-42a1-9e35-4d7c487981a6', 'aaaaaaaa-0048-0048-0048-000000000048', '2026-02-02', '2026-02-02 13:48:00+00', '2026-02-02 15:15:19+00', 14.53, 5239, 6.01, 29, 87, 'blue', 13.5),
-  ('fac78762-48fe-4aed-9657-109dacc5606a', 'aaaaaaaa-0030-0030-0030-000000000030', '2026-02-02', '2026-02-02 13:07:00+00', '2026-02-02 13:57:37+00', 6.44, 3037, 7.86, 9, 9, 'red', 12.2),
-  ('7986139d-2fbd-4388-b866-adb12375fb96', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-02-02', '2026-02-02 14:47:00+00', '2026-02-02 15:13:23+00', 3.66, 1583, 7.21, 4, 12, 'red', 10.3),
-  ('30aabade-a8da-4d02-9f95-efc8e0ec1b7b', 'aaaaaaaa-0096-0096-0096-000000000096', '2026-02-02', '2026-02-02 16:32:00+00', '2026-02-02 17:50:09+00', 12.73, 4689, 6.14, 29, 58, 'purple', 17.4),
-  ('2256f8be-9723-44ec-9a56-913bf0241eb7', 'aaaaaaaa-0057-0057-0057-000000000057', '2026-02-02', '2026-02-02 15:37:00+00', '2026-02-02 16:32:57+00', 11.26, 3357, 4.97, 21, 63, 'blue', 7.2),
-  ('2d85a3a5-f009-4702-ba76-afdcaf4bc43c', 'aaaaaaaa-0020-0020-0020-000000000020', '2026-02-02', '2026-02-02 10:02:00+00', '2026-02-02 10:52:41+00', 11.24, 3041, 4.51, 14, 28, 'red', 19.1),
-  ('9381c1d7-a5dc-4dc8-9026-5a5f0249887d', 'aaaaaaaa-0063-0063-0063-000000000063', '2026-02-02', '2026-02-02 20:12:00+00', '2026-02-02 21:00:05+00', 9.04, 2885, 5.32, 14, 14, 'blue', 18.8),
-  ('f0550b00-1499-4e72-9626-5b6774b6314f', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-02-02', '2026-02-02 09:47:00+00', '2026-02-02 10:55:11+00', 9.38, 4091, 7.27, 20, 20, 'purple', 12.2),
-  ('6fa10ae8-87ad-497b-9a3d-4c374a859f2a', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-02-02', '2026-02-02 21:19:00+00', '2026-02-02 22:18:30+00', 8.02, 3570, 7.42, 11, 33, 'blue', 4.3),
-  ('d93c8e02-62d4-42d9-a936-d7289e95cf2f', 'aaaaaaaa-0019-0019-0019-000000000019', '2026-02-02', '2026-02-02 19:32:00+00', '2026-02-02 19:41:32+00', 2.11, 572, 4.52, 5, 10, 'red', 22.9),
-  ('d2220edd-083d-494b-a9fa-f913077be9f6', 'aaaaaaaa-0023-0023-0023-000000000023', '2026-02-02', '2026-02-02 11:46:00+00', '2026-02-02 12:25:02+00', 5.53, 2342, 7.06, 8, 16, 'red', 3.4),
-  ('33bc1b8f-344d-4db8-8a4e-c7a491e11f41', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-02-02', '2026-02-02 06:02:00+00', '2026-02-02 06:30:35+00', 5.06, 1715, 5.65, 10, 30, 'purple', 5.5),
-  ('8636359a-770b-4109-af32-7827321f54fa', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-02-02', '2026-02-02 12:39:00+00', '2026-02-02 12:51:53+00', 2.25, 773, 5.73, 3, 6, 'purple', 4.9),
-  ('f9024ec2-3936-4011-bc8d-2fd5b58ade5b', 'aaaaaaaa-0014-0014-0014-000000000014', '2026-02-02', '2026-02-02 16:43:00+00', '2026-02-02 17:20:37+00', 4.8, 2257, 7.84, 8, 24, 'red', 24.1),
-  ('ed954452-3cf7-4b46-89ca-84332af73dc6', 'aaaaaaaa-0082-0082-0082-000000000082', '2026-02-02', '2026-02-02 11:40:00+00', '2026-02-02 12:39:46+00', 8.83, 3586, 6.77, 17, 17, 'purple', 14.1),
-  ('2021164c-d86e-469d-80e9-89e396a0fa98', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-02-02', '2026-02-02 11:25:00+00', '2026-02-02 12:13:27+00', 9.04, 2907, 5.36, 13, 26, 'blue', 11.1),
-  ('af6cd33d-b02b-4b78-b165-fca129f304b5', 'aaaaaaaa-0069-0069-0069-000000000069', '2026-02-02', '2026-02-02 07:40:00+00', '2026-02-02 07:54:12+00', 2.57, 852, 5.53, 4, 4, 'blue', 18.9),
-  ('a8839224-21ce-4ec8-877f-b6e899ae19fc', 'aaaaaaaa-0022-0022-0022-000000000022', '2026-02-02', '2026-02-02 18:44:00+00', '2026-02-02 18:56:34+00', 2.49, 754, 5.05, 5, 5, 'red', 11.5),
-  ('ce051b4b-2efa-4f95-8236-936db4ef5b4a', 'aaaaaaaa-0027-0027-0027-000000000027', '2026-02-02', '2026-02-02 07:52:00+00', '2026-02-02 08:03:14+00', 2.29, 674, 4.91, 4, 4, 'red', 12.5),
-  ('d03127c0-2cb4-4b2f-81c6-c586a4055496', 'aaaaaaaa-0099-0099-0099-000000000099', '2026-02-02', '2026-02-02 17:34:00+00', '2026-02-02 18:48:41+00', 11.58, 4481, 6.45, 18, 36, 'purple', 15.1),
-  ('d1d64d44-de42-4c74-9019-eddd9b4304fb', 'aaaaaaaa-0041-0041-0041-000000000041', '2026-02-02', '2026-02-02 06:42:00+00', '2026-02-02 07:22:59+00', 7.62, 2459, 5.38, 11, 33, 'blue', 10.0),
-  ('540714e6-4b0c-4c00-b0f9-b35b01bfd470', 'aaaaaaaa-0024-0024-0024-000000000024', '2026-02-02', '2026-02-02 07:24:00+00', '2026-02-02 08:35:37+00', 11.14, 4297, 6.43, 20, 20, 'red', 13.1),
-  ('75947951-342b-4338-b67b-6ec6298c342d', 'aaaaaaaa-0058-0058-0058-000000000058', '2026-02-02', '2026-02-02 05:56:00+00', '2026-02-02 06:46:55+00', 10.61, 3055, 4.8, 18, 18, 'blue', 24.4),
-  ('c3227991-14c5-4a1d-befc-694a77a42111', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-02-02', '2026-02-02 08:23:00+00', '2026-02-02 09:30:31+00', 12.74, 4051, 5.3, 24, 72, 'purple', 4.3),
-  ('aca6fc13-2ed4-42e8-a536-495eccd27a5e', 'aaaaaaaa-0093-0093-0093-000000000093', '2026-02-02', '2026-02-02 17:46:00+00', '2026-02-02 19:18:23+00', 13.75, 5543, 6.72, 19, 19, 'purple', 19.4),
-  ('ba2236e7-2b1b-42e0-a415-3ad4602e350f', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-02-02', '2026-02-02 12:53:00+00', '2026-02-02 14:29:51+00', 13.0, 5811, 7.45, 24, 48, 'blue', 22.2),
-  ('f75fd924-72eb-413b-8eb6-698c14525161', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-02-02', '2026-02-02 10:51:00+00', '2026-02-02 12:19:50+00', 13.71, 5330, 6.48, 18, 54, 'blue', 9.1),
-  ('a9e27993-4e41-4387-b2a2-c36f23c05f77', 'aaaaaaaa-0066-0066-0066-000000000066', '2026-02-02', '2026-02-02 14:39:00+00', '2026-02-02 15:43:28+00', 10.17, 3868, 6.34, 15, 30, 'blue', 3.3),
-  ('400c518f-82bb-44b6-9176-13b8910b6b28', 'aaaaaaaa-0085-0085-0085-000000000085', '2026-02-02', '2026-02-02 08:45:00+00', '2026-02-02 09:07:19+00', 3.02, 1339, 7.39, 5, 5, 'purple', 9.8),
-  ('903a29c7-06ce-42a9-b9d5-0b6f299bdeda', 'aaaaaaaa-0045-0045-0045-000000000045', '2026-02-02', '2026-02-02 17:10:00+00', '2026-02-02 18:05:35+00', 7.72, 3335, 7.2, 12, 36, 'blue', 9.4),
-  ('f3c0108f-af79-458d-b730-49dc24c1a9bf', 'aaaaaaaa-0025-0025-0025-000000000025', '2026-02-02', '2026-02-02 09:11:00+00', '2026-02-02 10:08:43+00', 9.28, 3463, 6.22, 22, 22, 'red', 4.8),
-  ('1b6aa65d-aa87-41dd-90df-2b941c2495d7', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-02-02', '2026-02-02 07:30:00+00', '2026-02-02 07:44:42+00', 3.02, 882, 4.87, 5, 15, 'purple', 15.2),
-  ('99654aa3-fef4-44e5-9a7f-44cc29f8e648', 'aaaaaaaa-0061-0061-0061-000000000061', '2026-02-02', '2026-02-02 16:37:00+00', '2026-02-02 17:01:28+00', 5.09, 1468, 4.81, 5, 10, 'blue', 24.5),
-  ('11670573-9dd6-4a82-8fa4-776b0a03d1b4', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-02-02', '2026-02-02 11:14:00+00', '2026-02-02 11:35:37+00', 2.97, 1297, 7.28, 6, 24, 'red', 19.6),
-  ('f8565a6f-c8c1-4602-894a-7e29110f285b', 'aaaaaaaa-0042-0042-0042-000000000042', '2026-02-02', '2026-02-02 18:39:00+00', '2026-02-02 19:39:37+00', 8.66, 3637, 7.0, 12, 24, 'blue', 14.2),
-  ('84b0879d-5d26-4dbd-8194-44faa17d2172', 'aaaaaaaa-0029-0029-0029-000000000029', '2026-02-02', '2026-02-02 13:12:00+00', '2026-02-02 14:07:20+00', 7.55, 3320, 7.33, 15, 15, 'red', 20.2),
-  ('2285a9f6-b6b2-4263-9bed-7ca4b41434d5', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-02-02', '2026-02-02 12:36:00+00', '2026-02-02 14:18:39+00', 14.52, 6159, 7.07, 24, 48, 'red', 4.7),
-  ('e4a688c9-e234-462a-b337-d7858b86a357', 'aaaaaaaa-0000-0000-0000-000000000000', '2026-02-02', '2026-02-02 13:23:00+00', '2026-02-02 14:47:09+00', 10.79, 5049, 7.8, 17, 34, 'red', 17.5),
-  ('8a8f565b-b76a-49d0-afb3-a5e825597914', 'aaaaaaaa-0052-0052-0052-000000000052', '2026-02-02', '2026-02-02 20:09:00+00', '2026-02-02 20:30:52+00', 3.51, 1312, 6.23, 3, 3, 'blue', 5.0),
-  ('1304b0f0-b5f4-49fd-8720-0068b65da1be', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-02-02', '2026-02-02 19:42:00+00', '2026-02-02 20:58:46+00', 9.97, 4606, 7.7, 15, 45, 'red', 6.3),
-  ('53b78ef9-6a7d-466b-9d3a-e6f030897a83', 'aaaaaaaa-0098-0098-0098-000000000098', '2026-02-02', '2026-02-02 14:41:00+00', '2026-02-02 15:41:25+00', 8.45, 3625, 7.15, 16, 32, 'purple', 12.4),
-  ('6819688e-68cd-43a1-9d3f-4a1ff2afa23a', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-02-02', '2026-02-02 19:27:00+00', '2026-02-02 21:11:18+00', 13.27, 6258, 7.86, 14, 14, 'red', 22.6),
-  ('77545f4c-e21d-4aaf-a028-a49544cdfa68', 'aaaaaaaa-0033-0033-0033-000000000033', '2026-02-02', '2026-02-02 13:42:00+00', '2026-02-02 14:15:05+00', 6.06, 1985, 5.46, 4, 12, 'red', 4.7),
-  ('3735cf51-959f-43c6-b89f-eb5bb03a98c7', 'aaaaaaaa-0091-0091-0091-000000000091', '2026-02-02', '2026-02-02 05:06:00+00', '2026-02-02 05:53:44+00', 8.99, 2864, 5.31, 20, 60, 'purple', 19.0),
-  ('401d24cb-f1fb-43ce-b0ea-024298afff45', 'aaaaaaaa-0012-0012-0012-000000000012', '2026-02-02', '2026-02-02 20:41:00+00', '2026-02-02 22:08:05+00', 11.18, 5225, 7.79, 16, 16, 'red', 7.1),
-  ('e0c2ee40-0441-4944-8655-9e1a7a6cf66e', 'aaaaaaaa-0046-0046-0046-000000000046', '2026-02-02', '2026-02-02 09:37:00+00', '2026-02-02 10:15:33+00', 8.53, 2313, 4.52, 19, 38, 'blue', 14.0),
-  ('8eae0c7f-6a8c-4725-87d9-767075fe4f3c', 'aaaaaaaa-0060-0060-0060-000000000060', '2026-02-02', '2026-02-02 08:31:00+00', '2026-02-02 09:55:53+00', 13.0, 5093, 6.53, 21, 63, 'blue', 6.7),
-  ('4729530c-102f-4edd-8615-8aa4cb3758cb', 'aaaaaaaa-0051-0051-0051-000000000051', '2026-02-02', '2026-02-02 16:52:00+00', '2026-02-02 17:11:20+00', 3.38, 1160, 5.72, 6, 18, 'blue', 22.7),
-  ('42852cae-b346-44ab-a4a8-92069c02f4b5', 'aaaaaaaa-0064-0064-0064-000000000064', '2026-02-02', '2026-02-02 20:15:00+00', '2026-02-02 21:29:24+00', 9.49, 4464, 7.84, 15, 45, 'blue', 4.1),
-  ('e45b0507-16cf-4de7-be0f-9c0fbba7b9fa', 'aaaaaaaa-0089-0089-0089-000000000089', '2026-02-03', '2026-02-03 08:54:00+00', '2026-02-03 09:43:32+00', 10.11, 2972, 4.9, 22, 22, 'purple', 23.5),
-  ('8e0e5e90-0c7a-4998-8953-1b3643a5b4c1', 'aaaaaaaa-0044-0044-0044-000000000044', '2026-02-03', '2026-02-03 10:11:00+00', '2026-02-03 11:37:43+00', 13.7, 5203, 6.33, 17, 17, 'blue', 14.0),
-  ('4761fcd5-1b0a-4081-a657-3dc516649556', 'aaaaaaaa-0078-0078-0078-000000000078', '2026-02-03', '2026-02-03 19:38:00+00', '2026-02-03 20:08:18+00', 5.56, 1818, 5.45, 4, 4, 'blue', 6.5),
-  ('9beab057-da4f-404b-a40e-a46de6724f0f', 'aaaaaaaa-0086-0086-0086-000000000086', '2026-02-03', '2026-02-03 11:01:00+00', '2026-02-03 11:20:05+00', 3.47, 1145, 5.5, 6, 18, 'purple', 8.2),
-  ('d2c0add6-7c6a-4664-bce4-ccf706f3471d', 'aaaaaaaa-0084-0084-0084-000000000084', '2026-02-03', '2026-02-03 17:28:00+00', '2026-02-03 18:48:32+00', 14.67, 4832, 5.49, 32, 32, 'purple', 9.0),
-  ('e760aab6-f97b-4017-bb27-f42a0a5b6aae', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-02-03', '2026-02-03 15:13:00+00', '2026-02-03 15:35:19+00', 3.43, 1339, 6.51, 6, 24, 'red', 12.7),
-  ('fb39ed11-6b26-4be8-a5b4-6836a10a6dc4', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-02-03', '2026-02-03 19:02:00+00', '2026-02-03 20:04:55+00', 11.42, 3775, 5.51, 24, 24, 'red', 9.0),
-  ('5a4566eb-b7a6-4211-a816-b51ab811b522', 'aaaaaaaa-0018-0018-0018-000000000018', '2026-02-03', '2026-02-03 09:16:00+00', '2026-02-03 10:09:29+00', 10.17, 3209, 5.26, 15, 45, 'red', 13.8),
-  ('55dcaf3c-8551-4b8d-b818-3ed0ba8209c2', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-02-03', '2026-02-03 16:05:00+00', '2026-02-03 16:47:30+00', 7.06, 2550, 6.02, 11, 22, 'blue', 18.4),
-  ('bee87d5f-15c5-45b0-ba7b-b36102d8ece1', 'aaaaaaaa-0077-0077-0077-000000000077', '2026-02-03', '2026-02-03 17:31:00+00', '2026-02-03 18:16:58+00', 9.74, 2758, 4.72, 16, 48, 'blue', 15.6),
-  ('f139e546-1cff-4275-943a-b0707be356c4', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-02-03', '2026-02-03 16:48:00+00', '2026-02-03 17:21:23+00', 6.64, 2003, 5.03, 7, 14, 'blue', 8.6),
-  ('bb0905cf-fd5d-4b67-ad21-f9327bab323f', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-02-03', '2026-02-03 08:36:00+00', '2026-02-03 08:52:58+00', 2.76, 1018, 6.15, 4, 4, 'blue', 15.1),
-  ('4c3059d4-d800-4101-b798-0021bc6d54b0', 'aaaaaaaa-0064-0064-0064-000000000064', '2026-02-03', '2026-02-03 19:40:00+00', '2026-02-03 19:59:05+00', 3.81, 1145, 5.01, 4, 4, 'blue', 5.6),
-  ('72f69e97-5e02-4616-a9f4-6c37d7eba5a0', 'aaaaaaaa-0035-0035-0035-000000000035', '2026-02-03', '2026-02-03 12:14:00+00', '2026-02-03 13:27:53+00', 14.46, 4433, 5.11, 26, 78, 'red', 12.2),
-  ('62555682-6721-4fdc-8669-584579ba03db', 'aaaaaaaa-0066-0066-0066-000000000066', '2026-02-03', '2026-02-03 08:49:00+00', '2026-02-03 09:05:33+00', 3.47, 993, 4.77, 3, 3, 'blue', 11.9),
-  ('e633d231-e17a-4ae6-b978-1ef61b26b402', 'aaaaaaaa-0026-0026-0026-000000000026', '2026-02-03', '2026-02-03 21:02:00+00', '2026-02-03 21:57:10+00', 8.62, 3310, 6.4, 10, 40, 'red', 23.5),
-  ('25cbaece-cc2d-4bf7-bdd8-55c26c807024', 'aaaaaaaa-0034-0034-0034-000000000034', '2026-02-03', '2026-02-03 13:44:00+00', '2026-02-03 14:22:55+00', 8.06, 2335, 4.83, 12, 36, 'red', 6.4),
-  ('da2b3975-63bb-49b7-862a-478e938d7600', 'aaaaaaaa-0029-0029-0029-000000000029', '2026-02-03', '2026-02-03 09:11:00+00', '2026-02-03 10:26:10+00', 11.22, 4510, 6.7, 10, 10, 'red', 22.4),
-  ('8485258c-026b-4ce3-a720-20a5dacf2b7b', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-02-03', '2026-02-03 09:39:00+00', '2026-02-03 10:08:41+00', 5.8, 1781, 5.12, 5, 15, 'red', 8.1),
-  ('e8609176-37c1-4462-b81b-f36088fda2f7', 'aaaaaaaa-0072-0072-0072-000000000072', '2026-02-03', '2026-02-03 07:31:00+00', '2026-02-03 08:00:13+00', 4.1, 1753, 7.13, 8, 24, 'blue', 3.2),
-  ('0ecb0462-da6e-4466-ac05-32bc7aea929a', 'aaaaaaaa-0056-0056-0056-000000000056', '2026-02-03', '2026-02-03 10:47:00+00', '2026-02-03 12:30:34+00', 13.96, 6214, 7.42, 22, 22, 'blue', 22.0),
-  ('aaf70b43-77fa-4406-963e-4084fac0fddd', 'aaaaaaaa-0069-0069-0069-000000000069', '2026-02-03', '2026-02-03 14:21:00+00', '2026-02-03 15:10:50+00', 9.81, 2990, 5.08, 12, 12, 'blue', 20.4),
-  ('35b6d295-d0f7-45b3-9a68-82ab72280134', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-02-03', '2026-02-03 13:11:00+00', '2026-02-03 14:09:54+00', 10.89, 3534, 5.41, 25, 25, 'purple', 8.8),
-  ('da9814ba-c71e-4a37-9f20-a3760bf6318e', 'aaaaaaaa-0062-0062-0062-000000000062', '2026-02-03', '2026-02-03 11:50:00+00', '2026-02-03 12:10:26+00', 3.53, 1226, 5.79, 6, 6, 'blue', 6.1),
-  ('46dbd4e5-0c2f-466d-9a71-acd92ec23325', 'aaaaaaaa-0009-0009-0009-000000000009', '2026-02-03', '2026-02-03 19:35:00+00', '2026-02-03 20:26:50+00', 9.53, 3110, 5.44, 12, 12, 'red', 22.9),
-  ('77555f9b-4206-4204-b3e9-b1b0f674e638', 'aaaaaaaa-0042-0042-0042-000000000042', '2026-02-03', '2026-02-03 06:45:00+00', '2026-02-03 07:02:31+00', 2.34, 1051, 7.49, 3, 3, 'blue', 16.5),
-  ('f8896bcc-78e2-4c40-8b00-09afe8c64597', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-02-03', '2026-02-03 16:02:00+00', '2026-02-03 17:06:56+00', 8.23, 3896, 7.89, 8, 8, 'red', 23.9),
-  ('2721fda4-6329-48b9-a110-bd2bbcd4989a', 'aaaaaaaa-0023-0023-0023-000000000023', '2026-02-03', '2026-02-03 14:17:00+00', '2026-02-03 14:51:52+00', 7.09, 2092, 4.92, 12, 12, 'red', 5.1),
-  ('0743180e-f664-4fcd-a1e9-0c681233616e', 'aaaaaaaa-0043-0043-0043-000000000043', '2026-02-03', '2026-02-03 12:03:00+00', '2026-02-03 13:22:02+00', 13.33, 4742, 5.93, 17, 34, 'blue', 21.2),
-  ('d83a9677-2c7b-4531-acf7-846c700d3641', 'aaaaaaaa-0041-0041-0041-000000000041', '2026-02-03', '2026-02-03 05:42:00+00', '2026-02-03 06:40:08+00', 9.2, 3488, 6.32, 14, 14, 'blue', 18.7),
-  ('ef1485b0-8db1-47e0-876b-14bacda74881', 'aaaaaaaa-0076-0076-0076-000000000076', '2026-02-03', '2026-02-03 18:11:00+00', '2026-02-03 18:27:19+00', 2.09, 979, 7.81, 1, 3, 'blue', 17.6),
-  ('3e0eaaa7-95da-45a6-b40b-153128a0ae08', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-02-03', '2026-02-03 17:27:00+00', '2026-02-03 18:16:57+00', 6.75, 2997, 7.4, 7, 21, 'red', 10.7),
-  ('41eb0f3f-9570-41d5-9d29-8fe8511d54c8', 'aaaaaaaa-0038-0038-0038-000000000038', '2026-02-03', '2026-02-03 17:51:00+00', '2026-02-03 18:49:36+00', 9.56, 3516, 6.13, 15, 15, 'red', 12.4),
-  ('64849a31-e1b9-4ccf-a845-02d936d107ef', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-02-03', '2026-02-03 10:33:00+00', '2026-02-03 12:16:22+00', 14.6, 6202, 7.08, 16, 48, 'blue', 17.3),
-  ('205191d5-c751-4fc7-b8d3-f621aa86a735', 'aaaaaaaa-0063-0063-0063-000000000063', '2026-02-03', '2026-02-03 09:57:00+00', '2026-02-03 10:47:48+00', 6.48, 3048, 7.84, 7, 21, 'blue', 19.2),
-  ('36594383-94ea-4aba-8229-32211679126e', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-02-03', '2026-02-03 12:38:00+00', '2026-02-03 12:55:59+00', 2.38, 1079, 7.56, 3, 12, 'red', 17.5),
-  ('36d0a793-b130-4fc0-ae75-cf0c99a24402', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-02-03', '2026-02-03 09:37:00+00', '2026-02-03 11:02:11+00', 13.83, 5111, 6.16, 28, 56, 'red', 15.3),
-  ('2d42fd06-d634-47b2-9fc9-201f3bb5dc3b', 'aaaaaaaa-0082-0082-0082-000000000082', '2026-02-03', '2026-02-03 20:54:00+00', '2026-02-03 21:17:35+00', 3.49, 1415, 6.76, 7, 14, 'purple', 13.0),
-  ('771ddc6a-7ca0-4e93-9a33-77be41322d3c', 'aaaaaaaa-0065-0065-0065-000000000065', '2026-02-03', '2026-02-03 18:21:00+00', '2026-02-03 18:59:34+00', 7.25, 2314, 5.32, 12, 12, 'blue', 3.3),
-  ('0a4fe4d2-16b3-42e8-bc65-819567117545', 'aaaaaaaa-0067-0067-0067-000000000067', '2026-02-03', '2026-02-03 08:06:00+00', '2026-02-03 08:37:12+00', 5.15, 1872, 6.06, 4, 12, 'blue', 23.2),
-  ('ece0987f-4fb8-45c0-b575-6e6eebd41ed3', 'aaaaaaaa-0051-0051-0051-000000000051', '2026-02-03', '2026-02-03 07:47:00+00', '2026-02-03 09:32:46+00', 14.45, 6346, 7.32, 19, 19, 'blue', 11.1),
-  ('30d6a210-2bb6-4cfb-a549-1aac8e4baf97', 'aaaaaaaa-0061-0061-0061-000000000061', '2026-02-03', '2026-02-03 13:56:00+00', '2026-02-03 14:22:56+00', 3.68, 1616, 7.32, 4, 4, 'blue', 17.2),
-  ('a9630ff1-3e96-422f-bad7-4ca436f229fa', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-02-03', '2026-02-03 05:47:00+00', '2026-02-03 06:13:36+00', 3.68, 1596, 7.23, 2, 6, 'blue', 4.2),
-  ('2576589e-2e95-4509-991a-15b8632e5090', 'aaaaaaaa-0070-0070-0070-000000000070', '2026-02-03', '2026-02-03 09:58:00+00', '2026-02-03 10:53:28+00', 8.47, 3328, 6.55, 9, 27, 'blue', 13.1),
-  ('8617bfbb-8ac2-4994-860e-8dc2bfed6d4c', 'aaaaaaaa-0045-0045-0045-000000000045', '2026-02-03', '2026-02-03 19:33:00+00', '2026-02-03 20:54:46+00', 13.21, 4906, 6.19, 10, 10, 'blue', 18.4),
-  ('a2a5e20d-2d69-4417-9b24-13f9d08d6532', 'aaaaaaaa-0057-0057-0057-000000000057', '2026-02-03', '2026-02-03 16:15:00+00', '2026-02-03 16:46:49+00', 4.6, 1909, 6.92, 1, 1, 'blue', 17.5),
-  ('654136d2-b154-4c6b-9a43-ae19bf6b0468', 'aaaaaaaa-0003-0003-0003-000000000003', '2026-02-03', '2026-02-03 11:50:00+00', '2026-02-03 13:21:39+00', 13.64, 5499, 6.72, 26, 26, 'red', 6.7),
-  ('a0ee4d4d-6ece-4d74-9847-92832f29c57c', 'aaaaaaaa-0014-0014-0014-000000000014', '2026-02-03', '2026-02-03 07:02:00+00', '2026-02-03 08:47:54+00', 14.37, 6354, 7.37, 23, 92, 'red', 21.0),
-  ('c9eb8559-66fb-4f20-9092-8a064e5f2fc9', 'aaaaaaaa-0080-0080-0080-000000000080', '2026-02-03', '2026-02-03 20:51:00+00', '2026-02-03 21:32:35+00', 8.61, 2495, 4.83, 21, 63, 'purple', 14.2),
-  ('b2fa998e-2fbe-4422-b13e-8924e8e789c6', 'aaaaaaaa-0012-0012-0012-000000000012', '2026-02-03', '2026-02-03 12:09:00+00', '2026-02-03 12:38:12+00', 5.42, 1752, 5.39, 7, 21, 'red', 23.0),
-  ('52de9cea-c3d4-4c9c-bdb4-f63109ded19b', 'aaaaaaaa-0052-0052-0052-000000000052', '2026-02-03', '2026-02-03 06:11:00+00', '2026-02-03 07:33:16+00', 11.54, 4936, 7.13, 17, 34, 'blue', 22.5),
-  ('e91681ae-4dc7-4e6c-a7c5-a2352b35b12c', 'aaaaaaaa-0025-0025-0025-000000000025', '2026-02-03', '2026-02-03 06:29:00+00', '2026-02-03 07:05:37+00', 5.21, 2197, 7.03, 8, 16, 'red', 24.8),
-  ('32caf768-742a-4ee9-bd35-e28cc1ad128f', 'aaaaaaaa-0049-0049-0049-000000000049', '2026-02-03', '2026-02-03 17:29:00+00', '2026-02-03 18:27:13+00', 9.87, 3493, 5.9, 12, 24, 'blue', 9.2),
-  ('841c4480-cd9e-4e58-a5c2-9910040e3657', 'aaaaaaaa-0022-0022-0022-000000000022', '2026-02-03', '2026-02-03 05:51:00+00', '2026-02-03 06:35:07+00', 7.98, 2647, 5.53, 14, 28, 'red', 8.5),
-  ('c31cc911-6fd5-49bf-937a-af11ba061799', 'aaaaaaaa-0036-0036-0036-000000000036', '2026-02-04', '2026-02-04 06:49:00+00', '2026-02-04 07:56:11+00', 12.33, 4031, 5.45, 18, 36, 'red', 22.8),
-  ('bc7f41f6-f9d7-4fc0-9be3-eb09c098ffc6', 'aaaaaaaa-0096-0096-0096-000000000096', '2026-02-04', '2026-02-04 07:07:00+00', '2026-02-04 07:30:04+00', 4.89, 1384, 4.72, 10, 20, 'purple', 11.5),
-  ('db1d3c34-1611-41fd-aa40-a83c925b3e1e', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-02-04', '2026-02-04 20:59:00+00', '2026-02-04 21:42:32+00', 9.09, 2612, 4.79, 14, 14, 'blue', 5.3),
-  ('27d0d3c1-8c89-4904-9425-e5903fe49d8c', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-02-04', '2026-02-04 11:44:00+00', '2026-02-04 13:31:23+00', 14.69, 6443, 7.31, 22, 66, 'red', 13.7),
-  ('d8a6b29c-abb2-4eca-9d1a-1b63d9ec26b0', 'aaaaaaaa-0028-0028-0028-000000000028', '2026-02-04', '2026-02-04 12:56:00+00', '2026-02-04 14:45:46+00', 14.02, 6586, 7.83, 13, 52, 'red', 23.2),
-  ('04992569-0ce5-4566-841f-107b86f4f265', 'aaaaaaaa-0086-0086-0086-000000000086', '2026-02-04', '2026-02-04 06:13:00+00', '2026-02-04 06:39:09+00', 3.52, 1569, 7.43, 7, 14, 'purple', 21.3),
-  ('35ee22b4-15c8-40f6-8760-48a55f7566db', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-02-04', '2026-02-04 13:08:00+00', '2026-02-04 14:19:19+00', 13.85, 4279, 5.15, 30, 90, 'purple', 4.2),
-  ('d2a2818c-c7d6-4673-802e-0ddd9720b01b', 'aaaaaaaa-0000-0000-0000-000000000000', '2026-02-04', '2026-02-04 16:27:00+00', '2026-02-04 17:58:17+00', 13.27, 5477, 6.88, 18, 18, 'red', 11.3),
-  ('9f5a9953-b021-4955-a95b-a37e028d5348', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-02-04', '2026-02-04 08:55:00+00', '2026-02-04 09:32:58+00', 8.22, 2278, 4.62, 6, 6, 'red', 24.1),
-  ('a48c3a4c-b5c9-4097-96e2-bbc41e5403ed', 'aaaaaaaa-0071-0071-0071-000000000071', '2026-02-04', '2026-02-04 14:30:00+00', '2026-02-04 15:01:46+00', 4.18, 1906, 7.6, 8, 8, 'blue', 5.9),
-  ('0a48f81f-7da9-419b-8c64-693b6cd03248', 'aaaaaaaa-0027-0027-0027-000000000027', '2026-02-04', '2026-02-04 18:22:00+00', '2026-02-04 19:43:48+00', 13.89, 4908, 5.89, 12, 36, 'red', 12.2),
-  ('433ee13b-2cf4-466b-8fb5-95bfd7850084', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-02-04', '2026-02-04 19:23:00+00', '2026-02-04 19:56:01+00', 5.25, 1981, 6.29, 11, 11, 'purple', 5.0),
-  ('ee29257e-4116-47b1-9158-cafbfcd4f10a', 'aaaaaaaa-0038-0038-0038-000000000038', '2026-02-04', '2026-02-04 09:15:00+00', '2026-02-04 10:40:00+00', 13.24, 5100, 6.42, 10, 40, 'red', 18.6),
-  ('e85e6837-de3d-4689-89aa-b6bf646aefee', 'aaaaaaaa-0015-0015-0015-000000000015', '2026-02-04', '2026-02-04 13:34:00+00', '2026-02-04 14:34:44+00', 10.04, 3644, 6.05, 4, 16, 'red', 13.7),
-  ('6c5fd16c-8683-4c87-9a4d-86ba8c83a3d6', 'aaaaaaaa-0068-0068-0068-000000000068', '2026-02-04', '2026-02-04 07:58:00+00', '2026-02-04 08:10:58+00', 2.2, 778, 5.9, 5, 15, 'blue', 9.3),
-  ('79e15770-c778-4c77-a2c3-3528b1598cb3', 'aaaaaaaa-0061-0061-0061-000000000061', '2026-02-04', '2026-02-04 13:14:00+00', '2026-02-04 14:36:20+00', 14.27, 4940, 5.77, 32, 32, 'blue', 10.3),
-  ('9e8b208e-0a57-4531-bed5-f2b3a6de22b1', 'aaaaaaaa-0093-0093-0093-000000000093', '2026-02-04', '2026-02-04 17:06:00+00', '2026-02-04 17:50:16+00', 6.38, 2656, 6.94, 12, 24, 'purple', 13.7),
-  ('1c867de7-330a-4bea-b004-e3578be4d564', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-02-04', '2026-02-04 19:32:00+00', '2026-02-04 20:43:31+00', 11.96, 4291, 5.98, 19, 38, 'blue', 4.1),
-  ('d8e7d3bd-9e38-43fe-81b2-0f4ce2adfcd8', 'aaaaaaaa-0082-0082-0082-000000000082', '2026-02-04', '2026-02-04 07:59:00+00', '2026-02-04 09:05:01+00', 11.94, 3961, 5.53, 22, 22, 'purple', 13.2),
-  ('49ad3e96-b6e8-4b04-8f7d-bc12806a0ffa', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-02-04', '2026-02-04 11:55:00+00', '2026-02-04 13:11:10+00', 10.35, 4570, 7.36, 18, 54, 'red', 24.7),
-  ('cf4a80b1-fc55-4772-88c8-9e881d37fd5d', 'aaaaaaaa-0025-0025-0025-000000000025', '2026-02-04', '2026-02-04 09:22:00+00', '2026-02-04 09:47:21+00', 4.09, 1521, 6.2, 7, 14, 'red', 10.2),
-  ('722a5f8a-ea9b-4af6-8eec-9a1955ac684f', 'aaaaaaaa-0078-0078-0078-000000000078', '2026-02-04', '2026-02-04 21:52:00+00', '2026-02-04 23:14:08+00', 13.06, 4928, 6.29, 26, 78, 'blue', 23.5),
-  ('5ab9b6a6-6cc9-4d7f-814c-ba8b1e0f56d4', 'aaaaaaaa-0024-0024-0024-000000000024', '2026-02-04', '2026-02-04 16:12:00+00', '2026-02-04 16:51:18+00', 7.28, 2358, 5.4, 11, 11, 'red', 18.3),
-  ('38105a16-506c-43ff-a4a4-bc1394013633', 'aaaaaaaa-0007-0007-0007-000000000007', '2026-02-04', '2026-02-04 08:52:00+00', '2026-02-04 09:33:25+00', 6.79, 2485, 6.1, 6, 6, 'red', 24.7),
-  ('32f3176b-4621-481f-9ce5-4c7a1db104e2', 'aaaaaaaa-0029-0029-0029-000000000029', '2026-02-04', '2026-02-04 13:38:00+00', '2026-02-04 14:54:43+00', 10.7, 4603, 7.17, 12, 24, 'red', 13.4),
-  ('883d3b80-6926-466b-9303-30c98a51285a', 'aaaaaaaa-0065-0065-0065-000000000065', '2026-02-04', '2026-02-04 21:25:00+00', '2026-02-04 22:08:19+00', 8.48, 2599, 5.11, 16, 32, 'blue', 21.4),
-  ('34492fe9-a294-421d-bb7a-92a775616f81', 'aaaaaaaa-0091-0091-0091-000000000091', '2026-02-04', '2026-02-04 09:04:00+00', '2026-02-04 09:21:45+00', 2.42, 1065, 7.34, 5, 5, 'purple', 9.4),
-  ('9a3fce5b-ed0a-49df-b021-b0bc08663a67', 'aaaaaaaa-0077-0077-0077-000000000077', '2026-02-04', '2026-02-04 05:08:00+00', '2026-02-04 06:20:16+00', 10.55, 4336, 6.85, 17, 17, 'blue', 15.5),
-  ('8c90a4cc-4a1b-4d36-9a59-21b90910a69c', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-02-04', '2026-02-04 14:08:00+00', '2026-02-04 14:25:49+00', 2.49, 1069, 7.16, 3, 3, 'blue', 14.1),
-  ('5d8f6d88-abcb-45a2-9953-6bac063381a6', 'aaaaaaaa-0034-0034-0034-000000000034', '2026-02-04', '2026-02-04 16:09:00+00', '2026-02-04 16:31:31+00', 2.87, 1351, 7.85, 5, 20, 'red', 5.2),
-  ('6a6c65a1-369c-4366-a92a-382c297f2758', 'aaaaaaaa-0026-0026-0026-000000000026', '2026-02-04', '2026-02-04 21:24:00+00', '2026-02-04 21:47:18+00', 3.05, 1398, 7.64, 4, 16, 'red', 14.6),
-  ('9d912729-9a3d-4ccf-aace-0f73b5305032', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-02-04', '2026-02-04 14:29:00+00', '2026-02-04 15:33:36+00', 12.57, 3876, 5.14, 17, 17, 'red', 16.6),
-  ('aec2b913-3784-4a60-92bc-bba28acd1290', 'aaaaaaaa-0031-0031-0031-000000000031', '2026-02-04', '2026-02-04 15:03:00+00', '2026-02-04 15:41:25+00', 8.28, 2305, 4.64, 6, 12, 'red', 14.5),
-  ('c77c32ff-9641-4fba-b9cf-dfd6bc9942fc', 'aaaaaaaa-0056-0056-0056-000000000056', '2026-02-04', '2026-02-04 14:57:00+00', '2026-02-04 15:51:35+00', 7.53, 3275, 7.25, 8, 16, 'blue', 9.7),
-  ('cc287c53-d92e-465d-9a65-e204356898df', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-02-04', '2026-02-04 16:11:00+00', '2026-02-04 17:38:17+00', 13.64, 5237, 6.4, 30, 30, 'purple', 18.3),
-  ('9c21957c-ebc5-4af0-af38-ea744f4a2dab', 'aaaaaaaa-0085-0085-0085-000000000085', '2026-02-04', '2026-02-04 10:12:00+00', '2026-02-04 11:30:45+00', 13.04, 4725, 6.04, 22, 44, 'purple', 14.5),
-  ('1213efee-772e-4d18-9048-7a82bbbe1c90', 'aaaaaaaa-0019-0019-0019-000000000019', '2026-02-04', '2026-02-04 12:04:00+00', '2026-02-04 12:45:53+00', 8.62, 2513, 4.86, 14, 28, 'red', 9.0),
-  ('9c9a4b9b-0dc4-4e83-96d6-ee60407be9d9', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-02-04', '2026-02-04 14:40:00+00', '2026-02-04 15:59:17+00', 13.96, 4757, 5.68, 26, 78, 'blue', 10.7),
-  ('fcd76c12-29a7-4210-b6c5-affb3f531ab7', 'aaaaaaaa-0045-0045-0045-000000000045', '2026-02-04', '2026-02-04 19:53:00+00', '2026-02-04 21:36:19+00', 13.23, 6199, 7.81, 18, 54, 'blue', 14.5),
-  ('0694f1f6-d036-42d2-bf43-199ab85befb1', 'aaaaaaaa-0099-0099-0099-000000000099', '2026-02-04', '2026-02-04 13:11:00+00', '2026-02-04 13:33:12+00', 3.64, 1332, 6.1, 5, 15, 'purple', 3.2),
-  ('94f68256-0a16-41a3-b73e-a1934f06b01d', 'aaaaaaaa-0023-0023-0023-000000000023', '2026-02-04', '2026-02-04 13:15:00+00', '2026-02-04 13:27:58+00', 2.78, 778, 4.67, 5, 15, 'red', 17.1),
-  ('034afced-082a-4351-81fa-39aa650a7faf', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-02-04', '2026-02-04 20:50:00+00', '2026-02-04 21:21:53+00', 6.34, 1913, 5.03, 9, 27, 'blue', 11.9),
-  ('166c4619-ab44-47cf-9ea3-3f0f1dbefd39', 'aaaaaaaa-0044-0044-0044-000000000044', '2026-02-04', '2026-02-04 07:28:00+00', '2026-02-04 07:57:35+00', 5.2, 1775, 5.69, 7, 7, 'blue', 12.9),
-  ('90285953-1cad-4838-99b2-747b31132323', 'aaaaaaaa-0097-0097-0097-000000000097', '2026-02-04', '2026-02-04 07:36:00+00', '2026-02-04 08:05:35+00', 3.79, 1775, 7.81, 7, 21, 'purple', 19.2);
-
--- ============================================================
--- HEXES (156 hexes)
--- ============================================================
-INSERT INTO public.hexes (id, last_runner_team) VALUES
-  ('8928308292bffff', 'red'),
-  ('89283082853ffff', 'purple'),
-  ('892830828efffff', 'blue'),
-  ('89283082867ffff', 'blue'),
-  ('89283082987ffff', 'blue'),
-  ('8928308291fffff', 'purple'),
-  ('892830829d3ffff', 'purple'),
-  ('89283082977ffff', 'blue'),
-  ('892830828a7ffff', 'purple'),
-  ('8928308297bffff', 'red'),
-  ('8928308296bffff', 'blue'),
-  ('892830828d7ffff', 'purple'),
-  ('89283082913ffff', 'red'),
-  ('8928308284bffff', 'purple'),
-  ('892830828afffff', 'purple'),
-  ('89283082a23ffff', 'blue'),
-  ('892830828fbffff', 'blue'),
-  ('89283082a4fffff', 'purple'),
-  ('892830829dbffff', 'red'),
-  ('89283082a5fffff', 'blue'),
-  ('89283082917ffff', 'purple'),
-  ('892830828e3ffff', 'blue'),
-  ('8928308294fffff', 'blue'),
-  ('8928308283bffff', 'purple'),
-  ('892830828ebffff', 'red'),
-  ('89283082823ffff', 'blue'),
-  ('89283082943ffff', 'blue'),
-  ('892830828dbffff', 'purple'),
-  ('892830829ffffff', 'blue'),
-  ('89283082997ffff', 'purple'),
-  ('892830829d7ffff', 'blue'),
-  ('89283082893ffff', 'blue'),
-  ('8928308290fffff', 'blue'),
-  ('8928308288fffff', 'blue'),
-  ('892830828ffffff', 'blue'),
-  ('89283082a3fffff', 'blue'),
-  ('89283082a27ffff', 'blue'),
-  ('89283082a0bffff', 'blue'),
-  ('892830829fbffff', 'blue'),
-  ('8928308285fffff', 'purple'),
-  ('89283082833ffff', 'red'),
-  ('89283082873ffff', 'red'),
-  ('8928308289fffff', 'red'),
-  ('892830828a3ffff', 'red'),
-  ('892830829b3ffff', 'purple'),
-  ('89283082843ffff', 'purple'),
-  ('8928308298bffff', 'purple'),
-  ('892830829dfffff', 'blue'),
-  ('89283082a1fffff', 'blue'),
-  ('89283082903ffff', 'blue'),
-  ('8928308280bffff', 'red'),
-  ('89283082877ffff', 'purple'),
-  ('8928308295fffff', 'purple'),
-  ('89283082a5bffff', 'red'),
-  ('8928308292fffff', 'purple'),
-  ('892830829bfffff', 'blue'),
-  ('89283082a03ffff', 'purple'),
-  ('892830828b7ffff', 'red'),
-  ('89283082a07ffff', 'purple'),
-  ('8928308286fffff', 'blue'),
-  ('89283082933ffff', 'blue'),
-  ('89283082a67ffff', 'red'),
-  ('892830828cbffff', 'blue'),
-  ('8928308297fffff', 'blue'),
-  ('89283082a2bffff', 'purple'),
-  ('89283082803ffff', 'blue'),
-  ('8928308294bffff', 'blue'),
-  ('892830829f7ffff', 'blue'),
-  ('89283082813ffff', 'purple'),
-  ('89283082973ffff', 'purple'),
-  ('8928308293bffff', 'purple'),
-  ('892830828f7ffff', 'blue'),
-  ('89283082857ffff', 'blue'),
-  ('892830829f3ffff', 'red'),
-  ('89283082847ffff', 'purple'),
-  ('89283082883ffff', 'blue'),
-  ('892830829e7ffff', 'blue'),
-  ('8928308291bffff', 'purple'),
-  ('89283082a13ffff', 'red'),
-  ('89283082887ffff', 'blue'),
-  ('89283082937ffff', 'blue'),
-  ('8928308293fffff', 'purple'),
-  ('8928308299bffff', 'blue'),
-  ('892830829c3ffff', 'purple'),
-  ('892830829cfffff', 'red'),
-  ('8928308287bffff', 'blue'),
-  ('892830828e7ffff', 'red'),
-  ('8928308295bffff', 'blue'),
-  ('89283082817ffff', 'blue'),
-  ('89283082a37ffff', 'blue'),
-  ('89283082807ffff', 'red'),
-  ('8928308283fffff', 'blue'),
-  ('89283082a3bffff', 'red'),
-  ('89283082953ffff', 'red'),
-  ('89283082a4bffff', 'purple'),
-  ('892830829a3ffff', 'blue'),
-  ('892830828c3ffff', 'red'),
-  ('89283082863ffff', 'red'),
-  ('892830829bbffff', 'blue'),
-  ('892830829a7ffff', 'blue'),
-  ('89283082837ffff', 'purple'),
-  ('892830829cbffff', 'blue'),
-  ('892830828bbffff', 'blue'),
-  ('8928308284fffff', 'red'),
-  ('892830829c7ffff', 'red'),
-  ('89283082a33ffff', 'red'),
-  ('8928308280fffff', 'red'),
-  ('892830828abffff', 'red'),
-  ('8928308298fffff', 'blue'),
-  ('89283082927ffff', 'red'),
-  ('892830828dfffff', 'blue'),
-  ('89283082a53ffff', 'blue'),
-  ('892830828bfffff', 'purple'),
-  ('89283082a47ffff', 'purple'),
-  ('89283082a63ffff', 'blue'),
-  ('8928308282bffff', 'purple'),
-  ('892830829afffff', 'blue'),
-  ('89283082a43ffff', 'blue'),
-  ('89283082a17ffff', 'blue'),
-  ('8928308290bffff', 'purple'),
-  ('892830828d3ffff', 'red'),
-  ('89283082a2fffff', 'blue'),
-  ('892830828b3ffff', 'blue'),
-  ('8928308286bffff', 'blue'),
-  ('8928308288bffff', 'blue'),
-  ('8928308282fffff', 'blue'),
-  ('89283082957ffff', 'blue'),
-  ('8928308289bffff', 'purple'),
-  ('89283082827ffff', 'blue'),
-  ('89283082897ffff', 'purple'),
-  ('8928308296fffff', 'purple'),
-  ('892830828f3ffff', 'blue'),
-  ('8928308281bffff', 'blue'),
-  ('89283082a0fffff', 'red'),
-  ('892830829e3ffff', 'red'),
-  ('892830828cfffff', 'blue'),
-  ('89283082967ffff', 'blue'),
-  ('8928308281fffff', 'blue'),
-  ('89283082907ffff', 'purple'),
-  ('8928308287fffff', 'blue'),
-  ('8928308299fffff', 'red'),
-  ('892830828c7ffff', 'blue'),
-  ('89283082923ffff', 'red'),
-  ('89283082a6fffff', 'blue'),
-  ('892830829abffff', 'red'),
-  ('89283082947ffff', 'blue'),
-  ('892830829b7ffff', 'blue'),
-  ('89283082a57ffff', 'blue'),
-  ('892830829ebffff', 'purple'),
-  ('89283082a6bffff', 'blue'),
-  ('89283082993ffff', 'purple'),
-  ('89283082963ffff', 'blue'),
-  ('892830829efffff', 'red'),
-  ('89283082a1bffff', 'purple'),
-  ('8928308285bffff', 'blue'),
-  ('89283082983ffff', 'red')
-ON CONFLICT (id) DO UPDATE SET last_runner_team = EXCLUDED.last_runner_team;
-
--- ============================================================
--- UPDATE SEASON POINTS (100 users with points)
--- ============================================================
-UPDATE public.users SET season_points = 1030 WHERE id = 'aaaaaaaa-0003-0003-0003-000000000003';
-UPDATE public.users SET season_points = 1019 WHERE id = 'aaaaaaaa-0031-0031-0031-000000000031';
-UPDATE public.users SET season_points = 1018 WHERE id = 'aaaaaaaa-0094-0094-0094-000000000094';
-UPDATE public.users SET season_points = 964 WHERE id = 'aaaaaaaa-0017-0017-0017-000000000017';
-UPDATE public.users SET season_points = 956 WHERE id = 'aaaaaaaa-0016-0016-0016-000000000016';
-UPDATE public.users SET season_points = 944 WHERE id = 'aaaaaaaa-0002-0002-0002-000000000002';
-UPDATE public.users SET season_points = 934 WHERE id = 'aaaaaaaa-0098-0098-0098-000000000098';
-UPDATE public.users SET season_points = 918 WHERE id = 'aaaaaaaa-0010-0010-0010-000000000010';
-UPDATE public.users SET season_points = 894 WHERE id = 'aaaaaaaa-0007-0007-0007-000000000007';
-UPDATE public.users SET season_points = 870 WHERE id = 'aaaaaaaa-0075-0075-0075-000000000075';
-UPDATE public.users SET season_points = 863 WHERE id = 'aaaaaaaa-0033-0033-0033-000000000033';
-UPDATE public.users SET season_points = 853 WHERE id = 'aaaaaaaa-0006-0006-0006-000000000006';
-UPDATE public.users SET season_points = 846 WHERE id = 'aaaaaaaa-0001-0001-0001-000000000001';
-UPDATE public.users SET season_points = 843 WHERE id = 'aaaaaaaa-0026-0026-0026-000000000026';
-UPDATE public.users SET season_points = 826 WHERE id = 'aaaaaaaa-0083-0083-0083-000000000083';
-UPDATE public.users SET season_points = 814 WHERE id = 'aaaaaaaa-0095-0095-0095-000000000095';
-UPDATE public.users SET season_points = 808 WHERE id = 'aaaaaaaa-0028-0028-0028-000000000028';
-UPDATE public.users SET season_points = 807 WHERE id = 'aaaaaaaa-0082-0082-0082-000000000082';
-UPDATE public.users SET season_points = 797 WHERE id = 'aaaaaaaa-0079-0079-0079-000000000079';
-UPDATE public.users SET season_points = 796 WHERE id = 'aaaaaaaa-0035-0035-0035-000000000035';
-UPDATE public.users SET season_points = 775 WHERE id = 'aaaaaaaa-0025-0025-0025-000000000025';
-UPDATE public.users SET season_points = 773 WHERE id = 'aaaaaaaa-0013-0013-0013-000000000013';
-UPDATE public.users SET season_points = 773 WHERE id = 'aaaaaaaa-0051-0051-0051-000000000051';
-UPDATE public.users SET season_points = 761 WHERE id = 'aaaaaaaa-0039-0039-0039-000000000039';
-UPDATE public.users SET season_points = 754 WHERE id = 'aaaaaaaa-0011-0011-0011-000000000011';
-UPDATE public.users SET season_points = 751 WHERE id = 'aaaaaaaa-0005-0005-0005-000000000005';
-UPDATE public.users SET season_points = 747 WHERE id = 'aaaaaaaa-0055-0055-0055-000000000055';
-UPDATE public.users SET season_points = 740 WHERE id = 'aaaaaaaa-0024-0024-0024-000000000024';
-UPDATE public.users SET season_points = 738 WHERE id = 'aaaaaaaa-0048-0048-0048-000000000048';
-UPDATE public.users SET season_points = 738 WHERE id = 'aaaaaaaa-0088-0088-0088-000000000088';
-UPDATE public.users SET season_points = 730 WHERE id = 'aaaaaaaa-0096-0096-0096-000000000096';
-UPDATE public.users SET season_points = 727 WHERE id = 'aaaaaaaa-0020-0020-0020-000000000020';
-UPDATE public.users SET season_points = 727 WHERE id = 'aaaaaaaa-0092-0092-0092-000000000092';
-UPDATE public.users SET season_points = 719 WHERE id = 'aaaaaaaa-0000-0000-0000-000000000000';
-UPDATE public.users SET season_points = 718 WHERE id = 'aaaaaaaa-0014-0014-0014-000000000014';
-UPDATE public.users SET season_points = 708 WHERE id = 'aaaaaaaa-0036-0036-0036-000000000036';
-UPDATE public.users SET season_points = 706 WHERE id = 'aaaaaaaa-0073-0073-0073-000000000073';
-UPDATE public.users SET season_points = 706 WHERE id = 'aaaaaaaa-0093-0093-0093-000000000093';
-UPDATE public.users SET season_points = 690 WHERE id = 'aaaaaaaa-0064-0064-0064-000000000064';
-UPDATE public.users SET season_points = 690 WHERE id = 'aaaaaaaa-0084-0084-0084-000000000084';
-UPDATE public.users SET season_points = 683 WHERE id = 'aaaaaaaa-0043-0043-0043-000000000043';
-UPDATE public.users SET season_points = 680 WHERE id = 'aaaaaaaa-0085-0085-0085-000000000085';
-UPDATE public.users SET season_points = 667 WHERE id = 'aaaaaaaa-0040-0040-0040-000000000040';
-UPDATE public.users SET season_points = 656 WHERE id = 'aaaaaaaa-0012-0012-0012-000000000012';
-UPDATE public.users SET season_points = 652 WHERE id = 'aaaaaaaa-0070-0070-0070-000000000070';
-UPDATE public.users SET season_points = 652 WHERE id = 'aaaaaaaa-0090-0090-0090-000000000090';
-UPDATE public.users SET season_points = 651 WHERE id = 'aaaaaaaa-0019-0019-0019-000000000019';
-UPDATE public.users SET season_points = 651 WHERE id = 'aaaaaaaa-0081-0081-0081-000000000081';
-UPDATE public.users SET season_points = 643 WHERE id = 'aaaaaaaa-0097-0097-0097-000000000097';
-UPDATE public.users SET season_points = 642 WHERE id = 'aaaaaaaa-0059-0059-0059-000000000059';
-UPDATE public.users SET season_points = 632 WHERE id = 'aaaaaaaa-0058-0058-0058-000000000058';
-UPDATE public.users SET season_points = 625 WHERE id = 'aaaaaaaa-0041-0041-0041-000000000041';
-UPDATE public.users SET season_points = 622 WHERE id = 'aaaaaaaa-0030-0030-0030-000000000030';
-UPDATE public.users SET season_points = 621 WHERE id = 'aaaaaaaa-0050-0050-0050-000000000050';
-UPDATE public.users SET season_points = 620 WHERE id = 'aaaaaaaa-0057-0057-0057-000000000057';
-UPDATE public.users SET season_points = 618 WHERE id = 'aaaaaaaa-0009-0009-0009-000000000009';
-UPDATE public.users SET season_points = 611 WHERE id = 'aaaaaaaa-0027-0027-0027-000000000027';
-UPDATE public.users SET season_points = 608 WHERE id = 'aaaaaaaa-0045-0045-0045-000000000045';
-UPDATE public.users SET season_points = 602 WHERE id = 'aaaaaaaa-0037-0037-0037-000000000037';
-UPDATE public.users SET season_points = 599 WHERE id = 'aaaaaaaa-0099-0099-0099-000000000099';
-UPDATE public.users SET season_points = 590 WHERE id = 'aaaaaaaa-0087-0087-0087-000000000087';
-UPDATE public.users SET season_points = 579 WHERE id = 'aaaaaaaa-0060-0060-0060-000000000060';
-UPDATE public.users SET season_points = 579 WHERE id = 'aaaaaaaa-0086-0086-0086-000000000086';
-UPDATE public.users SET season_points = 572 WHERE id = 'aaaaaaaa-0044-0044-0044-000000000044';
-UPDATE public.users SET season_points = 571 WHERE id = 'aaaaaaaa-0034-0034-0034-000000000034';
-UPDATE public.users SET season_points = 566 WHERE id = 'aaaaaaaa-0008-0008-0008-000000000008';
-UPDATE public.users SET season_points = 565 WHERE id = 'aaaaaaaa-0076-0076-0076-000000000076';
-UPDATE public.users SET season_points = 565 WHERE id = 'aaaaaaaa-0080-0080-0080-000000000080';
-UPDATE public.users SET season_points = 565 WHERE id = 'aaaaaaaa-0091-0091-0091-000000000091';
-UPDATE public.users SET season_points = 563 WHERE id = 'aaaaaaaa-0053-0053-0053-000000000053';
-UPDATE public.users SET season_points = 560 WHERE id = 'aaaaaaaa-0089-0089-0089-000000000089';
-UPDATE public.users SET season_points = 553 WHERE id = 'aaaaaaaa-0029-0029-0029-000000000029';
-UPDATE public.users SET season_points = 549 WHERE id = 'aaaaaaaa-0038-0038-0038-000000000038';
-UPDATE public.users SET season_points = 546 WHERE id = 'aaaaaaaa-0015-0015-0015-000000000015';
-UPDATE public.users SET season_points = 541 WHERE id = 'aaaaaaaa-0066-0066-0066-000000000066';
-UPDATE public.users SET season_points = 539 WHERE id = 'aaaaaaaa-0052-0052-0052-000000000052';
-UPDATE public.users SET season_points = 535 WHERE id = 'aaaaaaaa-0018-0018-0018-000000000018';
-UPDATE public.users SET season_points = 529 WHERE id = 'aaaaaaaa-0054-0054-0054-000000000054';
-UPDATE public.users SET season_points = 529 WHERE id = 'aaaaaaaa-0069-0069-0069-000000000069';
-UPDATE public.users SET season_points = 529 WHERE id = 'aaaaaaaa-0071-0071-0071-000000000071';
-UPDATE public.users SET season_points = 527 WHERE id = 'aaaaaaaa-0022-0022-0022-000000000022';
-UPDATE public.users SET season_points = 520 WHERE id = 'aaaaaaaa-0046-0046-0046-000000000046';
-UPDATE public.users SET season_points = 513 WHERE id = 'aaaaaaaa-0004-0004-0004-000000000004';
-UPDATE public.users SET season_points = 510 WHERE id = 'aaaaaaaa-0023-0023-0023-000000000023';
-UPDATE public.users SET season_points = 489 WHERE id = 'aaaaaaaa-0072-0072-0072-000000000072';
-UPDATE public.users SET season_points = 485 WHERE id = 'aaaaaaaa-0068-0068-0068-000000000068';
-UPDATE public.users SET season_points = 485 WHERE id = 'aaaaaaaa-0078-0078-0078-000000000078';
-UPDATE public.users SET season_points = 482 WHERE id = 'aaaaaaaa-0042-0042-0042-000000000042';
-UPDATE public.users SET season_points = 479 WHERE id = 'aaaaaaaa-0063-0063-0063-000000000063';
-UPDATE public.users SET season_points = 464 WHERE id = 'aaaaaaaa-0074-0074-0074-000000000074';
-UPDATE public.users SET season_points = 462 WHERE id = 'aaaaaaaa-0061-0061-0061-000000000061';
-UPDATE public.users SET season_points = 455 WHERE id = 'aaaaaaaa-0056-0056-0056-000000000056';
-UPDATE public.users SET season_points = 455 WHERE id = 'aaaaaaaa-0077-0077-0077-000000000077';
-UPDATE public.users SET season_points = 452 WHERE id = 'aaaaaaaa-0047-0047-0047-000000000047';
-UPDATE public.users SET season_points = 448 WHERE id = 'aaaaaaaa-0032-0032-0032-000000000032';
-UPDATE public.users SET season_points = 438 WHERE id = 'aaaaaaaa-0049-0049-0049-000000000049';
-UPDATE public.users SET season_points = 430 WHERE id = 'aaaaaaaa-0021-0021-0021-000000000021';
-UPDATE public.users SET season_points = 416 WHERE id = 'aaaaaaaa-0062-0062-0062-000000000062';
-UPDATE public.users SET season_points = 370 WHERE id = 'aaaaaaaa-0067-0067-0067-000000000067';
-UPDATE public.users SET season_points = 368 WHERE id = 'aaaaaaaa-0065-0065-0065-000000000065';
-
--- ============================================================
--- SUMMARY
--- ============================================================
--- Season: D-40 to D-1
--- Users: 100 (Red: 40, Blue: 40, Purple: 20)
--- Total runs: 2222
--- Total distance: 19033.3 km
--- Total flips: 29985
---
--- Team Points:
---   Red:    28,668
---   Blue:   22,837
---   Purple: 14,074
---
--- Hex Control:
---   Red:    36
---   Blue:   78
---   Purple: 42
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+RunStrict Multi-Season Generator
+
+Replaces the frozen season_40days.sql / seed_7days.sql fixtures. Those went
+stale with every migration, and rebuilding them meant replaying simulate_day.py
+day by day against a live DB. This generator writes N consecutive seasons
+offline, as per-table COPY CSV parts plus a manifest, in the state a database
+would be in after living through them:
+
+  - run_history: every season's runs (reset_season keeps them). Bots, runs and
+    hex walks are seed_generator's: same region, archetypes and bot ids.
+  - season_leaderboard_snapshot: one ranking per ended season, computed the
+    way snapshot_season_leaderboard() computes it from run_history (points >
+    0, ranked by points, then name; byte order for ties).
+  - users: all-time aggregates over every season. season_points and team are
+    the current season's, because reset_season zeroes them at each transition.
+    Teams are re-picked every season in the --teams mix; --team-churn sets
+    how many bots switch.
+  - hexes, hex_snapshot, daily_all_range_stats: the current season only (the
+    reset wipes them), as in seed_generator.
+  - app_config season block (startDate, durationDays, seasonNumber), so the
+    server's season arithmetic matches the generated calendar.
+
+The last season is the current one: --current-days days, ending at --end.
+The seasons before it are --season-days long and end the day before the next
+one starts.
+
+Each season is one worker process (--jobs). Every (season, chunk) is seeded by
+(seed, chunk, season), and the bots' homes and archetypes by (seed, chunk), so
+the files do not depend on --jobs. Seasons only meet in the parent, which sums
+their per-bot aggregates into users and writes the manifest and load.sql.
+
+    <out>/run_history/s002-part-0000.csv             # per season, per --chunk-bots
+    <out>/season_leaderboard_snapshot/s002.csv       # per ended season
+    <out>/users/part-0000.csv
+    <out>/hexes/part-0000.csv                        # + hex_snapshot, daily_all_range_stats
+    <out>/manifest.json                              # calendar, tables, parts, row counts
+    <out>/load.sql                                   # psql: one transaction, FK order
+
+Usage:
+    python3 season_generator.py --out out/seasons                    # 100 bots, 3 seasons, 5 days into the current one
+    python3 season_generator.py --seasons 1 --current-days 40 --out out/season40     # old season_40days.sql
+    python3 season_generator.py --seasons 1 --current-days 7 --out out/seed7         # old seed_7days.sql
+    python3 season_generator.py --bots 100000 --seasons 8 --season-days 40 --jobs 8 --out out/history
+    psql "$DATABASE_URL" -f out/seasons/load.sql
+
+Requires: pip install h3 numpy pyarrow
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    print("ERROR: pyarrow required. Install with: pip install pyarrow", file=sys.stderr)
+    sys.exit(1)
+
+import seed_generator as seed
+import simulate_day as sim
+
+SNAPSHOT_TABLE = ('public.season_leaderboard_snapshot', [
+    'season_number', 'rank', 'user_id', 'name', 'team', 'avatar', 'manifesto', 'season_points',
+    'total_distance_km', 'avg_pace_min_per_km', 'avg_cv', 'home_hex', 'home_hex_end', 'nationality', 'total_runs',
+])
+
+# table -> (qualified name, columns), in load (FK) order after auth.users
+TABLES = {**seed.TABLES, 'season_leaderboard_snapshot': SNAPSHOT_TABLE}
+
+AGG_KEYS = ('distance', 'minutes', 'cv', 'pace', 'runs', 'points')
+
+
+# ==================== Calendar ====================
+
+def season_calendar(first_season, seasons, season_days, current_days, end):
+    """[{number, start, days, offset}] for `seasons` seasons; the last has current_days days up to `end`."""
+    current_start = end - timedelta(days=current_days - 1)
+    first_start = current_start - timedelta(days=(seasons - 1) * season_days)
+    return [{
+        'number': first_season + i,
+        'start': first_start + timedelta(days=i * season_days),
+        'days': current_days if i == seasons - 1 else season_days,
+        'offset': i * season_days,   # global day index of the first day; keeps run ids unique across seasons
+    } for i in range(seasons)]
+
+
+def season_part(out, table, number, k=None):
+    suffix = '' if k is None else f"-part-{k:04d}"
+    return Path(out) / table / f"s{number:03d}{suffix}.csv"
+
+
+# ==================== Bots ====================
+
+def bot_chunk(spec, k):
+    """Bots [k * chunk_bots, ...): index, ids, home cell and archetype, the same in every season."""
+    region = seed.region_for(spec['province'])
+    i0 = k * spec['chunk_bots']
+    idx = np.arange(i0, min(i0 + spec['chunk_bots'], spec['bots']), dtype=np.int64)
+    rng = np.random.default_rng([spec['seed'], k])
+    home = rng.integers(0, len(region.cells), len(idx)).astype(np.int32)
+    weights = np.array([c['weight'] for c in sim.ARCHETYPES.values()], dtype=float)
+    arch = rng.choice(len(weights), len(idx), p=weights / weights.sum())
+    return idx, seed.bot_ids(idx), home, arch
+
+
+def season_teams(spec, idx, i):
+    """Teams for the i-th season: seed_generator's interleaved --teams mix, with every bot's position
+    moved by --team-churn of the range per season, so the bots near a team boundary switch at each reset."""
+    bounds = np.cumsum(spec['weights'])[:-1] / sum(spec['weights'])
+    position = ((idx * spec['stride'] + i * spec['team_shift']) % spec['bots'] + 0.5) / spec['bots']
+    return np.searchsorted(bounds, position, side='right').astype(np.int8)
+
+
+def new_agg(n):
+    return {key: np.zeros(n, dtype=np.int32 if key in ('runs', 'points') else float) for key in AGG_KEYS}
+
+
+def round_numeric(x, digits):
+    """ROUND(x::NUMERIC, digits): halves away from zero, after float noise below 1e-9 is dropped."""
+    scaled = np.round(x * 10 ** digits, 9)
+    return np.sign(scaled) * np.floor(np.abs(scaled) + 0.5) / 10 ** digits
+
+
+def snapshot_rows(number, users, agg):
+    """Unranked season_leaderboard_snapshot rows of one chunk (bots with points only)."""
+    runs = np.maximum(agg['runs'], 1)
+    rows = pa.table([
+        pa.repeat(pa.scalar(number, pa.int32()), users.num_rows), pa.repeat(pa.scalar(0, pa.int32()), users.num_rows),
+        users['id'], users['name'], users['team'], users['avatar'], users['manifesto'], users['season_points'],
+        users['total_distance_km'], pa.array(round_numeric(agg['pace'] / runs, 2)),
+        pa.array(round_numeric(agg['cv'] / runs, 1)),
+        users['home_hex'], users['home_hex_end'], users['nationality'], users['total_runs'],
+    ], names=SNAPSHOT_TABLE[1])
+    return rows.filter(pa.array(agg['points'] > 0))
+
+
+def rank(rows):
+    """Order by season_points DESC, name ASC and number the ranks, as snapshot_season_leaderboard()."""
+    rows = rows.sort_by([('season_points', 'descending'), ('name', 'ascending')])
+    return rows.set_column(1, 'rank', pa.array(np.arange(1, rows.num_rows + 1, dtype=np.int32)))
+
+
+# ==================== Seasons ====================
+
+def generate_season(spec, i):
+    """One season: run_history parts, its leaderboard snapshot unless it is the current season.
+
+    Returns row counts, the per-bot aggregates (for the all-time users columns),
+    and, for the current season, the per-cell hex ownership.
+    """
+    region = seed.region_for(spec['province'])
+    season = spec['calendar'][i]
+    current = i == len(spec['calendar']) - 1
+    totals = new_agg(spec['bots'])
+    ownership = (np.zeros(len(region.cells), dtype=np.int64), np.full(len(region.cells), -1, dtype=np.int8))
+    snapshot = []
+    runs = 0
+
+    for k in range(spec['chunks']):
+        idx, ids, home, arch = bot_chunk(spec, k)
+        teams = season_teams(spec, idx, i)
+        rng = np.random.default_rng([spec['seed'], k, season['number']])
+        agg = new_agg(len(idx))
+        part = seed.PartWriter(season_part(spec['out'], 'run_history', season['number'], k), 'run_history', 'csv', 0)
+        for day in range(season['days']):
+            part.write(seed.day_runs(rng, idx, ids, teams, home, arch, season['offset'] + day,
+                                     season['start'] + timedelta(days=day), region, agg, ownership))
+        part.close()
+        runs += part.rows
+        for key in AGG_KEYS:
+            totals[key][idx] = agg[key]
+        if not current:
+            snapshot.append(snapshot_rows(season['number'], seed.users_table(idx, ids, teams, home, region, agg), agg))
+
+    counts = {'run_history': runs}
+    if not current:
+        ranked = rank(pa.concat_tables(snapshot))
+        pacsv.write_csv(ranked, season_part(spec['out'], 'season_leaderboard_snapshot', season['number']))
+        counts['season_leaderboard_snapshot'] = ranked.num_rows
+    return counts, totals, ownership if current else None
+
+
+def write_users(spec, alltime, current):
+    """users parts: all-time aggregates, the current season's points and team."""
+    region = seed.region_for(spec['province'])
+    rows = 0
+    for k in range(spec['chunks']):
+        idx, ids, home, _ = bot_chunk(spec, k)
+        agg = {key: alltime[key][idx] for key in AGG_KEYS}
+        agg['points'] = current['points'][idx]
+        part = seed.PartWriter(seed.part_path(spec['out'], 'users', k, 'csv'), 'users', 'csv', 0)
+        part.write(seed.users_table(idx, ids, season_teams(spec, idx, len(spec['calendar']) - 1), home, region, agg))
+        part.close()
+        rows += part.rows
+    return rows
+
+
+# ==================== Manifest / Load Script ====================
+
+def build_manifest(spec, season_counts, rows, out):
+    """Calendar, app_config season block, and each table's rows and parts (path, bytes) in load order."""
+    calendar = spec['calendar']
+    tables = [{
+        'table': name, 'columns': columns, 'rows': rows[table],
+        'parts': [{'path': str(p.relative_to(out)), 'bytes': p.stat().st_size}
+                  for p in sorted((out / table).iterdir())],
+    } for table, (name, columns) in TABLES.items()]
+    return {
+        'generator': 'season_generator.py',
+        'seed': spec['seed'], 'bots': spec['bots'], 'province': spec['province'],
+        'app_config_season': {'startDate': calendar[0]['start'].isoformat(), 'durationDays': spec['season_days'],
+                              'seasonNumber': calendar[0]['number']},
+        'seasons': [{
+            'number': s['number'], 'start': s['start'].isoformat(),
+            'end': (s['start'] + timedelta(days=s['days'] - 1)).isoformat(), 'days': s['days'],
+            'current': i == len(calendar) - 1, **season_counts[i],
+        } for i, s in enumerate(calendar)],
+        'tables': tables,
+    }
+
+
+def load_script(manifest, out):
+    """psql script: remove earlier bots, the seasons' snapshots and the region's hexes, then load every part."""
+    seasons = manifest['seasons']
+    current = seasons[-1]
+    prefix = seed.BOT_ID_PREFIX[:8]
+    first_day, last_day = seasons[0]['start'], current['end']
+    lines = [
+        f"-- RunStrict seasons: {manifest['bots']:,} bots in {manifest['province']}, "
+        f"S{seasons[0]['number']}..S{current['number']} ({first_day} .. {last_day})",
+        f"-- Generated by season_generator.py (seed {manifest['seed']}); see manifest.json",
+        "\\set ON_ERROR_STOP on",
+        "BEGIN;",
+        f"DELETE FROM public.run_history WHERE user_id::text LIKE '{prefix}-%';",
+        f"DELETE FROM public.leaderboard_dirty WHERE user_id::text LIKE '{prefix}-%';",
+        f"DELETE FROM public.season_leaderboard_snapshot "
+        f"WHERE season_number BETWEEN {seasons[0]['number']} AND {current['number']} OR user_id::text LIKE '{prefix}-%';",
+        f"DELETE FROM public.users WHERE id::text LIKE '{prefix}-%';",
+        f"DELETE FROM auth.users WHERE id::text LIKE '{prefix}-%';",
+        f"DELETE FROM public.hex_snapshot WHERE parent_hex = '{manifest['province']}';",
+        f"DELETE FROM public.hexes WHERE parent_hex = '{manifest['province']}';",
+        f"DELETE FROM public.daily_all_range_stats WHERE stat_date = '{current['end']}';",
+        f"UPDATE public.app_config SET config_data = jsonb_set(config_data, '{{season}}', "
+        f"'{json.dumps(manifest['app_config_season'])}'::jsonb);",
+        # Partitioned run_history (20260308000003): monthly partitions instead of the DEFAULT one
+        "DO $$ BEGIN\n"
+        "  IF EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'public.run_history'::regclass) THEN\n"
+        f"    PERFORM public.create_date_partitions('public.run_history', '{first_day}', '{last_day}', 'month');\n"
+        "  END IF;\n"
+        "END $$;",
+        seed.AUTH_USERS_SQL.format(prefix=seed.BOT_ID_PREFIX, password=seed.PASSWORD_HASH,
+                                   domain=seed.BOT_EMAIL_DOMAIN, app_meta=seed.APP_META_DATA,
+                                   last=manifest['bots'] - 1).strip(),
+    ]
+    for table in manifest['tables']:
+        for part in table['parts']:   # \copy paths are relative to psql's cwd, not the script
+            lines.append(f"\\copy {table['table']} ({', '.join(table['columns'])}) "
+                         f"FROM '{(out / part['path']).resolve()}' WITH (FORMAT csv, HEADER true)")
+    lines.append("COMMIT;")
+    return "\n".join(lines) + "\n"
+
+
+# ==================== Main ====================
+
+def main():
+    default_end = sim.today_gmt2() - timedelta(days=1)
+    default_teams = ','.join(f"{t}={w}" for t, w in sim.TEAM_DISTRIBUTION.items())
+    parser = argparse.ArgumentParser(description='Generate N consecutive seasons as COPY CSV parts with a manifest')
+    parser.add_argument('--out', required=True, help='Output directory (replaced if it holds earlier output)')
+    parser.add_argument('--force', action='store_true', help='Replace --out even if it does not hold earlier output')
+    parser.add_argument('--bots', type=int, default=100, help='Bots (default: 100)')
+    parser.add_argument('--teams', default=default_teams, help=f'Team mix per season (default: {default_teams})')
+    parser.add_argument('--team-churn', type=float, default=0.1,
+                        help='Team mix rotation per season; about 3x this share of bots switch team (default: 0.1)')
+    parser.add_argument('--province', default=sim.h3.cell_to_parent(sim.DEFAULT_HOME_HEX, sim.ALL_RESOLUTION),
+                        help='Res 5 province, or any finer cell inside it (default: DEFAULT_HOME_HEX province)')
+    parser.add_argument('--seasons', type=int, default=3, help='Seasons, the last one current (default: 3)')
+    parser.add_argument('--first-season', type=int, default=2, help='Number of the first season (default: 2)')
+    parser.add_argument('--season-days', type=int, default=40, help='Days per season (default: 40)')
+    parser.add_argument('--current-days', type=int, default=5, help='Days run in the current season (default: 5)')
+    parser.add_argument('--end', type=date.fromisoformat, default=default_end,
+                        help=f'Last run date (default: yesterday GMT+2, {default_end})')
+    parser.add_argument('--chunk-bots', type=int, default=100000, help='Bots per part file (default: 100000)')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='Worker processes, one season each '
+                        '(default: CPU count)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    args = parser.parse_args()
+
+    try:
+        weights = seed.parse_teams(args.teams)
+    except ValueError as e:
+        parser.error(f"--teams: {e}")
+    if not sim.h3.is_valid_cell(args.province) or sim.h3.get_resolution(args.province) < sim.ALL_RESOLUTION:
+        parser.error(f"--province: {args.province} is not a Res {sim.ALL_RESOLUTION}+ H3 cell")
+    if min(args.bots, args.chunk_bots, args.seasons, args.season_days, args.current_days) < 1:
+        parser.error("--bots, --chunk-bots, --seasons, --season-days and --current-days must be positive")
+    if args.current_days > args.season_days:
+        parser.error("--current-days is longer than --season-days")
+
+    stride = seed.team_stride(args.bots)
+    spec = {
+        'out': args.out, 'bots': args.bots, 'weights': weights, 'stride': stride, 'seed': args.seed,
+        'team_shift': round(args.bots * args.team_churn),
+        'province': sim.h3.cell_to_parent(args.province, sim.ALL_RESOLUTION),
+        'season_days': args.season_days, 'chunk_bots': args.chunk_bots, 'chunks': -(-args.bots // args.chunk_bots),
+        'calendar': season_calendar(args.first_season, args.seasons, args.season_days, args.current_days, args.end),
+    }
+    out = Path(args.out)
+    try:
+        seed.replace_out_dir(out, args.force, marker='manifest.json')
+    except ValueError as e:
+        parser.error(f"--out: {e}")
+    for table in TABLES:
+        (out / table).mkdir(parents=True)
+
+    calendar = spec['calendar']
+    jobs = max(1, min(args.jobs, len(calendar)))
+    region = seed.region_for(spec['province'])
+    print(f"Generating {args.bots:,} bots x {len(calendar)} seasons (S{calendar[0]['number']} {calendar[0]['start']} "
+          f".. S{calendar[-1]['number']} {args.end}) in {spec['province']} ({len(region.cells):,} cells) "
+          f"on {jobs} processes", file=sys.stderr)
+
+    t0 = time.perf_counter()
+    alltime = new_agg(args.bots)
+    season_counts = []
+    pool = ProcessPoolExecutor(jobs) if jobs > 1 else None
+    results = pool.map(generate_season, [spec] * len(calendar), range(len(calendar))) if pool else \
+        (generate_season(spec, i) for i in range(len(calendar)))
+    for i, (counts, totals, ownership) in enumerate(results):
+        season_counts.append(counts)
+        for key in AGG_KEYS:
+            alltime[key] += totals[key]
+        if ownership is not None:
+            current_agg, current_ownership = totals, ownership
+        print(f"  S{calendar[i]['number']}: {counts['run_history']:,} runs, "
+              f"{counts.get('season_leaderboard_snapshot', 0):,} ranked ({time.perf_counter() - t0:.1f}s)",
+              file=sys.stderr)
+    if pool:
+        pool.shutdown()
+
+    rows = {table: sum(c.get(table, 0) for c in season_counts)
+            for table in ('run_history', 'season_leaderboard_snapshot')}
+    rows['users'] = write_users(spec, alltime, current_agg)
+    current = calendar[-1]
+    for table, data in seed.region_tables({'province': spec['province'], 'start': current['start'],
+                                           'days': current['days']}, region, *current_ownership).items():
+        pacsv.write_csv(data, seed.part_path(out, table, 0, 'csv'))
+        rows[table] = data.num_rows
+
+    manifest = build_manifest(spec, season_counts, rows, out)
+    (out / 'manifest.json').write_text(json.dumps(manifest, indent=2) + '\n')
+    (out / 'load.sql').write_text(load_script(manifest, out))
+    elapsed = time.perf_counter() - t0
+
+    print(f"\n{'table':<30} {'rows':>12} {'bytes':>10}")
+    print(f"{'auth_users':<30} {args.bots:>12,} {'load.sql':>10}")
+    for table in TABLES:
+        size = sum(p.stat().st_size for p in (out / table).iterdir())
+        print(f"{table:<30} {rows[table]:>12,} {size / 1e6:>8.1f}MB")
+    total_rows = sum(rows.values())
+    print(f"\n{total_rows:,} rows in {elapsed:.1f}s ({total_rows / elapsed:,.0f} rows/s). "
+          f"Load with: psql \"$DATABASE_URL\" -f {out / 'load.sql'}")
+
+
+if __name__ == '__main__':
+    main()
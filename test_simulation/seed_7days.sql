@@ -1,747 +0,0 @@
--- ============================================================
--- RunStrict Simulation: 7 day(s) starting 2026-02-04
--- Generated: 2026-02-04 21:15:12
--- ============================================================
-
--- Run this SQL in Supabase SQL Editor to populate test data
--- https://supabase.com/dashboard/project/vhooaslzkmbnzmzwiium/sql
-
--- Users (100 total: 40 Red, 40 Blue, 20 Purple)
-INSERT INTO public.users (id, name, team, avatar, season_points) VALUES
-  ('aaaaaaaa-0000-0000-0000-000000000000', 'AlexRunner', 'red', '🏃', 0),
-  ('aaaaaaaa-0001-0001-0001-000000000001', 'JordanDash', 'red', '🏃‍♂️', 0),
-  ('aaaaaaaa-0002-0002-0002-000000000002', 'CaseySwift', 'red', '🏃‍♀️', 0),
-  ('aaaaaaaa-0003-0003-0003-000000000003', 'RileyFlash', 'red', '🦊', 0),
-  ('aaaaaaaa-0004-0004-0004-000000000004', 'MorganBolt', 'red', '🐺', 0),
-  ('aaaaaaaa-0005-0005-0005-000000000005', 'TaylorStride', 'red', '🦅', 0),
-  ('aaaaaaaa-0006-0006-0006-000000000006', 'QuinnPace', 'red', '🐬', 0),
-  ('aaaaaaaa-0007-0007-0007-000000000007', 'AverySprint', 'red', '🔥', 0),
-  ('aaaaaaaa-0008-0008-0008-000000000008', 'BlakeBlaze', 'red', '💨', 0),
-  ('aaaaaaaa-0009-0009-0009-000000000009', 'CameronStorm', 'red', '⚡', 0),
-  ('aaaaaaaa-0010-0010-0010-000000000010', 'DakotaWind', 'red', '🌊', 0),
-  ('aaaaaaaa-0011-0011-0011-000000000011', 'EmeryFire', 'red', '🌪️', 0),
-  ('aaaaaaaa-0012-0012-0012-000000000012', 'FinleyWave', 'red', '💎', 0),
-  ('aaaaaaaa-0013-0013-0013-000000000013', 'GrayTide', 'red', '🚀', 0),
-  ('aaaaaaaa-0014-0014-0014-000000000014', 'HarperFrost', 'red', '🌟', 0),
-  ('aaaaaaaa-0015-0015-0015-000000000015', 'IndigoThunder', 'red', '✨', 0),
-  ('aaaaaaaa-0016-0016-0016-000000000016', 'JamieShadow', 'red', '🏃', 0),
-  ('aaaaaaaa-0017-0017-0017-000000000017', 'KaiNight', 'red', '🏃‍♂️', 0),
-  ('aaaaaaaa-0018-0018-0018-000000000018', 'LoganDawn', 'red', '🏃‍♀️', 0),
-  ('aaaaaaaa-0019-0019-0019-000000000019', 'MasonStar', 'red', '🦊', 0),
-  ('aaaaaaaa-0020-0020-0020-000000000020', 'NoahMoon', 'red', '🐺', 0),
-  ('aaaaaaaa-0021-0021-0021-000000000021', 'OliverSun', 'red', '🦅', 0),
-  ('aaaaaaaa-0022-0022-0022-000000000022', 'ParkerSky', 'red', '🐬', 0),
-  ('aaaaaaaa-0023-0023-0023-000000000023', 'ReeseCloud', 'red', '🔥', 0),
-  ('aaaaaaaa-0024-0024-0024-000000000024', 'SageStone', 'red', '💨', 0),
-  ('aaaaaaaa-0025-0025-0025-000000000025', 'SkylerSteel', 'red', '⚡', 0),
-  ('aaaaaaaa-0026-0026-0026-000000000026', 'TatumIron', 'red', '🌊', 0),
-  ('aaaaaaaa-0027-0027-0027-000000000027', 'RiverGold', 'red', '🌪️', 0),
-  ('aaaaaaaa-0028-0028-0028-000000000028', 'WinterSilver', 'red', '💎', 0),
-  ('aaaaaaaa-0029-0029-0029-000000000029', 'PhoenixBronze', 'red', '🚀', 0),
-  ('aaaaaaaa-0030-0030-0030-000000000030', 'StormCopper', 'red', '🌟', 0),
-  ('aaaaaaaa-0031-0031-0031-000000000031', 'ArrowChrome', 'red', '✨', 0),
-  ('aaaaaaaa-0032-0032-0032-000000000032', 'BlazeRunner', 'red', '🏃', 0),
-  ('aaaaaaaa-0033-0033-0033-000000000033', 'CloudDash', 'red', '🏃‍♂️', 0),
-  ('aaaaaaaa-0034-0034-0034-000000000034', 'DawnSwift', 'red', '🏃‍♀️', 0),
-  ('aaaaaaaa-0035-0035-0035-000000000035', 'EchoFlash', 'red', '🦊', 0),
-  ('aaaaaaaa-0036-0036-0036-000000000036', 'FalconBolt', 'red', '🐺', 0),
-  ('aaaaaaaa-0037-0037-0037-000000000037', 'GalaxyStride', 'red', '🦅', 0),
-  ('aaaaaaaa-0038-0038-0038-000000000038', 'HawkPace', 'red', '🐬', 0),
-  ('aaaaaaaa-0039-0039-0039-000000000039', 'IonSprint', 'red', '🔥', 0),
-  ('aaaaaaaa-0040-0040-0040-000000000040', 'JadeBlaze', 'blue', '💨', 0),
-  ('aaaaaaaa-0041-0041-0041-000000000041', 'KnightStorm', 'blue', '⚡', 0),
-  ('aaaaaaaa-0042-0042-0042-000000000042', 'LunaWind', 'blue', '🌊', 0),
-  ('aaaaaaaa-0043-0043-0043-000000000043', 'MidnightFire', 'blue', '🌪️', 0),
-  ('aaaaaaaa-0044-0044-0044-000000000044', 'NovaWave', 'blue', '💎', 0),
-  ('aaaaaaaa-0045-0045-0045-000000000045', 'OrionTide', 'blue', '🚀', 0),
-  ('aaaaaaaa-0046-0046-0046-000000000046', 'PulseFrost', 'blue', '🌟', 0),
-  ('aaaaaaaa-0047-0047-0047-000000000047', 'QuantumThunder', 'blue', '✨', 0),
-  ('aaaaaaaa-0048-0048-0048-000000000048', 'RavenShadow', 'blue', '🏃', 0),
-  ('aaaaaaaa-0049-0049-0049-000000000049', 'ShadowNight', 'blue', '🏃‍♂️', 0),
-  ('aaaaaaaa-0050-0050-0050-000000000050', 'ThunderDawn', 'blue', '🏃‍♀️', 0),
-  ('aaaaaaaa-0051-0051-0051-000000000051', 'UltraStar', 'blue', '🦊', 0),
-  ('aaaaaaaa-0052-0052-0052-000000000052', 'VegaMoon', 'blue', '🐺', 0),
-  ('aaaaaaaa-0053-0053-0053-000000000053', 'WolfSun', 'blue', '🦅', 0),
-  ('aaaaaaaa-0054-0054-0054-000000000054', 'XenonSky', 'blue', '🐬', 0),
-  ('aaaaaaaa-0055-0055-0055-000000000055', 'ZenCloud', 'blue', '🔥', 0),
-  ('aaaaaaaa-0056-0056-0056-000000000056', 'AlexStone1', 'blue', '💨', 0),
-  ('aaaaaaaa-0057-0057-0057-000000000057', 'JordanSteel1', 'blue', '⚡', 0),
-  ('aaaaaaaa-0058-0058-0058-000000000058', 'CaseyIron1', 'blue', '🌊', 0),
-  ('aaaaaaaa-0059-0059-0059-000000000059', 'RileyGold1', 'blue', '🌪️', 0),
-  ('aaaaaaaa-0060-0060-0060-000000000060', 'MorganSilver1', 'blue', '💎', 0),
-  ('aaaaaaaa-0061-0061-0061-000000000061', 'TaylorBronze1', 'blue', '🚀', 0),
-  ('aaaaaaaa-0062-0062-0062-000000000062', 'QuinnCopper1', 'blue', '🌟', 0),
-  ('aaaaaaaa-0063-0063-0063-000000000063', 'AveryChrome1', 'blue', '✨', 0),
-  ('aaaaaaaa-0064-0064-0064-000000000064', 'BlakeRunner1', 'blue', '🏃', 0),
-  ('aaaaaaaa-0065-0065-0065-000000000065', 'CameronDash1', 'blue', '🏃‍♂️', 0),
-  ('aaaaaaaa-0066-0066-0066-000000000066', 'DakotaSwift1', 'blue', '🏃‍♀️', 0),
-  ('aaaaaaaa-0067-0067-0067-000000000067', 'EmeryFlash1', 'blue', '🦊', 0),
-  ('aaaaaaaa-0068-0068-0068-000000000068', 'FinleyBolt1', 'blue', '🐺', 0),
-  ('aaaaaaaa-0069-0069-0069-000000000069', 'GrayStride1', 'blue', '🦅', 0),
-  ('aaaaaaaa-0070-0070-0070-000000000070', 'HarperPace1', 'blue', '🐬', 0),
-  ('aaaaaaaa-0071-0071-0071-000000000071', 'IndigoSprint1', 'blue', '🔥', 0),
-  ('aaaaaaaa-0072-0072-0072-000000000072', 'JamieBlaze1', 'blue', '💨', 0),
-  ('aaaaaaaa-0073-0073-0073-000000000073', 'KaiStorm1', 'blue', '⚡', 0),
-  ('aaaaaaaa-0074-0074-0074-000000000074', 'LoganWind1', 'blue', '🌊', 0),
-  ('aaaaaaaa-0075-0075-0075-000000000075', 'MasonFire1', 'blue', '🌪️', 0),
-  ('aaaaaaaa-0076-0076-0076-000000000076', 'NoahWave1', 'blue', '💎', 0),
-  ('aaaaaaaa-0077-0077-0077-000000000077', 'OliverTide1', 'blue', '🚀', 0),
-  ('aaaaaaaa-0078-0078-0078-000000000078', 'ParkerFrost1', 'blue', '🌟', 0),
-  ('aaaaaaaa-0079-0079-0079-000000000079', 'ReeseThunder1', 'blue', '✨', 0),
-  ('aaaaaaaa-0080-0080-0080-000000000080', 'SageShadow1', 'purple', '🏃', 0),
-  ('aaaaaaaa-0081-0081-0081-000000000081', 'SkylerNight1', 'purple', '🏃‍♂️', 0),
-  ('aaaaaaaa-0082-0082-0082-000000000082', 'TatumDawn1', 'purple', '🏃‍♀️', 0),
-  ('aaaaaaaa-0083-0083-0083-000000000083', 'RiverStar1', 'purple', '🦊', 0),
-  ('aaaaaaaa-0084-0084-0084-000000000084', 'WinterMoon1', 'purple', '🐺', 0),
-  ('aaaaaaaa-0085-0085-0085-000000000085', 'PhoenixSun1', 'purple', '🦅', 0),
-  ('aaaaaaaa-0086-0086-0086-000000000086', 'StormSky1', 'purple', '🐬', 0),
-  ('aaaaaaaa-0087-0087-0087-000000000087', 'ArrowCloud1', 'purple', '🔥', 0),
-  ('aaaaaaaa-0088-0088-0088-000000000088', 'BlazeStone1', 'purple', '💨', 0),
-  ('aaaaaaaa-0089-0089-0089-000000000089', 'CloudSteel1', 'purple', '⚡', 0),
-  ('aaaaaaaa-0090-0090-0090-000000000090', 'DawnIron1', 'purple', '🌊', 0),
-  ('aaaaaaaa-0091-0091-0091-000000000091', 'EchoGold1', 'purple', '🌪️', 0),
-  ('aaaaaaaa-0092-0092-0092-000000000092', 'FalconSilver1', 'purple', '💎', 0),
-  ('aaaaaaaa-0093-0093-0093-000000000093', 'GalaxyBronze1', 'purple', '🚀', 0),
-  ('aaaaaaaa-0094-0094-0094-000000000094', 'HawkCopper1', 'purple', '🌟', 0),
-  ('aaaaaaaa-0095-0095-0095-000000000095', 'IonChrome1', 'purple', '✨', 0),
-  ('aaaaaaaa-0096-0096-0096-000000000096', 'JadeRunner1', 'purple', '🏃', 0),
-  ('aaaaaaaa-0097-0097-0097-000000000097', 'KnightDash1', 'purple', '🏃‍♂️', 0),
-  ('aaaaaaaa-0098-0098-0098-000000000098', 'LunaSwift1', 'purple', '🏃‍♀️', 0),
-  ('aaaaaaaa-0099-0099-0099-000000000099', 'MidnightFlash1', 'purple', '🦊', 0)
-ON CONFLICT (id) DO UPDATE SET
-  name = EXCLUDED.name,
-  team = EXCLUDED.team,
-  avatar = EXCLUDED.avatar;
-
--- Run History (360 runs)
-INSERT INTO public.run_history (id, user_id, run_date, start_time, end_time, distance_km, duration_seconds, avg_pace_min_per_km, flip_count, flip_points, team_at_run, cv) VALUES
-  ('e6e1c69e-921e-4504-9096-07cf221cdf32', 'aaaaaaaa-0003-0003-0003-000000000003', '2026-02-04', '2026-02-04 13:04:00+00', '2026-02-04 13:56:00+00', 11.16, 3120, 4.66, 27, 108, 'red', 8.0),
-  ('e5cb8c8c-9780-4084-bb6d-b2da33cddcf8', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-02-04', '2026-02-04 18:57:00+00', '2026-02-04 19:33:58+00', 4.74, 2218, 7.8, 11, 22, 'purple', 22.3),
-  ('5ca4a099-eb42-4bcc-85b2-4f915a9d9540', 'aaaaaaaa-0035-0035-0035-000000000035', '2026-02-04', '2026-02-04 19:00:00+00', '2026-02-04 19:55:20+00', 9.59, 3320, 5.77, 21, 42, 'red', 24.9),
-  ('d59470b1-2d21-4827-9233-d17b81557076', 'aaaaaaaa-0031-0031-0031-000000000031', '2026-02-04', '2026-02-04 11:59:00+00', '2026-02-04 13:48:00+00', 14.4, 6540, 7.57, 27, 108, 'red', 8.8),
-  ('3b08941b-f98d-478e-b4a0-87bdc9b941ec', 'aaaaaaaa-0028-0028-0028-000000000028', '2026-02-04', '2026-02-04 21:15:00+00', '2026-02-04 22:18:31+00', 9.01, 3811, 7.05, 14, 14, 'red', 7.4),
-  ('61d0d97e-5b92-4f60-bc96-d8835f542909', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-02-04', '2026-02-04 17:46:00+00', '2026-02-04 18:20:50+00', 5.62, 2090, 6.2, 7, 7, 'red', 14.9),
-  ('c7ef0b2a-cf51-4796-8604-5a5d4d4c6eee', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-02-04', '2026-02-04 12:10:00+00', '2026-02-04 12:58:12+00', 6.41, 2892, 7.52, 6, 6, 'red', 8.5),
-  ('57e74d29-562a-4061-8982-a5cac5a4aed3', 'aaaaaaaa-0086-0086-0086-000000000086', '2026-02-04', '2026-02-04 15:03:00+00', '2026-02-04 15:47:59+00', 7.28, 2699, 6.18, 18, 18, 'purple', 22.0),
-  ('3ad2e1e0-8d1e-4384-9239-bf009737dcae', 'aaaaaaaa-0069-0069-0069-000000000069', '2026-02-04', '2026-02-04 07:43:00+00', '2026-02-04 07:59:21+00', 2.65, 981, 6.17, 6, 6, 'blue', 23.2),
-  ('ad7719f9-18ea-4ffb-bc34-2f558e610ea2', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-02-04', '2026-02-04 16:18:00+00', '2026-02-04 17:36:00+00', 13.2, 4680, 5.91, 19, 38, 'red', 23.7),
-  ('7f8f07e0-cce8-49f1-a397-cb90b294df2d', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-02-04', '2026-02-04 14:38:00+00', '2026-02-04 15:08:03+00', 4.05, 1803, 7.42, 10, 20, 'blue', 18.5),
-  ('79464a22-2807-4eb7-8554-b330372ce9e7', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-02-04', '2026-02-04 13:10:00+00', '2026-02-04 13:37:01+00', 4.74, 1621, 5.7, 10, 10, 'blue', 18.1),
-  ('69262764-bbf0-47b5-8ca8-cdf75bbedd93', 'aaaaaaaa-0004-0004-0004-000000000004', '2026-02-04', '2026-02-04 12:17:00+00', '2026-02-04 13:31:50+00', 11.64, 4490, 6.43, 12, 48, 'red', 12.4),
-  ('e3ecdfe6-b4a5-47f0-b111-25cc12af7110', 'aaaaaaaa-0099-0099-0099-000000000099', '2026-02-04', '2026-02-04 11:25:00+00', '2026-02-04 11:53:17+00', 4.07, 1697, 6.95, 10, 30, 'purple', 11.4),
-  ('49e63c8a-692c-4d84-b736-8cc29929f747', 'aaaaaaaa-0090-0090-0090-000000000090', '2026-02-04', '2026-02-04 16:46:00+00', '2026-02-04 17:33:12+00', 6.27, 2832, 7.53, 13, 26, 'purple', 24.3),
-  ('3d422f03-da35-4cf7-b7f4-2066a6963738', 'aaaaaaaa-0027-0027-0027-000000000027', '2026-02-04', '2026-02-04 17:35:00+00', '2026-02-04 18:48:41+00', 12.22, 4421, 6.03, 15, 45, 'red', 24.7),
-  ('a157d060-ce14-44d3-9f49-3648e592c5aa', 'aaaaaaaa-0029-0029-0029-000000000029', '2026-02-04', '2026-02-04 08:49:00+00', '2026-02-04 10:00:23+00', 12.84, 4283, 5.56, 11, 11, 'red', 7.6),
-  ('8a9377d7-0119-4940-976b-aecfc5ba4622', 'aaaaaaaa-0064-0064-0064-000000000064', '2026-02-04', '2026-02-04 20:28:00+00', '2026-02-04 21:06:33+00', 7.53, 2313, 5.12, 15, 45, 'blue', 24.1),
-  ('95e4d9a4-ce09-4b19-9bb7-23f3ce1aab00', 'aaaaaaaa-0077-0077-0077-000000000077', '2026-02-04', '2026-02-04 09:14:00+00', '2026-02-04 09:42:50+00', 5.37, 1730, 5.37, 11, 11, 'blue', 17.0),
-  ('303ab487-ad3e-4e64-8675-92fb654fcffb', 'aaaaaaaa-0092-0092-0092-000000000092', '2026-02-04', '2026-02-04 18:34:00+00', '2026-02-04 19:09:06+00', 6.98, 2106, 5.03, 15, 30, 'purple', 7.7),
-  ('01f9262e-6343-45f9-b357-c4bb0022ee37', 'aaaaaaaa-0071-0071-0071-000000000071', '2026-02-04', '2026-02-04 17:17:00+00', '2026-02-04 18:32:07+00', 11.72, 4507, 6.41, 22, 44, 'blue', 16.3),
-  ('cc2f2af2-a06c-4ec6-8c33-79fa4d96a32b', 'aaaaaaaa-0025-0025-0025-000000000025', '2026-02-04', '2026-02-04 17:45:00+00', '2026-02-04 19:12:17+00', 11.78, 5237, 7.41, 17, 68, 'red', 8.5),
-  ('af4e3a44-115c-4be5-9cfa-0b4e1fa9d80c', 'aaaaaaaa-0091-0091-0091-000000000091', '2026-02-04', '2026-02-04 21:41:00+00', '2026-02-04 22:11:05+00', 4.58, 1805, 6.57, 11, 11, 'purple', 21.3),
-  ('002b97ae-9e72-4f96-83f6-c3ffcaa6196c', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-02-04', '2026-02-04 13:56:00+00', '2026-02-04 14:44:06+00', 6.44, 2886, 7.47, 13, 13, 'blue', 21.1),
-  ('5cd1ec21-e9f4-4b09-bea2-5c165299f015', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-02-04', '2026-02-04 18:31:00+00', '2026-02-04 19:27:02+00', 7.86, 3362, 7.13, 17, 17, 'purple', 15.5),
-  ('42a87cab-225b-4734-9c5c-ffc93c1ce4d9', 'aaaaaaaa-0057-0057-0057-000000000057', '2026-02-04', '2026-02-04 11:20:00+00', '2026-02-04 12:09:14+00', 9.22, 2954, 5.34, 11, 11, 'blue', 13.5),
-  ('ba272bc7-1f53-4556-b1c0-db87c0d2fd31', 'aaaaaaaa-0097-0097-0097-000000000097', '2026-02-04', '2026-02-04 08:53:00+00', '2026-02-04 09:15:38+00', 3.55, 1358, 6.38, 6, 12, 'purple', 19.8),
-  ('9d347485-50eb-44e0-b7f1-b886892d3184', 'aaaaaaaa-0000-0000-0000-000000000000', '2026-02-04', '2026-02-04 20:30:00+00', '2026-02-04 20:53:57+00', 4.52, 1437, 5.3, 5, 15, 'red', 6.9),
-  ('bd7f0975-d033-462e-9450-e6f6e9ff9384', 'aaaaaaaa-0020-0020-0020-000000000020', '2026-02-04', '2026-02-04 19:58:00+00', '2026-02-04 20:37:48+00', 7.73, 2388, 5.15, 11, 44, 'red', 4.1),
-  ('35442ea5-65e6-4bc6-9d66-cc3a6fdcc869', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-02-04', '2026-02-04 12:18:00+00', '2026-02-04 13:16:16+00', 7.76, 3496, 7.51, 15, 15, 'purple', 24.8),
-  ('4a6227c0-ddf1-4980-9218-7372eb7966fd', 'aaaaaaaa-0043-0043-0043-000000000043', '2026-02-04', '2026-02-04 15:38:00+00', '2026-02-04 16:55:52+00', 11.19, 4672, 6.96, 18, 36, 'blue', 13.0),
-  ('b158820f-62c3-4880-a57b-2447b694087f', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-02-04', '2026-02-04 20:05:00+00', '2026-02-04 20:30:18+00', 5.25, 1518, 4.82, 7, 21, 'blue', 24.2),
-  ('8f40ac41-a5b0-420f-862e-5b78586d5cb2', 'aaaaaaaa-0019-0019-0019-000000000019', '2026-02-04', '2026-02-04 06:12:00+00', '2026-02-04 07:00:05+00', 8.11, 2885, 5.93, 13, 52, 'red', 10.1),
-  ('ba0dff69-be40-4c45-9bd6-4046c92825fa', 'aaaaaaaa-0084-0084-0084-000000000084', '2026-02-04', '2026-02-04 08:41:00+00', '2026-02-04 09:39:22+00', 8.74, 3502, 6.68, 14, 28, 'purple', 14.0),
-  ('b5f082fa-5215-406c-b6d2-b8341740d44a', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-02-04', '2026-02-04 12:36:00+00', '2026-02-04 13:55:59+00', 12.82, 4799, 6.24, 22, 22, 'purple', 18.8),
-  ('9e6cd090-b227-4d4b-8605-861724240d4e', 'aaaaaaaa-0093-0093-0093-000000000093', '2026-02-04', '2026-02-04 09:04:00+00', '2026-02-04 09:56:21+00', 6.98, 3141, 7.5, 9, 18, 'purple', 12.0),
-  ('c597a012-dc74-4cf0-8ee9-be01d6bfe6b7', 'aaaaaaaa-0085-0085-0085-000000000085', '2026-02-04', '2026-02-04 15:50:00+00', '2026-02-04 16:53:54+00', 8.1, 3834, 7.89, 7, 7, 'purple', 10.4),
-  ('2522e322-e52d-4b4d-a749-127f8274c6e0', 'aaaaaaaa-0024-0024-0024-000000000024', '2026-02-04', '2026-02-04 07:39:00+00', '2026-02-04 07:54:41+00', 2.73, 941, 5.75, 3, 6, 'red', 12.5),
-  ('429879d3-cf04-4fa9-a0a8-9e9f8ea9d0bf', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-02-04', '2026-02-04 13:00:00+00', '2026-02-04 14:28:50+00', 13.32, 5330, 6.67, 28, 112, 'red', 8.3),
-  ('7e1e44dd-5d50-4c74-a0b0-a42d3fd8e328', 'aaaaaaaa-0022-0022-0022-000000000022', '2026-02-04', '2026-02-04 21:32:00+00', '2026-02-04 22:36:35+00', 9.36, 3875, 6.9, 13, 39, 'red', 19.4),
-  ('2c7db1fe-4f99-4d60-ab4a-f628b5d6ade4', 'aaaaaaaa-0070-0070-0070-000000000070', '2026-02-04', '2026-02-04 18:07:00+00', '2026-02-04 19:49:51+00', 13.88, 6171, 7.41, 29, 58, 'blue', 8.7),
-  ('d5f39af0-84f7-4400-8263-0733e64fed97', 'aaaaaaaa-0060-0060-0060-000000000060', '2026-02-04', '2026-02-04 18:37:00+00', '2026-02-04 19:06:50+00', 3.82, 1790, 7.81, 4, 12, 'blue', 9.7),
-  ('d82634da-ebdc-4e5e-8224-5da4c91cb4b8', 'aaaaaaaa-0038-0038-0038-000000000038', '2026-02-04', '2026-02-04 11:37:00+00', '2026-02-04 12:35:42+00', 11.65, 3522, 5.04, 20, 20, 'red', 12.1),
-  ('c2d064d6-4558-44b3-8315-e7be99f18d95', 'aaaaaaaa-0016-0016-0016-000000000016', '2026-02-04', '2026-02-04 15:01:00+00', '2026-02-04 15:37:16+00', 4.81, 2176, 7.54, 6, 12, 'red', 10.2),
-  ('9e954cb6-3145-4bdc-8056-1553f33aac7c', 'aaaaaaaa-0051-0051-0051-000000000051', '2026-02-04', '2026-02-04 12:39:00+00', '2026-02-04 12:58:59+00', 4.27, 1199, 4.68, 7, 21, 'blue', 19.3),
-  ('0faf1252-4bc4-44dc-808e-274684ad2821', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-02-04', '2026-02-04 18:43:00+00', '2026-02-04 19:01:32+00', 2.56, 1112, 7.24, 2, 8, 'red', 22.1),
-  ('a07c8731-8aa1-4a28-b1a1-a6b68fd3e7d7', 'aaaaaaaa-0046-0046-0046-000000000046', '2026-02-04', '2026-02-04 15:24:00+00', '2026-02-04 15:47:45+00', 3.4, 1425, 6.99, 7, 21, 'blue', 12.8),
-  ('5a64acdd-546b-4486-8c57-9350046e5e1e', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-02-04', '2026-02-04 08:26:00+00', '2026-02-04 10:00:57+00', 14.93, 5697, 6.36, 32, 96, 'purple', 13.0),
-  ('e2dfa4dc-8159-4d81-8800-23b608b2e708', 'aaaaaaaa-0034-0034-0034-000000000034', '2026-02-04', '2026-02-04 13:36:00+00', '2026-02-04 14:21:04+00', 6.6, 2704, 6.83, 10, 10, 'red', 19.5),
-  ('0b7858a5-12b2-4d8b-b492-5c1815703890', 'aaaaaaaa-0007-0007-0007-000000000007', '2026-02-04', '2026-02-04 07:09:00+00', '2026-02-04 07:38:38+00', 4.94, 1778, 6.0, 7, 28, 'red', 15.3),
-  ('7274c436-14fd-4d07-885a-4adfa93b3007', 'aaaaaaaa-0062-0062-0062-000000000062', '2026-02-04', '2026-02-04 20:33:00+00', '2026-02-04 22:04:52+00', 11.63, 5512, 7.9, 26, 52, 'blue', 5.0),
-  ('427e1e33-e238-4d45-947d-29bb049363da', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-02-04', '2026-02-04 07:55:00+00', '2026-02-04 08:44:43+00', 10.67, 2983, 4.66, 10, 40, 'red', 11.7),
-  ('7f76fb4e-32b3-441f-bb87-8964f00b3d74', 'aaaaaaaa-0068-0068-0068-000000000068', '2026-02-04', '2026-02-04 07:25:00+00', '2026-02-04 08:01:25+00', 6.07, 2185, 6.0, 12, 36, 'blue', 11.9),
-  ('5ab41a80-2d14-4337-943a-98c03d234770', 'aaaaaaaa-0018-0018-0018-000000000018', '2026-02-04', '2026-02-04 16:32:00+00', '2026-02-04 18:06:42+00', 13.32, 5682, 7.11, 20, 20, 'red', 7.9),
-  ('2e3d1b08-7896-41e2-8b61-76d2085ba378', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-02-04', '2026-02-04 06:28:00+00', '2026-02-04 06:46:06+00', 2.96, 1086, 6.12, 6, 12, 'blue', 3.8),
-  ('1c65aa70-570a-4de9-8f10-68c5207935f5', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-02-04', '2026-02-04 15:05:00+00', '2026-02-04 16:34:49+00', 13.82, 5389, 6.5, 16, 32, 'red', 7.1),
-  ('9568397e-a761-4c3e-9438-a720ce9cae1c', 'aaaaaaaa-0023-0023-0023-000000000023', '2026-02-04', '2026-02-04 09:04:00+00', '2026-02-04 09:51:48+00', 9.58, 2868, 4.99, 10, 20, 'red', 10.7),
-  ('cc56b327-e05e-4dce-8237-0273aac00128', 'aaaaaaaa-0036-0036-0036-000000000036', '2026-02-04', '2026-02-04 12:28:00+00', '2026-02-04 13:10:28+00', 5.85, 2548, 7.26, 5, 15, 'red', 14.2),
-  ('2f94d887-373f-4c48-9be4-5e75ea7b144e', 'aaaaaaaa-0012-0012-0012-000000000012', '2026-02-04', '2026-02-04 14:05:00+00', '2026-02-04 15:15:52+00', 9.94, 4252, 7.13, 4, 4, 'red', 20.2),
-  ('8d312d20-b92e-4dec-aaf0-a0648bb9b703', 'aaaaaaaa-0034-0034-0034-000000000034', '2026-02-05', '2026-02-05 16:15:00+00', '2026-02-05 17:21:31+00', 10.22, 3991, 6.51, 7, 7, 'red', 18.8),
-  ('c1834bdb-8af3-4c77-8451-4ca589d1db0e', 'aaaaaaaa-0057-0057-0057-000000000057', '2026-02-05', '2026-02-05 06:55:00+00', '2026-02-05 08:12:15+00', 11.53, 4635, 6.7, 25, 50, 'blue', 20.0),
-  ('dba6d380-b439-42f2-b5f0-1e80e548aedd', 'aaaaaaaa-0065-0065-0065-000000000065', '2026-02-05', '2026-02-05 19:22:00+00', '2026-02-05 20:19:26+00', 10.52, 3446, 5.46, 14, 14, 'blue', 20.6),
-  ('53e3659e-f666-4bcb-a939-e5f9d2c259f6', 'aaaaaaaa-0018-0018-0018-000000000018', '2026-02-05', '2026-02-05 09:43:00+00', '2026-02-05 10:37:58+00', 7.81, 3298, 7.04, 8, 8, 'red', 23.1),
-  ('9b223863-589d-4b5e-bb23-bd580c965deb', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-02-05', '2026-02-05 19:13:00+00', '2026-02-05 19:58:31+00', 7.85, 2731, 5.8, 13, 39, 'blue', 12.8),
-  ('98ca45fa-1566-4e6f-b6c2-4b405b01a21d', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-02-05', '2026-02-05 17:45:00+00', '2026-02-05 19:07:13+00', 14.95, 4933, 5.5, 19, 57, 'red', 23.2),
-  ('546e8237-7a11-4be2-a02d-3210f44af0bb', 'aaaaaaaa-0028-0028-0028-000000000028', '2026-02-05', '2026-02-05 13:08:00+00', '2026-02-05 14:19:57+00', 11.35, 4317, 6.34, 7, 14, 'red', 19.9),
-  ('e318d98c-f0b5-437b-8898-19d5d51a5419', 'aaaaaaaa-0098-0098-0098-000000000098', '2026-02-05', '2026-02-05 06:10:00+00', '2026-02-05 07:17:21+00', 10.13, 4041, 6.65, 24, 72, 'purple', 5.1),
-  ('d68d4426-f694-42b1-a220-b48b65c9138f', 'aaaaaaaa-0044-0044-0044-000000000044', '2026-02-05', '2026-02-05 17:55:00+00', '2026-02-05 18:42:43+00', 7.71, 2863, 6.19, 13, 26, 'blue', 7.5),
-  ('72edf1c4-bf25-436c-9552-366a16993b98', 'aaaaaaaa-0003-0003-0003-000000000003', '2026-02-05', '2026-02-05 05:54:00+00', '2026-02-05 06:47:42+00', 10.0, 3222, 5.37, 15, 45, 'red', 22.0),
-  ('ce05b88b-bbea-4642-a0b1-f9aeb0d47b87', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-02-05', '2026-02-05 14:04:00+00', '2026-02-05 14:20:53+00', 3.4, 1013, 4.97, 5, 10, 'blue', 8.8),
-  ('57cd6880-1004-48cc-a195-e12561f27071', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-02-05', '2026-02-05 15:51:00+00', '2026-02-05 16:33:40+00', 7.02, 2560, 6.08, 10, 20, 'red', 15.1),
-  ('5c5a37a2-6ade-49f8-80ee-e821ad76448b', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-02-05', '2026-02-05 14:50:00+00', '2026-02-05 15:39:46+00', 8.16, 2986, 6.1, 16, 48, 'blue', 16.3),
-  ('336992a6-175e-4763-bdc3-918a1fb48fed', 'aaaaaaaa-0064-0064-0064-000000000064', '2026-02-05', '2026-02-05 15:11:00+00', '2026-02-05 16:54:17+00', 13.68, 6197, 7.55, 25, 50, 'blue', 16.8),
-  ('6958833c-c7fc-4af6-b2d5-f452d1519063', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-02-05', '2026-02-05 17:52:00+00', '2026-02-05 18:42:49+00', 7.98, 3049, 6.37, 6, 12, 'blue', 15.0),
-  ('b8c3dfd0-77ad-4765-b9ca-fcfaac3d8e0c', 'aaaaaaaa-0030-0030-0030-000000000030', '2026-02-05', '2026-02-05 06:42:00+00', '2026-02-05 07:28:47+00', 6.49, 2807, 7.21, 9, 18, 'red', 6.2),
-  ('cfc2226a-8caa-41c3-8892-85114f5c1038', 'aaaaaaaa-0049-0049-0049-000000000049', '2026-02-05', '2026-02-05 08:59:00+00', '2026-02-05 10:11:50+00', 13.77, 4370, 5.29, 21, 63, 'blue', 8.1),
-  ('b37878cb-b4e8-4ffa-a2f7-33e39e880739', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-02-05', '2026-02-05 13:21:00+00', '2026-02-05 14:42:17+00', 14.78, 4877, 5.5, 24, 96, 'red', 24.8),
-  ('a193d549-5160-4c0a-8150-937a1c79765d', 'aaaaaaaa-0085-0085-0085-000000000085', '2026-02-05', '2026-02-05 09:29:00+00', '2026-02-05 10:10:41+00', 5.93, 2501, 7.03, 14, 28, 'purple', 3.3),
-  ('bfc09327-32dd-4aa1-aab7-3957b89a816a', 'aaaaaaaa-0093-0093-0093-000000000093', '2026-02-05', '2026-02-05 09:32:00+00', '2026-02-05 10:49:35+00', 11.72, 4655, 6.62, 27, 54, 'purple', 12.1),
-  ('e1acd5a4-8023-4a88-a202-ddfe72be37da', 'aaaaaaaa-0090-0090-0090-000000000090', '2026-02-05', '2026-02-05 10:49:00+00', '2026-02-05 11:36:52+00', 7.4, 2872, 6.47, 12, 24, 'purple', 15.3),
-  ('7be9ed31-2b82-4092-b0e9-a33bf5620e2f', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-02-05', '2026-02-05 10:34:00+00', '2026-02-05 10:59:22+00', 3.76, 1522, 6.75, 6, 6, 'blue', 19.0),
-  ('5298adeb-48d0-4696-8063-22edcbcac82e', 'aaaaaaaa-0012-0012-0012-000000000012', '2026-02-05', '2026-02-05 05:15:00+00', '2026-02-05 05:50:11+00', 7.11, 2111, 4.95, 15, 60, 'red', 24.5),
-  ('89643cde-5d3c-46be-a2bd-6514e7b64cc0', 'aaaaaaaa-0042-0042-0042-000000000042', '2026-02-05', '2026-02-05 14:14:00+00', '2026-02-05 14:36:41+00', 4.68, 1361, 4.85, 7, 21, 'blue', 3.7),
-  ('cff20b78-0824-4535-ac72-4b2b32eb3cbf', 'aaaaaaaa-0096-0096-0096-000000000096', '2026-02-05', '2026-02-05 09:51:00+00', '2026-02-05 11:20:01+00', 12.61, 5341, 7.06, 23, 69, 'purple', 10.0),
-  ('abeb707d-5720-4b89-af57-f59e89deca20', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-02-05', '2026-02-05 11:51:00+00', '2026-02-05 12:28:41+00', 8.02, 2261, 4.7, 16, 16, 'red', 12.1),
-  ('e8384b2b-ee84-4f86-b76a-46005678e789', 'aaaaaaaa-0004-0004-0004-000000000004', '2026-02-05', '2026-02-05 16:20:00+00', '2026-02-05 17:43:46+00', 11.9, 5026, 7.04, 18, 36, 'red', 15.3),
-  ('0666fcfe-614a-44cf-af4e-2e766f5026a1', 'aaaaaaaa-0036-0036-0036-000000000036', '2026-02-05', '2026-02-05 20:46:00+00', '2026-02-05 21:33:44+00', 7.38, 2864, 6.47, 6, 18, 'red', 7.9),
-  ('b734416e-d5be-4524-a355-ce0affc17a13', 'aaaaaaaa-0060-0060-0060-000000000060', '2026-02-05', '2026-02-05 20:01:00+00', '2026-02-05 21:05:18+00', 10.34, 3858, 6.22, 18, 54, 'blue', 6.7),
-  ('1ce18960-6d7f-48da-994a-2efd6ae1cd44', 'aaaaaaaa-0074-0074-0074-000000000074', '2026-02-05', '2026-02-05 18:51:00+00', '2026-02-05 19:04:26+00', 2.09, 806, 6.43, 5, 15, 'blue', 3.3),
-  ('2eba22d5-a05e-40de-943d-10f147a16ef5', 'aaaaaaaa-0071-0071-0071-000000000071', '2026-02-05', '2026-02-05 06:14:00+00', '2026-02-05 07:26:56+00', 14.22, 4376, 5.13, 23, 69, 'blue', 23.2),
-  ('b5e5d796-2f39-4cfd-b2ac-b4933253cedd', 'aaaaaaaa-0092-0092-0092-000000000092', '2026-02-05', '2026-02-05 09:48:00+00', '2026-02-05 10:23:48+00', 4.75, 2148, 7.54, 11, 11, 'purple', 22.5),
-  ('de7179e6-81bb-4c4f-a26f-1cf854dbaad8', 'aaaaaaaa-0000-0000-0000-000000000000', '2026-02-05', '2026-02-05 07:49:00+00', '2026-02-05 09:22:22+00', 12.67, 5602, 7.37, 19, 76, 'red', 23.4),
-  ('7337d414-3912-4060-9a9b-690c4bfe3414', 'aaaaaaaa-0082-0082-0082-000000000082', '2026-02-05', '2026-02-05 16:35:00+00', '2026-02-05 17:48:11+00', 10.04, 4391, 7.29, 23, 23, 'purple', 18.7),
-  ('bf0b1820-24bd-4dbb-8140-abfd8d104416', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-02-05', '2026-02-05 17:10:00+00', '2026-02-05 17:31:09+00', 3.21, 1269, 6.59, 5, 10, 'red', 10.1),
-  ('0a5ebea8-5f00-4c0e-a339-9617847828ef', 'aaaaaaaa-0032-0032-0032-000000000032', '2026-02-05', '2026-02-05 12:46:00+00', '2026-02-05 13:07:05+00', 3.8, 1265, 5.55, 6, 18, 'red', 13.8),
-  ('03f3fc2b-1c6d-4fd1-be56-e69005e3200a', 'aaaaaaaa-0027-0027-0027-000000000027', '2026-02-05', '2026-02-05 17:23:00+00', '2026-02-05 18:29:39+00', 10.13, 3999, 6.58, 12, 36, 'red', 7.3),
-  ('4c544369-b9f1-4b29-a50c-e84c7efe0faf', 'aaaaaaaa-0089-0089-0089-000000000089', '2026-02-05', '2026-02-05 07:52:00+00', '2026-02-05 08:14:30+00', 3.48, 1350, 6.47, 5, 15, 'purple', 16.0),
-  ('1f129e4a-f5cb-4a28-99a9-aec4f1436d4f', 'aaaaaaaa-0009-0009-0009-000000000009', '2026-02-05', '2026-02-05 19:23:00+00', '2026-02-05 20:57:47+00', 13.02, 5687, 7.28, 13, 26, 'red', 17.8),
-  ('2cbbef11-0775-4ccf-824c-a5d39e7a9cc7', 'aaaaaaaa-0035-0035-0035-000000000035', '2026-02-05', '2026-02-05 16:30:00+00', '2026-02-05 17:20:58+00', 7.08, 3058, 7.2, 9, 36, 'red', 15.9),
-  ('f1e7faea-357e-471a-b179-e312f01cc6ef', 'aaaaaaaa-0046-0046-0046-000000000046', '2026-02-05', '2026-02-05 12:33:00+00', '2026-02-05 12:55:59+00', 3.27, 1379, 7.03, 7, 21, 'blue', 13.0),
-  ('0097c22c-1897-4666-a4d4-771b41b1402d', 'aaaaaaaa-0038-0038-0038-000000000038', '2026-02-05', '2026-02-05 17:00:00+00', '2026-02-05 17:21:36+00', 4.27, 1296, 5.06, 3, 12, 'red', 15.3),
-  ('7c547285-779d-4e83-afe7-d85dc25f251b', 'aaaaaaaa-0033-0033-0033-000000000033', '2026-02-05', '2026-02-05 08:11:00+00', '2026-02-05 09:09:15+00', 11.16, 3495, 5.22, 9, 27, 'red', 19.6),
-  ('739b0ada-b7ef-4854-80f4-b0d0d6044d92', 'aaaaaaaa-0063-0063-0063-000000000063', '2026-02-05', '2026-02-05 20:08:00+00', '2026-02-05 20:42:10+00', 6.85, 2050, 4.99, 14, 14, 'blue', 11.5),
-  ('e38689a7-568b-4431-838b-b645d93b12a8', 'aaaaaaaa-0007-0007-0007-000000000007', '2026-02-05', '2026-02-05 13:14:00+00', '2026-02-05 13:40:30+00', 4.54, 1590, 5.84, 7, 7, 'red', 15.4),
-  ('8e8f373c-20f7-4a8d-b9bc-465046afc549', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-02-05', '2026-02-05 19:55:00+00', '2026-02-05 20:40:45+00', 8.99, 2745, 5.09, 17, 17, 'purple', 13.1),
-  ('1aa81bb2-c73a-4fdd-803a-4d013e7611af', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-02-05', '2026-02-05 13:40:00+00', '2026-02-05 15:27:34+00', 14.92, 6454, 7.21, 31, 93, 'blue', 8.2),
-  ('ade1297b-87af-425d-b08d-ae20c4f32550', 'aaaaaaaa-0015-0015-0015-000000000015', '2026-02-05', '2026-02-05 13:20:00+00', '2026-02-05 14:04:52+00', 7.38, 2692, 6.08, 9, 36, 'red', 16.9),
-  ('3b2db3a4-6894-46cb-829f-a3c111405aea', 'aaaaaaaa-0019-0019-0019-000000000019', '2026-02-05', '2026-02-05 08:00:00+00', '2026-02-05 09:12:32+00', 12.77, 4352, 5.68, 13, 13, 'red', 15.7),
-  ('b4c1ede6-445d-4459-85ec-75e21ba4f0cd', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-02-05', '2026-02-05 08:06:00+00', '2026-02-05 08:28:45+00', 4.77, 1365, 4.77, 10, 10, 'purple', 16.1),
-  ('01efd0d1-50a5-42ef-afc2-74c279671b44', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-02-05', '2026-02-05 09:48:00+00', '2026-02-05 10:34:00+00', 6.07, 2760, 7.58, 11, 11, 'blue', 6.0),
-  ('ddc54a19-1a81-4a3e-b35f-e303e41e6676', 'aaaaaaaa-0052-0052-0052-000000000052', '2026-02-05', '2026-02-05 05:54:00+00', '2026-02-05 06:19:24+00', 3.6, 1524, 7.06, 4, 8, 'blue', 10.7),
-  ('5f943211-0bc7-4a20-975e-900a30951b48', 'aaaaaaaa-0026-0026-0026-000000000026', '2026-02-05', '2026-02-05 21:18:00+00', '2026-02-05 22:56:29+00', 13.01, 5909, 7.57, 17, 68, 'red', 7.5),
-  ('3e9f30e1-1ada-4c2a-8865-29fa69336c12', 'aaaaaaaa-0078-0078-0078-000000000078', '2026-02-05', '2026-02-05 06:19:00+00', '2026-02-05 07:22:33+00', 10.17, 3813, 6.25, 16, 48, 'blue', 12.1),
-  ('5364f622-4f00-4497-ada6-a79fa4a23427', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-02-05', '2026-02-05 20:54:00+00', '2026-02-05 22:06:29+00', 10.66, 4349, 6.8, 14, 14, 'red', 6.9),
-  ('05d5572d-409a-48ae-bbf1-34809da27bdf', 'aaaaaaaa-0029-0029-0029-000000000029', '2026-02-05', '2026-02-05 16:07:00+00', '2026-02-05 17:01:15+00', 9.37, 3255, 5.79, 9, 9, 'red', 8.6),
-  ('8a8114ba-0d6f-45d3-8f53-7f022cac6c65', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-02-05', '2026-02-05 12:09:00+00', '2026-02-05 13:14:20+00', 8.53, 3920, 7.66, 14, 14, 'blue', 6.9),
-  ('b5d70cb8-40b6-48fe-8ac3-bd3d395972c8', 'aaaaaaaa-0087-0087-0087-000000000087', '2026-02-05', '2026-02-05 14:06:00+00', '2026-02-05 14:18:21+00', 2.08, 741, 5.94, 5, 15, 'purple', 8.1),
-  ('5cd277aa-079d-4c68-b6b1-5b331ead4d6b', 'aaaaaaaa-0031-0031-0031-000000000031', '2026-02-05', '2026-02-05 21:08:00+00', '2026-02-05 21:45:04+00', 4.67, 2224, 7.94, 6, 6, 'red', 12.2),
-  ('1c4be63c-cc94-457b-a48c-4651c47536b6', 'aaaaaaaa-0058-0058-0058-000000000058', '2026-02-05', '2026-02-05 16:49:00+00', '2026-02-05 17:49:26+00', 10.28, 3626, 5.88, 14, 42, 'blue', 16.0),
-  ('8456de68-046b-4d97-a665-b29a382ee50b', 'aaaaaaaa-0099-0099-0099-000000000099', '2026-02-05', '2026-02-05 21:03:00+00', '2026-02-05 21:29:13+00', 4.7, 1573, 5.58, 10, 20, 'purple', 8.8),
-  ('61a0adbf-87e6-4aca-99d2-25efbc69a387', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-02-05', '2026-02-05 08:02:00+00', '2026-02-05 09:00:25+00', 10.8, 3505, 5.41, 15, 45, 'red', 24.8),
-  ('f0109557-2402-4d63-846d-466dc32be6d1', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-02-06', '2026-02-06 11:53:00+00', '2026-02-06 12:33:11+00', 5.46, 2411, 7.36, 6, 12, 'red', 23.2),
-  ('b9afe450-0735-4110-bcb7-b29b123e7162', 'aaaaaaaa-0021-0021-0021-000000000021', '2026-02-06', '2026-02-06 15:11:00+00', '2026-02-06 17:03:38+00', 14.84, 6758, 7.59, 13, 52, 'red', 13.8),
-  ('c9857059-e402-44bf-b879-d0d9a649addc', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-02-06', '2026-02-06 13:13:00+00', '2026-02-06 14:25:23+00', 11.19, 4343, 6.47, 23, 23, 'blue', 22.6),
-  ('f0199529-b5a6-4dcd-994a-caed4338931b', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-02-06', '2026-02-06 12:10:00+00', '2026-02-06 12:34:50+00', 5.24, 1490, 4.74, 5, 10, 'blue', 8.6),
-  ('62058621-7849-4df9-b6a6-b2fc974a8743', 'aaaaaaaa-0092-0092-0092-000000000092', '2026-02-06', '2026-02-06 10:03:00+00', '2026-02-06 11:00:27+00', 7.87, 3447, 7.3, 19, 38, 'purple', 3.7),
-  ('9c6b2c45-e165-47a3-a3b1-9c3cc7c24436', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-02-06', '2026-02-06 20:09:00+00', '2026-02-06 20:26:19+00', 3.32, 1039, 5.22, 3, 6, 'blue', 7.2),
-  ('7e3e2a25-ab9b-4639-a982-0a5ca2a2a4bb', 'aaaaaaaa-0063-0063-0063-000000000063', '2026-02-06', '2026-02-06 14:05:00+00', '2026-02-06 14:17:13+00', 2.71, 733, 4.51, 3, 3, 'blue', 4.9),
-  ('2fd5c990-fe12-4785-ac78-cd22c0638dc2', 'aaaaaaaa-0003-0003-0003-000000000003', '2026-02-06', '2026-02-06 18:48:00+00', '2026-02-06 19:27:59+00', 8.16, 2399, 4.9, 12, 36, 'red', 20.3),
-  ('cd432a11-70b5-497d-8d18-ba2f12159893', 'aaaaaaaa-0048-0048-0048-000000000048', '2026-02-06', '2026-02-06 18:12:00+00', '2026-02-06 19:14:16+00', 9.67, 3736, 6.44, 15, 45, 'blue', 21.5),
-  ('06f1961f-9a1e-4af8-8737-51038b4c5b3d', 'aaaaaaaa-0087-0087-0087-000000000087', '2026-02-06', '2026-02-06 17:02:00+00', '2026-02-06 18:42:13+00', 14.96, 6013, 6.7, 31, 93, 'purple', 21.4),
-  ('ac59b6fa-8d09-49ae-b840-5b83e65275e2', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-02-06', '2026-02-06 07:12:00+00', '2026-02-06 08:06:11+00', 7.15, 3251, 7.58, 14, 42, 'blue', 18.2),
-  ('2bd0745a-ccc9-43c2-8451-2f737fb53706', 'aaaaaaaa-0022-0022-0022-000000000022', '2026-02-06', '2026-02-06 06:58:00+00', '2026-02-06 07:57:35+00', 7.74, 3575, 7.7, 12, 48, 'red', 12.0),
-  ('8fedc8ca-7b2a-4ee1-916d-2a3ed7fb40a2', 'aaaaaaaa-0045-0045-0045-000000000045', '2026-02-06', '2026-02-06 13:47:00+00', '2026-02-06 14:21:44+00', 6.68, 2084, 5.2, 9, 9, 'blue', 11.1),
-  ('de10be52-5d5e-47cc-8184-ddf568750fbd', 'aaaaaaaa-0027-0027-0027-000000000027', '2026-02-06', '2026-02-06 14:19:00+00', '2026-02-06 15:20:41+00', 12.8, 3701, 4.82, 23, 69, 'red', 3.6),
-  ('fdada846-e7be-4228-a63c-33e9a023030a', 'aaaaaaaa-0023-0023-0023-000000000023', '2026-02-06', '2026-02-06 10:53:00+00', '2026-02-06 12:00:28+00', 10.9, 4048, 6.19, 17, 51, 'red', 10.4),
-  ('fdafa32d-dbd4-46dc-a7cd-b95b45500085', 'aaaaaaaa-0035-0035-0035-000000000035', '2026-02-06', '2026-02-06 18:03:00+00', '2026-02-06 19:11:02+00', 10.55, 4082, 6.45, 12, 36, 'red', 9.5),
-  ('376b7422-0a69-4bfe-865f-1008763c7f75', 'aaaaaaaa-0084-0084-0084-000000000084', '2026-02-06', '2026-02-06 05:57:00+00', '2026-02-06 07:03:59+00', 13.32, 4019, 5.03, 28, 56, 'purple', 24.8),
-  ('6957987f-3390-41b8-b074-9d84eac53264', 'aaaaaaaa-0057-0057-0057-000000000057', '2026-02-06', '2026-02-06 19:46:00+00', '2026-02-06 20:31:55+00', 6.19, 2755, 7.42, 13, 26, 'blue', 7.2),
-  ('e1c75e36-9af6-4ba7-9057-cba6bf49e2f9', 'aaaaaaaa-0019-0019-0019-000000000019', '2026-02-06', '2026-02-06 06:42:00+00', '2026-02-06 07:37:27+00', 8.76, 3327, 6.33, 12, 12, 'red', 12.5),
-  ('9099dfc9-19de-4686-89ec-5479dd63620b', 'aaaaaaaa-0004-0004-0004-000000000004', '2026-02-06', '2026-02-06 11:44:00+00', '2026-02-06 12:09:20+00', 3.41, 1520, 7.43, 3, 6, 'red', 4.1),
-  ('392322e2-8d2e-4556-aca2-31ae845b40f5', 'aaaaaaaa-0078-0078-0078-000000000078', '2026-02-06', '2026-02-06 05:42:00+00', '2026-02-06 06:31:25+00', 10.91, 2965, 4.53, 22, 22, 'blue', 12.3),
-  ('4d2e87a1-f780-4c16-a11e-5ea0518803d1', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-02-06', '2026-02-06 12:29:00+00', '2026-02-06 12:44:27+00', 3.16, 927, 4.89, 4, 12, 'blue', 15.6),
-  ('e3f77653-58da-40d0-b934-d667140d255d', 'aaaaaaaa-0031-0031-0031-000000000031', '2026-02-06', '2026-02-06 10:06:00+00', '2026-02-06 11:28:16+00', 14.85, 4936, 5.54, 22, 22, 'red', 13.2),
-  ('9807a963-56dc-4840-955d-836bcd0b0a2b', 'aaaaaaaa-0037-0037-0037-000000000037', '2026-02-06', '2026-02-06 15:33:00+00', '2026-02-06 16:21:41+00', 7.41, 2921, 6.57, 8, 16, 'red', 20.6),
-  ('1af879d0-ac93-4586-b46a-d7676acc4167', 'aaaaaaaa-0093-0093-0093-000000000093', '2026-02-06', '2026-02-06 17:25:00+00', '2026-02-06 18:26:09+00', 8.8, 3669, 6.95, 21, 63, 'purple', 5.1),
-  ('c60ea98b-dbc5-4a59-9c06-5df8ecbb1795', 'aaaaaaaa-0052-0052-0052-000000000052', '2026-02-06', '2026-02-06 08:48:00+00', '2026-02-06 09:48:19+00', 12.62, 3619, 4.78, 25, 25, 'blue', 12.8),
-  ('11d189f8-86b5-470a-b98d-97d49672d955', 'aaaaaaaa-0070-0070-0070-000000000070', '2026-02-06', '2026-02-06 21:08:00+00', '2026-02-06 21:55:40+00', 10.57, 2860, 4.51, 16, 48, 'blue', 10.8),
-  ('9d2729f4-6ebd-4f92-8bde-5e99db62acc8', 'aaaaaaaa-0061-0061-0061-000000000061', '2026-02-06', '2026-02-06 09:45:00+00', '2026-02-06 10:50:40+00', 14.53, 3940, 4.52, 18, 54, 'blue', 19.2),
-  ('13c2c9a3-c772-4470-b5a5-b787f1e45061', 'aaaaaaaa-0007-0007-0007-000000000007', '2026-02-06', '2026-02-06 11:48:00+00', '2026-02-06 13:10:01+00', 10.45, 4921, 7.85, 13, 39, 'red', 14.1),
-  ('56fcc19f-9e55-481c-acb9-5f1942b37be2', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-02-06', '2026-02-06 19:11:00+00', '2026-02-06 20:03:04+00', 9.04, 3124, 5.76, 10, 30, 'red', 13.0),
-  ('52291811-fb9c-4bad-932d-92849bc411e1', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-02-06', '2026-02-06 15:21:00+00', '2026-02-06 16:31:21+00', 14.78, 4221, 4.76, 32, 32, 'purple', 24.2),
-  ('fc694b6f-9303-4ef9-98dc-85d36b684101', 'aaaaaaaa-0049-0049-0049-000000000049', '2026-02-06', '2026-02-06 21:52:00+00', '2026-02-06 22:27:11+00', 6.69, 2111, 5.26, 9, 9, 'blue', 19.6),
-  ('8bb65c21-5694-4858-b4ed-17c34b7c577a', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-02-06', '2026-02-06 07:36:00+00', '2026-02-06 08:51:43+00', 12.02, 4543, 6.3, 20, 60, 'red', 14.2),
-  ('dd00dffb-1ee9-437e-9f5b-a2d582904688', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-02-06', '2026-02-06 14:43:00+00', '2026-02-06 16:20:30+00', 12.68, 5850, 7.69, 19, 19, 'blue', 12.0),
-  ('8a32de38-82aa-4ff0-a44c-f199856f87c0', 'aaaaaaaa-0025-0025-0025-000000000025', '2026-02-06', '2026-02-06 13:06:00+00', '2026-02-06 14:52:36+00', 13.53, 6396, 7.88, 19, 19, 'red', 22.1),
-  ('6976f930-6022-4d00-b9f6-a62c249935c8', 'aaaaaaaa-0077-0077-0077-000000000077', '2026-02-06', '2026-02-06 14:44:00+00', '2026-02-06 15:13:50+00', 4.57, 1790, 6.53, 6, 18, 'blue', 23.9),
-  ('20163a63-a427-43fc-ad7d-beb578f3c54f', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-02-06', '2026-02-06 13:46:00+00', '2026-02-06 14:48:08+00', 9.59, 3728, 6.48, 14, 28, 'red', 11.0),
-  ('ca43f7e7-91d3-4e04-83be-ca06b9eb0cba', 'aaaaaaaa-0024-0024-0024-000000000024', '2026-02-06', '2026-02-06 10:36:00+00', '2026-02-06 11:40:29+00', 13.52, 3869, 4.77, 18, 36, 'red', 4.7),
-  ('d511d71d-b9bf-48cc-8741-16abc9ee2d38', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-02-06', '2026-02-06 16:52:00+00', '2026-02-06 18:29:35+00', 14.33, 5855, 6.81, 32, 64, 'purple', 24.3),
-  ('3f792cbd-86f8-4f44-9d55-872baffbef80', 'aaaaaaaa-0090-0090-0090-000000000090', '2026-02-06', '2026-02-06 21:02:00+00', '2026-02-06 22:24:20+00', 13.28, 4940, 6.2, 27, 27, 'purple', 13.6),
-  ('0e0b0060-01da-401c-b93c-fbe7dea4acec', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-02-06', '2026-02-06 18:52:00+00', '2026-02-06 20:00:02+00', 13.58, 4082, 5.01, 19, 57, 'purple', 6.7),
-  ('3d307c26-01ae-4513-8131-c4b7c3a63e38', 'aaaaaaaa-0030-0030-0030-000000000030', '2026-02-06', '2026-02-06 18:33:00+00', '2026-02-06 18:52:04+00', 3.94, 1144, 4.84, 7, 7, 'red', 13.5),
-  ('81b37b0a-46c0-4872-8ca8-0cb2d6273c57', 'aaaaaaaa-0034-0034-0034-000000000034', '2026-02-06', '2026-02-06 11:00:00+00', '2026-02-06 11:56:28+00', 7.47, 3388, 7.56, 10, 30, 'red', 18.3),
-  ('1e181536-99e1-4c91-90ad-2cbaa8d7f386', 'aaaaaaaa-0072-0072-0072-000000000072', '2026-02-06', '2026-02-06 09:54:00+00', '2026-02-06 11:15:27+00', 11.22, 4887, 7.26, 27, 81, 'blue', 15.7),
-  ('46791ee8-c027-40ac-9f56-268312f6cc8d', 'aaaaaaaa-0064-0064-0064-000000000064', '2026-02-06', '2026-02-06 14:12:00+00', '2026-02-06 15:17:05+00', 13.23, 3905, 4.92, 27, 81, 'blue', 8.1),
-  ('a882334b-6642-4a5e-8acc-776fb3da165d', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-02-06', '2026-02-06 07:17:00+00', '2026-02-06 07:33:06+00', 2.44, 966, 6.6, 3, 3, 'blue', 14.3),
-  ('0b53835b-2534-4935-b5f9-52fe6fef3bd1', 'aaaaaaaa-0036-0036-0036-000000000036', '2026-02-06', '2026-02-06 17:36:00+00', '2026-02-06 18:45:41+00', 12.14, 4181, 5.74, 22, 88, 'red', 11.7),
-  ('d898a951-7707-47bb-84d1-23df6fb38be0', 'aaaaaaaa-0032-0032-0032-000000000032', '2026-02-06', '2026-02-06 15:04:00+00', '2026-02-06 15:48:21+00', 8.29, 2661, 5.35, 7, 28, 'red', 10.5),
-  ('a3c21156-69c0-4d78-b5cd-5185207d943f', 'aaaaaaaa-0020-0020-0020-000000000020', '2026-02-06', '2026-02-06 15:31:00+00', '2026-02-06 16:18:09+00', 9.21, 2829, 5.12, 15, 45, 'red', 9.9),
-  ('59de2f8b-dd02-41ae-bbcf-1a166960096f', 'aaaaaaaa-0062-0062-0062-000000000062', '2026-02-06', '2026-02-06 13:15:00+00', '2026-02-06 14:58:41+00', 13.68, 6221, 7.58, 26, 26, 'blue', 15.6),
-  ('82899dc2-82a8-40ad-9c31-90b69eb75881', 'aaaaaaaa-0067-0067-0067-000000000067', '2026-02-06', '2026-02-06 12:52:00+00', '2026-02-06 13:35:10+00', 5.5, 2590, 7.85, 4, 12, 'blue', 10.5),
-  ('9112376f-e343-46e9-b955-1a7c9f3a1029', 'aaaaaaaa-0097-0097-0097-000000000097', '2026-02-06', '2026-02-06 20:08:00+00', '2026-02-06 20:25:57+00', 3.3, 1077, 5.44, 7, 14, 'purple', 8.2),
-  ('3c3673f6-4c2b-4846-9925-0f0bff764a55', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-02-06', '2026-02-06 17:39:00+00', '2026-02-06 19:30:36+00', 14.94, 6696, 7.47, 22, 22, 'red', 14.4),
-  ('6194df2e-7380-4402-be89-d2c47df60363', 'aaaaaaaa-0051-0051-0051-000000000051', '2026-02-06', '2026-02-06 17:17:00+00', '2026-02-06 17:55:22+00', 5.72, 2302, 6.71, 12, 36, 'blue', 6.2),
-  ('6e04e698-fac5-4b6e-8fd7-40360cc7e413', 'aaaaaaaa-0038-0038-0038-000000000038', '2026-02-06', '2026-02-06 09:08:00+00', '2026-02-06 10:45:53+00', 13.54, 5873, 7.23, 13, 52, 'red', 23.7),
-  ('3a15c2c7-8dea-4d86-8349-080085cf9a00', 'aaaaaaaa-0014-0014-0014-000000000014', '2026-02-06', '2026-02-06 18:16:00+00', '2026-02-06 19:01:08+00', 8.85, 2708, 5.1, 10, 30, 'red', 3.8),
-  ('f3797941-9ddd-4276-9075-b0dd3698c850', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-02-06', '2026-02-06 12:50:00+00', '2026-02-06 13:08:15+00', 4.02, 1095, 4.54, 7, 14, 'blue', 14.5),
-  ('f455eaed-2919-461a-993e-83ad00b8c96f', 'aaaaaaaa-0068-0068-0068-000000000068', '2026-02-06', '2026-02-06 17:53:00+00', '2026-02-06 18:05:08+00', 2.09, 728, 5.81, 4, 12, 'blue', 12.1),
-  ('acf130ed-6c5d-442d-aaa4-4db6d017e884', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-02-06', '2026-02-06 09:03:00+00', '2026-02-06 09:40:30+00', 6.92, 2250, 5.42, 15, 15, 'purple', 12.3),
-  ('1e858407-68ee-406c-9a37-8cfaf1fbf56d', 'aaaaaaaa-0058-0058-0058-000000000058', '2026-02-06', '2026-02-06 17:49:00+00', '2026-02-06 18:55:54+00', 14.61, 4014, 4.58, 21, 21, 'blue', 24.4),
-  ('b60fbadd-4609-4401-8bc3-9c0689d19ed9', 'aaaaaaaa-0033-0033-0033-000000000033', '2026-02-06', '2026-02-06 09:23:00+00', '2026-02-06 10:41:46+00', 14.67, 4726, 5.37, 17, 68, 'red', 24.9),
-  ('6a204a0d-8418-48b2-a49c-a23e8eca162b', 'aaaaaaaa-0089-0089-0089-000000000089', '2026-02-06', '2026-02-06 13:55:00+00', '2026-02-06 14:59:32+00', 12.02, 3872, 5.37, 28, 56, 'purple', 14.0),
-  ('1d2f367d-e36d-47d0-a9aa-517b25260ce6', 'aaaaaaaa-0076-0076-0076-000000000076', '2026-02-06', '2026-02-06 06:53:00+00', '2026-02-06 08:31:38+00', 12.81, 5918, 7.7, 25, 25, 'blue', 15.2),
-  ('d35065bb-6ec1-48e6-a82f-2896a71b15d8', 'aaaaaaaa-0044-0044-0044-000000000044', '2026-02-06', '2026-02-06 12:34:00+00', '2026-02-06 13:46:47+00', 14.19, 4367, 5.13, 18, 54, 'blue', 3.7),
-  ('218d0c3d-dd70-401d-8894-73cbd82b7965', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-02-06', '2026-02-06 16:57:00+00', '2026-02-06 17:33:18+00', 7.01, 2178, 5.18, 11, 44, 'red', 17.5),
-  ('faec29e8-f013-4c88-97b9-31f8f7428ce8', 'aaaaaaaa-0099-0099-0099-000000000099', '2026-02-06', '2026-02-06 05:46:00+00', '2026-02-06 06:34:37+00', 6.1, 2917, 7.97, 11, 22, 'purple', 10.1),
-  ('f93cfe6d-cfbd-4eb8-a0e0-6ebe1bb88554', 'aaaaaaaa-0015-0015-0015-000000000015', '2026-02-06', '2026-02-06 05:49:00+00', '2026-02-06 06:02:28+00', 2.45, 808, 5.5, 4, 12, 'red', 3.4),
-  ('112dc1c4-e822-4ca8-ad35-1962faf16235', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-02-06', '2026-02-06 07:49:00+00', '2026-02-06 09:16:41+00', 12.69, 5261, 6.91, 18, 72, 'red', 9.1),
-  ('aad9c856-353b-4675-bbfb-b58530459728', 'aaaaaaaa-0098-0098-0098-000000000098', '2026-02-07', '2026-02-07 20:25:00+00', '2026-02-07 20:40:34+00', 2.64, 934, 5.9, 6, 6, 'purple', 4.9),
-  ('bed21e5f-2dbf-4860-9ddf-ecdd302969a4', 'aaaaaaaa-0042-0042-0042-000000000042', '2026-02-07', '2026-02-07 16:09:00+00', '2026-02-07 17:03:23+00', 10.48, 3263, 5.19, 18, 18, 'blue', 16.6),
-  ('333a390d-6b6b-494a-a5ef-e1e2ffb1bc9c', 'aaaaaaaa-0044-0044-0044-000000000044', '2026-02-07', '2026-02-07 13:03:00+00', '2026-02-07 14:31:38+00', 11.85, 5318, 7.48, 12, 36, 'blue', 5.5),
-  ('03261b39-78dc-4bbe-8770-ecd194cf4572', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-02-07', '2026-02-07 05:02:00+00', '2026-02-07 06:04:47+00', 8.04, 3767, 7.81, 12, 36, 'blue', 4.5),
-  ('677bc279-aa14-4a63-9dde-ce138ef67381', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-02-07', '2026-02-07 13:14:00+00', '2026-02-07 13:47:08+00', 5.22, 1988, 6.35, 7, 21, 'blue', 10.3),
-  ('9af78043-6263-40ba-8406-4139ff0794d6', 'aaaaaaaa-0015-0015-0015-000000000015', '2026-02-07', '2026-02-07 15:28:00+00', '2026-02-07 15:58:19+00', 3.97, 1819, 7.64, 4, 12, 'red', 17.5),
-  ('18854970-45ff-4b47-93a3-dc57aced877a', 'aaaaaaaa-0029-0029-0029-000000000029', '2026-02-07', '2026-02-07 19:47:00+00', '2026-02-07 20:34:14+00', 9.05, 2834, 5.22, 16, 48, 'red', 6.0),
-  ('6f840e7c-4da5-4b7a-9afa-d025d942e104', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-02-07', '2026-02-07 12:47:00+00', '2026-02-07 14:34:53+00', 14.14, 6473, 7.63, 33, 66, 'purple', 23.5),
-  ('f6420501-4ebe-48be-b3c2-89c16f444391', 'aaaaaaaa-0077-0077-0077-000000000077', '2026-02-07', '2026-02-07 14:28:00+00', '2026-02-07 15:23:54+00', 10.73, 3354, 5.21, 15, 15, 'blue', 7.5),
-  ('2be6f9e7-1842-4fce-97e6-b5bc59bbd05d', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-02-07', '2026-02-07 19:01:00+00', '2026-02-07 19:40:56+00', 7.17, 2396, 5.57, 13, 39, 'red', 21.2),
-  ('b491984c-67d2-4da7-ad4f-95e3b9a99113', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-02-07', '2026-02-07 21:45:00+00', '2026-02-07 22:13:26+00', 4.33, 1706, 6.57, 8, 8, 'purple', 18.7),
-  ('ac3d7c13-4a91-4c61-b7c9-92b725f5dc85', 'aaaaaaaa-0080-0080-0080-000000000080', '2026-02-07', '2026-02-07 10:07:00+00', '2026-02-07 10:57:49+00', 6.99, 3049, 7.27, 13, 26, 'purple', 14.3),
-  ('05759fef-62d2-48c6-b259-202fddd58e81', 'aaaaaaaa-0048-0048-0048-000000000048', '2026-02-07', '2026-02-07 10:43:00+00', '2026-02-07 12:30:31+00', 13.68, 6451, 7.86, 16, 16, 'blue', 3.1),
-  ('73e625a2-323c-49c0-8e9c-8410cabf29df', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-02-07', '2026-02-07 14:30:00+00', '2026-02-07 15:08:49+00', 5.7, 2329, 6.81, 12, 12, 'red', 18.4),
-  ('b63416c2-2d8e-49c6-83d2-824ee68dd498', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-02-07', '2026-02-07 18:38:00+00', '2026-02-07 19:03:59+00', 3.75, 1559, 6.93, 5, 15, 'red', 9.0),
-  ('fd279c23-b1df-448d-bae2-9282fc565801', 'aaaaaaaa-0067-0067-0067-000000000067', '2026-02-07', '2026-02-07 05:07:00+00', '2026-02-07 06:17:26+00', 13.02, 4226, 5.41, 16, 32, 'blue', 15.7),
-  ('c53af933-f6f5-4558-b4b4-1bb9b3b2cc5f', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-02-07', '2026-02-07 15:24:00+00', '2026-02-07 16:26:08+00', 10.92, 3728, 5.69, 17, 17, 'red', 18.9),
-  ('1d7cb8bb-3e91-40f4-b1b4-019fd842c481', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-02-07', '2026-02-07 05:51:00+00', '2026-02-07 07:06:32+00', 10.14, 4532, 7.45, 13, 39, 'blue', 15.6),
-  ('5922e0d8-a0a6-4826-917d-1dc9b2295692', 'aaaaaaaa-0069-0069-0069-000000000069', '2026-02-07', '2026-02-07 08:33:00+00', '2026-02-07 09:24:41+00', 8.27, 3101, 6.25, 8, 8, 'blue', 7.2),
-  ('9cbab39b-172d-4393-b9fe-006f6c494b72', 'aaaaaaaa-0072-0072-0072-000000000072', '2026-02-07', '2026-02-07 15:34:00+00', '2026-02-07 16:59:02+00', 11.96, 5102, 7.11, 10, 30, 'blue', 3.5),
-  ('bcf648ad-9337-4692-acab-ee3070e47f99', 'aaaaaaaa-0019-0019-0019-000000000019', '2026-02-07', '2026-02-07 07:52:00+00', '2026-02-07 08:30:32+00', 7.77, 2312, 4.96, 14, 28, 'red', 13.4),
-  ('cf1dc2c8-aa08-4b1d-9fb4-77111190ad2a', 'aaaaaaaa-0041-0041-0041-000000000041', '2026-02-07', '2026-02-07 07:50:00+00', '2026-02-07 09:16:23+00', 12.43, 5183, 6.95, 18, 54, 'blue', 5.1),
-  ('37abb0b0-8747-4cb5-b356-aea90bf0011f', 'aaaaaaaa-0064-0064-0064-000000000064', '2026-02-07', '2026-02-07 12:11:00+00', '2026-02-07 12:47:13+00', 5.93, 2173, 6.11, 7, 21, 'blue', 16.0),
-  ('913550e6-787a-49fc-92c5-08ed3823dd97', 'aaaaaaaa-0028-0028-0028-000000000028', '2026-02-07', '2026-02-07 19:12:00+00', '2026-02-07 20:02:36+00', 10.61, 3036, 4.77, 21, 84, 'red', 23.5),
-  ('22a3bbb0-a2ac-4bd8-9e96-da96e49e2f59', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-02-07', '2026-02-07 06:00:00+00', '2026-02-07 06:35:21+00', 4.67, 2121, 7.57, 4, 8, 'blue', 9.6),
-  ('449ca276-e039-480c-843b-d319972dc71e', 'aaaaaaaa-0086-0086-0086-000000000086', '2026-02-07', '2026-02-07 20:42:00+00', '2026-02-07 22:04:06+00', 11.14, 4926, 7.37, 26, 26, 'purple', 10.9),
-  ('c959e0e8-8ee1-4cb1-abe6-cef5f952d3c2', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-02-07', '2026-02-07 16:02:00+00', '2026-02-07 17:03:12+00', 7.68, 3672, 7.97, 8, 24, 'blue', 4.9),
-  ('9b778f51-6b72-4185-95d2-e0ec1ca2ba95', 'aaaaaaaa-0057-0057-0057-000000000057', '2026-02-07', '2026-02-07 13:03:00+00', '2026-02-07 14:38:31+00', 14.72, 5731, 6.49, 16, 32, 'blue', 18.5),
-  ('b4a90739-25b4-42cb-956a-0fba93acb5c1', 'aaaaaaaa-0091-0091-0091-000000000091', '2026-02-07', '2026-02-07 06:21:00+00', '2026-02-07 07:27:22+00', 10.18, 3982, 6.52, 21, 63, 'purple', 15.6),
-  ('9be0c78d-bac0-4fef-af8f-457ce2334cb7', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-02-07', '2026-02-07 08:58:00+00', '2026-02-07 10:54:41+00', 14.79, 7001, 7.89, 30, 30, 'red', 16.1),
-  ('78b1dee0-fd69-48c2-b6c1-dbd602cc1d6e', 'aaaaaaaa-0076-0076-0076-000000000076', '2026-02-07', '2026-02-07 08:43:00+00', '2026-02-07 09:34:08+00', 8.91, 3068, 5.74, 13, 39, 'blue', 21.6),
-  ('60f3531c-3824-4a31-8bc9-9bc7d23c8560', 'aaaaaaaa-0096-0096-0096-000000000096', '2026-02-07', '2026-02-07 07:40:00+00', '2026-02-07 08:21:06+00', 7.8, 2466, 5.27, 12, 24, 'purple', 9.2),
-  ('731aa135-fb85-4abd-96aa-5f9bbb5d1012', 'aaaaaaaa-0037-0037-0037-000000000037', '2026-02-07', '2026-02-07 11:39:00+00', '2026-02-07 12:41:57+00', 7.89, 3777, 7.98, 13, 52, 'red', 19.9),
-  ('0101bcb0-ab78-4303-8b19-a6ae9a00c464', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-02-07', '2026-02-07 17:44:00+00', '2026-02-07 19:03:40+00', 10.36, 4780, 7.69, 17, 17, 'blue', 18.7),
-  ('4d6ca20a-3078-4ee3-a4ec-b468e64a46f9', 'aaaaaaaa-0018-0018-0018-000000000018', '2026-02-07', '2026-02-07 20:24:00+00', '2026-02-07 21:42:10+00', 12.63, 4690, 6.19, 19, 38, 'red', 15.5),
-  ('b685189a-8505-4772-8a44-3086c339ab58', 'aaaaaaaa-0016-0016-0016-000000000016', '2026-02-07', '2026-02-07 08:13:00+00', '2026-02-07 08:31:01+00', 2.82, 1081, 6.39, 3, 12, 'red', 9.8),
-  ('02c7f7ef-94e5-49ad-9002-fdd2645f8d5f', 'aaaaaaaa-0043-0043-0043-000000000043', '2026-02-07', '2026-02-07 17:20:00+00', '2026-02-07 18:45:25+00', 12.49, 5125, 6.84, 17, 51, 'blue', 13.1),
-  ('750d9816-3618-46b9-8831-2726ba67169e', 'aaaaaaaa-0092-0092-0092-000000000092', '2026-02-07', '2026-02-07 09:48:00+00', '2026-02-07 10:12:35+00', 3.57, 1475, 6.89, 6, 12, 'purple', 15.0),
-  ('579c29a3-98e6-4bff-8abb-8a66317b4713', 'aaaaaaaa-0030-0030-0030-000000000030', '2026-02-07', '2026-02-07 11:09:00+00', '2026-02-07 12:00:21+00', 7.4, 3081, 6.94, 11, 22, 'red', 15.2),
-  ('20de15c2-9324-46a8-b0c8-60ae3f9080d6', 'aaaaaaaa-0036-0036-0036-000000000036', '2026-02-07', '2026-02-07 09:43:00+00', '2026-02-07 10:48:19+00', 10.32, 3919, 6.33, 15, 15, 'red', 12.1),
-  ('a0e61c1e-d8df-468c-aa97-703a76b24d09', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-02-07', '2026-02-07 18:55:00+00', '2026-02-07 20:34:44+00', 12.97, 5984, 7.69, 21, 21, 'blue', 13.9),
-  ('a0fb46b5-9780-4f6f-8fca-8ef2fc06a938', 'aaaaaaaa-0028-0028-0028-000000000028', '2026-02-08', '2026-02-08 11:08:00+00', '2026-02-08 12:10:58+00', 13.12, 3778, 4.8, 17, 68, 'red', 21.9),
-  ('4f897621-99da-4e14-afbc-6106bf713b4b', 'aaaaaaaa-0009-0009-0009-000000000009', '2026-02-08', '2026-02-08 15:33:00+00', '2026-02-08 16:08:33+00', 6.66, 2133, 5.34, 11, 44, 'red', 25.0),
-  ('64cda99c-c57f-4d9e-b33c-ee43be8cea8c', 'aaaaaaaa-0060-0060-0060-000000000060', '2026-02-08', '2026-02-08 16:56:00+00', '2026-02-08 17:10:33+00', 2.43, 873, 5.99, 4, 12, 'blue', 8.9),
-  ('4bc0dc4a-80d1-4019-aac4-9bd0497cb110', 'aaaaaaaa-0074-0074-0074-000000000074', '2026-02-08', '2026-02-08 15:15:00+00', '2026-02-08 15:30:35+00', 2.67, 935, 5.84, 3, 3, 'blue', 13.2),
-  ('28b484f8-d80c-41ce-a419-f5f0cd211700', 'aaaaaaaa-0062-0062-0062-000000000062', '2026-02-08', '2026-02-08 16:51:00+00', '2026-02-08 17:52:03+00', 9.02, 3663, 6.77, 12, 36, 'blue', 19.2),
-  ('8fd3e081-d6d0-4d84-9bea-c36bfe74b5d9', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-02-08', '2026-02-08 14:12:00+00', '2026-02-08 15:26:29+00', 10.75, 4469, 6.93, 15, 15, 'red', 24.5),
-  ('2ad4bd6d-e56c-4796-b819-54711c62cdb6', 'aaaaaaaa-0055-0055-0055-000000000055', '2026-02-08', '2026-02-08 21:53:00+00', '2026-02-08 22:14:17+00', 2.82, 1277, 7.55, 3, 9, 'blue', 8.1),
-  ('7941b1a4-b542-4ec0-a9ff-2e941c5d1438', 'aaaaaaaa-0018-0018-0018-000000000018', '2026-02-08', '2026-02-08 15:36:00+00', '2026-02-08 16:31:41+00', 9.13, 3341, 6.1, 13, 13, 'red', 15.5),
-  ('8951d826-e94a-4898-a0f2-19ad5a31dcb7', 'aaaaaaaa-0027-0027-0027-000000000027', '2026-02-08', '2026-02-08 08:58:00+00', '2026-02-08 09:17:41+00', 3.64, 1181, 5.41, 4, 12, 'red', 7.1),
-  ('a0f2c86a-dabd-4022-8141-2fae67b955b8', 'aaaaaaaa-0078-0078-0078-000000000078', '2026-02-08', '2026-02-08 15:41:00+00', '2026-02-08 15:59:00+00', 2.32, 1080, 7.76, 4, 12, 'blue', 19.9),
-  ('57cd6d26-9925-4989-8866-31db4c45d0b3', 'aaaaaaaa-0058-0058-0058-000000000058', '2026-02-08', '2026-02-08 19:43:00+00', '2026-02-08 20:51:48+00', 11.17, 4128, 6.16, 20, 60, 'blue', 9.4),
-  ('6dd47af7-16e5-4161-8489-7171e5781f34', 'aaaaaaaa-0022-0022-0022-000000000022', '2026-02-08', '2026-02-08 09:53:00+00', '2026-02-08 10:44:36+00', 10.73, 3096, 4.81, 10, 40, 'red', 14.3),
-  ('0d7327d0-b3c8-4c46-9ac3-80d0e9c77f20', 'aaaaaaaa-0049-0049-0049-000000000049', '2026-02-08', '2026-02-08 19:14:00+00', '2026-02-08 20:00:13+00', 9.63, 2773, 4.8, 14, 42, 'blue', 7.6),
-  ('82a408d8-dca9-4fb1-80ed-0b854d062f49', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-02-08', '2026-02-08 12:01:00+00', '2026-02-08 12:11:35+00', 2.35, 635, 4.51, 2, 4, 'blue', 8.8),
-  ('f321b806-939a-459d-a5cb-fbc62660d605', 'aaaaaaaa-0017-0017-0017-000000000017', '2026-02-08', '2026-02-08 08:23:00+00', '2026-02-08 08:42:25+00', 3.55, 1165, 5.47, 4, 16, 'red', 24.9),
-  ('232b6774-8953-41ac-932b-6cb7038aea0c', 'aaaaaaaa-0089-0089-0089-000000000089', '2026-02-08', '2026-02-08 15:55:00+00', '2026-02-08 16:51:22+00', 8.66, 3382, 6.51, 21, 21, 'purple', 21.6),
-  ('b6ba2003-e081-4ce4-ad70-2c445e6c0691', 'aaaaaaaa-0024-0024-0024-000000000024', '2026-02-08', '2026-02-08 08:13:00+00', '2026-02-08 08:58:34+00', 6.11, 2734, 7.46, 11, 22, 'red', 20.6),
-  ('f37f1a55-723d-4a10-8fe2-50ac6b4e9e2d', 'aaaaaaaa-0080-0080-0080-000000000080', '2026-02-08', '2026-02-08 16:19:00+00', '2026-02-08 16:40:07+00', 4.01, 1267, 5.27, 9, 18, 'purple', 7.1),
-  ('e45c0614-71ff-4f0b-866e-129a593f8148', 'aaaaaaaa-0045-0045-0045-000000000045', '2026-02-08', '2026-02-08 08:58:00+00', '2026-02-08 09:52:47+00', 10.98, 3287, 4.99, 17, 34, 'blue', 12.7),
-  ('3dd7d0c8-9a23-48a4-9ded-74e68e7f8f11', 'aaaaaaaa-0034-0034-0034-000000000034', '2026-02-08', '2026-02-08 16:10:00+00', '2026-02-08 16:35:01+00', 5.29, 1501, 4.73, 8, 24, 'red', 17.7),
-  ('5679e372-7255-41a2-a3a6-74bbfc4c812d', 'aaaaaaaa-0025-0025-0025-000000000025', '2026-02-08', '2026-02-08 08:33:00+00', '2026-02-08 10:07:51+00', 13.12, 5691, 7.23, 19, 76, 'red', 16.5),
-  ('61a5de98-dc4b-43c2-af22-7e60c6a815d9', 'aaaaaaaa-0042-0042-0042-000000000042', '2026-02-08', '2026-02-08 14:43:00+00', '2026-02-08 15:10:01+00', 3.77, 1621, 7.17, 4, 12, 'blue', 18.5),
-  ('de7c8f0f-1c9f-4b20-b98f-3ddedf012140', 'aaaaaaaa-0016-0016-0016-000000000016', '2026-02-08', '2026-02-08 17:22:00+00', '2026-02-08 18:50:52+00', 14.69, 5332, 6.05, 16, 48, 'red', 15.2),
-  ('e30a2824-d692-490f-af40-a1aac214d42c', 'aaaaaaaa-0004-0004-0004-000000000004', '2026-02-08', '2026-02-08 09:19:00+00', '2026-02-08 10:13:08+00', 8.19, 3248, 6.61, 5, 15, 'red', 11.9),
-  ('4f7d8bcc-4183-4dc0-9581-3a65d035196b', 'aaaaaaaa-0072-0072-0072-000000000072', '2026-02-08', '2026-02-08 14:56:00+00', '2026-02-08 15:44:50+00', 10.09, 2930, 4.84, 15, 15, 'blue', 4.7),
-  ('cc35f7a6-e6ff-4734-ac77-c43fd74ec612', 'aaaaaaaa-0007-0007-0007-000000000007', '2026-02-08', '2026-02-08 15:24:00+00', '2026-02-08 16:33:32+00', 11.18, 4172, 6.22, 13, 13, 'red', 6.0),
-  ('73ccac4e-03c3-43cb-8ddd-6ced3f72f68c', 'aaaaaaaa-0035-0035-0035-000000000035', '2026-02-08', '2026-02-08 14:07:00+00', '2026-02-08 14:25:40+00', 3.27, 1120, 5.71, 2, 2, 'red', 10.9),
-  ('0c2462bd-08cb-45de-b420-7a079d5ed6c8', 'aaaaaaaa-0085-0085-0085-000000000085', '2026-02-08', '2026-02-08 08:44:00+00', '2026-02-08 09:13:12+00', 6.39, 1752, 4.57, 12, 24, 'purple', 10.2),
-  ('aabc90df-164c-4623-8ca8-9514665f0824', 'aaaaaaaa-0014-0014-0014-000000000014', '2026-02-08', '2026-02-08 21:51:00+00', '2026-02-08 22:52:13+00', 10.78, 3673, 5.68, 8, 24, 'red', 14.1),
-  ('fc49a891-fa93-4369-8954-b3d80f099b8d', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-02-08', '2026-02-08 18:59:00+00', '2026-02-08 19:39:14+00', 5.9, 2414, 6.82, 10, 20, 'blue', 9.9),
-  ('36b367f8-0030-4e4b-9827-2438ff3245f1', 'aaaaaaaa-0084-0084-0084-000000000084', '2026-02-08', '2026-02-08 14:29:00+00', '2026-02-08 15:31:37+00', 9.36, 3757, 6.69, 19, 19, 'purple', 14.5),
-  ('12f107b3-12a9-47a6-8da9-4615b31095ee', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-02-08', '2026-02-08 07:25:00+00', '2026-02-08 08:31:13+00', 8.31, 3973, 7.97, 15, 30, 'blue', 12.3),
-  ('7fe47858-b5e1-43f5-9770-4e339f2a9fc8', 'aaaaaaaa-0021-0021-0021-000000000021', '2026-02-08', '2026-02-08 12:17:00+00', '2026-02-08 13:57:14+00', 14.26, 6014, 7.03, 21, 84, 'red', 6.1),
-  ('aac6415e-334e-49f4-88b7-2f85de4f4d5e', 'aaaaaaaa-0043-0043-0043-000000000043', '2026-02-08', '2026-02-08 20:47:00+00', '2026-02-08 22:31:29+00', 13.43, 6269, 7.78, 22, 44, 'blue', 11.0),
-  ('d684ddf5-e6a3-4dd3-b5b6-4beb3c150d2e', 'aaaaaaaa-0099-0099-0099-000000000099', '2026-02-08', '2026-02-08 14:20:00+00', '2026-02-08 15:14:49+00', 7.37, 3289, 7.44, 16, 16, 'purple', 18.8),
-  ('0e720c89-e64b-45d0-bc7d-c44cb1107031', 'aaaaaaaa-0037-0037-0037-000000000037', '2026-02-08', '2026-02-08 11:16:00+00', '2026-02-08 12:02:24+00', 9.49, 2784, 4.89, 18, 72, 'red', 8.5),
-  ('889419ad-8a41-497f-a2dc-f1f7e1dd3f82', 'aaaaaaaa-0020-0020-0020-000000000020', '2026-02-08', '2026-02-08 18:11:00+00', '2026-02-08 19:07:36+00', 11.12, 3396, 5.09, 10, 20, 'red', 11.8),
-  ('7e8fd974-e3a6-47c8-92f4-d24d0a48969c', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-02-08', '2026-02-08 08:35:00+00', '2026-02-08 09:11:37+00', 7.31, 2197, 5.01, 14, 14, 'blue', 9.4),
-  ('c05ab1bf-5067-4de2-be2b-db3431b858be', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-02-08', '2026-02-08 17:19:00+00', '2026-02-08 17:34:38+00', 2.76, 938, 5.67, 5, 15, 'purple', 8.2),
-  ('6851ee61-6587-487f-a68f-d688beb1bfcc', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-02-08', '2026-02-08 19:03:00+00', '2026-02-08 20:43:45+00', 14.71, 6045, 6.85, 27, 27, 'blue', 5.9),
-  ('05d3c523-7cf4-4753-b143-bd9445973af9', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-02-08', '2026-02-08 19:31:00+00', '2026-02-08 19:51:55+00', 4.46, 1255, 4.69, 9, 36, 'red', 7.0),
-  ('a2ea011e-aaf2-4a06-be4c-6bd61dae22e7', 'aaaaaaaa-0057-0057-0057-000000000057', '2026-02-08', '2026-02-08 11:37:00+00', '2026-02-08 12:01:17+00', 3.46, 1457, 7.02, 5, 15, 'blue', 6.3),
-  ('6c70f4db-7e66-4a89-b029-a2e611957e3b', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-02-08', '2026-02-08 07:25:00+00', '2026-02-08 08:32:30+00', 14.97, 4050, 4.51, 20, 80, 'red', 19.9),
-  ('13b141ad-9795-4056-824b-b18d71062bb2', 'aaaaaaaa-0036-0036-0036-000000000036', '2026-02-08', '2026-02-08 09:22:00+00', '2026-02-08 09:50:24+00', 5.32, 1704, 5.34, 6, 18, 'red', 20.0),
-  ('8f3ae3df-ee3c-48e7-ba93-f6ef1a093999', 'aaaaaaaa-0073-0073-0073-000000000073', '2026-02-08', '2026-02-08 20:19:00+00', '2026-02-08 21:37:54+00', 10.65, 4734, 7.41, 18, 18, 'blue', 14.3),
-  ('f46620d2-aea3-4682-8bc0-31a1a77bb026', 'aaaaaaaa-0016-0016-0016-000000000016', '2026-02-09', '2026-02-09 05:13:00+00', '2026-02-09 06:24:07+00', 12.5, 4267, 5.69, 13, 26, 'red', 23.2),
-  ('992bfc23-1aee-4a68-8f1c-c35bbe93258f', 'aaaaaaaa-0087-0087-0087-000000000087', '2026-02-09', '2026-02-09 17:03:00+00', '2026-02-09 17:44:19+00', 8.25, 2479, 5.01, 19, 57, 'purple', 8.3),
-  ('f2a90a98-1249-4fa6-8301-72725b8f64c5', 'aaaaaaaa-0038-0038-0038-000000000038', '2026-02-09', '2026-02-09 18:36:00+00', '2026-02-09 19:06:48+00', 6.34, 1848, 4.86, 9, 9, 'red', 21.6),
-  ('a8e304d2-a85d-476a-98fb-0587da2dbd28', 'aaaaaaaa-0031-0031-0031-000000000031', '2026-02-09', '2026-02-09 15:58:00+00', '2026-02-09 16:26:50+00', 6.11, 1730, 4.72, 8, 16, 'red', 22.6),
-  ('0cc7185a-882c-4189-adfa-2d09af032863', 'aaaaaaaa-0066-0066-0066-000000000066', '2026-02-09', '2026-02-09 13:22:00+00', '2026-02-09 14:35:14+00', 9.83, 4394, 7.45, 19, 38, 'blue', 17.5),
-  ('57991d0d-e921-462f-bb8f-c8c9d228d0a3', 'aaaaaaaa-0054-0054-0054-000000000054', '2026-02-09', '2026-02-09 10:40:00+00', '2026-02-09 11:35:11+00', 10.8, 3311, 5.11, 19, 19, 'blue', 21.9),
-  ('e7274065-6759-4b27-8e2f-cc0c9d91b4df', 'aaaaaaaa-0037-0037-0037-000000000037', '2026-02-09', '2026-02-09 08:54:00+00', '2026-02-09 09:12:25+00', 3.53, 1105, 5.22, 6, 12, 'red', 11.0),
-  ('20f039a5-341e-4e74-923a-e14e132f1b0f', 'aaaaaaaa-0072-0072-0072-000000000072', '2026-02-09', '2026-02-09 12:09:00+00', '2026-02-09 12:45:27+00', 4.62, 2187, 7.89, 7, 14, 'blue', 19.9),
-  ('661bf3a6-2e00-46fe-94b2-85a1ccfe3c58', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-02-09', '2026-02-09 05:52:00+00', '2026-02-09 07:06:51+00', 11.79, 4491, 6.35, 17, 51, 'red', 20.3),
-  ('54d7e675-2c14-4c05-aedf-4c79c9ac3078', 'aaaaaaaa-0070-0070-0070-000000000070', '2026-02-09', '2026-02-09 14:13:00+00', '2026-02-09 14:48:48+00', 5.64, 2148, 6.35, 11, 33, 'blue', 23.2),
-  ('4ea3dc14-5dd2-47ca-b19a-cb3996e7c341', 'aaaaaaaa-0009-0009-0009-000000000009', '2026-02-09', '2026-02-09 21:07:00+00', '2026-02-09 21:27:38+00', 3.21, 1238, 6.43, 4, 16, 'red', 14.5),
-  ('d24c3209-97a7-4c68-910c-7efa1d4952e6', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-02-09', '2026-02-09 18:53:00+00', '2026-02-09 20:18:49+00', 11.52, 5149, 7.45, 11, 22, 'red', 8.7),
-  ('b7faeeb2-df7d-4d04-85a7-83d5a85dbba2', 'aaaaaaaa-0065-0065-0065-000000000065', '2026-02-09', '2026-02-09 18:52:00+00', '2026-02-09 19:27:28+00', 7.36, 2128, 4.82, 9, 27, 'blue', 12.3),
-  ('893b4c7b-9d4f-4cc9-b244-074051e048ae', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-02-09', '2026-02-09 08:38:00+00', '2026-02-09 09:03:49+00', 4.12, 1549, 6.27, 6, 18, 'red', 13.7),
-  ('d74ea288-bac4-4c27-a95f-e6c1a9aad96c', 'aaaaaaaa-0098-0098-0098-000000000098', '2026-02-09', '2026-02-09 17:30:00+00', '2026-02-09 18:33:57+00', 13.08, 3837, 4.89, 30, 60, 'purple', 11.1),
-  ('fc893e08-0167-4bee-93ec-ecd8432aa2f2', 'aaaaaaaa-0094-0094-0094-000000000094', '2026-02-09', '2026-02-09 10:01:00+00', '2026-02-09 11:36:20+00', 12.85, 5720, 7.42, 25, 75, 'purple', 5.9),
-  ('5f6dc660-c7d6-4832-817a-04d67be4de73', 'aaaaaaaa-0052-0052-0052-000000000052', '2026-02-09', '2026-02-09 18:01:00+00', '2026-02-09 18:30:04+00', 5.57, 1744, 5.22, 11, 11, 'blue', 21.3),
-  ('839d78f8-f45c-4cfe-95a2-8ff2ce849864', 'aaaaaaaa-0012-0012-0012-000000000012', '2026-02-09', '2026-02-09 20:32:00+00', '2026-02-09 21:45:56+00', 13.18, 4436, 5.61, 25, 50, 'red', 8.7),
-  ('909ca169-2c12-4822-933f-c77476a25ec6', 'aaaaaaaa-0059-0059-0059-000000000059', '2026-02-09', '2026-02-09 19:53:00+00', '2026-02-09 21:01:54+00', 11.78, 4134, 5.85, 22, 22, 'blue', 5.5),
-  ('22575cd5-f003-4563-ba29-89d2df2d41c4', 'aaaaaaaa-0092-0092-0092-000000000092', '2026-02-09', '2026-02-09 19:17:00+00', '2026-02-09 20:25:22+00', 10.07, 4102, 6.79, 17, 51, 'purple', 6.7),
-  ('3b69a905-f286-4b8d-9f9e-352b2f032c78', 'aaaaaaaa-0032-0032-0032-000000000032', '2026-02-09', '2026-02-09 17:34:00+00', '2026-02-09 18:15:17+00', 5.2, 2477, 7.94, 7, 28, 'red', 10.5),
-  ('e7c343e2-2bb5-4fd1-8f8a-4caff4d36955', 'aaaaaaaa-0045-0045-0045-000000000045', '2026-02-09', '2026-02-09 17:11:00+00', '2026-02-09 17:34:05+00', 3.05, 1385, 7.57, 4, 8, 'blue', 17.3),
-  ('59119ea4-2ac7-4477-b9f8-bc05d7b6082b', 'aaaaaaaa-0079-0079-0079-000000000079', '2026-02-09', '2026-02-09 10:04:00+00', '2026-02-09 11:38:45+00', 12.91, 5685, 7.34, 14, 42, 'blue', 24.6),
-  ('f4b8e179-4557-4e02-8e2b-390c0ad24701', 'aaaaaaaa-0074-0074-0074-000000000074', '2026-02-09', '2026-02-09 12:03:00+00', '2026-02-09 13:11:36+00', 9.65, 4116, 7.11, 12, 36, 'blue', 5.8),
-  ('b9c3493b-bb62-41e8-827e-ee16b91da5dc', 'aaaaaaaa-0010-0010-0010-000000000010', '2026-02-09', '2026-02-09 07:40:00+00', '2026-02-09 08:13:29+00', 5.61, 2009, 5.97, 10, 30, 'red', 12.9),
-  ('bf04aafd-5f14-479b-8f5b-40c558fcccf0', 'aaaaaaaa-0064-0064-0064-000000000064', '2026-02-09', '2026-02-09 19:03:00+00', '2026-02-09 19:49:35+00', 10.13, 2795, 4.6, 11, 11, 'blue', 12.5),
-  ('3e4f8074-7f0a-4134-8e7e-850ce1a73abd', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-02-09', '2026-02-09 08:21:00+00', '2026-02-09 09:00:36+00', 5.92, 2376, 6.69, 12, 48, 'red', 4.4),
-  ('315b84e5-ee2a-4ed7-945c-fa0a0a75a5c1', 'aaaaaaaa-0014-0014-0014-000000000014', '2026-02-09', '2026-02-09 09:09:00+00', '2026-02-09 10:20:51+00', 10.46, 4311, 6.87, 18, 54, 'red', 3.6),
-  ('cd86e8d7-f87d-44f6-9a1a-cecf5afed58a', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-02-09', '2026-02-09 15:39:00+00', '2026-02-09 16:32:32+00', 8.1, 3212, 6.61, 18, 54, 'purple', 9.4),
-  ('8e71f096-34f4-4b48-91f0-d57b5c72c817', 'aaaaaaaa-0022-0022-0022-000000000022', '2026-02-09', '2026-02-09 05:23:00+00', '2026-02-09 05:56:20+00', 5.9, 2000, 5.65, 11, 22, 'red', 5.3),
-  ('53442617-67f3-49bb-a73d-b96fc8ea0bc6', 'aaaaaaaa-0023-0023-0023-000000000023', '2026-02-09', '2026-02-09 06:01:00+00', '2026-02-09 06:13:14+00', 2.13, 734, 5.75, 4, 12, 'red', 15.2),
-  ('a00bf079-b951-48df-b4c5-60806fe5e542', 'aaaaaaaa-0050-0050-0050-000000000050', '2026-02-09', '2026-02-09 08:21:00+00', '2026-02-09 08:46:11+00', 4.59, 1511, 5.49, 6, 18, 'blue', 7.8),
-  ('9aeca7a1-0c84-4450-8184-537fce64fd50', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-02-09', '2026-02-09 21:24:00+00', '2026-02-09 22:42:55+00', 14.17, 4735, 5.57, 30, 30, 'purple', 8.3),
-  ('a494ad2d-6673-4634-ac87-da7b1037f429', 'aaaaaaaa-0075-0075-0075-000000000075', '2026-02-09', '2026-02-09 19:33:00+00', '2026-02-09 20:52:33+00', 11.77, 4773, 6.76, 22, 44, 'blue', 14.2),
-  ('451c8ef6-2b29-4fae-89ca-31c534aefa5a', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-02-09', '2026-02-09 07:22:00+00', '2026-02-09 08:04:58+00', 6.57, 2578, 6.54, 6, 18, 'blue', 13.2),
-  ('68006de3-8364-48ff-966e-c5ce9d545c9a', 'aaaaaaaa-0097-0097-0097-000000000097', '2026-02-09', '2026-02-09 11:30:00+00', '2026-02-09 12:45:52+00', 13.72, 4552, 5.53, 20, 60, 'purple', 14.0),
-  ('18e13d4b-941a-43d4-80d9-c032751447a0', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-02-09', '2026-02-09 16:08:00+00', '2026-02-09 16:41:00+00', 5.04, 1980, 6.55, 5, 5, 'blue', 15.2),
-  ('cb453280-fa96-4ee7-9e96-d64f637c4baa', 'aaaaaaaa-0093-0093-0093-000000000093', '2026-02-09', '2026-02-09 08:21:00+00', '2026-02-09 09:08:04+00', 9.51, 2824, 4.95, 12, 24, 'purple', 23.8),
-  ('dfff5453-a382-4c2d-b7f3-1cc162c552f8', 'aaaaaaaa-0046-0046-0046-000000000046', '2026-02-09', '2026-02-09 15:55:00+00', '2026-02-09 16:52:09+00', 9.4, 3429, 6.08, 15, 15, 'blue', 22.7),
-  ('9679b76e-2531-43a4-a3ff-1c29f93d175c', 'aaaaaaaa-0029-0029-0029-000000000029', '2026-02-09', '2026-02-09 16:44:00+00', '2026-02-09 18:05:10+00', 13.83, 4870, 5.87, 25, 100, 'red', 24.8),
-  ('103c5144-6733-4b54-92f3-6359dfafc72b', 'aaaaaaaa-0048-0048-0048-000000000048', '2026-02-09', '2026-02-09 06:29:00+00', '2026-02-09 08:03:08+00', 12.95, 5648, 7.27, 18, 54, 'blue', 11.6),
-  ('ff807bd3-e736-4761-832e-5e4130499996', 'aaaaaaaa-0042-0042-0042-000000000042', '2026-02-09', '2026-02-09 06:00:00+00', '2026-02-09 06:15:50+00', 2.35, 950, 6.74, 4, 8, 'blue', 17.9),
-  ('b0789a14-335c-43b9-ad18-025ffbf64cd1', 'aaaaaaaa-0028-0028-0028-000000000028', '2026-02-09', '2026-02-09 10:18:00+00', '2026-02-09 10:54:42+00', 5.26, 2202, 6.98, 12, 12, 'red', 6.0),
-  ('42c99db6-9297-4ed2-9553-f8816e7f47e8', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-02-09', '2026-02-09 19:44:00+00', '2026-02-09 20:09:37+00', 3.61, 1537, 7.1, 7, 14, 'red', 6.7),
-  ('bc75e23b-a7d6-4fa2-8a62-475bfa761db7', 'aaaaaaaa-0081-0081-0081-000000000081', '2026-02-10', '2026-02-10 10:16:00+00', '2026-02-10 11:34:37+00', 10.12, 4717, 7.77, 20, 20, 'purple', 11.7),
-  ('34a70112-4012-447d-8dbc-1759188f16a1', 'aaaaaaaa-0066-0066-0066-000000000066', '2026-02-10', '2026-02-10 19:47:00+00', '2026-02-10 21:22:30+00', 14.47, 5730, 6.6, 27, 81, 'blue', 24.6),
-  ('188fabfa-c7c7-408d-afa5-dca70d43e25b', 'aaaaaaaa-0082-0082-0082-000000000082', '2026-02-10', '2026-02-10 12:32:00+00', '2026-02-10 13:38:38+00', 13.41, 3998, 4.97, 28, 28, 'purple', 10.0),
-  ('9a2f5eb7-10bf-450c-895a-ce4d7986d1fe', 'aaaaaaaa-0084-0084-0084-000000000084', '2026-02-10', '2026-02-10 19:40:00+00', '2026-02-10 20:01:15+00', 3.02, 1275, 7.04, 3, 6, 'purple', 9.9),
-  ('89ced7b1-a9df-4518-ac79-400b6b043afd', 'aaaaaaaa-0091-0091-0091-000000000091', '2026-02-10', '2026-02-10 17:27:00+00', '2026-02-10 18:01:44+00', 4.62, 2084, 7.52, 9, 9, 'purple', 13.6),
-  ('f74d85af-94cc-427f-9e4c-e2814612582b', 'aaaaaaaa-0096-0096-0096-000000000096', '2026-02-10', '2026-02-10 20:19:00+00', '2026-02-10 21:52:47+00', 13.1, 5627, 7.16, 18, 36, 'purple', 23.3),
-  ('2bcdf95d-f73f-48cd-b269-142901d0092f', 'aaaaaaaa-0013-0013-0013-000000000013', '2026-02-10', '2026-02-10 12:38:00+00', '2026-02-10 13:45:45+00', 10.33, 4065, 6.56, 22, 66, 'red', 12.0),
-  ('a8baa3df-a064-438f-9917-5ec13beddd8f', 'aaaaaaaa-0049-0049-0049-000000000049', '2026-02-10', '2026-02-10 11:59:00+00', '2026-02-10 13:03:55+00', 9.52, 3895, 6.82, 18, 54, 'blue', 6.6),
-  ('6a005833-85b0-4048-93b0-b70f2b933331', 'aaaaaaaa-0088-0088-0088-000000000088', '2026-02-10', '2026-02-10 08:55:00+00', '2026-02-10 10:16:31+00', 11.73, 4891, 6.95, 15, 30, 'purple', 3.1),
-  ('1dcf74fd-7460-4369-b61b-f6a3f213961f', 'aaaaaaaa-0039-0039-0039-000000000039', '2026-02-10', '2026-02-10 15:23:00+00', '2026-02-10 16:12:05+00', 10.27, 2945, 4.78, 19, 76, 'red', 4.9),
-  ('31f471b3-4ca3-4fe7-9ea7-e6b997b9139c', 'aaaaaaaa-0056-0056-0056-000000000056', '2026-02-10', '2026-02-10 15:43:00+00', '2026-02-10 16:44:54+00', 10.86, 3714, 5.7, 22, 22, 'blue', 9.9),
-  ('fa9dabf6-d4ac-4794-8e93-2edcc8c5986e', 'aaaaaaaa-0006-0006-0006-000000000006', '2026-02-10', '2026-02-10 10:57:00+00', '2026-02-10 11:48:30+00', 7.78, 3090, 6.62, 15, 60, 'red', 11.8),
-  ('627dc547-2c3b-4b47-b340-f1e0b396968c', 'aaaaaaaa-0076-0076-0076-000000000076', '2026-02-10', '2026-02-10 15:55:00+00', '2026-02-10 16:33:13+00', 7.8, 2293, 4.9, 13, 13, 'blue', 17.6),
-  ('7692812d-2245-4ac9-84f1-4cc79658b911', 'aaaaaaaa-0000-0000-0000-000000000000', '2026-02-10', '2026-02-10 07:21:00+00', '2026-02-10 07:53:00+00', 4.91, 1920, 6.52, 9, 9, 'red', 23.3),
-  ('85acb1e8-3052-49f2-9b0b-22cee973d286', 'aaaaaaaa-0095-0095-0095-000000000095', '2026-02-10', '2026-02-10 14:09:00+00', '2026-02-10 15:39:28+00', 11.63, 5428, 7.78, 25, 25, 'purple', 19.4),
-  ('1ce245c0-3bfe-4ff2-b013-11335d229996', 'aaaaaaaa-0048-0048-0048-000000000048', '2026-02-10', '2026-02-10 17:25:00+00', '2026-02-10 18:52:28+00', 11.71, 5248, 7.47, 21, 42, 'blue', 21.2),
-  ('a0fb156a-22ed-41cf-838d-fd05fa7d89cf', 'aaaaaaaa-0025-0025-0025-000000000025', '2026-02-10', '2026-02-10 14:29:00+00', '2026-02-10 14:49:37+00', 2.93, 1237, 7.04, 3, 3, 'red', 9.2),
-  ('982fa133-9ebb-4891-98c1-697569cd1a8d', 'aaaaaaaa-0031-0031-0031-000000000031', '2026-02-10', '2026-02-10 06:07:00+00', '2026-02-10 07:15:31+00', 10.51, 4111, 6.52, 23, 46, 'red', 12.7),
-  ('58733482-a552-4701-9413-57cd63a72e0a', 'aaaaaaaa-0047-0047-0047-000000000047', '2026-02-10', '2026-02-10 20:41:00+00', '2026-02-10 21:12:51+00', 5.13, 1911, 6.21, 11, 11, 'blue', 18.1),
-  ('98400d6e-09fc-440f-926a-7a26abb251ec', 'aaaaaaaa-0030-0030-0030-000000000030', '2026-02-10', '2026-02-10 10:00:00+00', '2026-02-10 11:07:07+00', 10.69, 4027, 6.28, 16, 32, 'red', 3.5),
-  ('42e783a4-0448-4395-b55d-9335f009c129', 'aaaaaaaa-0083-0083-0083-000000000083', '2026-02-10', '2026-02-10 20:44:00+00', '2026-02-10 21:51:13+00', 9.21, 4033, 7.3, 18, 18, 'purple', 5.7),
-  ('60b0536c-2877-4264-bb5d-80a849e7be52', 'aaaaaaaa-0011-0011-0011-000000000011', '2026-02-10', '2026-02-10 16:17:00+00', '2026-02-10 17:03:40+00', 6.07, 2800, 7.69, 6, 12, 'red', 24.9),
-  ('0b0670bb-1140-48f5-b210-c5c2b00466ff', 'aaaaaaaa-0002-0002-0002-000000000002', '2026-02-10', '2026-02-10 07:40:00+00', '2026-02-10 08:04:30+00', 3.67, 1470, 6.68, 7, 14, 'red', 4.6),
-  ('5b6cdb29-705e-490e-8666-252410594d6a', 'aaaaaaaa-0053-0053-0053-000000000053', '2026-02-10', '2026-02-10 17:14:00+00', '2026-02-10 18:45:55+00', 11.52, 5515, 7.98, 20, 20, 'blue', 18.3),
-  ('73d883e0-9e3d-4809-82fe-457ae3a6a86e', 'aaaaaaaa-0003-0003-0003-000000000003', '2026-02-10', '2026-02-10 10:22:00+00', '2026-02-10 10:55:42+00', 6.92, 2022, 4.87, 9, 36, 'red', 23.4),
-  ('5b92450b-3149-4324-98f7-94da1e371252', 'aaaaaaaa-0001-0001-0001-000000000001', '2026-02-10', '2026-02-10 14:26:00+00', '2026-02-10 15:51:44+00', 12.48, 5144, 6.87, 18, 18, 'red', 20.4),
-  ('7ecf0d95-9cf2-4a33-946b-1d9b3de8ada2', 'aaaaaaaa-0043-0043-0043-000000000043', '2026-02-10', '2026-02-10 12:11:00+00', '2026-02-10 13:40:40+00', 12.02, 5380, 7.46, 18, 54, 'blue', 17.0),
-  ('e6bbe61a-9503-4cf0-a05a-712c2c485d03', 'aaaaaaaa-0024-0024-0024-000000000024', '2026-02-10', '2026-02-10 12:53:00+00', '2026-02-10 13:15:10+00', 2.98, 1330, 7.44, 6, 18, 'red', 14.3),
-  ('eefbcaae-c408-48c5-9c68-36da50a66a3e', 'aaaaaaaa-0008-0008-0008-000000000008', '2026-02-10', '2026-02-10 16:56:00+00', '2026-02-10 18:00:41+00', 9.01, 3881, 7.18, 12, 12, 'red', 5.6),
-  ('608f4444-2e1c-4509-b0e7-405c2e9caa16', 'aaaaaaaa-0028-0028-0028-000000000028', '2026-02-10', '2026-02-10 05:22:00+00', '2026-02-10 06:29:18+00', 11.39, 4038, 5.91, 12, 48, 'red', 3.2),
-  ('53ba7940-e34d-4d98-b3af-3b4f7a15aca1', 'aaaaaaaa-0012-0012-0012-000000000012', '2026-02-10', '2026-02-10 18:38:00+00', '2026-02-10 20:12:09+00', 13.49, 5649, 6.98, 10, 30, 'red', 5.4),
-  ('9b892aa6-9210-45fb-8c36-f39a7a017ad2', 'aaaaaaaa-0021-0021-0021-000000000021', '2026-02-10', '2026-02-10 05:39:00+00', '2026-02-10 06:48:46+00', 11.59, 4186, 6.02, 6, 24, 'red', 9.4),
-  ('82e4fdee-c386-4065-ae99-c698fc781df5', 'aaaaaaaa-0068-0068-0068-000000000068', '2026-02-10', '2026-02-10 13:23:00+00', '2026-02-10 13:57:38+00', 4.6, 2078, 7.53, 9, 9, 'blue', 11.4),
-  ('73e8f380-c857-4d85-b29e-1f5a15da338c', 'aaaaaaaa-0005-0005-0005-000000000005', '2026-02-10', '2026-02-10 13:31:00+00', '2026-02-10 14:03:22+00', 5.65, 1942, 5.73, 2, 4, 'red', 12.2),
-  ('ac586ed3-c77f-47d6-a15c-75e6c1f8cffe', 'aaaaaaaa-0087-0087-0087-000000000087', '2026-02-10', '2026-02-10 08:02:00+00', '2026-02-10 08:39:29+00', 6.73, 2249, 5.57, 16, 16, 'purple', 5.1),
-  ('f5122d3c-549a-4ae9-ac04-8abdc4bd16d4', 'aaaaaaaa-0093-0093-0093-000000000093', '2026-02-10', '2026-02-10 21:59:00+00', '2026-02-10 23:13:03+00', 9.63, 4443, 7.69, 21, 42, 'purple', 17.4),
-  ('6939bde0-35ed-491f-8b86-734bb08d57f1', 'aaaaaaaa-0041-0041-0041-000000000041', '2026-02-10', '2026-02-10 10:14:00+00', '2026-02-10 11:58:32+00', 14.38, 6272, 7.27, 29, 29, 'blue', 6.7),
-  ('880d0d3c-3fb5-4ecf-bd91-9e8983f177fa', 'aaaaaaaa-0020-0020-0020-000000000020', '2026-02-10', '2026-02-10 08:00:00+00', '2026-02-10 08:13:48+00', 2.59, 828, 5.33, 3, 6, 'red', 3.9),
-  ('3534a194-5ca8-4e1b-a26b-51dc8473c511', 'aaaaaaaa-0035-0035-0035-000000000035', '2026-02-10', '2026-02-10 09:28:00+00', '2026-02-10 10:37:59+00', 10.43, 4199, 6.71, 11, 44, 'red', 24.4),
-  ('a44a8c6d-9709-4aa7-aad5-431279c2b240', 'aaaaaaaa-0040-0040-0040-000000000040', '2026-02-10', '2026-02-10 10:56:00+00', '2026-02-10 11:31:16+00', 5.01, 2116, 7.04, 7, 14, 'blue', 11.1),
-  ('76a30bde-4dfa-4c78-9af9-48f5c545ed2e', 'aaaaaaaa-0069-0069-0069-000000000069', '2026-02-10', '2026-02-10 05:38:00+00', '2026-02-10 06:03:20+00', 4.31, 1520, 5.88, 5, 15, 'blue', 16.4);
-
--- Hexes (156 hexes)
-INSERT INTO public.hexes (id, last_runner_team) VALUES
-  ('8928308292bffff', 'blue'),
-  ('89283082853ffff', 'red'),
-  ('892830828efffff', 'blue'),
-  ('89283082867ffff', 'blue'),
-  ('89283082987ffff', 'red'),
-  ('8928308291fffff', 'red'),
-  ('892830829d3ffff', 'blue'),
-  ('89283082977ffff', 'purple'),
-  ('892830828a7ffff', 'red'),
-  ('8928308297bffff', 'red'),
-  ('8928308296bffff', 'blue'),
-  ('892830828d7ffff', 'purple'),
-  ('89283082913ffff', 'red'),
-  ('8928308284bffff', 'blue'),
-  ('892830828afffff', 'red'),
-  ('89283082a23ffff', 'blue'),
-  ('892830828fbffff', 'blue'),
-  ('89283082a4fffff', 'blue'),
-  ('892830829dbffff', 'red'),
-  ('89283082a5fffff', 'red'),
-  ('89283082917ffff', 'red'),
-  ('892830828e3ffff', 'red'),
-  ('8928308294fffff', 'red'),
-  ('8928308283bffff', 'red'),
-  ('892830828ebffff', 'red'),
-  ('89283082823ffff', 'red'),
-  ('89283082943ffff', 'blue'),
-  ('892830828dbffff', 'red'),
-  ('892830829ffffff', 'blue'),
-  ('89283082997ffff', 'blue'),
-  ('892830829d7ffff', 'blue'),
-  ('89283082893ffff', 'blue'),
-  ('8928308290fffff', 'red'),
-  ('8928308288fffff', 'blue'),
-  ('892830828ffffff', 'red'),
-  ('89283082a3fffff', 'purple'),
-  ('89283082a27ffff', 'red'),
-  ('89283082a0bffff', 'blue'),
-  ('892830829fbffff', 'blue'),
-  ('8928308285fffff', 'blue'),
-  ('89283082833ffff', 'red'),
-  ('89283082873ffff', 'blue'),
-  ('8928308289fffff', 'purple'),
-  ('892830828a3ffff', 'blue'),
-  ('892830829b3ffff', 'red'),
-  ('89283082843ffff', 'blue'),
-  ('8928308298bffff', 'blue'),
-  ('892830829dfffff', 'red'),
-  ('89283082a1fffff', 'red'),
-  ('89283082903ffff', 'purple'),
-  ('8928308280bffff', 'red'),
-  ('89283082877ffff', 'red'),
-  ('8928308295fffff', 'purple'),
-  ('89283082a5bffff', 'purple'),
-  ('8928308292fffff', 'red'),
-  ('892830829bfffff', 'purple'),
-  ('89283082a03ffff', 'blue'),
-  ('892830828b7ffff', 'blue'),
-  ('89283082a07ffff', 'red'),
-  ('8928308286fffff', 'red'),
-  ('89283082933ffff', 'red'),
-  ('89283082a67ffff', 'purple'),
-  ('892830828cbffff', 'red'),
-  ('8928308297fffff', 'purple'),
-  ('89283082a2bffff', 'red'),
-  ('89283082803ffff', 'blue'),
-  ('8928308294bffff', 'red'),
-  ('892830829f7ffff', 'blue'),
-  ('89283082813ffff', 'red'),
-  ('89283082973ffff', 'purple'),
-  ('8928308293bffff', 'blue'),
-  ('892830828f7ffff', 'blue'),
-  ('89283082857ffff', 'red'),
-  ('892830829f3ffff', 'red'),
-  ('89283082847ffff', 'blue'),
-  ('89283082883ffff', 'purple'),
-  ('892830829e7ffff', 'purple'),
-  ('8928308291bffff', 'blue'),
-  ('89283082a13ffff', 'red'),
-  ('89283082887ffff', 'blue'),
-  ('89283082937ffff', 'blue'),
-  ('8928308293fffff', 'blue'),
-  ('8928308299bffff', 'blue'),
-  ('892830829c3ffff', 'blue'),
-  ('892830829cfffff', 'blue'),
-  ('8928308287bffff', 'purple'),
-  ('892830828e7ffff', 'red'),
-  ('8928308295bffff', 'blue'),
-  ('89283082817ffff', 'blue'),
-  ('89283082a37ffff', 'red'),
-  ('89283082807ffff', 'red'),
-  ('8928308283fffff', 'blue'),
-  ('89283082a3bffff', 'blue'),
-  ('89283082953ffff', 'purple'),
-  ('89283082a4bffff', 'red'),
-  ('892830829a3ffff', 'red'),
-  ('892830828c3ffff', 'blue'),
-  ('89283082863ffff', 'red'),
-  ('892830829bbffff', 'red'),
-  ('892830829a7ffff', 'red'),
-  ('89283082837ffff', 'red'),
-  ('892830829cbffff', 'purple'),
-  ('892830828bbffff', 'blue'),
-  ('8928308284fffff', 'blue'),
-  ('892830829c7ffff', 'red'),
-  ('89283082a33ffff', 'red'),
-  ('8928308280fffff', 'purple'),
-  ('892830828abffff', 'blue'),
-  ('8928308298fffff', 'blue'),
-  ('89283082927ffff', 'red'),
-  ('892830828dfffff', 'blue'),
-  ('89283082a53ffff', 'red'),
-  ('892830828bfffff', 'blue'),
-  ('89283082a47ffff', 'blue'),
-  ('89283082a63ffff', 'red'),
-  ('8928308282bffff', 'red'),
-  ('892830829afffff', 'purple'),
-  ('89283082a43ffff', 'red'),
-  ('89283082a17ffff', 'purple'),
-  ('8928308290bffff', 'blue'),
-  ('892830828d3ffff', 'red'),
-  ('89283082a2fffff', 'purple'),
-  ('892830828b3ffff', 'red'),
-  ('8928308286bffff', 'red'),
-  ('8928308288bffff', 'red'),
-  ('8928308282fffff', 'blue'),
-  ('89283082957ffff', 'blue'),
-  ('8928308289bffff', 'red'),
-  ('89283082827ffff', 'red'),
-  ('89283082897ffff', 'red'),
-  ('8928308296fffff', 'red'),
-  ('892830828f3ffff', 'purple'),
-  ('8928308281bffff', 'red'),
-  ('89283082a0fffff', 'blue'),
-  ('892830829e3ffff', 'red'),
-  ('892830828cfffff', 'purple'),
-  ('89283082967ffff', 'red'),
-  ('8928308281fffff', 'blue'),
-  ('89283082907ffff', 'red'),
-  ('8928308287fffff', 'red'),
-  ('8928308299fffff', 'blue'),
-  ('892830828c7ffff', 'purple'),
-  ('89283082923ffff', 'blue'),
-  ('89283082a6fffff', 'red'),
-  ('892830829abffff', 'purple'),
-  ('89283082947ffff', 'red'),
-  ('892830829b7ffff', 'blue'),
-  ('89283082a57ffff', 'purple'),
-  ('892830829ebffff', 'blue'),
-  ('89283082a6bffff', 'purple'),
-  ('89283082993ffff', 'red'),
-  ('89283082963ffff', 'purple'),
-  ('892830829efffff', 'purple'),
-  ('89283082a1bffff', 'blue'),
-  ('8928308285bffff', 'purple'),
-  ('89283082983ffff', 'red')
-ON CONFLICT (id) DO UPDATE SET last_runner_team = EXCLUDED.last_runner_team;
-
--- Update season points for 100 users
-UPDATE public.users SET season_points = 100 WHERE id = 'aaaaaaaa-0000-0000-0000-000000000000';
-UPDATE public.users SET season_points = 124 WHERE id = 'aaaaaaaa-0001-0001-0001-000000000001';
-UPDATE public.users SET season_points = 108 WHERE id = 'aaaaaaaa-0002-0002-0002-000000000002';
-UPDATE public.users SET season_points = 225 WHERE id = 'aaaaaaaa-0003-0003-0003-000000000003';
-UPDATE public.users SET season_points = 105 WHERE id = 'aaaaaaaa-0004-0004-0004-000000000004';
-UPDATE public.users SET season_points = 83 WHERE id = 'aaaaaaaa-0005-0005-0005-000000000005';
-UPDATE public.users SET season_points = 282 WHERE id = 'aaaaaaaa-0006-0006-0006-000000000006';
-UPDATE public.users SET season_points = 87 WHERE id = 'aaaaaaaa-0007-0007-0007-000000000007';
-UPDATE public.users SET season_points = 12 WHERE id = 'aaaaaaaa-0008-0008-0008-000000000008';
-UPDATE public.users SET season_points = 86 WHERE id = 'aaaaaaaa-0009-0009-0009-000000000009';
-UPDATE public.users SET season_points = 250 WHERE id = 'aaaaaaaa-0010-0010-0010-000000000010';
-UPDATE public.users SET season_points = 167 WHERE id = 'aaaaaaaa-0011-0011-0011-000000000011';
-UPDATE public.users SET season_points = 144 WHERE id = 'aaaaaaaa-0012-0012-0012-000000000012';
-UPDATE public.users SET season_points = 90 WHERE id = 'aaaaaaaa-0013-0013-0013-000000000013';
-UPDATE public.users SET season_points = 108 WHERE id = 'aaaaaaaa-0014-0014-0014-000000000014';
-UPDATE public.users SET season_points = 60 WHERE id = 'aaaaaaaa-0015-0015-0015-000000000015';
-UPDATE public.users SET season_points = 98 WHERE id = 'aaaaaaaa-0016-0016-0016-000000000016';
-UPDATE public.users SET season_points = 99 WHERE id = 'aaaaaaaa-0017-0017-0017-000000000017';
-UPDATE public.users SET season_points = 79 WHERE id = 'aaaaaaaa-0018-0018-0018-000000000018';
-UPDATE public.users SET season_points = 105 WHERE id = 'aaaaaaaa-0019-0019-0019-000000000019';
-UPDATE public.users SET season_points = 115 WHERE id = 'aaaaaaaa-0020-0020-0020-000000000020';
-UPDATE public.users SET season_points = 160 WHERE id = 'aaaaaaaa-0021-0021-0021-000000000021';
-UPDATE public.users SET season_points = 149 WHERE id = 'aaaaaaaa-0022-0022-0022-000000000022';
-UPDATE public.users SET season_points = 83 WHERE id = 'aaaaaaaa-0023-0023-0023-000000000023';
-UPDATE public.users SET season_points = 82 WHERE id = 'aaaaaaaa-0024-0024-0024-000000000024';
-UPDATE public.users SET season_points = 166 WHERE id = 'aaaaaaaa-0025-0025-0025-000000000025';
-UPDATE public.users SET season_points = 68 WHERE id = 'aaaaaaaa-0026-0026-0026-000000000026';
-UPDATE public.users SET season_points = 162 WHERE id = 'aaaaaaaa-0027-0027-0027-000000000027';
-UPDATE public.users SET season_points = 240 WHERE id = 'aaaaaaaa-0028-0028-0028-000000000028';
-UPDATE public.users SET season_points = 168 WHERE id = 'aaaaaaaa-0029-0029-0029-000000000029';
-UPDATE public.users SET season_points = 79 WHERE id = 'aaaaaaaa-0030-0030-0030-000000000030';
-UPDATE public.users SET season_points = 198 WHERE id = 'aaaaaaaa-0031-0031-0031-000000000031';
-UPDATE public.users SET season_points = 74 WHERE id = 'aaaaaaaa-0032-0032-0032-000000000032';
-UPDATE public.users SET season_points = 95 WHERE id = 'aaaaaaaa-0033-0033-0033-000000000033';
-UPDATE public.users SET season_points = 71 WHERE id = 'aaaaaaaa-0034-0034-0034-000000000034';
-UPDATE public.users SET season_points = 160 WHERE id = 'aaaaaaaa-0035-0035-0035-000000000035';
-UPDATE public.users SET season_points = 154 WHERE id = 'aaaaaaaa-0036-0036-0036-000000000036';
-UPDATE public.users SET season_points = 152 WHERE id = 'aaaaaaaa-0037-0037-0037-000000000037';
-UPDATE public.users SET season_points = 93 WHERE id = 'aaaaaaaa-0038-0038-0038-000000000038';
-UPDATE public.users SET season_points = 259 WHERE id = 'aaaaaaaa-0039-0039-0039-000000000039';
-UPDATE public.users SET season_points = 103 WHERE id = 'aaaaaaaa-0040-0040-0040-000000000040';
-UPDATE public.users SET season_points = 83 WHERE id = 'aaaaaaaa-0041-0041-0041-000000000041';
-UPDATE public.users SET season_points = 59 WHERE id = 'aaaaaaaa-0042-0042-0042-000000000042';
-UPDATE public.users SET season_points = 185 WHERE id = 'aaaaaaaa-0043-0043-0043-000000000043';
-UPDATE public.users SET season_points = 116 WHERE id = 'aaaaaaaa-0044-0044-0044-000000000044';
-UPDATE public.users SET season_points = 51 WHERE id = 'aaaaaaaa-0045-0045-0045-000000000045';
-UPDATE public.users SET season_points = 57 WHERE id = 'aaaaaaaa-0046-0046-0046-000000000046';
-UPDATE public.users SET season_points = 62 WHERE id = 'aaaaaaaa-0047-0047-0047-000000000047';
-UPDATE public.users SET season_points = 157 WHERE id = 'aaaaaaaa-0048-0048-0048-000000000048';
-UPDATE public.users SET season_points = 168 WHERE id = 'aaaaaaaa-0049-0049-0049-000000000049';
-UPDATE public.users SET season_points = 110 WHERE id = 'aaaaaaaa-0050-0050-0050-000000000050';
-UPDATE public.users SET season_points = 57 WHERE id = 'aaaaaaaa-0051-0051-0051-000000000051';
-UPDATE public.users SET season_points = 44 WHERE id = 'aaaaaaaa-0052-0052-0052-000000000052';
-UPDATE public.users SET season_points = 131 WHERE id = 'aaaaaaaa-0053-0053-0053-000000000053';
-UPDATE public.users SET season_points = 71 WHERE id = 'aaaaaaaa-0054-0054-0054-000000000054';
-UPDATE public.users SET season_points = 94 WHERE id = 'aaaaaaaa-0055-0055-0055-000000000055';
-UPDATE public.users SET season_points = 22 WHERE id = 'aaaaaaaa-0056-0056-0056-000000000056';
-UPDATE public.users SET season_points = 134 WHERE id = 'aaaaaaaa-0057-0057-0057-000000000057';
-UPDATE public.users SET season_points = 123 WHERE id = 'aaaaaaaa-0058-0058-0058-000000000058';
-UPDATE public.users SET season_points = 45 WHERE id = 'aaaaaaaa-0059-0059-0059-000000000059';
-UPDATE public.users SET season_points = 78 WHERE id = 'aaaaaaaa-0060-0060-0060-000000000060';
-UPDATE public.users SET season_points = 54 WHERE id = 'aaaaaaaa-0061-0061-0061-000000000061';
-UPDATE public.users SET season_points = 114 WHERE id = 'aaaaaaaa-0062-0062-0062-000000000062';
-UPDATE public.users SET season_points = 17 WHERE id = 'aaaaaaaa-0063-0063-0063-000000000063';
-UPDATE public.users SET season_points = 208 WHERE id = 'aaaaaaaa-0064-0064-0064-000000000064';
-UPDATE public.users SET season_points = 41 WHERE id = 'aaaaaaaa-0065-0065-0065-000000000065';
-UPDATE public.users SET season_points = 119 WHERE id = 'aaaaaaaa-0066-0066-0066-000000000066';
-UPDATE public.users SET season_points = 44 WHERE id = 'aaaaaaaa-0067-0067-0067-000000000067';
-UPDATE public.users SET season_points = 57 WHERE id = 'aaaaaaaa-0068-0068-0068-000000000068';
-UPDATE public.users SET season_points = 29 WHERE id = 'aaaaaaaa-0069-0069-0069-000000000069';
-UPDATE public.users SET season_points = 139 WHERE id = 'aaaaaaaa-0070-0070-0070-000000000070';
-UPDATE public.users SET season_points = 113 WHERE id = 'aaaaaaaa-0071-0071-0071-000000000071';
-UPDATE public.users SET season_points = 140 WHERE id = 'aaaaaaaa-0072-0072-0072-000000000072';
-UPDATE public.users SET season_points = 93 WHERE id = 'aaaaaaaa-0073-0073-0073-000000000073';
-UPDATE public.users SET season_points = 54 WHERE id = 'aaaaaaaa-0074-0074-0074-000000000074';
-UPDATE public.users SET season_points = 157 WHERE id = 'aaaaaaaa-0075-0075-0075-000000000075';
-UPDATE public.users SET season_points = 77 WHERE id = 'aaaaaaaa-0076-0076-0076-000000000076';
-UPDATE public.users SET season_points = 44 WHERE id = 'aaaaaaaa-0077-0077-0077-000000000077';
-UPDATE public.users SET season_points = 82 WHERE id = 'aaaaaaaa-0078-0078-0078-000000000078';
-UPDATE public.users SET season_points = 73 WHERE id = 'aaaaaaaa-0079-0079-0079-000000000079';
-UPDATE public.users SET season_points = 44 WHERE id = 'aaaaaaaa-0080-0080-0080-000000000080';
-UPDATE public.users SET season_points = 104 WHERE id = 'aaaaaaaa-0081-0081-0081-000000000081';
-UPDATE public.users SET season_points = 51 WHERE id = 'aaaaaaaa-0082-0082-0082-000000000082';
-UPDATE public.users SET season_points = 229 WHERE id = 'aaaaaaaa-0083-0083-0083-000000000083';
-UPDATE public.users SET season_points = 109 WHERE id = 'aaaaaaaa-0084-0084-0084-000000000084';
-UPDATE public.users SET season_points = 59 WHERE id = 'aaaaaaaa-0085-0085-0085-000000000085';
-UPDATE public.users SET season_points = 44 WHERE id = 'aaaaaaaa-0086-0086-0086-000000000086';
-UPDATE public.users SET season_points = 181 WHERE id = 'aaaaaaaa-0087-0087-0087-000000000087';
-UPDATE public.users SET season_points = 132 WHERE id = 'aaaaaaaa-0088-0088-0088-000000000088';
-UPDATE public.users SET season_points = 92 WHERE id = 'aaaaaaaa-0089-0089-0089-000000000089';
-UPDATE public.users SET season_points = 77 WHERE id = 'aaaaaaaa-0090-0090-0090-000000000090';
-UPDATE public.users SET season_points = 83 WHERE id = 'aaaaaaaa-0091-0091-0091-000000000091';
-UPDATE public.users SET season_points = 142 WHERE id = 'aaaaaaaa-0092-0092-0092-000000000092';
-UPDATE public.users SET season_points = 201 WHERE id = 'aaaaaaaa-0093-0093-0093-000000000093';
-UPDATE public.users SET season_points = 161 WHERE id = 'aaaaaaaa-0094-0094-0094-000000000094';
-UPDATE public.users SET season_points = 82 WHERE id = 'aaaaaaaa-0095-0095-0095-000000000095';
-UPDATE public.users SET season_points = 129 WHERE id = 'aaaaaaaa-0096-0096-0096-000000000096';
-UPDATE public.users SET season_points = 86 WHERE id = 'aaaaaaaa-0097-0097-0097-000000000097';
-UPDATE public.users SET season_points = 138 WHERE id = 'aaaaaaaa-0098-0098-0098-000000000098';
-UPDATE public.users SET season_points = 88 WHERE id = 'aaaaaaaa-0099-0099-0099-000000000099';
-
--- Summary:
---   Users: 100
---   Days: 7
---   Total runs: 360
---   Total distance: 3097.4 km
---   Total flips: 4890
---   Hexes touched: 156
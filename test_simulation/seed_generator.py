@@ -0,0 +1,501 @@
+#!/usr/bin/env python3
+"""
+RunStrict Bot Seed Generator
+
+Parametric replacement for scripts/generate_seed.py (100 bots, 49 fixed hexes,
+fixed dates). It takes the bot count, team mix, region and date range:
+
+  - region: any Res 5 province, expanded through H3 into its Res 9 cells
+    (7^4 = 2,401). Bots live in a random cell, and each run is a walk of
+    flip_count cells from home that stays inside the province.
+  - runs: one per bot per active day. Participation, distance, pace and CV
+    follow simulate_day's archetypes (elite / normal / slow).
+  - users: season_points and the run aggregates match the bot's run_history.
+  - hexes: last runner per cell, with its Res 6 district_hex. hex_snapshot is
+    frozen the day after --end, and daily_all_range_stats is written for --end.
+    daily_buff_stats is left to calculate_daily_buffs(), which counts hexes per
+    district_hex and reads users.district_hex / province_hex; both are written.
+
+Bots are generated vectorized, --chunk-bots at a time. Each chunk is written
+to its own part file per table and is seeded by (seed, chunk), so the output
+does not depend on --jobs. Chunks are spread over --jobs processes, and memory
+stays constant in the bot count and the number of days. Only the per-cell
+hex ownership (one province) is merged in the parent.
+
+    <out>/users/part-0000.csv
+    <out>/run_history/part-0000.csv
+    <out>/hexes/part-0000.csv            # + hex_snapshot, daily_all_range_stats
+    <out>/load.sql                       # psql: cleanup, auth.users, \\copy in FK order
+
+--format sql writes INSERT ... VALUES statements of --rows-per-insert rows
+(part-NNNN.sql) instead, for the SQL editor. load.sql then \\i's the parts.
+
+Bot ids are bbbbbbbb-0000-0000-0000-<n>, so seeds and simulate_day users
+(aaaaaaaa-...) can coexist. load.sql first deletes earlier bots. auth.users
+rows are built in load.sql from generate_series(), because every column is a
+constant or derived from n; as CSV they were a third of the output.
+
+Usage:
+    python3 seed_generator.py --out out/seed                          # 100 bots, 40/40/20, last 5 days
+    python3 seed_generator.py --bots 1000000 --jobs 8 --out out/seed1m
+    python3 seed_generator.py --bots 5000 --teams red=45,blue=45,purple=10 \\
+      --province 85283473fffffff --start 2026-02-11 --end 2026-02-15 --out out/seed
+    python3 seed_generator.py --bots 100 --format sql --out out/seed_sql
+    psql "$DATABASE_URL" -f out/seed/load.sql
+
+Requires: pip install h3 numpy pyarrow
+"""
+
+import argparse
+import math
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    print("ERROR: pyarrow required. Install with: pip install pyarrow", file=sys.stderr)
+    sys.exit(1)
+
+import simulate_day as sim
+
+BOT_ID_PREFIX = 'bbbbbbbb-0000-0000-0000-'
+RUN_ID_PREFIX = 'cccccccc-'
+BOT_EMAIL_DOMAIN = '@runstrict.test'
+PASSWORD_HASH = '$2a$10$SimulatedPasswordHashForTestingOnly000000000000000000000'
+APP_META_DATA = '{"provider":"email","providers":["email"]}'
+
+TEAMS = ('red', 'blue', 'purple')
+GOLDEN = 0.6180339887498949
+
+MANIFESTOS = [
+    "Run or die trying", "Pace is grace", "Born to run", "Chasing the horizon", "Never stop moving",
+    "Speed is life", "Endurance is key", "Run free", "Hex hunter", "Territory taker",
+    "Red team rules", "Blue wave incoming", "Purple chaos reigns", "Just one more mile", "Sweat is glory",
+    "Miles to go", "On the run", "Slow and steady", "Run hard", "Run smart",
+]
+
+AUTH_USERS_SQL = """
+INSERT INTO auth.users (id, instance_id, aud, role, encrypted_password, email_confirmed_at, created_at, updated_at,
+                        confirmation_token, email, raw_app_meta_data, raw_user_meta_data)
+SELECT ('{prefix}' || lpad(n::text, 12, '0'))::uuid, '00000000-0000-0000-0000-000000000000', 'authenticated',
+       'authenticated', '{password}', now(), now(), now(), '', 'bot' || lpad(n::text, 3, '0') || '{domain}',
+       '{app_meta}', '{{}}'
+FROM generate_series(0, {last}) AS n;"""
+
+# table -> (qualified name, columns), in load (FK) order after auth.users
+TABLES = {
+    'users': ('public.users', ['id', 'name', 'team', 'avatar', 'manifesto', 'nationality', 'season_points',
+                               'home_hex', 'home_hex_start', 'home_hex_end', 'season_home_hex', 'district_hex',
+                               'province_hex', 'total_distance_km', 'total_runs', 'avg_pace_min_per_km', 'avg_cv',
+                               'cv_run_count']),
+    'run_history': ('public.run_history', ['id', 'user_id', 'run_date', 'start_time', 'end_time', 'distance_km',
+                                           'duration_seconds', 'avg_pace_min_per_km', 'flip_count',
+                                           'flip_points', 'cv', 'team_at_run']),
+    'hexes': ('public.hexes', ['id', 'last_runner_team', 'last_flipped_at', 'parent_hex', 'district_hex']),
+    'hex_snapshot': ('public.hex_snapshot', ['hex_id', 'last_runner_team', 'snapshot_date',
+                                             'last_run_end_time', 'parent_hex']),
+    'daily_all_range_stats': ('public.daily_all_range_stats', ['stat_date', 'dominant_team', 'red_hex_count',
+                                                               'blue_hex_count', 'purple_hex_count']),
+}
+
+TS = pa.timestamp('s', tz='UTC')
+
+
+# ==================== Region ====================
+
+class Region:
+    """A Res 5 province as arrays over its Res 9 cells."""
+
+    def __init__(self, province):
+        self.province = province
+        self.cells = sorted(sim.h3.cell_to_children(province, sim.BASE_RESOLUTION))
+        index = {c: k for k, c in enumerate(self.cells)}
+        # Neighbours outside the province map to the cell itself, so walks stay in the region.
+        # Pentagons have 5 neighbours; the sixth slot is the cell itself too.
+        self.neighbors = np.array([([index.get(n, k) for n in sorted(sim.h3.grid_ring(c, 1))] + [k])[:6]
+                                   for k, c in enumerate(self.cells)], dtype=np.int32)
+        self.cell_array = pa.array(self.cells)
+        self.district_array = pa.array([sim.h3.cell_to_parent(c, sim.CITY_RESOLUTION) for c in self.cells])
+
+
+_REGIONS = {}
+
+
+def region_for(province):
+    """Per-process Region cache (workers build it once)."""
+    if province not in _REGIONS:
+        _REGIONS[province] = Region(province)
+    return _REGIONS[province]
+
+
+# ==================== Bots ====================
+
+def padded(ints, width):
+    return pc.utf8_lpad(pc.cast(pa.array(ints), pa.string()), width, '0')
+
+
+def join(*parts):
+    return pc.binary_join_element_wise(*parts, '')
+
+
+def bot_ids(idx):
+    return join(BOT_ID_PREFIX, padded(idx, 12))
+
+
+def team_stride(bots):
+    """A stride near bots * GOLDEN and coprime to bots: i -> i * stride % bots is a well-mixed permutation."""
+    stride = max(1, round(bots * GOLDEN))
+    while math.gcd(stride, bots) != 1:
+        stride += 1
+    return stride
+
+
+def team_codes(idx, weights, bots, stride):
+    """Team per bot index: the --teams mix exactly (to rounding), interleaved rather than in blocks."""
+    bounds = np.cumsum(weights)[:-1] / sum(weights)
+    position = ((idx * stride) % bots + 0.5) / bots
+    return np.searchsorted(bounds, position, side='right').astype(np.int8)
+
+
+def pick(values, codes):
+    return pa.array(values).take(pa.array(codes))
+
+
+def users_table(idx, ids, teams, home, region, agg):
+    """public.users rows; names, avatars and nationalities follow simulate_day.generate_users."""
+    suffix = pc.if_else(pa.array(idx >= len(sim.FIRST_NAMES)),
+                        pc.cast(pa.array(idx // len(sim.FIRST_NAMES)), pa.string()), '')
+    name = join(pick(sim.FIRST_NAMES, idx % len(sim.FIRST_NAMES)),
+                pick(sim.LAST_NAMES, idx % len(sim.LAST_NAMES)), suffix)
+    home_hex = region.cell_array.take(pa.array(home))
+    runs = agg['runs']
+    ran = runs > 0
+    with np.errstate(invalid='ignore', divide='ignore'):
+        pace = np.round(agg['minutes'] / agg['distance'], 2)
+        cv = np.round(agg['cv'] / runs, 2)
+    return pa.table([
+        ids, name, pick(TEAMS, teams), pick(sim.AVATARS, idx % len(sim.AVATARS)),
+        pick(MANIFESTOS, idx % len(MANIFESTOS)), pick(sim.NATIONALITIES, idx % len(sim.NATIONALITIES)),
+        pa.array(agg['points']), home_hex, home_hex, home_hex, home_hex,
+        region.district_array.take(pa.array(home)), pa.repeat(region.province, len(idx)),
+        pa.array(np.round(agg['distance'], 2)), pa.array(runs),
+        pa.array(pace, mask=~ran), pa.array(cv, mask=~ran), pa.array(runs),
+    ], names=TABLES['users'][1])
+
+
+# ==================== Runs ====================
+
+def day_runs(rng, idx, ids, teams, home, arch, day, run_date, region, agg, ownership):
+    """One day's run_history rows for a chunk of bots. Updates `agg` and walks the hexes into `ownership`."""
+    cfg = list(sim.ARCHETYPES.values())
+
+    def lo_hi(key):
+        return np.array([c[key][0] for c in cfg])[arch], np.array([c[key][1] for c in cfg])[arch]
+
+    n = len(idx)
+    active = rng.random(n) < np.array([c['participation'] for c in cfg])[arch]
+    dist = rng.uniform(*lo_hi('dist'))
+    pace = rng.uniform(*lo_hi('pace'))
+    cv = rng.uniform(*lo_hi('cv'))
+    morning = rng.random(n) < 0.6
+    hour = np.clip(np.where(morning, rng.normal(7.0, 1.0, n), rng.normal(19.0, 1.5, n)), 5.0, 22.0)
+    flips = (dist * rng.uniform(1.5, 3.0, n)).astype(np.int32)
+
+    sel = np.flatnonzero(active)
+    dist, pace, cv = np.round(dist[sel], 2), np.round(pace[sel], 2), np.round(cv[sel], 2)
+    hour, flips = hour[sel], flips[sel]
+    duration = (dist * pace * 60).astype(np.int64)
+    midnight = int(datetime(run_date.year, run_date.month, run_date.day, tzinfo=sim.GMT2).timestamp())
+    start = midnight + (hour * 3600).astype(np.int64)
+    end = start + duration
+
+    agg['distance'][sel] += dist
+    agg['minutes'][sel] += duration / 60.0
+    agg['cv'][sel] += cv
+    agg['pace'][sel] += pace
+    agg['runs'][sel] += 1
+    agg['points'][sel] += flips   # buff multiplier 1, as the 100-bot seed
+    walk(rng, home[sel], flips, end, teams[sel], region, ownership)
+
+    run_ids = join(RUN_ID_PREFIX, padded(np.full(len(sel), day), 4), '-0000-0000-', padded(idx[sel], 12))
+    return pa.table([
+        run_ids, ids.take(pa.array(sel)), pa.array(np.full(len(sel), run_date), pa.date32()),
+        pa.array(start, TS), pa.array(end, TS), pa.array(dist), pa.array(duration),
+        pa.array(pace), pa.array(flips), pa.array(flips), pa.array(cv), pick(TEAMS, teams[sel]),
+    ], names=TABLES['run_history'][1])
+
+
+def walk(rng, home, length, end, teams, region, ownership):
+    """Walk each run `length` cells from home; keep the latest end_time (and team) per cell."""
+    last_end, last_team = ownership
+    order = np.argsort(end, kind='stable')   # within a step, the last write per cell is the latest run
+    pos, length, end, teams = home[order], length[order], end[order], teams[order]
+    for step in range(int(length.max(initial=0))):
+        live = np.flatnonzero(length > step)
+        if step:
+            pos[live] = region.neighbors[pos[live], rng.integers(0, 6, len(live))]
+        cells = pos[live]
+        newer = end[live] > last_end[cells]
+        last_end[cells[newer]] = end[live][newer]
+        last_team[cells[newer]] = teams[live][newer]
+
+
+# ==================== Output ====================
+
+def sql_literals(table):
+    """Each column as SQL literals ('text', 1.5, NULL)."""
+    cols = []
+    for col in table.columns:
+        if pa.types.is_timestamp(col.type):
+            text = pc.strftime(col, format='%Y-%m-%d %H:%M:%S+00')
+        else:
+            text = pc.cast(col, pa.string())
+        if pa.types.is_string(col.type) or pa.types.is_timestamp(col.type) or pa.types.is_date(col.type):
+            text = join("'", pc.replace_substring(text, "'", "''"), "'")
+        cols.append(text.fill_null('NULL'))
+    return pc.binary_join_element_wise(*cols, ', ')
+
+
+class PartWriter:
+    """One part file of one table, as COPY CSV (with header) or INSERT statements."""
+
+    def __init__(self, path, table, fmt, rows_per_insert):
+        self.path = path
+        self.name, self.columns = TABLES[table]
+        self.fmt = fmt
+        self.rows_per_insert = rows_per_insert
+        self.rows = 0
+        self._csv = None
+        self._sql = open(path, 'w') if fmt == 'sql' else None
+
+    def write(self, table):
+        self.rows += table.num_rows
+        if self.fmt == 'csv':
+            if self._csv is None:
+                self._csv = pacsv.CSVWriter(str(self.path), table.schema)
+            self._csv.write_table(table)
+            return
+        header = f"INSERT INTO {self.name} ({', '.join(self.columns)}) VALUES\n"
+        values = sql_literals(table)
+        for k in range(0, table.num_rows, self.rows_per_insert):
+            rows = values.slice(k, self.rows_per_insert).to_pylist()
+            self._sql.write(header + "  (" + "),\n  (".join(rows) + ")\nON CONFLICT DO NOTHING;\n")
+
+    def close(self):
+        if self._csv is not None:
+            self._csv.close()
+        if self._sql is not None:
+            self._sql.close()
+
+
+def part_path(out, table, k, fmt):
+    return Path(out) / table / f"part-{k:04d}.{fmt}"
+
+
+def generate_chunk(spec, k):
+    """Bots [k * chunk_bots, ...): users / run_history parts. Returns row counts and hex ownership."""
+    region = region_for(spec['province'])
+    i0 = k * spec['chunk_bots']
+    idx = np.arange(i0, min(i0 + spec['chunk_bots'], spec['bots']), dtype=np.int64)
+    n = len(idx)
+    rng = np.random.default_rng([spec['seed'], k])
+    ids = bot_ids(idx)
+    teams = team_codes(idx, spec['weights'], spec['bots'], spec['stride'])
+    home = rng.integers(0, len(region.cells), n).astype(np.int32)
+    weights = np.array([c['weight'] for c in sim.ARCHETYPES.values()], dtype=float)
+    arch = rng.choice(len(weights), n, p=weights / weights.sum())
+    agg = {'distance': np.zeros(n), 'minutes': np.zeros(n), 'cv': np.zeros(n), 'pace': np.zeros(n),
+           'runs': np.zeros(n, dtype=np.int32), 'points': np.zeros(n, dtype=np.int32)}
+    ownership = (np.zeros(len(region.cells), dtype=np.int64), np.full(len(region.cells), -1, dtype=np.int8))
+
+    fmt, out, per_insert = spec['format'], spec['out'], spec['rows_per_insert']
+    runs = PartWriter(part_path(out, 'run_history', k, fmt), 'run_history', fmt, per_insert)
+    for day in range(spec['days']):
+        run_date = spec['start'] + timedelta(days=day)
+        runs.write(day_runs(rng, idx, ids, teams, home, arch, day, run_date, region, agg, ownership))
+    runs.close()
+
+    counts = {'run_history': runs.rows}
+    users = PartWriter(part_path(out, 'users', k, fmt), 'users', fmt, per_insert)
+    users.write(users_table(idx, ids, teams, home, region, agg))
+    users.close()
+    counts['users'] = users.rows
+    return counts, ownership
+
+
+def region_tables(spec, region, last_end, last_team):
+    """hexes, hex_snapshot (the day after --end) and daily_all_range_stats from the merged ownership."""
+    owned = np.flatnonzero(last_team >= 0)
+    cells = region.cell_array.take(pa.array(owned))
+    team = pick(TEAMS, last_team[owned])
+    at = pa.array(last_end[owned], TS)
+    parent = pa.repeat(spec['province'], len(owned))
+    end = spec['start'] + timedelta(days=spec['days'] - 1)
+    counts = np.bincount(last_team[owned], minlength=len(TEAMS))
+    return {
+        'hexes': pa.table([cells, team, at, parent, region.district_array.take(pa.array(owned))],
+                          names=TABLES['hexes'][1]),
+        'hex_snapshot': pa.table([cells, team, pa.repeat(pa.scalar(end + timedelta(days=1), pa.date32()), len(owned)),
+                                  at, parent], names=TABLES['hex_snapshot'][1]),
+        'daily_all_range_stats': pa.table([pa.array([end], pa.date32()),
+                                           pa.array([TEAMS[int(np.argmax(counts))]]),
+                                           *[pa.array([int(c)]) for c in counts]],
+                                          names=TABLES['daily_all_range_stats'][1]),
+    }
+
+
+def load_script(spec, n_chunks):
+    """psql script: remove earlier bots and this region's hexes, then load every part in FK order."""
+    end = spec['start'] + timedelta(days=spec['days'] - 1)
+    lines = [
+        f"-- RunStrict bot seed: {spec['bots']:,} bots in {spec['province']}, {spec['start']} .. {end}",
+        f"-- Generated by seed_generator.py (seed {spec['seed']})",
+        "\\set ON_ERROR_STOP on",
+        "BEGIN;",
+        f"DELETE FROM public.run_history WHERE user_id::text LIKE '{BOT_ID_PREFIX[:8]}-%';",
+        f"DELETE FROM public.leaderboard_dirty WHERE user_id::text LIKE '{BOT_ID_PREFIX[:8]}-%';",
+        f"DELETE FROM public.users WHERE id::text LIKE '{BOT_ID_PREFIX[:8]}-%';",
+        f"DELETE FROM auth.users WHERE id::text LIKE '{BOT_ID_PREFIX[:8]}-%';",
+        f"DELETE FROM public.hex_snapshot WHERE parent_hex = '{spec['province']}' "
+        f"AND snapshot_date = '{end + timedelta(days=1)}';",
+        f"DELETE FROM public.hexes WHERE parent_hex = '{spec['province']}';",
+        f"DELETE FROM public.daily_all_range_stats WHERE stat_date = '{end}';",
+        AUTH_USERS_SQL.format(prefix=BOT_ID_PREFIX, password=PASSWORD_HASH, domain=BOT_EMAIL_DOMAIN,
+                              app_meta=APP_META_DATA, last=spec['bots'] - 1).strip(),
+    ]
+    for table, (name, columns) in TABLES.items():
+        parts = range(n_chunks) if table in ('users', 'run_history') else range(1)
+        for k in parts:
+            path = part_path(spec['out'], table, k, spec['format'])
+            if spec['format'] == 'csv':   # \copy paths are relative to psql's cwd, not the script
+                lines.append(f"\\copy {name} ({', '.join(columns)}) FROM '{path.resolve()}' WITH (FORMAT csv, HEADER true)")
+            else:
+                lines.append(f"\\ir {path.relative_to(spec['out'])}")
+    lines.append("COMMIT;")
+    return "\n".join(lines) + "\n"
+
+
+def replace_out_dir(out, force, marker='load.sql'):
+    """Empty `out` for a new seed. A non-empty directory is only removed if an earlier run left
+    `marker` in it, or with --force, so a mistyped --out cannot wipe an unrelated tree."""
+    if out.exists():
+        if not out.is_dir():
+            raise ValueError(f"{out} is not a directory")
+        if any(out.iterdir()) and not (out / marker).is_file() and not force:
+            raise ValueError(f"{out} is not empty and has no {marker} from an earlier run (use --force to replace it)")
+        shutil.rmtree(out)
+    out.mkdir(parents=True)
+
+
+def parse_teams(text):
+    """'red=40,blue=40,purple=20' -> [40, 40, 20] in TEAMS order."""
+    mix = dict.fromkeys(TEAMS, 0.0)
+    for item in text.split(','):
+        team, _, weight = item.partition('=')
+        if team.strip() not in mix:
+            raise ValueError(f"unknown team {team!r}")
+        mix[team.strip()] = float(weight)
+    if sum(mix.values()) <= 0:
+        raise ValueError("team weights must add up to more than 0")
+    return [mix[t] for t in TEAMS]
+
+
+def main():
+    default_end = sim.today_gmt2() - timedelta(days=1)
+    default_teams = ','.join(f"{t}={w}" for t, w in sim.TEAM_DISTRIBUTION.items())
+    parser = argparse.ArgumentParser(description='Stream a bot seed (users, runs, hexes) as COPY CSV or SQL parts')
+    parser.add_argument('--out', required=True, help='Output directory (replaced if it holds an earlier seed)')
+    parser.add_argument('--force', action='store_true', help='Replace --out even if it does not hold an earlier seed')
+    parser.add_argument('--bots', type=int, default=100, help='Bots (default: 100)')
+    parser.add_argument('--teams', default=default_teams, help=f'Team mix (default: {default_teams})')
+    parser.add_argument('--province', default=sim.h3.cell_to_parent(sim.DEFAULT_HOME_HEX, sim.ALL_RESOLUTION),
+                        help='Res 5 province, or any finer cell inside it (default: DEFAULT_HOME_HEX province)')
+    parser.add_argument('--start', type=date.fromisoformat, help='First run date (default: --end minus 4 days)')
+    parser.add_argument('--end', type=date.fromisoformat, default=default_end,
+                        help=f'Last run date (default: yesterday GMT+2, {default_end})')
+    parser.add_argument('--format', choices=('csv', 'sql'), default='csv', help='Part format (default: csv)')
+    parser.add_argument('--rows-per-insert', type=int, default=1000, help='Rows per INSERT with --format sql (default: 1000)')
+    parser.add_argument('--chunk-bots', type=int, default=100000, help='Bots per part file (default: 100000)')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='Worker processes (default: CPU count)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    args = parser.parse_args()
+
+    try:
+        weights = parse_teams(args.teams)
+    except ValueError as e:
+        parser.error(f"--teams: {e}")
+    if not sim.h3.is_valid_cell(args.province) or sim.h3.get_resolution(args.province) < sim.ALL_RESOLUTION:
+        parser.error(f"--province: {args.province} is not a Res {sim.ALL_RESOLUTION}+ H3 cell")
+    start = args.start or args.end - timedelta(days=4)
+    if start > args.end:
+        parser.error("--start is after --end")
+    if args.bots < 1 or args.chunk_bots < 1:
+        parser.error("--bots and --chunk-bots must be positive")
+
+    spec = {
+        'out': args.out, 'bots': args.bots, 'weights': weights, 'stride': team_stride(args.bots), 'seed': args.seed,
+        'province': sim.h3.cell_to_parent(args.province, sim.ALL_RESOLUTION),
+        'start': start, 'days': (args.end - start).days + 1,
+        'format': args.format, 'rows_per_insert': args.rows_per_insert, 'chunk_bots': args.chunk_bots,
+    }
+    out = Path(args.out)
+    try:
+        replace_out_dir(out, args.force)
+    except ValueError as e:
+        parser.error(f"--out: {e}")
+    for table in TABLES:
+        (out / table).mkdir(parents=True)
+
+    n_chunks = -(-args.bots // args.chunk_bots)
+    jobs = max(1, min(args.jobs, n_chunks))
+    region = region_for(spec['province'])
+    print(f"Generating {args.bots:,} bots x {spec['days']} days in {spec['province']} "
+          f"({len(region.cells):,} cells): {n_chunks} chunks on {jobs} processes", file=sys.stderr)
+
+    t0 = time.perf_counter()
+    totals = dict.fromkeys(TABLES, 0)
+    last_end = np.zeros(len(region.cells), dtype=np.int64)
+    last_team = np.full(len(region.cells), -1, dtype=np.int8)
+    pool = ProcessPoolExecutor(jobs) if jobs > 1 else None
+    results = pool.map(generate_chunk, [spec] * n_chunks, range(n_chunks)) if pool else \
+        (generate_chunk(spec, k) for k in range(n_chunks))
+    for k, (counts, (chunk_end, chunk_team)) in enumerate(results):
+        for table, rows in counts.items():
+            totals[table] += rows
+        newer = chunk_end > last_end
+        last_end[newer] = chunk_end[newer]
+        last_team[newer] = chunk_team[newer]
+        print(f"  chunk {k + 1}/{n_chunks} ({time.perf_counter() - t0:.1f}s)", file=sys.stderr)
+    if pool:
+        pool.shutdown()
+
+    for table, data in region_tables(spec, region, last_end, last_team).items():
+        part = PartWriter(part_path(out, table, 0, args.format), table, args.format, args.rows_per_insert)
+        part.write(data)
+        part.close()
+        totals[table] = part.rows
+    (out / 'load.sql').write_text(load_script(spec, n_chunks))
+    elapsed = time.perf_counter() - t0
+
+    print(f"\n{'table':<22} {'rows':>12} {'bytes':>10}")
+    print(f"{'auth_users':<22} {args.bots:>12,} {'load.sql':>10}")
+    for table, rows in totals.items():
+        size = sum(p.stat().st_size for p in (out / table).iterdir())
+        print(f"{table:<22} {rows:>12,} {size / 1e6:>8.1f}MB")
+    total_rows = sum(totals.values())
+    print(f"\n{total_rows:,} rows in {elapsed:.1f}s ({total_rows / elapsed:,.0f} rows/s). "
+          f"Load with: psql \"$DATABASE_URL\" -f {out / 'load.sql'}")
+
+
+if __name__ == '__main__':
+    main()
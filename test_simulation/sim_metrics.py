@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+RunStrict Simulator Metrics
+
+Where a simulate_day run spends its time. simulate_day records into one
+Metrics object (METRICS):
+
+  - phases: exclusive wall time per phase (generate, update_state, sql_build,
+    sink, output, db_connect, execute, save_state). Nested phases are
+    subtracted from their parent, so the phases add up to the day.
+  - counters: runs, flips, hexes_touched, hexes_owned, hexes_changed,
+    sql_bytes, statements, db_rows
+  - db: per-statement timings grouped by statement kind
+    ("INSERT public.run_history", "UPDATE public.users", ...), with p50 / p99 /
+    max. A statement slower than --slow-ms is logged to stderr as it happens
+    and kept in the day's record.
+
+--metrics-json writes one JSON line per day as soon as the day finishes, and
+a "total" line at the end. The total line carries the arguments, the git
+commit and the host, so files from different runs can be compared.
+--profile cprofile|pyinstrument wraps the day loop in a profiler.
+
+Usage:
+    python3 simulate_day.py --days 40 --users 5000 --dry-run --metrics-json m.jsonl > /dev/null
+    python3 simulate_day.py --days 5 --slow-ms 200 --metrics-json m.jsonl
+    python3 simulate_day.py --days 5 --dry-run --profile cprofile --profile-out sim.prof > /dev/null
+    python3 sim_metrics.py m.jsonl                 # Phase / DB breakdown of one run
+    python3 sim_metrics.py old.jsonl new.jsonl     # Throughput of several runs side by side
+
+Requires: pip install pyinstrument (only for --profile pyinstrument)
+"""
+
+import argparse
+import json
+import platform
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+STATEMENT_KIND = re.compile(r'^\s*(INSERT\s+INTO|UPDATE|DELETE\s+FROM|SELECT|CREATE|DROP|TRUNCATE|ALTER)\s*([\w.]*)',
+                            re.IGNORECASE)
+
+
+def statement_kind(sql):
+    """'INSERT INTO public.hexes (...) VALUES ...' -> 'INSERT public.hexes'."""
+    m = STATEMENT_KIND.match(sql)
+    if not m:
+        return 'OTHER'
+    verb = m.group(1).split()[0].upper()
+    return verb if verb == 'SELECT' or not m.group(2) else f"{verb} {m.group(2)}"
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list."""
+    return sorted_values[min(len(sorted_values) - 1, int(q / 100 * len(sorted_values)))]
+
+
+def git_commit():
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=Path(__file__).parent,
+                             capture_output=True, text=True, timeout=5)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+# ==================== Metrics ====================
+
+class Metrics:
+    """Per-day phase timers, counters and statement timings."""
+
+    def __init__(self, slow_ms=500.0):
+        self.slow_ms = slow_ms
+        self.out = None
+        self.days = []
+        self.outside = defaultdict(float)   # phases timed between days (save_state, sink close)
+        self._stack = []   # [name, start, child seconds] of the open phases
+        self._reset(None)
+
+    def _reset(self, day):
+        """Start a day (or, with None, the time between days)."""
+        self.day = day
+        self.started = time.perf_counter()
+        self.phases = defaultdict(float)
+        self.counters = defaultdict(int)
+        self.db = defaultdict(list)   # kind -> [(seconds, rows)]
+        self.slow = []
+
+    def open(self, path):
+        """Stream day records to `path` (JSON lines)."""
+        self.out = open(path, 'w')
+
+    @contextmanager
+    def phase(self, name):
+        frame = [name, time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            elapsed = time.perf_counter() - frame[1]
+            self.phases[name] += elapsed - frame[2]
+            if self._stack:
+                self._stack[-1][2] += elapsed
+
+    def count(self, name, n=1):
+        self.counters[name] += n
+
+    def statement(self, sql, seconds, rows):
+        kind = statement_kind(sql)
+        self.db[kind].append((seconds, rows))
+        self.counters['statements'] += 1
+        if rows > 0:
+            self.counters['db_rows'] += rows
+        if seconds * 1000 >= self.slow_ms:
+            self.slow.append({'kind': kind, 'ms': round(seconds * 1000, 1), 'rows': rows, 'sql': sql[:200]})
+            print(f"  SLOW {seconds * 1000:,.0f}ms {kind} ({rows:,} rows): {' '.join(sql[:120].split())}",
+                  file=sys.stderr)
+
+    def start_day(self, day):
+        if self.day is None:
+            for k, v in self.phases.items():
+                self.outside[k] += v
+        self._reset(day)
+
+    def end_day(self, **extra):
+        """Close the current day: returns its record and streams it to --metrics-json."""
+        wall = time.perf_counter() - self.started
+        db = {}
+        for kind, samples in sorted(self.db.items()):
+            ms = sorted(s * 1000 for s, _ in samples)
+            db[kind] = {'n': len(ms), 'total_ms': round(sum(ms), 1),
+                        'p50_ms': round(percentile(ms, 50), 2), 'p99_ms': round(percentile(ms, 99), 2),
+                        'max_ms': round(ms[-1], 1), 'rows': sum(max(r, 0) for _, r in samples)}
+        record = {
+            'day': self.day, **extra,
+            'wall_s': round(wall, 3),
+            'runs_per_s': round(self.counters['runs'] / wall, 1) if wall > 0 else None,
+            'phases': {k: round(v, 4) for k, v in sorted(self.phases.items(), key=lambda kv: -kv[1])},
+            'counters': dict(self.counters),
+            'db': db,
+            'slow': self.slow,
+        }
+        self.days.append(record)
+        self._write(record)
+        self._reset(None)
+        return record
+
+    def close(self, **meta):
+        """Write the "total" record (sums over the days plus `meta`) and close the file."""
+        total = self.totals()
+        total.update(meta, commit=git_commit(), host=platform.node(), python=platform.python_version(),
+                     finished_at=datetime.now(timezone.utc).isoformat(timespec='seconds'))
+        self._write(total)
+        if self.out is not None:
+            self.out.close()
+            self.out = None
+        return total
+
+    def totals(self):
+        """Sums over the finished days, plus phases timed outside any day."""
+        phases, counters, db = defaultdict(float, self.outside), defaultdict(int), {}
+        outside = sum(self.outside.values())
+        if self.day is None:
+            for k, v in self.phases.items():
+                phases[k] += v
+                outside += v
+        for r in self.days:
+            for k, v in r['phases'].items():
+                phases[k] += v
+            for k, v in r['counters'].items():
+                counters[k] += v
+            for kind, s in r['db'].items():
+                t = db.setdefault(kind, {'n': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'rows': 0})
+                t['n'] += s['n']
+                t['total_ms'] = round(t['total_ms'] + s['total_ms'], 1)
+                t['max_ms'] = max(t['max_ms'], s['max_ms'])
+                t['rows'] += s['rows']
+        wall = sum(r['wall_s'] for r in self.days) + outside
+        return {
+            'day': 'total', 'days': len(self.days), 'wall_s': round(wall, 3),
+            'runs_per_s': round(counters['runs'] / wall, 1) if wall > 0 else None,
+            'phases': {k: round(v, 4) for k, v in sorted(phases.items(), key=lambda kv: -kv[1])},
+            'counters': dict(counters), 'db': db,
+            'slow': sum(len(r['slow']) for r in self.days),
+        }
+
+    def _write(self, record):
+        if self.out is not None:
+            self.out.write(json.dumps(record) + '\n')
+            self.out.flush()
+
+
+def print_breakdown(total, file=sys.stderr):
+    """Phase shares, counters and the slowest statement kinds of a "total" record."""
+    wall = total['wall_s'] or 1e-9
+    print(f"\n{'phase':<14} {'seconds':>9} {'share':>6}", file=file)
+    for name, s in total['phases'].items():
+        print(f"{name:<14} {s:>9.2f} {s / wall:>6.1%}", file=file)
+    print(f"{'(wall)':<14} {total['wall_s']:>9.2f}   {total['runs_per_s'] or 0:,.0f} runs/s", file=file)
+    print("  " + ", ".join(f"{k} {v:,}" for k, v in total['counters'].items()), file=file)
+    if total['db']:
+        print(f"\n{'statement':<34} {'n':>8} {'total':>10} {'max':>9} {'rows':>10}", file=file)
+        for kind, s in sorted(total['db'].items(), key=lambda kv: -kv[1]['total_ms'])[:10]:
+            print(f"{kind:<34} {s['n']:>8,} {s['total_ms'] / 1000:>9.2f}s {s['max_ms']:>7.0f}ms {s['rows']:>10,}",
+                  file=file)
+        if total['slow']:
+            print(f"{total['slow']} statements over the slow threshold", file=file)
+
+
+# ==================== Profiling ====================
+
+class Profiler:
+    """Optional cProfile / pyinstrument wrapper around the simulator's day loop."""
+
+    DEFAULT_OUT = {'cprofile': 'simulate_day.prof', 'pyinstrument': 'simulate_day.html'}
+
+    def __init__(self, kind, out=None):
+        self.kind = kind
+        self.out = out or self.DEFAULT_OUT[kind]
+        if kind == 'cprofile':
+            import cProfile
+            self._profiler = cProfile.Profile()
+        else:
+            try:
+                from pyinstrument import Profiler as PyInstrument
+            except ImportError:
+                print("ERROR: pyinstrument required. Install with: pip install pyinstrument", file=sys.stderr)
+                sys.exit(1)
+            self._profiler = PyInstrument()
+
+    def start(self):
+        if self.kind == 'cprofile':
+            self._profiler.enable()
+        else:
+            self._profiler.start()
+
+    def stop(self):
+        """Stop, write the profile to self.out and print a short summary to stderr."""
+        if self.kind == 'cprofile':
+            import pstats
+            self._profiler.disable()
+            self._profiler.dump_stats(self.out)
+            print(f"\ncProfile written to {self.out} (top 15 by cumulative time):", file=sys.stderr)
+            pstats.Stats(self._profiler, stream=sys.stderr).sort_stats('cumulative').print_stats(15)
+        else:
+            self._profiler.stop()
+            Path(self.out).write_text(self._profiler.output_html())
+            print(f"\npyinstrument report written to {self.out}", file=sys.stderr)
+            print(self._profiler.output_text(unicode=False, color=False), file=sys.stderr)
+
+
+# ==================== Compare ====================
+
+def load_totals(path):
+    """The "total" record of a --metrics-json file (rebuilt from the day lines if the run was cut short)."""
+    records = [json.loads(line) for line in open(path) if line.strip()]
+    for r in records:
+        if r['day'] == 'total':
+            return r
+    m = Metrics()
+    m.days = [r for r in records if r['day'] != 'total']
+    return m.totals()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Summarize or compare simulate_day --metrics-json files')
+    parser.add_argument('files', nargs='+', help='--metrics-json files (JSON lines)')
+    args = parser.parse_args()
+
+    totals = [(path, load_totals(path)) for path in args.files]
+    if len(totals) == 1:
+        path, total = totals[0]
+        print(f"{path}: {total['days']} days, commit {total.get('commit') or '?'}, "
+              f"{total.get('users', '?')} users", file=sys.stderr)
+        print_breakdown(total, file=sys.stdout)
+        return
+
+    phases = sorted({p for _, t in totals for p in t['phases']})
+    print(f"{'file':<28} {'commit':>9} {'days':>5} {'runs':>9} {'wall':>8} {'runs/s':>9} "
+          + " ".join(f"{p[:10]:>10}" for p in phases))
+    for path, t in totals:
+        print(f"{Path(path).name[:28]:<28} {t.get('commit') or '?':>9} {t['days']:>5} "
+              f"{t['counters'].get('runs', 0):>9,} {t['wall_s']:>7.1f}s {t['runs_per_s'] or 0:>9,.0f} "
+              + " ".join(f"{t['phases'].get(p, 0):>9.2f}s" for p in phases))
+
+
+if __name__ == '__main__':
+    main()
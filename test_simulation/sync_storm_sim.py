@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+RunStrict Sync Retry Storm Simulator
+
+Discrete-event model of SyncRetryService after a backend outage. N clients
+hold queued (pending) runs. The server is down for --outage hours and then
+recovers. The simulator follows the app's semantics:
+
+  - LocalStorage.incrementRetryCount(): backoff 30s -> 2min -> 10min -> 1hr
+    -> 6hr (capped), measured from the failed attempt. No jitter.
+  - retryUnsyncedRuns() walks every eligible run (next_retry_at <= now) in
+    endTime order, one finalize_run() at a time. It does not stop at the first
+    failure, so a client with 8 queued runs sends 8 requests per trigger, even
+    into an outage. A run reaching 10 retries is dead-lettered ('failed') at
+    the next trigger.
+  - A new run's Final Sync (run_provider) is one attempt. If it fails, the run
+    is pending with retry_count 0 and is eligible at the next trigger.
+
+Retries have two trigger models (--triggers):
+
+  sessions  as the app does today: retryUnsyncedRuns() runs on app launch /
+            resume (Poisson, --sessions-per-day), and on the midnight refresh
+            (AppLifecycleManager fires at server midnight + 5s on every client
+            whose app is alive, --midnight-share)
+  timer     the worst case: every client retries exactly at next_retry_at, as
+            a background retry timer would. Fixed steps keep all clients
+            phase-locked, so retries arrive as waves.
+
+The server is FCFS with --workers connections (the PostgREST pool). A request
+that waits more than --pool-timeout for a connection is rejected without
+running (PostgREST db-pool-acquisition-timeout). The app sets no client
+timeout, so every other request completes. During the outage requests fail
+fast and never reach finalize_run(). The finalize_run() service time is
+sampled from latencies measured on local Postgres: one simulate_day day
+replayed serially through finalize_run() (needs --dsn; this deletes the
+simulation users, their run_history, and hexes, like bench_buffered_hexes.py).
+--service-ms skips the database and uses a lognormal fitted to p50/p99.
+
+Schedule variants (--variants, combine with '+'):
+
+  fixed    the current schedule
+  full     full jitter: uniform(0, step)
+  equal    equal jitter: step/2 + uniform(0, step/2)
+  bucket   per-client token bucket: a retry spends a token (--bucket-size,
+           one token back every --bucket-refill seconds). A run that gets no
+           token keeps its retry_count and waits for the next trigger.
+
+For each variant the report gives:
+  - finalize_run() requests, peak requests/s over 1s and over 1 minute
+  - pool rejections, attempts lost to the outage, p99 wait for a connection
+  - dead-lettered runs
+  - drain time: from recovery until every run queued before recovery is
+    synced or dead-lettered
+  - a timeline of average / peak requests/s per --report-minutes window
+
+Usage:
+    python3 sync_storm_sim.py                                     # measures service time on local Postgres
+    python3 sync_storm_sim.py --service-ms 9,60                   # no database: lognormal p50=9ms, p99=60ms
+    python3 sync_storm_sim.py --triggers timer --clients 50000 --service-ms 9,60
+    python3 sync_storm_sim.py --outage 6 --queued 4 --variants fixed,full,full+bucket
+    python3 sync_storm_sim.py --dsn postgresql://...
+
+Requires: pip install numpy (+ h3 psycopg2-binary to measure service time)
+"""
+
+import argparse
+import heapq
+import sys
+import time
+
+import numpy as np
+
+import simulate_day as sim
+
+# LocalStorage._backoffDelays and SyncRetryService.maxRetries
+BACKOFF_STEPS = [30, 120, 600, 3600, 21600]
+MAX_RETRIES = 10
+
+# AppLifecycleManager schedules the midnight refresh 5s after server midnight
+MIDNIGHT_DELAY = 5
+DAY = 86400
+
+
+# ==================== Service Time ====================
+
+def measure_service_times(dsn, n_users, seed):
+    """finalize_run() latencies in seconds: one simulated day replayed serially on `dsn`."""
+    from bench_buffered_hexes import CLEANUP_SQL, FINALIZE_RUN_SQL, simulate
+
+    users, schedule = simulate(n_users, 1, seed)
+    _, calls = schedule[0]
+    conn = sim.get_db_connection(dsn)
+    cur = conn.cursor()
+    latency = []
+    try:
+        cur.execute(CLEANUP_SQL)
+        cur.execute(sim.sql_auth_users_insert(users))
+        cur.execute(sim.sql_users_insert(users))
+        conn.commit()
+        conn.autocommit = True
+        for params in calls:
+            t0 = time.perf_counter()
+            cur.execute(FINALIZE_RUN_SQL, params)
+            cur.fetchall()
+            latency.append(time.perf_counter() - t0)
+    finally:
+        conn.autocommit = False
+        conn.rollback()
+        cur.execute(CLEANUP_SQL)
+        conn.commit()
+        conn.close()
+    return np.array(latency)
+
+
+def percentiles_ms(text):
+    """argparse type for --service-ms: 'P50,P99' -> (p50, p99), with 0 < p50 <= p99."""
+    try:
+        p50, p99 = (float(x) for x in text.split(','))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected P50,P99 in ms (e.g. 9,60), got {text!r}")
+    if not 0 < p50 <= p99:
+        raise argparse.ArgumentTypeError(f"need 0 < P50 <= P99, got {text!r}")
+    return p50, p99
+
+
+def lognormal_service_times(p50_ms, p99_ms, n, rng):
+    """Lognormal sample (seconds) with the given median and 99th percentile."""
+    mu = np.log(p50_ms / 1000)
+    sigma = max(np.log(p99_ms / p50_ms) / 2.326, 1e-6)
+    return rng.lognormal(mu, sigma, n)
+
+
+# ==================== Model ====================
+
+class Variant:
+    """Backoff delay and retry admission for one schedule variant."""
+
+    def __init__(self, name, rng, bucket_size, bucket_refill):
+        parts = set(name.split('+'))
+        unknown = parts - {'fixed', 'full', 'equal', 'bucket'}
+        if unknown:
+            raise ValueError(f"unknown variant part(s): {', '.join(sorted(unknown))}")
+        self.name = name
+        self.jitter = 'full' if 'full' in parts else 'equal' if 'equal' in parts else None
+        self.bucket = 'bucket' in parts
+        self.bucket_size = bucket_size
+        self.bucket_refill = bucket_refill
+        self.rng = rng
+
+    def delay(self, retry_count):
+        step = BACKOFF_STEPS[min(retry_count, len(BACKOFF_STEPS) - 1)]
+        if self.jitter == 'full':
+            return self.rng.uniform(0, step)
+        if self.jitter == 'equal':
+            return step / 2 + self.rng.uniform(0, step / 2)
+        return step
+
+    def take_token(self, client, now):
+        """Spend one retry token. Returns None, or the time the next token is due."""
+        if not self.bucket:
+            return None
+        tokens = min(self.bucket_size, client['tokens'] + (now - client['tokens_at']) / self.bucket_refill)
+        client['tokens_at'] = now
+        if tokens < 1 - 1e-9:   # refill arithmetic lands just under 1 at the due time
+            client['tokens'] = tokens
+            return now + (1 - tokens) * self.bucket_refill
+        client['tokens'] = tokens - 1
+        return None
+
+
+class Server:
+    """FCFS pool of `workers` connections in front of finalize_run()."""
+
+    def __init__(self, args, service, rng, horizon):
+        self.workers = [0.0] * args.workers
+        self.outage_end = args.outage * 3600
+        self.pool_timeout = args.pool_timeout
+        self.rtt = args.rtt_ms / 1000
+        self.service = service
+        self.rng = rng
+        self.arrivals = np.zeros(int(horizon) + 1, dtype=np.int64)
+        self.waits = []
+        self.outage_fails = 0
+        self.rejected = 0
+
+    def submit(self, now):
+        """One finalize_run() call sent at `now`. Returns (ok, time the client sees the answer)."""
+        if now < self.outage_end:
+            self.outage_fails += 1
+            return False, now + self.rtt
+        self.arrivals[int(now)] += 1
+        start = max(now, self.workers[0])
+        if start - now > self.pool_timeout:
+            self.rejected += 1
+            return False, now + self.pool_timeout + self.rtt
+        self.waits.append(start - now)
+        done = start + self.service[self.rng.integers(len(self.service))]
+        heapq.heapreplace(self.workers, done)
+        return True, done + self.rtt
+
+
+def simulate(variant_name, args, service, seed):
+    """Run one schedule variant. Returns the stats dict."""
+    rng = np.random.default_rng(seed)
+    horizon = args.hours * 3600
+    recovery = args.outage * 3600
+    variant = Variant(variant_name, np.random.default_rng(seed + 1), args.bucket_size, args.bucket_refill)
+    server = Server(args, service, np.random.default_rng(seed + 2), horizon)
+    timer = args.triggers == 'timer'
+
+    events = []   # (time, seq, kind, client index, payload)
+    seq = 0
+
+    def push(t, kind, c, payload=None):
+        nonlocal seq
+        if t <= horizon:
+            heapq.heappush(events, (t, seq, kind, c, payload))
+            seq += 1
+
+    clients = []
+    for c in range(args.clients):
+        # Runs queued before the outage: Final Sync failed, eligible at the next trigger
+        runs = [{'count': 0, 'next_at': None, 'backlog': True} for _ in range(max(1, rng.poisson(args.queued)))]
+        client = {'runs': runs, 'busy': False, 'batch': [], 'timer_at': None,
+                  'tokens': float(args.bucket_size), 'tokens_at': 0.0}
+        clients.append(client)
+        if timer:
+            client['timer_at'] = 0.0
+            push(0.0, 'trigger', c)
+        else:
+            t = rng.exponential(DAY / args.sessions_per_day)
+            while t <= horizon:
+                push(t, 'trigger', c)
+                t += rng.exponential(DAY / args.sessions_per_day)
+        t = rng.exponential(DAY / args.runs_per_day) if args.runs_per_day > 0 else horizon + 1
+        while t <= horizon:
+            push(t, 'final_sync', c)
+            t += rng.exponential(DAY / args.runs_per_day)
+
+    if not timer:
+        start = args.start_hour * 3600
+        midnight = DAY - start % DAY + MIDNIGHT_DELAY
+        alive = np.flatnonzero(rng.random(args.clients) < args.midnight_share)
+        while midnight <= horizon:
+            for c in alive:
+                push(midnight, 'trigger', int(c))
+            midnight += DAY
+
+    backlog = sum(len(cl['runs']) for cl in clients)
+    drained_at = None
+    dead = 0
+
+    def arm_timer(c, now, token_at=None):
+        """Timer trigger model: wake the client at its earliest next_retry_at (or next token)."""
+        cl = clients[c]
+        if not cl['runs']:
+            cl['timer_at'] = None
+            return
+        due = min(now if r['next_at'] is None else r['next_at'] for r in cl['runs'])
+        cl['timer_at'] = max(now, due, token_at or 0.0)
+        push(cl['timer_at'], 'trigger', c)
+
+    def settle(run, now):
+        nonlocal backlog, drained_at
+        if run.pop('backlog', False):
+            backlog -= 1
+            if backlog == 0:
+                drained_at = now
+
+    while events:
+        now, _, kind, c, payload = heapq.heappop(events)
+        cl = clients[c]
+
+        if kind == 'final_sync':
+            ok, _ = server.submit(now)
+            if not ok:
+                run = {'count': 0, 'next_at': None}
+                if timer:
+                    run['next_at'] = now + variant.delay(0)
+                cl['runs'].append(run)
+                if timer and not cl['busy'] and (cl['timer_at'] is None or run['next_at'] < cl['timer_at']):
+                    arm_timer(c, now)
+
+        elif kind == 'trigger':
+            if cl['busy'] or (timer and cl['timer_at'] != now):
+                continue   # retry already in flight / stale timer
+            eligible = [r for r in cl['runs'] if r['next_at'] is None or r['next_at'] <= now]
+            if not eligible:
+                if timer:
+                    arm_timer(c, now)
+                continue
+            cl['busy'] = True
+            cl['batch'] = eligible
+            push(now, 'send', c)
+
+        elif kind == 'send':
+            token_at = None
+            while cl['batch']:
+                run = cl['batch'].pop(0)
+                if run['count'] >= MAX_RETRIES:
+                    cl['runs'].remove(run)
+                    dead += 1
+                    settle(run, now)
+                    continue
+                token_at = variant.take_token(cl, now)
+                if token_at is not None:
+                    cl['batch'] = []   # out of tokens: the rest waits, retry_count untouched
+                    break
+                ok, answered = server.submit(now)
+                push(answered, 'answer', c, (run, ok))
+                break
+            else:
+                cl['busy'] = False
+                if timer:
+                    arm_timer(c, now)
+                continue
+            if token_at is not None:
+                cl['busy'] = False
+                if timer:
+                    arm_timer(c, now, token_at)
+
+        elif kind == 'answer':
+            run, ok = payload
+            if ok:
+                cl['runs'].remove(run)
+                settle(run, now)
+            else:
+                run['next_at'] = now + variant.delay(run['count'])
+                run['count'] += 1
+            push(now, 'send', c)
+
+    waits = np.array(server.waits) if server.waits else np.zeros(1)
+    per_minute = np.convolve(server.arrivals, np.ones(60), 'valid') / 60 if horizon >= 60 else server.arrivals
+    return {
+        'requests': int(server.arrivals.sum()),
+        'peak_1s': int(server.arrivals.max()),
+        'peak_1m': float(per_minute.max()),
+        'rejected': server.rejected,
+        'outage_fails': server.outage_fails,
+        'wait_p99': float(np.percentile(waits, 99)),
+        'dead': dead,
+        'drain': None if drained_at is None else max(0.0, drained_at - recovery),
+        'undrained': backlog,
+        'pending': sum(len(cl['runs']) for cl in clients),
+        'arrivals': server.arrivals,
+    }
+
+
+# ==================== Report ====================
+
+def fmt_duration(seconds):
+    if seconds is None:
+        return '-'
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    if seconds < 3600:
+        return f"{seconds / 60:.1f}m"
+    return f"{seconds / 3600:.1f}h"
+
+
+def print_timeline(results, args):
+    window = args.report_minutes * 60
+    names = list(results)
+    print(f"\nfinalize_run() requests/s per {args.report_minutes}-minute window (avg / peak over 1s), "
+          f"t=0 at outage start ({args.start_hour:02d}:00)")
+    print(f"{'t':>7} " + ' '.join(f"{n:>17}" for n in names))
+    horizon = len(next(iter(results.values()))['arrivals']) - 1
+    for t0 in range(0, horizon, window):
+        cells = []
+        for n in names:
+            w = results[n]['arrivals'][t0:t0 + window]
+            cells.append(f"{w.sum() / window:>8.1f} / {w.max():>6,}" if w.any() else f"{'-':>17}")
+        mark = ' <- recovery' if t0 <= args.outage * 3600 < t0 + window else ''
+        print(f"{fmt_duration(t0):>7} " + ' '.join(cells) + mark)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Discrete-event simulation of SyncRetryService retry storms after an outage')
+    parser.add_argument('--dsn', default=sim.LOCAL_DB_DSN, help='Postgres DSN for the service-time measurement (default: local supabase / $SIM_DB_DSN)')
+    parser.add_argument('--service-ms', type=percentiles_ms, help='P50,P99 finalize_run() ms as a lognormal instead of measuring (e.g. 9,60)')
+    parser.add_argument('--measure-users', type=int, default=1000, help='Simulated users for the service-time measurement (default: 1000)')
+    parser.add_argument('--clients', type=int, default=10000, help='Clients (default: 10000)')
+    parser.add_argument('--queued', type=float, default=1.5, help='Mean pending runs per client at outage start, at least 1 (default: 1.5)')
+    parser.add_argument('--outage', type=float, default=2, help='Outage length in hours, starting at t=0 (default: 2)')
+    parser.add_argument('--hours', type=float, default=48, help='Simulated hours (default: 48)')
+    parser.add_argument('--start-hour', type=int, default=20, help='Server-time hour the outage starts (default: 20)')
+    parser.add_argument('--triggers', choices=['sessions', 'timer'], default='sessions',
+                        help='Retry trigger model (default: sessions, as the app)')
+    parser.add_argument('--sessions-per-day', type=float, default=6, help='App launches / resumes per client per day (default: 6)')
+    parser.add_argument('--midnight-share', type=float, default=0.1,
+                        help='Share of clients whose app is alive for the midnight refresh (default: 0.1)')
+    parser.add_argument('--runs-per-day', type=float, default=1, help='New runs (Final Sync) per client per day (default: 1)')
+    parser.add_argument('--variants', default='fixed,equal,full,bucket,full+bucket',
+                        help='Schedule variants, parts joined by + (default: fixed,equal,full,bucket,full+bucket)')
+    parser.add_argument('--bucket-size', type=int, default=2, help='Token bucket capacity (default: 2)')
+    parser.add_argument('--bucket-refill', type=float, default=300, help='Seconds per token refill (default: 300)')
+    parser.add_argument('--workers', type=int, default=10, help='Server connections running finalize_run() (default: 10)')
+    parser.add_argument('--pool-timeout', type=float, default=10, help='Seconds a request waits for a connection before rejection (default: 10)')
+    parser.add_argument('--rtt-ms', type=float, default=50, help='Client round trip in ms (default: 50)')
+    parser.add_argument('--report-minutes', type=int, default=120, help='Timeline window in minutes (default: 120)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    args = parser.parse_args()
+
+    if args.service_ms:
+        p50, p99 = args.service_ms
+        service = lognormal_service_times(p50, p99, 100000, np.random.default_rng(args.seed))
+        source = f"lognormal p50={p50:g}ms p99={p99:g}ms"
+    else:
+        if sim.psycopg2 is None:
+            print("ERROR: psycopg2 required to measure finalize_run(). Install with: pip install psycopg2-binary "
+                  "(or pass --service-ms)", file=sys.stderr)
+            sys.exit(1)
+        print(f"Measuring finalize_run() on {args.dsn} ...", file=sys.stderr)
+        service = measure_service_times(args.dsn, args.measure_users, args.seed)
+        source = f"measured, {len(service):,} runs"
+    print(f"Service time ({source}): p50 {np.percentile(service, 50) * 1000:.2f}ms, "
+          f"p99 {np.percentile(service, 99) * 1000:.2f}ms, "
+          f"capacity ~{args.workers / service.mean():,.0f} req/s on {args.workers} connections", file=sys.stderr)
+
+    results = {}
+    for name in args.variants.split(','):
+        t0 = time.perf_counter()
+        results[name] = simulate(name, args, service, args.seed)
+        print(f"  {name}: {time.perf_counter() - t0:.1f}s", file=sys.stderr)
+
+    print(f"\n{args.clients:,} clients, {args.outage:g}h outage, {args.hours:g}h simulated, "
+          f"{args.triggers} triggers, {args.workers} connections, pool timeout {args.pool_timeout:g}s")
+    print(f"{'variant':<12} {'requests':>9} {'peak 1s':>8} {'peak 1m':>8} {'rejected':>9} {'outage':>8} "
+          f"{'wait p99':>9} {'dead':>7} {'drain':>7} {'undrained':>9} {'pending':>8}")
+    for name, r in results.items():
+        print(f"{name:<12} {r['requests']:>9,} {r['peak_1s']:>8,} {r['peak_1m']:>8.1f} {r['rejected']:>9,} "
+              f"{r['outage_fails']:>8,} {r['wait_p99'] * 1000:>7.0f}ms {r['dead']:>7,} "
+              f"{fmt_duration(r['drain']):>7} {r['undrained']:>9,} {r['pending']:>8,}")
+    print_timeline(results, args)
+
+
+if __name__ == '__main__':
+    main()
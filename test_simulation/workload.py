@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+RunStrict Geographic Workload Model
+
+Skewed runner density for load tests. The default simulator spreads users
+evenly (50 + 50 users) and picks hexes uniformly from fixed pools of 80, so
+nothing ever contends. This model adds:
+
+- Zipf-distributed runner density across Res 6 districts (home district = rank 1)
+- Hotspot routes: park loops (H3 rings) and commuter corridors (H3 lines)
+  that a configurable share of all runs follow, so hundreds of runners
+  cross the same hexes
+- Time-of-day peaks (mixture of Gaussians over the UTC day)
+
+Everything is precomputed into flat tables (cell pool, neighbor table,
+cumulative weights), so sampling a run is a few bisects plus a short walk.
+`sample_paths` does the same walk vectorized for millions of runs.
+
+Usage:
+    python3 workload.py --home-hex 89283472a93ffff --runs 1000000   # Skew report + throughput
+    python3 workload.py --zipf-s 0 --hotspot-share 0                # Near-uniform baseline
+    python3 simulate_day.py --days 5 --users 5000 --workload zipf --dry-run
+
+Requires: pip install h3 numpy
+"""
+
+import argparse
+import bisect
+import itertools
+import json
+import math
+import random
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    print("ERROR: numpy required. Install with: pip install numpy", file=sys.stderr)
+    sys.exit(1)
+
+from simulate_day import ALL_RESOLUTION, BASE_RESOLUTION, CITY_RESOLUTION, DEFAULT_HOME_HEX, h3
+
+WORKLOAD_DEFAULTS = {
+    'zipf_s': 1.2,              # District density skew (0 = uniform)
+    'province_rings': 1,        # Res 5 k-ring around the home province (1 -> 7 provinces)
+    'hotspots': 12,             # Park loops
+    'corridors': 4,             # Commuter corridors between hotspots
+    'loop_radius': 2,           # Park loop = H3 ring of this radius (12 cells)
+    'hotspot_zipf_s': 1.0,      # Popularity skew across hotspot routes
+    'hotspot_share': 0.35,      # Share of runs that follow a hotspot route
+    # (UTC hour, sigma hours, weight): morning, evening, lunch
+    'tod_peaks': [[5.0, 1.0, 0.45], [16.5, 1.5, 0.40], [10.5, 2.0, 0.15]],
+}
+
+
+def zipf_weights(n, s):
+    """Unnormalized Zipf weights 1/k^s for ranks 1..n."""
+    return [1.0 / (k ** s) for k in range(1, n + 1)]
+
+
+def _cumulative(weights):
+    return list(itertools.accumulate(weights))
+
+
+def _pick(cum, rng):
+    return bisect.bisect_right(cum, rng.random() * cum[-1])
+
+
+class WorkloadModel:
+    """Precomputed skewed geography around one home hex.
+
+    Cells are addressed by index into `cells`; `neighbors[i]` holds the six
+    H3 neighbors of cell i (-1 when the neighbor is outside the pool).
+    """
+
+    def __init__(self, home_hex=DEFAULT_HOME_HEX, config=None, seed=42):
+        self.config = dict(WORKLOAD_DEFAULTS, **(config or {}))
+        cfg = self.config
+        rng = random.Random(seed)
+        res = h3.get_resolution(home_hex)
+
+        # Provinces (Res 5) and their districts (Res 6); home district first
+        self.home_province = h3.cell_to_parent(home_hex, ALL_RESOLUTION)
+        home_district = h3.cell_to_parent(home_hex, CITY_RESOLUTION)
+        provinces = sorted(h3.grid_disk(self.home_province, cfg['province_rings']))
+        others = sorted(d for p in provinces for d in h3.cell_to_children(p, CITY_RESOLUTION)
+                        if d != home_district)
+        rng.shuffle(others)
+        self.districts = [home_district] + others
+        self.district_cum = _cumulative(zipf_weights(len(self.districts), cfg['zipf_s']))
+
+        # Flat cell pool + neighbor table
+        self.cells = []
+        self.district_start = []
+        for d in self.districts:
+            self.district_start.append(len(self.cells))
+            self.cells.extend(sorted(h3.cell_to_children(d, res)))
+        self.district_start.append(len(self.cells))
+        self.index = {c: i for i, c in enumerate(self.cells)}
+        self.neighbors = np.full((len(self.cells), 6), -1, dtype=np.int32)
+        for i, c in enumerate(self.cells):
+            ring = [self.index.get(n, -1) for n in h3.grid_ring(c, 1)]
+            self.neighbors[i, :len(ring)] = ring[:6]
+        self._neighbor_lists = [[n for n in row if n >= 0] for row in self.neighbors.tolist()]
+
+        # Hotspot routes: park loops, then corridors between loop centers
+        self.routes = []
+        centers = []
+        for _ in range(cfg['hotspots']):
+            d = _pick(self.district_cum, rng)
+            center = self.cells[rng.randrange(self.district_start[d], self.district_start[d + 1])]
+            loop = self._ordered_ring(center, cfg['loop_radius'])
+            if len(loop) >= 3:
+                centers.append(center)
+                self.routes.append({'kind': 'loop', 'cells': loop})
+        for _ in range(cfg['corridors']):
+            if len(centers) < 2:
+                break
+            a, b = rng.sample(centers, 2)
+            line = [self.index[c] for c in h3.grid_path_cells(a, b) if c in self.index]
+            if len(line) >= 3:
+                self.routes.append({'kind': 'corridor', 'cells': line})
+        self.route_cum = _cumulative(zipf_weights(len(self.routes), cfg['hotspot_zipf_s'])) if self.routes else []
+
+        # Time-of-day mixture
+        self.tod_cum = _cumulative([w for _, _, w in cfg['tod_peaks']])
+
+    def _ordered_ring(self, center, radius):
+        """Ring cells around `center`, ordered by bearing so a loop is walkable."""
+        lat0, lng0 = h3.cell_to_latlng(center)
+        ring = [c for c in h3.grid_ring(center, radius) if c in self.index]
+        ring.sort(key=lambda c: math.atan2(h3.cell_to_latlng(c)[0] - lat0, h3.cell_to_latlng(c)[1] - lng0))
+        return [self.index[c] for c in ring]
+
+    # ==================== Scalar Sampling ====================
+
+    def sample_district(self, rng=random):
+        return _pick(self.district_cum, rng)
+
+    def sample_home_hex(self, rng=random):
+        """Home hex drawn with Zipf district density."""
+        d = self.sample_district(rng)
+        return self.cells[rng.randrange(self.district_start[d], self.district_start[d + 1])]
+
+    def sample_path(self, home_hex, num_hexes, rng=random):
+        """Distinct hexes for one run: a hotspot route segment, or a walk from home."""
+        if self.routes and rng.random() < self.config['hotspot_share']:
+            route = self.routes[_pick(self.route_cum, rng)]
+            cells = route['cells'] if rng.random() < 0.5 else route['cells'][::-1]
+            n = min(num_hexes, len(cells))
+            if route['kind'] == 'loop':
+                start = rng.randrange(len(cells))
+                idx = [cells[(start + k) % len(cells)] for k in range(n)]
+            else:
+                start = rng.randrange(len(cells) - n + 1)
+                idx = cells[start:start + n]
+        else:
+            cur = self.index.get(home_hex)
+            if cur is None:
+                cur = self.index[self.sample_home_hex(rng)]
+            prev = -1
+            idx = [cur]
+            for _ in range(num_hexes - 1):
+                options = [n for n in self._neighbor_lists[cur] if n != prev] or [cur]
+                prev, cur = cur, rng.choice(options)
+                idx.append(cur)
+        return [self.cells[i] for i in dict.fromkeys(idx)]
+
+    def sample_start_minute(self, rng=random):
+        """Minute of the UTC day from the time-of-day peaks."""
+        hour, sigma, _ = self.config['tod_peaks'][_pick(self.tod_cum, rng)]
+        return int(rng.gauss(hour, sigma) * 60) % 1440
+
+    # ==================== Vectorized Sampling ====================
+
+    def sample_home_cells(self, n, np_rng):
+        """Vectorized sample_home_hex: `n` cell indices with Zipf district density."""
+        districts = np.asarray(self.district_cum)
+        d = np.searchsorted(districts, np_rng.random(n) * districts[-1], side='right')
+        starts = np.asarray(self.district_start)
+        return starts[d] + (np_rng.random(n) * (starts[d + 1] - starts[d])).astype(np.int64)
+
+    def sample_paths(self, n_runs, num_hexes, np_rng, start_cells=None):
+        """Sample `n_runs` paths of up to `num_hexes` cell indices in one shot.
+
+        Walks start at `start_cells` (e.g. users' home cells) when given.
+        Returns an (n_runs, num_hexes) int32 array; repeats within a row are
+        possible (use np.unique per row if distinct hexes are needed).
+        """
+        if start_cells is None:
+            cur = self.sample_home_cells(n_runs, np_rng)
+        else:
+            cur = np.asarray(start_cells, dtype=np.int64)
+
+        paths = np.empty((n_runs, num_hexes), dtype=np.int32)
+        paths[:, 0] = cur
+        for k in range(1, num_hexes):
+            nxt = self.neighbors[cur, np_rng.integers(0, 6, n_runs)]
+            cur = np.where(nxt >= 0, nxt, cur)
+            paths[:, k] = cur
+
+        if self.routes:
+            on_route = np_rng.random(n_runs) < self.config['hotspot_share']
+            rc = np.asarray(self.route_cum)
+            which = np.searchsorted(rc, np_rng.random(n_runs) * rc[-1], side='right')
+            for r, route in enumerate(self.routes):
+                rows = np.nonzero(on_route & (which == r))[0]
+                if not len(rows):
+                    continue
+                arr = np.asarray(route['cells'], dtype=np.int32)
+                offs = np_rng.integers(0, len(arr), len(rows))
+                cols = offs[:, None] + np.arange(num_hexes)[None, :]
+                if route['kind'] == 'loop':
+                    cols %= len(arr)
+                else:
+                    cols = np.minimum(cols, len(arr) - 1)  # Stop at the corridor end
+                paths[rows] = arr[cols]
+        return paths
+
+    def sample_start_minutes(self, n_runs, np_rng):
+        peaks = np.asarray(self.config['tod_peaks'], dtype=np.float64)
+        which = np.searchsorted(np.asarray(self.tod_cum), np_rng.random(n_runs) * self.tod_cum[-1], side='right')
+        hours = np_rng.normal(peaks[which, 0], peaks[which, 1])
+        return (hours * 60).astype(np.int64) % 1440
+
+    def summary(self):
+        return {
+            'home_province': self.home_province,
+            'districts': len(self.districts),
+            'cells': len(self.cells),
+            'routes': {k: sum(1 for r in self.routes if r['kind'] == k) for k in ('loop', 'corridor')},
+            'top_district_share': round(self.district_cum[0] / self.district_cum[-1], 3),
+        }
+
+
+_MODEL_CACHE = {}
+
+
+def get_workload(state):
+    """WorkloadModel for a simulator state with a 'workload' config, else None."""
+    cfg = state.get('workload')
+    if cfg is None:
+        return None
+    key = (state.get('home_hex'), state.get('seed'), json.dumps(cfg, sort_keys=True))
+    if key not in _MODEL_CACHE:
+        _MODEL_CACHE[key] = WorkloadModel(state.get('home_hex') or DEFAULT_HOME_HEX, cfg, state.get('seed', 42))
+    return _MODEL_CACHE[key]
+
+
+# ==================== Report ====================
+
+def skew_report(model, n_runs, num_hexes, seed):
+    np_rng = np.random.default_rng(seed)
+    t0 = time.perf_counter()
+    paths = model.sample_paths(n_runs, num_hexes, np_rng)
+    minutes = model.sample_start_minutes(n_runs, np_rng)
+    elapsed = time.perf_counter() - t0
+
+    visits = np.bincount(paths.ravel(), minlength=len(model.cells))
+    touched = visits[visits > 0]
+    top = np.sort(touched)[::-1]
+    top1pct = max(1, len(top) // 100)
+    hour_hist = np.bincount(minutes // 60, minlength=24)
+    return {
+        'runs': n_runs,
+        'sample_seconds': round(elapsed, 3),
+        'runs_per_sec': int(n_runs / elapsed) if elapsed > 0 else None,
+        'cells_touched': int(len(touched)),
+        'max_visits_per_hex': int(top[0]) if len(top) else 0,
+        'top_1pct_hex_share': round(float(top[:top1pct].sum() / touched.sum()), 3) if len(top) else 0,
+        'peak_hour_utc': int(hour_hist.argmax()),
+        'peak_hour_share': round(float(hour_hist.max() / n_runs), 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='RunStrict skewed workload model')
+    parser.add_argument('--home-hex', type=str, default=DEFAULT_HOME_HEX, help='H3 Res 9 home hex')
+    parser.add_argument('--runs', type=int, default=1_000_000, help='Runs to sample for the report (default: 1M)')
+    parser.add_argument('--hexes-per-run', type=int, default=20, help='Path length (default: 20)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    for key in ('zipf_s', 'hotspot_share', 'hotspot_zipf_s'):
+        parser.add_argument('--' + key.replace('_', '-'), type=float, default=WORKLOAD_DEFAULTS[key])
+    for key in ('province_rings', 'hotspots', 'corridors', 'loop_radius'):
+        parser.add_argument('--' + key.replace('_', '-'), type=int, default=WORKLOAD_DEFAULTS[key])
+    args = parser.parse_args()
+
+    if h3.get_resolution(args.home_hex) != BASE_RESOLUTION:
+        print(f"WARNING: Home hex is not resolution {BASE_RESOLUTION}.", file=sys.stderr)
+
+    config = {k: getattr(args, k) for k in WORKLOAD_DEFAULTS if hasattr(args, k)}
+    t0 = time.perf_counter()
+    model = WorkloadModel(args.home_hex, config, args.seed)
+    print(f"Built model in {time.perf_counter() - t0:.2f}s: {model.summary()}", file=sys.stderr)
+    print(json.dumps(skew_report(model, args.runs, args.hexes_per_run, args.seed), indent=2))
+
+
+if __name__ == '__main__':
+    main()